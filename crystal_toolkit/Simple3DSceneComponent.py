@@ -14,6 +14,8 @@ inside Python to make this component redundant.
 Keyword arguments:
 - id (string; optional): The ID used to identify this component in Dash callbacks
 - data (dict; optional): Simple3DScene JSON
+- patch (dict; optional): Changes to colors and radii of objects already in the scene,
+applied in place without re-drawing the scene
 - settings (dict; optional): Options used for generating scene
 - toggleVisibility (dict; optional): Hide/show nodes in scene by name (key), value is 1 to show the node
 and 0 to hide it
@@ -26,6 +28,7 @@ and 0 to hide it
         self,
         id=Component.UNDEFINED,
         data=Component.UNDEFINED,
+        patch=Component.UNDEFINED,
         settings=Component.UNDEFINED,
         toggleVisibility=Component.UNDEFINED,
         downloadRequest=Component.UNDEFINED,
@@ -36,6 +39,7 @@ and 0 to hide it
         self._prop_names = [
             "id",
             "data",
+            "patch",
             "settings",
             "toggleVisibility",
             "downloadRequest",
@@ -48,6 +52,7 @@ and 0 to hide it
         self.available_properties = [
             "id",
             "data",
+            "patch",
             "settings",
             "toggleVisibility",
             "downloadRequest",
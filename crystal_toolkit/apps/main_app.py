@@ -13,10 +13,16 @@ from flask import make_response, jsonify, request
 from flask_caching import Cache
 
 from crystal_toolkit.core.mpcomponent import MPComponent
+from crystal_toolkit.core.object_store import ObjectStore
 from crystal_toolkit.helpers.layouts import *
 from crystal_toolkit.helpers.mprester import MPRester
+from crystal_toolkit.helpers.volumetric_store import VolumetricDataHandle
+from crystal_toolkit.core.scene import Scene
 from crystal_toolkit import __file__ as module_path
 
+# adds VolumetricData.get_scene
+import crystal_toolkit.renderables.volumetric
+
 import crystal_toolkit.components as ctc
 
 from pymatgen import Structure, Molecule
@@ -51,6 +57,10 @@ DEBUG_MODE = literal_eval(os.environ.get("CRYSTAL_TOOLKIT_DEBUG_MODE", "False").
 MP_EMBED_MODE = literal_eval(
     os.environ.get("CRYSTAL_TOOLKIT_MP_EMBED_MODE", "False").title()
 )
+# keep large data (e.g. band structures) on the server rather than in the browser
+OBJECT_STORE_MODE = literal_eval(
+    os.environ.get("CRYSTAL_TOOLKIT_OBJECT_STORE_MODE", "False").title()
+)
 
 assets_folder = os.path.join(os.path.dirname(module_path), "apps/assets/")
 crystal_toolkit_app = dash.Dash(
@@ -116,6 +126,10 @@ logger = logging.getLogger(crystal_toolkit_app.title)
 
 ctc.register_app(crystal_toolkit_app)
 ctc.register_cache(cache)
+if OBJECT_STORE_MODE:
+    ctc.register_object_store(
+        ObjectStore(redis_url=os.environ.get("REDIS_URL", "") or None)
+    )
 
 supercell = ctc.SupercellTransformationComponent()
 grain_boundary = ctc.GrainBoundaryTransformationComponent()
@@ -509,10 +523,51 @@ def master_update_structure(search_mpid, upload_data):
     else:
 
         struct = MPComponent.from_data(upload_data["data"])
+        if isinstance(struct, VolumetricDataHandle):
+            struct = struct.structure
 
     return MPComponent.to_data(struct.as_dict())
 
 
+@crystal_toolkit_app.callback(
+    Output(struct_component.id("scene_additions"), "data"),
+    [Input(search_component.id(), "data"), Input(upload_component.id(), "data")],
+)
+def update_volumetric_scene(search_mpid, upload_data):
+
+    if not search_mpid and not upload_data:
+        raise PreventUpdate
+
+    search_mpid = search_mpid or {}
+    upload_data = upload_data or {}
+
+    time_searched = search_mpid.get("time_requested", -1)
+    time_uploaded = upload_data.get("time_requested", -1)
+
+    scene = Scene(name="scene_additions")
+
+    if time_uploaded > time_searched:
+
+        handle = MPComponent.from_data(upload_data["data"])
+
+        # draw an isosurface of uploaded volumetric data (e.g. a CHGCAR),
+        # enclosing the highest tenth of its values
+        if isinstance(handle, VolumetricDataHandle):
+            try:
+                volumetric_data = handle.load(upload_component.volumetric_store)
+            except KeyError:
+                # expired, the file has to be uploaded again
+                raise PreventUpdate
+            isolvl = volumetric_data.get_analysis().get_isolvl(0.1)
+            scene.contents.append(
+                volumetric_data.get_scene(
+                    isolvl=isolvl, max_triangles=50000, color="#2f71d4", opacity=0.5
+                )
+            )
+
+    return MPComponent.to_data(scene.to_json())
+
+
 # @crystal_toolkit_app.callback(
 #    Output(struct_component.id(""), ""),
 #    [Input(transformation_component.id(""), "")],
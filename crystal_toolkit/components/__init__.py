@@ -3,6 +3,7 @@ from crystal_toolkit.core.panelcomponent import PanelComponent
 
 register_app = MPComponent.register_app
 register_cache = MPComponent.register_cache
+register_object_store = MPComponent.register_object_store
 
 from crystal_toolkit.helpers.layouts import *
 from crystal_toolkit.core.scene import *
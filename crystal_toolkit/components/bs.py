@@ -2,6 +2,8 @@ import dash
 import dash_core_components as dcc
 import dash_html_components as html
 import math
+import os
+import re
 import numpy as np
 from scipy.special import wofz
 import plotly.graph_objs as go
@@ -9,13 +11,21 @@ import plotly.tools as tls
 from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
 
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import gettempdir
+from typing import Optional, Tuple
+
+from monty.serialization import dumpfn, loadfn
+from requests.exceptions import RequestException
+
 from pymatgen import MPRester
+from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine
+from pymatgen.electronic_structure.dos import CompleteDos
+from pymatgen.ext.matproj import MPRestError
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 from pymatgen.electronic_structure.plotter import BSPlotter
 from pymatgen.electronic_structure.core import Spin
-from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine as BSML
-from pymatgen.electronic_structure.dos import CompleteDos
 
 from crystal_toolkit.helpers.layouts import *
 from crystal_toolkit.core.mpcomponent import MPComponent
@@ -26,6 +36,15 @@ from crystal_toolkit.core.panelcomponent import PanelComponent
 
 
 class BandstructureAndDosComponent(MPComponent):
+
+    # REST API to fetch data from, by default that used by MPRester
+    mprester_endpoint = None
+    # where fetched data is saved, shared between processes on the same machine
+    data_directory = os.environ.get(
+        "CRYSTAL_TOOLKIT_BS_DOS_DIR",
+        os.path.join(gettempdir(), "crystal_toolkit_bs_dos"),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.create_store("mpid")
@@ -40,6 +59,66 @@ class BandstructureAndDosComponent(MPComponent):
         "plot_bgcolor": "rgba(0,0,0,0)",
     }
 
+    @staticmethod
+    def get_bs_dos(
+        mpid: str
+    ) -> Tuple[Optional[BandStructureSymmLine], Optional[CompleteDos]]:
+        """
+        Get the band structure and density of states of a material, fetching
+        both at the same time from the Materials Project on first use and
+        reading them from a compressed file in data_directory afterwards.
+
+        :param mpid: a Materials Project id, e.g. "mp-149"
+        :return: band structure and density of states, either is None if not
+        available
+        """
+
+        # the mpid is used as a file name
+        if not re.fullmatch(r"[\w-]+", mpid):
+            return None, None
+
+        path = os.path.join(
+            BandstructureAndDosComponent.data_directory, f"{mpid}.json.gz"
+        )
+
+        if os.path.exists(path):
+            data = loadfn(path)
+            return data["bandstructure"], data["dos"]
+
+        def fetch(method_name):
+            # each thread needs its own MPRester, since requests sessions
+            # are not thread-safe
+            try:
+                with MPRester(
+                    endpoint=BandstructureAndDosComponent.mprester_endpoint
+                ) as m:
+                    return getattr(m, method_name)(mpid)
+            except (MPRestError, IndexError, RequestException):
+                # e.g. not available, or the API could not be reached
+                return None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bandStructureSymmLine, densityOfStates = executor.map(
+                fetch, ["get_bandstructure_by_material_id", "get_dos_by_material_id"]
+            )
+
+        # a failed request may succeed later, so only complete data is saved
+        if bandStructureSymmLine is not None and densityOfStates is not None:
+            os.makedirs(BandstructureAndDosComponent.data_directory, exist_ok=True)
+            # write to a temporary file first, in case several processes are
+            # saving the same data, keeping the extension for compression
+            tmp_path = os.path.join(
+                BandstructureAndDosComponent.data_directory,
+                f"{mpid}.{os.getpid()}.json.gz",
+            )
+            dumpfn(
+                {"bandstructure": bandStructureSymmLine, "dos": densityOfStates},
+                tmp_path,
+            )
+            os.replace(tmp_path, path)
+
+        return bandStructureSymmLine, densityOfStates
+
     @property
     def all_layouts(self):
 
@@ -189,7 +268,7 @@ class BandstructureAndDosComponent(MPComponent):
             # - BS Data
             bstraces = []
 
-            bs_reg_plot = BSPlotter(BSML.from_dict(bandStructureSymmLine))
+            bs_reg_plot = BSPlotter(self.from_data(bandStructureSymmLine, copy=False))
 
             bs_data = bs_reg_plot.bs_plot_data()
 
@@ -246,7 +325,7 @@ class BandstructureAndDosComponent(MPComponent):
             # -- DOS Data
             dostraces = []
 
-            dos = CompleteDos.from_dict(densityOfStates)
+            dos = self.from_data(densityOfStates, copy=False)
 
             if Spin.down in dos.densities:
                 # Add second spin data if available
@@ -341,14 +420,15 @@ class BandstructureAndDosComponent(MPComponent):
 
             mpid = mpid["mpid"]
 
-            with MPRester() as m:
-                bandStructureSymmLine = m.get_bandstructure_by_material_id(mpid)
-                densityOfStates = m.get_dos_by_material_id(mpid)
+            bandStructureSymmLine, densityOfStates = self.get_bs_dos(mpid)
 
             if bandStructureSymmLine == None or densityOfStates == None:
                 return "error", "error"
             else:
-                return bandStructureSymmLine.as_dict(), densityOfStates.as_dict()
+                return (
+                    self.to_data(bandStructureSymmLine),
+                    self.to_data(densityOfStates),
+                )
 
 
 class BandstructureAndDosPanelComponent(PanelComponent):
@@ -8,11 +8,24 @@ from dash.exceptions import PreventUpdate
 
 from pymatgen import MPRester
 from pymatgen.core.composition import Composition
-from pymatgen.analysis.phase_diagram import PhaseDiagram, PDPlotter, PDEntry
+from pymatgen.analysis.phase_diagram import (
+    PhaseDiagram,
+    PhaseDiagramError,
+    PDPlotter,
+    PDEntry,
+)
 
 from crystal_toolkit.helpers.layouts import *  # layout helpers like `Columns` etc. (most subclass html.Div)
 from crystal_toolkit.core.mpcomponent import MPComponent
 from crystal_toolkit.core.panelcomponent import PanelComponent
+from crystal_toolkit.core.cache import LRUCache
+from crystal_toolkit.helpers.incremental_hull import (
+    IncrementalHull,
+    SUPPORTS_COMPUTED_DATA,
+)
+
+from collections import Counter
+from typing import List, Optional
 
 
 # Author: Matthew McDermott
@@ -20,6 +33,17 @@ from crystal_toolkit.core.panelcomponent import PanelComponent
 
 
 class PhaseDiagramComponent(MPComponent):
+
+    # in-process caches of entries by chemical system and of phase diagrams
+    # by entries, in front of MPComponent.cache
+    entries_cache = LRUCache(maxsize=32)
+    phase_diagram_cache = LRUCache(maxsize=32)
+
+    # hulls of recent phase diagrams by entries, so that they can be updated
+    # incrementally when entries are edited, see get_phase_diagram
+    hulls = LRUCache(maxsize=32)
+    max_incremental_changes = 16
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.create_store("mpid")
@@ -28,6 +52,8 @@ class PhaseDiagramComponent(MPComponent):
         self.create_store("chemsys-external")
         self.create_store("figure")
         self.create_store("entries")
+        # key of the entries of the displayed phase diagram, see get_phase_diagram
+        self.create_store("entries_key")
 
     # Default plot layouts for Binary (2), Ternary (3), Quaternary (4) phase diagrams
     default_binary_plot_style = dict(
@@ -360,6 +386,144 @@ class PhaseDiagramComponent(MPComponent):
 
         return unstable_marker_plot
 
+    @staticmethod
+    def get_entries_in_chemsys(chemsys: List[str]) -> List[PDEntry]:
+        """
+        :param chemsys: list of elements
+        :return: entries from the Materials Project, cached by chemical system
+        """
+
+        key = "PhaseDiagramComponent_entries_{}".format("-".join(sorted(chemsys)))
+
+        entries = PhaseDiagramComponent.entries_cache.get(key)
+        if entries is not None:
+            return entries
+
+        entries_data = MPComponent.cache.get(key)
+        if entries_data is not None:
+            entries = MPComponent.from_data(entries_data)
+        else:
+            with MPRester() as mpr:
+                entries = mpr.get_entries_in_chemsys(chemsys)
+            MPComponent.cache.set(
+                key, MPComponent.to_data(entries, use_object_store=False)
+            )
+
+        PhaseDiagramComponent.entries_cache.set(key, entries)
+
+        return entries
+
+    @staticmethod
+    def get_entries_key(
+        entries: List[PDEntry], entries_data: Optional[str] = None
+    ) -> str:
+        """
+        :param entries: entries
+        :param entries_data: entries as returned by to_data, if already known,
+        so that the entries do not have to be serialized again
+        :return: key of the entries, for use with get_phase_diagram
+        """
+        return MPComponent.get_data_hash(
+            entries_data or MPComponent.to_data(entries, use_object_store=False)
+        )
+
+    @staticmethod
+    def get_phase_diagram(
+        entries: List[PDEntry],
+        entries_data: Optional[str] = None,
+        previous_entries_key: Optional[str] = None,
+    ) -> PhaseDiagram:
+        """
+        Phase diagrams are cached by their entries. If the entries differ from
+        those of the previous phase diagram by only a few entries, as is
+        typical when editing the entry table, the hull of the previous phase
+        diagram is updated incrementally instead of being re-computed. This
+        requires a version of pymatgen that can make a PhaseDiagram from a
+        pre-computed hull, otherwise the hull is always re-computed.
+
+        :param entries: entries
+        :param entries_data: entries as returned by to_data, if already known
+        :param previous_entries_key: get_entries_key of the entries of the
+        phase diagram currently displayed, if any
+        :return: PhaseDiagram
+        """
+
+        key = PhaseDiagramComponent.get_entries_key(entries, entries_data)
+
+        pd = PhaseDiagramComponent.phase_diagram_cache.get(key)
+        if pd is not None:
+            return pd
+
+        if not SUPPORTS_COMPUTED_DATA:
+            pd = PhaseDiagram(entries)
+            PhaseDiagramComponent.phase_diagram_cache.set(key, pd)
+            return pd
+
+        hull = None
+        if previous_entries_key is not None:
+            hull = PhaseDiagramComponent._update_hull(previous_entries_key, entries)
+
+        if hull is None:
+            hull = IncrementalHull(entries)
+
+        pd = hull.get_phase_diagram()
+
+        PhaseDiagramComponent.phase_diagram_cache.set(key, pd)
+        PhaseDiagramComponent.hulls.set(key, hull)
+
+        return pd
+
+    @staticmethod
+    def _update_hull(
+        entries_key: str, entries: List[PDEntry]
+    ) -> Optional[IncrementalHull]:
+        """
+        :param entries_key: get_entries_key of the entries of an existing hull
+        :param entries: new entries
+        :return: a copy of the existing hull, with entries no longer present
+        removed and new entries inserted, or None if the hull is not
+        available or too many entries have changed
+        """
+
+        hull = PhaseDiagramComponent.hulls.get(entries_key)
+        if hull is None:
+            return None
+
+        def get_entry_key(entry):
+            return (
+                entry.composition.formula,
+                round(entry.energy, 6),
+                str(getattr(entry, "attribute", None)),
+            )
+
+        previous_keys = Counter(map(get_entry_key, hull.entries))
+        keys = Counter(map(get_entry_key, entries))
+        removed_keys = previous_keys - keys
+        added_keys = keys - previous_keys
+
+        if (
+            sum(removed_keys.values()) + sum(added_keys.values())
+            > PhaseDiagramComponent.max_incremental_changes
+        ):
+            return None
+
+        hull = hull.copy()
+
+        try:
+            for entry in list(hull.entries):
+                if removed_keys[get_entry_key(entry)] > 0:
+                    removed_keys[get_entry_key(entry)] -= 1
+                    hull.remove(entry)
+            for entry in entries:
+                if added_keys[get_entry_key(entry)] > 0:
+                    added_keys[get_entry_key(entry)] -= 1
+                    hull.insert(entry)
+        except (ValueError, PhaseDiagramError):
+            # e.g. an element was added or its last entry removed
+            return None
+
+        return hull
+
     @staticmethod
     def create_table_content(pd):
         data = []
@@ -524,7 +688,7 @@ class PhaseDiagramComponent(MPComponent):
             if pd is None:
                 raise PreventUpdate
 
-            pd = self.from_data(pd)
+            pd = self.from_data(pd, copy=False)
             dim = pd.dim
 
             if dim not in [2, 3, 4]:
@@ -575,14 +739,28 @@ class PhaseDiagramComponent(MPComponent):
 
             return fig
 
-        @app.callback(Output(self.id(), "data"), [Input(self.id("entries"), "data")])
-        def create_pd_object(entries):
-            if entries is None or not entries:
+        @app.callback(
+            [Output(self.id(), "data"), Output(self.id("entries_key"), "data")],
+            [Input(self.id("entries"), "data")],
+            [State(self.id("entries_key"), "data")],
+        )
+        def create_pd_object(entries_data, previous_entries_key):
+            if entries_data is None or not entries_data:
                 raise PreventUpdate
 
-            entries = self.from_data(entries)
+            entries = self.from_data(entries_data)
+
+            pd = self.get_phase_diagram(
+                entries,
+                entries_data=entries_data,
+                previous_entries_key=previous_entries_key,
+            )
 
-            return self.to_data(PhaseDiagram(entries))
+            # re-computing the hull is the expensive part of decoding a PhaseDiagram
+            return (
+                self.to_data(pd, cache_decoded=True),
+                self.get_entries_key(entries, entries_data),
+            )
 
         @app.callback(
             Output(self.id("entries"), "data"),
@@ -633,17 +811,18 @@ class PhaseDiagramComponent(MPComponent):
 
             # PD update trigger
             if trigger["prop_id"] == self.id() + ".modified_timestamp":
-                table_content = self.create_table_content(self.from_data(pd))
+                table_content = self.create_table_content(
+                    self.from_data(pd, copy=False)
+                )
                 return table_content
             elif trigger["prop_id"] == self.id("editing-rows-button") + ".n_clicks":
                 if n_clicks > 0 and rows:
                     rows.append(self.empty_row)
                     return rows
 
-            with MPRester() as mpr:
-                entries = mpr.get_entries_in_chemsys(chemsys)
+            entries = self.get_entries_in_chemsys(chemsys)
 
-            pd = PhaseDiagram(entries)
+            pd = self.get_phase_diagram(entries)
             table_content = self.create_table_content(pd)
 
             return table_content
@@ -6,9 +6,14 @@ from dash.dependencies import Input, Output, State
 from dash.exceptions import PreventUpdate
 
 import numpy as np
+import os
 import re
 from pymatgen import MPRester
-from pymatgen.analysis.pourbaix_diagram import PourbaixDiagram, ELEMENTS_HO
+from pymatgen.analysis.pourbaix_diagram import (
+    PourbaixDiagram,
+    PourbaixEntry,
+    ELEMENTS_HO,
+)
 
 from crystal_toolkit.helpers.layouts import (
     MessageContainer,
@@ -16,6 +21,9 @@ from crystal_toolkit.helpers.layouts import (
 )  # layout helpers like `Columns` etc. (most subclass html.Div)
 from crystal_toolkit.core.mpcomponent import MPComponent
 from crystal_toolkit.core.panelcomponent import PanelComponent
+from crystal_toolkit.core.cache import LRUCache, get_hash
+
+from typing import Dict, List, Optional, Tuple
 
 
 __author__ = "Joseph Montoya"
@@ -24,11 +32,29 @@ __email__ = "joseph.montoya@tri.global"
 
 # TODO: fix bug for Pa, etc.
 
-SUPPORTED_N_ELEMENTS = 4
+# multi-element entries of larger systems are generated in parallel, see
+# PourbaixDiagramComponent.pourbaix_workers
+SUPPORTED_N_ELEMENTS = 5
 WIDTH = 700  # in px
 
 
 class PourbaixDiagramComponent(MPComponent):
+
+    # in-process cache of Pourbaix diagrams, in front of MPComponent.cache
+    pourbaix_diagram_cache = LRUCache(maxsize=32)
+
+    # heatmaps of decomposition energy, see get_heatmap
+    heatmap_cache = LRUCache(maxsize=32)
+    # heatmap resolution is chosen so that each grid point covers
+    # about this many pixels along each axis, see get_heatmap_resolution
+    heatmap_pixels_per_point = 4
+
+    # number of processes used to generate multi-element entries, for
+    # systems with at least min_elements_for_parallel non-OH elements, kept
+    # small since each diagram requested starts its own process pool
+    pourbaix_workers = min(4, os.cpu_count() or 1)
+    min_elements_for_parallel = 3
+
     def __init__(self, pourbaix_diagram=None, **kwargs):
         super().__init__(**kwargs)
         self.create_store("mpid")
@@ -43,7 +69,8 @@ class PourbaixDiagramComponent(MPComponent):
 
         self.create_store("conc_dict")
         self.create_store(
-            "pourbaix_diagram", initial_data=self.to_data(pourbaix_diagram)
+            "pourbaix_diagram",
+            initial_data=self.to_data(pourbaix_diagram, use_object_store=False),
         )
 
     default_plot_style = dict(
@@ -124,10 +151,155 @@ class PourbaixDiagramComponent(MPComponent):
         "Predicted Stable": None,
     }
 
+    @staticmethod
+    def get_heatmap_resolution(
+        ph_range: List[float], v_range: List[float]
+    ) -> Tuple[float, float]:
+        """
+        Choose the spacing of the heatmap grid so that each grid point covers
+        a similar area of the plot however far it is zoomed in. Spacings are
+        rounded down to 1, 2 or 5 times a power of ten, so that small changes
+        to the ranges give the same grid.
+
+        :param ph_range: pH range displayed
+        :param v_range: potential range displayed
+        :return: spacing of the grid in pH and in V
+        """
+
+        layout = PourbaixDiagramComponent.default_plot_style
+        points = (
+            (layout["width"] - layout["margin"]["l"] - layout["margin"]["r"])
+            / PourbaixDiagramComponent.heatmap_pixels_per_point,
+            (layout["height"] - layout["margin"]["t"] - layout["margin"]["b"])
+            / PourbaixDiagramComponent.heatmap_pixels_per_point,
+        )
+
+        default_ranges = (layout["xaxis"]["range"], layout["yaxis"]["range"])
+
+        resolution = []
+        for (lower, upper), default_range, n_points in zip(
+            (ph_range, v_range), default_ranges, points
+        ):
+            # a range of zero width has no sensible resolution, use the
+            # resolution of the default range instead
+            width = abs(upper - lower) or abs(default_range[1] - default_range[0])
+            step = width / n_points
+            magnitude = 10 ** np.floor(np.log10(step))
+            resolution.append(
+                max(m for m in (1, 2, 5) if m * magnitude <= step * (1 + 1e-9))
+                * magnitude
+            )
+
+        return tuple(resolution)
+
+    @staticmethod
+    def get_heatmap(
+        pourbaix_diagram: PourbaixDiagram,
+        heatmap_entry: PourbaixEntry,
+        ph_range: List[float],
+        v_range: List[float],
+        resolution: Tuple[float, float],
+        pourbaix_diagram_hash: Optional[str] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Decomposition energies of an entry on a grid, cached by the diagram,
+        entry, resolution and range. The grid is aligned to multiples of the
+        resolution, so that grids of overlapping ranges share grid points.
+
+        :param pourbaix_diagram: Pourbaix diagram
+        :param heatmap_entry: entry to calculate decomposition energies of
+        :param ph_range: pH range
+        :param v_range: potential range
+        :param resolution: spacing of the grid in pH and in V, see
+        get_heatmap_resolution
+        :param pourbaix_diagram_hash: get_data_hash of the data the diagram
+        was decoded from, if known, otherwise the diagram is serialized to
+        find its hash
+        :return: pH, potential and decomposition energy at each grid point
+        """
+
+        indices = [
+            (int(np.floor(min(r) / step)), int(np.ceil(max(r) / step)))
+            for r, step in zip((ph_range, v_range), resolution)
+        ]
+
+        if pourbaix_diagram_hash is None:
+            pourbaix_diagram_hash = MPComponent.get_data_hash(
+                MPComponent.to_data(pourbaix_diagram, use_object_store=False)
+            )
+        key = (
+            pourbaix_diagram_hash,
+            str(heatmap_entry.entry_id),
+            heatmap_entry.name,
+            heatmap_entry.energy,
+            tuple(resolution),
+            tuple(indices),
+        )
+
+        heatmap = PourbaixDiagramComponent.heatmap_cache.get(key)
+        if heatmap is not None:
+            return heatmap
+
+        ph_mesh, v_mesh = np.meshgrid(
+            *[
+                np.arange(start, stop + 1) * step
+                for (start, stop), step in zip(indices, resolution)
+            ]
+        )
+        decomposition_e = pourbaix_diagram.get_decomposition_energy(
+            heatmap_entry, ph_mesh, v_mesh
+        )
+
+        heatmap = (ph_mesh, v_mesh, decomposition_e)
+        PourbaixDiagramComponent.heatmap_cache.set(key, heatmap)
+
+        return heatmap
+
+    @staticmethod
+    def get_ranges(
+        relayout_data: Dict, figure: Optional[Dict] = None
+    ) -> Dict[str, Optional[List[float]]]:
+        """
+        Find the ranges to display from the relayoutData of the graph, e.g.
+        after zooming in. Zooming or panning along one axis only gives the
+        range of that axis, so the range of the other axis is taken from the
+        figure currently displayed, otherwise it would snap back to its
+        default range.
+
+        :param relayout_data: relayoutData of the graph
+        :param figure: figure currently displayed, as generated by get_figure
+        :return: dict of the "xaxis" (pH) and "yaxis" (potential) ranges, None
+        if the default range should be displayed
+        """
+
+        layout = figure.get("layout", {}) if isinstance(figure, dict) else {}
+
+        ranges = {}
+        for axis in ("xaxis", "yaxis"):
+            if f"{axis}.range[0]" in relayout_data:
+                ranges[axis] = [
+                    relayout_data[f"{axis}.range[0]"],
+                    relayout_data[f"{axis}.range[1]"],
+                ]
+            elif f"{axis}.range" in relayout_data:
+                ranges[axis] = relayout_data[f"{axis}.range"]
+            elif f"{axis}.autorange" in relayout_data:
+                ranges[axis] = None
+            else:
+                ranges[axis] = layout.get(axis, {}).get("range")
+
+        return ranges
+
     # TODO: why both plotter and pd
     @staticmethod
     def get_figure(
-        pourbaix_diagram, heatmap_entry=None, heatmap_as_contour=True, show_labels=True
+        pourbaix_diagram,
+        heatmap_entry=None,
+        heatmap_as_contour=True,
+        show_labels=True,
+        ph_range=None,
+        v_range=None,
+        pourbaix_diagram_hash=None,
     ):
         """
         Static method for getting plotly figure from a pourbaix diagram
@@ -136,6 +308,11 @@ class PourbaixDiagramComponent(MPComponent):
             pourbaix_diagram (PourbaixDiagram): pourbaix diagram to plot
             heatmap_entry (PourbaixEntry): id for the heatmap generation
             heatmap_as_contour (bool): if True, display contours, if False heatmap as grid
+            show_labels (bool): if True, label the stable domains
+            ph_range ([float, float]): pH range to display, by default -2 to 16
+            v_range ([float, float]): potential range to display, by default -2 to 4
+            pourbaix_diagram_hash (str): get_data_hash of the data the diagram
+                was decoded from, used to cache the heatmap, see get_heatmap
 
         Returns:
             (dict) figure layout
@@ -144,66 +321,60 @@ class PourbaixDiagramComponent(MPComponent):
         # TODO: fix mpid problem.  Can't attach from mpid without it being a structure.
         data = []
 
+        layout = PourbaixDiagramComponent.default_plot_style
+        ph_range = ph_range or layout["xaxis"]["range"]
+        v_range = v_range or layout["yaxis"]["range"]
+
         # Get data for heatmap
         if heatmap_entry is not None:
-            ph_range = np.arange(-2, 16.001, 0.1)
-            v_range = np.arange(-2, 4.001, 0.1)
-            ph_mesh, v_mesh = np.meshgrid(ph_range, v_range)
-            decomposition_e = pourbaix_diagram.get_decomposition_energy(
-                heatmap_entry, ph_mesh, v_mesh
+            ph_mesh, v_mesh, decomposition_e = PourbaixDiagramComponent.get_heatmap(
+                pourbaix_diagram,
+                heatmap_entry,
+                ph_range=ph_range,
+                v_range=v_range,
+                resolution=PourbaixDiagramComponent.get_heatmap_resolution(
+                    ph_range, v_range
+                ),
+                pourbaix_diagram_hash=pourbaix_diagram_hash,
             )
 
-            # Generate hoverinfo
-            hovertexts = []
-            for ph_val, v_val, de_val in zip(
-                ph_mesh.ravel(), v_mesh.ravel(), decomposition_e.ravel()
-            ):
-                hovertext = [
-                    "∆G<sub>pbx</sub>={:.2f}".format(de_val),
-                    "ph={:.2f}".format(ph_val),
-                    "V={:.2f}".format(v_val),
-                ]
-                hovertext = "<br>".join(hovertext)
-                hovertexts.append(hovertext)
-            hovertexts = np.reshape(hovertexts, list(decomposition_e.shape))
-
-            # Enforce decomposition limit energy
-            decomposition_e = np.min(
-                [decomposition_e, np.ones(decomposition_e.shape)], axis=0
+            # Plotly needs lists here for validation, values are rounded
+            # to reduce the size of the figure, z and customdata are left as
+            # arrays since validating nested lists is slow
+            heatmap_kwargs = dict(
+                x=np.round(ph_mesh[0], 4).tolist(),
+                y=np.round(v_mesh[:, 0], 4).tolist(),
+                # Enforce decomposition limit energy
+                z=np.round(np.minimum(decomposition_e, 1), 3),
+                # hover shows the energy before the limit is enforced
+                customdata=np.round(decomposition_e, 3),
+                hovertemplate=(
+                    "∆G<sub>pbx</sub>=%{customdata:.2f}<br>"
+                    "pH=%{x:.2f}<br>V=%{y:.2f}<extra></extra>"
+                ),
+                colorscale=PourbaixDiagramComponent.colorscale,
+                zmin=0,
+                zmax=1,
             )
 
             if not heatmap_as_contour:
-                # Plotly needs a list here for validation
                 hmap = go.Heatmap(
-                    x=list(ph_range),
-                    y=list(v_range),
-                    z=decomposition_e,
-                    text=hovertexts,
-                    hoverinfo="text",
                     colorbar={
                         "title": "∆G<sub>pbx</sub> (eV/atom)",
                         "titleside": "right",
                     },
-                    colorscale=PourbaixDiagramComponent.colorscale,
-                    zmin=0,
-                    zmax=1,
+                    **heatmap_kwargs,
                 )
                 data.append(hmap)
 
             else:
 
                 hmap = go.Contour(
-                    z=decomposition_e,
-                    x=list(ph_range),
-                    y=list(v_range),
-                    colorscale=PourbaixDiagramComponent.colorscale,  # or magma
-                    zmin=0,
-                    zmax=1,
                     connectgaps=True,
                     line_smoothing=0,
                     line_width=0,
                     contours_coloring="heatmap",
-                    text=hovertexts,
+                    **heatmap_kwargs,
                 )
                 data.insert(0, hmap)
 
@@ -250,8 +421,14 @@ class PourbaixDiagramComponent(MPComponent):
             )
             shapes.append(shape)
 
-        layout = PourbaixDiagramComponent.default_plot_style
-        layout.update({"shapes": shapes})
+        layout = dict(PourbaixDiagramComponent.default_plot_style)
+        layout.update(
+            {
+                "shapes": shapes,
+                "xaxis": dict(layout["xaxis"], range=list(ph_range)),
+                "yaxis": dict(layout["yaxis"], range=list(v_range)),
+            }
+        )
 
         if show_labels:
             if len(pourbaix_diagram.pbx_elts) == 1:
@@ -286,6 +463,81 @@ class PourbaixDiagramComponent(MPComponent):
         return figure
 
     # TODO: format formula
+    @staticmethod
+    def get_pourbaix_diagram(
+        pourbaix_entries: List[PourbaixEntry],
+        comp_dict: Optional[Dict[str, float]] = None,
+        conc_dict: Optional[Dict[str, float]] = None,
+        filter_solids: bool = True,
+    ) -> str:
+        """
+        Generating the multi-element entries of a Pourbaix diagram is
+        expensive, so diagrams are cached by chemical system, composition,
+        concentrations and filter options.
+
+        :param pourbaix_entries: entries for the chemical system
+        :param comp_dict: amounts of each non-OH element, by default equal
+        :param conc_dict: ion concentrations of each non-OH element in M, by
+        default 1e-6 M
+        :param filter_solids: whether to only include solids stable on the
+        compositional phase diagram
+        :return: the PourbaixDiagram, as returned by to_data
+        """
+
+        pbx_elts = sorted(
+            {
+                str(elt)
+                for entry in pourbaix_entries
+                for elt in entry.composition.elements
+                if elt not in ELEMENTS_HO
+            }
+        )
+
+        # normalize, so that equivalent inputs share a cache key, e.g. the
+        # composition of a supercell and of its primitive cell
+        comp_dict = comp_dict or {elt: 1 for elt in pbx_elts}
+        comp_dict = {
+            elt: float("{:.6g}".format(comp_dict[elt] / sum(comp_dict.values())))
+            for elt in sorted(comp_dict)
+        }
+        conc_dict = conc_dict or {elt: 1e-6 for elt in pbx_elts}
+        conc_dict = {
+            elt: float("{:.6g}".format(conc_dict[elt])) for elt in sorted(conc_dict)
+        }
+
+        key = "PourbaixDiagramComponent_{}_{}".format(
+            "-".join(pbx_elts), get_hash(comp_dict, conc_dict, filter_solids)
+        )
+
+        pourbaix_diagram_data = PourbaixDiagramComponent.pourbaix_diagram_cache.get(
+            key
+        )
+        if pourbaix_diagram_data is not None:
+            return MPComponent.store_data(pourbaix_diagram_data)
+
+        pourbaix_diagram_data = MPComponent.cache.get(key)
+
+        if pourbaix_diagram_data is None:
+            workers = PourbaixDiagramComponent.pourbaix_workers
+            if len(pbx_elts) < PourbaixDiagramComponent.min_elements_for_parallel:
+                workers = 1
+            pourbaix_diagram = PourbaixDiagram(
+                pourbaix_entries,
+                comp_dict=comp_dict,
+                conc_dict=conc_dict,
+                filter_solids=filter_solids,
+                nproc=workers if workers > 1 else None,
+            )
+            # decoding re-computes the stable domains, so keep the decoded object
+            pourbaix_diagram_data = MPComponent.to_data(
+                pourbaix_diagram, cache_decoded=True, use_object_store=False
+            )
+            MPComponent.cache.set(key, pourbaix_diagram_data)
+
+        PourbaixDiagramComponent.pourbaix_diagram_cache.set(key, pourbaix_diagram_data)
+
+        return MPComponent.store_data(pourbaix_diagram_data)
+
     @staticmethod
     def clean_formula(formula):
         # Superscript charges
@@ -400,6 +652,7 @@ class PourbaixDiagramComponent(MPComponent):
             else:
                 plot = [
                     dcc.Graph(
+                        id=self.id("pourbaix-graph"),
                         figure=figure,
                         config={"displayModeBar": False, "displaylogo": False},
                     )
@@ -413,10 +666,17 @@ class PourbaixDiagramComponent(MPComponent):
                 Input(self.id("pourbaix_display_options"), "value"),
                 Input(self.id("pourbaix_entries"), "data"),
                 Input(self.id("struct"), "data"),
+                Input(self.id("pourbaix-graph"), "relayoutData"),
             ],
+            [State(self.id("figure"), "data")],
         )
         def make_figure(
-            pourbaix_diagram, pourbaix_display_options, pourbaix_entries, struct
+            pourbaix_diagram,
+            pourbaix_display_options,
+            pourbaix_entries,
+            struct,
+            relayout_data,
+            displayed_figure,
         ):
             if pourbaix_entries == "too_many_elements":
                 return "too_many_elements"
@@ -426,8 +686,31 @@ class PourbaixDiagramComponent(MPComponent):
 
             pourbaix_display_options = pourbaix_display_options or []
 
-            pourbaix_diagram = self.from_data(pourbaix_diagram)
-            pourbaix_entries = self.from_data(pourbaix_entries)
+            # when zoomed in, the heatmap is re-computed at a finer resolution,
+            # and the figure keeps the ranges currently displayed
+            relayout_data = relayout_data or {}
+            ranges = self.get_ranges(relayout_data, figure=displayed_figure)
+
+            ctx = dash.callback_context
+            if (
+                ctx.triggered
+                and ctx.triggered[0]["prop_id"]
+                == self.id("pourbaix-graph") + ".relayoutData"
+                and (
+                    "show_heatmap" not in pourbaix_display_options
+                    or not any(
+                        key.startswith(("xaxis.", "yaxis.")) for key in relayout_data
+                    )
+                )
+            ):
+                # e.g. the graph has just been created, or there is no heatmap
+                # to re-compute
+                raise PreventUpdate
+
+            # cheap to find from the data, unlike from the decoded diagram
+            pourbaix_diagram_hash = self.get_data_hash(pourbaix_diagram)
+            pourbaix_diagram = self.from_data(pourbaix_diagram, copy=False)
+            pourbaix_entries = self.from_data(pourbaix_entries, copy=False)
 
             # Get heatmap id
             if "show_heatmap" in pourbaix_display_options:
@@ -446,7 +729,12 @@ class PourbaixDiagramComponent(MPComponent):
 
             show_labels = "show_labels" in pourbaix_display_options
             fig = self.get_figure(
-                pourbaix_diagram, heatmap_entry=heatmap_entry, show_labels=show_labels
+                pourbaix_diagram,
+                heatmap_entry=heatmap_entry,
+                show_labels=show_labels,
+                ph_range=ranges["xaxis"],
+                v_range=ranges["yaxis"],
+                pourbaix_diagram_hash=pourbaix_diagram_hash,
             )
             return fig
 
@@ -489,14 +777,14 @@ class PourbaixDiagramComponent(MPComponent):
             if conc_dict is not None:
                 conc_dict = self.from_data(conc_dict)
 
-            pourbaix_diagram = PourbaixDiagram(
+            pourbaix_diagram_data = self.get_pourbaix_diagram(
                 pourbaix_entries,
                 comp_dict=comp_dict,
                 conc_dict=conc_dict,
                 filter_solids=filter_solids,
             )
             self.logger.debug("Generated pourbaix diagram")
-            return self.to_data(pourbaix_diagram)
+            return pourbaix_diagram_data
 
         # Add arbitrary chemsys?
         @app.callback(
@@ -31,16 +31,26 @@ from palettable.colorbrewer.qualitative import Set1_9, Set2_8
 from typing import Dict, Union, Optional, List, Tuple
 
 from collections import defaultdict, OrderedDict
+from copy import deepcopy
 
 from itertools import combinations_with_replacement, chain
 import re
+from concurrent.futures import ProcessPoolExecutor
 
-from crystal_toolkit.core.scene import Scene, Spheres, Arrows
+from crystal_toolkit.core.scene import (
+    Scene,
+    Spheres,
+    Arrows,
+    get_scene_patch,
+    get_scene_skeleton,
+)
+from crystal_toolkit.core.cache import LRUCache, get_hash, get_structure_fingerprint
 
 import numpy as np
 
 # TODO: make dangling bonds "stubs"? (fixed length)
 
+
 EL_COLORS["VESTA"]["bcp"] = [0, 0, 255]
 EL_COLORS["VESTA"]["rcp"] = [255, 0, 0]
 EL_COLORS["VESTA"]["ccp"] = [255, 255, 0]
@@ -57,6 +67,13 @@ class StructureMoleculeComponent(MPComponent):
 
     default_scene_settings = {"cylinderScale": 0.1}
 
+    # in-process cache of bonding graphs, in front of MPComponent.cache
+    graph_cache = LRUCache(maxsize=64)
+
+    # sites are split between processes to find bonds only if there are at
+    # least this many of them, otherwise bonds are found serially
+    min_sites_for_parallel_bonding = 64
+
     def __init__(
         self,
         struct_or_mol=None,
@@ -74,8 +91,20 @@ class StructureMoleculeComponent(MPComponent):
         hide_incomplete_bonds=False,
         show_compass=True,
         scene_settings=None,
+        binary_transport=False,
+        bonding_workers=1,
         **kwargs,
     ):
+        """
+        :param binary_transport: if True, send scene positions and normals to
+        the browser as base64-encoded float32 buffers instead of nested JSON
+        lists, recommended for large structures and volumetric data
+        :param bonding_workers: number of processes to use to find bonds in
+        large structures, by default bonds are found in this process
+        """
+
+        self.binary_transport = binary_transport
+        self.bonding_workers = bonding_workers
 
         super().__init__(
             id=id, contents=struct_or_mol, origin_component=origin_component, **kwargs
@@ -130,6 +159,7 @@ class StructureMoleculeComponent(MPComponent):
                 struct_or_mol,
                 bonding_strategy=bonding_strategy,
                 bonding_strategy_kwargs=bonding_strategy_kwargs,
+                bonding_workers=self.bonding_workers,
             )
             scene, legend = self.get_scene_and_legend(
                 graph,
@@ -153,10 +183,20 @@ class StructureMoleculeComponent(MPComponent):
         self.initial_legend = legend
         self.create_store("legend_data", initial_data=self.initial_legend)
 
-        self.initial_scene_data = scene.to_json()
+        self.initial_scene_data = scene.to_json(binary=self.binary_transport)
 
         self.initial_graph = graph
-        self.create_store("graph", initial_data=self.to_data(graph))
+        self.create_store(
+            "graph", initial_data=self.to_data(graph, use_object_store=False)
+        )
+
+        # record a skeleton of the scene initially displayed, so that it can
+        # be patched when display options change, see update_scene_and_legend
+        self.create_store(
+            "displayed_scene",
+            initial_data=get_scene_skeleton(self.initial_scene_data),
+            to_data=False,
+        )
 
     def generate_callbacks(self, app, cache):
         @app.callback(
@@ -191,6 +231,7 @@ class StructureMoleculeComponent(MPComponent):
                 bonding_strategy_kwargs=graph_generation_options[
                     "bonding_strategy_kwargs"
                 ],
+                bonding_workers=self.bonding_workers,
             )
 
             self.logger.debug("Constructed graph")
@@ -198,17 +239,47 @@ class StructureMoleculeComponent(MPComponent):
             return self.to_data(graph)
 
         @app.callback(
-            [Output(self.id("scene"), "data"), Output(self.id("legend_data"), "data")],
+            [
+                Output(self.id("scene"), "data"),
+                Output(self.id("scene"), "patch"),
+                Output(self.id("legend_data"), "data"),
+                Output(self.id("displayed_scene"), "data"),
+            ],
             [
                 Input(self.id("graph"), "data"),
                 Input(self.id("display_options"), "data"),
+                Input(self.id("scene_additions"), "data"),
             ],
+            [State(self.id("displayed_scene"), "data")],
         )
-        def update_scene_and_legend(graph, display_options):
-            display_options = self.from_data(display_options)
-            graph = self.from_data(graph)
-            scene, legend = self.get_scene_and_legend(graph, **display_options)
-            return scene.to_json(), self.to_data(legend)
+        def update_scene_and_legend(
+            graph_data, display_options_data, scene_additions_data, displayed_scene
+        ):
+            display_options = self.from_data(display_options_data)
+            graph = self.from_data(graph_data)
+            scene, legend = self.get_scene_and_legend(
+                graph, name=self.id(), **display_options
+            )
+            scene_json = scene.to_json(binary=self.binary_transport)
+
+            # scene additions (e.g. isosurfaces of volumetric data) are stored
+            # as JSON already
+            scene_additions = self.from_data(scene_additions_data)
+            if scene_additions:
+                scene_json["contents"].append(scene_additions)
+
+            # if only display options have changed (e.g. radius scheme), the
+            # scene currently displayed can often be patched in place rather
+            # than re-sent and re-drawn, see get_scene_patch for when this is
+            # possible, only a skeleton of the displayed scene is kept to
+            # compare against
+            scene_skeleton = get_scene_skeleton(scene_json)
+            patch = get_scene_patch(displayed_scene, scene_skeleton)
+            if patch is not None:
+                self.logger.debug("Patching scene")
+                return dash.no_update, patch, self.to_data(legend), scene_skeleton
+
+            return scene_json, dash.no_update, self.to_data(legend), scene_skeleton
 
         @app.callback(
             Output(self.id("color-scheme"), "options"),
@@ -649,6 +720,7 @@ class StructureMoleculeComponent(MPComponent):
         input: Union[Structure, StructureGraph, Molecule, MoleculeGraph],
         bonding_strategy: str = "CrystalNN",
         bonding_strategy_kwargs: Optional[Dict] = None,
+        bonding_workers: int = 1,
     ) -> Union[StructureGraph, MoleculeGraph]:
 
         if isinstance(input, Structure):
@@ -688,6 +760,23 @@ class StructureMoleculeComponent(MPComponent):
                 )
             else:
                 bonding_strategy_kwargs = bonding_strategy_kwargs or {}
+
+                # near-neighbor analysis is expensive, so graphs are cached by
+                # the structure itself and how its bonds were determined
+                cache_key = StructureMoleculeComponent._get_graph_cache_key(
+                    input, bonding_strategy, bonding_strategy_kwargs
+                )
+                graph = StructureMoleculeComponent.graph_cache.get(cache_key)
+                if graph is None:
+                    graph_data = MPComponent.cache.get(cache_key)
+                    if graph_data is not None:
+                        graph = MPComponent.from_data(graph_data)
+                        StructureMoleculeComponent.graph_cache.set(cache_key, graph)
+                if graph is not None:
+                    # cached graphs are shared, so return a copy that can be
+                    # modified safely
+                    return deepcopy(graph)
+
                 if bonding_strategy == "CutOffDictNN":
                     if "cut_off_dict" in bonding_strategy_kwargs:
                         # TODO: remove this hack by making args properly JSON serializable
@@ -702,22 +791,105 @@ class StructureMoleculeComponent(MPComponent):
                 )
                 try:
                     if isinstance(input, Structure):
-                        graph = StructureGraph.with_local_env_strategy(
-                            input, bonding_strategy
+                        graph = StructureMoleculeComponent._get_structure_graph(
+                            input, bonding_strategy, workers=bonding_workers
                         )
                     else:
                         graph = MoleculeGraph.with_local_env_strategy(
                             input, bonding_strategy
                         )
-                except:
-                    # for some reason computing bonds failed, so let's not have any bonds(!)
+                except Exception as exc:
+                    # for some reason computing bonds failed, so let's not have
+                    # any bonds(!), this graph is not cached since the failure
+                    # may not happen next time
+                    warnings.warn(f"Could not compute bonds: {exc}")
                     if isinstance(input, Structure):
-                        graph = StructureGraph.with_empty_graph(input)
+                        return StructureGraph.with_empty_graph(input)
                     else:
-                        graph = MoleculeGraph.with_empty_graph(input)
+                        return MoleculeGraph.with_empty_graph(input)
+
+                StructureMoleculeComponent.graph_cache.set(cache_key, deepcopy(graph))
+                MPComponent.cache.set(
+                    cache_key, MPComponent.to_data(graph, use_object_store=False)
+                )
 
         return graph
 
+    @staticmethod
+    def _get_nn_info(args):
+        """
+        Process pool worker, returns the neighbors of each of the given site
+        indices. Only the information needed to construct a graph is returned
+        since returning the neighboring sites themselves is expensive.
+        """
+        structure, strategy, site_indices = args
+        return [
+            [
+                (nn["site_index"], tuple(int(i) for i in nn["image"]), nn["weight"])
+                for nn in strategy.get_nn_info(structure, n)
+            ]
+            for n in site_indices
+        ]
+
+    @staticmethod
+    def _get_structure_graph(
+        structure: Structure, strategy: NearNeighbors, workers: int = 1
+    ) -> StructureGraph:
+        """
+        Equivalent to StructureGraph.with_local_env_strategy, except that
+        bonds are found in parallel for large structures if workers is
+        greater than one.
+        """
+
+        if (
+            workers <= 1
+            or len(structure)
+            < StructureMoleculeComponent.min_sites_for_parallel_bonding
+        ):
+            return StructureGraph.with_local_env_strategy(structure, strategy)
+
+        chunks = np.array_split(np.arange(len(structure)), workers)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            all_nn_info = chain.from_iterable(
+                executor.map(
+                    StructureMoleculeComponent._get_nn_info,
+                    [(structure, strategy, chunk.tolist()) for chunk in chunks],
+                )
+            )
+
+            graph = StructureGraph.with_empty_graph(
+                structure, name="bonds", edge_weight_name="weight", edge_weight_units=""
+            )
+            for n, neighbors in enumerate(all_nn_info):
+                for site_index, image, weight in neighbors:
+                    # edges are found from both sites of each bond,
+                    # so duplicates are expected
+                    graph.add_edge(
+                        from_index=n,
+                        from_jimage=(0, 0, 0),
+                        to_index=site_index,
+                        to_jimage=image,
+                        weight=weight,
+                        warn_duplicates=False,
+                    )
+
+        return graph
+
+    @staticmethod
+    def _get_graph_cache_key(
+        struct_or_mol: Union[Structure, Molecule],
+        bonding_strategy: str,
+        bonding_strategy_kwargs: Dict,
+    ) -> str:
+        # site properties are included since they can change how the graph
+        # is displayed, e.g. when coloring by magmom
+        return "StructureMoleculeComponent_graph_{}_{}_{}".format(
+            get_structure_fingerprint(struct_or_mol, site_properties=True),
+            bonding_strategy,
+            get_hash(bonding_strategy_kwargs),
+        )
+
     @staticmethod
     def _get_struct_or_mol(
         graph: Union[StructureGraph, MoleculeGraph]
@@ -0,0 +1,133 @@
+import json
+import os
+
+from tempfile import TemporaryDirectory
+from threading import Barrier, Thread
+
+import numpy as np
+
+from flask import Flask
+from monty.json import MontyEncoder
+from requests.exceptions import Timeout
+from werkzeug.serving import make_server
+
+from crystal_toolkit.components.bs import BandstructureAndDosComponent
+
+from pymatgen import MPRester, Structure, Lattice
+from pymatgen.electronic_structure.bandstructure import BandStructureSymmLine
+from pymatgen.electronic_structure.core import Spin
+from pymatgen.electronic_structure.dos import CompleteDos, Dos
+
+
+def make_api_server(data):
+    """
+    A stand-in for the Materials Project REST API, serving the properties
+    MPRester.get_data requests.
+
+    :param data: a dict of mpid to a dict of property name to value
+    :return: the server, with a list of the requests made as server.requests
+    """
+
+    app = Flask(__name__)
+    requests = []
+    # requests for the band structure and DOS can only both be answered if
+    # they are made at the same time
+    barrier = Barrier(2)
+
+    @app.route("/materials/<mpid>/vasp/<prop>")
+    def get_data(mpid, prop):
+        requests.append((mpid, prop))
+        barrier.wait(timeout=10)
+        response = [{prop: data[mpid][prop]}] if mpid in data else []
+        return json.dumps(
+            {"valid_response": True, "response": response}, cls=MontyEncoder
+        )
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    server.requests = requests
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+class TestBandstructureAndDos:
+    def setup_method(self, method):
+
+        struct = Structure(Lattice.cubic(4.2), ["Na", "Cl"], [[0, 0, 0], [0.5] * 3])
+
+        kpoints = [[x, 0, 0] for x in np.linspace(0, 0.5, 11)]
+        eigenvals = {Spin.up: np.random.RandomState(0).rand(4, len(kpoints))}
+        self.bs = BandStructureSymmLine(
+            kpoints,
+            eigenvals,
+            struct.lattice.reciprocal_lattice,
+            efermi=0.5,
+            labels_dict={"\\Gamma": [0, 0, 0], "X": [0.5, 0, 0]},
+            structure=struct,
+        )
+
+        energies = np.linspace(-5, 5, 101)
+        total_dos = Dos(0.5, energies, {Spin.up: np.exp(-energies ** 2)})
+        self.dos = CompleteDos(struct, total_dos, {})
+
+        self.server = make_api_server(
+            {"mp-22862": {"bandstructure": self.bs, "dos": self.dos}}
+        )
+
+        self.tempdir = TemporaryDirectory()
+        self.data_directory = BandstructureAndDosComponent.data_directory
+        BandstructureAndDosComponent.mprester_endpoint = (
+            f"http://127.0.0.1:{self.server.server_port}"
+        )
+        BandstructureAndDosComponent.data_directory = self.tempdir.name
+
+    def teardown_method(self, method):
+        BandstructureAndDosComponent.mprester_endpoint = None
+        BandstructureAndDosComponent.data_directory = self.data_directory
+        self.server.shutdown()
+        self.tempdir.cleanup()
+
+    def test_get_bs_dos(self):
+
+        bs, dos = BandstructureAndDosComponent.get_bs_dos("mp-22862")
+
+        assert sorted(self.server.requests) == [
+            ("mp-22862", "bandstructure"),
+            ("mp-22862", "dos"),
+        ]
+        assert np.allclose(bs.bands[Spin.up], self.bs.bands[Spin.up])
+        assert np.allclose(dos.densities[Spin.up], self.dos.densities[Spin.up])
+        assert os.path.exists(os.path.join(self.tempdir.name, "mp-22862.json.gz"))
+
+        # now read from disk, without any further requests
+        bs, dos = BandstructureAndDosComponent.get_bs_dos("mp-22862")
+
+        assert len(self.server.requests) == 2
+        assert isinstance(bs, BandStructureSymmLine)
+        assert isinstance(dos, CompleteDos)
+        assert np.allclose(bs.bands[Spin.up], self.bs.bands[Spin.up])
+
+    def test_not_available(self):
+
+        assert BandstructureAndDosComponent.get_bs_dos("mp-0") == (None, None)
+
+        # missing data is requested again, since it may become available
+        BandstructureAndDosComponent.get_bs_dos("mp-0")
+        assert len(self.server.requests) == 4
+        assert not os.listdir(self.tempdir.name)
+
+    def test_invalid_mpid(self):
+
+        for mpid in ("mp-22862\n", "../mp-22862", "mp-22862/dos"):
+            assert BandstructureAndDosComponent.get_bs_dos(mpid) == (None, None)
+        assert not self.server.requests
+
+    def test_connection_error(self, monkeypatch):
+        def timeout(self, mpid):
+            raise Timeout("the API did not respond")
+
+        monkeypatch.setattr(MPRester, "get_bandstructure_by_material_id", timeout)
+        monkeypatch.setattr(MPRester, "get_dos_by_material_id", timeout)
+
+        assert BandstructureAndDosComponent.get_bs_dos("mp-22862") == (None, None)
+        assert not os.listdir(self.tempdir.name)
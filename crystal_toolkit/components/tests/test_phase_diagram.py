@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from crystal_toolkit.components.phase_diagram import PhaseDiagramComponent
+from crystal_toolkit.helpers.incremental_hull import SUPPORTS_COMPUTED_DATA
+
+from pymatgen.analysis.phase_diagram import PhaseDiagram, PDEntry
+from pymatgen.core.composition import Composition
+
+
+class TestPhaseDiagramCache:
+    def setup_method(self, method):
+
+        PhaseDiagramComponent.phase_diagram_cache.clear()
+        PhaseDiagramComponent.hulls.clear()
+
+        random_state = np.random.RandomState(0)
+
+        chemsys = ["Li", "Fe", "O"]
+        self.entries = [PDEntry(Composition(el), 0) for el in chemsys]
+        while len(self.entries) < 40:
+            amounts = random_state.randint(0, 5, len(chemsys))
+            if not amounts.any():
+                continue
+            comp = Composition(dict(zip(chemsys, amounts)))
+            energy = comp.num_atoms * (random_state.rand() - 1.5)
+            self.entries.append(PDEntry(comp, energy))
+
+    @pytest.mark.skipif(
+        not SUPPORTS_COMPUTED_DATA, reason="requires PhaseDiagram computed_data"
+    )
+    def test_incremental_update(self):
+
+        PhaseDiagramComponent.get_phase_diagram(self.entries[:-2])
+        previous_entries_key = PhaseDiagramComponent.get_entries_key(self.entries[:-2])
+
+        hits = PhaseDiagramComponent.hulls.info()["hits"]
+        pd = PhaseDiagramComponent.get_phase_diagram(
+            self.entries, previous_entries_key=previous_entries_key
+        )
+        # the previous hull was updated, rather than a new hull computed
+        assert PhaseDiagramComponent.hulls.info()["hits"] == hits + 1
+
+        expected_pd = PhaseDiagram(self.entries)
+        assert set(pd.stable_entries) == set(expected_pd.stable_entries)
+        for entry in self.entries:
+            assert np.isclose(
+                pd.get_e_above_hull(entry), expected_pd.get_e_above_hull(entry)
+            )
@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from crystal_toolkit.components.pourbaix import PourbaixDiagramComponent
+from crystal_toolkit.core.mpcomponent import MPComponent
+
+from pymatgen.analysis.pourbaix_diagram import PourbaixEntry, IonEntry
+from pymatgen.core.ion import Ion
+from pymatgen.entries.computed_entries import ComputedEntry
+
+
+def get_fe_cr_entries():
+
+    solids = {"Fe": 0, "Cr": 0, "Fe2O3": -8.5, "Cr2O3": -11.8, "FeCr2O4": -15.2}
+    ions = {"Fe[2+]": -0.8, "Fe[3+]": -0.05, "Cr[3+]": -2.1, "CrO4[2-]": -7.5}
+
+    return [
+        PourbaixEntry(ComputedEntry(formula, energy))
+        for formula, energy in solids.items()
+    ] + [
+        PourbaixEntry(IonEntry(Ion.from_formula(formula), energy))
+        for formula, energy in ions.items()
+    ]
+
+
+class TestPourbaixCache:
+    def setup_method(self, method):
+
+        PourbaixDiagramComponent.pourbaix_diagram_cache.clear()
+        self.entries = get_fe_cr_entries()
+
+    def test_get_pourbaix_diagram(self):
+
+        data = PourbaixDiagramComponent.get_pourbaix_diagram(
+            self.entries,
+            comp_dict={"Fe": 1, "Cr": 2},
+            conc_dict={"Fe": 1e-6, "Cr": 1e-6},
+        )
+        assert MPComponent.from_data(data).stable_entries
+
+        hits = PourbaixDiagramComponent.pourbaix_diagram_cache.info()["hits"]
+
+        # equivalent compositions and concentrations share a cached diagram
+        assert (
+            PourbaixDiagramComponent.get_pourbaix_diagram(
+                self.entries,
+                comp_dict={"Cr": 4, "Fe": 2},
+                conc_dict={"Cr": 1.0000000001e-6, "Fe": 1e-6},
+            )
+            == data
+        )
+        assert (
+            PourbaixDiagramComponent.pourbaix_diagram_cache.info()["hits"] == hits + 1
+        )
+
+        assert (
+            PourbaixDiagramComponent.get_pourbaix_diagram(
+                self.entries,
+                comp_dict={"Fe": 1, "Cr": 2},
+                conc_dict={"Fe": 1e-4, "Cr": 1e-6},
+            )
+            != data
+        )
+
+
+class TestPourbaixHeatmap:
+    def setup_method(self, method):
+
+        PourbaixDiagramComponent.heatmap_cache.clear()
+
+        self.data = PourbaixDiagramComponent.get_pourbaix_diagram(
+            get_fe_cr_entries(),
+            comp_dict={"Fe": 1, "Cr": 2},
+            conc_dict={"Fe": 1e-6, "Cr": 1e-6},
+        )
+        self.pourbaix_diagram = MPComponent.from_data(self.data)
+        self.heatmap_entry = self.pourbaix_diagram.stable_entries[0]
+
+    def test_get_heatmap_resolution(self):
+
+        assert PourbaixDiagramComponent.get_heatmap_resolution(
+            [-2, 16], [-2, 4]
+        ) == pytest.approx((0.1, 0.05))
+
+        # zoomed in, the resolution is finer
+        assert PourbaixDiagramComponent.get_heatmap_resolution(
+            [6, 7.8], [0, 0.6]
+        ) == pytest.approx((0.01, 0.005))
+
+        # a range of zero width has the resolution of the default range
+        assert PourbaixDiagramComponent.get_heatmap_resolution(
+            [7, 7], [1, 1]
+        ) == pytest.approx((0.1, 0.05))
+
+    def test_get_heatmap(self):
+
+        kwargs = dict(ph_range=[0, 14], v_range=[-1, 1], resolution=(0.5, 0.25))
+        pourbaix_diagram_hash = MPComponent.get_data_hash(self.data)
+
+        ph_mesh, v_mesh, decomposition_e = PourbaixDiagramComponent.get_heatmap(
+            self.pourbaix_diagram,
+            self.heatmap_entry,
+            pourbaix_diagram_hash=pourbaix_diagram_hash,
+            **kwargs,
+        )
+        assert ph_mesh.shape == v_mesh.shape == decomposition_e.shape == (9, 29)
+        assert np.all(decomposition_e >= -1e-6)
+
+        hits = PourbaixDiagramComponent.heatmap_cache.info()["hits"]
+
+        # the diagram is not serialized again when its hash is given
+        with patch.object(MPComponent, "to_data", side_effect=AssertionError):
+            heatmap = PourbaixDiagramComponent.get_heatmap(
+                self.pourbaix_diagram,
+                self.heatmap_entry,
+                pourbaix_diagram_hash=pourbaix_diagram_hash,
+                **kwargs,
+            )
+        assert heatmap[2] is decomposition_e
+        assert PourbaixDiagramComponent.heatmap_cache.info()["hits"] == hits + 1
+
+        # a different resolution is a different heatmap
+        PourbaixDiagramComponent.get_heatmap(
+            self.pourbaix_diagram,
+            self.heatmap_entry,
+            pourbaix_diagram_hash=pourbaix_diagram_hash,
+            **dict(kwargs, resolution=(1, 0.5)),
+        )
+        assert PourbaixDiagramComponent.heatmap_cache.info()["hits"] == hits + 1
+
+
+class TestPourbaixRanges:
+    def test_get_ranges(self):
+
+        # as generated by get_figure
+        figure = {
+            "data": [],
+            "layout": {"xaxis": {"range": [6, 8]}, "yaxis": {"range": [0, 1]}},
+        }
+
+        assert PourbaixDiagramComponent.get_ranges(
+            {"xaxis.range[0]": 2, "xaxis.range[1]": 4, "yaxis.range": [-1, 0]},
+            figure=figure,
+        ) == {"xaxis": [2, 4], "yaxis": [-1, 0]}
+
+        # zooming along one axis keeps the range displayed along the other
+        assert PourbaixDiagramComponent.get_ranges(
+            {"xaxis.range[0]": 2, "xaxis.range[1]": 4}, figure=figure
+        ) == {"xaxis": [2, 4], "yaxis": [0, 1]}
+
+        # reset to the default range
+        assert PourbaixDiagramComponent.get_ranges(
+            {"xaxis.autorange": True, "yaxis.autorange": True}, figure=figure
+        ) == {"xaxis": None, "yaxis": None}
+
+        # e.g. the graph has just been created
+        assert PourbaixDiagramComponent.get_ranges({"autosize": True}) == {
+            "xaxis": None,
+            "yaxis": None,
+        }
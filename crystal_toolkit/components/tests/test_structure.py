@@ -0,0 +1,139 @@
+from crystal_toolkit.components.structure import StructureMoleculeComponent
+from crystal_toolkit.core.scene import get_scene_patch, get_scene_skeleton
+
+from pymatgen import Structure, Lattice
+from pymatgen.analysis.local_env import MinimumDistanceNN
+
+
+class TestGraphCache:
+    def setup_method(self, method):
+
+        self.structure = Structure(
+            Lattice.cubic(4.2), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]
+        )
+        StructureMoleculeComponent.graph_cache.clear()
+
+    def test_cached_graph_is_copied(self):
+
+        graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            self.structure, bonding_strategy="MinimumDistanceNN"
+        )
+        assert len(StructureMoleculeComponent.graph_cache) == 1
+
+        # modifying a returned graph does not modify the cached graph
+        graph.graph.remove_edges_from(list(graph.graph.edges))
+        cached_graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            self.structure, bonding_strategy="MinimumDistanceNN"
+        )
+        assert cached_graph is not graph
+        assert len(cached_graph.graph.edges) > 0
+
+    def test_site_properties(self):
+
+        graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            self.structure, bonding_strategy="MinimumDistanceNN"
+        )
+
+        # the same structure with different magmoms is a different graph
+        structure = self.structure.copy(site_properties={"magmom": [1, -1]})
+        magnetic_graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            structure, bonding_strategy="MinimumDistanceNN"
+        )
+
+        assert "magmom" not in graph.structure.site_properties
+        assert magnetic_graph.structure.site_properties["magmom"] == [1, -1]
+        assert len(StructureMoleculeComponent.graph_cache) == 2
+
+    def test_failure_is_not_cached(self, monkeypatch):
+        def fail(structure, strategy, workers=1):
+            # any error from a NearNeighbors strategy, not only a ValueError
+            raise ZeroDivisionError("bonding failed")
+
+        monkeypatch.setattr(
+            StructureMoleculeComponent, "_get_structure_graph", staticmethod(fail)
+        )
+        graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            self.structure, bonding_strategy="MinimumDistanceNN"
+        )
+        assert len(graph.graph.edges) == 0
+        assert len(StructureMoleculeComponent.graph_cache) == 0
+
+        # bonds are found once bonding succeeds again
+        monkeypatch.undo()
+        graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            self.structure, bonding_strategy="MinimumDistanceNN"
+        )
+        assert len(graph.graph.edges) > 0
+
+
+class TestParallelBonding:
+    def setup_method(self, method):
+
+        self.structure = Structure(
+            Lattice.cubic(4.2), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]
+        )
+        self.structure.make_supercell([4, 4, 4])
+
+    def test_same_graph(self):
+
+        def get_edges(graph):
+            return {
+                (u, v, tuple(d["to_jimage"]))
+                for u, v, d in graph.graph.edges(data=True)
+            }
+
+        strategy = MinimumDistanceNN()
+        serial_graph = StructureMoleculeComponent._get_structure_graph(
+            self.structure, strategy
+        )
+        parallel_graph = StructureMoleculeComponent._get_structure_graph(
+            self.structure, strategy, workers=2
+        )
+
+        assert len(self.structure) >= (
+            StructureMoleculeComponent.min_sites_for_parallel_bonding
+        )
+        # each site has 8 nearest neighbors
+        assert len(serial_graph.graph.edges) == 8 * len(self.structure) // 2
+        assert get_edges(parallel_graph) == get_edges(serial_graph)
+
+
+class TestScenePatch:
+    def setup_method(self, method):
+
+        structure = Structure(
+            Lattice.cubic(4.2),
+            ["Na", "Na", "Cl", "Cl"],
+            [[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0], [0, 0.5, 0]],
+            site_properties={"magmom": [1, -1, 0, 0]},
+        )
+        self.graph = StructureMoleculeComponent._preprocess_input_to_graph(
+            structure, bonding_strategy="MinimumDistanceNN"
+        )
+
+    def get_skeleton(self, **display_options):
+        scene, legend = StructureMoleculeComponent.get_scene_and_legend(
+            self.graph, **display_options
+        )
+        return get_scene_skeleton(scene.to_json())
+
+    def test_patchable(self):
+
+        displayed = self.get_skeleton(color_scheme="Jmol", radius_strategy="uniform")
+
+        # sites are still grouped by element
+        for display_options in [
+            {"color_scheme": "Jmol", "radius_strategy": "atomic"},
+            {"color_scheme": "VESTA", "radius_strategy": "uniform"},
+        ]:
+            patch = get_scene_patch(displayed, self.get_skeleton(**display_options))
+            assert patch is not None
+            assert len(patch["updates"]) > 0
+
+    def test_not_patchable(self):
+
+        displayed = self.get_skeleton(color_scheme="Jmol", radius_strategy="uniform")
+
+        # sodium sites now have different colors
+        scene = self.get_skeleton(color_scheme="magmom", radius_strategy="uniform")
+        assert get_scene_patch(displayed, scene) is None
@@ -0,0 +1,125 @@
+import math
+
+import numpy as np
+import pytest
+
+from dash.exceptions import PreventUpdate
+
+from crystal_toolkit.components.xrd import XRayDiffractionComponent
+
+
+def _broaden_reference(x, x_peaks, y_peaks, grain_size, K, peak_profile, N_density):
+    # original peak-by-peak, point-by-point implementation
+
+    num_sigma = {"G": 5, "L": 12, "V": 12}[peak_profile]
+    first = x_peaks[0]
+    N = len(x)
+    y = np.zeros(N).tolist()
+
+    for xp, yp in zip(x_peaks, y_peaks):
+        alpha = XRayDiffractionComponent.grain_to_hwhm(
+            grain_size, math.radians(xp / 2), K=K
+        )
+        sigma = (alpha / np.sqrt(2 * np.log(2))).item()
+
+        center_idx = int(round((xp - first) * N_density))
+        half_window = int(round(num_sigma * sigma * N_density))
+
+        lb = max([0, (center_idx - half_window)])
+        ub = min([N, (center_idx + half_window)])
+
+        profile = getattr(XRayDiffractionComponent, peak_profile)
+        G0 = profile(0, 0, alpha)
+        for i in range(lb, ub):
+            y[i] += yp * profile(x[i], xp, alpha) / G0
+
+    return y
+
+
+class TestBroaden:
+    def setup_method(self, method):
+
+        rng = np.random.RandomState(0)
+        self.x_peaks = np.sort(rng.uniform(10, 90, 100)).tolist()
+        self.y_peaks = rng.uniform(0, 100, 100).tolist()
+
+    def test_broaden(self):
+
+        for peak_profile in ("G", "L", "V"):
+            for logsize in (0, 1.5):
+
+                N_density = 150 * (logsize ** 4) if logsize > 1 else 150
+                N = int(N_density * (self.x_peaks[-1] - self.x_peaks[0]))
+                x = np.linspace(self.x_peaks[0], self.x_peaks[-1], N)
+
+                hwhms = XRayDiffractionComponent.grain_to_hwhm(
+                    10 ** logsize, np.radians(np.divide(self.x_peaks, 2)), K=0.94
+                )
+                y = XRayDiffractionComponent.broaden(
+                    x,
+                    self.x_peaks,
+                    self.y_peaks,
+                    hwhms,
+                    peak_profile=peak_profile,
+                    N_density=N_density,
+                    num_sigma={"G": 5, "L": 12, "V": 12}[peak_profile],
+                )
+
+                y_reference = _broaden_reference(
+                    x.tolist(),
+                    self.x_peaks,
+                    self.y_peaks,
+                    10 ** logsize,
+                    0.94,
+                    peak_profile,
+                    N_density,
+                )
+
+                assert np.allclose(y, y_reference, rtol=1e-12, atol=1e-12)
+
+
+class TestDownsample:
+    def test_downsample(self):
+
+        x = np.linspace(0, 90, 200001)
+        y = 100 * np.exp(-(((x - 45.123) / 0.01) ** 2)) + 50 * np.exp(
+            -(((x - 10) / 0.002) ** 2)
+        )
+
+        x_downsampled, y_downsampled = XRayDiffractionComponent.downsample(x, y, 4000)
+
+        assert len(x_downsampled) <= 4000
+        assert np.all(np.diff(x_downsampled) > 0)
+
+        # peaks should be preserved, even narrow ones
+        assert y_downsampled.max() == y.max()
+        assert y_downsampled[np.abs(x_downsampled - 10) < 0.01].max() == (
+            y[np.abs(x - 10) < 0.01].max()
+        )
+
+        # short traces are unchanged
+        assert len(XRayDiffractionComponent.downsample(x[:100], y[:100], 4000)[0]) == 100
+
+
+class TestXRange:
+    def test_zoom_then_change_source(self):
+
+        relayout_data = {"xaxis.range[0]": 20, "xaxis.range[1]": 30}
+        assert XRayDiffractionComponent.get_x_range(relayout_data, relayout=True) == [
+            20,
+            30,
+        ]
+
+        # relayoutData keeps the last zoom, but the new pattern is shown in full
+        assert XRayDiffractionComponent.get_x_range(relayout_data) is None
+
+        assert (
+            XRayDiffractionComponent.get_x_range(
+                {"xaxis.autorange": True}, relayout=True
+            )
+            is None
+        )
+        with pytest.raises(PreventUpdate):
+            XRayDiffractionComponent.get_x_range(
+                {"yaxis.range[0]": 0, "yaxis.range[1]": 1}, relayout=True
+            )
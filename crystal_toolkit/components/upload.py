@@ -7,17 +7,22 @@ from dash.exceptions import PreventUpdate
 
 from crystal_toolkit.core.mpcomponent import MPComponent
 from crystal_toolkit.helpers.layouts import *
+from crystal_toolkit.helpers.volumetric_store import VolumetricDataStore
 
 from tempfile import NamedTemporaryFile
 from base64 import b64decode
+from hashlib import sha1
 
 from pymatgen.core.structure import Structure, Molecule
-from pymatgen.io.vasp.outputs import Chgcar
 
 from monty.serialization import loadfn
 
 
 class StructureMoleculeUploadComponent(MPComponent):
+
+    # volumetric data is too large to keep in a Store, so is saved to disk
+    volumetric_store = VolumetricDataStore()
+
     @property
     def all_layouts(self):
 
@@ -123,7 +128,10 @@ class StructureMoleculeUploadComponent(MPComponent):
                         data = self.to_data(struct_or_mol)
                     except:
                         try:
-                            struct_or_mol = Chgcar.from_file(tmp.name)
+                            handle = self.volumetric_store.add(
+                                tmp.name, key=sha1(decoded_contents).hexdigest()
+                            )
+                            data = self.to_data(handle)
                         except:
                             # TODO: fix these horrible try/excepts, loadfn may be dangerous
                             try:
@@ -1,7 +1,6 @@
 import dash
 import dash_core_components as dcc
 import dash_html_components as html
-import math
 import numpy as np
 from scipy.special import wofz
 import plotly.graph_objs as go
@@ -15,6 +14,7 @@ from pymatgen.analysis.diffraction.xrd import XRDCalculator, WAVELENGTHS
 
 from crystal_toolkit.helpers.layouts import *
 from crystal_toolkit.core.mpcomponent import MPComponent
+from crystal_toolkit.core.cache import LRUCache, get_hash, get_structure_fingerprint
 from crystal_toolkit.core.panelcomponent import PanelComponent, PanelComponent2
 
 
@@ -23,15 +23,25 @@ from crystal_toolkit.core.panelcomponent import PanelComponent, PanelComponent2
 
 
 class XRayDiffractionComponent(MPComponent):
+
+    default_xrdcalculator_kwargs = {
+        "wavelength": "CuKa",
+        "symprec": 0,
+        "debye_waller_factors": None,
+    }
+
+    # in-process cache of patterns, in front of MPComponent.cache
+    pattern_cache = LRUCache(maxsize=64)
+
+    # maximum number of points sent to the plot for the broadened profile,
+    # a few times the width of the plot in pixels is ample
+    max_profile_points = 4000
+
     def __init__(self, *args, initial_structure=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.create_store("struct", initial_data=initial_structure)
 
-        self.initial_xrdcalculator_kwargs = {
-            "wavelength": "CuKa",
-            "symprec": 0,
-            "debye_waller_factors": None,
-        }
+        self.initial_xrdcalculator_kwargs = dict(self.default_xrdcalculator_kwargs)
         self.create_store(
             "xrdcalculator_kwargs", initial_data=self.initial_xrdcalculator_kwargs
         )
@@ -106,7 +116,8 @@ class XRayDiffractionComponent(MPComponent):
             sigma * np.sqrt(2 * np.pi)
         )
 
-    def grain_to_hwhm(self, tau, two_theta, K=0.9, wavelength="CuKa"):
+    @staticmethod
+    def grain_to_hwhm(tau, two_theta, K=0.9, wavelength="CuKa"):
         """
         :param tau: grain size in nm
         :param theta: angle (in 2-theta)
@@ -119,6 +130,208 @@ class XRayDiffractionComponent(MPComponent):
             0.5 * K * 0.1 * wavelength / (tau * abs(np.cos(two_theta / 2)))
         )  # Scherrer equation for half-width half max
 
+    @staticmethod
+    def get_pattern(struct, xrdcalculator_kwargs):
+        """
+        Calculate the diffraction pattern of the conventional standard
+        structure. Patterns are cached by structure and calculator kwargs.
+
+        :param struct: Structure
+        :param xrdcalculator_kwargs: kwargs for XRDCalculator
+        :return: DiffractionPattern as a dict
+        """
+
+        key = "XRayDiffractionComponent_pattern_{}_{}".format(
+            get_structure_fingerprint(struct), get_hash(xrdcalculator_kwargs)
+        )
+
+        pattern = XRayDiffractionComponent.pattern_cache.get(key)
+        if pattern is None:
+            pattern = MPComponent.cache.get(key)
+        if pattern is None:
+            sga = SpacegroupAnalyzer(struct)
+            struct = (
+                sga.get_conventional_standard_structure()
+            )  # always get conventional structure
+
+            xrdc = XRDCalculator(**xrdcalculator_kwargs)
+            pattern = xrdc.get_pattern(struct, two_theta_range=None).as_dict()
+            MPComponent.cache.set(key, pattern)
+
+        XRayDiffractionComponent.pattern_cache.set(key, pattern)
+
+        return pattern
+
+    @classmethod
+    def get_profile(
+        cls, x_peaks, y_peaks, logsize=0, K=0.94, wavelength="CuKa", peak_profile="G"
+    ):
+        """
+        Broaden a diffraction pattern into a continuous profile, with peak
+        widths given by the Scherrer equation.
+
+        :param x_peaks: peak positions (2-theta, in degrees)
+        :param y_peaks: peak heights
+        :param logsize: log10 of the crystallite size in nm
+        :param K: shape factor
+        :param wavelength: radiation source
+        :param peak_profile: "G", "L" or "V" for Gaussian, Lorentzian or Voigt
+        :return: x and y of the profile as NumPy arrays
+        """
+
+        first = x_peaks[0]
+        last = x_peaks[-1]
+        domain = last - first  # find total domain of angles in pattern
+
+        num_sigma = {"G": 5, "L": 12, "V": 12}[peak_profile]
+
+        # optimal number of points per degree determined through usage experiments
+        if logsize > 1:
+            N_density = 150 * (logsize ** 4)  # scaled to log size to the 4th power
+        else:
+            N_density = 150
+
+        N = int(N_density * domain)  # num total points
+        x = np.linspace(first, last, N)
+
+        hwhms = cls.grain_to_hwhm(
+            10 ** logsize,
+            np.radians(np.divide(x_peaks, 2)),
+            K=K,
+            wavelength=wavelength,
+        )
+        y = cls.broaden(
+            x,
+            x_peaks,
+            y_peaks,
+            hwhms,
+            peak_profile=peak_profile,
+            N_density=N_density,
+            num_sigma=num_sigma,
+        )
+
+        return x, y
+
+    @staticmethod
+    def downsample(x, y, max_points):
+        """
+        Reduce the number of points in a trace while preserving its shape, by
+        dividing it into buckets and keeping only the minimum and maximum
+        points in each bucket (and the first and last points). Peaks are
+        therefore never cut off, unlike taking every n-th point.
+
+        :param x: x values, sorted
+        :param y: y values
+        :param max_points: approximate maximum number of points to keep
+        :return: downsampled x and y
+        """
+
+        N = len(x)
+        n_buckets = max(max_points // 2, 1)
+
+        if N <= max_points:
+            return x, y
+
+        bucket_size = -(-N // n_buckets)  # round up
+        padding = n_buckets * bucket_size - N
+
+        y_max = np.pad(y, (0, padding), constant_values=-np.inf)
+        y_min = np.pad(y, (0, padding), constant_values=np.inf)
+        offsets = np.arange(n_buckets) * bucket_size
+
+        idxs = np.unique(
+            np.concatenate(
+                [
+                    [0, N - 1],
+                    y_max.reshape(n_buckets, bucket_size).argmax(axis=1) + offsets,
+                    y_min.reshape(n_buckets, bucket_size).argmin(axis=1) + offsets,
+                ]
+            )
+        )
+        idxs = idxs[idxs < N]
+
+        return x[idxs], y[idxs]
+
+    @staticmethod
+    def get_x_range(relayout_data, relayout=False):
+        """
+        :param relayout_data: relayoutData of the plot, this keeps the last
+        zoom even after the figure is replaced
+        :param relayout: True if the plot was just zoomed or panned, otherwise
+        e.g. the radiation source changed, and the last zoom no longer applies
+        :return: [min, max] of the x range to plot, or None for the full range
+        :raises PreventUpdate: if the plot was relaid out but the x range did
+        not change
+        """
+
+        if not relayout:
+            return None
+
+        relayout_data = relayout_data or {}
+        if "xaxis.range[0]" in relayout_data:
+            x_range = [relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]]
+        else:
+            x_range = relayout_data.get("xaxis.range")
+
+        if not x_range and "xaxis.autorange" not in relayout_data:
+            # e.g. only the y axis has changed
+            raise PreventUpdate
+
+        return x_range
+
+    @classmethod
+    def broaden(
+        cls, x, x_peaks, y_peaks, hwhms, peak_profile="G", N_density=150, num_sigma=5
+    ):
+        """
+        Broaden peaks into a continuous profile. Each peak is only evaluated
+        within num_sigma standard deviations of its center, and all peaks are
+        evaluated together in a single vectorized pass.
+
+        :param x: points to evaluate the profile at, evenly spaced with
+        N_density points per unit
+        :param x_peaks: peak positions
+        :param y_peaks: peak heights
+        :param hwhms: half-width half-max of each peak
+        :param peak_profile: "G", "L" or "V" for Gaussian, Lorentzian or Voigt
+        :param N_density: number of points per unit of x
+        :param num_sigma: half-width of the window each peak is evaluated in
+        :return: the profile evaluated at x
+        """
+
+        x = np.asarray(x, dtype=float)
+        x_peaks = np.asarray(x_peaks, dtype=float)
+        y_peaks = np.asarray(y_peaks, dtype=float)
+        hwhms = np.asarray(hwhms, dtype=float)
+        N = len(x)
+
+        profile = getattr(cls, peak_profile)
+        sigmas = hwhms / np.sqrt(2 * np.log(2))
+
+        center_idxs = np.round((x_peaks - x[0]) * N_density).astype(int)
+        half_windows = np.round(num_sigma * sigmas * N_density).astype(int)
+        lbs = np.maximum(0, center_idxs - half_windows)
+        ubs = np.minimum(N, center_idxs + half_windows)
+
+        # a (peak, point) index pair for every point in every peak's window
+        window_lengths = np.maximum(ubs - lbs, 0)
+        peak_idxs = np.repeat(np.arange(len(x_peaks)), window_lengths)
+        window_starts = np.cumsum(window_lengths) - window_lengths
+        point_idxs = (
+            np.arange(np.sum(window_lengths))
+            - np.repeat(window_starts, window_lengths)
+            + np.repeat(lbs, window_lengths)
+        )
+
+        G0 = profile(0, 0, hwhms)
+        weights = (
+            y_peaks[peak_idxs]
+            * profile(x[point_idxs], x_peaks[peak_idxs], hwhms[peak_idxs])
+            / G0[peak_idxs]
+        )
+
+        return np.bincount(point_idxs, weights=weights, minlength=N)
+
     @property
     def all_layouts(self):
 
@@ -240,17 +453,27 @@ class XRayDiffractionComponent(MPComponent):
                 Input(self.id("rad-source"), "value"),
                 Input(self.id("peak-profile"), "value"),
                 Input(self.id("shape-factor"), "value"),
+                Input(self.id("xrd-plot"), "relayoutData"),
             ],
         )
-        def update_graph(data, logsize, rad_source, peak_profile, K):
+        def update_graph(data, logsize, rad_source, peak_profile, K, relayout_data):
 
             if not data:
                 raise PreventUpdate
 
+            # when zoomed in, only the visible range is sent, at a finer
+            # resolution, any other change shows the full pattern again
+            ctx = dash.callback_context
+            x_range = self.get_x_range(
+                relayout_data,
+                relayout=bool(ctx.triggered)
+                and ctx.triggered[0]["prop_id"]
+                == self.id("xrd-plot") + ".relayoutData",
+            )
+
             x_peak = data["x"]
             y_peak = data["y"]
             d_hkls = data["d_hkls"]
-            grain_size = 10 ** logsize
 
             hkl_list = [hkl[0]["hkl"] for hkl in data["hkls"]]
             hkls = [
@@ -262,41 +485,23 @@ class XRayDiffractionComponent(MPComponent):
                 for peak_x, peak_y, hkl, d in zip(x_peak, y_peak, hkls, d_hkls)
             ]  # text boxes
 
-            first = x_peak[0]
-            last = x_peak[-1]
-            domain = last - first  # find total domain of angles in pattern
+            domain = x_peak[-1] - x_peak[0]  # find total domain of angles in pattern
             bar_width = 0.003 * domain  # set width of bars to 0.5% of the domain
             length = len(x_peak)
 
-            num_sigma = {"G": 5, "L": 12, "V": 12}[peak_profile]
-
-            # optimal number of points per degree determined through usage experiments
-            if logsize > 1:
-                N_density = 150 * (logsize ** 4)  # scaled to log size to the 4th power
-            else:
-                N_density = 150
-
-            N = int(N_density * domain)  # num total points
-            x = np.linspace(first, last, N).tolist()
-            y = np.zeros(len(x)).tolist()
-
-            for xp, yp in zip(x_peak, y_peak):
-                alpha = self.grain_to_hwhm(
-                    grain_size, math.radians(xp / 2), K=float(K), wavelength=rad_source
-                )
-                sigma = (alpha / np.sqrt(2 * np.log(2))).item()
-
-                center_idx = int(round((xp - first) * N_density))
-                half_window = int(
-                    round(num_sigma * sigma * N_density)
-                )  # i.e. total window of 2 * num_sigma
-
-                lb = max([0, (center_idx - half_window)])
-                ub = min([N, (center_idx + half_window)])
+            x, y = self.get_profile(
+                x_peak,
+                y_peak,
+                logsize=logsize,
+                K=float(K),
+                wavelength=rad_source,
+                peak_profile=peak_profile,
+            )
 
-                G0 = getattr(self, peak_profile)(0, 0, alpha)
-                for i, j in zip(range(lb, ub), range(lb, ub)):
-                    y[j] += yp * getattr(self, peak_profile)(x[i], xp, alpha) / G0
+            if x_range:
+                in_range = (x >= min(x_range)) & (x <= max(x_range))
+                x, y = x[in_range], y[in_range]
+            x, y = self.downsample(x, y, self.max_profile_points)
 
             plotdata = [
                 go.Bar(
@@ -307,9 +512,14 @@ class XRayDiffractionComponent(MPComponent):
                     text=annotations,
                     opacity=0.2,
                 ),
-                go.Scatter(x=x, y=y, hoverinfo="none"),
+                go.Scatter(x=x.tolist(), y=y.tolist(), hoverinfo="none"),
             ]
-            plot = go.Figure(data=plotdata, layout=self.default_xrd_plot_style)
+
+            layout = dict(self.default_xrd_plot_style)
+            if x_range:
+                layout["xaxis"] = dict(layout["xaxis"], range=x_range)
+
+            plot = go.Figure(data=plotdata, layout=layout)
 
             return plot
 
@@ -328,15 +538,7 @@ class XRayDiffractionComponent(MPComponent):
             struct = self.from_data(struct)
             xrdcalculator_kwargs = self.from_data(xrdcalculator_kwargs)
 
-            sga = SpacegroupAnalyzer(struct)
-            struct = (
-                sga.get_conventional_standard_structure()
-            )  # always get conventional structure
-
-            xrdc = XRDCalculator(**xrdcalculator_kwargs)
-            data = xrdc.get_pattern(struct, two_theta_range=None)
-
-            return data.as_dict()
+            return self.get_pattern(struct, xrdcalculator_kwargs)
 
         @app.callback(
             Output(self.id("xrdcalculator_kwargs"), "data"),
@@ -0,0 +1,141 @@
+"""
+In-process caching helpers. These are used as a fast first tier in front of
+the cache registered with MPComponent.register_cache (e.g. Redis), which is
+shared between processes but requires (de)serialization on every access.
+"""
+
+from collections import OrderedDict
+from hashlib import sha1
+from json import dumps
+from threading import RLock
+
+import numpy as np
+
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+from pymatgen.core.structure import Structure, Molecule
+
+
+class LRUCache:
+    """
+    A small thread-safe least-recently-used cache. Keeps count of hits and
+    misses so that its effectiveness can be monitored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxbytes: Optional[int] = None,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        """
+        :param maxsize: maximum number of items to keep, the least-recently
+        used item is evicted when this is exceeded
+        :param maxbytes: if set, least-recently used items are also evicted
+        while the total size of all items exceeds this
+        :param getsizeof: function returning the size of an item in bytes,
+        required if maxbytes is set
+        """
+        if maxbytes is not None and getsizeof is None:
+            raise ValueError("getsizeof is required if maxbytes is set")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.getsizeof = getsizeof
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            if self.getsizeof:
+                size = self.getsizeof(value)
+                self.nbytes += size - self._sizes.get(key, 0)
+                self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            # an item larger than maxbytes is not kept at all
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                evicted_key, _ = self._data.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted_key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        :return: a dict of hits, misses, current size and maximum size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def get_hash(*args) -> str:
+    """
+    :param args: any JSON-serializable arguments
+    :return: a hex digest uniquely identifying the arguments, suitable
+    for use as part of a cache key
+    """
+    return sha1(dumps(args, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_structure_fingerprint(
+    struct_or_mol: Union[Structure, Molecule],
+    decimals: int = 6,
+    site_properties: bool = False,
+) -> str:
+    """
+    A canonical fingerprint for a Structure or Molecule, two inputs with
+    the same lattice, species and co-ordinates (to within the given number
+    of decimals) will have the same fingerprint.
+
+    :param struct_or_mol: Structure or Molecule
+    :param decimals: number of decimal places to round co-ordinates to
+    :param site_properties: if True, inputs must also have the same site
+    properties (e.g. magmom) to have the same fingerprint
+    :return: a hex digest
+    """
+
+    species = [str(site.species) for site in struct_or_mol]
+
+    if isinstance(struct_or_mol, Structure):
+        lattice = np.round(struct_or_mol.lattice.matrix, decimals).tolist()
+        coords = np.round(struct_or_mol.frac_coords, decimals).tolist()
+        charge = None
+    else:
+        lattice = None
+        coords = np.round(struct_or_mol.cart_coords, decimals).tolist()
+        charge = struct_or_mol.charge
+
+    if site_properties:
+        return get_hash(lattice, species, coords, charge, struct_or_mol.site_properties)
+
+    return get_hash(lattice, species, coords, charge)
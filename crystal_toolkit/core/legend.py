@@ -5,6 +5,8 @@ from pymatgen.analysis.molecule_structure_comparator import CovalentRadius
 from monty.json import MSONable
 from monty.serialization import loadfn
 
+from crystal_toolkit.core.cache import LRUCache
+
 from itertools import chain
 from collections import defaultdict
 
@@ -23,6 +25,10 @@ import os
 module_dir = os.path.dirname(os.path.abspath(__file__))
 EL_COLORS = loadfn(os.path.join(module_dir, "ElementColorSchemes.yaml"))
 
+# tables of species to (color, radius), shared between Legend instances,
+# see Legend.get_species_table
+SPECIES_TABLES = LRUCache(maxsize=256)
+
 
 class Legend(MSONable):
     """
@@ -368,6 +374,127 @@ class Legend(MSONable):
 
         return radius
 
+    def get_species_table(
+        self
+    ) -> Dict[Union[Specie, Element], Tuple[Optional[str], float]]:
+        """
+        Get the color and radius of every species in the site collection.
+        These depend only on the species present and the color and radius
+        schemes, so tables are cached and shared between Legend instances.
+
+        Returns: A dictionary of species to (color, radius), color will be
+        None if the color scheme depends on site properties
+
+        """
+
+        all_species = frozenset(
+            chain.from_iterable(
+                comp.keys() for comp in self.site_collection.species_and_occu
+            )
+        )
+
+        if self.color_scheme in ("VESTA", "Jmol", "accessible"):
+            color_scheme = self.color_scheme
+        else:
+            color_scheme = None
+
+        key = (
+            all_species,
+            color_scheme,
+            self.radius_scheme,
+            self.uniform_radius,
+            self.fallback_radius,
+        )
+
+        table = SPECIES_TABLES.get(key)
+        if table is None:
+            table = {
+                sp: (
+                    self.get_color(sp) if color_scheme else None,
+                    self.get_radius(sp),
+                )
+                for sp in all_species
+            }
+            SPECIES_TABLES.set(key, table)
+
+        return table
+
+    def get_colors(self) -> List[List[str]]:
+        """
+        Get colors for every species on every site in the site collection,
+        equivalent to calling get_color for each, but looking up each color
+        only once and resolving the color map for all sites together.
+
+        Returns: A list with an entry for each site, of a list of colors with
+        an entry for each species on that site
+
+        """
+
+        if "display_color" in self.site_collection.site_properties:
+            return [
+                [self.get_color(sp, site) for sp in site.species]
+                for site in self.site_collection
+            ]
+
+        if self.color_scheme in self.site_prop_types.get("scalar", []):
+
+            props = np.array(
+                self.site_collection.site_properties[self.color_scheme], dtype=float
+            )
+
+            # normalize in [0, 1] range, as expected by cmap
+            prop_min = self.cmap_range[0]
+            prop_max = self.cmap_range[1]
+            props_normed = (props - prop_min) / (prop_max - prop_min)
+
+            rgb = (get_cmap(self.cmap)(props_normed)[:, 0:3] * 255).astype(int)
+            site_colors = [html5_serialize_simple_color(tuple(c)) for c in rgb.tolist()]
+
+        elif self.color_scheme in self.site_prop_types.get("categorical", []):
+
+            site_colors = [
+                html5_serialize_simple_color(
+                    self.categorical_colors[self.color_scheme].get(
+                        prop, self.default_color
+                    )
+                )
+                for prop in self.site_collection.site_properties[self.color_scheme]
+            ]
+
+        else:
+
+            table = self.get_species_table()
+
+            return [
+                [table[sp][0] for sp in site.species] for site in self.site_collection
+            ]
+
+        return [
+            [color] * len(site.species)
+            for site, color in zip(self.site_collection, site_colors)
+        ]
+
+    def get_radii(self) -> List[List[float]]:
+        """
+        Get radii for every species on every site in the site collection,
+        equivalent to calling get_radius for each, but looking up each
+        radius only once.
+
+        Returns: A list with an entry for each site, of a list of radii with
+        an entry for each species on that site
+
+        """
+
+        if "display_radius" in self.site_collection.site_properties:
+            return [
+                [self.get_radius(sp, site) for sp in site.species]
+                for site in self.site_collection
+            ]
+
+        table = self.get_species_table()
+
+        return [[table[sp][1] for sp in site.species] for site in self.site_collection]
+
     @staticmethod
     def analyze_site_props(site_collection: SiteCollection) -> Dict[str, List[str]]:
         """
@@ -415,9 +542,9 @@ class Legend(MSONable):
         legend = defaultdict(list)
 
         # first get all our colors for different species
-        for site in self.site_collection:
-            for sp, occu in site.species.items():
-                legend[self.get_color(sp, site)].append(label(site, sp))
+        for site, site_colors in zip(self.site_collection, self.get_colors()):
+            for sp, color in zip(site.species, site_colors):
+                legend[color].append(label(site, sp))
 
         legend = {k: ", ".join(sorted(list(set(v)))) for k, v in legend.items()}
 
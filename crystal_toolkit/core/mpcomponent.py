@@ -1,21 +1,72 @@
 import logging
+import math
 import sys
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from datetime import datetime
+from hashlib import sha1
 from json import dumps, loads
 from time import mktime
 from warnings import warn
 
+import numpy as np
+
 import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Output, Input, State
+from dash.exceptions import PreventUpdate
 from monty.json import MontyEncoder, MontyDecoder
 from pymatgen import MPRester
 
+from flask import Flask
 from flask_caching import Cache
 
-# fallback cache if Redis etc. isn't set up
-null_cache = Cache(config={"CACHE_TYPE": "null"})
+from crystal_toolkit.core.cache import LRUCache
+from crystal_toolkit.core.object_store import ObjectStore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fallback cache if Redis etc. isn't set up, this has its own Flask app so
+# that it can also be used outside of a request (e.g. when a component is
+# created) or before an app has been registered
+null_cache = Cache(
+    Flask(__name__), config={"CACHE_TYPE": "null", "CACHE_NO_NULL_WARNING": True}
+)
+
+_MISSING = object()
+
+# NumPy arrays, datetimes and dataclasses are passed to MontyEncoder so that
+# they can be decoded to the same objects as when using the json module
+ORJSON_OPTIONS = (
+    (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if orjson
+    else None
+)
+
+
+def _is_finite(obj) -> bool:
+    """
+    :param obj: an object as passed to orjson, i.e. plain containers of
+    values, with other objects converted by MontyEncoder.default
+    :return: False if obj contains NaN or infinity, which orjson writes as
+    null, objects converted by MontyEncoder.default are not checked
+    """
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_is_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_is_finite(value) for value in obj)
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in "fc":
+        return bool(np.isfinite(obj).all())
+    return True
 
 
 class MPComponent(ABC):
@@ -23,15 +74,44 @@ class MPComponent(ABC):
     _app_stores = []
     app = None
     cache = null_cache
+    serialization = "compact"
+    object_store = None
+    # decoded objects, keyed by a hash of their data
+    _from_data_cache = LRUCache(maxsize=128)
 
     @staticmethod
     def register_app(app):
         MPComponent.app = app
+        # so that the fallback cache can also be used within the app's requests
+        null_cache.init_app(app.server)
 
     @staticmethod
     def register_cache(cache):
         MPComponent.cache = cache
 
+    @staticmethod
+    def register_object_store(object_store):
+        """
+        :param object_store: an ObjectStore, if set large data is kept on the
+        server and dcc.Stores only hold a handle to it, or None to keep all
+        data in dcc.Stores (default)
+        """
+        MPComponent.object_store = object_store
+
+    @staticmethod
+    def register_serialization(serialization):
+        """
+        :param serialization: "compact" (default) for the smallest and fastest
+        store payloads, using orjson if installed, or "pretty" for indented JSON
+        which can be easier to read when debugging
+        """
+        if serialization not in ("compact", "pretty"):
+            raise ValueError(
+                f"Serialization {serialization} not supported, "
+                f"choose from: compact, pretty"
+            )
+        MPComponent.serialization = serialization
+
     @staticmethod
     def all_app_stores():
         return html.Div(MPComponent._app_stores)
@@ -79,7 +159,7 @@ class MPComponent(ABC):
             self.create_store(
                 name="default", initial_data=contents, storage_type=storage_type
             )
-            self.initial_data = self.to_data(contents)
+            self.initial_data = self.to_data(contents, use_object_store=False)
         else:
             if MPComponent.app is None:
                 raise ValueError("Can only link stores if an app is defined.")
@@ -107,9 +187,13 @@ class MPComponent(ABC):
         debug_clear=False,
         to_data=True,
     ):
+        if to_data:
+            # initial data is part of the layout, served with every page
+            # load, so it is kept inline rather than as a handle that expires
+            initial_data = self.to_data(initial_data, use_object_store=False)
         store = dcc.Store(
             id=self.id(name),
-            data=self.to_data(initial_data) if to_data else initial_data,
+            data=initial_data,
             storage_type=storage_type,
             clear_data=debug_clear,
         )
@@ -117,27 +201,134 @@ class MPComponent(ABC):
         MPComponent._app_stores.append(store)
 
     @staticmethod
-    def to_data(msonable_obj):
+    def to_data(msonable_obj, cache_decoded=False, use_object_store=True):
         """
         Converts any MSONable object into a format suitable for storing in
         a dcc.Store data prop
 
         :param msonable_obj: Any MSONable object
+        :param cache_decoded: if True, from_data will return a copy of this
+        object for the returned data instead of decoding it, useful for
+        objects that are expensive to reconstruct (e.g. PhaseDiagram)
+        :param use_object_store: if False, always return the JSON string even
+        if an object store is registered, e.g. for data to be saved in
+        MPComponent.cache which may outlive the object store
         :return: A JSON string (a string is preferred over a dict since this can
-        be easily memoized)
+        be easily memoized), or a handle to it, see register_object_store
         """
         if msonable_obj is None:
             return None
-        data_str = dumps(msonable_obj, cls=MontyEncoder, indent=4)
+        if MPComponent.serialization == "pretty":
+            data_str = dumps(msonable_obj, cls=MontyEncoder, indent=4)
+        else:
+            data_str = None
+            if orjson:
+                # keep what MontyEncoder converts, to check for NaN later
+                converted = []
+
+                def default(obj):
+                    converted.append(MontyEncoder().default(obj))
+                    return converted[-1]
+
+                data_str = orjson.dumps(
+                    msonable_obj, default=default, option=ORJSON_OPTIONS
+                ).decode()
+                # orjson writes NaN and infinity as null, like None, so data
+                # that contains them is encoded with the json module instead
+                if "null" in data_str and not all(
+                    map(_is_finite, [msonable_obj] + converted)
+                ):
+                    data_str = None
+            if data_str is None:
+                data_str = dumps(msonable_obj, cls=MontyEncoder, separators=(",", ":"))
+        if cache_decoded:
+            MPComponent._from_data_cache.set(
+                sha1(data_str.encode()).hexdigest(), deepcopy(msonable_obj)
+            )
+        if use_object_store:
+            return MPComponent.store_data(data_str)
         return data_str
 
     @staticmethod
-    def from_data(data):
+    def store_data(data_str):
+        """
+        :param data_str: a JSON string as returned by to_data
+        :return: a handle to the data if an object store is registered and
+        the data is large enough to be worth storing, otherwise the data
+        """
+        if (
+            MPComponent.object_store is None
+            or len(data_str) < MPComponent.object_store.min_size
+        ):
+            return data_str
+        return MPComponent.object_store.put(data_str)
+
+    @staticmethod
+    def from_data(data, copy=True):
         """
         Converts the contents of a dcc.Store back into a Python object.
-        :param data: contents of a dcc.Store created by to_data
+
+        Decoded objects are cached, since the same data is often decoded by
+        several callbacks. A copy is returned so that callbacks are free to
+        modify it.
+
+        :param data: contents of a dcc.Store created by to_data, or a
+        handle to it
+        :param copy: if False, the cached object itself is returned, which
+        avoids copying large objects (e.g. a PhaseDiagram or BandStructure)
+        but must then not be modified, e.g. by callbacks that only plot it
         :return: a Python object
+        :raises PreventUpdate: if the data a handle refers to has expired,
+        so that callbacks using it do not update
+        """
+        if not isinstance(data, str):
+            return MPComponent._decode(data)
+        # the handle contains the hash of the data, so the data only has
+        # to be fetched if it has not already been decoded
+        key = MPComponent.get_data_hash(data)
+        obj = MPComponent._from_data_cache.get(key, default=_MISSING)
+        if obj is _MISSING:
+            if ObjectStore.is_handle(data):
+                if MPComponent.object_store is None:
+                    raise ValueError(f"No object store registered to look up {data}")
+                try:
+                    data = MPComponent.object_store.get(data)
+                except KeyError as exc:
+                    # e.g. the page has been open for longer than the ttl of
+                    # the object store, reloading it generates the data again
+                    warn(f"{exc.args[0]}, the page needs to be reloaded")
+                    raise PreventUpdate
+            obj = MPComponent._decode(data)
+            MPComponent._from_data_cache.set(key, obj)
+        return deepcopy(obj) if copy else obj
+
+    @staticmethod
+    def get_data_hash(data):
         """
+        :param data: a JSON string as returned by to_data, or a handle to it
+        :return: a sha1 hex digest of the data, the same for the data and for
+        a handle to it, suitable for use as part of a cache key
+        """
+        if ObjectStore.is_handle(data):
+            return ObjectStore.get_key(data)
+        return sha1(data.encode()).hexdigest()
+
+    @staticmethod
+    def from_data_cache_info():
+        """
+        :return: a dict of hits, misses, current size and maximum size of
+        the cache used by from_data
+        """
+        return MPComponent._from_data_cache.info()
+
+    @staticmethod
+    def _decode(data):
+        if orjson:
+            try:
+                return MontyDecoder().process_decoded(orjson.loads(data))
+            except orjson.JSONDecodeError:
+                # orjson is stricter than the json module, e.g. for NaN
+                pass
         return loads(data, cls=MontyDecoder)
 
     def attach_from(
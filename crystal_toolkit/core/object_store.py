@@ -0,0 +1,187 @@
+"""
+Serialized objects such as band structures or structure graphs can be several
+MB, and a dcc.Store sends its contents back to the server with every callback
+that uses it. An ObjectStore keeps this data on the server instead, so that
+the dcc.Store only has to hold a short handle containing a hash of the data.
+See MPComponent.register_object_store.
+"""
+
+import os
+
+from hashlib import sha1
+from tempfile import gettempdir
+from time import time
+from typing import Optional
+
+from crystal_toolkit.core.cache import LRUCache
+
+try:
+    from redis import Redis
+except ImportError:
+    Redis = None
+
+
+class ObjectStore:
+    """
+    Stores data by a hash of its contents. Recently used data is kept in
+    memory, in front of either a directory on local disk (shared between
+    processes on the same machine) or Redis (shared between machines). Data
+    not used for ttl seconds is evicted.
+    """
+
+    prefix = "ctk-object:"
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        redis_url: Optional[str] = None,
+        ttl: int = 86400,
+        maxsize: int = 64,
+        min_size: int = 10000,
+    ):
+        """
+        :param directory: where to save data if Redis is not used, by default
+        the CRYSTAL_TOOLKIT_OBJECT_STORE_DIR environment variable if set,
+        otherwise a directory in the system's temporary directory
+        :param redis_url: if set, save data in Redis instead of on disk
+        :param ttl: time in seconds after which unused data is evicted
+        :param maxsize: number of items to keep in memory
+        :param min_size: data smaller than this many characters is not worth
+        storing, see MPComponent.store_data
+        """
+
+        if redis_url and Redis is None:
+            raise ImportError("The redis package is required to use a Redis URL.")
+
+        self.directory = directory or os.environ.get(
+            "CRYSTAL_TOOLKIT_OBJECT_STORE_DIR",
+            os.path.join(gettempdir(), "crystal_toolkit_objects"),
+        )
+        self.redis = Redis.from_url(redis_url) if redis_url else None
+        self.ttl = ttl
+        self.min_size = min_size
+
+        # (data, time its expiry was last refreshed) by key
+        self._memory = LRUCache(maxsize=maxsize)
+        self._last_evicted = 0
+
+    @classmethod
+    def is_handle(cls, data) -> bool:
+        return isinstance(data, str) and data.startswith(cls.prefix)
+
+    @classmethod
+    def get_key(cls, handle: str) -> str:
+        """
+        :return: the hash of the data a handle refers to
+        """
+        return handle[len(cls.prefix) :]
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def put(self, data: str, key: Optional[str] = None) -> str:
+        """
+        :param data: a string, e.g. as returned by MPComponent.to_data
+        :param key: a sha1 hex digest of the data, if already known
+        :return: a handle to the data
+        """
+
+        key = key or sha1(data.encode()).hexdigest()
+
+        self._save(key, data)
+        self._memory.set(key, (data, time()))
+
+        if self.redis is None:
+            self._evict_expired()
+
+        return self.prefix + key
+
+    def _save(self, key: str, data: str):
+        """
+        Save data to Redis or to disk, if already saved only refresh its
+        expiry.
+        """
+
+        if self.redis is not None:
+            if not self.redis.expire(self.prefix + key, self.ttl):
+                self.redis.set(self.prefix + key, data.encode(), ex=self.ttl)
+            return
+
+        path = self._get_path(key)
+        try:
+            os.utime(path)
+            return
+        except FileNotFoundError:
+            # not saved yet, or just removed by another process
+            pass
+
+        os.makedirs(self.directory, exist_ok=True)
+        # write to a temporary file first, in case several processes are
+        # saving the same data
+        with open(f"{path}.{os.getpid()}", "w") as f:
+            f.write(data)
+        os.replace(f"{path}.{os.getpid()}", path)
+
+    def get(self, handle: str) -> str:
+        """
+        :param handle: a handle, as returned by put
+        :return: the data
+        :raises KeyError: if the data has expired or was never stored
+        """
+
+        key = self.get_key(handle)
+        now = time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            data, refreshed = entry
+            if now - refreshed < self.ttl / 10:
+                return data
+            if now - refreshed < self.ttl:
+                # refresh its expiry, at most every tenth of ttl, so that data
+                # in use here does not expire for other processes
+                self._save(key, data)
+                self._memory.set(key, (data, now))
+                return data
+            # otherwise it may have expired, so check Redis or disk
+
+        if self.redis is not None:
+            data = self.redis.get(self.prefix + key)
+            if data is None:
+                raise KeyError(f"{handle} not found, it may have expired")
+            self.redis.expire(self.prefix + key, self.ttl)
+            data = data.decode()
+        else:
+            path = self._get_path(key)
+            try:
+                if os.path.getmtime(path) < now - self.ttl:
+                    raise FileNotFoundError
+                with open(path) as f:
+                    data = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                raise KeyError(f"{handle} not found, it may have expired")
+
+        self._memory.set(key, (data, now))
+
+        return data
+
+    def _evict_expired(self):
+        """
+        Remove data from disk that has not been used for ttl seconds. Checks
+        at most every tenth of ttl, since this requires listing the directory.
+        """
+
+        now = time()
+        if now - self._last_evicted < self.ttl / 10:
+            return
+        self._last_evicted = now
+
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            try:
+                if os.path.getmtime(path) < now - self.ttl:
+                    os.remove(path)
+            except FileNotFoundError:
+                # removed by another process
+                pass
@@ -1,10 +1,14 @@
+from base64 import b64encode
 from abc import ABC, abstractmethod, abstractproperty
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import List, Optional, Dict, Any
-from itertools import chain
 from collections import defaultdict
 from warnings import warn
 
+from crystal_toolkit.core.cache import get_hash
+
+import numpy as np
+
 
 """
 This module gives a Python interface to generate JSON for the
@@ -12,8 +16,49 @@ Simple3DSceneComponent. To use, create a Scene whose contents can either be a
 a list of any of the geometric primitives defined below (e.g. Spheres,
 Cylinders, etc.) or can be another Scene. Then use scene_to_json() to convert
 the Scene to the JSON format to pass to Simple3DSceneComponent's data attribute.
+
+Positions (and position pairs, normals) can be given either as nested lists or
+as NumPy arrays. Arrays are preferred for large scenes: primitives of the same
+type are merged with a single array concatenation per group, and are only
+converted to lists when the Scene is serialized.
 """
 
+
+def _concatenate(arrays, shape):
+    """
+    Concatenate a list of positions (each either a nested list or a NumPy
+    array) into a single NumPy array with trailing dimensions given by shape,
+    e.g. (3, ) for positions or (2, 3) for position pairs.
+    """
+    return np.concatenate([np.reshape(array, (-1, *shape)) for array in arrays])
+
+
+# fields that can be sent as binary buffers, see Scene.to_json
+BINARY_FIELDS = ("positions", "positionPairs", "normals", "rotate_to")
+
+
+def _encode_array(array):
+    """
+    Encode a numeric array as a base64 string of little-endian float32 values,
+    in the format expected by Simple3DScene.decodeArray. Returns None if the
+    input cannot be represented as a rectangular numeric array.
+    """
+    try:
+        array = np.asarray(array, dtype="<f4")
+    except (TypeError, ValueError):
+        return None
+    return {
+        "@binary": "float32",
+        "shape": list(array.shape),
+        "data": b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def _bounding_box(positions) -> List[List[float]]:
+    positions = np.reshape(positions, (-1, 3))
+    return [positions.min(axis=0).tolist(), positions.max(axis=0).tolist()]
+
+
 class Primitive:
     """
     A Mixin class for standard plottable primitive behavior
@@ -30,8 +75,7 @@ class Primitive:
 
     @property
     def bounding_box(self) -> List[List[float]]:
-        x, y, z = zip(*self.positions)
-        return [[min(x), min(y), min(z)], [max(x), max(y), max(z)]]
+        return _bounding_box(self.positions)
 
 
 @dataclass
@@ -46,7 +90,7 @@ class Scene:
     origin: List[float] = field(default=(0, 0, 0))
     _meta: Any = None
 
-    def to_json(self):
+    def to_json(self, binary=False):
         """
         Convert a Scene into JSON. It will implicitly assume all None values means
         that that attribute uses its default value, and so will be removed from
@@ -57,6 +101,10 @@ class Scene:
         encoder.
 
         :param scene: A Scene object
+        :param binary: if True, positions, position pairs, normals and
+        rotations are sent as base64-encoded float32 buffers rather than
+        nested lists of floats, this is several times smaller and much
+        faster to encode and parse for large scenes
         :return: dict in a format that can be parsed by Simple3DSceneComponent
         """
 
@@ -66,25 +114,37 @@ class Scene:
             origin=self.origin,
         )
 
-        def remove_defaults(scene_dict):
+        def to_list(v):
+            if isinstance(v, np.ndarray):
+                return v.tolist()
+            elif isinstance(v, (list, tuple)):
+                return [to_list(item) for item in v]
+            return v
+
+        def remove_defaults(obj):
             """
             Reduce file size of JSON by removing any key which
-            is just its default value.
+            is just its default value. This walks the dataclasses
+            directly (rather than via asdict) so that large position
+            arrays are not deep-copied before being converted to lists.
             """
             trimmed_dict = {}
-            for k, v in scene_dict.items():
+            for f in fields(obj):
+                v = getattr(obj, f.name)
                 if isinstance(v, dict):
-                    v = remove_defaults(v)
+                    continue
+                elif binary and f.name in BINARY_FIELDS and v is not None:
+                    trimmed_dict[f.name] = _encode_array(v) or to_list(v)
                 elif isinstance(v, list):
-                    trimmed_dict[k] = [
-                        remove_defaults(item) if isinstance(item, dict) else item
+                    trimmed_dict[f.name] = [
+                        remove_defaults(item) if is_dataclass(item) else to_list(item)
                         for item in v
                     ]
                 elif v is not None:
-                    trimmed_dict[k] = v
+                    trimmed_dict[f.name] = to_list(v)
             return trimmed_dict
 
-        return remove_defaults(asdict(merged_scene))
+        return remove_defaults(merged_scene)
 
     @property
     def bounding_box(self) -> List[List[float]]:
@@ -125,13 +185,110 @@ class Scene:
         return merged + remainder
 
 
+# primitive attributes that Simple3DScene can update in place, any other
+# difference between two scenes requires the scene to be re-drawn
+PATCHABLE_FIELDS = ("color", "radius")
+
+
+def get_scene_patch(old_scene_json, new_scene_json) -> Optional[Dict]:
+    """
+    Compare two scenes (as generated by Scene.to_json) and, if they differ
+    only in the colors or radii of their primitives, return a small patch
+    that Simple3DSceneComponent can apply in place without re-drawing the
+    scene.
+
+    Sites of the same color and radius are drawn together, so a structure
+    scene can only be patched if a new color or radius scheme groups its
+    sites in the same way, e.g. changing between radius schemes, or between
+    two color schemes that color sites by element (such as Jmol and VESTA).
+    Otherwise, e.g. changing to a color scheme that colors sites by a site
+    property, the scene has to be re-drawn.
+
+    :param old_scene_json: scene currently displayed
+    :param new_scene_json: scene to be displayed
+    :return: a dict with the name of the scene and a list of updates, each
+    update has a "path" (list of child indices from the root of the scene)
+    and the new values of any changed attributes, or None if the scenes
+    cannot be patched
+    """
+
+    updates = []
+
+    def compare(old, new, path):
+
+        if ("type" in old) != ("type" in new):
+            return False
+
+        if "type" not in old:
+            # a (sub-)scene
+            if old.get("name") != new.get("name") or len(old["contents"]) != len(
+                new["contents"]
+            ):
+                return False
+            return all(
+                compare(old_child, new_child, path + [idx])
+                for idx, (old_child, new_child) in enumerate(
+                    zip(old["contents"], new["contents"])
+                )
+            )
+
+        # a primitive, all geometric attributes must be identical
+        keys = (set(old.keys()) | set(new.keys())) - set(PATCHABLE_FIELDS)
+        if any(old.get(k) != new.get(k) for k in keys):
+            return False
+
+        changed = {k: new.get(k) for k in PATCHABLE_FIELDS if old.get(k) != new.get(k)}
+        if changed:
+            updates.append({"path": path, **changed})
+
+        return True
+
+    if not old_scene_json or not new_scene_json:
+        return None
+
+    if not compare(old_scene_json, new_scene_json, []):
+        return None
+
+    return {"name": new_scene_json["name"], "updates": updates}
+
+
+def get_scene_skeleton(scene_json) -> Optional[Dict]:
+    """
+    A compact stand-in for a scene (as generated by Scene.to_json) to compare
+    against with get_scene_patch, so that the scene currently displayed does
+    not need to be kept in full. Each primitive keeps its type and patchable
+    attributes, all other attributes (positions etc.) are replaced by a
+    digest. get_scene_patch gives the same result for two skeletons as for the
+    scenes they were made from.
+
+    :param scene_json: scene as generated by Scene.to_json
+    :return: skeleton of the scene
+    """
+
+    if not scene_json:
+        return None
+
+    if "type" not in scene_json:
+        return {
+            "name": scene_json.get("name"),
+            "contents": [get_scene_skeleton(c) for c in scene_json["contents"]],
+        }
+
+    geometry = {k: v for k, v in scene_json.items() if k not in PATCHABLE_FIELDS}
+    skeleton = {k: scene_json[k] for k in PATCHABLE_FIELDS if k in scene_json}
+    skeleton["type"] = scene_json["type"]
+    skeleton["digest"] = get_hash(geometry)
+
+    return skeleton
+
+
 @dataclass
 class Spheres(Primitive):
     """
     Create a set of spheres. All spheres will have the same color, radius and
     segment size (if only drawing a section of a sphere).
-    :param positions: This is a list of lists corresponding to the vector
-    positions of the spheres.
+    :param positions: This is a list of lists (or an (N, 3) array)
+    corresponding to the vector positions of the spheres.
     :param color: Sphere color as a hexadecimal string, e.g. #ff0000
     :param radius: The radius of the sphere, defaults to 1.
     :param phiStart: Start angle in radians if drawing only a section of the
@@ -160,10 +317,47 @@ class Spheres(Primitive):
         return f"sphere_{self.color}_{self.radius}_{self.phiStart}_{self.phiEnd}_{self.reference}"
 
     @classmethod
-    def merge(cls, sphere_list):
-        new_positions = list(
-            chain.from_iterable([sphere.positions for sphere in sphere_list])
+    def from_arrays(cls, positions, colors, radii) -> List["Spheres"]:
+        """
+        Create spheres for many positions at once, grouped into one Spheres
+        per distinct color and radius, without creating an object for each
+        position.
+
+        :param positions: (N, 3) array of positions
+        :param colors: N colors, as hexadecimal strings
+        :param radii: N radii
+        :return: a list of Spheres, in order of first appearance of each
+        color and radius
+        """
+
+        positions = np.reshape(positions, (-1, 3))
+        if not len(positions):
+            return []
+
+        _, color_idxs = np.unique(np.asarray(colors, dtype=str), return_inverse=True)
+        _, radius_idxs = np.unique(np.asarray(radii, dtype=float), return_inverse=True)
+        _, first_idxs, group_idxs = np.unique(
+            color_idxs * (radius_idxs.max() + 1) + radius_idxs,
+            return_index=True,
+            return_inverse=True,
         )
+
+        # sort positions by group, keeping their order within each group
+        order = np.argsort(group_idxs, kind="stable")
+        groups = np.split(order, np.cumsum(np.bincount(group_idxs))[:-1])
+
+        return [
+            cls(
+                positions=positions[groups[group_idx]],
+                color=str(colors[first_idxs[group_idx]]),
+                radius=float(radii[first_idxs[group_idx]]),
+            )
+            for group_idx in np.argsort(first_idxs)
+        ]
+
+    @classmethod
+    def merge(cls, sphere_list):
+        new_positions = _concatenate([sphere.positions for sphere in sphere_list], (3,))
         return cls(
             positions=new_positions,
             color=sphere_list[0].color,
@@ -212,11 +406,11 @@ class Ellipsoids(Primitive):
 
     @classmethod
     def merge(cls, ellipsoid_list):
-        new_positions = list(
-            chain.from_iterable([ellipsoid.positions for ellipsoid in ellipsoid_list])
+        new_positions = _concatenate(
+            [ellipsoid.positions for ellipsoid in ellipsoid_list], (3,)
         )
-        rotate_to = list(
-            chain.from_iterable([ellipsoid.rotate_to for ellipsoid in ellipsoid_list])
+        rotate_to = _concatenate(
+            [ellipsoid.rotate_to for ellipsoid in ellipsoid_list], (3,)
         )
 
         return cls(
@@ -235,8 +429,8 @@ class Cylinders(Primitive):
     """
     Create a set of cylinders. All cylinders will have the same color and
     radius.
-    :param positionPairs: This is a list of pairs of lists corresponding to the
-    start and end position of the cylinder.
+    :param positionPairs: This is a list of pairs of lists (or an (N, 2, 3)
+    array) corresponding to the start and end position of the cylinder.
     :param color: Cylinder color as a hexadecimal string, e.g. #ff0000
     :param radius: The radius of the cylinder, defaults to 1.
     :param visible: If False, will hide the object by default.
@@ -261,8 +455,8 @@ class Cylinders(Primitive):
     @classmethod
     def merge(cls, cylinder_list):
 
-        new_positionPairs = list(
-            chain.from_iterable([cylinder.positionPairs for cylinder in cylinder_list])
+        new_positionPairs = _concatenate(
+            [cylinder.positionPairs for cylinder in cylinder_list], (2, 3)
         )
         return cls(
             positionPairs=new_positionPairs,
@@ -273,8 +467,7 @@ class Cylinders(Primitive):
 
     @property
     def bounding_box(self) -> List[List[float]]:
-        x, y, z = zip(*chain.from_iterable(self.positionPairs))
-        return [[min(x), min(y), min(z)], [min(x), min(y), min(z)]]
+        return _bounding_box(self.positionPairs)
 
 
 @dataclass
@@ -306,9 +499,7 @@ class Cubes(Primitive):
 
     @classmethod
     def merge(cls, cube_list):
-        new_positions = list(
-            chain.from_iterable([cube.positions for cube in cube_list])
-        )
+        new_positions = _concatenate([cube.positions for cube in cube_list], (3,))
         return cls(
             positions=new_positions,
             color=cube_list[0].color,
@@ -355,9 +546,7 @@ class Lines(Primitive):
 
     @classmethod
     def merge(cls, line_list):
-        new_positions = list(
-            chain.from_iterable([line.positions for line in line_list])
-        )
+        new_positions = _concatenate([line.positions for line in line_list], (3,))
         return cls(
             positions=new_positions,
             color=line_list[0].color,
@@ -448,8 +637,8 @@ class Arrows(Primitive):
 
     @classmethod
     def merge(cls, arrow_list):
-        new_positionPairs = list(
-            chain.from_iterable([arrow.positionPairs for arrow in arrow_list])
+        new_positionPairs = _concatenate(
+            [arrow.positionPairs for arrow in arrow_list], (2, 3)
         )
         return cls(
             positionPairs=new_positionPairs,
@@ -462,8 +651,7 @@ class Arrows(Primitive):
 
     @property
     def bounding_box(self) -> List[List[float]]:
-        x, y, z = zip(*chain.from_iterable(self.positionPairs))
-        return [[min(x), min(y), min(z)], [min(x), min(y), min(z)]]
+        return _bounding_box(self.positionPairs)
 
 
 # class VolumetricData:
@@ -0,0 +1,48 @@
+from crystal_toolkit.core.cache import LRUCache, get_hash
+
+
+class TestLRUCache:
+    def setup_method(self, method):
+        self.cache = LRUCache(maxsize=2)
+
+    def test_lru_cache(self):
+
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        assert self.cache.get("a") == 1
+
+        # "b" is now the least-recently used item
+        self.cache.set("c", 3)
+        assert "b" not in self.cache
+        assert self.cache.get("b") is None
+        assert self.cache.get("c") == 3
+
+        assert self.cache.info() == {"hits": 2, "misses": 1, "size": 2, "maxsize": 2}
+
+        self.cache.clear()
+        assert len(self.cache) == 0
+
+    def test_maxbytes(self):
+
+        cache = LRUCache(maxsize=10, maxbytes=10, getsizeof=len)
+        cache.set("a", "1234")
+        cache.set("b", "1234")
+        assert cache.nbytes == 8
+
+        # "a" is evicted to stay within maxbytes
+        cache.set("c", "1234")
+        assert "a" not in cache
+        assert cache.nbytes == 8
+
+        # replacing an item counts only its new size
+        cache.set("c", "12")
+        assert "b" in cache and cache.nbytes == 6
+
+        # an item larger than maxbytes is not kept
+        cache.set("d", "12345678901")
+        assert len(cache) == 0 and cache.nbytes == 0
+
+    def test_get_hash(self):
+
+        assert get_hash({"a": 1, "b": 2}) == get_hash({"b": 2, "a": 1})
+        assert get_hash({"a": 1}) != get_hash({"a": 2})
@@ -163,6 +163,49 @@ class TestLegend:
 
         assert legend.get_radius(sp=self.sp2) == 0.94
 
+    def test_get_colors_and_radii(self):
+
+        # should be equivalent to looking up each species on each site
+        for struct, color_scheme in (
+            (self.struct, "VESTA"),
+            (self.struct, "accessible"),
+            (self.struct, "example_site_prop"),
+            (self.struct, "example_categorical_site_prop"),
+            (self.struct_disordered, "Jmol"),
+            (self.struct_manual, "Jmol"),
+        ):
+
+            legend = Legend(
+                struct,
+                color_scheme=color_scheme,
+                radius_scheme="specified_or_average_ionic",
+            )
+
+            assert legend.get_colors() == [
+                [legend.get_color(sp, site=site) for sp in site.species]
+                for site in struct
+            ]
+
+            assert legend.get_radii() == [
+                [legend.get_radius(sp, site=site) for sp in site.species]
+                for site in struct
+            ]
+
+    def test_get_species_table(self):
+
+        legend = Legend(self.struct, color_scheme="VESTA", radius_scheme="covalent")
+
+        assert legend.get_species_table()[self.sp1] == ("#fe0300", 0.66)
+
+        # tables are shared between legends for the same species and schemes
+        other_legend = Legend(
+            self.struct.copy(), color_scheme="VESTA", radius_scheme="covalent"
+        )
+        assert other_legend.get_species_table() is legend.get_species_table()
+
+        other_legend = Legend(self.struct, color_scheme="Jmol", radius_scheme="covalent")
+        assert other_legend.get_species_table() is not legend.get_species_table()
+
     def test_msonable(self):
 
         legend = Legend(self.struct)
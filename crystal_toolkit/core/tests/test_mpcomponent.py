@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+import crystal_toolkit.core.mpcomponent
+
+from crystal_toolkit.core.mpcomponent import MPComponent
+
+from pymatgen import Structure, Lattice
+from pymatgen.analysis.graphs import StructureGraph
+from pymatgen.analysis.local_env import MinimumDistanceNN
+from pymatgen.electronic_structure.bandstructure import BandStructure
+from pymatgen.electronic_structure.core import Spin
+
+
+class TestSerialization:
+    def setup_method(self, method):
+
+        struct = Structure(
+            Lattice.cubic(4.2),
+            ["Na", "K"],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            site_properties={"magmom": [np.float64(0.1), np.float64(-0.1)]},
+        )
+        struct.make_supercell([6, 6, 6])
+
+        kpoints = np.random.RandomState(0).rand(200, 3)
+        eigenvals = {Spin.up: np.random.RandomState(1).rand(40, 200)}
+
+        self.payloads = {
+            "Structure": struct,
+            "StructureGraph": StructureGraph.with_local_env_strategy(
+                struct, MinimumDistanceNN()
+            ),
+            "BandStructure": BandStructure(
+                kpoints, eigenvals, struct.lattice.reciprocal_lattice, efermi=0.5
+            ),
+        }
+
+    def teardown_method(self, method):
+        MPComponent.register_serialization("compact")
+
+    def test_round_trip(self):
+
+        for serialization in ("compact", "pretty"):
+            MPComponent.register_serialization(serialization)
+            for name, obj in self.payloads.items():
+                data = MPComponent.to_data(obj)
+                assert MPComponent.to_data(MPComponent.from_data(data)) == data
+
+    def test_non_finite(self):
+
+        struct = Structure(
+            Lattice.cubic(4.2),
+            ["Na", "K"],
+            [[0, 0, 0], [0.5, 0.5, 0.5]],
+            site_properties={
+                "magmom": [float("nan"), float("inf")],
+                "charge": [None, 1],
+            },
+        )
+        payload = {
+            "structure": struct,
+            "densities": np.array([0.5, np.nan, np.inf, -np.inf]),
+            "values": [None, -float("inf"), 1],
+        }
+
+        for serialization in ("compact", "pretty"):
+            MPComponent.register_serialization(serialization)
+            MPComponent._from_data_cache.clear()
+
+            decoded = MPComponent.from_data(MPComponent.to_data(payload))
+
+            magmoms = decoded["structure"].site_properties["magmom"]
+            assert np.isnan(magmoms[0]) and magmoms[1] == float("inf")
+            assert decoded["structure"].site_properties["charge"] == [None, 1]
+            assert np.array_equal(
+                decoded["densities"], payload["densities"], equal_nan=True
+            )
+            assert decoded["values"] == payload["values"]
+
+    def test_orjson(self, monkeypatch):
+
+        if crystal_toolkit.core.mpcomponent.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        def dumps(*args, **kwargs):
+            raise AssertionError("encoded with the json module")
+
+        monkeypatch.setattr(crystal_toolkit.core.mpcomponent, "dumps", dumps)
+
+        # None is written as null, but only NaN and infinity need the json module
+        struct = self.payloads["Structure"].copy(
+            site_properties={"charge": [None] * len(self.payloads["Structure"])}
+        )
+        data = MPComponent.to_data(struct)
+        assert "null" in data
+        assert MPComponent.from_data(data) == struct
+
+    def test_compact(self):
+
+        for name, obj in self.payloads.items():
+
+            MPComponent.register_serialization("pretty")
+            pretty_data = MPComponent.to_data(obj)
+
+            MPComponent.register_serialization("compact")
+            compact_data = MPComponent.to_data(obj)
+
+            assert len(compact_data) < len(pretty_data)
+            # both decode to the same object, decoded directly since
+            # from_data would return cached objects
+            for data in (pretty_data, compact_data):
+                assert MPComponent.to_data(MPComponent._decode(data)) == compact_data
+
+    def test_from_data_cache(self):
+
+        data = MPComponent.to_data(self.payloads["Structure"])
+
+        struct = MPComponent.from_data(data)
+        struct.replace(0, "Li")
+
+        hits = MPComponent.from_data_cache_info()["hits"]
+
+        # modifying a decoded object must not affect the cached object
+        assert MPComponent.from_data(data)[0].species_string == "Na"
+        assert MPComponent.from_data_cache_info()["hits"] == hits + 1
+
+        # read-only callers share the cached object
+        assert MPComponent.from_data(data, copy=False) is (
+            MPComponent.from_data(data, copy=False)
+        )
+        assert MPComponent.from_data(data) is not MPComponent.from_data(data)
@@ -0,0 +1,148 @@
+import os
+
+from tempfile import TemporaryDirectory
+from time import time
+
+import pytest
+
+from dash.exceptions import PreventUpdate
+
+import crystal_toolkit.core.object_store
+
+from crystal_toolkit.core.mpcomponent import MPComponent
+from crystal_toolkit.core.object_store import ObjectStore
+
+from pymatgen import Structure, Lattice
+
+
+class StaticComponent(MPComponent):
+    def all_layouts(self):
+        return {}
+
+    def generate_callbacks(self, app, cache):
+        pass
+
+
+class TestObjectStore:
+    def setup_method(self, method):
+
+        self.tempdir = TemporaryDirectory()
+        self.store = ObjectStore(directory=self.tempdir.name, ttl=60, min_size=100)
+
+        struct = Structure(Lattice.cubic(4.2), ["Na", "K"], [[0, 0, 0], [0.5] * 3])
+        struct.make_supercell([3, 3, 3])
+        self.struct = struct
+
+    def teardown_method(self, method):
+        MPComponent.register_object_store(None)
+        self.tempdir.cleanup()
+
+    def test_put_get(self):
+
+        data = MPComponent.to_data(self.struct)
+        handle = self.store.put(data)
+
+        assert ObjectStore.is_handle(handle)
+        assert len(handle) < 100
+        assert self.store.get(handle) == data
+        assert MPComponent.get_data_hash(handle) == MPComponent.get_data_hash(data)
+
+        # a new store, e.g. in another process, reads the data from disk
+        store = ObjectStore(directory=self.tempdir.name, ttl=60)
+        assert store.get(handle) == data
+
+        with pytest.raises(KeyError):
+            store.get(ObjectStore.prefix + "0" * 40)
+
+    def test_expiry(self):
+
+        handle = self.store.put(MPComponent.to_data(self.struct))
+        path = os.path.join(self.tempdir.name, f"{ObjectStore.get_key(handle)}.json")
+        os.utime(path, (time() - 120, time() - 120))
+
+        store = ObjectStore(directory=self.tempdir.name, ttl=60)
+        with pytest.raises(KeyError):
+            store.get(handle)
+
+        # expired data is removed when new data is stored
+        store.put(MPComponent.to_data(Structure(Lattice.cubic(3), ["Li"], [[0] * 3])))
+        assert not os.path.exists(path)
+
+    def test_refresh(self, monkeypatch):
+
+        now = time()
+        monkeypatch.setattr(crystal_toolkit.core.object_store, "time", lambda: now)
+
+        handle = self.store.put(MPComponent.to_data(self.struct))
+        path = self.store._get_path(ObjectStore.get_key(handle))
+
+        # data in use in this process does not expire for other processes
+        now += 45
+        assert self.store.get(handle)
+        assert os.path.getmtime(path) > time() - 5
+
+        # even if removed in the meantime by another process
+        os.remove(path)
+        now += 10
+        assert self.store.get(handle)
+        assert os.path.exists(path)
+
+        # data not used for ttl seconds is not kept in memory either
+        os.remove(path)
+        now += 61
+        with pytest.raises(KeyError):
+            self.store.get(handle)
+
+    def test_put_after_eviction(self, monkeypatch):
+
+        data = MPComponent.to_data(self.struct)
+        handle = self.store.put(data)
+        path = self.store._get_path(ObjectStore.get_key(handle))
+
+        # removed by another process just after checking that it exists
+        os.remove(path)
+        with monkeypatch.context() as m:
+            m.setattr(os.path, "exists", lambda path: True)
+            self.store.put(data)
+        assert ObjectStore(directory=self.tempdir.name).get(handle) == data
+
+    def test_mpcomponent(self):
+
+        MPComponent.register_object_store(self.store)
+
+        handle = MPComponent.to_data(self.struct)
+        assert ObjectStore.is_handle(handle)
+        assert MPComponent.from_data(handle) == self.struct
+
+        # small data is not worth storing
+        small_data = MPComponent.to_data({"a": 1})
+        assert not ObjectStore.is_handle(small_data)
+        assert MPComponent.from_data(small_data) == {"a": 1}
+
+        # data for caches is never replaced by a handle
+        assert not ObjectStore.is_handle(
+            MPComponent.to_data(self.struct, use_object_store=False)
+        )
+
+    def test_expired_handle(self):
+
+        MPComponent.register_object_store(self.store)
+        MPComponent._from_data_cache.clear()
+
+        handle = MPComponent.to_data(self.struct)
+        self.store._memory.clear()
+        os.remove(self.store._get_path(ObjectStore.get_key(handle)))
+
+        # callbacks using expired data do not update
+        with pytest.warns(UserWarning, match="reloaded"):
+            with pytest.raises(PreventUpdate):
+                MPComponent.from_data(handle)
+
+    def test_initial_data(self):
+
+        MPComponent.register_object_store(self.store)
+
+        # initial data is part of the layout, so is never replaced by a handle
+        component = StaticComponent(self.struct, id="object_store_test", static=True)
+        assert not ObjectStore.is_handle(component.initial_data)
+        assert not ObjectStore.is_handle(component._stores["default"].data)
@@ -0,0 +1,211 @@
+from base64 import b64decode
+
+import numpy as np
+
+from crystal_toolkit.core.scene import (
+    Scene,
+    Spheres,
+    Cylinders,
+    _bounding_box,
+    _encode_array,
+    get_scene_patch,
+    get_scene_skeleton,
+)
+
+
+class TestArrayPrimitives:
+    def setup_method(self, method):
+
+        rng = np.random.RandomState(0)
+        self.positions = rng.rand(100, 3)
+        self.colors = rng.choice(["#ff0000", "#00ff00"], size=100).tolist()
+        self.radii = rng.choice([0.5, 1.0, 1.5], size=100).tolist()
+
+    def test_bounding_box(self):
+
+        assert _bounding_box(self.positions) == [
+            self.positions.min(axis=0).tolist(),
+            self.positions.max(axis=0).tolist(),
+        ]
+        assert _bounding_box([[0, 1, 2]]) == [[0, 1, 2], [0, 1, 2]]
+
+        # position pairs give the box around both ends of every pair
+        cylinders = Cylinders(positionPairs=[[[0, 0, 0], [1, 2, 3]]])
+        assert cylinders.bounding_box == [[0, 0, 0], [1, 2, 3]]
+
+    def test_from_arrays(self):
+
+        spheres = Spheres.from_arrays(self.positions, self.colors, self.radii)
+
+        assert len(spheres) == len(set(zip(self.colors, self.radii)))
+        assert sum(len(sphere.positions) for sphere in spheres) == 100
+
+        # same spheres as creating one Spheres per position
+        expected = {
+            (color, radius, tuple(position))
+            for position, color, radius in zip(
+                self.positions.tolist(), self.colors, self.radii
+            )
+        }
+        assert {
+            (sphere.color, sphere.radius, tuple(position))
+            for sphere in spheres
+            for position in sphere.positions.tolist()
+        } == expected
+
+        # groups are ordered by first appearance
+        assert (spheres[0].color, spheres[0].radius) == (
+            self.colors[0],
+            self.radii[0],
+        )
+
+        assert Spheres.from_arrays(np.empty((0, 3)), [], []) == []
+
+    def test_merge(self):
+
+        spheres = [
+            Spheres(positions=position.reshape(1, 3), color="#ff0000")
+            for position in self.positions
+        ] + [Spheres(positions=[[0, 0, 0]], color="#ff0000")]
+
+        merged = Scene.merge_primitives(spheres)
+
+        assert len(merged) == 1
+        assert np.allclose(merged[0].positions[:100], self.positions)
+        assert np.allclose(merged[0].positions[100], [0, 0, 0])
+
+    def test_to_json(self):
+
+        spheres = Spheres.from_arrays(self.positions, self.colors, self.radii)
+        scene_json = Scene("test", contents=spheres).to_json()
+
+        assert len(scene_json["contents"]) == len(spheres)
+        for sphere, sphere_json in zip(spheres, scene_json["contents"]):
+            assert sphere_json["positions"] == sphere.positions.tolist()
+            assert sphere_json["color"] == sphere.color
+            assert sphere_json["radius"] == sphere.radius
+            assert "phiStart" not in sphere_json
+
+
+class TestBinaryTransport:
+    def setup_method(self, method):
+
+        self.positions = np.random.RandomState(0).rand(10, 3)
+
+    def test_encode_array(self):
+
+        encoded = _encode_array(self.positions)
+
+        assert encoded["@binary"] == "float32"
+        assert encoded["shape"] == [10, 3]
+
+        decoded = np.frombuffer(b64decode(encoded["data"]), dtype="<f4")
+        assert decoded.dtype == np.dtype("<f4")
+        assert np.allclose(decoded.reshape(encoded["shape"]), self.positions)
+
+        # nested lists are encoded the same way as arrays
+        assert _encode_array(self.positions.tolist()) == encoded
+
+        # ragged input cannot be sent as a buffer
+        assert _encode_array([[0, 0, 0], [1, 1]]) is None
+
+    def test_to_json(self):
+
+        scene = Scene(
+            "test",
+            contents=[
+                Spheres(positions=self.positions, color="#ff0000"),
+                Cylinders(positionPairs=self.positions[:8].reshape(4, 2, 3)),
+            ],
+        )
+
+        scene_json = scene.to_json(binary=True)
+        spheres_json, cylinders_json = scene_json["contents"]
+
+        assert spheres_json["color"] == "#ff0000"
+        assert spheres_json["positions"]["shape"] == [10, 3]
+        assert cylinders_json["positionPairs"]["shape"] == [4, 2, 3]
+
+        # decodes to the same values as the plain JSON, to float32 precision
+        plain_json = scene.to_json()
+        for encoded, expected in [
+            (spheres_json["positions"], plain_json["contents"][0]["positions"]),
+            (
+                cylinders_json["positionPairs"],
+                plain_json["contents"][1]["positionPairs"],
+            ),
+        ]:
+            decoded = np.frombuffer(b64decode(encoded["data"]), dtype="<f4")
+            assert np.allclose(decoded.reshape(encoded["shape"]), expected)
+
+
+class TestScenePatch:
+    def setup_method(self, method):
+
+        self.scene = Scene(
+            "test",
+            contents=[
+                Scene(
+                    "atoms",
+                    contents=[
+                        Spheres(positions=[[0, 0, 0]], color="#ff0000", radius=0.5),
+                        Spheres(positions=[[1, 1, 1]], color="#0000ff", radius=0.5),
+                    ],
+                ),
+                Scene(
+                    "bonds",
+                    contents=[Cylinders(positionPairs=[[[0, 0, 0], [1, 1, 1]]])],
+                ),
+            ],
+        )
+
+    def test_patchable(self):
+
+        old_json = self.scene.to_json()
+        self.scene.contents[0].contents[1].color = "#00ff00"
+        self.scene.contents[0].contents[1].radius = 1.0
+        self.scene.contents[1].contents[0].radius = 0.2
+        new_json = self.scene.to_json()
+
+        assert get_scene_patch(old_json, new_json) == {
+            "name": "test",
+            "updates": [
+                {"path": [0, 1], "color": "#00ff00", "radius": 1.0},
+                {"path": [1, 0], "radius": 0.2},
+            ],
+        }
+
+        # identical scenes give an empty patch
+        assert get_scene_patch(new_json, new_json) == {"name": "test", "updates": []}
+
+    def test_not_patchable(self):
+
+        old_json = self.scene.to_json()
+
+        # geometry changed
+        self.scene.contents[0].contents[0].positions = [[0.5, 0, 0]]
+        assert get_scene_patch(old_json, self.scene.to_json()) is None
+
+        # number of primitives changed
+        self.scene.contents[0].contents.pop()
+        assert get_scene_patch(old_json, self.scene.to_json()) is None
+
+        # nothing displayed yet
+        assert get_scene_patch(None, old_json) is None
+
+    def test_skeleton(self):
+
+        old_json = self.scene.to_json(binary=True)
+        old_skeleton = get_scene_skeleton(old_json)
+        assert "positions" not in old_skeleton["contents"][0]["contents"][0]
+
+        # skeletons can be patched in the same way as the scenes themselves
+        self.scene.contents[0].contents[1].color = "#00ff00"
+        new_json = self.scene.to_json(binary=True)
+        assert get_scene_patch(old_skeleton, get_scene_skeleton(new_json)) == (
+            get_scene_patch(old_json, new_json)
+        )
+
+        self.scene.contents[0].contents[0].positions = [[0.5, 0, 0]]
+        new_json = self.scene.to_json(binary=True)
+        assert get_scene_patch(old_skeleton, get_scene_skeleton(new_json)) is None
@@ -58,7 +58,7 @@ var r;r=function(){return function(e){var t={};function i(r){if(t[r])return t[r]
  *
  * Copyright (c) 2016 Jorik Tangelder;
  * Licensed under the MIT license */
-!function(n,o,a,s){var l,u=["","webkit","Moz","MS","ms","o"],h=o.createElement("div"),c="function",d=Math.round,p=Math.abs,f=Date.now;function m(e,t,i){return setTimeout(w(e,i),t)}function v(e,t,i){return!!Array.isArray(e)&&(g(e,i[t],i),!0)}function g(e,t,i){var r;if(e)if(e.forEach)e.forEach(t,i);else if(e.length!==s)for(r=0;r<e.length;)t.call(i,e[r],r,e),r++;else for(r in e)e.hasOwnProperty(r)&&t.call(i,e[r],r,e)}function y(e,t,i){var r="DEPRECATED METHOD: "+t+"\n"+i+" AT \n";return function(){var t=new Error("get-stack-trace"),i=t&&t.stack?t.stack.replace(/^[^\(]+?[\n$]/gm,"").replace(/^\s+at\s+/gm,"").replace(/^Object.<anonymous>\s*\(/gm,"{anonymous}()@"):"Unknown Stack Trace",o=n.console&&(n.console.warn||n.console.log);return o&&o.call(n.console,r,i),e.apply(this,arguments)}}l="function"!=typeof Object.assign?function(e){if(e===s||null===e)throw new TypeError("Cannot convert undefined or null to object");for(var t=Object(e),i=1;i<arguments.length;i++){var r=arguments[i];if(r!==s&&null!==r)for(var n in r)r.hasOwnProperty(n)&&(t[n]=r[n])}return t}:Object.assign;var _=y(function(e,t,i){for(var r=Object.keys(t),n=0;n<r.length;)(!i||i&&e[r[n]]===s)&&(e[r[n]]=t[r[n]]),n++;return e},"extend","Use `assign`."),b=y(function(e,t){return _(e,t,!0)},"merge","Use `assign`.");function x(e,t,i){var r,n=t.prototype;(r=e.prototype=Object.create(n)).constructor=e,r._super=n,i&&l(r,i)}function w(e,t){return function(){return e.apply(t,arguments)}}function S(e,t){return typeof e==c?e.apply(t&&t[0]||s,t):e}function M(e,t){return e===s?t:e}function T(e,t,i){g(N(t),function(t){e.addEventListener(t,i,!1)})}function A(e,t,i){g(N(t),function(t){e.removeEventListener(t,i,!1)})}function C(e,t){for(;e;){if(e==t)return!0;e=e.parentNode}return!1}function L(e,t){return e.indexOf(t)>-1}function N(e){return e.trim().split(/\s+/g)}function k(e,t,i){if(e.indexOf&&!i)return e.indexOf(t);for(var r=0;r<e.length;){if(i&&e[r][i]==t||!i&&e[r]===t)return r;r++}return-1}function P(e){return Array.prototype.slice.call(e,0)}function E(e,t,i){for(var r=[],n=[],o=0;o<e.length;){var a=t?e[o][t]:e[o];k(n,a)<0&&r.push(e[o]),n[o]=a,o++}return i&&(r=t?r.sort(function(e,i){return e[t]>i[t]}):r.sort()),r}function D(e,t){for(var i,r,n=t[0].toUpperCase()+t.slice(1),o=0;o<u.length;){if((r=(i=u[o])?i+n:t)in e)return r;o++}return s}var O=1;function R(e){var t=e.ownerDocument||e;return t.defaultView||t.parentWindow||n}var F="ontouchstart"in n,I=D(n,"PointerEvent")!==s,B=F&&/mobile|tablet|ip(ad|hone|od)|android/i.test(navigator.userAgent),U=25,V=1,z=2,G=4,j=8,W=1,H=2,q=4,Y=8,X=16,K=H|q,Q=Y|X,Z=K|Q,J=["x","y"],$=["clientX","clientY"];function ee(e,t){var i=this;this.manager=e,this.callback=t,this.element=e.element,this.target=e.options.inputTarget,this.domHandler=function(t){S(e.options.enable,[e])&&i.handler(t)},this.init()}function te(e,t,i){var r=i.pointers.length,n=i.changedPointers.length,o=t&V&&r-n==0,a=t&(G|j)&&r-n==0;i.isFirst=!!o,i.isFinal=!!a,o&&(e.session={}),i.eventType=t,function(e,t){var i=e.session,r=t.pointers,n=r.length;i.firstInput||(i.firstInput=ie(t));n>1&&!i.firstMultiple?i.firstMultiple=ie(t):1===n&&(i.firstMultiple=!1);var o=i.firstInput,a=i.firstMultiple,l=a?a.center:o.center,u=t.center=re(r);t.timeStamp=f(),t.deltaTime=t.timeStamp-o.timeStamp,t.angle=se(l,u),t.distance=ae(l,u),function(e,t){var i=t.center,r=e.offsetDelta||{},n=e.prevDelta||{},o=e.prevInput||{};t.eventType!==V&&o.eventType!==G||(n=e.prevDelta={x:o.deltaX||0,y:o.deltaY||0},r=e.offsetDelta={x:i.x,y:i.y});t.deltaX=n.x+(i.x-r.x),t.deltaY=n.y+(i.y-r.y)}(i,t),t.offsetDirection=oe(t.deltaX,t.deltaY);var h=ne(t.deltaTime,t.deltaX,t.deltaY);t.overallVelocityX=h.x,t.overallVelocityY=h.y,t.overallVelocity=p(h.x)>p(h.y)?h.x:h.y,t.scale=a?(c=a.pointers,d=r,ae(d[0],d[1],$)/ae(c[0],c[1],$)):1,t.rotation=a?function(e,t){return se(t[1],t[0],$)+se(e[1],e[0],$)}(a.pointers,r):0,t.maxPointers=i.prevInput?t.pointers.length>i.prevInput.maxPointers?t.pointers.length:i.prevInput.maxPointers:t.pointers.length,function(e,t){var i,r,n,o,a=e.lastInterval||t,l=t.timeStamp-a.timeStamp;if(t.eventType!=j&&(l>U||a.velocity===s)){var u=t.deltaX-a.deltaX,h=t.deltaY-a.deltaY,c=ne(l,u,h);r=c.x,n=c.y,i=p(c.x)>p(c.y)?c.x:c.y,o=oe(u,h),e.lastInterval=t}else i=a.velocity,r=a.velocityX,n=a.velocityY,o=a.direction;t.velocity=i,t.velocityX=r,t.velocityY=n,t.direction=o}(i,t);var c,d;var m=e.element;C(t.srcEvent.target,m)&&(m=t.srcEvent.target);t.target=m}(e,i),e.emit("hammer.input",i),e.recognize(i),e.session.prevInput=i}function ie(e){for(var t=[],i=0;i<e.pointers.length;)t[i]={clientX:d(e.pointers[i].clientX),clientY:d(e.pointers[i].clientY)},i++;return{timeStamp:f(),pointers:t,center:re(t),deltaX:e.deltaX,deltaY:e.deltaY}}function re(e){var t=e.length;if(1===t)return{x:d(e[0].clientX),y:d(e[0].clientY)};for(var i=0,r=0,n=0;n<t;)i+=e[n].clientX,r+=e[n].clientY,n++;return{x:d(i/t),y:d(r/t)}}function ne(e,t,i){return{x:t/e||0,y:i/e||0}}function oe(e,t){return e===t?W:p(e)>=p(t)?e<0?H:q:t<0?Y:X}function ae(e,t,i){i||(i=J);var r=t[i[0]]-e[i[0]],n=t[i[1]]-e[i[1]];return Math.sqrt(r*r+n*n)}function se(e,t,i){i||(i=J);var r=t[i[0]]-e[i[0]],n=t[i[1]]-e[i[1]];return 180*Math.atan2(n,r)/Math.PI}ee.prototype={handler:function(){},init:function(){this.evEl&&T(this.element,this.evEl,this.domHandler),this.evTarget&&T(this.target,this.evTarget,this.domHandler),this.evWin&&T(R(this.element),this.evWin,this.domHandler)},destroy:function(){this.evEl&&A(this.element,this.evEl,this.domHandler),this.evTarget&&A(this.target,this.evTarget,this.domHandler),this.evWin&&A(R(this.element),this.evWin,this.domHandler)}};var le={mousedown:V,mousemove:z,mouseup:G},ue="mousedown",he="mousemove mouseup";function ce(){this.evEl=ue,this.evWin=he,this.pressed=!1,ee.apply(this,arguments)}x(ce,ee,{handler:function(e){var t=le[e.type];t&V&&0===e.button&&(this.pressed=!0),t&z&&1!==e.which&&(t=G),this.pressed&&(t&G&&(this.pressed=!1),this.callback(this.manager,t,{pointers:[e],changedPointers:[e],pointerType:"mouse",srcEvent:e}))}});var de={pointerdown:V,pointermove:z,pointerup:G,pointercancel:j,pointerout:j},pe={2:"touch",3:"pen",4:"mouse",5:"kinect"},fe="pointerdown",me="pointermove pointerup pointercancel";function ve(){this.evEl=fe,this.evWin=me,ee.apply(this,arguments),this.store=this.manager.session.pointerEvents=[]}n.MSPointerEvent&&!n.PointerEvent&&(fe="MSPointerDown",me="MSPointerMove MSPointerUp MSPointerCancel"),x(ve,ee,{handler:function(e){var t=this.store,i=!1,r=e.type.toLowerCase().replace("ms",""),n=de[r],o=pe[e.pointerType]||e.pointerType,a="touch"==o,s=k(t,e.pointerId,"pointerId");n&V&&(0===e.button||a)?s<0&&(t.push(e),s=t.length-1):n&(G|j)&&(i=!0),s<0||(t[s]=e,this.callback(this.manager,n,{pointers:t,changedPointers:[e],pointerType:o,srcEvent:e}),i&&t.splice(s,1))}});var ge={touchstart:V,touchmove:z,touchend:G,touchcancel:j},ye="touchstart",_e="touchstart touchmove touchend touchcancel";function be(){this.evTarget=ye,this.evWin=_e,this.started=!1,ee.apply(this,arguments)}x(be,ee,{handler:function(e){var t=ge[e.type];if(t===V&&(this.started=!0),this.started){var i=function(e,t){var i=P(e.touches),r=P(e.changedTouches);t&(G|j)&&(i=E(i.concat(r),"identifier",!0));return[i,r]}.call(this,e,t);t&(G|j)&&i[0].length-i[1].length==0&&(this.started=!1),this.callback(this.manager,t,{pointers:i[0],changedPointers:i[1],pointerType:"touch",srcEvent:e})}}});var xe={touchstart:V,touchmove:z,touchend:G,touchcancel:j},we="touchstart touchmove touchend touchcancel";function Se(){this.evTarget=we,this.targetIds={},ee.apply(this,arguments)}x(Se,ee,{handler:function(e){var t=xe[e.type],i=function(e,t){var i=P(e.touches),r=this.targetIds;if(t&(V|z)&&1===i.length)return r[i[0].identifier]=!0,[i,i];var n,o,a=P(e.changedTouches),s=[],l=this.target;if(o=i.filter(function(e){return C(e.target,l)}),t===V)for(n=0;n<o.length;)r[o[n].identifier]=!0,n++;n=0;for(;n<a.length;)r[a[n].identifier]&&s.push(a[n]),t&(G|j)&&delete r[a[n].identifier],n++;if(!s.length)return;return[E(o.concat(s),"identifier",!0),s]}.call(this,e,t);i&&this.callback(this.manager,t,{pointers:i[0],changedPointers:i[1],pointerType:"touch",srcEvent:e})}});var Me=2500,Te=25;function Ae(){ee.apply(this,arguments);var e=w(this.handler,this);this.touch=new Se(this.manager,e),this.mouse=new ce(this.manager,e),this.primaryTouch=null,this.lastTouches=[]}function Ce(e){var t=e.changedPointers[0];if(t.identifier===this.primaryTouch){var i={x:t.clientX,y:t.clientY};this.lastTouches.push(i);var r=this.lastTouches;setTimeout(function(){var e=r.indexOf(i);e>-1&&r.splice(e,1)},Me)}}x(Ae,ee,{handler:function(e,t,i){var r="touch"==i.pointerType,n="mouse"==i.pointerType;if(!(n&&i.sourceCapabilities&&i.sourceCapabilities.firesTouchEvents)){if(r)(function(e,t){e&V?(this.primaryTouch=t.changedPointers[0].identifier,Ce.call(this,t)):e&(G|j)&&Ce.call(this,t)}).call(this,t,i);else if(n&&function(e){for(var t=e.srcEvent.clientX,i=e.srcEvent.clientY,r=0;r<this.lastTouches.length;r++){var n=this.lastTouches[r],o=Math.abs(t-n.x),a=Math.abs(i-n.y);if(o<=Te&&a<=Te)return!0}return!1}.call(this,i))return;this.callback(e,t,i)}},destroy:function(){this.touch.destroy(),this.mouse.destroy()}});var Le=D(h.style,"touchAction"),Ne=Le!==s,ke="auto",Pe="manipulation",Ee="none",De="pan-x",Oe="pan-y",Re=function(){if(!Ne)return!1;var e={},t=n.CSS&&n.CSS.supports;return["auto","manipulation","pan-y","pan-x","pan-x pan-y","none"].forEach(function(i){e[i]=!t||n.CSS.supports("touch-action",i)}),e}();function Fe(e,t){this.manager=e,this.set(t)}Fe.prototype={set:function(e){"compute"==e&&(e=this.compute()),Ne&&this.manager.element.style&&Re[e]&&(this.manager.element.style[Le]=e),this.actions=e.toLowerCase().trim()},update:function(){this.set(this.manager.options.touchAction)},compute:function(){var e=[];return g(this.manager.recognizers,function(t){S(t.options.enable,[t])&&(e=e.concat(t.getTouchAction()))}),function(e){if(L(e,Ee))return Ee;var t=L(e,De),i=L(e,Oe);if(t&&i)return Ee;if(t||i)return t?De:Oe;if(L(e,Pe))return Pe;return ke}(e.join(" "))},preventDefaults:function(e){var t=e.srcEvent,i=e.offsetDirection;if(this.manager.session.prevented)t.preventDefault();else{var r=this.actions,n=L(r,Ee)&&!Re[Ee],o=L(r,Oe)&&!Re[Oe],a=L(r,De)&&!Re[De];if(n){var s=1===e.pointers.length,l=e.distance<2,u=e.deltaTime<250;if(s&&l&&u)return}if(!a||!o)return n||o&&i&K||a&&i&Q?this.preventSrc(t):void 0}},preventSrc:function(e){this.manager.session.prevented=!0,e.preventDefault()}};var Ie=1,Be=2,Ue=4,Ve=8,ze=Ve,Ge=16;function je(e){this.options=l({},this.defaults,e||{}),this.id=O++,this.manager=null,this.options.enable=M(this.options.enable,!0),this.state=Ie,this.simultaneous={},this.requireFail=[]}function We(e){return e&Ge?"cancel":e&Ve?"end":e&Ue?"move":e&Be?"start":""}function He(e){return e==X?"down":e==Y?"up":e==H?"left":e==q?"right":""}function qe(e,t){var i=t.manager;return i?i.get(e):e}function Ye(){je.apply(this,arguments)}function Xe(){Ye.apply(this,arguments),this.pX=null,this.pY=null}function Ke(){Ye.apply(this,arguments)}function Qe(){je.apply(this,arguments),this._timer=null,this._input=null}function Ze(){Ye.apply(this,arguments)}function Je(){Ye.apply(this,arguments)}function $e(){je.apply(this,arguments),this.pTime=!1,this.pCenter=!1,this._timer=null,this._input=null,this.count=0}function et(e,t){return(t=t||{}).recognizers=M(t.recognizers,et.defaults.preset),new tt(e,t)}je.prototype={defaults:{},set:function(e){return l(this.options,e),this.manager&&this.manager.touchAction.update(),this},recognizeWith:function(e){if(v(e,"recognizeWith",this))return this;var t=this.simultaneous;return t[(e=qe(e,this)).id]||(t[e.id]=e,e.recognizeWith(this)),this},dropRecognizeWith:function(e){return v(e,"dropRecognizeWith",this)?this:(e=qe(e,this),delete this.simultaneous[e.id],this)},requireFailure:function(e){if(v(e,"requireFailure",this))return this;var t=this.requireFail;return-1===k(t,e=qe(e,this))&&(t.push(e),e.requireFailure(this)),this},dropRequireFailure:function(e){if(v(e,"dropRequireFailure",this))return this;e=qe(e,this);var t=k(this.requireFail,e);return t>-1&&this.requireFail.splice(t,1),this},hasRequireFailures:function(){return this.requireFail.length>0},canRecognizeWith:function(e){return!!this.simultaneous[e.id]},emit:function(e){var t=this,i=this.state;function r(i){t.manager.emit(i,e)}i<Ve&&r(t.options.event+We(i)),r(t.options.event),e.additionalEvent&&r(e.additionalEvent),i>=Ve&&r(t.options.event+We(i))},tryEmit:function(e){if(this.canEmit())return this.emit(e);this.state=32},canEmit:function(){for(var e=0;e<this.requireFail.length;){if(!(this.requireFail[e].state&(32|Ie)))return!1;e++}return!0},recognize:function(e){var t=l({},e);if(!S(this.options.enable,[this,t]))return this.reset(),void(this.state=32);this.state&(ze|Ge|32)&&(this.state=Ie),this.state=this.process(t),this.state&(Be|Ue|Ve|Ge)&&this.tryEmit(t)},process:function(e){},getTouchAction:function(){},reset:function(){}},x(Ye,je,{defaults:{pointers:1},attrTest:function(e){var t=this.options.pointers;return 0===t||e.pointers.length===t},process:function(e){var t=this.state,i=e.eventType,r=t&(Be|Ue),n=this.attrTest(e);return r&&(i&j||!n)?t|Ge:r||n?i&G?t|Ve:t&Be?t|Ue:Be:32}}),x(Xe,Ye,{defaults:{event:"pan",threshold:10,pointers:1,direction:Z},getTouchAction:function(){var e=this.options.direction,t=[];return e&K&&t.push(Oe),e&Q&&t.push(De),t},directionTest:function(e){var t=this.options,i=!0,r=e.distance,n=e.direction,o=e.deltaX,a=e.deltaY;return n&t.direction||(t.direction&K?(n=0===o?W:o<0?H:q,i=o!=this.pX,r=Math.abs(e.deltaX)):(n=0===a?W:a<0?Y:X,i=a!=this.pY,r=Math.abs(e.deltaY))),e.direction=n,i&&r>t.threshold&&n&t.direction},attrTest:function(e){return Ye.prototype.attrTest.call(this,e)&&(this.state&Be||!(this.state&Be)&&this.directionTest(e))},emit:function(e){this.pX=e.deltaX,this.pY=e.deltaY;var t=He(e.direction);t&&(e.additionalEvent=this.options.event+t),this._super.emit.call(this,e)}}),x(Ke,Ye,{defaults:{event:"pinch",threshold:0,pointers:2},getTouchAction:function(){return[Ee]},attrTest:function(e){return this._super.attrTest.call(this,e)&&(Math.abs(e.scale-1)>this.options.threshold||this.state&Be)},emit:function(e){if(1!==e.scale){var t=e.scale<1?"in":"out";e.additionalEvent=this.options.event+t}this._super.emit.call(this,e)}}),x(Qe,je,{defaults:{event:"press",pointers:1,time:251,threshold:9},getTouchAction:function(){return[ke]},process:function(e){var t=this.options,i=e.pointers.length===t.pointers,r=e.distance<t.threshold,n=e.deltaTime>t.time;if(this._input=e,!r||!i||e.eventType&(G|j)&&!n)this.reset();else if(e.eventType&V)this.reset(),this._timer=m(function(){this.state=ze,this.tryEmit()},t.time,this);else if(e.eventType&G)return ze;return 32},reset:function(){clearTimeout(this._timer)},emit:function(e){this.state===ze&&(e&&e.eventType&G?this.manager.emit(this.options.event+"up",e):(this._input.timeStamp=f(),this.manager.emit(this.options.event,this._input)))}}),x(Ze,Ye,{defaults:{event:"rotate",threshold:0,pointers:2},getTouchAction:function(){return[Ee]},attrTest:function(e){return this._super.attrTest.call(this,e)&&(Math.abs(e.rotation)>this.options.threshold||this.state&Be)}}),x(Je,Ye,{defaults:{event:"swipe",threshold:10,velocity:.3,direction:K|Q,pointers:1},getTouchAction:function(){return Xe.prototype.getTouchAction.call(this)},attrTest:function(e){var t,i=this.options.direction;return i&(K|Q)?t=e.overallVelocity:i&K?t=e.overallVelocityX:i&Q&&(t=e.overallVelocityY),this._super.attrTest.call(this,e)&&i&e.offsetDirection&&e.distance>this.options.threshold&&e.maxPointers==this.options.pointers&&p(t)>this.options.velocity&&e.eventType&G},emit:function(e){var t=He(e.offsetDirection);t&&this.manager.emit(this.options.event+t,e),this.manager.emit(this.options.event,e)}}),x($e,je,{defaults:{event:"tap",pointers:1,taps:1,interval:300,time:250,threshold:9,posThreshold:10},getTouchAction:function(){return[Pe]},process:function(e){var t=this.options,i=e.pointers.length===t.pointers,r=e.distance<t.threshold,n=e.deltaTime<t.time;if(this.reset(),e.eventType&V&&0===this.count)return this.failTimeout();if(r&&n&&i){if(e.eventType!=G)return this.failTimeout();var o=!this.pTime||e.timeStamp-this.pTime<t.interval,a=!this.pCenter||ae(this.pCenter,e.center)<t.posThreshold;if(this.pTime=e.timeStamp,this.pCenter=e.center,a&&o?this.count+=1:this.count=1,this._input=e,0===this.count%t.taps)return this.hasRequireFailures()?(this._timer=m(function(){this.state=ze,this.tryEmit()},t.interval,this),Be):ze}return 32},failTimeout:function(){return this._timer=m(function(){this.state=32},this.options.interval,this),32},reset:function(){clearTimeout(this._timer)},emit:function(){this.state==ze&&(this._input.tapCount=this.count,this.manager.emit(this.options.event,this._input))}}),et.VERSION="2.0.7",et.defaults={domEvents:!1,touchAction:"compute",enable:!0,inputTarget:null,inputClass:null,preset:[[Ze,{enable:!1}],[Ke,{enable:!1},["rotate"]],[Je,{direction:K}],[Xe,{direction:K},["swipe"]],[$e],[$e,{event:"doubletap",taps:2},["tap"]],[Qe]],cssProps:{userSelect:"none",touchSelect:"none",touchCallout:"none",contentZooming:"none",userDrag:"none",tapHighlightColor:"rgba(0,0,0,0)"}};function tt(e,t){var i;this.options=l({},et.defaults,t||{}),this.options.inputTarget=this.options.inputTarget||e,this.handlers={},this.session={},this.recognizers=[],this.oldCssProps={},this.element=e,this.input=new((i=this).options.inputClass||(I?ve:B?Se:F?Ae:ce))(i,te),this.touchAction=new Fe(this,this.options.touchAction),it(this,!0),g(this.options.recognizers,function(e){var t=this.add(new e[0](e[1]));e[2]&&t.recognizeWith(e[2]),e[3]&&t.requireFailure(e[3])},this)}function it(e,t){var i,r=e.element;r.style&&(g(e.options.cssProps,function(n,o){i=D(r.style,o),t?(e.oldCssProps[i]=r.style[i],r.style[i]=n):r.style[i]=e.oldCssProps[i]||""}),t||(e.oldCssProps={}))}tt.prototype={set:function(e){return l(this.options,e),e.touchAction&&this.touchAction.update(),e.inputTarget&&(this.input.destroy(),this.input.target=e.inputTarget,this.input.init()),this},stop:function(e){this.session.stopped=e?2:1},recognize:function(e){var t=this.session;if(!t.stopped){var i;this.touchAction.preventDefaults(e);var r=this.recognizers,n=t.curRecognizer;(!n||n&&n.state&ze)&&(n=t.curRecognizer=null);for(var o=0;o<r.length;)i=r[o],2===t.stopped||n&&i!=n&&!i.canRecognizeWith(n)?i.reset():i.recognize(e),!n&&i.state&(Be|Ue|Ve)&&(n=t.curRecognizer=i),o++}},get:function(e){if(e instanceof je)return e;for(var t=this.recognizers,i=0;i<t.length;i++)if(t[i].options.event==e)return t[i];return null},add:function(e){if(v(e,"add",this))return this;var t=this.get(e.options.event);return t&&this.remove(t),this.recognizers.push(e),e.manager=this,this.touchAction.update(),e},remove:function(e){if(v(e,"remove",this))return this;if(e=this.get(e)){var t=this.recognizers,i=k(t,e);-1!==i&&(t.splice(i,1),this.touchAction.update())}return this},on:function(e,t){if(e!==s&&t!==s){var i=this.handlers;return g(N(e),function(e){i[e]=i[e]||[],i[e].push(t)}),this}},off:function(e,t){if(e!==s){var i=this.handlers;return g(N(e),function(e){t?i[e]&&i[e].splice(k(i[e],t),1):delete i[e]}),this}},emit:function(e,t){this.options.domEvents&&function(e,t){var i=o.createEvent("Event");i.initEvent(e,!0,!0),i.gesture=t,t.target.dispatchEvent(i)}(e,t);var i=this.handlers[e]&&this.handlers[e].slice();if(i&&i.length){t.type=e,t.preventDefault=function(){t.srcEvent.preventDefault()};for(var r=0;r<i.length;)i[r](t),r++}},destroy:function(){this.element&&it(this,!1),this.handlers={},this.session={},this.input.destroy(),this.element=null}},l(et,{INPUT_START:V,INPUT_MOVE:z,INPUT_END:G,INPUT_CANCEL:j,STATE_POSSIBLE:Ie,STATE_BEGAN:Be,STATE_CHANGED:Ue,STATE_ENDED:Ve,STATE_RECOGNIZED:ze,STATE_CANCELLED:Ge,STATE_FAILED:32,DIRECTION_NONE:W,DIRECTION_LEFT:H,DIRECTION_RIGHT:q,DIRECTION_UP:Y,DIRECTION_DOWN:X,DIRECTION_HORIZONTAL:K,DIRECTION_VERTICAL:Q,DIRECTION_ALL:Z,Manager:tt,Input:ee,TouchAction:Fe,TouchInput:Se,MouseInput:ce,PointerEventInput:ve,TouchMouseInput:Ae,SingleTouchInput:be,Recognizer:je,AttrRecognizer:Ye,Tap:$e,Pan:Xe,Swipe:Je,Pinch:Ke,Rotate:Ze,Press:Qe,on:T,off:A,each:g,merge:b,extend:_,assign:l,inherit:x,bindFn:w,prefixed:D}),(void 0!==n?n:"undefined"!=typeof self?self:{}).Hammer=et,(r=function(){return et}.call(t,i,t,e))===s||(e.exports=r)}(window,document)},function(e,t,i){t.util=i(2),t.DOMutil=i(14),t.DataSet=i(11),t.DataView=i(12),t.Queue=i(43),t.Timeline=i(178),t.Graph2d=i(180),t.timeline={Core:i(65),DateUtil:i(36),Range:i(64),stack:i(100),TimeStep:i(66),components:{items:{Item:i(38),BackgroundItem:i(103),BoxItem:i(101),PointItem:i(102),RangeItem:i(70)},BackgroundGroup:i(69),Component:i(16),CurrentTime:i(67),CustomTime:i(46),DataAxis:i(107),DataScale:i(108),GraphGroup:i(109),Group:i(68),ItemSet:i(99),Legend:i(112),LineGraph:i(106),TimeAxis:i(45)}},t.moment=i(9),t.Hammer=i(10),t.keycharm=i(35)},function(e,t,i){var r=i(9),n=i(2),o=i(11),a=i(12),s=i(64),l=i(65),u=i(45),h=i(67),c=i(46),d=i(99),p=i(15).printStyle,f=i(105).allOptions,m=i(105).configureOptions,v=i(71).default,g=i(15).default;function y(e,t,i,l){if(!(this instanceof y))throw new SyntaxError("Constructor must be called with the new operator");if(!(Array.isArray(i)||i instanceof o||i instanceof a)&&i instanceof Object){var c=l;l=i,i=c}l&&l.throttleRedraw&&console.warn('Timeline option "throttleRedraw" is DEPRICATED and no longer supported. It will be removed in the next MAJOR release.');var p=this;if(this.defaultOptions={start:null,end:null,autoResize:!0,orientation:{axis:"bottom",item:"bottom"},moment:r,width:null,height:null,maxHeight:null,minHeight:null},this.options=n.deepExtend({},this.defaultOptions),this._create(e),!l||l&&void 0===l.rtl){this.dom.root.style.visibility="hidden";for(var f,m=this.dom.root;!f&&m;)f=window.getComputedStyle(m,null).direction,m=m.parentElement;this.options.rtl=f&&"rtl"==f.toLowerCase()}else this.options.rtl=l.rtl;this.options.rollingMode=l&&l.rollingMode,this.options.onInitialDrawComplete=l&&l.onInitialDrawComplete,this.components=[],this.body={dom:this.dom,domProps:this.props,emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this)},hiddenDates:[],util:{getScale:function(){return p.timeAxis.step.scale},getStep:function(){return p.timeAxis.step.step},toScreen:p._toScreen.bind(p),toGlobalScreen:p._toGlobalScreen.bind(p),toTime:p._toTime.bind(p),toGlobalTime:p._toGlobalTime.bind(p)}},this.range=new s(this.body,this.options),this.components.push(this.range),this.body.range=this.range,this.timeAxis=new u(this.body,this.options),this.timeAxis2=null,this.components.push(this.timeAxis),this.currentTime=new h(this.body,this.options),this.components.push(this.currentTime),this.itemSet=new d(this.body,this.options),this.components.push(this.itemSet),this.itemsData=null,this.groupsData=null,this.dom.root.onclick=function(e){p.emit("click",p.getEventProperties(e))},this.dom.root.ondblclick=function(e){p.emit("doubleClick",p.getEventProperties(e))},this.dom.root.oncontextmenu=function(e){p.emit("contextmenu",p.getEventProperties(e))},this.dom.root.onmouseover=function(e){p.emit("mouseOver",p.getEventProperties(e))},window.PointerEvent?(this.dom.root.onpointerdown=function(e){p.emit("mouseDown",p.getEventProperties(e))},this.dom.root.onpointermove=function(e){p.emit("mouseMove",p.getEventProperties(e))},this.dom.root.onpointerup=function(e){p.emit("mouseUp",p.getEventProperties(e))}):(this.dom.root.onmousemove=function(e){p.emit("mouseMove",p.getEventProperties(e))},this.dom.root.onmousedown=function(e){p.emit("mouseDown",p.getEventProperties(e))},this.dom.root.onmouseup=function(e){p.emit("mouseUp",p.getEventProperties(e))}),this.initialFitDone=!1,this.on("changed",function(){if(null!=this.itemsData&&!this.options.rollingMode){if(!p.initialFitDone)if(p.initialFitDone=!0,null!=p.options.start||null!=p.options.end){if(null==p.options.start||null==p.options.end)var e=p.getItemRange();var t=null!=p.options.start?p.options.start:e.min,i=null!=p.options.end?p.options.end:e.max;p.setWindow(t,i,{animation:!1})}else p.fit({animation:!1});!p.initialDrawDone&&p.initialRangeChangeDone&&(p.initialDrawDone=!0,p.dom.root.style.visibility="visible",p.options.onInitialDrawComplete&&setTimeout(function(){return p.options.onInitialDrawComplete()},0))}}),l&&this.setOptions(l),i&&this.setGroups(i),t&&this.setItems(t),this._redraw()}function _(e){return n.convert(e.data.start,"Date").valueOf()}function b(e){var t=null!=e.data.end?e.data.end:e.data.start;return n.convert(t,"Date").valueOf()}function x(e,t){var i=e.props.leftContainer.height,r=e.props.left.height,n=t.parent,o=n.top,a=!0,s=e.timeAxis.options.orientation.axis,l=function(){return"bottom"==s?n.height-t.top-t.height:t.top},u=-1*e._getScrollTop(),h=o+l(),c=t.height;return h<u?o+i<=o+l()+c&&(o+=l()-e.itemSet.options.margin.item.vertical):h+c>u+i?o+=l()+c-i+e.itemSet.options.margin.item.vertical:a=!1,{shouldScroll:a,scrollOffset:o=Math.min(o,r-i),itemTop:h}}y.prototype=new l,y.prototype._createConfigurator=function(){return new v(this,this.dom.container,m)},y.prototype.redraw=function(){this.itemSet&&this.itemSet.markDirty({refreshItems:!0}),this._redraw()},y.prototype.setOptions=function(e){if(!0===g.validate(e,f)&&console.log("%cErrors have been found in the supplied options object.",p),l.prototype.setOptions.call(this,e),"type"in e&&e.type!==this.options.type){this.options.type=e.type;var t=this.itemsData;if(t){var i=this.getSelection();this.setItems(null),this.setItems(t),this.setSelection(i)}}},y.prototype.setItems=function(e){var t;t=e?e instanceof o||e instanceof a?e:new o(e,{type:{start:"Date",end:"Date"}}):null,this.itemsData=t,this.itemSet&&this.itemSet.setItems(t)},y.prototype.setGroups=function(e){var t;if(e){var i=function(e){return!1!==e.visible};t=e instanceof o||e instanceof a?new a(e,{filter:i}):new o(e.filter(i))}else t=null;this.groupsData=t,this.itemSet.setGroups(t)},y.prototype.setData=function(e){e&&e.groups&&this.setGroups(e.groups),e&&e.items&&this.setItems(e.items)},y.prototype.setSelection=function(e,t){this.itemSet&&this.itemSet.setSelection(e),t&&t.focus&&this.focus(e,t)},y.prototype.getSelection=function(){return this.itemSet&&this.itemSet.getSelection()||[]},y.prototype.focus=function(e,t){if(this.itemsData&&null!=e){var i=Array.isArray(e)?e:[e],r=this.itemsData.getDataSet().get(i,{type:{start:"Date",end:"Date"}}),n=null,o=null;if(r.forEach(function(e){var t=e.start.valueOf(),i="end"in e?e.end.valueOf():e.start.valueOf();(null===n||t<n)&&(n=t),(null===o||i>o)&&(o=i)}),null!==n&&null!==o){var a=this,s=this.itemSet.items[i[0]],l=-1*this._getScrollTop(),u=null,h=function(){var e=x(a,s);e.shouldScroll&&e.itemTop!=u.itemTop&&(a._setScrollTop(-e.scrollOffset),a._redraw())},c=(n+o)/2,d=Math.max(this.range.end-this.range.start,1.1*(o-n)),p=!t||void 0===t.animation||t.animation;p||(u={shouldScroll:!1,scrollOffset:-1,itemTop:-1}),this.range.setRange(c-d/2,c+d/2,{animation:p},function(){h(),setTimeout(h,100)},function(e,t,i){var r=x(a,s);if(u||(u=r),u.itemTop!=r.itemTop||u.shouldScroll){u.itemTop!=r.itemTop&&r.shouldScroll&&(u=r,l=-1*a._getScrollTop());var n=l,o=u.scrollOffset,h=i?o:n+(o-n)*e;a._setScrollTop(-h),t||a._redraw()}})}}},y.prototype.fit=function(e,t){var i,r=!e||void 0===e.animation||e.animation,n=this.itemsData&&this.itemsData.getDataSet();1===n.length&&void 0===n.get()[0].end?(i=this.getDataRange(),this.moveTo(i.min.valueOf(),{animation:r},t)):(i=this.getItemRange(),this.range.setRange(i.min,i.max,{animation:r},t))},y.prototype.getItemRange=function(){var e=this.getDataRange(),t=null!==e.min?e.min.valueOf():null,i=null!==e.max?e.max.valueOf():null,r=null,o=null;if(null!=t&&null!=i){var a=i-t;a<=0&&(a=10);var s=a/this.props.center.width,l={},u=0;if(n.forEach(this.itemSet.items,function(e,t){if(e.groupShowing){l[t]=e.redraw(!0),u=l[t].length}}),u>0)for(var h=0;h<u;h++)n.forEach(l,function(e){e[h]()});if(n.forEach(this.itemSet.items,function(e){var n,a,l=_(e),u=b(e);this.options.rtl?(n=l-(e.getWidthRight()+10)*s,a=u+(e.getWidthLeft()+10)*s):(n=l-(e.getWidthLeft()+10)*s,a=u+(e.getWidthRight()+10)*s),n<t&&(t=n,r=e),a>i&&(i=a,o=e)}.bind(this)),r&&o){var c=r.getWidthLeft()+10,d=o.getWidthRight()+10,p=this.props.center.width-c-d;p>0&&(this.options.rtl?(t=_(r)-d*a/p,i=b(o)+c*a/p):(t=_(r)-c*a/p,i=b(o)+d*a/p))}}return{min:null!=t?new Date(t):null,max:null!=i?new Date(i):null}},y.prototype.getDataRange=function(){var e=null,t=null,i=this.itemsData&&this.itemsData.getDataSet();return i&&i.forEach(function(i){var r=n.convert(i.start,"Date").valueOf(),o=n.convert(null!=i.end?i.end:i.start,"Date").valueOf();(null===e||r<e)&&(e=r),(null===t||o>t)&&(t=o)}),{min:null!=e?new Date(e):null,max:null!=t?new Date(t):null}},y.prototype.getEventProperties=function(e){var t,i=e.center?e.center.x:e.clientX,r=e.center?e.center.y:e.clientY;t=this.options.rtl?n.getAbsoluteRight(this.dom.centerContainer)-i:i-n.getAbsoluteLeft(this.dom.centerContainer);var o=r-n.getAbsoluteTop(this.dom.centerContainer),a=this.itemSet.itemFromTarget(e),s=this.itemSet.groupFromTarget(e),l=c.customTimeFromTarget(e),u=this.itemSet.options.snap||null,h=this.body.util.getScale(),d=this.body.util.getStep(),p=this._toTime(t),f=u?u(p,h,d):p,m=n.getTarget(e),v=null;return null!=a?v="item":null!=l?v="custom-time":n.hasParent(m,this.timeAxis.dom.foreground)?v="axis":this.timeAxis2&&n.hasParent(m,this.timeAxis2.dom.foreground)?v="axis":n.hasParent(m,this.itemSet.dom.labelSet)?v="group-label":n.hasParent(m,this.currentTime.bar)?v="current-time":n.hasParent(m,this.dom.center)&&(v="background"),{event:e,item:a?a.id:null,group:s?s.groupId:null,what:v,pageX:e.srcEvent?e.srcEvent.pageX:e.pageX,pageY:e.srcEvent?e.srcEvent.pageY:e.pageY,x:t,y:o,time:p,snappedTime:f}},y.prototype.toggleRollingMode=function(){this.range.rolling?this.range.stopRolling():(null==this.options.rollingMode&&this.setOptions(this.options),this.range.startRolling())},e.exports=y},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(19)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=i(10),l=i(37),u=i(2),h=function(){function e(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1;(0,n.default)(this,e),this.pixelRatio=t,this.generated=!1,this.centerCoordinates={x:144.5,y:144.5},this.r=289*.49,this.color={r:255,g:255,b:255,a:1},this.hueCircle=void 0,this.initialColor={r:255,g:255,b:255,a:1},this.previousColor=void 0,this.applied=!1,this.updateCallback=function(){},this.closeCallback=function(){},this._create()}return(0,o.default)(e,[{key:"insertTo",value:function(e){void 0!==this.hammer&&(this.hammer.destroy(),this.hammer=void 0),this.container=e,this.container.appendChild(this.frame),this._bindHammer(),this._setSize()}},{key:"setUpdateCallback",value:function(e){if("function"!=typeof e)throw new Error("Function attempted to set as colorPicker update callback is not a function.");this.updateCallback=e}},{key:"setCloseCallback",value:function(e){if("function"!=typeof e)throw new Error("Function attempted to set as colorPicker closing callback is not a function.");this.closeCallback=e}},{key:"_isColorString",value:function(e){if("string"==typeof e)return{black:"#000000",navy:"#000080",darkblue:"#00008B",mediumblue:"#0000CD",blue:"#0000FF",darkgreen:"#006400",green:"#008000",teal:"#008080",darkcyan:"#008B8B",deepskyblue:"#00BFFF",darkturquoise:"#00CED1",mediumspringgreen:"#00FA9A",lime:"#00FF00",springgreen:"#00FF7F",aqua:"#00FFFF",cyan:"#00FFFF",midnightblue:"#191970",dodgerblue:"#1E90FF",lightseagreen:"#20B2AA",forestgreen:"#228B22",seagreen:"#2E8B57",darkslategray:"#2F4F4F",limegreen:"#32CD32",mediumseagreen:"#3CB371",turquoise:"#40E0D0",royalblue:"#4169E1",steelblue:"#4682B4",darkslateblue:"#483D8B",mediumturquoise:"#48D1CC",indigo:"#4B0082",darkolivegreen:"#556B2F",cadetblue:"#5F9EA0",cornflowerblue:"#6495ED",mediumaquamarine:"#66CDAA",dimgray:"#696969",slateblue:"#6A5ACD",olivedrab:"#6B8E23",slategray:"#708090",lightslategray:"#778899",mediumslateblue:"#7B68EE",lawngreen:"#7CFC00",chartreuse:"#7FFF00",aquamarine:"#7FFFD4",maroon:"#800000",purple:"#800080",olive:"#808000",gray:"#808080",skyblue:"#87CEEB",lightskyblue:"#87CEFA",blueviolet:"#8A2BE2",darkred:"#8B0000",darkmagenta:"#8B008B",saddlebrown:"#8B4513",darkseagreen:"#8FBC8F",lightgreen:"#90EE90",mediumpurple:"#9370D8",darkviolet:"#9400D3",palegreen:"#98FB98",darkorchid:"#9932CC",yellowgreen:"#9ACD32",sienna:"#A0522D",brown:"#A52A2A",darkgray:"#A9A9A9",lightblue:"#ADD8E6",greenyellow:"#ADFF2F",paleturquoise:"#AFEEEE",lightsteelblue:"#B0C4DE",powderblue:"#B0E0E6",firebrick:"#B22222",darkgoldenrod:"#B8860B",mediumorchid:"#BA55D3",rosybrown:"#BC8F8F",darkkhaki:"#BDB76B",silver:"#C0C0C0",mediumvioletred:"#C71585",indianred:"#CD5C5C",peru:"#CD853F",chocolate:"#D2691E",tan:"#D2B48C",lightgrey:"#D3D3D3",palevioletred:"#D87093",thistle:"#D8BFD8",orchid:"#DA70D6",goldenrod:"#DAA520",crimson:"#DC143C",gainsboro:"#DCDCDC",plum:"#DDA0DD",burlywood:"#DEB887",lightcyan:"#E0FFFF",lavender:"#E6E6FA",darksalmon:"#E9967A",violet:"#EE82EE",palegoldenrod:"#EEE8AA",lightcoral:"#F08080",khaki:"#F0E68C",aliceblue:"#F0F8FF",honeydew:"#F0FFF0",azure:"#F0FFFF",sandybrown:"#F4A460",wheat:"#F5DEB3",beige:"#F5F5DC",whitesmoke:"#F5F5F5",mintcream:"#F5FFFA",ghostwhite:"#F8F8FF",salmon:"#FA8072",antiquewhite:"#FAEBD7",linen:"#FAF0E6",lightgoldenrodyellow:"#FAFAD2",oldlace:"#FDF5E6",red:"#FF0000",fuchsia:"#FF00FF",magenta:"#FF00FF",deeppink:"#FF1493",orangered:"#FF4500",tomato:"#FF6347",hotpink:"#FF69B4",coral:"#FF7F50",darkorange:"#FF8C00",lightsalmon:"#FFA07A",orange:"#FFA500",lightpink:"#FFB6C1",pink:"#FFC0CB",gold:"#FFD700",peachpuff:"#FFDAB9",navajowhite:"#FFDEAD",moccasin:"#FFE4B5",bisque:"#FFE4C4",mistyrose:"#FFE4E1",blanchedalmond:"#FFEBCD",papayawhip:"#FFEFD5",lavenderblush:"#FFF0F5",seashell:"#FFF5EE",cornsilk:"#FFF8DC",lemonchiffon:"#FFFACD",floralwhite:"#FFFAF0",snow:"#FFFAFA",yellow:"#FFFF00",lightyellow:"#FFFFE0",ivory:"#FFFFF0",white:"#FFFFFF"}[e]}},{key:"setColor",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if("none"!==e){var i=void 0,n=this._isColorString(e);if(void 0!==n&&(e=n),!0===u.isString(e)){if(!0===u.isValidRGB(e)){var o=e.substr(4).substr(0,e.length-5).split(",");i={r:o[0],g:o[1],b:o[2],a:1}}else if(!0===u.isValidRGBA(e)){var a=e.substr(5).substr(0,e.length-6).split(",");i={r:a[0],g:a[1],b:a[2],a:a[3]}}else if(!0===u.isValidHex(e)){var s=u.hexToRGB(e);i={r:s.r,g:s.g,b:s.b,a:1}}}else if(e instanceof Object&&void 0!==e.r&&void 0!==e.g&&void 0!==e.b){var l=void 0!==e.a?e.a:"1.0";i={r:e.r,g:e.g,b:e.b,a:l}}if(void 0===i)throw new Error("Unknown color passed to the colorPicker. Supported are strings: rgb, hex, rgba. Object: rgb ({r:r,g:g,b:b,[a:a]}). Supplied: "+(0,r.default)(e));this._setColor(i,t)}}},{key:"show",value:function(){void 0!==this.closeCallback&&(this.closeCallback(),this.closeCallback=void 0),this.applied=!1,this.frame.style.display="block",this._generateHueCircle()}},{key:"_hide",value:function(){var e=this;!0===(!(arguments.length>0&&void 0!==arguments[0])||arguments[0])&&(this.previousColor=u.extend({},this.color)),!0===this.applied&&this.updateCallback(this.initialColor),this.frame.style.display="none",setTimeout(function(){void 0!==e.closeCallback&&(e.closeCallback(),e.closeCallback=void 0)},0)}},{key:"_save",value:function(){this.updateCallback(this.color),this.applied=!1,this._hide()}},{key:"_apply",value:function(){this.applied=!0,this.updateCallback(this.color),this._updatePicker(this.color)}},{key:"_loadLast",value:function(){void 0!==this.previousColor?this.setColor(this.previousColor,!1):alert("There is no last color to load...")}},{key:"_setColor",value:function(e){!0===(!(arguments.length>1&&void 0!==arguments[1])||arguments[1])&&(this.initialColor=u.extend({},e)),this.color=e;var t=u.RGBToHSV(e.r,e.g,e.b),i=2*Math.PI,r=this.r*t.s,n=this.centerCoordinates.x+r*Math.sin(i*t.h),o=this.centerCoordinates.y+r*Math.cos(i*t.h);this.colorPickerSelector.style.left=n-.5*this.colorPickerSelector.clientWidth+"px",this.colorPickerSelector.style.top=o-.5*this.colorPickerSelector.clientHeight+"px",this._updatePicker(e)}},{key:"_setOpacity",value:function(e){this.color.a=e/100,this._updatePicker(this.color)}},{key:"_setBrightness",value:function(e){var t=u.RGBToHSV(this.color.r,this.color.g,this.color.b);t.v=e/100;var i=u.HSVToRGB(t.h,t.s,t.v);i.a=this.color.a,this.color=i,this._updatePicker()}},{key:"_updatePicker",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.color,t=u.RGBToHSV(e.r,e.g,e.b),i=this.colorPickerCanvas.getContext("2d");void 0===this.pixelRation&&(this.pixelRatio=(window.devicePixelRatio||1)/(i.webkitBackingStorePixelRatio||i.mozBackingStorePixelRatio||i.msBackingStorePixelRatio||i.oBackingStorePixelRatio||i.backingStorePixelRatio||1)),i.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0);var r=this.colorPickerCanvas.clientWidth,n=this.colorPickerCanvas.clientHeight;i.clearRect(0,0,r,n),i.putImageData(this.hueCircle,0,0),i.fillStyle="rgba(0,0,0,"+(1-t.v)+")",i.circle(this.centerCoordinates.x,this.centerCoordinates.y,this.r),i.fill(),this.brightnessRange.value=100*t.v,this.opacityRange.value=100*e.a,this.initialColorDiv.style.backgroundColor="rgba("+this.initialColor.r+","+this.initialColor.g+","+this.initialColor.b+","+this.initialColor.a+")",this.newColorDiv.style.backgroundColor="rgba("+this.color.r+","+this.color.g+","+this.color.b+","+this.color.a+")"}},{key:"_setSize",value:function(){this.colorPickerCanvas.style.width="100%",this.colorPickerCanvas.style.height="100%",this.colorPickerCanvas.width=289*this.pixelRatio,this.colorPickerCanvas.height=289*this.pixelRatio}},{key:"_create",value:function(){if(this.frame=document.createElement("div"),this.frame.className="vis-color-picker",this.colorPickerDiv=document.createElement("div"),this.colorPickerSelector=document.createElement("div"),this.colorPickerSelector.className="vis-selector",this.colorPickerDiv.appendChild(this.colorPickerSelector),this.colorPickerCanvas=document.createElement("canvas"),this.colorPickerDiv.appendChild(this.colorPickerCanvas),this.colorPickerCanvas.getContext){var e=this.colorPickerCanvas.getContext("2d");this.pixelRatio=(window.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1),this.colorPickerCanvas.getContext("2d").setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0)}else{var t=document.createElement("DIV");t.style.color="red",t.style.fontWeight="bold",t.style.padding="10px",t.innerHTML="Error: your browser does not support HTML canvas",this.colorPickerCanvas.appendChild(t)}this.colorPickerDiv.className="vis-color",this.opacityDiv=document.createElement("div"),this.opacityDiv.className="vis-opacity",this.brightnessDiv=document.createElement("div"),this.brightnessDiv.className="vis-brightness",this.arrowDiv=document.createElement("div"),this.arrowDiv.className="vis-arrow",this.opacityRange=document.createElement("input");try{this.opacityRange.type="range",this.opacityRange.min="0",this.opacityRange.max="100"}catch(e){}this.opacityRange.value="100",this.opacityRange.className="vis-range",this.brightnessRange=document.createElement("input");try{this.brightnessRange.type="range",this.brightnessRange.min="0",this.brightnessRange.max="100"}catch(e){}this.brightnessRange.value="100",this.brightnessRange.className="vis-range",this.opacityDiv.appendChild(this.opacityRange),this.brightnessDiv.appendChild(this.brightnessRange);var i=this;this.opacityRange.onchange=function(){i._setOpacity(this.value)},this.opacityRange.oninput=function(){i._setOpacity(this.value)},this.brightnessRange.onchange=function(){i._setBrightness(this.value)},this.brightnessRange.oninput=function(){i._setBrightness(this.value)},this.brightnessLabel=document.createElement("div"),this.brightnessLabel.className="vis-label vis-brightness",this.brightnessLabel.innerHTML="brightness:",this.opacityLabel=document.createElement("div"),this.opacityLabel.className="vis-label vis-opacity",this.opacityLabel.innerHTML="opacity:",this.newColorDiv=document.createElement("div"),this.newColorDiv.className="vis-new-color",this.newColorDiv.innerHTML="new",this.initialColorDiv=document.createElement("div"),this.initialColorDiv.className="vis-initial-color",this.initialColorDiv.innerHTML="initial",this.cancelButton=document.createElement("div"),this.cancelButton.className="vis-button vis-cancel",this.cancelButton.innerHTML="cancel",this.cancelButton.onclick=this._hide.bind(this,!1),this.applyButton=document.createElement("div"),this.applyButton.className="vis-button vis-apply",this.applyButton.innerHTML="apply",this.applyButton.onclick=this._apply.bind(this),this.saveButton=document.createElement("div"),this.saveButton.className="vis-button vis-save",this.saveButton.innerHTML="save",this.saveButton.onclick=this._save.bind(this),this.loadButton=document.createElement("div"),this.loadButton.className="vis-button vis-load",this.loadButton.innerHTML="load last",this.loadButton.onclick=this._loadLast.bind(this),this.frame.appendChild(this.colorPickerDiv),this.frame.appendChild(this.arrowDiv),this.frame.appendChild(this.brightnessLabel),this.frame.appendChild(this.brightnessDiv),this.frame.appendChild(this.opacityLabel),this.frame.appendChild(this.opacityDiv),this.frame.appendChild(this.newColorDiv),this.frame.appendChild(this.initialColorDiv),this.frame.appendChild(this.cancelButton),this.frame.appendChild(this.applyButton),this.frame.appendChild(this.saveButton),this.frame.appendChild(this.loadButton)}},{key:"_bindHammer",value:function(){var e=this;this.drag={},this.pinch={},this.hammer=new s(this.colorPickerCanvas),this.hammer.get("pinch").set({enable:!0}),l.onTouch(this.hammer,function(t){e._moveSelector(t)}),this.hammer.on("tap",function(t){e._moveSelector(t)}),this.hammer.on("panstart",function(t){e._moveSelector(t)}),this.hammer.on("panmove",function(t){e._moveSelector(t)}),this.hammer.on("panend",function(t){e._moveSelector(t)})}},{key:"_generateHueCircle",value:function(){if(!1===this.generated){var e=this.colorPickerCanvas.getContext("2d");void 0===this.pixelRation&&(this.pixelRatio=(window.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1)),e.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0);var t=this.colorPickerCanvas.clientWidth,i=this.colorPickerCanvas.clientHeight;e.clearRect(0,0,t,i);var r=void 0,n=void 0,o=void 0,a=void 0;this.centerCoordinates={x:.5*t,y:.5*i},this.r=.49*t;var s=2*Math.PI/360,l=1/this.r,h=void 0;for(o=0;o<360;o++)for(a=0;a<this.r;a++)r=this.centerCoordinates.x+a*Math.sin(s*o),n=this.centerCoordinates.y+a*Math.cos(s*o),h=u.HSVToRGB(o*(1/360),a*l,1),e.fillStyle="rgb("+h.r+","+h.g+","+h.b+")",e.fillRect(r-.5,n-.5,2,2);e.strokeStyle="rgba(0,0,0,1)",e.circle(this.centerCoordinates.x,this.centerCoordinates.y,this.r),e.stroke(),this.hueCircle=e.getImageData(0,0,t,i)}this.generated=!0}},{key:"_moveSelector",value:function(e){var t=this.colorPickerDiv.getBoundingClientRect(),i=e.center.x-t.left,r=e.center.y-t.top,n=.5*this.colorPickerDiv.clientHeight,o=.5*this.colorPickerDiv.clientWidth,a=i-o,s=r-n,l=Math.atan2(a,s),h=.98*Math.min(Math.sqrt(a*a+s*s),o),c=Math.cos(l)*h+n,d=Math.sin(l)*h+o;this.colorPickerSelector.style.top=c-.5*this.colorPickerSelector.clientHeight+"px",this.colorPickerSelector.style.left=d-.5*this.colorPickerSelector.clientWidth+"px";var p=l/(2*Math.PI);p=p<0?p+1:p;var f=h/this.r,m=u.RGBToHSV(this.color.r,this.color.g,this.color.b);m.h=p,m.s=f;var v=u.HSVToRGB(m.h,m.s,m.v);v.a=this.color.a,this.color=v,this.initialColorDiv.style.backgroundColor="rgba("+this.initialColor.r+","+this.initialColor.g+","+this.initialColor.b+","+this.initialColor.a+")",this.newColorDiv.style.backgroundColor="rgba("+this.color.r+","+this.color.g+","+this.color.b+","+this.color.a+")"}}]),e}();t.default=h},function(e,t,i){var r=i(9),n=i(2),o=i(11),a=i(12),s=i(64),l=i(65),u=i(45),h=i(67),c=i(46),d=i(106),p=i(15).printStyle,f=i(113).allOptions,m=i(113).configureOptions,v=i(71).default,g=i(15).default;function y(e,t,i,l){if(!(Array.isArray(i)||i instanceof o||i instanceof a)&&i instanceof Object){var c=l;l=i,i=c}l&&l.throttleRedraw&&console.warn('Graph2d option "throttleRedraw" is DEPRICATED and no longer supported. It will be removed in the next MAJOR release.');var p=this;this.defaultOptions={start:null,end:null,autoResize:!0,orientation:{axis:"bottom",item:"bottom"},moment:r,width:null,height:null,maxHeight:null,minHeight:null},this.options=n.deepExtend({},this.defaultOptions),this._create(e),this.components=[],this.body={dom:this.dom,domProps:this.props,emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this)},hiddenDates:[],util:{toScreen:p._toScreen.bind(p),toGlobalScreen:p._toGlobalScreen.bind(p),toTime:p._toTime.bind(p),toGlobalTime:p._toGlobalTime.bind(p)}},this.range=new s(this.body),this.components.push(this.range),this.body.range=this.range,this.timeAxis=new u(this.body),this.components.push(this.timeAxis),this.currentTime=new h(this.body),this.components.push(this.currentTime),this.linegraph=new d(this.body),this.components.push(this.linegraph),this.itemsData=null,this.groupsData=null,this.on("tap",function(e){p.emit("click",p.getEventProperties(e))}),this.on("doubletap",function(e){p.emit("doubleClick",p.getEventProperties(e))}),this.dom.root.oncontextmenu=function(e){p.emit("contextmenu",p.getEventProperties(e))},l&&this.setOptions(l),i&&this.setGroups(i),t&&this.setItems(t),this._redraw()}y.prototype=new l,y.prototype.setOptions=function(e){!0===g.validate(e,f)&&console.log("%cErrors have been found in the supplied options object.",p),l.prototype.setOptions.call(this,e)},y.prototype.setItems=function(e){var t,i=null==this.itemsData;if(t=e?e instanceof o||e instanceof a?e:new o(e,{type:{start:"Date",end:"Date"}}):null,this.itemsData=t,this.linegraph&&this.linegraph.setItems(t),i)if(null!=this.options.start||null!=this.options.end){var r=null!=this.options.start?this.options.start:null,n=null!=this.options.end?this.options.end:null;this.setWindow(r,n,{animation:!1})}else this.fit({animation:!1})},y.prototype.setGroups=function(e){var t;t=e?e instanceof o||e instanceof a?e:new o(e):null,this.groupsData=t,this.linegraph.setGroups(t)},y.prototype.getLegend=function(e,t,i){return void 0===t&&(t=15),void 0===i&&(i=15),void 0!==this.linegraph.groups[e]?this.linegraph.groups[e].getLegend(t,i):"cannot find group:'"+e+"'"},y.prototype.isGroupVisible=function(e){return void 0!==this.linegraph.groups[e]&&(this.linegraph.groups[e].visible&&(void 0===this.linegraph.options.groups.visibility[e]||1==this.linegraph.options.groups.visibility[e]))},y.prototype.getDataRange=function(){var e=null,t=null;for(var i in this.linegraph.groups)if(this.linegraph.groups.hasOwnProperty(i)&&1==this.linegraph.groups[i].visible)for(var r=0;r<this.linegraph.groups[i].itemsData.length;r++){var o=this.linegraph.groups[i].itemsData[r],a=n.convert(o.x,"Date").valueOf();e=null==e?a:e>a?a:e,t=null==t?a:t<a?a:t}return{min:null!=e?new Date(e):null,max:null!=t?new Date(t):null}},y.prototype.getEventProperties=function(e){var t=e.center?e.center.x:e.clientX,i=e.center?e.center.y:e.clientY,r=t-n.getAbsoluteLeft(this.dom.centerContainer),o=i-n.getAbsoluteTop(this.dom.centerContainer),a=this._toTime(r),s=c.customTimeFromTarget(e),l=n.getTarget(e),u=null;n.hasParent(l,this.timeAxis.dom.foreground)?u="axis":this.timeAxis2&&n.hasParent(l,this.timeAxis2.dom.foreground)?u="axis":n.hasParent(l,this.linegraph.yAxisLeft.dom.frame)?u="data-axis":n.hasParent(l,this.linegraph.yAxisRight.dom.frame)?u="data-axis":n.hasParent(l,this.linegraph.legendLeft.dom.frame)?u="legend":n.hasParent(l,this.linegraph.legendRight.dom.frame)?u="legend":null!=s?u="custom-time":n.hasParent(l,this.currentTime.bar)?u="current-time":n.hasParent(l,this.dom.center)&&(u="background");var h=[],d=this.linegraph.yAxisLeft,p=this.linegraph.yAxisRight;return!d.hidden&&this.itemsData.length>0&&h.push(d.screenToValue(o)),!p.hidden&&this.itemsData.length>0&&h.push(p.screenToValue(o)),{event:e,what:u,pageX:e.srcEvent?e.srcEvent.pageX:e.pageX,pageY:e.srcEvent?e.srcEvent.pageY:e.pageY,x:r,y:o,time:a,value:h}},y.prototype._createConfigurator=function(){return new v(this,this.dom.container,m)},e.exports=y},function(e,t,i){t.util=i(2),t.DOMutil=i(14),t.DataSet=i(11),t.DataView=i(12),t.Queue=i(43),t.Network=i(182),t.network={Images:i(116),dotparser:i(114),gephiParser:i(115),allOptions:i(122)},t.network.convertDot=function(e){return t.network.dotparser.DOTToGraph(e)},t.network.convertGephi=function(e,i){return t.network.gephiParser.parseGephi(e,i)},t.moment=i(9),t.Hammer=i(10),t.keycharm=i(35)},function(e,t,i){i(183);var r=i(44),n=i(2),o=i(114),a=i(115),s=i(97),l=i(184),u=i(116).default,h=i(186).default,c=i(187).default,d=i(214).default,p=i(220).default,f=i(227).default,m=i(229).default,v=i(230).default,g=i(231).default,y=i(232).default,_=i(234).default,b=i(235).default,x=i(237).default,w=i(71).default,S=i(15).default,M=i(15).printStyle,T=i(122),A=T.allOptions,C=T.configureOptions,L=i(238).default;function N(e,t,i){var r=this;if(!(this instanceof N))throw new SyntaxError("Constructor must be called with the new operator");this.options={},this.defaultOptions={locale:"en",locales:l,clickToUse:!1},n.extend(this.options,this.defaultOptions),this.body={container:e,nodes:{},nodeIndices:[],edges:{},edgeIndices:[],emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this),once:this.once.bind(this)},eventListeners:{onTap:function(){},onTouch:function(){},onDoubleTap:function(){},onHold:function(){},onDragStart:function(){},onDrag:function(){},onDragEnd:function(){},onMouseWheel:function(){},onPinch:function(){},onMouseMove:function(){},onRelease:function(){},onContext:function(){}},data:{nodes:null,edges:null},functions:{createNode:function(){},createEdge:function(){},getPointer:function(){}},modules:{},view:{scale:1,translation:{x:0,y:0}}},this.bindEventListeners(),this.images=new u(function(){return r.body.emitter.emit("_requestRedraw")}),this.groups=new h,this.canvas=new v(this.body),this.selectionHandler=new _(this.body,this.canvas),this.interactionHandler=new y(this.body,this.canvas,this.selectionHandler),this.view=new g(this.body,this.canvas),this.renderer=new m(this.body,this.canvas),this.physics=new p(this.body),this.layoutEngine=new b(this.body),this.clustering=new f(this.body),this.manipulation=new x(this.body,this.canvas,this.selectionHandler),this.nodesHandler=new c(this.body,this.images,this.groups,this.layoutEngine),this.edgesHandler=new d(this.body,this.images,this.groups),this.body.modules.kamadaKawai=new L(this.body,150,.05),this.body.modules.clustering=this.clustering,this.canvas._create(),this.setOptions(i),this.setData(t)}r(N.prototype),N.prototype.setOptions=function(e){var t=this;if(void 0!==e){!0===S.validate(e,A)&&console.log("%cErrors have been found in the supplied options object.",M);if(n.selectiveDeepExtend(["locale","locales","clickToUse"],this.options,e),e=this.layoutEngine.setOptions(e.layout,e),this.canvas.setOptions(e),this.groups.setOptions(e.groups),this.nodesHandler.setOptions(e.nodes),this.edgesHandler.setOptions(e.edges),this.physics.setOptions(e.physics),this.manipulation.setOptions(e.manipulation,e,this.options),this.interactionHandler.setOptions(e.interaction),this.renderer.setOptions(e.interaction),this.selectionHandler.setOptions(e.interaction),void 0!==e.groups&&this.body.emitter.emit("refreshNodes"),"configure"in e&&(this.configurator||(this.configurator=new w(this,this.body.container,C,this.canvas.pixelRatio)),this.configurator.setOptions(e.configure)),this.configurator&&!0===this.configurator.options.enabled){var i={nodes:{},edges:{},layout:{},interaction:{},manipulation:{},physics:{},global:{}};n.deepExtend(i.nodes,this.nodesHandler.options),n.deepExtend(i.edges,this.edgesHandler.options),n.deepExtend(i.layout,this.layoutEngine.options),n.deepExtend(i.interaction,this.selectionHandler.options),n.deepExtend(i.interaction,this.renderer.options),n.deepExtend(i.interaction,this.interactionHandler.options),n.deepExtend(i.manipulation,this.manipulation.options),n.deepExtend(i.physics,this.physics.options),n.deepExtend(i.global,this.canvas.options),n.deepExtend(i.global,this.options),this.configurator.setModuleOptions(i)}void 0!==e.clickToUse?!0===e.clickToUse?void 0===this.activator&&(this.activator=new s(this.canvas.frame),this.activator.on("change",function(){t.body.emitter.emit("activate")})):(void 0!==this.activator&&(this.activator.destroy(),delete this.activator),this.body.emitter.emit("activate")):this.body.emitter.emit("activate"),this.canvas.setSize(),this.body.emitter.emit("startSimulation")}},N.prototype._updateVisibleIndices=function(){var e=this.body.nodes,t=this.body.edges;for(var i in this.body.nodeIndices=[],this.body.edgeIndices=[],e)e.hasOwnProperty(i)&&(this.clustering._isClusteredNode(i)||!1!==e[i].options.hidden||this.body.nodeIndices.push(e[i].id));for(var r in t)if(t.hasOwnProperty(r)){var n=t[r],o=e[n.fromId],a=e[n.toId],s=void 0!==o&&void 0!==a;!this.clustering._isClusteredEdge(r)&&!1===n.options.hidden&&s&&!1===o.options.hidden&&!1===a.options.hidden&&this.body.edgeIndices.push(n.id)}},N.prototype.bindEventListeners=function(){var e=this;this.body.emitter.on("_dataChanged",function(){e.edgesHandler._updateState(),e.body.emitter.emit("_dataUpdated")}),this.body.emitter.on("_dataUpdated",function(){e.clustering._updateState(),e._updateVisibleIndices(),e._updateValueRange(e.body.nodes),e._updateValueRange(e.body.edges),e.body.emitter.emit("startSimulation"),e.body.emitter.emit("_requestRedraw")})},N.prototype.setData=function(e){if(this.body.emitter.emit("resetPhysics"),this.body.emitter.emit("_resetData"),this.selectionHandler.unselectAll(),e&&e.dot&&(e.nodes||e.edges))throw new SyntaxError('Data must contain either parameter "dot" or  parameter pair "nodes" and "edges", but not both.');if(this.setOptions(e&&e.options),e&&e.dot){console.log("The dot property has been deprecated. Please use the static convertDot method to convert DOT into vis.network format and use the normal data format with nodes and edges. This converter is used like this: var data = vis.network.convertDot(dotString);");var t=o.DOTToGraph(e.dot);this.setData(t)}else if(e&&e.gephi){console.log("The gephi property has been deprecated. Please use the static convertGephi method to convert gephi into vis.network format and use the normal data format with nodes and edges. This converter is used like this: var data = vis.network.convertGephi(gephiJson);");var i=a.parseGephi(e.gephi);this.setData(i)}else this.nodesHandler.setData(e&&e.nodes,!0),this.edgesHandler.setData(e&&e.edges,!0),this.body.emitter.emit("_dataChanged"),this.body.emitter.emit("_dataLoaded"),this.body.emitter.emit("initPhysics")},N.prototype.destroy=function(){for(var e in this.body.emitter.emit("destroy"),this.body.emitter.off(),this.off(),delete this.groups,delete this.canvas,delete this.selectionHandler,delete this.interactionHandler,delete this.view,delete this.renderer,delete this.physics,delete this.layoutEngine,delete this.clustering,delete this.manipulation,delete this.nodesHandler,delete this.edgesHandler,delete this.configurator,delete this.images,this.body.nodes)this.body.nodes.hasOwnProperty(e)&&delete this.body.nodes[e];for(var t in this.body.edges)this.body.edges.hasOwnProperty(t)&&delete this.body.edges[t];n.recursiveDOMDelete(this.body.container)},N.prototype._updateValueRange=function(e){var t,i=void 0,r=void 0,n=0;for(t in e)if(e.hasOwnProperty(t)){var o=e[t].getValue();void 0!==o&&(i=void 0===i?o:Math.min(o,i),r=void 0===r?o:Math.max(o,r),n+=o)}if(void 0!==i&&void 0!==r)for(t in e)e.hasOwnProperty(t)&&e[t].setValueRange(i,r,n)},N.prototype.isActive=function(){return!this.activator||this.activator.active},N.prototype.setSize=function(){return this.canvas.setSize.apply(this.canvas,arguments)},N.prototype.canvasToDOM=function(){return this.canvas.canvasToDOM.apply(this.canvas,arguments)},N.prototype.DOMtoCanvas=function(){return this.canvas.DOMtoCanvas.apply(this.canvas,arguments)},N.prototype.findNode=function(){return this.clustering.findNode.apply(this.clustering,arguments)},N.prototype.isCluster=function(){return this.clustering.isCluster.apply(this.clustering,arguments)},N.prototype.openCluster=function(){return this.clustering.openCluster.apply(this.clustering,arguments)},N.prototype.cluster=function(){return this.clustering.cluster.apply(this.clustering,arguments)},N.prototype.getNodesInCluster=function(){return this.clustering.getNodesInCluster.apply(this.clustering,arguments)},N.prototype.clusterByConnection=function(){return this.clustering.clusterByConnection.apply(this.clustering,arguments)},N.prototype.clusterByHubsize=function(){return this.clustering.clusterByHubsize.apply(this.clustering,arguments)},N.prototype.clusterOutliers=function(){return this.clustering.clusterOutliers.apply(this.clustering,arguments)},N.prototype.getSeed=function(){return this.layoutEngine.getSeed.apply(this.layoutEngine,arguments)},N.prototype.enableEditMode=function(){return this.manipulation.enableEditMode.apply(this.manipulation,arguments)},N.prototype.disableEditMode=function(){return this.manipulation.disableEditMode.apply(this.manipulation,arguments)},N.prototype.addNodeMode=function(){return this.manipulation.addNodeMode.apply(this.manipulation,arguments)},N.prototype.editNode=function(){return this.manipulation.editNode.apply(this.manipulation,arguments)},N.prototype.editNodeMode=function(){return console.log("Deprecated: Please use editNode instead of editNodeMode."),this.manipulation.editNode.apply(this.manipulation,arguments)},N.prototype.addEdgeMode=function(){return this.manipulation.addEdgeMode.apply(this.manipulation,arguments)},N.prototype.editEdgeMode=function(){return this.manipulation.editEdgeMode.apply(this.manipulation,arguments)},N.prototype.deleteSelected=function(){return this.manipulation.deleteSelected.apply(this.manipulation,arguments)},N.prototype.getPositions=function(){return this.nodesHandler.getPositions.apply(this.nodesHandler,arguments)},N.prototype.storePositions=function(){return this.nodesHandler.storePositions.apply(this.nodesHandler,arguments)},N.prototype.moveNode=function(){return this.nodesHandler.moveNode.apply(this.nodesHandler,arguments)},N.prototype.getBoundingBox=function(){return this.nodesHandler.getBoundingBox.apply(this.nodesHandler,arguments)},N.prototype.getConnectedNodes=function(e){return void 0!==this.body.nodes[e]?this.nodesHandler.getConnectedNodes.apply(this.nodesHandler,arguments):this.edgesHandler.getConnectedNodes.apply(this.edgesHandler,arguments)},N.prototype.getConnectedEdges=function(){return this.nodesHandler.getConnectedEdges.apply(this.nodesHandler,arguments)},N.prototype.startSimulation=function(){return this.physics.startSimulation.apply(this.physics,arguments)},N.prototype.stopSimulation=function(){return this.physics.stopSimulation.apply(this.physics,arguments)},N.prototype.stabilize=function(){return this.physics.stabilize.apply(this.physics,arguments)},N.prototype.getSelection=function(){return this.selectionHandler.getSelection.apply(this.selectionHandler,arguments)},N.prototype.setSelection=function(){return this.selectionHandler.setSelection.apply(this.selectionHandler,arguments)},N.prototype.getSelectedNodes=function(){return this.selectionHandler.getSelectedNodes.apply(this.selectionHandler,arguments)},N.prototype.getSelectedEdges=function(){return this.selectionHandler.getSelectedEdges.apply(this.selectionHandler,arguments)},N.prototype.getNodeAt=function(){var e=this.selectionHandler.getNodeAt.apply(this.selectionHandler,arguments);return void 0!==e&&void 0!==e.id?e.id:e},N.prototype.getEdgeAt=function(){var e=this.selectionHandler.getEdgeAt.apply(this.selectionHandler,arguments);return void 0!==e&&void 0!==e.id?e.id:e},N.prototype.selectNodes=function(){return this.selectionHandler.selectNodes.apply(this.selectionHandler,arguments)},N.prototype.selectEdges=function(){return this.selectionHandler.selectEdges.apply(this.selectionHandler,arguments)},N.prototype.unselectAll=function(){this.selectionHandler.unselectAll.apply(this.selectionHandler,arguments),this.redraw()},N.prototype.redraw=function(){return this.renderer.redraw.apply(this.renderer,arguments)},N.prototype.getScale=function(){return this.view.getScale.apply(this.view,arguments)},N.prototype.getViewPosition=function(){return this.view.getViewPosition.apply(this.view,arguments)},N.prototype.fit=function(){return this.view.fit.apply(this.view,arguments)},N.prototype.moveTo=function(){return this.view.moveTo.apply(this.view,arguments)},N.prototype.focus=function(){return this.view.focus.apply(this.view,arguments)},N.prototype.releaseNode=function(){return this.view.releaseNode.apply(this.view,arguments)},N.prototype.getOptionsFromConfigurator=function(){var e={};return this.configurator&&(e=this.configurator.getOptions.apply(this.configurator)),e},e.exports=N},function(e,t,i){"undefined"!=typeof CanvasRenderingContext2D&&(CanvasRenderingContext2D.prototype.circle=function(e,t,i){this.beginPath(),this.arc(e,t,i,0,2*Math.PI,!1),this.closePath()},CanvasRenderingContext2D.prototype.square=function(e,t,i){this.beginPath(),this.rect(e-i,t-i,2*i,2*i),this.closePath()},CanvasRenderingContext2D.prototype.triangle=function(e,t,i){this.beginPath(),t+=.275*(i*=1.15);var r=2*i,n=r/2,o=Math.sqrt(3)/6*r,a=Math.sqrt(r*r-n*n);this.moveTo(e,t-(a-o)),this.lineTo(e+n,t+o),this.lineTo(e-n,t+o),this.lineTo(e,t-(a-o)),this.closePath()},CanvasRenderingContext2D.prototype.triangleDown=function(e,t,i){this.beginPath(),t-=.275*(i*=1.15);var r=2*i,n=r/2,o=Math.sqrt(3)/6*r,a=Math.sqrt(r*r-n*n);this.moveTo(e,t+(a-o)),this.lineTo(e+n,t-o),this.lineTo(e-n,t-o),this.lineTo(e,t+(a-o)),this.closePath()},CanvasRenderingContext2D.prototype.star=function(e,t,i){this.beginPath(),t+=.1*(i*=.82);for(var r=0;r<10;r++){var n=r%2==0?1.3*i:.5*i;this.lineTo(e+n*Math.sin(2*r*Math.PI/10),t-n*Math.cos(2*r*Math.PI/10))}this.closePath()},CanvasRenderingContext2D.prototype.diamond=function(e,t,i){this.beginPath(),this.lineTo(e,t+i),this.lineTo(e+i,t),this.lineTo(e,t-i),this.lineTo(e-i,t),this.closePath()},CanvasRenderingContext2D.prototype.roundRect=function(e,t,i,r,n){var o=Math.PI/180;i-2*n<0&&(n=i/2),r-2*n<0&&(n=r/2),this.beginPath(),this.moveTo(e+n,t),this.lineTo(e+i-n,t),this.arc(e+i-n,t+n,n,270*o,360*o,!1),this.lineTo(e+i,t+r-n),this.arc(e+i-n,t+r-n,n,0,90*o,!1),this.lineTo(e+n,t+r),this.arc(e+n,t+r-n,n,90*o,180*o,!1),this.lineTo(e,t+n),this.arc(e+n,t+n,n,180*o,270*o,!1),this.closePath()},CanvasRenderingContext2D.prototype.ellipse_vis=function(e,t,i,r){var n=i/2*.5522848,o=r/2*.5522848,a=e+i,s=t+r,l=e+i/2,u=t+r/2;this.beginPath(),this.moveTo(e,u),this.bezierCurveTo(e,u-o,l-n,t,l,t),this.bezierCurveTo(l+n,t,a,u-o,a,u),this.bezierCurveTo(a,u+o,l+n,s,l,s),this.bezierCurveTo(l-n,s,e,u+o,e,u),this.closePath()},CanvasRenderingContext2D.prototype.database=function(e,t,i,r){var n=r*(1/3),o=i/2*.5522848,a=n/2*.5522848,s=e+i,l=t+n,u=e+i/2,h=t+n/2,c=t+(r-n/2),d=t+r;this.beginPath(),this.moveTo(s,h),this.bezierCurveTo(s,h+a,u+o,l,u,l),this.bezierCurveTo(u-o,l,e,h+a,e,h),this.bezierCurveTo(e,h-a,u-o,t,u,t),this.bezierCurveTo(u+o,t,s,h-a,s,h),this.lineTo(s,c),this.bezierCurveTo(s,c+a,u+o,d,u,d),this.bezierCurveTo(u-o,d,e,c+a,e,c),this.lineTo(e,h)},CanvasRenderingContext2D.prototype.dashedLine=function(e,t,i,r,n){this.beginPath(),this.moveTo(e,t);for(var o=n.length,a=i-e,s=r-t,l=s/a,u=Math.sqrt(a*a+s*s),h=0,c=!0,d=0,p=n[0];u>=.1;)(p=n[h++%o])>u&&(p=u),d=Math.sqrt(p*p/(1+l*l)),e+=d=a<0?-d:d,t+=l*d,!0===c?this.lineTo(e,t):this.moveTo(e,t),u-=p,c=!c},CanvasRenderingContext2D.prototype.hexagon=function(e,t,i){this.beginPath();var r=2*Math.PI/6;this.moveTo(e+i,t);for(var n=1;n<6;n++)this.lineTo(e+i*Math.cos(r*n),t+i*Math.sin(r*n));this.closePath()})},function(e,t,i){t.en={edit:"Edit",del:"Delete selected",back:"Back",addNode:"Add Node",addEdge:"Add Edge",editNode:"Edit Node",editEdge:"Edit Edge",addDescription:"Click in an empty space to place a new node.",edgeDescription:"Click on a node and drag the edge to another node to connect them.",editEdgeDescription:"Click on the control points and drag them to a node to connect to it.",createEdgeError:"Cannot link edges to a cluster.",deleteClusterError:"Clusters cannot be deleted.",editClusterError:"Clusters cannot be edited."},t.en_EN=t.en,t.en_US=t.en,t.de={edit:"Editieren",del:"Lösche Auswahl",back:"Zurück",addNode:"Knoten hinzufügen",addEdge:"Kante hinzufügen",editNode:"Knoten editieren",editEdge:"Kante editieren",addDescription:"Klicke auf eine freie Stelle, um einen neuen Knoten zu plazieren.",edgeDescription:"Klicke auf einen Knoten und ziehe die Kante zu einem anderen Knoten, um diese zu verbinden.",editEdgeDescription:"Klicke auf die Verbindungspunkte und ziehe diese auf einen Knoten, um sie zu verbinden.",createEdgeError:"Es ist nicht möglich, Kanten mit Clustern zu verbinden.",deleteClusterError:"Cluster können nicht gelöscht werden.",editClusterError:"Cluster können nicht editiert werden."},t.de_DE=t.de,t.es={edit:"Editar",del:"Eliminar selección",back:"Átras",addNode:"Añadir nodo",addEdge:"Añadir arista",editNode:"Editar nodo",editEdge:"Editar arista",addDescription:"Haga clic en un lugar vacío para colocar un nuevo nodo.",edgeDescription:"Haga clic en un nodo y arrastre la arista hacia otro nodo para conectarlos.",editEdgeDescription:"Haga clic en un punto de control y arrastrelo a un nodo para conectarlo.",createEdgeError:"No se puede conectar una arista a un grupo.",deleteClusterError:"No es posible eliminar grupos.",editClusterError:"No es posible editar grupos."},t.es_ES=t.es,t.it={edit:"Modifica",del:"Cancella la selezione",back:"Indietro",addNode:"Aggiungi un nodo",addEdge:"Aggiungi un vertice",editNode:"Modifica il nodo",editEdge:"Modifica il vertice",addDescription:"Clicca per aggiungere un nuovo nodo",edgeDescription:"Clicca su un nodo e trascinalo ad un altro nodo per connetterli.",editEdgeDescription:"Clicca sui Punti di controllo e trascinali ad un nodo per connetterli.",createEdgeError:"Non si possono collegare vertici ad un cluster",deleteClusterError:"I cluster non possono essere cancellati",editClusterError:"I clusters non possono essere modificati."},t.it_IT=t.it,t.nl={edit:"Wijzigen",del:"Selectie verwijderen",back:"Terug",addNode:"Node toevoegen",addEdge:"Link toevoegen",editNode:"Node wijzigen",editEdge:"Link wijzigen",addDescription:"Klik op een leeg gebied om een nieuwe node te maken.",edgeDescription:"Klik op een node en sleep de link naar een andere node om ze te verbinden.",editEdgeDescription:"Klik op de verbindingspunten en sleep ze naar een node om daarmee te verbinden.",createEdgeError:"Kan geen link maken naar een cluster.",deleteClusterError:"Clusters kunnen niet worden verwijderd.",editClusterError:"Clusters kunnen niet worden aangepast."},t.nl_NL=t.nl,t.nl_BE=t.nl,t["pt-br"]={edit:"Editar",del:"Remover selecionado",back:"Voltar",addNode:"Adicionar nó",addEdge:"Adicionar aresta",editNode:"Editar nó",editEdge:"Editar aresta",addDescription:"Clique em um espaço em branco para adicionar um novo nó",edgeDescription:"Clique em um nó e arraste a aresta até outro nó para conectá-los",editEdgeDescription:"Clique nos pontos de controle e os arraste para um nó para conectá-los",createEdgeError:"Não foi possível linkar arestas a um cluster.",deleteClusterError:"Clusters não puderam ser removidos.",editClusterError:"Clusters não puderam ser editados."},t["pt-BR"]=t["pt-br"],t.pt_BR=t["pt-br"],t.pt_br=t["pt-br"],t.ru={edit:"Редактировать",del:"Удалить выбранное",back:"Назад",addNode:"Добавить узел",addEdge:"Добавить ребро",editNode:"Редактировать узел",editEdge:"Редактировать ребро",addDescription:"Кликните в свободное место, чтобы добавить новый узел.",edgeDescription:"Кликните на узел и протяните ребро к другому узлу, чтобы соединить их.",editEdgeDescription:"Кликните на контрольные точки и перетащите их в узел, чтобы подключиться к нему.",createEdgeError:"Невозможно соединить ребра в кластер.",deleteClusterError:"Кластеры не могут быть удалены",editClusterError:"Кластеры недоступны для редактирования."},t.ru_RU=t.ru,t.cn={edit:"编辑",del:"删除选定",back:"返回",addNode:"添加节点",addEdge:"添加连接线",editNode:"编辑节点",editEdge:"编辑连接线",addDescription:"单击空白处放置新节点。",edgeDescription:"单击某个节点并将该连接线拖动到另一个节点以连接它们。",editEdgeDescription:"单击控制节点并将它们拖到节点上连接。",createEdgeError:"无法将连接线连接到群集。",deleteClusterError:"无法删除群集。",editClusterError:"无法编辑群集。"},t.zh_CN=t.cn},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(){(0,r.default)(this,e),this.NUM_ITERATIONS=4,this.image=new Image,this.canvas=document.createElement("canvas")}return(0,n.default)(e,[{key:"init",value:function(){if(!this.initialized()){this.src=this.image.src;var e=this.image.width,t=this.image.height;this.width=e,this.height=t;var i=Math.floor(t/2),r=Math.floor(t/4),n=Math.floor(t/8),o=Math.floor(t/16),a=Math.floor(e/2),s=Math.floor(e/4),l=Math.floor(e/8),u=Math.floor(e/16);this.canvas.width=3*s,this.canvas.height=i,this.coordinates=[[0,0,a,i],[a,0,s,r],[a,r,l,n],[5*l,r,u,o]],this._fillMipMap()}}},{key:"initialized",value:function(){return void 0!==this.coordinates}},{key:"_fillMipMap",value:function(){var e=this.canvas.getContext("2d"),t=this.coordinates[0];e.drawImage(this.image,t[0],t[1],t[2],t[3]);for(var i=1;i<this.NUM_ITERATIONS;i++){var r=this.coordinates[i-1],n=this.coordinates[i];e.drawImage(this.canvas,r[0],r[1],r[2],r[3],n[0],n[1],n[2],n[3])}}},{key:"drawImageAtPosition",value:function(e,t,i,r,n,o){if(this.initialized())if(t>2){t*=.5;for(var a=0;t>2&&a<this.NUM_ITERATIONS;)t*=.5,a+=1;a>=this.NUM_ITERATIONS&&(a=this.NUM_ITERATIONS-1);var s=this.coordinates[a];e.drawImage(this.canvas,s[0],s[1],s[2],s[3],i,r,n,o)}else e.drawImage(this.image,i,r,n,o)}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=function(){function e(){(0,r.default)(this,e),this.clear(),this.defaultIndex=0,this.groupsArray=[],this.groupIndex=0,this.defaultGroups=[{border:"#2B7CE9",background:"#97C2FC",highlight:{border:"#2B7CE9",background:"#D2E5FF"},hover:{border:"#2B7CE9",background:"#D2E5FF"}},{border:"#FFA500",background:"#FFFF00",highlight:{border:"#FFA500",background:"#FFFFA3"},hover:{border:"#FFA500",background:"#FFFFA3"}},{border:"#FA0A10",background:"#FB7E81",highlight:{border:"#FA0A10",background:"#FFAFB1"},hover:{border:"#FA0A10",background:"#FFAFB1"}},{border:"#41A906",background:"#7BE141",highlight:{border:"#41A906",background:"#A1EC76"},hover:{border:"#41A906",background:"#A1EC76"}},{border:"#E129F0",background:"#EB7DF4",highlight:{border:"#E129F0",background:"#F0B3F5"},hover:{border:"#E129F0",background:"#F0B3F5"}},{border:"#7C29F0",background:"#AD85E4",highlight:{border:"#7C29F0",background:"#D3BDF0"},hover:{border:"#7C29F0",background:"#D3BDF0"}},{border:"#C37F00",background:"#FFA807",highlight:{border:"#C37F00",background:"#FFCA66"},hover:{border:"#C37F00",background:"#FFCA66"}},{border:"#4220FB",background:"#6E6EFD",highlight:{border:"#4220FB",background:"#9B9BFD"},hover:{border:"#4220FB",background:"#9B9BFD"}},{border:"#FD5A77",background:"#FFC0CB",highlight:{border:"#FD5A77",background:"#FFD1D9"},hover:{border:"#FD5A77",background:"#FFD1D9"}},{border:"#4AD63A",background:"#C2FABC",highlight:{border:"#4AD63A",background:"#E6FFE3"},hover:{border:"#4AD63A",background:"#E6FFE3"}},{border:"#990000",background:"#EE0000",highlight:{border:"#BB0000",background:"#FF3333"},hover:{border:"#BB0000",background:"#FF3333"}},{border:"#FF6000",background:"#FF6000",highlight:{border:"#FF6000",background:"#FF6000"},hover:{border:"#FF6000",background:"#FF6000"}},{border:"#97C2FC",background:"#2B7CE9",highlight:{border:"#D2E5FF",background:"#2B7CE9"},hover:{border:"#D2E5FF",background:"#2B7CE9"}},{border:"#399605",background:"#255C03",highlight:{border:"#399605",background:"#255C03"},hover:{border:"#399605",background:"#255C03"}},{border:"#B70054",background:"#FF007E",highlight:{border:"#B70054",background:"#FF007E"},hover:{border:"#B70054",background:"#FF007E"}},{border:"#AD85E4",background:"#7C29F0",highlight:{border:"#D3BDF0",background:"#7C29F0"},hover:{border:"#D3BDF0",background:"#7C29F0"}},{border:"#4557FA",background:"#000EA1",highlight:{border:"#6E6EFD",background:"#000EA1"},hover:{border:"#6E6EFD",background:"#000EA1"}},{border:"#FFC0CB",background:"#FD5A77",highlight:{border:"#FFD1D9",background:"#FD5A77"},hover:{border:"#FFD1D9",background:"#FD5A77"}},{border:"#C2FABC",background:"#74D66A",highlight:{border:"#E6FFE3",background:"#74D66A"},hover:{border:"#E6FFE3",background:"#74D66A"}},{border:"#EE0000",background:"#990000",highlight:{border:"#FF3333",background:"#BB0000"},hover:{border:"#FF3333",background:"#BB0000"}}],this.options={},this.defaultOptions={useDefaultGroups:!0},a.extend(this.options,this.defaultOptions)}return(0,n.default)(e,[{key:"setOptions",value:function(e){var t=["useDefaultGroups"];if(void 0!==e)for(var i in e)if(e.hasOwnProperty(i)&&-1===t.indexOf(i)){var r=e[i];this.add(i,r)}}},{key:"clear",value:function(){this.groups={},this.groupsArray=[]}},{key:"get",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this.groups[e];if(void 0===i&&t)if(!1===this.options.useDefaultGroups&&this.groupsArray.length>0){var r=this.groupIndex%this.groupsArray.length;this.groupIndex++,(i={}).color=this.groups[this.groupsArray[r]],this.groups[e]=i}else{var n=this.defaultIndex%this.defaultGroups.length;this.defaultIndex++,(i={}).color=this.defaultGroups[n],this.groups[e]=i}return i}},{key:"add",value:function(e,t){return this.groups[e]=t,this.groupsArray.push(e),t}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(11),l=i(12),u=i(47).default,h=function(){function e(t,i,n,o){var s=this;if((0,r.default)(this,e),this.body=t,this.images=i,this.groups=n,this.layoutEngine=o,this.body.functions.createNode=this.create.bind(this),this.nodesListeners={add:function(e,t){s.add(t.items)},update:function(e,t){s.update(t.items,t.data,t.oldData)},remove:function(e,t){s.remove(t.items)}},this.defaultOptions={borderWidth:1,borderWidthSelected:2,brokenImage:void 0,color:{border:"#2B7CE9",background:"#97C2FC",highlight:{border:"#2B7CE9",background:"#D2E5FF"},hover:{border:"#2B7CE9",background:"#D2E5FF"}},fixed:{x:!1,y:!1},font:{color:"#343434",size:14,face:"arial",background:"none",strokeWidth:0,strokeColor:"#ffffff",align:"center",vadjust:0,multi:!1,bold:{mod:"bold"},boldital:{mod:"bold italic"},ital:{mod:"italic"},mono:{mod:"",size:15,face:"monospace",vadjust:2}},group:void 0,hidden:!1,icon:{face:"FontAwesome",code:void 0,size:50,color:"#2B7CE9"},image:void 0,label:void 0,labelHighlightBold:!0,level:void 0,margin:{top:5,right:5,bottom:5,left:5},mass:1,physics:!0,scaling:{min:10,max:30,label:{enabled:!1,min:14,max:30,maxVisible:30,drawThreshold:5},customScalingFunction:function(e,t,i,r){if(t===e)return.5;var n=1/(t-e);return Math.max(0,(r-e)*n)}},shadow:{enabled:!1,color:"rgba(0,0,0,0.5)",size:10,x:5,y:5},shape:"ellipse",shapeProperties:{borderDashes:!1,borderRadius:6,interpolation:!0,useImageSize:!1,useBorderWithImage:!1},size:25,title:void 0,value:void 0,x:void 0,y:void 0},this.defaultOptions.mass<=0)throw"Internal error: mass in defaultOptions of NodesHandler may not be zero or negative";this.options=a.bridgeObject(this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("refreshNodes",this.refresh.bind(this)),this.body.emitter.on("refresh",this.refresh.bind(this)),this.body.emitter.on("destroy",function(){a.forEach(e.nodesListeners,function(t,i){e.body.data.nodes&&e.body.data.nodes.off(i,t)}),delete e.body.functions.createNode,delete e.nodesListeners.add,delete e.nodesListeners.update,delete e.nodesListeners.remove,delete e.nodesListeners})}},{key:"setOptions",value:function(e){if(void 0!==e){if(u.parseOptions(this.options,e),void 0!==e.shape)for(var t in this.body.nodes)this.body.nodes.hasOwnProperty(t)&&this.body.nodes[t].updateShape();if(void 0!==e.font)for(var i in this.body.nodes)this.body.nodes.hasOwnProperty(i)&&(this.body.nodes[i].updateLabelModule(),this.body.nodes[i].needsRefresh());if(void 0!==e.size)for(var r in this.body.nodes)this.body.nodes.hasOwnProperty(r)&&this.body.nodes[r].needsRefresh();void 0===e.hidden&&void 0===e.physics||this.body.emitter.emit("_dataChanged")}}},{key:"setData",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.data.nodes;if(e instanceof s||e instanceof l)this.body.data.nodes=e;else if(Array.isArray(e))this.body.data.nodes=new s,this.body.data.nodes.add(e);else{if(e)throw new TypeError("Array or DataSet expected");this.body.data.nodes=new s}if(i&&a.forEach(this.nodesListeners,function(e,t){i.off(t,e)}),this.body.nodes={},this.body.data.nodes){var r=this;a.forEach(this.nodesListeners,function(e,t){r.body.data.nodes.on(t,e)});var n=this.body.data.nodes.getIds();this.add(n,!0)}!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"add",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=void 0,r=[],n=0;n<e.length;n++){i=e[n];var o=this.body.data.nodes.get(i),a=this.create(o);r.push(a),this.body.nodes[i]=a}this.layoutEngine.positionInitially(r),!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"update",value:function(e,t,i){for(var r=this.body.nodes,n=!1,o=0;o<e.length;o++){var a=e[o],s=r[a],l=t[o];void 0!==s?s.setOptions(l)&&(n=!0):(n=!0,s=this.create(l),r[a]=s)}n||void 0===i||(n=t.some(function(e,t){var r=i[t];return r&&r.level!==e.level})),!0===n?this.body.emitter.emit("_dataChanged"):this.body.emitter.emit("_dataUpdated")}},{key:"remove",value:function(e){for(var t=this.body.nodes,i=0;i<e.length;i++){delete t[e[i]]}this.body.emitter.emit("_dataChanged")}},{key:"create",value:function(e){return new(arguments.length>1&&void 0!==arguments[1]?arguments[1]:u)(e,this.body,this.images,this.groups,this.options,this.defaultOptions)}},{key:"refresh",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];a.forEach(this.body.nodes,function(i,r){var n=e.body.data.nodes.get(r);void 0!==n&&(!0===t&&i.setOptions({x:null,y:null}),i.setOptions({fixed:!1}),i.setOptions(n))})}},{key:"getPositions",value:function(e){var t={};if(void 0!==e){if(!0===Array.isArray(e)){for(var i=0;i<e.length;i++)if(void 0!==this.body.nodes[e[i]]){var r=this.body.nodes[e[i]];t[e[i]]={x:Math.round(r.x),y:Math.round(r.y)}}}else if(void 0!==this.body.nodes[e]){var n=this.body.nodes[e];t[e]={x:Math.round(n.x),y:Math.round(n.y)}}}else for(var o=0;o<this.body.nodeIndices.length;o++){var a=this.body.nodes[this.body.nodeIndices[o]];t[this.body.nodeIndices[o]]={x:Math.round(a.x),y:Math.round(a.y)}}return t}},{key:"storePositions",value:function(){var e=[],t=this.body.data.nodes.getDataSet();for(var i in t._data)if(t._data.hasOwnProperty(i)){var r=this.body.nodes[i];t._data[i].x==Math.round(r.x)&&t._data[i].y==Math.round(r.y)||e.push({id:r.id,x:Math.round(r.x),y:Math.round(r.y)})}t.update(e)}},{key:"getBoundingBox",value:function(e){if(void 0!==this.body.nodes[e])return this.body.nodes[e].shape.boundingBox}},{key:"getConnectedNodes",value:function(e,t){var i=[];if(void 0!==this.body.nodes[e])for(var r=this.body.nodes[e],n={},o=0;o<r.edges.length;o++){var a=r.edges[o];"to"!==t&&a.toId==r.id?void 0===n[a.fromId]&&(i.push(a.fromId),n[a.fromId]=!0):"from"!==t&&a.fromId==r.id&&void 0===n[a.toId]&&(i.push(a.toId),n[a.toId]=!0)}return i}},{key:"getConnectedEdges",value:function(e){var t=[];if(void 0!==this.body.nodes[e])for(var i=this.body.nodes[e],r=0;r<i.edges.length;r++)t.push(i.edges[r].id);else console.log("NodeId provided for getConnectedEdges does not exist. Provided: ",e);return t}},{key:"moveNode",value:function(e,t,i){var r=this;void 0!==this.body.nodes[e]?(this.body.nodes[e].x=Number(t),this.body.nodes[e].y=Number(i),setTimeout(function(){r.body.emitter.emit("startSimulation")},0)):console.log("Node id supplied to moveNode does not exist. Provided: ",e)}}]),e}();t.default=h},function(e,t,i){e.exports={default:i(189),__esModule:!0}},function(e,t,i){i(49),i(60),e.exports=i(190)},function(e,t,i){var r=i(86),n=i(13)("iterator"),o=i(31);e.exports=i(7).isIterable=function(e){var t=Object(e);return void 0!==t[n]||"@@iterator"in t||o.hasOwnProperty(r(t))}},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(192).default,s=i(48).default,l=function(){function e(t,i,n,o){var s=this;(0,r.default)(this,e),this.ctx=t,this.parent=i;this.lines=new a(function(e,i){if(void 0===e)return 0;var r=s.parent.getFormattingValues(t,n,o,i),a=0;""!==e&&(a=s.ctx.measureText(e).width);return{width:a,values:r}})}return(0,n.default)(e,[{key:"process",value:function(e){if(!s.isValidLabel(e))return this.lines.finalize();var t=this.parent.fontOptions;e=(e=e.replace(/\r\n/g,"\n")).replace(/\r/g,"\n");var i=String(e).split("\n"),r=i.length;if(t.multi)for(var n=0;n<r;n++){var o=this.splitBlocks(i[n],t.multi);if(void 0!==o)if(0!==o.length){if(t.maxWdt>0)for(var a=0;a<o.length;a++){var l=o[a].mod,u=o[a].text;this.splitStringIntoLines(u,l,!0)}else for(var h=0;h<o.length;h++){var c=o[h].mod,d=o[h].text;this.lines.append(d,c)}this.lines.newLine()}else this.lines.newLine("")}else if(t.maxWdt>0)for(var p=0;p<r;p++)this.splitStringIntoLines(i[p]);else for(var f=0;f<r;f++)this.lines.newLine(i[f]);return this.lines.finalize()}},{key:"decodeMarkupSystem",value:function(e){var t="none";return"markdown"===e||"md"===e?t="markdown":!0!==e&&"html"!==e||(t="html"),t}},{key:"splitHtmlBlocks",value:function(e){for(var t=[],i={bold:!1,ital:!1,mono:!1,spacing:!1,position:0,buffer:"",modStack:[],mod:function(){return 0===this.modStack.length?"normal":this.modStack[0]},modName:function(){return 0===this.modStack.length?"normal":"mono"===this.modStack[0]?"mono":i.bold&&i.ital?"boldital":i.bold?"bold":i.ital?"ital":void 0},emitBlock:function(){arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.spacing&&(this.add(" "),this.spacing=!1),this.buffer.length>0&&(t.push({text:this.buffer,mod:this.modName()}),this.buffer="")},add:function(e){" "===e&&(i.spacing=!0),i.spacing&&(this.buffer+=" ",this.spacing=!1)," "!=e&&(this.buffer+=e)}};i.position<e.length;){var r=e.charAt(i.position);/[ \t]/.test(r)?i.mono?i.add(r):i.spacing=!0:/</.test(r)?i.mono||i.bold||!/<b>/.test(e.substr(i.position,3))?i.mono||i.ital||!/<i>/.test(e.substr(i.position,3))?!i.mono&&/<code>/.test(e.substr(i.position,6))?(i.emitBlock(),i.mono=!0,i.modStack.unshift("mono"),i.position+=5):!i.mono&&"bold"===i.mod()&&/<\/b>/.test(e.substr(i.position,4))?(i.emitBlock(),i.bold=!1,i.modStack.shift(),i.position+=3):!i.mono&&"ital"===i.mod()&&/<\/i>/.test(e.substr(i.position,4))?(i.emitBlock(),i.ital=!1,i.modStack.shift(),i.position+=3):"mono"===i.mod()&&/<\/code>/.test(e.substr(i.position,7))?(i.emitBlock(),i.mono=!1,i.modStack.shift(),i.position+=6):i.add(r):(i.emitBlock(),i.ital=!0,i.modStack.unshift("ital"),i.position+=2):(i.emitBlock(),i.bold=!0,i.modStack.unshift("bold"),i.position+=2):/&/.test(r)?/&lt;/.test(e.substr(i.position,4))?(i.add("<"),i.position+=3):/&amp;/.test(e.substr(i.position,5))?(i.add("&"),i.position+=4):i.add("&"):i.add(r),i.position++}return i.emitBlock(),t}},{key:"splitMarkdownBlocks",value:function(e){for(var t=[],i={bold:!1,ital:!1,mono:!1,beginable:!0,spacing:!1,position:0,buffer:"",modStack:[],mod:function(){return 0===this.modStack.length?"normal":this.modStack[0]},modName:function(){return 0===this.modStack.length?"normal":"mono"===this.modStack[0]?"mono":i.bold&&i.ital?"boldital":i.bold?"bold":i.ital?"ital":void 0},emitBlock:function(){arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.spacing&&(this.add(" "),this.spacing=!1),this.buffer.length>0&&(t.push({text:this.buffer,mod:this.modName()}),this.buffer="")},add:function(e){" "===e&&(i.spacing=!0),i.spacing&&(this.buffer+=" ",this.spacing=!1)," "!=e&&(this.buffer+=e)}};i.position<e.length;){var r=e.charAt(i.position);/[ \t]/.test(r)?(i.mono?i.add(r):i.spacing=!0,i.beginable=!0):/\\/.test(r)?i.position<e.length+1&&(i.position++,r=e.charAt(i.position),/ \t/.test(r)?i.spacing=!0:(i.add(r),i.beginable=!1)):i.mono||i.bold||!i.beginable&&!i.spacing||!/\*/.test(r)?i.mono||i.ital||!i.beginable&&!i.spacing||!/\_/.test(r)?!i.mono&&(i.beginable||i.spacing)&&/`/.test(r)?(i.emitBlock(),i.mono=!0,i.modStack.unshift("mono")):!i.mono&&"bold"===i.mod()&&/\*/.test(r)?i.position===e.length-1||/[.,_` \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.bold=!1,i.modStack.shift()):i.add(r):!i.mono&&"ital"===i.mod()&&/\_/.test(r)?i.position===e.length-1||/[.,*` \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.ital=!1,i.modStack.shift()):i.add(r):i.mono&&"mono"===i.mod()&&/`/.test(r)?i.position===e.length-1||/[.,*_ \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.mono=!1,i.modStack.shift()):i.add(r):(i.add(r),i.beginable=!1):(i.emitBlock(),i.ital=!0,i.modStack.unshift("ital")):(i.emitBlock(),i.bold=!0,i.modStack.unshift("bold")),i.position++}return i.emitBlock(),t}},{key:"splitBlocks",value:function(e,t){var i=this.decodeMarkupSystem(t);return"none"===i?[{text:e,mod:"normal"}]:"markdown"===i?this.splitMarkdownBlocks(e):"html"===i?this.splitHtmlBlocks(e):void 0}},{key:"overMaxWidth",value:function(e){var t=this.ctx.measureText(e).width;return this.lines.curWidth()+t>this.parent.fontOptions.maxWdt}},{key:"getLongestFit",value:function(e){for(var t="",i=0;i<e.length;){var r=t+(""===t?"":" ")+e[i];if(this.overMaxWidth(r))break;t=r,i++}return i}},{key:"getLongestFitWord",value:function(e){for(var t=0;t<e.length&&!this.overMaxWidth(e.slice(0,t));)t++;return t}},{key:"splitStringIntoLines",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal",i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=(e=(e=e.replace(/^( +)/g,"$1\r")).replace(/([^\r][^ ]*)( +)/g,"$1\r$2\r")).split("\r");r.length>0;){var n=this.getLongestFit(r);if(0===n){var o=r[0],a=this.getLongestFitWord(o);this.lines.newLine(o.slice(0,a),t),r[0]=o.slice(a)}else{var s=n;" "===r[n-1]?n--:" "===r[s]&&s++;var l=r.slice(0,n).join("");n==r.length&&i?this.lines.append(l,t):this.lines.newLine(l,t),r=r.slice(s)}}}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(90)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=function(){function e(t){(0,n.default)(this,e),this.measureText=t,this.current=0,this.width=0,this.height=0,this.lines=[]}return(0,o.default)(e,[{key:"_add",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"normal";void 0===this.lines[e]&&(this.lines[e]={width:0,height:0,blocks:[]});var n=t;void 0!==t&&""!==t||(n=" ");var o=this.measureText(n,i),a=(0,r.default)({},o.values);a.text=t,a.width=o.width,a.mod=i,void 0!==t&&""!==t||(a.width=0),this.lines[e].blocks.push(a),this.lines[e].width+=a.width}},{key:"curWidth",value:function(){var e=this.lines[this.current];return void 0===e?0:e.width}},{key:"append",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal";this._add(this.current,e,t)}},{key:"newLine",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal";this._add(this.current,e,t),this.current++}},{key:"determineLineHeights",value:function(){for(var e=0;e<this.lines.length;e++){var t=this.lines[e],i=0;if(void 0!==t.blocks)for(var r=0;r<t.blocks.length;r++){var n=t.blocks[r];i<n.height&&(i=n.height)}t.height=i}}},{key:"determineLabelSize",value:function(){for(var e=0,t=0,i=0;i<this.lines.length;i++){var r=this.lines[i];r.width>e&&(e=r.width),t+=r.height}this.width=e,this.height=t}},{key:"removeEmptyBlocks",value:function(){for(var e=[],t=0;t<this.lines.length;t++){var i=this.lines[t];if(0!==i.blocks.length&&(t!==this.lines.length-1||0!==i.width)){var n={};(0,r.default)(n,i),n.blocks=[];for(var o=void 0,a=[],s=0;s<i.blocks.length;s++){var l=i.blocks[s];0!==l.width?a.push(l):void 0===o&&(o=l)}0===a.length&&void 0!==o&&a.push(o),n.blocks=a,e.push(n)}}return e}},{key:"finalize",value:function(){this.determineLineHeights(),this.determineLabelSize();var e=this.removeEmptyBlocks();return{width:this.width,height:this.height,lines:e}}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i);this.width=r.width+this.margin.right+this.margin.left,this.height=r.height+this.margin.top+this.margin.bottom,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.initContextForDraw(e,o),e.roundRect(this.left,this.top,this.width,this.height,o.borderRadius),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n)}},{key:"updateBoundingBox",value:function(e,t,i,r,n){this._updateBoundingBox(e,t,i,r,n);var o=this.options.shapeProperties.borderRadius;this._addBoundingBoxMargin(o)}},{key:"distanceToBorder",value:function(e,t){this.resize(e);var i=this.options.borderWidth;return Math.min(Math.abs(this.width/2/Math.cos(t)),Math.abs(this.height/2/Math.sin(t)))+i}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){i(195),e.exports=i(7).Object.getPrototypeOf},function(e,t,i){var r=i(41),n=i(85);i(87)("getPrototypeOf",function(){return function(e){return n(r(e))}})},function(e,t,i){e.exports={default:i(197),__esModule:!0}},function(e,t,i){i(198),e.exports=i(7).Object.setPrototypeOf},function(e,t,i){var r=i(17);r(r.S,"Object",{setPrototypeOf:i(199).set})},function(e,t,i){var r=i(32),n=i(27),o=function(e,t){if(n(e),!r(t)&&null!==t)throw TypeError(t+": can't set as prototype!")};e.exports={set:Object.setPrototypeOf||("__proto__"in{}?function(e,t,r){try{(r=i(80)(Function.call,i(89).f(Object.prototype,"__proto__").set,2))(e,[]),t=!(e instanceof Array)}catch(e){t=!0}return function(e,i){return o(e,i),t?e.__proto__=i:r(e,i),e}}({},!1):void 0),check:o}},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i),n=Math.max(r.width+this.margin.right+this.margin.left,r.height+this.margin.top+this.margin.bottom);this.options.size=n/2,this.width=n,this.height=n,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this._drawRawCircle(e,t,i,o),this.updateBoundingBox(t,i),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,i,r,n)}},{key:"updateBoundingBox",value:function(e,t){this.boundingBox.top=t-this.options.size,this.boundingBox.left=e-this.options.size,this.boundingBox.right=e+this.options.size,this.boundingBox.bottom=t+this.options.size}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),.5*this.width}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o,s,l){(0,n.default)(this,t);var u=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return u.setImages(s,l),u}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(void 0===this.imageObj.src||void 0===this.imageObj.width||void 0===this.imageObj.height){var r=2*this.options.size;return this.width=r,this.height=r,void(this.radius=.5*this.width)}this.needsRefresh(t,i)&&this._resizeImage()}},{key:"draw",value:function(e,t,i,r,n,o){this.switchImages(r),this.resize(),this.left=t-this.width/2,this.top=i-this.height/2,this._drawRawCircle(e,t,i,o),e.save(),e.clip(),this._drawImageAtPosition(e,o),e.restore(),this._drawImageLabel(e,t,i,r,n),this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){this.boundingBox.top=t-this.options.size,this.boundingBox.left=e-this.options.size,this.boundingBox.right=e+this.options.size,this.boundingBox.bottom=t+this.options.size,this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelOffset)}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),.5*this.width}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i).width+this.margin.right+this.margin.left;this.width=r,this.height=r,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.initContextForDraw(e,o),e.database(t-this.width/2,i-this.height/2,this.width,this.height),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"diamond",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"circle",2,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),this.options.size}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i);this.height=2*r.height,this.width=r.width+r.height,this.radius=.5*this.width}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-.5*this.width,this.top=i-.5*this.height,this.initContextForDraw(e,o),e.ellipse_vis(this.left,this.top,this.width,this.height),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,t,i,r,n)}},{key:"distanceToBorder",value:function(e,t){this.resize(e);var i=.5*this.width,r=.5*this.height,n=Math.sin(t)*i,o=Math.cos(t)*r;return i*r/Math.sqrt(n*n+o*o)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){this.needsRefresh(t,i)&&(this.iconSize={width:Number(this.options.icon.size),height:Number(this.options.icon.size)},this.width=this.iconSize.width+this.margin.right+this.margin.left,this.height=this.iconSize.height+this.margin.top+this.margin.bottom,this.radius=.5*this.width)}},{key:"draw",value:function(e,t,i,r,n,o){if(this.resize(e,r,n),this.options.icon.size=this.options.icon.size||50,this.left=t-this.width/2,this.top=i-this.height/2,this._icon(e,t,i,r,n,o),void 0!==this.options.label){this.labelModule.draw(e,this.left+this.iconSize.width/2+this.margin.left,i+this.height/2+5,r)}this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){if(this.boundingBox.top=t-.5*this.options.icon.size,this.boundingBox.left=e-.5*this.options.icon.size,this.boundingBox.right=e+.5*this.options.icon.size,this.boundingBox.bottom=t+.5*this.options.icon.size,void 0!==this.options.label&&this.labelModule.size.width>0){this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelModule.size.height+5)}}},{key:"_icon",value:function(e,t,i,r,n,o){var a=Number(this.options.icon.size);void 0!==this.options.icon.code?(e.font=(r?"bold ":"")+a+"px "+this.options.icon.face,e.fillStyle=this.options.icon.color||"black",e.textAlign="center",e.textBaseline="middle",this.enableShadow(e,o),e.fillText(this.options.icon.code,t,i),this.disableShadow(e,o)):console.error("When using the icon shape, you need to define the code in the icon options object. This can be done per node or globally.")}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o,s,l){(0,n.default)(this,t);var u=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return u.setImages(s,l),u}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(void 0===this.imageObj.src||void 0===this.imageObj.width||void 0===this.imageObj.height){var r=2*this.options.size;return this.width=r,void(this.height=r)}this.needsRefresh(t,i)&&this._resizeImage()}},{key:"draw",value:function(e,t,i,r,n,o){if(this.switchImages(r),this.resize(),this.left=t-this.width/2,this.top=i-this.height/2,!0===this.options.shapeProperties.useBorderWithImage){var a=this.options.borderWidth,s=this.options.borderWidthSelected||2*this.options.borderWidth,l=(r?s:a)/this.body.view.scale;e.lineWidth=Math.min(this.width,l),e.beginPath(),e.strokeStyle=r?this.options.color.highlight.border:n?this.options.color.hover.border:this.options.color.border,e.fillStyle=r?this.options.color.highlight.background:n?this.options.color.hover.background:this.options.color.background,e.rect(this.left-.5*e.lineWidth,this.top-.5*e.lineWidth,this.width+e.lineWidth,this.height+e.lineWidth),e.fill(),this.performStroke(e,o),e.closePath()}this._drawImageAtPosition(e,o),this._drawImageLabel(e,t,i,r,n),this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){this.resize(),this._updateBoundingBox(e,t),void 0!==this.options.label&&this.labelModule.size.width>0&&(this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelOffset))}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"square",2,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"hexagon",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"star",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){this.needsRefresh(t,i)&&(this.textSize=this.labelModule.getTextSize(e,t,i),this.width=this.textSize.width+this.margin.right+this.margin.left,this.height=this.textSize.height+this.margin.top+this.margin.bottom,this.radius=.5*this.width)}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.enableShadow(e,o),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n),this.disableShadow(e,o),this.updateBoundingBox(t,i,e,r,n)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"triangle",3,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"triangleDown",3,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(11),l=i(12),u=i(74).default,h=function(){function e(t,i,n){var o=this;(0,r.default)(this,e),this.body=t,this.images=i,this.groups=n,this.body.functions.createEdge=this.create.bind(this),this.edgesListeners={add:function(e,t){o.add(t.items)},update:function(e,t){o.update(t.items)},remove:function(e,t){o.remove(t.items)}},this.options={},this.defaultOptions={arrows:{to:{enabled:!1,scaleFactor:1,type:"arrow"},middle:{enabled:!1,scaleFactor:1,type:"arrow"},from:{enabled:!1,scaleFactor:1,type:"arrow"}},arrowStrikethrough:!0,color:{color:"#848484",highlight:"#848484",hover:"#848484",inherit:"from",opacity:1},dashes:!1,font:{color:"#343434",size:14,face:"arial",background:"none",strokeWidth:2,strokeColor:"#ffffff",align:"horizontal",multi:!1,vadjust:0,bold:{mod:"bold"},boldital:{mod:"bold italic"},ital:{mod:"italic"},mono:{mod:"",size:15,face:"courier new",vadjust:2}},hidden:!1,hoverWidth:1.5,label:void 0,labelHighlightBold:!0,length:void 0,physics:!0,scaling:{min:1,max:15,label:{enabled:!0,min:14,max:30,maxVisible:30,drawThreshold:5},customScalingFunction:function(e,t,i,r){if(t===e)return.5;var n=1/(t-e);return Math.max(0,(r-e)*n)}},selectionWidth:1.5,selfReferenceSize:20,shadow:{enabled:!1,color:"rgba(0,0,0,0.5)",size:10,x:5,y:5},smooth:{enabled:!0,type:"dynamic",forceDirection:"none",roundness:.5},title:void 0,width:1,value:void 0},a.deepExtend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("_forceDisableDynamicCurves",function(t){var i=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];"dynamic"===t&&(t="continuous");var r=!1;for(var n in e.body.edges)if(e.body.edges.hasOwnProperty(n)){var o=e.body.edges[n],a=e.body.data.edges._data[n];if(void 0!==a){var s=a.smooth;void 0!==s&&!0===s.enabled&&"dynamic"===s.type&&(void 0===t?o.setOptions({smooth:!1}):o.setOptions({smooth:{type:t}}),r=!0)}}!0===i&&!0===r&&e.body.emitter.emit("_dataChanged")}),this.body.emitter.on("_dataUpdated",function(){e.reconnectEdges()}),this.body.emitter.on("refreshEdges",this.refresh.bind(this)),this.body.emitter.on("refresh",this.refresh.bind(this)),this.body.emitter.on("destroy",function(){a.forEach(e.edgesListeners,function(t,i){e.body.data.edges&&e.body.data.edges.off(i,t)}),delete e.body.functions.createEdge,delete e.edgesListeners.add,delete e.edgesListeners.update,delete e.edgesListeners.remove,delete e.edgesListeners})}},{key:"setOptions",value:function(e){if(void 0!==e){u.parseOptions(this.options,e,!0,this.defaultOptions,!0);var t=!1;if(void 0!==e.smooth)for(var i in this.body.edges)this.body.edges.hasOwnProperty(i)&&(t=this.body.edges[i].updateEdgeType()||t);if(void 0!==e.font)for(var r in this.body.edges)this.body.edges.hasOwnProperty(r)&&this.body.edges[r].updateLabelModule();void 0===e.hidden&&void 0===e.physics&&!0!==t||this.body.emitter.emit("_dataChanged")}}},{key:"setData",value:function(e){var t=this,i=arguments.length>1&&void 0!==arguments[1]&&arguments[1],r=this.body.data.edges;if(e instanceof s||e instanceof l)this.body.data.edges=e;else if(Array.isArray(e))this.body.data.edges=new s,this.body.data.edges.add(e);else{if(e)throw new TypeError("Array or DataSet expected");this.body.data.edges=new s}if(r&&a.forEach(this.edgesListeners,function(e,t){r.off(t,e)}),this.body.edges={},this.body.data.edges){a.forEach(this.edgesListeners,function(e,i){t.body.data.edges.on(i,e)});var n=this.body.data.edges.getIds();this.add(n,!0)}this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),!1===i&&this.body.emitter.emit("_dataChanged")}},{key:"add",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.edges,r=this.body.data.edges,n=0;n<e.length;n++){var o=e[n],a=i[o];a&&a.disconnect();var s=r.get(o,{showInternalIds:!0});i[o]=this.create(s)}this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"update",value:function(e){for(var t=this.body.edges,i=this.body.data.edges,r=!1,n=0;n<e.length;n++){var o=e[n],a=i.get(o),s=t[o];void 0!==s?(s.disconnect(),r=s.setOptions(a)||r,s.connect()):(this.body.edges[o]=this.create(a),r=!0)}!0===r?(this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),this.body.emitter.emit("_dataChanged")):this.body.emitter.emit("_dataUpdated")}},{key:"remove",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(0!==e.length){var i=this.body.edges;a.forEach(e,function(e){var t=i[e];void 0!==t&&t.remove()}),t&&this.body.emitter.emit("_dataChanged")}}},{key:"refresh",value:function(){var e=this;a.forEach(this.body.edges,function(t,i){var r=e.body.data.edges._data[i];void 0!==r&&t.setOptions(r)})}},{key:"create",value:function(e){return new u(e,this.body,this.options,this.defaultOptions)}},{key:"reconnectEdges",value:function(){var e,t=this.body.nodes,i=this.body.edges;for(e in t)t.hasOwnProperty(e)&&(t[e].edges=[]);for(e in i)if(i.hasOwnProperty(e)){var r=i[e];r.from=null,r.to=null,r.connect()}}},{key:"getConnectedNodes",value:function(e){var t=[];if(void 0!==this.body.edges[e]){var i=this.body.edges[e];void 0!==i.fromId&&t.push(i.fromId),void 0!==i.toId&&t.push(i.toId)}return t}},{key:"_updateState",value:function(){this._addMissingEdges(),this._removeInvalidEdges()}},{key:"_removeInvalidEdges",value:function(){var e=this,t=[];a.forEach(this.body.edges,function(i,r){var n=e.body.nodes[i.toId],o=e.body.nodes[i.fromId];void 0!==n&&!0===n.isCluster||void 0!==o&&!0===o.isCluster||void 0!==n&&void 0!==o||t.push(r)}),this.remove(t,!1)}},{key:"_addMissingEdges",value:function(){var e=this.body.edges,t=this.body.data.edges,i=[];t.forEach(function(t,r){void 0===e[r]&&i.push(r)}),this.add(i,!0)}}]),e}();t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=u(i(30)),n=u(i(3)),o=u(i(0)),a=u(i(1)),s=u(i(4)),l=u(i(5));function u(e){return e&&e.__esModule?e:{default:e}}var h=function(e){function t(e,i,r){return(0,o.default)(this,t),(0,s.default)(this,(t.__proto__||(0,n.default)(t)).call(this,e,i,r))}return(0,l.default)(t,e),(0,a.default)(t,[{key:"_line",value:function(e,t,i){var r=i[0],n=i[1];this._bezierCurve(e,t,r,n)}},{key:"_getViaCoordinates",value:function(){var e=this.from.x-this.to.x,t=this.from.y-this.to.y,i=void 0,r=void 0,n=void 0,o=void 0,a=this.options.smooth.roundness;return(Math.abs(e)>Math.abs(t)||!0===this.options.smooth.forceDirection||"horizontal"===this.options.smooth.forceDirection)&&"vertical"!==this.options.smooth.forceDirection?(r=this.from.y,o=this.to.y,i=this.from.x-a*e,n=this.to.x+a*e):(r=this.from.y-a*t,o=this.to.y+a*t,i=this.from.x,n=this.to.x),[{x:i,y:r},{x:n,y:o}]}},{key:"getViaNode",value:function(){return this._getViaCoordinates()}},{key:"_findBorderPosition",value:function(e,t){return this._findBorderPositionBezier(e,t)}},{key:"_getDistanceToEdge",value:function(e,t,i,n,o,a){var s=arguments.length>6&&void 0!==arguments[6]?arguments[6]:this._getViaCoordinates(),l=(0,r.default)(s,2),u=l[0],h=l[1];return this._getDistanceToBezierEdge(e,t,i,n,o,a,u,h)}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._getViaCoordinates(),i=(0,r.default)(t,2),n=i[0],o=i[1],a=e,s=[];return s[0]=Math.pow(1-a,3),s[1]=3*a*Math.pow(1-a,2),s[2]=3*Math.pow(a,2)*(1-a),s[3]=Math.pow(a,3),{x:s[0]*this.fromPoint.x+s[1]*n.x+s[2]*o.x+s[3]*this.toPoint.x,y:s[0]*this.fromPoint.y+s[1]*n.y+s[2]*o.y+s[3]*this.toPoint.y}}}]),t}(u(i(216)).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_getDistanceToBezierEdge",value:function(e,t,i,r,n,o,a,s){var l=1e9,u=void 0,h=void 0,c=void 0,d=void 0,p=void 0,f=e,m=t,v=[0,0,0,0];for(h=1;h<10;h++)c=.1*h,v[0]=Math.pow(1-c,3),v[1]=3*c*Math.pow(1-c,2),v[2]=3*Math.pow(c,2)*(1-c),v[3]=Math.pow(c,3),d=v[0]*e+v[1]*a.x+v[2]*s.x+v[3]*i,p=v[0]*t+v[1]*a.y+v[2]*s.y+v[3]*r,h>0&&(l=(u=this._getDistanceToLine(f,m,d,p,n,o))<l?u:l),f=d,m=p;return l}}]),t}(l(i(75)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=u(i(30)),n=u(i(3)),o=u(i(0)),a=u(i(1)),s=u(i(4)),l=u(i(5));function u(e){return e&&e.__esModule?e:{default:e}}var h=function(e){function t(e,i,r){(0,o.default)(this,t);var a=(0,s.default)(this,(t.__proto__||(0,n.default)(t)).call(this,e,i,r));return a._boundFunction=function(){a.positionBezierNode()},a.body.emitter.on("_repositionBezierNodes",a._boundFunction),a}return(0,l.default)(t,e),(0,a.default)(t,[{key:"setOptions",value:function(e){var t=!1;this.options.physics!==e.physics&&(t=!0),this.options=e,this.id=this.options.id,this.from=this.body.nodes[this.options.from],this.to=this.body.nodes[this.options.to],this.setupSupportNode(),this.connect(),!0===t&&(this.via.setOptions({physics:this.options.physics}),this.positionBezierNode())}},{key:"connect",value:function(){this.from=this.body.nodes[this.options.from],this.to=this.body.nodes[this.options.to],void 0===this.from||void 0===this.to||!1===this.options.physics?this.via.setOptions({physics:!1}):this.from.id===this.to.id?this.via.setOptions({physics:!1}):this.via.setOptions({physics:!0})}},{key:"cleanup",value:function(){return this.body.emitter.off("_repositionBezierNodes",this._boundFunction),void 0!==this.via&&(delete this.body.nodes[this.via.id],this.via=void 0,!0)}},{key:"setupSupportNode",value:function(){if(void 0===this.via){var e="edgeId:"+this.id,t=this.body.functions.createNode({id:e,shape:"circle",physics:!0,hidden:!0});this.body.nodes[e]=t,this.via=t,this.via.parentEdgeId=this.id,this.positionBezierNode()}}},{key:"positionBezierNode",value:function(){void 0!==this.via&&void 0!==this.from&&void 0!==this.to?(this.via.x=.5*(this.from.x+this.to.x),this.via.y=.5*(this.from.y+this.to.y)):void 0!==this.via&&(this.via.x=0,this.via.y=0)}},{key:"_line",value:function(e,t,i){this._bezierCurve(e,t,i)}},{key:"getViaNode",value:function(){return this.via}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.via,i=e,n=void 0,o=void 0;if(this.from===this.to){var a=this._getCircleData(this.from),s=(0,r.default)(a,3),l=s[0],u=s[1],h=s[2],c=2*Math.PI*(1-i);n=l+h*Math.sin(c),o=u+h-h*(1-Math.cos(c))}else n=Math.pow(1-i,2)*this.fromPoint.x+2*i*(1-i)*t.x+Math.pow(i,2)*this.toPoint.x,o=Math.pow(1-i,2)*this.fromPoint.y+2*i*(1-i)*t.y+Math.pow(i,2)*this.toPoint.y;return{x:n,y:o}}},{key:"_findBorderPosition",value:function(e,t){return this._findBorderPositionBezier(e,t,this.via)}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){return this._getDistanceToBezierEdge(e,t,i,r,n,o,this.via)}}]),t}(u(i(75)).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_line",value:function(e,t,i){this._bezierCurve(e,t,i)}},{key:"getViaNode",value:function(){return this._getViaCoordinates()}},{key:"_getViaCoordinates",value:function(){var e=void 0,t=void 0,i=this.options.smooth.roundness,r=this.options.smooth.type,n=Math.abs(this.from.x-this.to.x),o=Math.abs(this.from.y-this.to.y);if("discrete"===r||"diagonalCross"===r){var a=void 0,s=void 0;a=s=n<=o?i*o:i*n,this.from.x>this.to.x&&(a=-a),this.from.y>=this.to.y&&(s=-s),e=this.from.x+a,t=this.from.y+s,"discrete"===r&&(n<=o?e=n<i*o?this.from.x:e:t=o<i*n?this.from.y:t)}else if("straightCross"===r){var l=(1-i)*n,u=(1-i)*o;n<=o?(l=0,this.from.y<this.to.y&&(u=-u)):(this.from.x<this.to.x&&(l=-l),u=0),e=this.to.x+l,t=this.to.y+u}else if("horizontal"===r){var h=(1-i)*n;this.from.x<this.to.x&&(h=-h),e=this.to.x+h,t=this.from.y}else if("vertical"===r){var c=(1-i)*o;this.from.y<this.to.y&&(c=-c),e=this.from.x,t=this.to.y+c}else if("curvedCW"===r){n=this.to.x-this.from.x,o=this.from.y-this.to.y;var d=Math.sqrt(n*n+o*o),p=Math.PI,f=(Math.atan2(o,n)+(.5*i+.5)*p)%(2*p);e=this.from.x+(.5*i+.5)*d*Math.sin(f),t=this.from.y+(.5*i+.5)*d*Math.cos(f)}else if("curvedCCW"===r){n=this.to.x-this.from.x,o=this.from.y-this.to.y;var m=Math.sqrt(n*n+o*o),v=Math.PI,g=(Math.atan2(o,n)+(.5*-i+.5)*v)%(2*v);e=this.from.x+(.5*i+.5)*m*Math.sin(g),t=this.from.y+(.5*i+.5)*m*Math.cos(g)}else{var y=void 0,_=void 0;y=_=n<=o?i*o:i*n,this.from.x>this.to.x&&(y=-y),this.from.y>=this.to.y&&(_=-_),e=this.from.x+y,t=this.from.y+_,n<=o?e=this.from.x<=this.to.x?this.to.x<e?this.to.x:e:this.to.x>e?this.to.x:e:t=this.from.y>=this.to.y?this.to.y>t?this.to.y:t:this.to.y<t?this.to.y:t}return{x:e,y:t}}},{key:"_findBorderPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return this._findBorderPositionBezier(e,t,i.via)}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){var a=arguments.length>6&&void 0!==arguments[6]?arguments[6]:this._getViaCoordinates();return this._getDistanceToBezierEdge(e,t,i,r,n,o,a)}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._getViaCoordinates(),i=e;return{x:Math.pow(1-i,2)*this.fromPoint.x+2*i*(1-i)*t.x+Math.pow(i,2)*this.toPoint.x,y:Math.pow(1-i,2)*this.fromPoint.y+2*i*(1-i)*t.y+Math.pow(i,2)*this.toPoint.y}}}]),t}(l(i(75)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_line",value:function(e,t){e.beginPath(),e.moveTo(this.fromPoint.x,this.fromPoint.y),e.lineTo(this.toPoint.x,this.toPoint.y),this.enableShadow(e,t),e.stroke(),this.disableShadow(e,t)}},{key:"getViaNode",value:function(){}},{key:"getPoint",value:function(e){return{x:(1-e)*this.fromPoint.x+e*this.toPoint.x,y:(1-e)*this.fromPoint.y+e*this.toPoint.y}}},{key:"_findBorderPosition",value:function(e,t){var i=this.to,r=this.from;e.id===this.from.id&&(i=this.from,r=this.to);var n=Math.atan2(i.y-r.y,i.x-r.x),o=i.x-r.x,a=i.y-r.y,s=Math.sqrt(o*o+a*a),l=(s-e.distanceToBorder(t,n))/s,u={};return u.x=(1-l)*r.x+l*i.x,u.y=(1-l)*r.y+l*i.y,u}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){return this._getDistanceToLine(e,t,i,r,n,o)}}]),t}(l(i(118)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(8)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=i(120).default,l=i(221).default,u=i(222).default,h=i(223).default,c=i(224).default,d=i(121).default,p=i(225).default,f=i(226).default,m=i(2),v=i(119).default,g=function(){function e(t){(0,n.default)(this,e),this.body=t,this.physicsBody={physicsNodeIndices:[],physicsEdgeIndices:[],forces:{},velocities:{}},this.physicsEnabled=!0,this.simulationInterval=1e3/60,this.requiresTimeout=!0,this.previousStates={},this.referenceState={},this.freezeCache={},this.renderTimer=void 0,this.adaptiveTimestep=!1,this.adaptiveTimestepEnabled=!1,this.adaptiveCounter=0,this.adaptiveInterval=3,this.stabilized=!1,this.startedStabilization=!1,this.stabilizationIterations=0,this.ready=!1,this.options={},this.defaultOptions={enabled:!0,barnesHut:{theta:.5,gravitationalConstant:-2e3,centralGravity:.3,springLength:95,springConstant:.04,damping:.09,avoidOverlap:0},forceAtlas2Based:{theta:.5,gravitationalConstant:-50,centralGravity:.01,springConstant:.08,springLength:100,damping:.4,avoidOverlap:0},repulsion:{centralGravity:.2,springLength:200,springConstant:.05,nodeDistance:100,damping:.09,avoidOverlap:0},hierarchicalRepulsion:{centralGravity:0,springLength:100,springConstant:.01,nodeDistance:120,damping:.09},maxVelocity:50,minVelocity:.75,solver:"barnesHut",stabilization:{enabled:!0,iterations:1e3,updateInterval:50,onlyDynamicEdges:!1,fit:!0},timestep:.5,adaptiveTimestep:!0},m.extend(this.options,this.defaultOptions),this.timestep=.5,this.layoutFailed=!1,this.bindEventListeners()}return(0,o.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("initPhysics",function(){e.initPhysics()}),this.body.emitter.on("_layoutFailed",function(){e.layoutFailed=!0}),this.body.emitter.on("resetPhysics",function(){e.stopSimulation(),e.ready=!1}),this.body.emitter.on("disablePhysics",function(){e.physicsEnabled=!1,e.stopSimulation()}),this.body.emitter.on("restorePhysics",function(){e.setOptions(e.options),!0===e.ready&&e.startSimulation()}),this.body.emitter.on("startSimulation",function(){!0===e.ready&&e.startSimulation()}),this.body.emitter.on("stopSimulation",function(){e.stopSimulation()}),this.body.emitter.on("destroy",function(){e.stopSimulation(!1),e.body.emitter.off()}),this.body.emitter.on("_dataChanged",function(){e.updatePhysicsData()})}},{key:"setOptions",value:function(e){void 0!==e&&(!1===e?(this.options.enabled=!1,this.physicsEnabled=!1,this.stopSimulation()):!0===e?(this.options.enabled=!0,this.physicsEnabled=!0,this.startSimulation()):(this.physicsEnabled=!0,m.selectiveNotDeepExtend(["stabilization"],this.options,e),m.mergeOptions(this.options,e,"stabilization"),void 0===e.enabled&&(this.options.enabled=!0),!1===this.options.enabled&&(this.physicsEnabled=!1,this.stopSimulation()),this.timestep=this.options.timestep)),this.init()}},{key:"init",value:function(){var e;"forceAtlas2Based"===this.options.solver?(e=this.options.forceAtlas2Based,this.nodesSolver=new p(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new f(this.body,this.physicsBody,e)):"repulsion"===this.options.solver?(e=this.options.repulsion,this.nodesSolver=new l(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)):"hierarchicalRepulsion"===this.options.solver?(e=this.options.hierarchicalRepulsion,this.nodesSolver=new u(this.body,this.physicsBody,e),this.edgesSolver=new c(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)):(e=this.options.barnesHut,this.nodesSolver=new s(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)),this.modelOptions=e}},{key:"initPhysics",value:function(){!0===this.physicsEnabled&&!0===this.options.enabled?!0===this.options.stabilization.enabled?this.stabilize():(this.stabilized=!1,this.ready=!0,this.body.emitter.emit("fit",{},this.layoutFailed),this.startSimulation()):(this.ready=!0,this.body.emitter.emit("fit"))}},{key:"startSimulation",value:function(){!0===this.physicsEnabled&&!0===this.options.enabled?(this.stabilized=!1,this.adaptiveTimestep=!1,this.body.emitter.emit("_resizeNodes"),void 0===this.viewFunction&&(this.viewFunction=this.simulationStep.bind(this),this.body.emitter.on("initRedraw",this.viewFunction),this.body.emitter.emit("_startRendering"))):this.body.emitter.emit("_redraw")}},{key:"stopSimulation",value:function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];this.stabilized=!0,!0===e&&this._emitStabilized(),void 0!==this.viewFunction&&(this.body.emitter.off("initRedraw",this.viewFunction),this.viewFunction=void 0,!0===e&&this.body.emitter.emit("_stopRendering"))}},{key:"simulationStep",value:function(){var e=Date.now();this.physicsTick(),(Date.now()-e<.4*this.simulationInterval||!0===this.runDoubleSpeed)&&!1===this.stabilized&&(this.physicsTick(),this.runDoubleSpeed=!0),!0===this.stabilized&&this.stopSimulation()}},{key:"_emitStabilized",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.stabilizationIterations;(this.stabilizationIterations>1||!0===this.startedStabilization)&&setTimeout(function(){e.body.emitter.emit("stabilized",{iterations:t}),e.startedStabilization=!1,e.stabilizationIterations=0},0)}},{key:"physicsStep",value:function(){this.gravitySolver.solve(),this.nodesSolver.solve(),this.edgesSolver.solve(),this.moveNodes()}},{key:"adjustTimeStep",value:function(){!0===this._evaluateStepQuality()?this.timestep=1.2*this.timestep:this.timestep/1.2<this.options.timestep?this.timestep=this.options.timestep:(this.adaptiveCounter=-1,this.timestep=Math.max(this.options.timestep,this.timestep/1.2))}},{key:"physicsTick",value:function(){if(this._startStabilizing(),!0!==this.stabilized){if(!0===this.adaptiveTimestep&&!0===this.adaptiveTimestepEnabled)this.adaptiveCounter%this.adaptiveInterval==0?(this.timestep=2*this.timestep,this.physicsStep(),this.revert(),this.timestep=.5*this.timestep,this.physicsStep(),this.physicsStep(),this.adjustTimeStep()):this.physicsStep(),this.adaptiveCounter+=1;else this.timestep=this.options.timestep,this.physicsStep();!0===this.stabilized&&this.revert(),this.stabilizationIterations++}}},{key:"updatePhysicsData",value:function(){this.physicsBody.forces={},this.physicsBody.physicsNodeIndices=[],this.physicsBody.physicsEdgeIndices=[];var e=this.body.nodes,t=this.body.edges;for(var i in e)e.hasOwnProperty(i)&&!0===e[i].options.physics&&this.physicsBody.physicsNodeIndices.push(e[i].id);for(var r in t)t.hasOwnProperty(r)&&!0===t[r].options.physics&&this.physicsBody.physicsEdgeIndices.push(t[r].id);for(var n=0;n<this.physicsBody.physicsNodeIndices.length;n++){var o=this.physicsBody.physicsNodeIndices[n];this.physicsBody.forces[o]={x:0,y:0},void 0===this.physicsBody.velocities[o]&&(this.physicsBody.velocities[o]={x:0,y:0})}for(var a in this.physicsBody.velocities)void 0===e[a]&&delete this.physicsBody.velocities[a]}},{key:"revert",value:function(){var e=(0,r.default)(this.previousStates),t=this.body.nodes,i=this.physicsBody.velocities;this.referenceState={};for(var n=0;n<e.length;n++){var o=e[n];void 0!==t[o]?!0===t[o].options.physics&&(this.referenceState[o]={positions:{x:t[o].x,y:t[o].y}},i[o].x=this.previousStates[o].vx,i[o].y=this.previousStates[o].vy,t[o].x=this.previousStates[o].x,t[o].y=this.previousStates[o].y):delete this.previousStates[o]}}},{key:"_evaluateStepQuality",value:function(){var e=void 0,t=void 0,i=this.body.nodes,r=this.referenceState;for(var n in this.referenceState)if(this.referenceState.hasOwnProperty(n)&&void 0!==i[n]&&(e=i[n].x-r[n].positions.x,t=i[n].y-r[n].positions.y,Math.sqrt(Math.pow(e,2)+Math.pow(t,2))>.3))return!1;return!0}},{key:"moveNodes",value:function(){for(var e=this.physicsBody.physicsNodeIndices,t=0,i=0,r=0;r<e.length;r++){var n=e[r],o=this._performStep(n);t=Math.max(t,o),i+=o}this.adaptiveTimestepEnabled=i/e.length<5,this.stabilized=t<this.options.minVelocity}},{key:"calculateComponentVelocity",value:function(e,t,i){e+=(t-this.modelOptions.damping*e)/i*this.timestep;var r=this.options.maxVelocity||1e9;return Math.abs(e)>r&&(e=e>0?r:-r),e}},{key:"_performStep",value:function(e){var t=this.body.nodes[e],i=this.physicsBody.forces[e],r=this.physicsBody.velocities[e];return this.previousStates[e]={x:t.x,y:t.y,vx:r.x,vy:r.y},!1===t.options.fixed.x?(r.x=this.calculateComponentVelocity(r.x,i.x,t.options.mass),t.x+=r.x*this.timestep):(i.x=0,r.x=0),!1===t.options.fixed.y?(r.y=this.calculateComponentVelocity(r.y,i.y,t.options.mass),t.y+=r.y*this.timestep):(i.y=0,r.y=0),Math.sqrt(Math.pow(r.x,2)+Math.pow(r.y,2))}},{key:"_freezeNodes",value:function(){var e=this.body.nodes;for(var t in e)if(e.hasOwnProperty(t)&&e[t].x&&e[t].y){var i=e[t].options.fixed;this.freezeCache[t]={x:i.x,y:i.y},i.x=!0,i.y=!0}}},{key:"_restoreFrozenNodes",value:function(){var e=this.body.nodes;for(var t in e)e.hasOwnProperty(t)&&void 0!==this.freezeCache[t]&&(e[t].options.fixed.x=this.freezeCache[t].x,e[t].options.fixed.y=this.freezeCache[t].y);this.freezeCache={}}},{key:"stabilize",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.options.stabilization.iterations;"number"!=typeof t&&(t=this.options.stabilization.iterations,console.log("The stabilize method needs a numeric amount of iterations. Switching to default: ",t)),0!==this.physicsBody.physicsNodeIndices.length?(this.adaptiveTimestep=this.options.adaptiveTimestep,this.body.emitter.emit("_resizeNodes"),this.stopSimulation(),this.stabilized=!1,this.body.emitter.emit("_blockRedraw"),this.targetIterations=t,!0===this.options.stabilization.onlyDynamicEdges&&this._freezeNodes(),this.stabilizationIterations=0,setTimeout(function(){return e._stabilizationBatch()},0)):this.ready=!0}},{key:"_startStabilizing",value:function(){return!0!==this.startedStabilization&&(this.body.emitter.emit("startStabilizing"),this.startedStabilization=!0,!0)}},{key:"_stabilizationBatch",value:function(){var e=this,t=function(){return!1===e.stabilized&&e.stabilizationIterations<e.targetIterations},i=function(){e.body.emitter.emit("stabilizationProgress",{iterations:e.stabilizationIterations,total:e.targetIterations})};this._startStabilizing()&&i();for(var r=0;t()&&r<this.options.stabilization.updateInterval;)this.physicsTick(),r++;i(),t()?setTimeout(this._stabilizationBatch.bind(this),0):this._finalizeStabilization()}},{key:"_finalizeStabilization",value:function(){this.body.emitter.emit("_allowRedraw"),!0===this.options.stabilization.fit&&this.body.emitter.emit("fit"),!0===this.options.stabilization.onlyDynamicEdges&&this._restoreFrozenNodes(),this.body.emitter.emit("stabilizationIterationsDone"),this.body.emitter.emit("_requestRedraw"),!0===this.stabilized?this._emitStabilized():this.startSimulation(),this.ready=!0}},{key:"_drawForces",value:function(e){for(var t=0;t<this.physicsBody.physicsNodeIndices.length;t++){var i=this.physicsBody.physicsNodeIndices[t],r=this.body.nodes[i],n=this.physicsBody.forces[i],o=Math.sqrt(Math.pow(n.x,2)+Math.pow(n.x,2)),a=Math.min(Math.max(5,o),15),s=3*a,l=m.HSVToHex((180-180*Math.min(1,Math.max(0,.03*o)))/360,1,1),u={x:r.x+20*n.x,y:r.y+20*n.y};e.lineWidth=a,e.strokeStyle=l,e.beginPath(),e.moveTo(r.x,r.y),e.lineTo(u.x,u.y),e.stroke();var h=Math.atan2(n.y,n.x);e.fillStyle=l,v.draw(e,{type:"arrow",point:u,angle:h,length:s}),e.fill()}}}]),e}();t.default=g},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e,t,i,r,n,o,a,s,l=this.body.nodes,u=this.physicsBody.physicsNodeIndices,h=this.physicsBody.forces,c=this.options.nodeDistance,d=-2/3/c,p=0;p<u.length-1;p++){a=l[u[p]];for(var f=p+1;f<u.length;f++)e=(s=l[u[f]]).x-a.x,t=s.y-a.y,0===(i=Math.sqrt(e*e+t*t))&&(e=i=.1*Math.random()),i<2*c&&(o=i<.5*c?1:d*i+4/3,r=e*(o/=i),n=t*o,h[a.id].x-=r,h[a.id].y-=n,h[s.id].x+=r,h[s.id].y+=n)}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){var e,t,i,r,n,o,a,s,l,u,h=this.body.nodes,c=this.physicsBody.physicsNodeIndices,d=this.physicsBody.forces,p=this.options.nodeDistance;for(l=0;l<c.length-1;l++)for(a=h[c[l]],u=l+1;u<c.length;u++)if(s=h[c[u]],a.level===s.level){e=s.x-a.x,t=s.y-a.y;o=(i=Math.sqrt(e*e+t*t))<p?-Math.pow(.05*i,2)+Math.pow(.05*p,2):0,0===i?i=.01:o/=i,r=e*o,n=t*o,d[a.id].x-=r,d[a.id].y-=n,d[s.id].x+=r,d[s.id].y+=n}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e=void 0,t=void 0,i=this.physicsBody.physicsEdgeIndices,r=this.body.edges,n=void 0,o=void 0,a=void 0,s=0;s<i.length;s++)!0===(t=r[i[s]]).connected&&t.toId!==t.fromId&&void 0!==this.body.nodes[t.toId]&&void 0!==this.body.nodes[t.fromId]&&(void 0!==t.edgeType.via?(e=void 0===t.options.length?this.options.springLength:t.options.length,n=t.to,o=t.edgeType.via,a=t.from,this._calculateSpringForce(n,o,.5*e),this._calculateSpringForce(o,a,.5*e)):(e=void 0===t.options.length?1.5*this.options.springLength:t.options.length,this._calculateSpringForce(t.from,t.to,e)))}},{key:"_calculateSpringForce",value:function(e,t,i){var r=e.x-t.x,n=e.y-t.y,o=Math.max(Math.sqrt(r*r+n*n),.01),a=this.options.springConstant*(i-o)/o,s=r*a,l=n*a;void 0!==this.physicsBody.forces[e.id]&&(this.physicsBody.forces[e.id].x+=s,this.physicsBody.forces[e.id].y+=l),void 0!==this.physicsBody.forces[t.id]&&(this.physicsBody.forces[t.id].x-=s,this.physicsBody.forces[t.id].y-=l)}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e,t,i,r,n,o,a,s,l,u,h=this.body.edges,c=this.physicsBody.physicsEdgeIndices,d=this.physicsBody.physicsNodeIndices,p=this.physicsBody.forces,f=0;f<d.length;f++){var m=d[f];p[m].springFx=0,p[m].springFy=0}for(var v=0;v<c.length;v++)!0===(t=h[c[v]]).connected&&(e=void 0===t.options.length?this.options.springLength:t.options.length,i=t.from.x-t.to.x,r=t.from.y-t.to.y,s=0===(s=Math.sqrt(i*i+r*r))?.01:s,n=i*(a=this.options.springConstant*(e-s)/s),o=r*a,t.to.level!=t.from.level?(void 0!==p[t.toId]&&(p[t.toId].springFx-=n,p[t.toId].springFy-=o),void 0!==p[t.fromId]&&(p[t.fromId].springFx+=n,p[t.fromId].springFy+=o)):(void 0!==p[t.toId]&&(p[t.toId].x-=.5*n,p[t.toId].y-=.5*o),void 0!==p[t.fromId]&&(p[t.fromId].x+=.5*n,p[t.fromId].y+=.5*o)));a=1;for(var g=0;g<d.length;g++){var y=d[g];l=Math.min(a,Math.max(-a,p[y].springFx)),u=Math.min(a,Math.max(-a,p[y].springFy)),p[y].x+=l,p[y].y+=u}for(var _=0,b=0,x=0;x<d.length;x++){var w=d[x];_+=p[w].x,b+=p[w].y}for(var S=_/d.length,M=b/d.length,T=0;T<d.length;T++){var A=d[T];p[A].x-=S,p[A].y-=M}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_calculateForces",value:function(e,t,i,r,n){0===e&&(t=e=.1*Math.random()),this.overlapAvoidanceFactor<1&&r.shape.radius&&(e=Math.max(.1+this.overlapAvoidanceFactor*r.shape.radius,e-r.shape.radius));var o=r.edges.length+1,a=this.options.gravitationalConstant*n.mass*r.options.mass*o/Math.pow(e,2),s=t*a,l=i*a;this.physicsBody.forces[r.id].x+=s,this.physicsBody.forces[r.id].y+=l}}]),t}(l(i(120)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_calculateForces",value:function(e,t,i,r,n){if(e>0){var o=n.edges.length+1,a=this.options.centralGravity*o*n.options.mass;r[n.id].x=t*a,r[n.id].y=i*a}}}]),t}(l(i(121)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=s(i(8)),n=s(i(6)),o=s(i(0)),a=s(i(1));function s(e){return e&&e.__esModule?e:{default:e}}var l=i(2),u=i(76).default,h=i(228).default,c=i(74).default,d=i(47).default,p=function(){function e(t){var i=this;(0,o.default)(this,e),this.body=t,this.clusteredNodes={},this.clusteredEdges={},this.options={},this.defaultOptions={},l.extend(this.options,this.defaultOptions),this.body.emitter.on("_resetData",function(){i.clusteredNodes={},i.clusteredEdges={}})}return(0,a.default)(e,[{key:"clusterByHubsize",value:function(e,t){void 0===e?e=this._getHubSize():"object"===(void 0===e?"undefined":(0,n.default)(e))&&(t=this._checkOptions(e),e=this._getHubSize());for(var i=[],r=0;r<this.body.nodeIndices.length;r++){var o=this.body.nodes[this.body.nodeIndices[r]];o.edges.length>=e&&i.push(o.id)}for(var a=0;a<i.length;a++)this.clusterByConnection(i[a],t,!0);this.body.emitter.emit("_dataChanged")}},{key:"cluster",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},i=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(void 0===t.joinCondition)throw new Error("Cannot call clusterByNodeData without a joinCondition function in the options.");t=this._checkOptions(t);var r={},n={};l.forEach(this.body.nodes,function(i,o){var a=u.cloneOptions(i);!0===t.joinCondition(a)&&(r[o]=i,l.forEach(i.edges,function(t){void 0===e.clusteredEdges[t.id]&&(n[t.id]=t)}))}),this._cluster(r,n,t,i)}},{key:"clusterByEdgeCount",value:function(e,t){var i=this,n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];t=this._checkOptions(t);for(var o=[],a={},s=void 0,l=void 0,h=void 0,c=function(n){var c={},d={},m=i.body.nodeIndices[n],v=i.body.nodes[m];if(void 0===a[m]){h=0,l=[];for(var g=0;g<v.edges.length;g++)s=v.edges[g],void 0===i.clusteredEdges[s.id]&&(s.toId!==s.fromId&&h++,l.push(s));if(h===e){p=function(e){if(void 0===t.joinCondition||null===t.joinCondition)return!0;var i=u.cloneOptions(e);return t.joinCondition(i)};for(var y=!0,_=0;_<l.length;_++){s=l[_];var b=i._getConnectedId(s,m);if(!p(v)){y=!1;break}d[s.id]=s,c[m]=v,c[b]=i.body.nodes[b],a[m]=!0}if((0,r.default)(c).length>0&&(0,r.default)(d).length>0&&!0===y)if(void 0!==(f=function(){for(var e=0;e<o.length;++e)for(var t in c)if(void 0!==o[e].nodes[t])return o[e]}())){for(var x in c)void 0===f.nodes[x]&&(f.nodes[x]=c[x]);for(var w in d)void 0===f.edges[w]&&(f.edges[w]=d[w])}else o.push({nodes:c,edges:d})}}},d=0;d<this.body.nodeIndices.length;d++){var p,f;c(d)}for(d=0;d<o.length;d++)this._cluster(o[d].nodes,o[d].edges,t,!1);!0===n&&this.body.emitter.emit("_dataChanged")}},{key:"clusterOutliers",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.clusterByEdgeCount(1,e,t)}},{key:"clusterBridges",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.clusterByEdgeCount(2,e,t)}},{key:"clusterByConnection",value:function(e,t){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(void 0===e)throw new Error("No nodeId supplied to clusterByConnection!");if(void 0===this.body.nodes[e])throw new Error("The nodeId given to clusterByConnection does not exist!");var n=this.body.nodes[e];void 0===(t=this._checkOptions(t,n)).clusterNodeProperties.x&&(t.clusterNodeProperties.x=n.x),void 0===t.clusterNodeProperties.y&&(t.clusterNodeProperties.y=n.y),void 0===t.clusterNodeProperties.fixed&&(t.clusterNodeProperties.fixed={},t.clusterNodeProperties.fixed.x=n.options.fixed.x,t.clusterNodeProperties.fixed.y=n.options.fixed.y);var o={},a={},s=n.id,l=u.cloneOptions(n);o[s]=n;for(var h=0;h<n.edges.length;h++){var c=n.edges[h];if(void 0===this.clusteredEdges[c.id]){var d=this._getConnectedId(c,s);if(void 0===this.clusteredNodes[d])if(d!==s)if(void 0===t.joinCondition)a[c.id]=c,o[d]=this.body.nodes[d];else{var p=u.cloneOptions(this.body.nodes[d]);!0===t.joinCondition(l,p)&&(a[c.id]=c,o[d]=this.body.nodes[d])}else a[c.id]=c}}var f=(0,r.default)(o).map(function(e){return o[e].id});for(m in o)if(o.hasOwnProperty(m))for(var m=o[m],v=0;v<m.edges.length;v++){var g=m.edges[v];f.indexOf(this._getConnectedId(g,m.id))>-1&&(a[g.id]=g)}this._cluster(o,a,t,i)}},{key:"_createClusterEdges",value:function(e,t,i,n){for(var o=void 0,a=void 0,s=void 0,l=void 0,u=void 0,h=void 0,c=(0,r.default)(e),d=[],p=0;p<c.length;p++){s=e[a=c[p]];for(var f=0;f<s.edges.length;f++)o=s.edges[f],void 0===this.clusteredEdges[o.id]&&(o.toId==o.fromId?t[o.id]=o:o.toId==a?(l=i.id,h=u=o.fromId):(l=o.toId,u=i.id,h=l),void 0===e[h]&&d.push({edge:o,fromId:u,toId:l}))}for(var m=[],v=function(e){for(var t=0;t<m.length;t++){var i=m[t],r=e.fromId===i.fromId&&e.toId===i.toId,n=e.fromId===i.toId&&e.toId===i.fromId;if(r||n)return i}return null},g=0;g<d.length;g++){var y=d[g],_=y.edge,b=v(y);null===b?(b=this._createClusteredEdge(y.fromId,y.toId,_,n),m.push(b)):b.clusteringEdgeReplacingIds.push(_.id),this.body.edges[_.id].edgeReplacedById=b.id,this._backupEdgeOptions(_),_.setOptions({physics:!1})}}},{key:"_checkOptions",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return void 0===e.clusterEdgeProperties&&(e.clusterEdgeProperties={}),void 0===e.clusterNodeProperties&&(e.clusterNodeProperties={}),e}},{key:"_cluster",value:function(e,t,i){var n=!(arguments.length>3&&void 0!==arguments[3])||arguments[3],o=[];for(var a in e)e.hasOwnProperty(a)&&void 0!==this.clusteredNodes[a]&&o.push(a);for(var s=0;s<o.length;++s)delete e[o[s]];if(0!=(0,r.default)(e).length&&(1!=(0,r.default)(e).length||1==i.clusterNodeProperties.allowSingleNodeCluster)){var c=l.deepExtend({},i.clusterNodeProperties);if(void 0!==i.processProperties){var d=[];for(var p in e)if(e.hasOwnProperty(p)){var f=u.cloneOptions(e[p]);d.push(f)}var m=[];for(var v in t)if(t.hasOwnProperty(v)&&"clusterEdge:"!==v.substr(0,12)){var g=u.cloneOptions(t[v],"edge");m.push(g)}if(!(c=i.processProperties(c,d,m)))throw new Error("The processProperties function does not return properties!")}void 0===c.id&&(c.id="cluster:"+l.randomUUID());var y=c.id;void 0===c.label&&(c.label="cluster");var _=void 0;void 0===c.x&&(_=this._getClusterPosition(e),c.x=_.x),void 0===c.y&&(void 0===_&&(_=this._getClusterPosition(e)),c.y=_.y),c.id=y;var b=this.body.functions.createNode(c,h);b.containedNodes=e,b.containedEdges=t,b.clusterEdgeProperties=i.clusterEdgeProperties,this.body.nodes[c.id]=b,this._clusterEdges(e,t,c,i.clusterEdgeProperties),c.id=void 0,!0===n&&this.body.emitter.emit("_dataChanged")}}},{key:"_backupEdgeOptions",value:function(e){void 0===this.clusteredEdges[e.id]&&(this.clusteredEdges[e.id]={physics:e.options.physics})}},{key:"_restoreEdge",value:function(e){var t=this.clusteredEdges[e.id];void 0!==t&&(e.setOptions({physics:t.physics}),delete this.clusteredEdges[e.id])}},{key:"isCluster",value:function(e){return void 0!==this.body.nodes[e]?!0===this.body.nodes[e].isCluster:(console.log("Node does not exist."),!1)}},{key:"_getClusterPosition",value:function(e){for(var t=(0,r.default)(e),i=e[t[0]].x,n=e[t[0]].x,o=e[t[0]].y,a=e[t[0]].y,s=void 0,l=1;l<t.length;l++)i=(s=e[t[l]]).x<i?s.x:i,n=s.x>n?s.x:n,o=s.y<o?s.y:o,a=s.y>a?s.y:a;return{x:.5*(i+n),y:.5*(o+a)}}},{key:"openCluster",value:function(e,t){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(void 0===e)throw new Error("No clusterNodeId supplied to openCluster.");var r=this.body.nodes[e];if(void 0===r)throw new Error("The clusterNodeId supplied to openCluster does not exist.");if(!0!==r.isCluster||void 0===r.containedNodes||void 0===r.containedEdges)throw new Error("The node:"+e+" is not a valid cluster.");var n=this.findNode(e),o=n.indexOf(e)-1;if(o>=0){var a=n[o];return this.body.nodes[a]._openChildCluster(e),delete this.body.nodes[e],void(!0===i&&this.body.emitter.emit("_dataChanged"))}var s=r.containedNodes,u=r.containedEdges;if(void 0!==t&&void 0!==t.releaseFunction&&"function"==typeof t.releaseFunction){var h={},c={x:r.x,y:r.y};for(var d in s)if(s.hasOwnProperty(d)){var p=this.body.nodes[d];h[d]={x:p.x,y:p.y}}var f=t.releaseFunction(c,h);for(var m in s)if(s.hasOwnProperty(m)){var v=this.body.nodes[m];void 0!==f[m]&&(v.x=void 0===f[m].x?r.x:f[m].x,v.y=void 0===f[m].y?r.y:f[m].y)}}else l.forEach(s,function(e){!1===e.options.fixed.x&&(e.x=r.x),!1===e.options.fixed.y&&(e.y=r.y)});for(var g in s)if(s.hasOwnProperty(g)){var y=this.body.nodes[g];y.vx=r.vx,y.vy=r.vy,y.setOptions({physics:!0}),delete this.clusteredNodes[g]}for(var _=[],b=0;b<r.edges.length;b++)_.push(r.edges[b]);for(var x=0;x<_.length;x++){for(var w=_[x],S=this._getConnectedId(w,e),M=this.clusteredNodes[S],T=0;T<w.clusteringEdgeReplacingIds.length;T++){var A=w.clusteringEdgeReplacingIds[T],C=this.body.edges[A];if(void 0!==C)if(void 0!==M){var L=this.body.nodes[M.clusterId];L.containedEdges[C.id]=C,delete u[C.id];var N=C.fromId,k=C.toId;C.toId==S?k=M.clusterId:N=M.clusterId,this._createClusteredEdge(N,k,C,L.clusterEdgeProperties,{hidden:!1,physics:!0})}else this._restoreEdge(C)}w.remove()}for(var P in u)u.hasOwnProperty(P)&&this._restoreEdge(u[P]);delete this.body.nodes[e],!0===i&&this.body.emitter.emit("_dataChanged")}},{key:"getNodesInCluster",value:function(e){var t=[];if(!0===this.isCluster(e)){var i=this.body.nodes[e].containedNodes;for(var r in i)i.hasOwnProperty(r)&&t.push(this.body.nodes[r].id)}return t}},{key:"findNode",value:function(e){for(var t=[],i=0,r=void 0;void 0!==this.clusteredNodes[e]&&i<100;){if(void 0===(r=this.body.nodes[e]))return[];t.push(r.id),e=this.clusteredNodes[e].clusterId,i++}return void 0===(r=this.body.nodes[e])?[]:(t.push(r.id),t.reverse(),t)}},{key:"updateClusteredNode",value:function(e,t){if(void 0===e)throw new Error("No clusteredNodeId supplied to updateClusteredNode.");if(void 0===t)throw new Error("No newOptions supplied to updateClusteredNode.");if(void 0===this.body.nodes[e])throw new Error("The clusteredNodeId supplied to updateClusteredNode does not exist.");this.body.nodes[e].setOptions(t),this.body.emitter.emit("_dataChanged")}},{key:"updateEdge",value:function(e,t){if(void 0===e)throw new Error("No startEdgeId supplied to updateEdge.");if(void 0===t)throw new Error("No newOptions supplied to updateEdge.");if(void 0===this.body.edges[e])throw new Error("The startEdgeId supplied to updateEdge does not exist.");for(var i=this.getClusteredEdges(e),r=0;r<i.length;r++){this.body.edges[i[r]].setOptions(t)}this.body.emitter.emit("_dataChanged")}},{key:"getClusteredEdges",value:function(e){for(var t=[],i=0;void 0!==e&&void 0!==this.body.edges[e]&&i<100;)t.push(this.body.edges[e].id),e=this.body.edges[e].edgeReplacedById,i++;return t.reverse(),t}},{key:"getBaseEdge",value:function(e){return this.getBaseEdges(e)[0]}},{key:"getBaseEdges",value:function(e){for(var t=[e],i=[],r=[],n=0;t.length>0&&n<100;){var o=t.pop();if(void 0!==o){var a=this.body.edges[o];if(void 0!==a){n++;var s=a.clusteringEdgeReplacingIds;if(void 0===s)r.push(o);else for(var l=0;l<s.length;++l){var u=s[l];-1===t.indexOf(s)&&-1===i.indexOf(s)&&t.push(u)}i.push(o)}}}return r}},{key:"_getConnectedId",value:function(e,t){return e.toId!=t?e.toId:(e.fromId,e.fromId)}},{key:"_getHubSize",value:function(){for(var e=0,t=0,i=0,r=0,n=0;n<this.body.nodeIndices.length;n++){var o=this.body.nodes[this.body.nodeIndices[n]];o.edges.length>r&&(r=o.edges.length),e+=o.edges.length,t+=Math.pow(o.edges.length,2),i+=1}e/=i;var a=(t/=i)-Math.pow(e,2),s=Math.sqrt(a),l=Math.floor(e+2*s);return l>r&&(l=r),l}},{key:"_createClusteredEdge",value:function(e,t,i,r,n){var o=u.cloneOptions(i,"edge");l.deepExtend(o,r),o.from=e,o.to=t,o.id="clusterEdge:"+l.randomUUID(),void 0!==n&&l.deepExtend(o,n);var a=this.body.functions.createEdge(o);return a.clusteringEdgeReplacingIds=[i.id],a.connect(),this.body.edges[a.id]=a,a}},{key:"_clusterEdges",value:function(e,t,i,r){if(t instanceof c){var n=t,o={};o[n.id]=n,t=o}if(e instanceof d){var a=e,s={};s[a.id]=a,e=s}if(null==i)throw new Error("_clusterEdges: parameter clusterNode required");for(var l in void 0===r&&(r=i.clusterEdgeProperties),this._createClusterEdges(e,t,i,r),t)if(t.hasOwnProperty(l)&&void 0!==this.body.edges[l]){var u=this.body.edges[l];this._backupEdgeOptions(u),u.setOptions({physics:!1})}for(var h in e)e.hasOwnProperty(h)&&(this.clusteredNodes[h]={clusterId:i.id,node:this.body.nodes[h]},this.body.nodes[h].setOptions({physics:!1}))}},{key:"_getClusterNodeForNode",value:function(e){if(void 0!==e){var t=this.clusteredNodes[e];if(void 0!==t){var i=t.clusterId;if(void 0!==i)return this.body.nodes[i]}}}},{key:"_filter",value:function(e,t){var i=[];return l.forEach(e,function(e){t(e)&&i.push(e)}),i}},{key:"_updateState",value:function(){var e=this,t=void 0,i=[],n=[],o=function(t){l.forEach(e.body.nodes,function(e){!0===e.isCluster&&t(e)})};for(t in this.clusteredNodes){if(this.clusteredNodes.hasOwnProperty(t))void 0===this.body.nodes[t]&&i.push(t)}o(function(e){for(var t=0;t<i.length;t++)delete e.containedNodes[i[t]]});for(var a=0;a<i.length;a++)delete this.clusteredNodes[i[a]];l.forEach(this.clusteredEdges,function(t){var i=e.body.edges[t];void 0!==i&&i.endPointsValid()||n.push(t)}),o(function(e){l.forEach(e.containedEdges,function(e,t){e.endPointsValid()||-1!==n.indexOf(t)||n.push(t)})}),l.forEach(this.body.edges,function(t,i){var r=!0,o=t.clusteringEdgeReplacingIds;if(void 0!==o){var a=0;l.forEach(o,function(t){var i=e.body.edges[t];void 0!==i&&i.endPointsValid()&&(a+=1)}),r=a>0}t.endPointsValid()&&r||n.push(i)}),o(function(t){l.forEach(n,function(i){delete t.containedEdges[i],l.forEach(t.edges,function(r,o){r.id!==i?r.clusteringEdgeReplacingIds=e._filter(r.clusteringEdgeReplacingIds,function(e){return-1===n.indexOf(e)}):t.edges[o]=null}),t.edges=e._filter(t.edges,function(e){return null!==e})})}),l.forEach(n,function(t){delete e.clusteredEdges[t]}),l.forEach(n,function(t){delete e.body.edges[t]});var s=(0,r.default)(this.body.edges);l.forEach(s,function(t){var i=e.body.edges[t],r=e._isClusteredNode(i.fromId)||e._isClusteredNode(i.toId);if(r!==e._isClusteredEdge(i.id)){if(!r)throw new Error("remove edge from clustering not implemented!");var n=e._getClusterNodeForNode(i.fromId);void 0!==n&&e._clusterEdges(e.body.nodes[i.fromId],i,n);var o=e._getClusterNodeForNode(i.toId);void 0!==o&&e._clusterEdges(e.body.nodes[i.toId],i,o)}});for(var u=!1,h=!0,c=function(){var t=[];o(function(e){var i=(0,r.default)(e.containedNodes).length,n=!0===e.options.allowSingleNodeCluster;(n&&i<1||!n&&i<2)&&t.push(e.id)});for(var i=0;i<t.length;++i)e.openCluster(t[i],{},!1);h=t.length>0,u=u||h};h;)c();u&&this._updateState()}},{key:"_isClusteredNode",value:function(e){return void 0!==this.clusteredNodes[e]}},{key:"_isClusteredEdge",value:function(e){return void 0!==this.clusteredEdges[e]}}]),e}();t.default=p},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=function(e){function t(e,i,o,s,l,u){(0,n.default)(this,t);var h=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o,s,l,u));return h.isCluster=!0,h.containedNodes={},h.containedEdges={},h}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_openChildCluster",value:function(e){var t=this,i=this.body.nodes[e];if(void 0===this.containedNodes[e])throw new Error("node with id: "+e+" not in current cluster");if(!i.isCluster)throw new Error("node with id: "+e+" is not a cluster");delete this.containedNodes[e],u.forEach(i.edges,function(e){delete t.containedEdges[e.id]}),u.forEach(i.containedNodes,function(e,i){t.containedNodes[i]=e}),i.containedNodes={},u.forEach(i.containedEdges,function(e,i){t.containedEdges[i]=e}),i.containedEdges={},u.forEach(i.edges,function(e){u.forEach(t.edges,function(i){var r=i.clusteringEdgeReplacingIds.indexOf(e.id);-1!==r&&(u.forEach(e.clusteringEdgeReplacingIds,function(e){i.clusteringEdgeReplacingIds.push(e),t.body.edges[e].edgeReplacedById=i.id}),i.clusteringEdgeReplacingIds.splice(r,1))})}),i.edges=[]}}]),t}(i(47).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=function(){function e(t,i){var n;(0,r.default)(this,e),void 0!==window&&(n=window.requestAnimationFrame||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame||window.msRequestAnimationFrame),window.requestAnimationFrame=void 0===n?function(e){e()}:n,this.body=t,this.canvas=i,this.redrawRequested=!1,this.renderTimer=void 0,this.requiresTimeout=!0,this.renderingActive=!1,this.renderRequests=0,this.allowRedraw=!0,this.dragging=!1,this.options={},this.defaultOptions={hideEdgesOnDrag:!1,hideNodesOnDrag:!1},a.extend(this.options,this.defaultOptions),this._determineBrowserMethod(),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("dragStart",function(){e.dragging=!0}),this.body.emitter.on("dragEnd",function(){e.dragging=!1}),this.body.emitter.on("_resizeNodes",function(){e._resizeNodes()}),this.body.emitter.on("_redraw",function(){!1===e.renderingActive&&e._redraw()}),this.body.emitter.on("_blockRedraw",function(){e.allowRedraw=!1}),this.body.emitter.on("_allowRedraw",function(){e.allowRedraw=!0,e.redrawRequested=!1}),this.body.emitter.on("_requestRedraw",this._requestRedraw.bind(this)),this.body.emitter.on("_startRendering",function(){e.renderRequests+=1,e.renderingActive=!0,e._startRendering()}),this.body.emitter.on("_stopRendering",function(){e.renderRequests-=1,e.renderingActive=e.renderRequests>0,e.renderTimer=void 0}),this.body.emitter.on("destroy",function(){e.renderRequests=0,e.allowRedraw=!1,e.renderingActive=!1,!0===e.requiresTimeout?clearTimeout(e.renderTimer):window.cancelAnimationFrame(e.renderTimer),e.body.emitter.off()})}},{key:"setOptions",value:function(e){if(void 0!==e){a.selectiveDeepExtend(["hideEdgesOnDrag","hideNodesOnDrag"],this.options,e)}}},{key:"_requestNextFrame",value:function(e,t){if("undefined"!=typeof window){var i=void 0,r=window;return!0===this.requiresTimeout?i=r.setTimeout(e,t):r.requestAnimationFrame&&(i=r.requestAnimationFrame(e)),i}}},{key:"_startRendering",value:function(){!0===this.renderingActive&&void 0===this.renderTimer&&(this.renderTimer=this._requestNextFrame(this._renderStep.bind(this),this.simulationInterval))}},{key:"_renderStep",value:function(){!0===this.renderingActive&&(this.renderTimer=void 0,!0===this.requiresTimeout&&this._startRendering(),this._redraw(),!1===this.requiresTimeout&&this._startRendering())}},{key:"redraw",value:function(){this.body.emitter.emit("setSize"),this._redraw()}},{key:"_requestRedraw",value:function(){var e=this;!0!==this.redrawRequested&&!1===this.renderingActive&&!0===this.allowRedraw&&(this.redrawRequested=!0,this._requestNextFrame(function(){e._redraw(!1)},0))}},{key:"_redraw",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(!0===this.allowRedraw){this.body.emitter.emit("initRedraw"),this.redrawRequested=!1,0!==this.canvas.frame.canvas.width&&0!==this.canvas.frame.canvas.height||this.canvas.setSize(),this.canvas.setTransform();var t=this.canvas.getContext(),i=this.canvas.frame.canvas.clientWidth,r=this.canvas.frame.canvas.clientHeight;if(t.clearRect(0,0,i,r),0===this.canvas.frame.clientWidth)return;t.save(),t.translate(this.body.view.translation.x,this.body.view.translation.y),t.scale(this.body.view.scale,this.body.view.scale),t.beginPath(),this.body.emitter.emit("beforeDrawing",t),t.closePath(),!1===e&&(!1===this.dragging||!0===this.dragging&&!1===this.options.hideEdgesOnDrag)&&this._drawEdges(t),(!1===this.dragging||!0===this.dragging&&!1===this.options.hideNodesOnDrag)&&this._drawNodes(t,e),t.beginPath(),this.body.emitter.emit("afterDrawing",t),t.closePath(),t.restore(),!0===e&&t.clearRect(0,0,i,r)}}},{key:"_resizeNodes",value:function(){this.canvas.setTransform();var e=this.canvas.getContext();e.save(),e.translate(this.body.view.translation.x,this.body.view.translation.y),e.scale(this.body.view.scale,this.body.view.scale);var t=this.body.nodes,i=void 0;for(var r in t)t.hasOwnProperty(r)&&((i=t[r]).resize(e),i.updateBoundingBox(e,i.selected));e.restore()}},{key:"_drawNodes",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.nodes,r=this.body.nodeIndices,n=void 0,o=[],a=this.canvas.DOMtoCanvas({x:-20,y:-20}),s=this.canvas.DOMtoCanvas({x:this.canvas.frame.canvas.clientWidth+20,y:this.canvas.frame.canvas.clientHeight+20}),l={top:a.y,left:a.x,bottom:s.y,right:s.x},u=0;u<r.length;u++)(n=i[r[u]]).isSelected()?o.push(r[u]):!0===t?n.draw(e):!0===n.isBoundingBoxOverlappingWith(l)?n.draw(e):n.updateBoundingBox(e,n.selected);for(var h=0;h<o.length;h++)(n=i[o[h]]).draw(e)}},{key:"_drawEdges",value:function(e){for(var t=this.body.edges,i=this.body.edgeIndices,r=void 0,n=0;n<i.length;n++)!0===(r=t[i[n]]).connected&&r.draw(e)}},{key:"_determineBrowserMethod",value:function(){if("undefined"!=typeof window){var e=navigator.userAgent.toLowerCase();this.requiresTimeout=!1,-1!=e.indexOf("msie 9.0")?this.requiresTimeout=!0:-1!=e.indexOf("safari")&&e.indexOf("chrome")<=-1&&(this.requiresTimeout=!0)}else this.requiresTimeout=!0}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(10),s=i(37),l=i(2),u=function(){function e(t){(0,r.default)(this,e),this.body=t,this.pixelRatio=1,this.resizeTimer=void 0,this.resizeFunction=this._onResize.bind(this),this.cameraState={},this.initialized=!1,this.canvasViewCenter={},this.options={},this.defaultOptions={autoResize:!0,height:"100%",width:"100%"},l.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.once("resize",function(t){0!==t.width&&(e.body.view.translation.x=.5*t.width),0!==t.height&&(e.body.view.translation.y=.5*t.height)}),this.body.emitter.on("setSize",this.setSize.bind(this)),this.body.emitter.on("destroy",function(){e.hammerFrame.destroy(),e.hammer.destroy(),e._cleanUp()})}},{key:"setOptions",value:function(e){var t=this;if(void 0!==e){l.selectiveDeepExtend(["width","height","autoResize"],this.options,e)}!0===this.options.autoResize&&(this._cleanUp(),this.resizeTimer=setInterval(function(){!0===t.setSize()&&t.body.emitter.emit("_requestRedraw")},1e3),this.resizeFunction=this._onResize.bind(this),l.addEventListener(window,"resize",this.resizeFunction))}},{key:"_cleanUp",value:function(){void 0!==this.resizeTimer&&clearInterval(this.resizeTimer),l.removeEventListener(window,"resize",this.resizeFunction),this.resizeFunction=void 0}},{key:"_onResize",value:function(){this.setSize(),this.body.emitter.emit("_redraw")}},{key:"_getCameraState",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.pixelRatio;!0===this.initialized&&(this.cameraState.previousWidth=this.frame.canvas.width/e,this.cameraState.previousHeight=this.frame.canvas.height/e,this.cameraState.scale=this.body.view.scale,this.cameraState.position=this.DOMtoCanvas({x:.5*this.frame.canvas.width/e,y:.5*this.frame.canvas.height/e}))}},{key:"_setCameraState",value:function(){if(void 0!==this.cameraState.scale&&0!==this.frame.canvas.clientWidth&&0!==this.frame.canvas.clientHeight&&0!==this.pixelRatio&&this.cameraState.previousWidth>0){var e=this.frame.canvas.width/this.pixelRatio/this.cameraState.previousWidth,t=this.frame.canvas.height/this.pixelRatio/this.cameraState.previousHeight,i=this.cameraState.scale;1!=e&&1!=t?i=.5*this.cameraState.scale*(e+t):1!=e?i=this.cameraState.scale*e:1!=t&&(i=this.cameraState.scale*t),this.body.view.scale=i;var r=this.DOMtoCanvas({x:.5*this.frame.canvas.clientWidth,y:.5*this.frame.canvas.clientHeight}),n={x:r.x-this.cameraState.position.x,y:r.y-this.cameraState.position.y};this.body.view.translation.x+=n.x*this.body.view.scale,this.body.view.translation.y+=n.y*this.body.view.scale}}},{key:"_prepareValue",value:function(e){if("number"==typeof e)return e+"px";if("string"==typeof e){if(-1!==e.indexOf("%")||-1!==e.indexOf("px"))return e;if(-1===e.indexOf("%"))return e+"px"}throw new Error("Could not use the value supplied for width or height:"+e)}},{key:"_create",value:function(){for(;this.body.container.hasChildNodes();)this.body.container.removeChild(this.body.container.firstChild);if(this.frame=document.createElement("div"),this.frame.className="vis-network",this.frame.style.position="relative",this.frame.style.overflow="hidden",this.frame.tabIndex=900,this.frame.canvas=document.createElement("canvas"),this.frame.canvas.style.position="relative",this.frame.appendChild(this.frame.canvas),this.frame.canvas.getContext)this._setPixelRatio(),this.setTransform();else{var e=document.createElement("DIV");e.style.color="red",e.style.fontWeight="bold",e.style.padding="10px",e.innerHTML="Error: your browser does not support HTML canvas",this.frame.canvas.appendChild(e)}this.body.container.appendChild(this.frame),this.body.view.scale=1,this.body.view.translation={x:.5*this.frame.canvas.clientWidth,y:.5*this.frame.canvas.clientHeight},this._bindHammer()}},{key:"_bindHammer",value:function(){var e=this;void 0!==this.hammer&&this.hammer.destroy(),this.drag={},this.pinch={},this.hammer=new a(this.frame.canvas),this.hammer.get("pinch").set({enable:!0}),this.hammer.get("pan").set({threshold:5,direction:a.DIRECTION_ALL}),s.onTouch(this.hammer,function(t){e.body.eventListeners.onTouch(t)}),this.hammer.on("tap",function(t){e.body.eventListeners.onTap(t)}),this.hammer.on("doubletap",function(t){e.body.eventListeners.onDoubleTap(t)}),this.hammer.on("press",function(t){e.body.eventListeners.onHold(t)}),this.hammer.on("panstart",function(t){e.body.eventListeners.onDragStart(t)}),this.hammer.on("panmove",function(t){e.body.eventListeners.onDrag(t)}),this.hammer.on("panend",function(t){e.body.eventListeners.onDragEnd(t)}),this.hammer.on("pinch",function(t){e.body.eventListeners.onPinch(t)}),this.frame.canvas.addEventListener("mousewheel",function(t){e.body.eventListeners.onMouseWheel(t)}),this.frame.canvas.addEventListener("DOMMouseScroll",function(t){e.body.eventListeners.onMouseWheel(t)}),this.frame.canvas.addEventListener("mousemove",function(t){e.body.eventListeners.onMouseMove(t)}),this.frame.canvas.addEventListener("contextmenu",function(t){e.body.eventListeners.onContext(t)}),this.hammerFrame=new a(this.frame),s.onRelease(this.hammerFrame,function(t){e.body.eventListeners.onRelease(t)})}},{key:"setSize",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.options.width,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.options.height;e=this._prepareValue(e),t=this._prepareValue(t);var i=!1,r=this.frame.canvas.width,n=this.frame.canvas.height,o=this.pixelRatio;if(this._setPixelRatio(),e!=this.options.width||t!=this.options.height||this.frame.style.width!=e||this.frame.style.height!=t)this._getCameraState(o),this.frame.style.width=e,this.frame.style.height=t,this.frame.canvas.style.width="100%",this.frame.canvas.style.height="100%",this.frame.canvas.width=Math.round(this.frame.canvas.clientWidth*this.pixelRatio),this.frame.canvas.height=Math.round(this.frame.canvas.clientHeight*this.pixelRatio),this.options.width=e,this.options.height=t,this.canvasViewCenter={x:.5*this.frame.clientWidth,y:.5*this.frame.clientHeight},i=!0;else{var a=Math.round(this.frame.canvas.clientWidth*this.pixelRatio),s=Math.round(this.frame.canvas.clientHeight*this.pixelRatio);this.frame.canvas.width===a&&this.frame.canvas.height===s||this._getCameraState(o),this.frame.canvas.width!==a&&(this.frame.canvas.width=a,i=!0),this.frame.canvas.height!==s&&(this.frame.canvas.height=s,i=!0)}return!0===i&&(this.body.emitter.emit("resize",{width:Math.round(this.frame.canvas.width/this.pixelRatio),height:Math.round(this.frame.canvas.height/this.pixelRatio),oldWidth:Math.round(r/this.pixelRatio),oldHeight:Math.round(n/this.pixelRatio)}),this._setCameraState()),this.initialized=!0,i}},{key:"getContext",value:function(){return this.frame.canvas.getContext("2d")}},{key:"_determinePixelRatio",value:function(){var e=this.getContext();if(void 0===e)throw new Error("Could not get canvax context");var t=1;return"undefined"!=typeof window&&(t=window.devicePixelRatio||1),t/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1)}},{key:"_setPixelRatio",value:function(){this.pixelRatio=this._determinePixelRatio()}},{key:"setTransform",value:function(){var e=this.getContext();if(void 0===e)throw new Error("Could not get canvax context");e.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0)}},{key:"_XconvertDOMtoCanvas",value:function(e){return(e-this.body.view.translation.x)/this.body.view.scale}},{key:"_XconvertCanvasToDOM",value:function(e){return e*this.body.view.scale+this.body.view.translation.x}},{key:"_YconvertDOMtoCanvas",value:function(e){return(e-this.body.view.translation.y)/this.body.view.scale}},{key:"_YconvertCanvasToDOM",value:function(e){return e*this.body.view.scale+this.body.view.translation.y}},{key:"canvasToDOM",value:function(e){return{x:this._XconvertCanvasToDOM(e.x),y:this._YconvertCanvasToDOM(e.y)}}},{key:"DOMtoCanvas",value:function(e){return{x:this._XconvertDOMtoCanvas(e.x),y:this._YconvertDOMtoCanvas(e.y)}}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(76).default,l=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.animationSpeed=1/this.renderRefreshRate,this.animationEasingFunction="easeInOutQuint",this.easingTime=0,this.sourceScale=0,this.targetScale=0,this.sourceTranslation=0,this.targetTranslation=0,this.lockedOnNodeId=void 0,this.lockedOnNodeOffset=void 0,this.touchTime=0,this.viewFunction=void 0,this.body.emitter.on("fit",this.fit.bind(this)),this.body.emitter.on("animationFinished",function(){n.body.emitter.emit("_stopRendering")}),this.body.emitter.on("unlockNode",this.releaseNode.bind(this))}return(0,n.default)(e,[{key:"setOptions",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};this.options=e}},{key:"fit",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{nodes:[]},t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=void 0,r=void 0;if(void 0!==e.nodes&&0!==e.nodes.length||(e.nodes=this.body.nodeIndices),!0===t){var n=0;for(var o in this.body.nodes){if(this.body.nodes.hasOwnProperty(o))!0===this.body.nodes[o].predefinedPosition&&(n+=1)}if(n>.5*this.body.nodeIndices.length)return void this.fit(e,!1);i=s.getRange(this.body.nodes,e.nodes),r=12.662/(this.body.nodeIndices.length+7.4147)+.0964822,r*=Math.min(this.canvas.frame.canvas.clientWidth/600,this.canvas.frame.canvas.clientHeight/600)}else{this.body.emitter.emit("_resizeNodes"),i=s.getRange(this.body.nodes,e.nodes);var a=1.1*Math.abs(i.maxX-i.minX),l=1.1*Math.abs(i.maxY-i.minY),u=this.canvas.frame.canvas.clientWidth/a,h=this.canvas.frame.canvas.clientHeight/l;r=u<=h?u:h}r>1?r=1:0===r&&(r=1);var c={position:s.findCenter(i),scale:r,animation:e.animation};this.moveTo(c)}},{key:"focus",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(void 0!==this.body.nodes[e]){var i={x:this.body.nodes[e].x,y:this.body.nodes[e].y};t.position=i,t.lockedOnNode=e,this.moveTo(t)}else console.log("Node: "+e+" cannot be found.")}},{key:"moveTo",value:function(e){void 0!==e?(void 0===e.offset&&(e.offset={x:0,y:0}),void 0===e.offset.x&&(e.offset.x=0),void 0===e.offset.y&&(e.offset.y=0),void 0===e.scale&&(e.scale=this.body.view.scale),void 0===e.position&&(e.position=this.getViewPosition()),void 0===e.animation&&(e.animation={duration:0}),!1===e.animation&&(e.animation={duration:0}),!0===e.animation&&(e.animation={}),void 0===e.animation.duration&&(e.animation.duration=1e3),void 0===e.animation.easingFunction&&(e.animation.easingFunction="easeInOutQuad"),this.animateView(e)):e={}}},{key:"animateView",value:function(e){if(void 0!==e){this.animationEasingFunction=e.animation.easingFunction,this.releaseNode(),!0===e.locked&&(this.lockedOnNodeId=e.lockedOnNode,this.lockedOnNodeOffset=e.offset),0!=this.easingTime&&this._transitionRedraw(!0),this.sourceScale=this.body.view.scale,this.sourceTranslation=this.body.view.translation,this.targetScale=e.scale,this.body.view.scale=this.targetScale;var t=this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight}),i=t.x-e.position.x,r=t.y-e.position.y;this.targetTranslation={x:this.sourceTranslation.x+i*this.targetScale+e.offset.x,y:this.sourceTranslation.y+r*this.targetScale+e.offset.y},0===e.animation.duration?null!=this.lockedOnNodeId?(this.viewFunction=this._lockedRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction)):(this.body.view.scale=this.targetScale,this.body.view.translation=this.targetTranslation,this.body.emitter.emit("_requestRedraw")):(this.animationSpeed=1/(60*e.animation.duration*.001)||1/60,this.animationEasingFunction=e.animation.easingFunction,this.viewFunction=this._transitionRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction),this.body.emitter.emit("_startRendering"))}}},{key:"_lockedRedraw",value:function(){var e=this.body.nodes[this.lockedOnNodeId].x,t=this.body.nodes[this.lockedOnNodeId].y,i=this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight}),r=i.x-e,n=i.y-t,o=this.body.view.translation,a={x:o.x+r*this.body.view.scale+this.lockedOnNodeOffset.x,y:o.y+n*this.body.view.scale+this.lockedOnNodeOffset.y};this.body.view.translation=a}},{key:"releaseNode",value:function(){void 0!==this.lockedOnNodeId&&void 0!==this.viewFunction&&(this.body.emitter.off("initRedraw",this.viewFunction),this.lockedOnNodeId=void 0,this.lockedOnNodeOffset=void 0)}},{key:"_transitionRedraw",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.easingTime+=this.animationSpeed,this.easingTime=!0===e?1:this.easingTime;var t=a.easingFunctions[this.animationEasingFunction](this.easingTime);this.body.view.scale=this.sourceScale+(this.targetScale-this.sourceScale)*t,this.body.view.translation={x:this.sourceTranslation.x+(this.targetTranslation.x-this.sourceTranslation.x)*t,y:this.sourceTranslation.y+(this.targetTranslation.y-this.sourceTranslation.y)*t},this.easingTime>=1&&(this.body.emitter.off("initRedraw",this.viewFunction),this.easingTime=0,null!=this.lockedOnNodeId&&(this.viewFunction=this._lockedRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction)),this.body.emitter.emit("animationFinished"))}},{key:"getScale",value:function(){return this.body.view.scale}},{key:"getViewPosition",value:function(){return this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight})}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(233).default,l=i(104).default,u=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.canvas=i,this.selectionHandler=n,this.navigationHandler=new s(t,i),this.body.eventListeners.onTap=this.onTap.bind(this),this.body.eventListeners.onTouch=this.onTouch.bind(this),this.body.eventListeners.onDoubleTap=this.onDoubleTap.bind(this),this.body.eventListeners.onHold=this.onHold.bind(this),this.body.eventListeners.onDragStart=this.onDragStart.bind(this),this.body.eventListeners.onDrag=this.onDrag.bind(this),this.body.eventListeners.onDragEnd=this.onDragEnd.bind(this),this.body.eventListeners.onMouseWheel=this.onMouseWheel.bind(this),this.body.eventListeners.onPinch=this.onPinch.bind(this),this.body.eventListeners.onMouseMove=this.onMouseMove.bind(this),this.body.eventListeners.onRelease=this.onRelease.bind(this),this.body.eventListeners.onContext=this.onContext.bind(this),this.touchTime=0,this.drag={},this.pinch={},this.popup=void 0,this.popupObj=void 0,this.popupTimer=void 0,this.body.functions.getPointer=this.getPointer.bind(this),this.options={},this.defaultOptions={dragNodes:!0,dragView:!0,hover:!1,keyboard:{enabled:!1,speed:{x:10,y:10,zoom:.02},bindToWindow:!0},navigationButtons:!1,tooltipDelay:300,zoomView:!0},a.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("destroy",function(){clearTimeout(e.popupTimer),delete e.body.functions.getPointer})}},{key:"setOptions",value:function(e){if(void 0!==e){a.selectiveNotDeepExtend(["hideEdgesOnDrag","hideNodesOnDrag","keyboard","multiselect","selectable","selectConnectedEdges"],this.options,e),a.mergeOptions(this.options,e,"keyboard"),e.tooltip&&(a.extend(this.options.tooltip,e.tooltip),e.tooltip.color&&(this.options.tooltip.color=a.parseColor(e.tooltip.color)))}this.navigationHandler.setOptions(this.options)}},{key:"getPointer",value:function(e){return{x:e.x-a.getAbsoluteLeft(this.canvas.frame.canvas),y:e.y-a.getAbsoluteTop(this.canvas.frame.canvas)}}},{key:"onTouch",value:function(e){(new Date).valueOf()-this.touchTime>50&&(this.drag.pointer=this.getPointer(e.center),this.drag.pinched=!1,this.pinch.scale=this.body.view.scale,this.touchTime=(new Date).valueOf())}},{key:"onTap",value:function(e){var t=this.getPointer(e.center),i=this.selectionHandler.options.multiselect&&(e.changedPointers[0].ctrlKey||e.changedPointers[0].metaKey);this.checkSelectionChanges(t,e,i),this.selectionHandler._generateClickEvent("click",e,t)}},{key:"onDoubleTap",value:function(e){var t=this.getPointer(e.center);this.selectionHandler._generateClickEvent("doubleClick",e,t)}},{key:"onHold",value:function(e){var t=this.getPointer(e.center),i=this.selectionHandler.options.multiselect;this.checkSelectionChanges(t,e,i),this.selectionHandler._generateClickEvent("click",e,t),this.selectionHandler._generateClickEvent("hold",e,t)}},{key:"onRelease",value:function(e){if((new Date).valueOf()-this.touchTime>10){var t=this.getPointer(e.center);this.selectionHandler._generateClickEvent("release",e,t),this.touchTime=(new Date).valueOf()}}},{key:"onContext",value:function(e){var t=this.getPointer({x:e.clientX,y:e.clientY});this.selectionHandler._generateClickEvent("oncontext",e,t)}},{key:"checkSelectionChanges",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=this.selectionHandler.getSelection(),n=!1;n=!0===i?this.selectionHandler.selectAdditionalOnPoint(e):this.selectionHandler.selectOnPoint(e);var o=this.selectionHandler.getSelection(),a=this._determineDifference(r,o),s=this._determineDifference(o,r);a.edges.length>0&&(this.selectionHandler._generateClickEvent("deselectEdge",t,e,r),n=!0),a.nodes.length>0&&(this.selectionHandler._generateClickEvent("deselectNode",t,e,r),n=!0),s.nodes.length>0&&(this.selectionHandler._generateClickEvent("selectNode",t,e),n=!0),s.edges.length>0&&(this.selectionHandler._generateClickEvent("selectEdge",t,e),n=!0),!0===n&&this.selectionHandler._generateClickEvent("select",t,e)}},{key:"_determineDifference",value:function(e,t){var i=function(e,t){for(var i=[],r=0;r<e.length;r++){var n=e[r];-1===t.indexOf(n)&&i.push(n)}return i};return{nodes:i(e.nodes,t.nodes),edges:i(e.edges,t.edges)}}},{key:"onDragStart",value:function(e){void 0===this.drag.pointer&&this.onTouch(e);var t=this.selectionHandler.getNodeAt(this.drag.pointer);if(this.drag.dragging=!0,this.drag.selection=[],this.drag.translation=a.extend({},this.body.view.translation),this.drag.nodeId=void 0,void 0!==t&&!0===this.options.dragNodes){this.drag.nodeId=t.id,!1===t.isSelected()&&(this.selectionHandler.unselectAll(),this.selectionHandler.selectObject(t)),this.selectionHandler._generateClickEvent("dragStart",e,this.drag.pointer);var i=this.selectionHandler.selectionObj.nodes;for(var r in i)if(i.hasOwnProperty(r)){var n=i[r],o={id:n.id,node:n,x:n.x,y:n.y,xFixed:n.options.fixed.x,yFixed:n.options.fixed.y};n.options.fixed.x=!0,n.options.fixed.y=!0,this.drag.selection.push(o)}}else this.selectionHandler._generateClickEvent("dragStart",e,this.drag.pointer,void 0,!0)}},{key:"onDrag",value:function(e){var t=this;if(!0!==this.drag.pinched){this.body.emitter.emit("unlockNode");var i=this.getPointer(e.center),r=this.drag.selection;if(r&&r.length&&!0===this.options.dragNodes){this.selectionHandler._generateClickEvent("dragging",e,i);var n=i.x-this.drag.pointer.x,o=i.y-this.drag.pointer.y;r.forEach(function(e){var i=e.node;!1===e.xFixed&&(i.x=t.canvas._XconvertDOMtoCanvas(t.canvas._XconvertCanvasToDOM(e.x)+n)),!1===e.yFixed&&(i.y=t.canvas._YconvertDOMtoCanvas(t.canvas._YconvertCanvasToDOM(e.y)+o))}),this.body.emitter.emit("startSimulation")}else if(!0===this.options.dragView){if(this.selectionHandler._generateClickEvent("dragging",e,i,void 0,!0),void 0===this.drag.pointer)return void this.onDragStart(e);var a=i.x-this.drag.pointer.x,s=i.y-this.drag.pointer.y;this.body.view.translation={x:this.drag.translation.x+a,y:this.drag.translation.y+s},this.body.emitter.emit("_requestRedraw")}}}},{key:"onDragEnd",value:function(e){this.drag.dragging=!1;var t=this.drag.selection;t&&t.length?(t.forEach(function(e){e.node.options.fixed.x=e.xFixed,e.node.options.fixed.y=e.yFixed}),this.selectionHandler._generateClickEvent("dragEnd",e,this.getPointer(e.center)),this.body.emitter.emit("startSimulation")):(this.selectionHandler._generateClickEvent("dragEnd",e,this.getPointer(e.center),void 0,!0),this.body.emitter.emit("_requestRedraw"))}},{key:"onPinch",value:function(e){var t=this.getPointer(e.center);this.drag.pinched=!0,void 0===this.pinch.scale&&(this.pinch.scale=1);var i=this.pinch.scale*e.scale;this.zoom(i,t)}},{key:"zoom",value:function(e,t){if(!0===this.options.zoomView){var i=this.body.view.scale;e<1e-5&&(e=1e-5),e>10&&(e=10);var r=void 0;void 0!==this.drag&&!0===this.drag.dragging&&(r=this.canvas.DOMtoCanvas(this.drag.pointer));var n=this.body.view.translation,o=e/i,a=(1-o)*t.x+n.x*o,s=(1-o)*t.y+n.y*o;if(this.body.view.scale=e,this.body.view.translation={x:a,y:s},null!=r){var l=this.canvas.canvasToDOM(r);this.drag.pointer.x=l.x,this.drag.pointer.y=l.y}this.body.emitter.emit("_requestRedraw"),i<e?this.body.emitter.emit("zoom",{direction:"+",scale:this.body.view.scale,pointer:t}):this.body.emitter.emit("zoom",{direction:"-",scale:this.body.view.scale,pointer:t})}}},{key:"onMouseWheel",value:function(e){if(!0===this.options.zoomView){var t=0;if(e.wheelDelta?t=e.wheelDelta/120:e.detail&&(t=-e.detail/3),0!==t){var i=this.body.view.scale,r=t/10;t<0&&(r/=1-r),i*=1+r;var n=this.getPointer({x:e.clientX,y:e.clientY});this.zoom(i,n)}e.preventDefault()}}},{key:"onMouseMove",value:function(e){var t=this,i=this.getPointer({x:e.clientX,y:e.clientY}),r=!1;void 0!==this.popup&&(!1===this.popup.hidden&&this._checkHidePopup(i),!1===this.popup.hidden&&(r=!0,this.popup.setPosition(i.x+3,i.y-5),this.popup.show())),!1===this.options.keyboard.bindToWindow&&!0===this.options.keyboard.enabled&&this.canvas.frame.focus(),!1===r&&(void 0!==this.popupTimer&&(clearInterval(this.popupTimer),this.popupTimer=void 0),this.drag.dragging||(this.popupTimer=setTimeout(function(){return t._checkShowPopup(i)},this.options.tooltipDelay))),!0===this.options.hover&&this.selectionHandler.hoverObject(e,i)}},{key:"_checkShowPopup",value:function(e){var t=this.canvas._XconvertDOMtoCanvas(e.x),i=this.canvas._YconvertDOMtoCanvas(e.y),r={left:t,top:i,right:t,bottom:i},n=void 0===this.popupObj?void 0:this.popupObj.id,o=!1,a="node";if(void 0===this.popupObj){for(var s=this.body.nodeIndices,u=this.body.nodes,h=void 0,c=[],d=0;d<s.length;d++)!0===(h=u[s[d]]).isOverlappingWith(r)&&void 0!==h.getTitle()&&c.push(s[d]);c.length>0&&(this.popupObj=u[c[c.length-1]],o=!0)}if(void 0===this.popupObj&&!1===o){for(var p=this.body.edgeIndices,f=this.body.edges,m=void 0,v=[],g=0;g<p.length;g++)!0===(m=f[p[g]]).isOverlappingWith(r)&&!0===m.connected&&void 0!==m.getTitle()&&v.push(p[g]);v.length>0&&(this.popupObj=f[v[v.length-1]],a="edge")}void 0!==this.popupObj?this.popupObj.id!==n&&(void 0===this.popup&&(this.popup=new l(this.canvas.frame)),this.popup.popupTargetType=a,this.popup.popupTargetId=this.popupObj.id,this.popup.setPosition(e.x+3,e.y-5),this.popup.setText(this.popupObj.getTitle()),this.popup.show(),this.body.emitter.emit("showPopup",this.popupObj.id)):void 0!==this.popup&&(this.popup.hide(),this.body.emitter.emit("hidePopup"))}},{key:"_checkHidePopup",value:function(e){var t=this.selectionHandler._pointerToPositionObject(e),i=!1;if("node"===this.popup.popupTargetType){if(void 0!==this.body.nodes[this.popup.popupTargetId]&&!0===(i=this.body.nodes[this.popup.popupTargetId].isOverlappingWith(t))){var r=this.selectionHandler.getNodeAt(e);i=void 0!==r&&r.id===this.popup.popupTargetId}}else void 0===this.selectionHandler.getNodeAt(e)&&void 0!==this.body.edges[this.popup.popupTargetId]&&(i=this.body.edges[this.popup.popupTargetId].isOverlappingWith(t));!1===i&&(this.popupObj=void 0,this.popup.hide(),this.body.emitter.emit("hidePopup"))}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(10),s=i(37),l=i(35),u=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.iconsCreated=!1,this.navigationHammers=[],this.boundFunctions={},this.touchTime=0,this.activated=!1,this.body.emitter.on("activate",function(){n.activated=!0,n.configureKeyboardBindings()}),this.body.emitter.on("deactivate",function(){n.activated=!1,n.configureKeyboardBindings()}),this.body.emitter.on("destroy",function(){void 0!==n.keycharm&&n.keycharm.destroy()}),this.options={}}return(0,n.default)(e,[{key:"setOptions",value:function(e){void 0!==e&&(this.options=e,this.create())}},{key:"create",value:function(){!0===this.options.navigationButtons?!1===this.iconsCreated&&this.loadNavigationElements():!0===this.iconsCreated&&this.cleanNavigation(),this.configureKeyboardBindings()}},{key:"cleanNavigation",value:function(){if(0!=this.navigationHammers.length){for(var e=0;e<this.navigationHammers.length;e++)this.navigationHammers[e].destroy();this.navigationHammers=[]}this.navigationDOM&&this.navigationDOM.wrapper&&this.navigationDOM.wrapper.parentNode&&this.navigationDOM.wrapper.parentNode.removeChild(this.navigationDOM.wrapper),this.iconsCreated=!1}},{key:"loadNavigationElements",value:function(){var e=this;this.cleanNavigation(),this.navigationDOM={};var t=["up","down","left","right","zoomIn","zoomOut","zoomExtends"],i=["_moveUp","_moveDown","_moveLeft","_moveRight","_zoomIn","_zoomOut","_fit"];this.navigationDOM.wrapper=document.createElement("div"),this.navigationDOM.wrapper.className="vis-navigation",this.canvas.frame.appendChild(this.navigationDOM.wrapper);for(var r=0;r<t.length;r++){this.navigationDOM[t[r]]=document.createElement("div"),this.navigationDOM[t[r]].className="vis-button vis-"+t[r],this.navigationDOM.wrapper.appendChild(this.navigationDOM[t[r]]);var n=new a(this.navigationDOM[t[r]]);"_fit"===i[r]?s.onTouch(n,this._fit.bind(this)):s.onTouch(n,this.bindToRedraw.bind(this,i[r])),this.navigationHammers.push(n)}var o=new a(this.canvas.frame);s.onRelease(o,function(){e._stopMovement()}),this.navigationHammers.push(o),this.iconsCreated=!0}},{key:"bindToRedraw",value:function(e){void 0===this.boundFunctions[e]&&(this.boundFunctions[e]=this[e].bind(this),this.body.emitter.on("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_startRendering"))}},{key:"unbindFromRedraw",value:function(e){void 0!==this.boundFunctions[e]&&(this.body.emitter.off("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_stopRendering"),delete this.boundFunctions[e])}},{key:"_fit",value:function(){(new Date).valueOf()-this.touchTime>700&&(this.body.emitter.emit("fit",{duration:700}),this.touchTime=(new Date).valueOf())}},{key:"_stopMovement",value:function(){for(var e in this.boundFunctions)this.boundFunctions.hasOwnProperty(e)&&(this.body.emitter.off("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_stopRendering"));this.boundFunctions={}}},{key:"_moveUp",value:function(){this.body.view.translation.y+=this.options.keyboard.speed.y}},{key:"_moveDown",value:function(){this.body.view.translation.y-=this.options.keyboard.speed.y}},{key:"_moveLeft",value:function(){this.body.view.translation.x+=this.options.keyboard.speed.x}},{key:"_moveRight",value:function(){this.body.view.translation.x-=this.options.keyboard.speed.x}},{key:"_zoomIn",value:function(){var e=this.body.view.scale,t=this.body.view.scale*(1+this.options.keyboard.speed.zoom),i=this.body.view.translation,r=t/e,n=(1-r)*this.canvas.canvasViewCenter.x+i.x*r,o=(1-r)*this.canvas.canvasViewCenter.y+i.y*r;this.body.view.scale=t,this.body.view.translation={x:n,y:o},this.body.emitter.emit("zoom",{direction:"+",scale:this.body.view.scale,pointer:null})}},{key:"_zoomOut",value:function(){var e=this.body.view.scale,t=this.body.view.scale/(1+this.options.keyboard.speed.zoom),i=this.body.view.translation,r=t/e,n=(1-r)*this.canvas.canvasViewCenter.x+i.x*r,o=(1-r)*this.canvas.canvasViewCenter.y+i.y*r;this.body.view.scale=t,this.body.view.translation={x:n,y:o},this.body.emitter.emit("zoom",{direction:"-",scale:this.body.view.scale,pointer:null})}},{key:"configureKeyboardBindings",value:function(){var e=this;void 0!==this.keycharm&&this.keycharm.destroy(),!0===this.options.keyboard.enabled&&(!0===this.options.keyboard.bindToWindow?this.keycharm=l({container:window,preventDefault:!0}):this.keycharm=l({container:this.canvas.frame,preventDefault:!0}),this.keycharm.reset(),!0===this.activated&&(this.keycharm.bind("up",function(){e.bindToRedraw("_moveUp")},"keydown"),this.keycharm.bind("down",function(){e.bindToRedraw("_moveDown")},"keydown"),this.keycharm.bind("left",function(){e.bindToRedraw("_moveLeft")},"keydown"),this.keycharm.bind("right",function(){e.bindToRedraw("_moveRight")},"keydown"),this.keycharm.bind("=",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("num+",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("num-",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("-",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("[",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("]",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("pageup",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("pagedown",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("up",function(){e.unbindFromRedraw("_moveUp")},"keyup"),this.keycharm.bind("down",function(){e.unbindFromRedraw("_moveDown")},"keyup"),this.keycharm.bind("left",function(){e.unbindFromRedraw("_moveLeft")},"keyup"),this.keycharm.bind("right",function(){e.unbindFromRedraw("_moveRight")},"keyup"),this.keycharm.bind("=",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("num+",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("num-",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("-",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("[",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("]",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("pageup",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("pagedown",function(){e.unbindFromRedraw("_zoomOut")},"keyup")))}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(47).default,s=i(74).default,l=i(2),u=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.selectionObj={nodes:[],edges:[]},this.hoverObj={nodes:{},edges:{}},this.options={},this.defaultOptions={multiselect:!1,selectable:!0,selectConnectedEdges:!0,hoverConnectedEdges:!0},l.extend(this.options,this.defaultOptions),this.body.emitter.on("_dataChanged",function(){n.updateSelection()})}return(0,n.default)(e,[{key:"setOptions",value:function(e){if(void 0!==e){l.selectiveDeepExtend(["multiselect","hoverConnectedEdges","selectable","selectConnectedEdges"],this.options,e)}}},{key:"selectOnPoint",value:function(e){var t=!1;if(!0===this.options.selectable){var i=this.getNodeAt(e)||this.getEdgeAt(e);this.unselectAll(),void 0!==i&&(t=this.selectObject(i)),this.body.emitter.emit("_requestRedraw")}return t}},{key:"selectAdditionalOnPoint",value:function(e){var t=!1;if(!0===this.options.selectable){var i=this.getNodeAt(e)||this.getEdgeAt(e);void 0!==i&&(t=!0,!0===i.isSelected()?this.deselectObject(i):this.selectObject(i),this.body.emitter.emit("_requestRedraw"))}return t}},{key:"_initBaseEvent",value:function(e,t){var i={};return i.pointer={DOM:{x:t.x,y:t.y},canvas:this.canvas.DOMtoCanvas(t)},i.event=e,i}},{key:"_generateClickEvent",value:function(e,t,i,r){var n=arguments.length>4&&void 0!==arguments[4]&&arguments[4],o=this._initBaseEvent(t,i);if(!0===n)o.nodes=[],o.edges=[];else{var a=this.getSelection();o.nodes=a.nodes,o.edges=a.edges}void 0!==r&&(o.previousSelection=r),"click"==e&&(o.items=this.getClickedItems(i)),this.body.emitter.emit(e,o)}},{key:"selectObject",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.options.selectConnectedEdges;return void 0!==e&&(e instanceof a&&!0===t&&this._selectConnectedEdges(e),e.select(),this._addToSelection(e),!0)}},{key:"deselectObject",value:function(e){!0===e.isSelected()&&(e.selected=!1,this._removeFromSelection(e))}},{key:"_getAllNodesOverlappingWith",value:function(e){for(var t=[],i=this.body.nodes,r=0;r<this.body.nodeIndices.length;r++){var n=this.body.nodeIndices[r];i[n].isOverlappingWith(e)&&t.push(n)}return t}},{key:"_pointerToPositionObject",value:function(e){var t=this.canvas.DOMtoCanvas(e);return{left:t.x-1,top:t.y+1,right:t.x+1,bottom:t.y-1}}},{key:"getNodeAt",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this._pointerToPositionObject(e),r=this._getAllNodesOverlappingWith(i);return r.length>0?!0===t?this.body.nodes[r[r.length-1]]:r[r.length-1]:void 0}},{key:"_getEdgesOverlappingWith",value:function(e,t){for(var i=this.body.edges,r=0;r<this.body.edgeIndices.length;r++){var n=this.body.edgeIndices[r];i[n].isOverlappingWith(e)&&t.push(n)}}},{key:"_getAllEdgesOverlappingWith",value:function(e){var t=[];return this._getEdgesOverlappingWith(e,t),t}},{key:"getEdgeAt",value:function(e){for(var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this.canvas.DOMtoCanvas(e),r=10,n=null,o=this.body.edges,a=0;a<this.body.edgeIndices.length;a++){var s=this.body.edgeIndices[a],l=o[s];if(l.connected){var u=l.from.x,h=l.from.y,c=l.to.x,d=l.to.y,p=l.edgeType.getDistanceToEdge(u,h,c,d,i.x,i.y);p<r&&(n=s,r=p)}}return null!==n?!0===t?this.body.edges[n]:n:void 0}},{key:"_addToSelection",value:function(e){e instanceof a?this.selectionObj.nodes[e.id]=e:this.selectionObj.edges[e.id]=e}},{key:"_addToHover",value:function(e){e instanceof a?this.hoverObj.nodes[e.id]=e:this.hoverObj.edges[e.id]=e}},{key:"_removeFromSelection",value:function(e){e instanceof a?(delete this.selectionObj.nodes[e.id],this._unselectConnectedEdges(e)):delete this.selectionObj.edges[e.id]}},{key:"unselectAll",value:function(){for(var e in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(e)&&this.selectionObj.nodes[e].unselect();for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&this.selectionObj.edges[t].unselect();this.selectionObj={nodes:{},edges:{}}}},{key:"_getSelectedNodeCount",value:function(){var e=0;for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&(e+=1);return e}},{key:"_getSelectedNode",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e))return this.selectionObj.nodes[e]}},{key:"_getSelectedEdge",value:function(){for(var e in this.selectionObj.edges)if(this.selectionObj.edges.hasOwnProperty(e))return this.selectionObj.edges[e]}},{key:"_getSelectedEdgeCount",value:function(){var e=0;for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&(e+=1);return e}},{key:"_getSelectedObjectCount",value:function(){var e=0;for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&(e+=1);for(var i in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(i)&&(e+=1);return e}},{key:"_selectionIsEmpty",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e))return!1;for(var t in this.selectionObj.edges)if(this.selectionObj.edges.hasOwnProperty(t))return!1;return!0}},{key:"_clusterInSelection",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e)&&this.selectionObj.nodes[e].clusterSize>1)return!0;return!1}},{key:"_selectConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.select(),this._addToSelection(i)}}},{key:"_hoverConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.hover=!0,this._addToHover(i)}}},{key:"_unselectConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.unselect(),this._removeFromSelection(i)}}},{key:"emitBlurEvent",value:function(e,t,i){var r=this._initBaseEvent(e,t);!0===i.hover&&(i.hover=!1,i instanceof a?(r.node=i.id,this.body.emitter.emit("blurNode",r)):(r.edge=i.id,this.body.emitter.emit("blurEdge",r)))}},{key:"emitHoverEvent",value:function(e,t,i){var r=this._initBaseEvent(e,t),n=!1;return!1===i.hover&&(i.hover=!0,this._addToHover(i),n=!0,i instanceof a?(r.node=i.id,this.body.emitter.emit("hoverNode",r)):(r.edge=i.id,this.body.emitter.emit("hoverEdge",r))),n}},{key:"hoverObject",value:function(e,t){var i=this.getNodeAt(t);void 0===i&&(i=this.getEdgeAt(t));var r=!1;for(var n in this.hoverObj.nodes)this.hoverObj.nodes.hasOwnProperty(n)&&(void 0===i||i instanceof a&&i.id!=n||i instanceof s)&&(this.emitBlurEvent(e,t,this.hoverObj.nodes[n]),delete this.hoverObj.nodes[n],r=!0);for(var o in this.hoverObj.edges)this.hoverObj.edges.hasOwnProperty(o)&&(!0===r?(this.hoverObj.edges[o].hover=!1,delete this.hoverObj.edges[o]):(void 0===i||i instanceof s&&i.id!=o||i instanceof a&&!i.hover)&&(this.emitBlurEvent(e,t,this.hoverObj.edges[o]),delete this.hoverObj.edges[o],r=!0));void 0!==i&&(r=r||this.emitHoverEvent(e,t,i),i instanceof a&&!0===this.options.hoverConnectedEdges&&this._hoverConnectedEdges(i)),!0===r&&this.body.emitter.emit("_requestRedraw")}},{key:"getSelection",value:function(){return{nodes:this.getSelectedNodes(),edges:this.getSelectedEdges()}}},{key:"getSelectedNodes",value:function(){var e=[];if(!0===this.options.selectable)for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&e.push(this.selectionObj.nodes[t].id);return e}},{key:"getSelectedEdges",value:function(){var e=[];if(!0===this.options.selectable)for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&e.push(this.selectionObj.edges[t].id);return e}},{key:"setSelection",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=void 0,r=void 0;if(!e||!e.nodes&&!e.edges)throw"Selection must be an object with nodes and/or edges properties";if((t.unselectAll||void 0===t.unselectAll)&&this.unselectAll(),e.nodes)for(i=0;i<e.nodes.length;i++){r=e.nodes[i];var n=this.body.nodes[r];if(!n)throw new RangeError('Node with id "'+r+'" not found');this.selectObject(n,t.highlightEdges)}if(e.edges)for(i=0;i<e.edges.length;i++){r=e.edges[i];var o=this.body.edges[r];if(!o)throw new RangeError('Edge with id "'+r+'" not found');this.selectObject(o)}this.body.emitter.emit("_requestRedraw")}},{key:"selectNodes",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!e||void 0===e.length)throw"Selection must be an array with ids";this.setSelection({nodes:e},{highlightEdges:t})}},{key:"selectEdges",value:function(e){if(!e||void 0===e.length)throw"Selection must be an array with ids";this.setSelection({edges:e})}},{key:"updateSelection",value:function(){for(var e in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(e)&&(this.body.nodes.hasOwnProperty(e)||delete this.selectionObj.nodes[e]);for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&(this.body.edges.hasOwnProperty(t)||delete this.selectionObj.edges[t])}},{key:"getClickedItems",value:function(e){for(var t=this.canvas.DOMtoCanvas(e),i=[],r=this.body.nodeIndices,n=this.body.nodes,o=r.length-1;o>=0;o--){var a=n[r[o]].getItemsOnPoint(t);i.push.apply(i,a)}for(var s=this.body.edgeIndices,l=this.body.edges,u=s.length-1;u>=0;u--){var h=l[s[u]].getItemsOnPoint(t);i.push.apply(i,h)}return i}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(30)),n=l(i(6)),o=l(i(8)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=i(76).default,c=i(236),d=c.HorizontalStrategy,p=c.VerticalStrategy,f=function(){function e(){(0,a.default)(this,e),this.childrenReference={},this.parentReference={},this.trees={},this.distributionOrdering={},this.levels={},this.distributionIndex={},this.isTree=!1,this.treeIndex=-1}return(0,s.default)(e,[{key:"addRelation",value:function(e,t){void 0===this.childrenReference[e]&&(this.childrenReference[e]=[]),this.childrenReference[e].push(t),void 0===this.parentReference[t]&&(this.parentReference[t]=[]),this.parentReference[t].push(e)}},{key:"checkIfTree",value:function(){for(var e in this.parentReference)if(this.parentReference[e].length>1)return void(this.isTree=!1);this.isTree=!0}},{key:"numTrees",value:function(){return this.treeIndex+1}},{key:"setTreeIndex",value:function(e,t){void 0!==t&&void 0===this.trees[e.id]&&(this.trees[e.id]=t,this.treeIndex=Math.max(t,this.treeIndex))}},{key:"ensureLevel",value:function(e){void 0===this.levels[e]&&(this.levels[e]=0)}},{key:"getMaxLevel",value:function(e){var t=this,i={};return function e(r){if(void 0!==i[r])return i[r];var n=t.levels[r];if(t.childrenReference[r]){var o=t.childrenReference[r];if(o.length>0)for(var a=0;a<o.length;a++)n=Math.max(n,e(o[a]))}return i[r]=n,n}(e)}},{key:"levelDownstream",value:function(e,t){void 0===this.levels[t.id]&&(void 0===this.levels[e.id]&&(this.levels[e.id]=0),this.levels[t.id]=this.levels[e.id]+1)}},{key:"setMinLevelToZero",value:function(e){var t=1e9;for(var i in e)e.hasOwnProperty(i)&&void 0!==this.levels[i]&&(t=Math.min(this.levels[i],t));for(var r in e)e.hasOwnProperty(r)&&void 0!==this.levels[r]&&(this.levels[r]-=t)}},{key:"getTreeSize",value:function(e,t){var i=1e9,r=-1e9,n=1e9,o=-1e9;for(var a in this.trees)if(this.trees.hasOwnProperty(a)&&this.trees[a]===t){var s=e[a];i=Math.min(s.x,i),r=Math.max(s.x,r),n=Math.min(s.y,n),o=Math.max(s.y,o)}return{min_x:i,max_x:r,min_y:n,max_y:o}}},{key:"hasSameParent",value:function(e,t){var i=this.parentReference[e.id],r=this.parentReference[t.id];if(void 0===i||void 0===r)return!1;for(var n=0;n<i.length;n++)for(var o=0;o<r.length;o++)if(i[n]==r[o])return!0;return!1}},{key:"inSameSubNetwork",value:function(e,t){return this.trees[e.id]===this.trees[t.id]}},{key:"getLevels",value:function(){return(0,o.default)(this.distributionOrdering)}},{key:"addToOrdering",value:function(e,t){void 0===this.distributionOrdering[t]&&(this.distributionOrdering[t]=[]);var i=!1,r=this.distributionOrdering[t];for(var n in r)if(r[n]===e){i=!0;break}i||(this.distributionOrdering[t].push(e),this.distributionIndex[e.id]=this.distributionOrdering[t].length-1)}}]),e}(),m=function(){function e(t){(0,a.default)(this,e),this.body=t,this.initialRandomSeed=Math.round(1e6*Math.random()),this.randomSeed=this.initialRandomSeed,this.setPhysics=!1,this.options={},this.optionsBackup={physics:{}},this.defaultOptions={randomSeed:void 0,improvedLayout:!0,hierarchical:{enabled:!1,levelSeparation:150,nodeSpacing:100,treeSpacing:200,blockShifting:!0,edgeMinimization:!0,parentCentralization:!0,direction:"UD",sortMethod:"hubsize"}},u.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,s.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("_dataChanged",function(){e.setupHierarchicalLayout()}),this.body.emitter.on("_dataLoaded",function(){e.layoutNetwork()}),this.body.emitter.on("_resetHierarchicalLayout",function(){e.setupHierarchicalLayout()}),this.body.emitter.on("_adjustEdgesForHierarchicalLayout",function(){if(!0===e.options.hierarchical.enabled){var t=e.direction.curveType();e.body.emitter.emit("_forceDisableDynamicCurves",t,!1)}})}},{key:"setOptions",value:function(e,t){if(void 0!==e){var i=this.options.hierarchical,r=i.enabled;if(u.selectiveDeepExtend(["randomSeed","improvedLayout"],this.options,e),u.mergeOptions(this.options,e,"hierarchical"),void 0!==e.randomSeed&&(this.initialRandomSeed=e.randomSeed),!0===i.enabled)return!0===r&&this.body.emitter.emit("refresh",!0),"RL"===i.direction||"DU"===i.direction?i.levelSeparation>0&&(i.levelSeparation*=-1):i.levelSeparation<0&&(i.levelSeparation*=-1),this.setDirectionStrategy(),this.body.emitter.emit("_resetHierarchicalLayout"),this.adaptAllOptionsForHierarchicalLayout(t);if(!0===r)return this.body.emitter.emit("refresh"),u.deepExtend(t,this.optionsBackup)}return t}},{key:"adaptAllOptionsForHierarchicalLayout",value:function(e){if(!0===this.options.hierarchical.enabled){var t=this.optionsBackup.physics;void 0===e.physics||!0===e.physics?(e.physics={enabled:void 0===t.enabled||t.enabled,solver:"hierarchicalRepulsion"},t.enabled=void 0===t.enabled||t.enabled,t.solver=t.solver||"barnesHut"):"object"===(0,n.default)(e.physics)?(t.enabled=void 0===e.physics.enabled||e.physics.enabled,t.solver=e.physics.solver||"barnesHut",e.physics.solver="hierarchicalRepulsion"):!1!==e.physics&&(t.solver="barnesHut",e.physics={solver:"hierarchicalRepulsion"});var i=this.direction.curveType();if(void 0===e.edges)this.optionsBackup.edges={smooth:{enabled:!0,type:"dynamic"}},e.edges={smooth:!1};else if(void 0===e.edges.smooth)this.optionsBackup.edges={smooth:{enabled:!0,type:"dynamic"}},e.edges.smooth=!1;else if("boolean"==typeof e.edges.smooth)this.optionsBackup.edges={smooth:e.edges.smooth},e.edges.smooth={enabled:e.edges.smooth,type:i};else{var r=e.edges.smooth;void 0!==r.type&&"dynamic"!==r.type&&(i=r.type),this.optionsBackup.edges={smooth:void 0===r.enabled||r.enabled,type:void 0===r.type?"dynamic":r.type,roundness:void 0===r.roundness?.5:r.roundness,forceDirection:void 0!==r.forceDirection&&r.forceDirection},e.edges.smooth={enabled:void 0===r.enabled||r.enabled,type:i,roundness:void 0===r.roundness?.5:r.roundness,forceDirection:void 0!==r.forceDirection&&r.forceDirection}}this.body.emitter.emit("_forceDisableDynamicCurves",i)}return e}},{key:"seededRandom",value:function(){var e=1e4*Math.sin(this.randomSeed++);return e-Math.floor(e)}},{key:"positionInitially",value:function(e){if(!0!==this.options.hierarchical.enabled){this.randomSeed=this.initialRandomSeed;for(var t=e.length+50,i=0;i<e.length;i++){var r=e[i],n=2*Math.PI*this.seededRandom();void 0===r.x&&(r.x=t*Math.cos(n)),void 0===r.y&&(r.y=t*Math.sin(n))}}}},{key:"layoutNetwork",value:function(){if(!0!==this.options.hierarchical.enabled&&!0===this.options.improvedLayout){for(var e=this.body.nodeIndices,t=0,i=0;i<e.length;i++){!0===this.body.nodes[e[i]].predefinedPosition&&(t+=1)}if(t<.5*e.length){var r=0,n={clusterNodeProperties:{shape:"ellipse",label:"",group:"",font:{multi:!1}},clusterEdgeProperties:{label:"",font:{multi:!1},smooth:{enabled:!1}}};if(e.length>150){for(var o=e.length;e.length>150&&r<=10;){r+=1;var a=e.length;if(r%3==0?this.body.modules.clustering.clusterBridges(n):this.body.modules.clustering.clusterOutliers(n),a==e.length&&r%3!=0)return this._declusterAll(),this.body.emitter.emit("_layoutFailed"),void console.info("This network could not be positioned by this version of the improved layout algorithm. Please disable improvedLayout for better performance.")}this.body.modules.kamadaKawai.setOptions({springLength:Math.max(150,2*o)})}r>10&&console.info("The clustering didn't succeed within the amount of interations allowed, progressing with partial result."),this.body.modules.kamadaKawai.solve(e,this.body.edgeIndices,!0),this._shiftToCenter();for(var s=0;s<e.length;s++){var l=this.body.nodes[e[s]];!1===l.predefinedPosition&&(l.x+=70*(.5-this.seededRandom()),l.y+=70*(.5-this.seededRandom()))}this._declusterAll(),this.body.emitter.emit("_repositionBezierNodes")}}}},{key:"_shiftToCenter",value:function(){for(var e=h.getRangeCore(this.body.nodes,this.body.nodeIndices),t=h.findCenter(e),i=0;i<this.body.nodeIndices.length;i++){var r=this.body.nodes[this.body.nodeIndices[i]];r.x-=t.x,r.y-=t.y}}},{key:"_declusterAll",value:function(){for(var e=!0;!0===e;){e=!1;for(var t=0;t<this.body.nodeIndices.length;t++)!0===this.body.nodes[this.body.nodeIndices[t]].isCluster&&(e=!0,this.body.modules.clustering.openCluster(this.body.nodeIndices[t],{},!1));!0===e&&this.body.emitter.emit("_dataChanged")}}},{key:"getSeed",value:function(){return this.initialRandomSeed}},{key:"setupHierarchicalLayout",value:function(){if(!0===this.options.hierarchical.enabled&&this.body.nodeIndices.length>0){var e=void 0,t=void 0,i=!1,r=!1;for(t in this.lastNodeOnLevel={},this.hierarchical=new f,this.body.nodes)this.body.nodes.hasOwnProperty(t)&&(void 0!==(e=this.body.nodes[t]).options.level?(i=!0,this.hierarchical.levels[t]=e.options.level):r=!0);if(!0===r&&!0===i)throw new Error("To use the hierarchical layout, nodes require either no predefined levels or levels have to be defined for all nodes.");if(!0===r){var n=this.options.hierarchical.sortMethod;"hubsize"===n?this._determineLevelsByHubsize():"directed"===n?this._determineLevelsDirected():"custom"===n&&this._determineLevelsCustomCallback()}for(var o in this.body.nodes)this.body.nodes.hasOwnProperty(o)&&this.hierarchical.ensureLevel(o);var a=this._getDistribution();this._generateMap(),this._placeNodesByHierarchy(a),this._condenseHierarchy(),this._shiftToCenter()}}},{key:"_condenseHierarchy",value:function(){var e=this,t=!1,i={},n=function(t,i){var r=e.hierarchical.trees;for(var n in r)r.hasOwnProperty(n)&&r[n]===t&&e.direction.shift(n,i)},o=function(){for(var t=[],i=0;i<e.hierarchical.numTrees();i++)t.push(e.direction.getTreeSize(i));return t},a=function t(i,r){if(!r[i.id]&&(r[i.id]=!0,e.hierarchical.childrenReference[i.id])){var n=e.hierarchical.childrenReference[i.id];if(n.length>0)for(var o=0;o<n.length;o++)t(e.body.nodes[n[o]],r)}},s=function(t){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1e9,n=1e9,o=1e9,a=1e9,s=-1e9;for(var l in t)if(t.hasOwnProperty(l)){var u=e.body.nodes[l],h=e.hierarchical.levels[u.id],c=e.direction.getPosition(u),d=e._getSpaceAroundNode(u,t),p=(0,r.default)(d,2),f=p[0],m=p[1];n=Math.min(f,n),o=Math.min(m,o),h<=i&&(a=Math.min(c,a),s=Math.max(c,s))}return[a,s,n,o]},l=function(t,i,r){for(var n=e.hierarchical,o=0;o<i.length;o++){var a=i[o],s=n.distributionOrdering[a];if(s.length>1)for(var l=0;l<s.length-1;l++){var u=s[l],h=s[l+1];n.hasSameParent(u,h)&&n.inSameSubNetwork(u,h)&&t(u,h,r)}}},u=function(i,r){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],o=e.direction.getPosition(i),l=e.direction.getPosition(r),u=Math.abs(l-o),h=e.options.hierarchical.nodeSpacing;if(u>h){var c={},d={};a(i,c),a(r,d);var p=function(t,i){var r=e.hierarchical.getMaxLevel(t.id),n=e.hierarchical.getMaxLevel(i.id);return Math.min(r,n)}(i,r),f=s(c,p),m=s(d,p),v=f[1],g=m[0],y=m[2];if(Math.abs(v-g)>h){var _=v-g+h;_<-y+h&&(_=-y+h),_<0&&(e._shiftBlock(r.id,_),t=!0,!0===n&&e._centerParent(r))}}},h=function(n,o){for(var l=o.id,u=o.edges,h=e.hierarchical.levels[o.id],c=e.options.hierarchical.levelSeparation*e.options.hierarchical.levelSeparation,d={},p=[],f=0;f<u.length;f++){var m=u[f];if(m.toId!=m.fromId){var v=m.toId==l?m.from:m.to;d[u[f].id]=v,e.hierarchical.levels[v.id]<h&&p.push(m)}}var g=function(t,i){for(var r=0,n=0;n<i.length;n++)if(void 0!==d[i[n].id]){var o=e.direction.getPosition(d[i[n].id])-t;r+=o/Math.sqrt(o*o+c)}return r},y=function(t,i){for(var r=0,n=0;n<i.length;n++)if(void 0!==d[i[n].id]){var o=e.direction.getPosition(d[i[n].id])-t;r-=c*Math.pow(o*o+c,-1.5)}return r},_=function(t,i){for(var r=e.direction.getPosition(o),n={},a=0;a<t;a++){var s=g(r,i),l=y(r,i);if(void 0!==n[r-=Math.max(-40,Math.min(40,Math.round(s/l)))])break;n[r]=a}return r},b=_(n,p);!function(r){var n=e.direction.getPosition(o);if(void 0===i[o.id]){var l={};a(o,l),i[o.id]=l}var u=s(i[o.id]),h=u[2],c=u[3],d=r-n,p=0;d>0?p=Math.min(d,c-e.options.hierarchical.nodeSpacing):d<0&&(p=-Math.min(-d,h-e.options.hierarchical.nodeSpacing)),0!=p&&(e._shiftBlock(o.id,p),t=!0)}(b),function(i){var n=e.direction.getPosition(o),a=e._getSpaceAroundNode(o),s=(0,r.default)(a,2),l=s[0],u=s[1],h=i-n,c=n;h>0?c=Math.min(n+(u-e.options.hierarchical.nodeSpacing),i):h<0&&(c=Math.max(n-(l-e.options.hierarchical.nodeSpacing),i)),c!==n&&(e.direction.setPosition(o,c),t=!0)}(b=_(n,u))};!0===this.options.hierarchical.blockShifting&&(function(i){var r=e.hierarchical.getLevels();r=r.reverse();for(var n=0;n<i&&(t=!1,l(u,r,!0),!0===t);n++);}(5),function(){for(var t in e.body.nodes)e.body.nodes.hasOwnProperty(t)&&e._centerParent(e.body.nodes[t])}()),!0===this.options.hierarchical.edgeMinimization&&function(i){var r=e.hierarchical.getLevels();r=r.reverse();for(var n=0;n<i;n++){t=!1;for(var o=0;o<r.length;o++)for(var a=r[o],s=e.hierarchical.distributionOrdering[a],l=0;l<s.length;l++)h(1e3,s[l]);if(!0!==t)break}}(20),!0===this.options.hierarchical.parentCentralization&&function(){var t=e.hierarchical.getLevels();t=t.reverse();for(var i=0;i<t.length;i++)for(var r=t[i],n=e.hierarchical.distributionOrdering[r],o=0;o<n.length;o++)e._centerParent(n[o])}(),function(){for(var t=o(),i=0,r=0;r<t.length-1;r++)i+=t[r].max-t[r+1].min+e.options.hierarchical.treeSpacing,n(r+1,i)}()}},{key:"_getSpaceAroundNode",value:function(e,t){var i=!0;void 0===t&&(i=!1);var r=this.hierarchical.levels[e.id];if(void 0!==r){var n=this.hierarchical.distributionIndex[e.id],o=this.direction.getPosition(e),a=this.hierarchical.distributionOrdering[r],s=1e9,l=1e9;if(0!==n){var u=a[n-1];if(!0===i&&void 0===t[u.id]||!1===i)s=o-this.direction.getPosition(u)}if(n!=a.length-1){var h=a[n+1];if(!0===i&&void 0===t[h.id]||!1===i){var c=this.direction.getPosition(h);l=Math.min(l,c-o)}}return[s,l]}return[0,0]}},{key:"_centerParent",value:function(e){if(this.hierarchical.parentReference[e.id])for(var t=this.hierarchical.parentReference[e.id],i=0;i<t.length;i++){var n=t[i],o=this.body.nodes[n],a=this.hierarchical.childrenReference[n];if(void 0!==a){var s=this._getCenterPosition(a),l=this.direction.getPosition(o),u=this._getSpaceAroundNode(o),h=(0,r.default)(u,2),c=h[0],d=h[1],p=l-s;(p<0&&Math.abs(p)<d-this.options.hierarchical.nodeSpacing||p>0&&Math.abs(p)<c-this.options.hierarchical.nodeSpacing)&&this.direction.setPosition(o,s)}}}},{key:"_placeNodesByHierarchy",value:function(e){for(var t in this.positionedNodes={},e)if(e.hasOwnProperty(t)){var i=(0,o.default)(e[t]);i=this._indexArrayToNodes(i),this.direction.sort(i);for(var r=0,n=0;n<i.length;n++){var a=i[n];if(void 0===this.positionedNodes[a.id]){var s=this.options.hierarchical.nodeSpacing,l=s*r;r>0&&(l=this.direction.getPosition(i[n-1])+s),this.direction.setPosition(a,l,t),this._validatePositionAndContinue(a,t,l),r++}}}}},{key:"_placeBranchNodes",value:function(e,t){var i=this.hierarchical.childrenReference[e];if(void 0!==i){for(var r=[],n=0;n<i.length;n++)r.push(this.body.nodes[i[n]]);this.direction.sort(r);for(var o=0;o<r.length;o++){var a=r[o],s=this.hierarchical.levels[a.id];if(!(s>t&&void 0===this.positionedNodes[a.id]))return;var l=this.options.hierarchical.nodeSpacing,u=void 0;u=0===o?this.direction.getPosition(this.body.nodes[e]):this.direction.getPosition(r[o-1])+l,this.direction.setPosition(a,u,s),this._validatePositionAndContinue(a,s,u)}var h=this._getCenterPosition(r);this.direction.setPosition(this.body.nodes[e],h,t)}}},{key:"_validatePositionAndContinue",value:function(e,t,i){if(this.hierarchical.isTree){if(void 0!==this.lastNodeOnLevel[t]){var r=this.direction.getPosition(this.body.nodes[this.lastNodeOnLevel[t]]);if(i-r<this.options.hierarchical.nodeSpacing){var n=r+this.options.hierarchical.nodeSpacing-i,o=this._findCommonParent(this.lastNodeOnLevel[t],e.id);this._shiftBlock(o.withChild,n)}}this.lastNodeOnLevel[t]=e.id,this.positionedNodes[e.id]=!0,this._placeBranchNodes(e.id,t)}}},{key:"_indexArrayToNodes",value:function(e){for(var t=[],i=0;i<e.length;i++)t.push(this.body.nodes[e[i]]);return t}},{key:"_getDistribution",value:function(){var e={},t=void 0,i=void 0;for(t in this.body.nodes)if(this.body.nodes.hasOwnProperty(t)){i=this.body.nodes[t];var r=void 0===this.hierarchical.levels[t]?0:this.hierarchical.levels[t];this.direction.fix(i,r),void 0===e[r]&&(e[r]={}),e[r][t]=i}return e}},{key:"_getActiveEdges",value:function(e){var t=this,i=[];return u.forEach(e.edges,function(e){-1!==t.body.edgeIndices.indexOf(e.id)&&i.push(e)}),i}},{key:"_getHubSizes",value:function(){var e=this,t={},i=this.body.nodeIndices;u.forEach(i,function(i){var r=e.body.nodes[i],n=e._getActiveEdges(r).length;t[n]=!0});var r=[];return u.forEach(t,function(e){r.push(Number(e))}),r.sort(function(e,t){return t-e}),r}},{key:"_determineLevelsByHubsize",value:function(){for(var e=this,t=function(t,i){e.hierarchical.levelDownstream(t,i)},i=this._getHubSizes(),r=function(r){var n=i[r];if(0===n)return"break";u.forEach(e.body.nodeIndices,function(i){var r=e.body.nodes[i];n===e._getActiveEdges(r).length&&e._crawlNetwork(t,i)})},n=0;n<i.length;++n){if("break"===r(n))break}}},{key:"_determineLevelsCustomCallback",value:function(){var e=this;this._crawlNetwork(function(t,i,r){var n=e.hierarchical.levels[t.id];void 0===n&&(n=e.hierarchical.levels[t.id]=1e5);var o=(h.cloneOptions(t,"node"),h.cloneOptions(i,"node"),void h.cloneOptions(r,"edge"));e.hierarchical.levels[i.id]=n+o}),this.hierarchical.setMinLevelToZero(this.body.nodes)}},{key:"_determineLevelsDirected",value:function(){var e=this;this._crawlNetwork(function(t,i,r){var n=e.hierarchical.levels[t.id],o=e.hierarchical.levels[i.id];(function(t){return u.forEach(e.body.edges,function(e){if(e.toId===t.fromId&&e.fromId===t.toId)return!0}),!1})(r)&&void 0!==n&&void 0!==o||(void 0===n&&(n=e.hierarchical.levels[t.id]=1e4),r.toId==i.id?e.hierarchical.levels[i.id]=n+1:e.hierarchical.levels[i.id]=n-1)}),this.hierarchical.setMinLevelToZero(this.body.nodes)}},{key:"_generateMap",value:function(){var e=this;this._crawlNetwork(function(t,i){e.hierarchical.levels[i.id]>e.hierarchical.levels[t.id]&&e.hierarchical.addRelation(t.id,i.id)}),this.hierarchical.checkIfTree()}},{key:"_crawlNetwork",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:function(){},i=arguments[1],r={},n=function i(n,o){if(void 0===r[n.id]){e.hierarchical.setTreeIndex(n,o),r[n.id]=!0;for(var a=void 0,s=e._getActiveEdges(n),l=0;l<s.length;l++){var u=s[l];!0===u.connected&&(a=u.toId==n.id?u.from:u.to,n.id!=a.id&&(t(n,a,u),i(a,o)))}}};if(void 0===i)for(var o=0,a=0;a<this.body.nodeIndices.length;a++){var s=this.body.nodeIndices[a];if(void 0===r[s])n(this.body.nodes[s],o),o+=1}else{var l=this.body.nodes[i];if(void 0===l)return void console.error("Node not found:",i);n(l)}}},{key:"_shiftBlock",value:function(e,t){var i=this,r={};!function e(n){if(!r[n]){r[n]=!0,i.direction.shift(n,t);var o=i.hierarchical.childrenReference[n];if(void 0!==o)for(var a=0;a<o.length;a++)e(o[a])}}(e)}},{key:"_findCommonParent",value:function(e,t){var i=this,r={};return function e(t,r){var n=i.hierarchical.parentReference[r];if(void 0!==n)for(var o=0;o<n.length;o++){var a=n[o];t[a]=!0,e(t,a)}}(r,e),function e(t,r){var n=i.hierarchical.parentReference[r];if(void 0!==n)for(var o=0;o<n.length;o++){var a=n[o];if(void 0!==t[a])return{foundParent:a,withChild:r};var s=e(t,a);if(null!==s.foundParent)return s}return{foundParent:null,withChild:r}}(r,t)}},{key:"setDirectionStrategy",value:function(){var e="UD"===this.options.hierarchical.direction||"DU"===this.options.hierarchical.direction;this.direction=e?new p(this):new d(this)}},{key:"_getCenterPosition",value:function(e){for(var t=1e9,i=-1e9,r=0;r<e.length;r++){var n=void 0;if(void 0!==e[r].id)n=e[r];else{var o=e[r];n=this.body.nodes[o]}var a=this.direction.getPosition(n);t=Math.min(t,a),i=Math.max(i,a)}return.5*(t+i)}}]),e}();t.default=m},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0}),t.VerticalStrategy=t.HorizontalStrategy=void 0;var r=l(i(3)),n=l(i(4)),o=l(i(5)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(){function e(){(0,a.default)(this,e)}return(0,s.default)(e,[{key:"abstract",value:function(){throw new Error("Can't instantiate abstract class!")}},{key:"fake_use",value:function(){}},{key:"curveType",value:function(){return this.abstract()}},{key:"getPosition",value:function(e){return this.fake_use(e),this.abstract()}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;this.fake_use(e,t,i),this.abstract()}},{key:"getTreeSize",value:function(e){return this.fake_use(e),this.abstract()}},{key:"sort",value:function(e){this.fake_use(e),this.abstract()}},{key:"fix",value:function(e,t){this.fake_use(e,t),this.abstract()}},{key:"shift",value:function(e,t){this.fake_use(e,t),this.abstract()}}]),e}(),h=function(e){function t(e){(0,a.default)(this,t);var i=(0,n.default)(this,(t.__proto__||(0,r.default)(t)).call(this));return i.layout=e,i}return(0,o.default)(t,e),(0,s.default)(t,[{key:"curveType",value:function(){return"horizontal"}},{key:"getPosition",value:function(e){return e.x}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;void 0!==i&&this.layout.hierarchical.addToOrdering(e,i),e.x=t}},{key:"getTreeSize",value:function(e){var t=this.layout.hierarchical.getTreeSize(this.layout.body.nodes,e);return{min:t.min_x,max:t.max_x}}},{key:"sort",value:function(e){e.sort(function(e,t){return void 0===e.x||void 0===t.x?0:e.x-t.x})}},{key:"fix",value:function(e,t){e.y=this.layout.options.hierarchical.levelSeparation*t,e.options.fixed.y=!0}},{key:"shift",value:function(e,t){this.layout.body.nodes[e].x+=t}}]),t}(u),c=function(e){function t(e){(0,a.default)(this,t);var i=(0,n.default)(this,(t.__proto__||(0,r.default)(t)).call(this));return i.layout=e,i}return(0,o.default)(t,e),(0,s.default)(t,[{key:"curveType",value:function(){return"vertical"}},{key:"getPosition",value:function(e){return e.y}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;void 0!==i&&this.layout.hierarchical.addToOrdering(e,i),e.y=t}},{key:"getTreeSize",value:function(e){var t=this.layout.hierarchical.getTreeSize(this.layout.body.nodes,e);return{min:t.min_y,max:t.max_y}}},{key:"sort",value:function(e){e.sort(function(e,t){return void 0===e.y||void 0===t.y?0:e.y-t.y})}},{key:"fix",value:function(e,t){e.x=this.layout.options.hierarchical.levelSeparation*t,e.options.fixed.x=!0}},{key:"shift",value:function(e,t){this.layout.body.nodes[e].y+=t}}]),t}(u);t.HorizontalStrategy=c,t.VerticalStrategy=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(8)),n=l(i(19)),o=l(i(6)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=i(10),c=i(37),d=function(){function e(t,i,r){var n=this;(0,a.default)(this,e),this.body=t,this.canvas=i,this.selectionHandler=r,this.editMode=!1,this.manipulationDiv=void 0,this.editModeDiv=void 0,this.closeDiv=void 0,this.manipulationHammers=[],this.temporaryUIFunctions={},this.temporaryEventFunctions=[],this.touchTime=0,this.temporaryIds={nodes:[],edges:[]},this.guiEnabled=!1,this.inMode=!1,this.selectedControlNode=void 0,this.options={},this.defaultOptions={enabled:!1,initiallyActive:!1,addNode:!0,addEdge:!0,editNode:void 0,editEdge:!0,deleteNode:!0,deleteEdge:!0,controlNodeStyle:{shape:"dot",size:6,color:{background:"#ff0000",border:"#3c3c3c",highlight:{background:"#07f968",border:"#3c3c3c"}},borderWidth:2,borderWidthSelected:2}},u.extend(this.options,this.defaultOptions),this.body.emitter.on("destroy",function(){n._clean()}),this.body.emitter.on("_dataChanged",this._restore.bind(this)),this.body.emitter.on("_resetData",this._restore.bind(this))}return(0,s.default)(e,[{key:"_restore",value:function(){!1!==this.inMode&&(!0===this.options.initiallyActive?this.enableEditMode():this.disableEditMode())}},{key:"setOptions",value:function(e,t,i){void 0!==t&&(void 0!==t.locale?this.options.locale=t.locale:this.options.locale=i.locale,void 0!==t.locales?this.options.locales=t.locales:this.options.locales=i.locales),void 0!==e&&("boolean"==typeof e?this.options.enabled=e:(this.options.enabled=!0,u.deepExtend(this.options,e)),!0===this.options.initiallyActive&&(this.editMode=!0),this._setup())}},{key:"toggleEditMode",value:function(){!0===this.editMode?this.disableEditMode():this.enableEditMode()}},{key:"enableEditMode",value:function(){this.editMode=!0,this._clean(),!0===this.guiEnabled&&(this.manipulationDiv.style.display="block",this.closeDiv.style.display="block",this.editModeDiv.style.display="none",this.showManipulatorToolbar())}},{key:"disableEditMode",value:function(){this.editMode=!1,this._clean(),!0===this.guiEnabled&&(this.manipulationDiv.style.display="none",this.closeDiv.style.display="none",this.editModeDiv.style.display="block",this._createEditButton())}},{key:"showManipulatorToolbar",value:function(){if(this._clean(),this.manipulationDOM={},!0===this.guiEnabled){this.editMode=!0,this.manipulationDiv.style.display="block",this.closeDiv.style.display="block";var e=this.selectionHandler._getSelectedNodeCount(),t=this.selectionHandler._getSelectedEdgeCount(),i=e+t,r=this.options.locales[this.options.locale],n=!1;!1!==this.options.addNode&&(this._createAddNodeButton(r),n=!0),!1!==this.options.addEdge&&(!0===n?this._createSeperator(1):n=!0,this._createAddEdgeButton(r)),1===e&&"function"==typeof this.options.editNode?(!0===n?this._createSeperator(2):n=!0,this._createEditNodeButton(r)):1===t&&0===e&&!1!==this.options.editEdge&&(!0===n?this._createSeperator(3):n=!0,this._createEditEdgeButton(r)),0!==i&&(e>0&&!1!==this.options.deleteNode?(!0===n&&this._createSeperator(4),this._createDeleteButton(r)):0===e&&!1!==this.options.deleteEdge&&(!0===n&&this._createSeperator(4),this._createDeleteButton(r))),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this)),this._temporaryBindEvent("select",this.showManipulatorToolbar.bind(this))}this.body.emitter.emit("_redraw")}},{key:"addNodeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="addNode",!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.addDescription||this.options.locales.en.addDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}this._temporaryBindEvent("click",this._performAddNode.bind(this))}},{key:"editNode",value:function(){var e=this;!0!==this.editMode&&this.enableEditMode(),this._clean();var t=this.selectionHandler._getSelectedNode();if(void 0!==t){if(this.inMode="editNode","function"!=typeof this.options.editNode)throw new Error("No function has been configured to handle the editing of nodes.");if(!0!==t.isCluster){var i=u.deepExtend({},t.options,!1);if(i.x=t.x,i.y=t.y,2!==this.options.editNode.length)throw new Error("The function for edit does not support two arguments (data, callback)");this.options.editNode(i,function(t){null!=t&&"editNode"===e.inMode&&e.body.data.nodes.getDataSet().update(t),e.showManipulatorToolbar()})}else alert(this.options.locales[this.options.locale].editClusterError||this.options.locales.en.editClusterError)}else this.showManipulatorToolbar()}},{key:"addEdgeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="addEdge",!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.edgeDescription||this.options.locales.en.edgeDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}this._temporaryBindUI("onTouch",this._handleConnect.bind(this)),this._temporaryBindUI("onDragEnd",this._finishConnect.bind(this)),this._temporaryBindUI("onDrag",this._dragControlNode.bind(this)),this._temporaryBindUI("onRelease",this._finishConnect.bind(this)),this._temporaryBindUI("onDragStart",this._dragStartEdge.bind(this)),this._temporaryBindUI("onHold",function(){})}},{key:"editEdgeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="editEdge","object"!==(0,o.default)(this.options.editEdge)||"function"!=typeof this.options.editEdge.editWithoutDrag||(this.edgeBeingEditedId=this.selectionHandler.getSelectedEdges()[0],void 0===this.edgeBeingEditedId)){if(!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.editEdgeDescription||this.options.locales.en.editEdgeDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}if(this.edgeBeingEditedId=this.selectionHandler.getSelectedEdges()[0],void 0!==this.edgeBeingEditedId){var t=this.body.edges[this.edgeBeingEditedId],i=this._getNewTargetNode(t.from.x,t.from.y),r=this._getNewTargetNode(t.to.x,t.to.y);this.temporaryIds.nodes.push(i.id),this.temporaryIds.nodes.push(r.id),this.body.nodes[i.id]=i,this.body.nodeIndices.push(i.id),this.body.nodes[r.id]=r,this.body.nodeIndices.push(r.id),this._temporaryBindUI("onTouch",this._controlNodeTouch.bind(this)),this._temporaryBindUI("onTap",function(){}),this._temporaryBindUI("onHold",function(){}),this._temporaryBindUI("onDragStart",this._controlNodeDragStart.bind(this)),this._temporaryBindUI("onDrag",this._controlNodeDrag.bind(this)),this._temporaryBindUI("onDragEnd",this._controlNodeDragEnd.bind(this)),this._temporaryBindUI("onMouseMove",function(){}),this._temporaryBindEvent("beforeDrawing",function(e){var n=t.edgeType.findBorderPositions(e);!1===i.selected&&(i.x=n.from.x,i.y=n.from.y),!1===r.selected&&(r.x=n.to.x,r.y=n.to.y)}),this.body.emitter.emit("_redraw")}else this.showManipulatorToolbar()}else{var n=this.body.edges[this.edgeBeingEditedId];this._performEditEdge(n.from,n.to)}}},{key:"deleteSelected",value:function(){var e=this;!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="delete";var t=this.selectionHandler.getSelectedNodes(),i=this.selectionHandler.getSelectedEdges(),r=void 0;if(t.length>0){for(var n=0;n<t.length;n++)if(!0===this.body.nodes[t[n]].isCluster)return void alert(this.options.locales[this.options.locale].deleteClusterError||this.options.locales.en.deleteClusterError);"function"==typeof this.options.deleteNode&&(r=this.options.deleteNode)}else i.length>0&&"function"==typeof this.options.deleteEdge&&(r=this.options.deleteEdge);if("function"==typeof r){var o={nodes:t,edges:i};if(2!==r.length)throw new Error("The function for delete does not support two arguments (data, callback)");r(o,function(t){null!=t&&"delete"===e.inMode?(e.body.data.edges.getDataSet().remove(t.edges),e.body.data.nodes.getDataSet().remove(t.nodes),e.body.emitter.emit("startSimulation"),e.showManipulatorToolbar()):(e.body.emitter.emit("startSimulation"),e.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().remove(i),this.body.data.nodes.getDataSet().remove(t),this.body.emitter.emit("startSimulation"),this.showManipulatorToolbar()}},{key:"_setup",value:function(){!0===this.options.enabled?(this.guiEnabled=!0,this._createWrappers(),!1===this.editMode?this._createEditButton():this.showManipulatorToolbar()):(this._removeManipulationDOM(),this.guiEnabled=!1)}},{key:"_createWrappers",value:function(){void 0===this.manipulationDiv&&(this.manipulationDiv=document.createElement("div"),this.manipulationDiv.className="vis-manipulation",!0===this.editMode?this.manipulationDiv.style.display="block":this.manipulationDiv.style.display="none",this.canvas.frame.appendChild(this.manipulationDiv)),void 0===this.editModeDiv&&(this.editModeDiv=document.createElement("div"),this.editModeDiv.className="vis-edit-mode",!0===this.editMode?this.editModeDiv.style.display="none":this.editModeDiv.style.display="block",this.canvas.frame.appendChild(this.editModeDiv)),void 0===this.closeDiv&&(this.closeDiv=document.createElement("div"),this.closeDiv.className="vis-close",this.closeDiv.style.display=this.manipulationDiv.style.display,this.canvas.frame.appendChild(this.closeDiv))}},{key:"_getNewTargetNode",value:function(e,t){var i=u.deepExtend({},this.options.controlNodeStyle);i.id="targetNode"+u.randomUUID(),i.hidden=!1,i.physics=!1,i.x=e,i.y=t;var r=this.body.functions.createNode(i);return r.shape.boundingBox={left:e,right:e,top:t,bottom:t},r}},{key:"_createEditButton",value:function(){this._clean(),this.manipulationDOM={},u.recursiveDOMDelete(this.editModeDiv);var e=this.options.locales[this.options.locale],t=this._createButton("editMode","vis-button vis-edit vis-edit-mode",e.edit||this.options.locales.en.edit);this.editModeDiv.appendChild(t),this._bindHammerToDiv(t,this.toggleEditMode.bind(this))}},{key:"_clean",value:function(){this.inMode=!1,!0===this.guiEnabled&&(u.recursiveDOMDelete(this.editModeDiv),u.recursiveDOMDelete(this.manipulationDiv),this._cleanManipulatorHammers()),this._cleanupTemporaryNodesAndEdges(),this._unbindTemporaryUIs(),this._unbindTemporaryEvents(),this.body.emitter.emit("restorePhysics")}},{key:"_cleanManipulatorHammers",value:function(){if(0!=this.manipulationHammers.length){for(var e=0;e<this.manipulationHammers.length;e++)this.manipulationHammers[e].destroy();this.manipulationHammers=[]}}},{key:"_removeManipulationDOM",value:function(){this._clean(),u.recursiveDOMDelete(this.manipulationDiv),u.recursiveDOMDelete(this.editModeDiv),u.recursiveDOMDelete(this.closeDiv),this.manipulationDiv&&this.canvas.frame.removeChild(this.manipulationDiv),this.editModeDiv&&this.canvas.frame.removeChild(this.editModeDiv),this.closeDiv&&this.canvas.frame.removeChild(this.closeDiv),this.manipulationDiv=void 0,this.editModeDiv=void 0,this.closeDiv=void 0}},{key:"_createSeperator",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1;this.manipulationDOM["seperatorLineDiv"+e]=document.createElement("div"),this.manipulationDOM["seperatorLineDiv"+e].className="vis-separator-line",this.manipulationDiv.appendChild(this.manipulationDOM["seperatorLineDiv"+e])}},{key:"_createAddNodeButton",value:function(e){var t=this._createButton("addNode","vis-button vis-add",e.addNode||this.options.locales.en.addNode);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.addNodeMode.bind(this))}},{key:"_createAddEdgeButton",value:function(e){var t=this._createButton("addEdge","vis-button vis-connect",e.addEdge||this.options.locales.en.addEdge);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.addEdgeMode.bind(this))}},{key:"_createEditNodeButton",value:function(e){var t=this._createButton("editNode","vis-button vis-edit",e.editNode||this.options.locales.en.editNode);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.editNode.bind(this))}},{key:"_createEditEdgeButton",value:function(e){var t=this._createButton("editEdge","vis-button vis-edit",e.editEdge||this.options.locales.en.editEdge);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.editEdgeMode.bind(this))}},{key:"_createDeleteButton",value:function(e){var t;t=this.options.rtl?"vis-button vis-delete-rtl":"vis-button vis-delete";var i=this._createButton("delete",t,e.del||this.options.locales.en.del);this.manipulationDiv.appendChild(i),this._bindHammerToDiv(i,this.deleteSelected.bind(this))}},{key:"_createBackButton",value:function(e){var t=this._createButton("back","vis-button vis-back",e.back||this.options.locales.en.back);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.showManipulatorToolbar.bind(this))}},{key:"_createButton",value:function(e,t,i){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"vis-label";return this.manipulationDOM[e+"Div"]=document.createElement("div"),this.manipulationDOM[e+"Div"].className=t,this.manipulationDOM[e+"Label"]=document.createElement("div"),this.manipulationDOM[e+"Label"].className=r,this.manipulationDOM[e+"Label"].innerHTML=i,this.manipulationDOM[e+"Div"].appendChild(this.manipulationDOM[e+"Label"]),this.manipulationDOM[e+"Div"]}},{key:"_createDescription",value:function(e){this.manipulationDiv.appendChild(this._createButton("description","vis-button vis-none",e))}},{key:"_temporaryBindEvent",value:function(e,t){this.temporaryEventFunctions.push({event:e,boundFunction:t}),this.body.emitter.on(e,t)}},{key:"_temporaryBindUI",value:function(e,t){if(void 0===this.body.eventListeners[e])throw new Error("This UI function does not exist. Typo? You tried: "+e+" possible are: "+(0,n.default)((0,r.default)(this.body.eventListeners)));this.temporaryUIFunctions[e]=this.body.eventListeners[e],this.body.eventListeners[e]=t}},{key:"_unbindTemporaryUIs",value:function(){for(var e in this.temporaryUIFunctions)this.temporaryUIFunctions.hasOwnProperty(e)&&(this.body.eventListeners[e]=this.temporaryUIFunctions[e],delete this.temporaryUIFunctions[e]);this.temporaryUIFunctions={}}},{key:"_unbindTemporaryEvents",value:function(){for(var e=0;e<this.temporaryEventFunctions.length;e++){var t=this.temporaryEventFunctions[e].event,i=this.temporaryEventFunctions[e].boundFunction;this.body.emitter.off(t,i)}this.temporaryEventFunctions=[]}},{key:"_bindHammerToDiv",value:function(e,t){var i=new h(e,{});c.onTouch(i,t),this.manipulationHammers.push(i)}},{key:"_cleanupTemporaryNodesAndEdges",value:function(){for(var e=0;e<this.temporaryIds.edges.length;e++){this.body.edges[this.temporaryIds.edges[e]].disconnect(),delete this.body.edges[this.temporaryIds.edges[e]];var t=this.body.edgeIndices.indexOf(this.temporaryIds.edges[e]);-1!==t&&this.body.edgeIndices.splice(t,1)}for(var i=0;i<this.temporaryIds.nodes.length;i++){delete this.body.nodes[this.temporaryIds.nodes[i]];var r=this.body.nodeIndices.indexOf(this.temporaryIds.nodes[i]);-1!==r&&this.body.nodeIndices.splice(r,1)}this.temporaryIds={nodes:[],edges:[]}}},{key:"_controlNodeTouch",value:function(e){this.selectionHandler.unselectAll(),this.lastTouch=this.body.functions.getPointer(e.center),this.lastTouch.translation=u.extend({},this.body.view.translation)}},{key:"_controlNodeDragStart",value:function(e){var t=this.lastTouch,i=this.selectionHandler._pointerToPositionObject(t),r=this.body.nodes[this.temporaryIds.nodes[0]],n=this.body.nodes[this.temporaryIds.nodes[1]],o=this.body.edges[this.edgeBeingEditedId];this.selectedControlNode=void 0;var a=r.isOverlappingWith(i),s=n.isOverlappingWith(i);!0===a?(this.selectedControlNode=r,o.edgeType.from=r):!0===s&&(this.selectedControlNode=n,o.edgeType.to=n),void 0!==this.selectedControlNode&&this.selectionHandler.selectObject(this.selectedControlNode),this.body.emitter.emit("_redraw")}},{key:"_controlNodeDrag",value:function(e){this.body.emitter.emit("disablePhysics");var t=this.body.functions.getPointer(e.center),i=this.canvas.DOMtoCanvas(t);if(void 0!==this.selectedControlNode)this.selectedControlNode.x=i.x,this.selectedControlNode.y=i.y;else{var r=t.x-this.lastTouch.x,n=t.y-this.lastTouch.y;this.body.view.translation={x:this.lastTouch.translation.x+r,y:this.lastTouch.translation.y+n}}this.body.emitter.emit("_redraw")}},{key:"_controlNodeDragEnd",value:function(e){var t=this.body.functions.getPointer(e.center),i=this.selectionHandler._pointerToPositionObject(t),r=this.body.edges[this.edgeBeingEditedId];if(void 0!==this.selectedControlNode){this.selectionHandler.unselectAll();for(var n=this.selectionHandler._getAllNodesOverlappingWith(i),o=void 0,a=n.length-1;a>=0;a--)if(n[a]!==this.selectedControlNode.id){o=this.body.nodes[n[a]];break}if(void 0!==o&&void 0!==this.selectedControlNode)if(!0===o.isCluster)alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError);else{var s=this.body.nodes[this.temporaryIds.nodes[0]];this.selectedControlNode.id===s.id?this._performEditEdge(o.id,r.to.id):this._performEditEdge(r.from.id,o.id)}else r.updateEdgeType(),this.body.emitter.emit("restorePhysics");this.body.emitter.emit("_redraw")}}},{key:"_handleConnect",value:function(e){if((new Date).valueOf()-this.touchTime>100){this.lastTouch=this.body.functions.getPointer(e.center),this.lastTouch.translation=u.extend({},this.body.view.translation);var t=this.lastTouch,i=this.selectionHandler.getNodeAt(t);if(void 0!==i)if(!0===i.isCluster)alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError);else{var r=this._getNewTargetNode(i.x,i.y);this.body.nodes[r.id]=r,this.body.nodeIndices.push(r.id);var n=this.body.functions.createEdge({id:"connectionEdge"+u.randomUUID(),from:i.id,to:r.id,physics:!1,smooth:{enabled:!0,type:"continuous",roundness:.5}});this.body.edges[n.id]=n,this.body.edgeIndices.push(n.id),this.temporaryIds.nodes.push(r.id),this.temporaryIds.edges.push(n.id)}this.touchTime=(new Date).valueOf()}}},{key:"_dragControlNode",value:function(e){var t=this.body.functions.getPointer(e.center);if(void 0!==this.temporaryIds.nodes[0]){var i=this.body.nodes[this.temporaryIds.nodes[0]];i.x=this.canvas._XconvertDOMtoCanvas(t.x),i.y=this.canvas._YconvertDOMtoCanvas(t.y),this.body.emitter.emit("_redraw")}else{var r=t.x-this.lastTouch.x,n=t.y-this.lastTouch.y;this.body.view.translation={x:this.lastTouch.translation.x+r,y:this.lastTouch.translation.y+n}}}},{key:"_finishConnect",value:function(e){var t=this.body.functions.getPointer(e.center),i=this.selectionHandler._pointerToPositionObject(t),r=void 0;void 0!==this.temporaryIds.edges[0]&&(r=this.body.edges[this.temporaryIds.edges[0]].fromId);for(var n=this.selectionHandler._getAllNodesOverlappingWith(i),o=void 0,a=n.length-1;a>=0;a--)if(-1===this.temporaryIds.nodes.indexOf(n[a])){o=this.body.nodes[n[a]];break}this._cleanupTemporaryNodesAndEdges(),void 0!==o&&(!0===o.isCluster?alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError):void 0!==this.body.nodes[r]&&void 0!==this.body.nodes[o.id]&&this._performAddEdge(r,o.id)),this.body.emitter.emit("_redraw")}},{key:"_dragStartEdge",value:function(e){var t=this.lastTouch;this.selectionHandler._generateClickEvent("dragStart",e,t,void 0,!0)}},{key:"_performAddNode",value:function(e){var t=this,i={id:u.randomUUID(),x:e.pointer.canvas.x,y:e.pointer.canvas.y,label:"new"};if("function"==typeof this.options.addNode){if(2!==this.options.addNode.length)throw this.showManipulatorToolbar(),new Error("The function for add does not support two arguments (data,callback)");this.options.addNode(i,function(e){null!=e&&"addNode"===t.inMode&&(t.body.data.nodes.getDataSet().add(e),t.showManipulatorToolbar())})}else this.body.data.nodes.getDataSet().add(i),this.showManipulatorToolbar()}},{key:"_performAddEdge",value:function(e,t){var i=this,r={from:e,to:t};if("function"==typeof this.options.addEdge){if(2!==this.options.addEdge.length)throw new Error("The function for connect does not support two arguments (data,callback)");this.options.addEdge(r,function(e){null!=e&&"addEdge"===i.inMode&&(i.body.data.edges.getDataSet().add(e),i.selectionHandler.unselectAll(),i.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().add(r),this.selectionHandler.unselectAll(),this.showManipulatorToolbar()}},{key:"_performEditEdge",value:function(e,t){var i=this,r={id:this.edgeBeingEditedId,from:e,to:t,label:this.body.data.edges._data[this.edgeBeingEditedId].label},n=this.options.editEdge;if("object"===(void 0===n?"undefined":(0,o.default)(n))&&(n=n.editWithoutDrag),"function"==typeof n){if(2!==n.length)throw new Error("The function for edit does not support two arguments (data, callback)");n(r,function(e){null==e||"editEdge"!==i.inMode?(i.body.edges[r.id].updateEdgeType(),i.body.emitter.emit("_redraw"),i.showManipulatorToolbar()):(i.body.data.edges.getDataSet().update(e),i.selectionHandler.unselectAll(),i.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().update(r),this.selectionHandler.unselectAll(),this.showManipulatorToolbar()}}]),e}();t.default=d},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=s(i(30)),n=s(i(0)),o=s(i(1)),a=s(i(239));function s(e){return e&&e.__esModule?e:{default:e}}var l=function(){function e(t,i,r){(0,n.default)(this,e),this.body=t,this.springLength=i,this.springConstant=r,this.distanceSolver=new a.default}return(0,o.default)(e,[{key:"setOptions",value:function(e){e&&(e.springLength&&(this.springLength=e.springLength),e.springConstant&&(this.springConstant=e.springConstant))}},{key:"solve",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],n=this.distanceSolver.getDistances(this.body,e,t);this._createL_matrix(n),this._createK_matrix(n),this._createE_matrix();for(var o=0,a=Math.max(1e3,Math.min(10*this.body.nodeIndices.length,6e3)),s=1e9,l=0,u=0,h=0,c=0,d=0;s>.01&&o<a;){o+=1;var p=this._getHighestEnergyNode(i),f=(0,r.default)(p,4);for(l=f[0],s=f[1],u=f[2],h=f[3],c=s,d=0;c>1&&d<5;){d+=1,this._moveNode(l,u,h);var m=this._getEnergy(l),v=(0,r.default)(m,3);c=v[0],u=v[1],h=v[2]}}}},{key:"_getHighestEnergyNode",value:function(e){for(var t=this.body.nodeIndices,i=this.body.nodes,n=0,o=t[0],a=0,s=0,l=0;l<t.length;l++){var u=t[l];if(!1===i[u].predefinedPosition||!0===i[u].isCluster&&!0===e||!0===i[u].options.fixed.x||!0===i[u].options.fixed.y){var h=this._getEnergy(u),c=(0,r.default)(h,3),d=c[0],p=c[1],f=c[2];n<d&&(n=d,o=u,a=p,s=f)}}return[o,n,a,s]}},{key:"_getEnergy",value:function(e){var t=(0,r.default)(this.E_sums[e],2),i=t[0],n=t[1];return[Math.sqrt(Math.pow(i,2)+Math.pow(n,2)),i,n]}},{key:"_moveNode",value:function(e,t,i){for(var r=this.body.nodeIndices,n=this.body.nodes,o=0,a=0,s=0,l=n[e].x,u=n[e].y,h=this.K_matrix[e],c=this.L_matrix[e],d=0;d<r.length;d++){var p=r[d];if(p!==e){var f=n[p].x,m=n[p].y,v=h[p],g=c[p],y=1/Math.pow(Math.pow(l-f,2)+Math.pow(u-m,2),1.5);o+=v*(1-g*Math.pow(u-m,2)*y),a+=v*(g*(l-f)*(u-m)*y),s+=v*(1-g*Math.pow(l-f,2)*y)}}var _=(t/o+i/a)/(a/o-s/a),b=-(a*_+t)/o;n[e].x+=b,n[e].y+=_,this._updateE_matrix(e)}},{key:"_createL_matrix",value:function(e){var t=this.body.nodeIndices,i=this.springLength;this.L_matrix=[];for(var r=0;r<t.length;r++){this.L_matrix[t[r]]={};for(var n=0;n<t.length;n++)this.L_matrix[t[r]][t[n]]=i*e[t[r]][t[n]]}}},{key:"_createK_matrix",value:function(e){var t=this.body.nodeIndices,i=this.springConstant;this.K_matrix=[];for(var r=0;r<t.length;r++){this.K_matrix[t[r]]={};for(var n=0;n<t.length;n++)this.K_matrix[t[r]][t[n]]=i*Math.pow(e[t[r]][t[n]],-2)}}},{key:"_createE_matrix",value:function(){var e=this.body.nodeIndices,t=this.body.nodes;this.E_matrix={},this.E_sums={};for(var i=0;i<e.length;i++)this.E_matrix[e[i]]=[];for(var r=0;r<e.length;r++){for(var n=e[r],o=t[n].x,a=t[n].y,s=0,l=0,u=r;u<e.length;u++){var h=e[u];if(h!==n){var c=t[h].x,d=t[h].y,p=1/Math.sqrt(Math.pow(o-c,2)+Math.pow(a-d,2));this.E_matrix[n][u]=[this.K_matrix[n][h]*(o-c-this.L_matrix[n][h]*(o-c)*p),this.K_matrix[n][h]*(a-d-this.L_matrix[n][h]*(a-d)*p)],this.E_matrix[h][r]=this.E_matrix[n][u],s+=this.E_matrix[n][u][0],l+=this.E_matrix[n][u][1]}}this.E_sums[n]=[s,l]}}},{key:"_updateE_matrix",value:function(e){for(var t=this.body.nodeIndices,i=this.body.nodes,r=this.E_matrix[e],n=this.K_matrix[e],o=this.L_matrix[e],a=i[e].x,s=i[e].y,l=0,u=0,h=0;h<t.length;h++){var c=t[h];if(c!==e){var d=r[h],p=d[0],f=d[1],m=i[c].x,v=i[c].y,g=1/Math.sqrt(Math.pow(a-m,2)+Math.pow(s-v,2)),y=n[c]*(a-m-o[c]*(a-m)*g),_=n[c]*(s-v-o[c]*(s-v)*g);r[h]=[y,_],l+=y,u+=_;var b=this.E_sums[c];b[0]+=y-p,b[1]+=_-f}}this.E_sums[e]=[l,u]}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(){(0,r.default)(this,e)}return(0,n.default)(e,[{key:"getDistances",value:function(e,t,i){for(var r={},n=e.edges,o=0;o<t.length;o++){var a={};r[t[o]]=a;for(var s=0;s<t.length;s++)a[t[s]]=o==s?0:1e9}for(var l=0;l<i.length;l++){var u=n[i[l]];!0===u.connected&&void 0!==r[u.fromId]&&void 0!==r[u.toId]&&(r[u.fromId][u.toId]=1,r[u.toId][u.fromId]=1)}for(var h=t.length,c=0;c<h;c++)for(var d=t[c],p=r[d],f=0;f<h-1;f++)for(var m=t[f],v=r[m],g=f+1;g<h;g++){var y=t[g],_=r[y],b=Math.min(v[y],v[d]+p[y]);v[y]=b,_[m]=b}return r}}]),e}();t.default=a}])},e.exports=r()},function(e,t,i){for(var r=i(239),n=[],o={},a=0;a<256;a++)n[a]=(a+256).toString(16).substr(1),o[n[a]]=a;function s(e,t){var i=t||0,r=n;return r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]}var l=r(),u=[1|l[0],l[1],l[2],l[3],l[4],l[5]],h=16383&(l[6]<<8|l[7]),c=0,d=0;function p(e,t,i){var n=t&&i||0;"string"==typeof e&&(t="binary"==e?new Array(16):null,e=null);var o=(e=e||{}).random||(e.rng||r)();if(o[6]=15&o[6]|64,o[8]=63&o[8]|128,t)for(var a=0;a<16;a++)t[n+a]=o[a];return t||s(o)}var f=p;f.v1=function(e,t,i){var r=t&&i||0,n=t||[],o=void 0!==(e=e||{}).clockseq?e.clockseq:h,a=void 0!==e.msecs?e.msecs:(new Date).getTime(),l=void 0!==e.nsecs?e.nsecs:d+1,p=a-c+(l-d)/1e4;if(p<0&&void 0===e.clockseq&&(o=o+1&16383),(p<0||a>c)&&void 0===e.nsecs&&(l=0),l>=1e4)throw new Error("uuid.v1(): Can't create more than 10M uuids/sec");c=a,d=l,h=o;var f=(1e4*(268435455&(a+=122192928e5))+l)%4294967296;n[r++]=f>>>24&255,n[r++]=f>>>16&255,n[r++]=f>>>8&255,n[r++]=255&f;var m=a/4294967296*1e4&268435455;n[r++]=m>>>8&255,n[r++]=255&m,n[r++]=m>>>24&15|16,n[r++]=m>>>16&255,n[r++]=o>>>8|128,n[r++]=255&o;for(var v=e.node||u,g=0;g<6;g++)n[r+g]=v[g];return t||s(n)},f.v4=p,f.parse=function(e,t,i){var r=t&&i||0,n=0;for(t=t||[],e.toLowerCase().replace(/[0-9a-f]{2}/g,function(e){n<16&&(t[r+n++]=o[e])});n<16;)t[r+n++]=0;return t},f.unparse=s,e.exports=f},function(e,t,i){(function(t){var i,r=t.crypto||t.msCrypto;if(r&&r.getRandomValues){var n=new Uint8Array(16);i=function(){return r.getRandomValues(n),n}}if(!i){var o=new Array(16);i=function(){for(var e,t=0;t<16;t++)0==(3&t)&&(e=4294967296*Math.random()),o[t]=e>>>((3&t)<<3)&255;return o}}e.exports=i}).call(this,i(59))},function(e,t,i){"use strict";Object.defineProperty(t,"__esModule",{value:!0});var r=function(){function e(e,t){for(var i=0;i<t.length;i++){var r=t[i];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,i,r){return i&&e(t.prototype,i),r&&e(t,r),t}}(),n=i(30),o=l(n),a=l(i(31)),s=l(i(241));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,t);var i=function(e,t){if(!e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!t||"object"!=typeof t&&"function"!=typeof t?e:t}(this,(t.__proto__||Object.getPrototypeOf(t)).call(this,e));return i.handleClick=i.handleClick.bind(i),i}return function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function, not "+typeof t);e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}),t&&(Object.setPrototypeOf?Object.setPrototypeOf(e,t):e.__proto__=t)}(t,n.Component),r(t,[{key:"componentDidMount",value:function(){this.scene=new s.default(this.props.data,this.mount,this.props.settings),this.scene.toggleVisibility(this.props.toggleVisibility)}},{key:"componentWillUpdate",value:function(e,t){e.downloadRequest!==this.props.downloadRequest&&this.scene.download(e.downloadRequest.filename,e.downloadRequest.filetype),e.data!==this.props.data&&(this.scene.addToScene(e.data),this.scene.toggleVisibility(this.props.toggleVisibility)),e.toggleVisibility!==this.props.toggleVisibility&&this.scene.toggleVisibility(e.toggleVisibility)}},{key:"componentWillUnmount",value:function(){this.scene.stop(),this.mount.removeChild(this.scene.renderer.domElement),this.scene.renderer.forceContextLoss(),this.scene.renderer.context=null,this.scene.renderer.domElement=null,this.scene.renderer=null}},{key:"handleClick",value:function(e){e.preventDefault();var t=this.scene.getClickedReference(e.clientX,e.clientY);this.props.selectedObjectReference===t?this.setState(function(e){return{selectedObjectCount:e.selectedObjectCount+1}}):this.setState({selectedObjectReference:t,selectedObjectCount:1})}},{key:"render",value:function(){var e=this,t=this.props.id;return o.default.createElement("div",{id:t,style:{width:"100%",height:"100%"},ref:function(t){e.mount=t},onClick:this.handleClick})}}]),t}();t.default=u,u.propTypes={id:a.default.string,data:a.default.object,settings:a.default.object,toggleVisibility:a.default.object,downloadRequest:a.default.object,setProps:a.default.func,selectedObjectReference:a.default.string,selectedObjectCount:a.default.number}},function(e,t,i){"use strict";Object.defineProperty(t,"__esModule",{value:!0});var r=function(){function e(e,t){for(var i=0;i<t.length;i++){var r=t[i];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,i,r){return i&&e(t.prototype,i),r&&e(t,r),t}}(),n=function(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var i in e)Object.prototype.hasOwnProperty.call(e,i)&&(t[i]=e[i]);return t.default=e,t}(i(242));function o(e){if(Array.isArray(e)){for(var t=0,i=Array(e.length);t<e.length;t++)i[t]=e[t];return i}return Array.from(e)}var a=function(){function e(t,i,r){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.start=this.start.bind(this),this.stop=this.stop.bind(this),this.animate=this.animate.bind(this);this.settings=Object.assign({shadows:!0,antialias:!0,transparent_background:!0,sphereSegments:32,cylinderSegments:8,staticScene:!0,sphereScale:1,cylinderScale:1,defaultSurfaceOpacity:.5,lights:[{type:"HemisphereLight",args:["#eeeeee","#999999",1]},{type:"DirectionalLight",args:["#ffffff",.15],position:[0,0,-10]},{type:"DirectionalLight",args:["#ffffff",.15],position:[-10,10,10]}],material:{type:"MeshStandardMaterial",parameters:{roughness:.07,metalness:0}},enableZoom:!0,defaultZoom:.8},r);var o=i.clientWidth,a=i.clientHeight,s=new n.WebGLRenderer({antialias:this.settings.antialias,alpha:this.settings.transparent_background,gammaInput:!0,gammaOutput:!0,gammaFactor:2.2,shadowMapEnabled:this.settings.shadows,shadowMapType:n.PCFSoftShadowMap});this.renderer=s,s.setPixelRatio(window.devicePixelRatio),s.setClearColor(16777215,0),s.setSize(o,a),i.appendChild(s.domElement);var l=new n.Scene;this.scene=l;var u=new n.OrthographicCamera(o/-2,o/2,a/2,a/-2,-2e3,2e3);u.position.z=2,this.camera=u,l.add(u),this.addToScene(t);var h=this.makeLights(this.settings.lights);u.add(h);var c=new n.OrbitControls(this.camera,this.renderer.domElement);function d(){s.render(l,u)}c.enableKeys=!1,c.minZoom=2,c.maxZoom=100,c.enablePan=!1,c.enableZoom=this.settings.enableZoom,d(),this.settings.staticScene?c.addEventListener("change",d):this.start(),window.addEventListener("resize",function(){var e=s.domElement,t=0|e.parentElement.clientWidth,i=0|e.parentElement.clientHeight;e.width===t&&e.height===i||s.setSize(t,i,!0),s.render(l,u)},!1),this.clickable_objects=[]}return r(e,[{key:"download",value:function(e,t){switch(t){case"png":this.downloadScreenshot(e);break;default:throw new Error("Unknown filetype.")}}},{key:"downloadScreenshot",value:function(e){var t=document.createElement("a");t.style.display="none",document.body.appendChild(t),this.renderScene(),t.href=this.renderer.domElement.toDataURL("image/png"),t.download=e||"screenshot.png",t.click()}},{key:"addToScene",value:function(t){e.removeObjectByName(this.scene,t.name),this.clickable_objects=[];var i=new n.Object3D;i.name=t.name,function e(t,i,r){t.contents.forEach(function(t){if(t.hasOwnProperty("type"))i.add(r.makeObject(t));else{var o=new n.Object3D;o.name=t.name,i.add(o),e(t,o,r)}})}(t,i,this),this.scene.add(i);var r=new n.Box3;r.setFromObject(i);var o=this.renderer.domElement.clientWidth,a=this.renderer.domElement.clientHeight;this.camera.zoom=Math.min(Math.max(o,a)/(r.max.x-r.min.x),Math.max(o,a)/(r.max.y-r.min.y),Math.max(o,a)/(r.max.z-r.min.z))*this.settings.defaultZoom,this.camera.updateProjectionMatrix(),this.camera.updateMatrix(),this.renderScene()}},{key:"makeLights",value:function(e){var t=new n.Object3D;return t.name="lights",e.forEach(function(e){switch(e.type){case"DirectionalLight":var i=new(Function.prototype.bind.apply(n.DirectionalLight,[null].concat(o(e.args))));if(e.helper){var r=new n.DirectionalLightHelper(i,5,"#444444");i.add(r)}break;case"AmbientLight":i=new(Function.prototype.bind.apply(n.AmbientLight,[null].concat(o(e.args))));break;case"HemisphereLight":i=new(Function.prototype.bind.apply(n.HemisphereLight,[null].concat(o(e.args))));break;default:throw new Error("Unknown light.")}var a;e.hasOwnProperty("position")&&(a=i.position).set.apply(a,o(e.position));t.add(i)}),t}},{key:"makeObject",value:function(e){var t=new n.Object3D;switch(t.name=e.name,e.visible&&(t.visible=e.visible),e.clickable&&(t.reference=e.reference,this.clickable_objects.push(t)),e.type){case"spheres":var i=new n.SphereBufferGeometry(e.radius*this.settings.sphereScale,this.settings.sphereSegments,this.settings.sphereSegments,e.phiStart||0,e.phiEnd||2*Math.PI),r=this.makeMaterial(e.color),a=[];return e.positions.forEach(function(e){var t,s=new n.Mesh(i,r);(t=s.position).set.apply(t,o(e)),a.push(s)}),a.forEach(function(e){t.add(e)}),t;case"ellipsoids":var s=new n.SphereBufferGeometry(this.settings.sphereScale,this.settings.sphereSegments,this.settings.sphereSegments,e.phiStart||0,e.phiEnd||2*Math.PI),l=this.makeMaterial(e.color),u=[];e.positions.forEach(function(t){var i,r,a=new n.Mesh(s,l);(i=a.position).set.apply(i,o(t)),(r=a.scale).set.apply(r,o(e.scale)),u.push(a)});var h=new n.Vector3(0,0,1),c=new n.Quaternion;return e.rotate_to.forEach(function(e,t){var i=new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e))));c.setFromUnitVectors(h,i.normalize()),u[t].setRotationFromQuaternion(c)}),u.forEach(function(e){t.add(e)}),t;case"cylinders":var d=e.radius||1,p=new n.CylinderBufferGeometry(d*this.settings.cylinderScale,d*this.settings.cylinderScale,1,this.settings.cylinderSegments),f=this.makeMaterial(e.color),m=new n.Vector3(0,1,0),v=new n.Quaternion;return e.positionPairs.forEach(function(e){var i=new n.Mesh(p,f),r=new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e[0])))),a=(new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e[1]))))).sub(r);i.scale.y=a.length();var s=r.add(a.clone().multiplyScalar(.5));i.position.set(s.x,s.y,s.z),v.setFromUnitVectors(m,a.normalize()),i.setRotationFromQuaternion(v),t.add(i)}),t;case"cubes":var g=new n.BoxBufferGeometry(e.width*this.settings.sphereScale,e.width*this.settings.sphereScale,e.width*this.settings.sphereScale),y=this.makeMaterial(e.color);return e.positions.forEach(function(e){var i,r=new n.Mesh(g,y);(i=r.position).set.apply(i,o(e)),t.add(r)}),t;case"lines":var _=new n.Float32BufferAttribute([].concat.apply([],e.positions),3),b=new n.BufferGeometry;b.addAttribute("position",_);var x=void 0;x=e.dashSize||e.scale||e.gapSize?new n.LineDashedMaterial({color:e.color||"#000000",linewidth:e.line_width||1,scale:e.scale||1,dashSize:e.dashSize||3,gapSize:e.gapSize||1}):new n.LineBasicMaterial({color:e.color||"#2c3c54",linewidth:e.line_width||1});var w=new n.LineSegments(b,x);return(e.dashSize||e.scale||e.gapSize)&&w.computeLineDistances(),t.add(w),t;case"surface":var S=new n.Float32BufferAttribute([].concat.apply([],e.positions),3),M=new n.BufferGeometry;M.addAttribute("position",S);var T=e.opacity||this.settings.defaultSurfaceOpacity,A=this.makeMaterial(e.color,T);if(e.normals){var C=new n.Float32BufferAttribute([].concat.apply([],e.normals),3);M.addAttribute("normal",C)}else M.computeFaceNormals(),A.side=n.DoubleSide;T&&(A.transparent=!0,A.depthWrite=!1);var L=new n.Mesh(M,A);return t.add(L),t;case"convex":var N=e.positions.map(function(e){return new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e))))}),k=new n.ConvexBufferGeometry(N),P=e.opacity||this.settings.defaultSurfaceOpacity,E=this.makeMaterial(e.color,P);P&&(E.transparent=!0,E.depthWrite=!1);var D=new n.Mesh(k,E);t.add(D);var O=new n.EdgesGeometry(k),R=new n.LineSegments(O,new n.LineBasicMaterial({color:e.color}));return t.add(R),t;case"arrows":var F=e.radius||1,I=e.headLength||2,B=e.headWidth||2,U=new n.CylinderBufferGeometry(F*this.settings.cylinderScale,F*this.settings.cylinderScale,1,this.settings.cylinderSegments),V=new n.ConeBufferGeometry(B*this.settings.cylinderScale,I*this.settings.cylinderScale,this.settings.cylinderSegments),z=this.makeMaterial(e.color),G=new n.Vector3(0,1,0),j=(new n.Vector3(0,0,1),new n.Quaternion),W=new n.Quaternion;return e.positionPairs.forEach(function(e){var i=new n.Mesh(U,z),r=new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e[0])))),a=new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e[1])))),s=new(Function.prototype.bind.apply(n.Vector3,[null].concat(o(e[1])))),l=a.sub(r);i.scale.y=l.length();var u=r.add(l.clone().multiplyScalar(.5));i.position.set(u.x,u.y,u.z),j.setFromUnitVectors(G,l.normalize()),i.setRotationFromQuaternion(j),t.add(i);var h=new n.Mesh(V,z);h.position.set(s.x,s.y,s.z),W.setFromUnitVectors(G,l.normalize()),h.setRotationFromQuaternion(W),t.add(h)}),t;case"labels":default:return t}}},{key:"makeMaterial",value:function(e,t){var i=Object.assign(this.settings.material.parameters,{color:e||"#52afb0",opacity:t||1});switch(this.settings.material.type){case"MeshStandardMaterial":return new n.MeshStandardMaterial(i);default:throw new Error("Unknown material.")}}},{key:"start",value:function(){this.frameId||(this.frameId=requestAnimationFrame(this.animate))}},{key:"stop",value:function(){cancelAnimationFrame(this.frameId)}},{key:"animate",value:function(){this.renderScene(),this.frameId=window.requestAnimationFrame(this.animate)}},{key:"renderScene",value:function(){this.renderer.render(this.scene,this.camera)}},{key:"toggleVisibility",value:function(e){if(void 0!==e)for(var t in e)if(e.hasOwnProperty(t)){var i=this.scene.getObjectByName(t);void 0!==i&&(i.visible=Boolean(e[t]))}this.renderScene()}},{key:"getClickedReference",value:function(e,t){var i=new n.Raycaster,r=new n.Vector2;r.x=e/this.renderer.domElement.clientWidth*2-1,r.y=-t/this.renderer.domElement.clientHeight*2+1,i.setFromCamera(r,this.camera);var o=i.intersectObjects(this.clickable_objects);return o.length>0?o[0].object.reference:null}}],[{key:"removeObjectByName",value:function(e,t){var i=e.getObjectByName(t);void 0!==i&&e.remove(i)}}]),e}();t.default=a},function(module,__webpack_exports__,__webpack_require__){"use strict";__webpack_require__.r(__webpack_exports__),__webpack_require__.d(__webpack_exports__,"CCDIKSolver",function(){return CCDIKSolver}),__webpack_require__.d(__webpack_exports__,"MMDAnimationHelper",function(){return MMDAnimationHelper}),__webpack_require__.d(__webpack_exports__,"MMDPhysics",function(){return MMDPhysics}),__webpack_require__.d(__webpack_exports__,"AnimationClipCreator",function(){return AnimationClipCreator}),__webpack_require__.d(__webpack_exports__,"CinematicCamera",function(){return CinematicCamera}),__webpack_require__.d(__webpack_exports__,"Car",function(){return Car}),__webpack_require__.d(__webpack_exports__,"DeviceOrientationControls",function(){return DeviceOrientationControls}),__webpack_require__.d(__webpack_exports__,"DragControls",function(){return DragControls}),__webpack_require__.d(__webpack_exports__,"EditorControls",function(){return EditorControls}),__webpack_require__.d(__webpack_exports__,"FirstPersonControls",function(){return FirstPersonControls}),__webpack_require__.d(__webpack_exports__,"FlyControls",function(){return FlyControls}),__webpack_require__.d(__webpack_exports__,"MapControls",function(){return MapControls}),__webpack_require__.d(__webpack_exports__,"OrbitControls",function(){return OrbitControls}),__webpack_require__.d(__webpack_exports__,"OrthographicTrackballControls",function(){return OrthographicTrackballControls}),__webpack_require__.d(__webpack_exports__,"PointerLockControls",function(){return PointerLockControls}),__webpack_require__.d(__webpack_exports__,"TrackballControls",function(){return TrackballControls}),__webpack_require__.d(__webpack_exports__,"TransformControls",function(){return TransformControls}),__webpack_require__.d(__webpack_exports__,"TransformControlsGizmo",function(){return TransformControlsGizmo}),__webpack_require__.d(__webpack_exports__,"TransformControlsPlane",function(){return TransformControlsPlane}),__webpack_require__.d(__webpack_exports__,"ConvexObjectBreaker",function(){return ConvexObjectBreaker}),__webpack_require__.d(__webpack_exports__,"GrannyKnot",function(){return GrannyKnot}),__webpack_require__.d(__webpack_exports__,"HeartCurve",function(){return HeartCurve}),__webpack_require__.d(__webpack_exports__,"VivianiCurve",function(){return VivianiCurve}),__webpack_require__.d(__webpack_exports__,"KnotCurve",function(){return KnotCurve}),__webpack_require__.d(__webpack_exports__,"HelixCurve",function(){return HelixCurve}),__webpack_require__.d(__webpack_exports__,"TrefoilKnot",function(){return TrefoilKnot}),__webpack_require__.d(__webpack_exports__,"TorusKnot",function(){return TorusKnot}),__webpack_require__.d(__webpack_exports__,"CinquefoilKnot",function(){return CinquefoilKnot}),__webpack_require__.d(__webpack_exports__,"TrefoilPolynomialKnot",function(){return TrefoilPolynomialKnot}),__webpack_require__.d(__webpack_exports__,"FigureEightPolynomialKnot",function(){return FigureEightPolynomialKnot}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot4a",function(){return DecoratedTorusKnot4a}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot4b",function(){return DecoratedTorusKnot4b}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot5a",function(){return DecoratedTorusKnot5a}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot5c",function(){return DecoratedTorusKnot5c}),__webpack_require__.d(__webpack_exports__,"NURBSCurve",function(){return NURBSCurve}),__webpack_require__.d(__webpack_exports__,"NURBSSurface",function(){return NURBSSurface}),__webpack_require__.d(__webpack_exports__,"NURBSUtils",function(){return NURBSUtils}),__webpack_require__.d(__webpack_exports__,"AnaglyphEffect",function(){return AnaglyphEffect}),__webpack_require__.d(__webpack_exports__,"AsciiEffect",function(){return AsciiEffect}),__webpack_require__.d(__webpack_exports__,"OutlineEffect",function(){return OutlineEffect}),__webpack_require__.d(__webpack_exports__,"ParallaxBarrierEffect",function(){return ParallaxBarrierEffect}),__webpack_require__.d(__webpack_exports__,"PeppersGhostEffect",function(){return PeppersGhostEffect}),__webpack_require__.d(__webpack_exports__,"StereoEffect",function(){return StereoEffect}),__webpack_require__.d(__webpack_exports__,"ColladaExporter",function(){return ColladaExporter}),__webpack_require__.d(__webpack_exports__,"GLTFExporter",function(){return GLTFExporter}),__webpack_require__.d(__webpack_exports__,"MMDExporter",function(){return MMDExporter}),__webpack_require__.d(__webpack_exports__,"OBJExporter",function(){return OBJExporter}),__webpack_require__.d(__webpack_exports__,"PLYExporter",function(){return PLYExporter}),__webpack_require__.d(__webpack_exports__,"STLExporter",function(){return STLExporter}),__webpack_require__.d(__webpack_exports__,"TypedGeometryExporter",function(){return TypedGeometryExporter}),__webpack_require__.d(__webpack_exports__,"BoxLineGeometry",function(){return BoxLineGeometry}),__webpack_require__.d(__webpack_exports__,"ConvexGeometry",function(){return ConvexGeometry}),__webpack_require__.d(__webpack_exports__,"ConvexBufferGeometry",function(){return ConvexBufferGeometry}),__webpack_require__.d(__webpack_exports__,"DecalGeometry",function(){return DecalGeometry}),__webpack_require__.d(__webpack_exports__,"hilbert2D",function(){return hilbert2D}),__webpack_require__.d(__webpack_exports__,"hilbert3D",function(){return hilbert3D}),__webpack_require__.d(__webpack_exports__,"LightningStrike",function(){return LightningStrike}),__webpack_require__.d(__webpack_exports__,"TeapotBufferGeometry",function(){return TeapotBufferGeometry}),__webpack_require__.d(__webpack_exports__,"GPUComputationRenderer",function(){return GPUComputationRenderer}),__webpack_require__.d(__webpack_exports__,"GPUParticleSystem",function(){return GPUParticleSystem}),__webpack_require__.d(__webpack_exports__,"GPUParticleContainer",function(){return GPUParticleContainer}),__webpack_require__.d(__webpack_exports__,"Gyroscope",function(){return Gyroscope}),__webpack_require__.d(__webpack_exports__,"ImprovedNoise",function(){return ImprovedNoise}),__webpack_require__.d(__webpack_exports__,"SelectionBox",function(){return SelectionBox}),__webpack_require__.d(__webpack_exports__,"SelectionHelper",function(){return SelectionHelper}),__webpack_require__.d(__webpack_exports__,"Line2",function(){return Line2}),__webpack_require__.d(__webpack_exports__,"LineGeometry",function(){return LineGeometry}),__webpack_require__.d(__webpack_exports__,"LineMaterial",function(){return LineMaterial}),__webpack_require__.d(__webpack_exports__,"LineSegments2",function(){return LineSegments2}),__webpack_require__.d(__webpack_exports__,"LineSegmentsGeometry",function(){return LineSegmentsGeometry}),__webpack_require__.d(__webpack_exports__,"Wireframe",function(){return Wireframe}),__webpack_require__.d(__webpack_exports__,"WireframeGeometry2",function(){return WireframeGeometry2}),__webpack_require__.d(__webpack_exports__,"ThreeMFLoader",function(){return ThreeMFLoader}),__webpack_require__.d(__webpack_exports__,"AMFLoader",function(){return AMFLoader}),__webpack_require__.d(__webpack_exports__,"AssimpJSONLoader",function(){return AssimpJSONLoader}),__webpack_require__.d(__webpack_exports__,"AssimpLoader",function(){return AssimpLoader}),__webpack_require__.d(__webpack_exports__,"AWDLoader",function(){return AWDLoader}),__webpack_require__.d(__webpack_exports__,"BabylonLoader",function(){return BabylonLoader}),__webpack_require__.d(__webpack_exports__,"BVHLoader",function(){return BVHLoader}),__webpack_require__.d(__webpack_exports__,"ColladaLoader",function(){return ColladaLoader}),__webpack_require__.d(__webpack_exports__,"DDSLoader",function(){return DDSLoader}),__webpack_require__.d(__webpack_exports__,"LegacyGLTFLoader",function(){return LegacyGLTFLoader}),__webpack_require__.d(__webpack_exports__,"LegacyJSONLoader",function(){return LegacyJSONLoader}),__webpack_require__.d(__webpack_exports__,"DRACOLoader",function(){return DRACOLoader$1}),__webpack_require__.d(__webpack_exports__,"CubemapGenerator",function(){return CubemapGenerator}),__webpack_require__.d(__webpack_exports__,"EXRLoader",function(){return EXRLoader}),__webpack_require__.d(__webpack_exports__,"FBXLoader",function(){return FBXLoader}),__webpack_require__.d(__webpack_exports__,"GCodeLoader",function(){return GCodeLoader}),__webpack_require__.d(__webpack_exports__,"GLTFLoader",function(){return GLTFLoader}),__webpack_require__.d(__webpack_exports__,"HDRCubeTextureLoader",function(){return HDRCubeTextureLoader}),__webpack_require__.d(__webpack_exports__,"KMZLoader",function(){return KMZLoader}),__webpack_require__.d(__webpack_exports__,"KTXLoader",function(){return KTXLoader}),__webpack_require__.d(__webpack_exports__,"LDrawLoader",function(){return LDrawLoader}),__webpack_require__.d(__webpack_exports__,"LoaderSupport",function(){return LoaderSupport}),__webpack_require__.d(__webpack_exports__,"MD2Loader",function(){return MD2Loader}),__webpack_require__.d(__webpack_exports__,"MMDLoader",function(){return MMDLoader}),__webpack_require__.d(__webpack_exports__,"MTLLoader",function(){return MTLLoader}),__webpack_require__.d(__webpack_exports__,"NodeMaterialLoader",function(){return NodeMaterialLoader}),__webpack_require__.d(__webpack_exports__,"OBJLoader",function(){return OBJLoader}),__webpack_require__.d(__webpack_exports__,"OBJLoader2",function(){return OBJLoader2}),__webpack_require__.d(__webpack_exports__,"PCDLoader",function(){return PCDLoader}),__webpack_require__.d(__webpack_exports__,"PDBLoader",function(){return PDBLoader}),__webpack_require__.d(__webpack_exports__,"PlayCanvasLoader",function(){return PlayCanvasLoader}),__webpack_require__.d(__webpack_exports__,"PLYLoader",function(){return PLYLoader}),__webpack_require__.d(__webpack_exports__,"PRWMLoader",function(){return PRWMLoader}),__webpack_require__.d(__webpack_exports__,"PVRLoader",function(){return PVRLoader}),__webpack_require__.d(__webpack_exports__,"HDRLoader",function(){return HDRLoader}),__webpack_require__.d(__webpack_exports__,"RGBELoader",function(){return RGBELoader}),__webpack_require__.d(__webpack_exports__,"STLLoader",function(){return STLLoader}),__webpack_require__.d(__webpack_exports__,"SVGLoader",function(){return SVGLoader}),__webpack_require__.d(__webpack_exports__,"TDSLoader",function(){return TDSLoader}),__webpack_require__.d(__webpack_exports__,"TGALoader",function(){return TGALoader}),__webpack_require__.d(__webpack_exports__,"TTFLoader",function(){return TTFLoader}),__webpack_require__.d(__webpack_exports__,"VRMLLoader",function(){return VRMLLoader}),__webpack_require__.d(__webpack_exports__,"VRMLoader",function(){return VRMLoader}),__webpack_require__.d(__webpack_exports__,"VTKLoader",function(){return VTKLoader}),__webpack_require__.d(__webpack_exports__,"MarchingCubes",function(){return MarchingCubes}),__webpack_require__.d(__webpack_exports__,"ColorConverter",function(){return ColorConverter}),__webpack_require__.d(__webpack_exports__,"Lut",function(){return Lut}),__webpack_require__.d(__webpack_exports__,"MD2Character",function(){return MD2Character}),__webpack_require__.d(__webpack_exports__,"MD2CharacterComplex",function(){return MD2CharacterComplex}),__webpack_require__.d(__webpack_exports__,"ExplodeModifier",function(){return ExplodeModifier}),__webpack_require__.d(__webpack_exports__,"SimplifyModifier",function(){return SimplifyModifier}),__webpack_require__.d(__webpack_exports__,"SubdivisionModifier",function(){return SubdivisionModifier}),__webpack_require__.d(__webpack_exports__,"TessellateModifier",function(){return TessellateModifier}),__webpack_require__.d(__webpack_exports__,"MorphAnimMesh",function(){return MorphAnimMesh}),__webpack_require__.d(__webpack_exports__,"MorphBlendMesh",function(){return MorphBlendMesh}),__webpack_require__.d(__webpack_exports__,"CameraNode",function(){return CameraNode}),__webpack_require__.d(__webpack_exports__,"ColorsNode",function(){return ColorsNode}),__webpack_require__.d(__webpack_exports__,"LightNode",function(){return LightNode}),__webpack_require__.d(__webpack_exports__,"NormalNode",function(){return NormalNode$1}),__webpack_require__.d(__webpack_exports__,"PositionNode",function(){return PositionNode}),__webpack_require__.d(__webpack_exports__,"ReflectNode",function(){return ReflectNode}),__webpack_require__.d(__webpack_exports__,"ResolutionNode",function(){return ResolutionNode}),__webpack_require__.d(__webpack_exports__,"ScreenUVNode",function(){return ScreenUVNode}),__webpack_require__.d(__webpack_exports__,"UVNode",function(){return UVNode}),__webpack_require__.d(__webpack_exports__,"BlinnExponentToRoughnessNode",function(){return BlinnExponentToRoughnessNode}),__webpack_require__.d(__webpack_exports__,"BlinnShininessExponentNode",function(){return BlinnShininessExponentNode}),__webpack_require__.d(__webpack_exports__,"RoughnessToBlinnExponentNode",function(){return RoughnessToBlinnExponentNode}),__webpack_require__.d(__webpack_exports__,"AttributeNode",function(){return AttributeNode}),__webpack_require__.d(__webpack_exports__,"ConstNode",function(){return ConstNode}),__webpack_require__.d(__webpack_exports__,"ExpressionNode",function(){return ExpressionNode}),__webpack_require__.d(__webpack_exports__,"FunctionCallNode",function(){return FunctionCallNode}),__webpack_require__.d(__webpack_exports__,"FunctionNode",function(){return FunctionNode}),__webpack_require__.d(__webpack_exports__,"InputNode",function(){return InputNode}),__webpack_require__.d(__webpack_exports__,"Node",function(){return Node$1}),__webpack_require__.d(__webpack_exports__,"NodeBuilder",function(){return NodeBuilder}),__webpack_require__.d(__webpack_exports__,"NodeFrame",function(){return NodeFrame}),__webpack_require__.d(__webpack_exports__,"NodeLib",function(){return NodeLib}),__webpack_require__.d(__webpack_exports__,"NodeUniform",function(){return NodeUniform}),__webpack_require__.d(__webpack_exports__,"NodeUtils",function(){return NodeUtils}),__webpack_require__.d(__webpack_exports__,"StructNode",function(){return StructNode}),__webpack_require__.d(__webpack_exports__,"TempNode",function(){return TempNode}),__webpack_require__.d(__webpack_exports__,"VarNode",function(){return VarNode}),__webpack_require__.d(__webpack_exports__,"BlurNode",function(){return BlurNode}),__webpack_require__.d(__webpack_exports__,"ColorAdjustmentNode",function(){return ColorAdjustmentNode}),__webpack_require__.d(__webpack_exports__,"LuminanceNode",function(){return LuminanceNode}),__webpack_require__.d(__webpack_exports__,"BoolNode",function(){return BoolNode}),__webpack_require__.d(__webpack_exports__,"ColorNode",function(){return ColorNode}),__webpack_require__.d(__webpack_exports__,"CubeTextureNode",function(){return CubeTextureNode}),__webpack_require__.d(__webpack_exports__,"FloatNode",function(){return FloatNode}),__webpack_require__.d(__webpack_exports__,"IntNode",function(){return IntNode}),__webpack_require__.d(__webpack_exports__,"Matrix3Node",function(){return Matrix3Node}),__webpack_require__.d(__webpack_exports__,"Matrix4Node",function(){return Matrix4Node}),__webpack_require__.d(__webpack_exports__,"PropertyNode",function(){return PropertyNode}),__webpack_require__.d(__webpack_exports__,"ReflectorNode",function(){return ReflectorNode}),__webpack_require__.d(__webpack_exports__,"RTTNode",function(){return RTTNode}),__webpack_require__.d(__webpack_exports__,"ScreenNode",function(){return ScreenNode}),__webpack_require__.d(__webpack_exports__,"TextureNode",function(){return TextureNode}),__webpack_require__.d(__webpack_exports__,"Vector2Node",function(){return Vector2Node}),__webpack_require__.d(__webpack_exports__,"Vector3Node",function(){return Vector3Node}),__webpack_require__.d(__webpack_exports__,"Vector4Node",function(){return Vector4Node}),__webpack_require__.d(__webpack_exports__,"MeshStandardNodeMaterial",function(){return MeshStandardNodeMaterial}),__webpack_require__.d(__webpack_exports__,"NodeMaterial",function(){return NodeMaterial}),__webpack_require__.d(__webpack_exports__,"MeshStandardNode",function(){return MeshStandardNode}),__webpack_require__.d(__webpack_exports__,"PhongNode",function(){return PhongNode}),__webpack_require__.d(__webpack_exports__,"RawNode",function(){return RawNode}),__webpack_require__.d(__webpack_exports__,"SpriteNode",function(){return SpriteNode}),__webpack_require__.d(__webpack_exports__,"StandardNode",function(){return StandardNode}),__webpack_require__.d(__webpack_exports__,"PhongNodeMaterial",function(){return PhongNodeMaterial}),__webpack_require__.d(__webpack_exports__,"SpriteNodeMaterial",function(){return SpriteNodeMaterial}),__webpack_require__.d(__webpack_exports__,"StandardNodeMaterial",function(){return StandardNodeMaterial}),__webpack_require__.d(__webpack_exports__,"CondNode",function(){return CondNode}),__webpack_require__.d(__webpack_exports__,"Math1Node",function(){return Math1Node}),__webpack_require__.d(__webpack_exports__,"Math2Node",function(){return Math2Node}),__webpack_require__.d(__webpack_exports__,"Math3Node",function(){return Math3Node}),__webpack_require__.d(__webpack_exports__,"OperatorNode",function(){return OperatorNode}),__webpack_require__.d(__webpack_exports__,"BumpMapNode",function(){return BumpMapNode}),__webpack_require__.d(__webpack_exports__,"NormalMapNode",function(){return NormalMapNode}),__webpack_require__.d(__webpack_exports__,"TextureCubeNode",function(){return TextureCubeNode}),__webpack_require__.d(__webpack_exports__,"TextureCubeUVNode",function(){return TextureCubeUVNode}),__webpack_require__.d(__webpack_exports__,"NodePass",function(){return NodePass}),__webpack_require__.d(__webpack_exports__,"NodePostProcessing",function(){return NodePostProcessing}),__webpack_require__.d(__webpack_exports__,"CheckerNode",function(){return CheckerNode}),__webpack_require__.d(__webpack_exports__,"NoiseNode",function(){return NoiseNode}),__webpack_require__.d(__webpack_exports__,"BypassNode",function(){return BypassNode}),__webpack_require__.d(__webpack_exports__,"ColorSpaceNode",function(){return ColorSpaceNode}),__webpack_require__.d(__webpack_exports__,"JoinNode",function(){return JoinNode}),__webpack_require__.d(__webpack_exports__,"MaxMIPLevelNode",function(){return MaxMIPLevelNode}),__webpack_require__.d(__webpack_exports__,"SwitchNode",function(){return SwitchNode}),__webpack_require__.d(__webpack_exports__,"TimerNode",function(){return TimerNode}),__webpack_require__.d(__webpack_exports__,"UVTransformNode",function(){return UVTransformNode}),__webpack_require__.d(__webpack_exports__,"VelocityNode",function(){return VelocityNode}),__webpack_require__.d(__webpack_exports__,"Fire",function(){return Fire}),__webpack_require__.d(__webpack_exports__,"Lensflare",function(){return Lensflare}),__webpack_require__.d(__webpack_exports__,"LensflareElement",function(){return LensflareElement}),__webpack_require__.d(__webpack_exports__,"LightningStorm",function(){return LightningStorm}),__webpack_require__.d(__webpack_exports__,"Reflector",function(){return Reflector}),__webpack_require__.d(__webpack_exports__,"ReflectorRTT",function(){return ReflectorRTT}),__webpack_require__.d(__webpack_exports__,"Refractor",function(){return Refractor}),__webpack_require__.d(__webpack_exports__,"ShadowMesh",function(){return ShadowMesh}),__webpack_require__.d(__webpack_exports__,"Sky",function(){return Sky}),__webpack_require__.d(__webpack_exports__,"Water",function(){return Water}),__webpack_require__.d(__webpack_exports__,"Water2",function(){return Water2}),__webpack_require__.d(__webpack_exports__,"Ocean",function(){return Ocean}),__webpack_require__.d(__webpack_exports__,"PMREMCubeUVPacker",function(){return PMREMCubeUVPacker}),__webpack_require__.d(__webpack_exports__,"PMREMGenerator",function(){return PMREMGenerator}),__webpack_require__.d(__webpack_exports__,"AdaptiveToneMappingPass",function(){return AdaptiveToneMappingPass}),__webpack_require__.d(__webpack_exports__,"AfterimagePass",function(){return AfterimagePass}),__webpack_require__.d(__webpack_exports__,"BloomPass",function(){return BloomPass}),__webpack_require__.d(__webpack_exports__,"BokehPass",function(){return BokehPass}),__webpack_require__.d(__webpack_exports__,"ClearPass",function(){return ClearPass}),__webpack_require__.d(__webpack_exports__,"CubeTexturePass",function(){return CubeTexturePass}),__webpack_require__.d(__webpack_exports__,"DotScreenPass",function(){return DotScreenPass}),__webpack_require__.d(__webpack_exports__,"EffectComposer",function(){return EffectComposer}),__webpack_require__.d(__webpack_exports__,"FilmPass",function(){return FilmPass}),__webpack_require__.d(__webpack_exports__,"GlitchPass",function(){return GlitchPass}),__webpack_require__.d(__webpack_exports__,"HalftonePass",function(){return HalftonePass}),__webpack_require__.d(__webpack_exports__,"MaskPass",function(){return MaskPass}),__webpack_require__.d(__webpack_exports__,"ClearMaskPass",function(){return ClearMaskPass}),__webpack_require__.d(__webpack_exports__,"OutlinePass",function(){return OutlinePass}),__webpack_require__.d(__webpack_exports__,"Pass",function(){return Pass}),__webpack_require__.d(__webpack_exports__,"RenderPass",function(){return RenderPass}),__webpack_require__.d(__webpack_exports__,"SAOPass",function(){return SAOPass}),__webpack_require__.d(__webpack_exports__,"SavePass",function(){return SavePass}),__webpack_require__.d(__webpack_exports__,"ShaderPass",function(){return ShaderPass}),__webpack_require__.d(__webpack_exports__,"SMAAPass",function(){return SMAAPass}),__webpack_require__.d(__webpack_exports__,"SSAARenderPass",function(){return SSAARenderPass}),__webpack_require__.d(__webpack_exports__,"SSAOPass",function(){return SSAOPass}),__webpack_require__.d(__webpack_exports__,"TAARenderPass",function(){return TAARenderPass}),__webpack_require__.d(__webpack_exports__,"TexturePass",function(){return TexturePass}),__webpack_require__.d(__webpack_exports__,"UnrealBloomPass",function(){return UnrealBloomPass}),__webpack_require__.d(__webpack_exports__,"PRNG",function(){return PRNG}),__webpack_require__.d(__webpack_exports__,"QuickHull",function(){return QuickHull}),__webpack_require__.d(__webpack_exports__,"CSS2DObject",function(){return CSS2DObject}),__webpack_require__.d(__webpack_exports__,"CSS2DRenderer",function(){return CSS2DRenderer}),__webpack_require__.d(__webpack_exports__,"CSS3DObject",function(){return CSS3DObject}),__webpack_require__.d(__webpack_exports__,"CSS3DSprite",function(){return CSS3DSprite}),__webpack_require__.d(__webpack_exports__,"CSS3DRenderer",function(){return CSS3DRenderer}),__webpack_require__.d(__webpack_exports__,"RenderableObject",function(){return RenderableObject}),__webpack_require__.d(__webpack_exports__,"RenderableFace",function(){return RenderableFace}),__webpack_require__.d(__webpack_exports__,"RenderableVertex",function(){return RenderableVertex}),__webpack_require__.d(__webpack_exports__,"RenderableLine",function(){return RenderableLine}),__webpack_require__.d(__webpack_exports__,"RenderableSprite",function(){return RenderableSprite}),__webpack_require__.d(__webpack_exports__,"Projector",function(){return Projector}),__webpack_require__.d(__webpack_exports__,"RaytracingRenderer",function(){return RaytracingRenderer}),__webpack_require__.d(__webpack_exports__,"SoftwareRenderer",function(){return SoftwareRenderer}),__webpack_require__.d(__webpack_exports__,"SVGObject",function(){return SVGObject}),__webpack_require__.d(__webpack_exports__,"SVGRenderer",function(){return SVGRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLDeferredRenderer",function(){return WebGLDeferredRenderer}),__webpack_require__.d(__webpack_exports__,"RollerCoasterGeometry",function(){return RollerCoasterGeometry}),__webpack_require__.d(__webpack_exports__,"RollerCoasterLiftersGeometry",function(){return RollerCoasterLiftersGeometry}),__webpack_require__.d(__webpack_exports__,"RollerCoasterShadowGeometry",function(){return RollerCoasterShadowGeometry}),__webpack_require__.d(__webpack_exports__,"SkyGeometry",function(){return SkyGeometry}),__webpack_require__.d(__webpack_exports__,"TreesGeometry",function(){return TreesGeometry}),__webpack_require__.d(__webpack_exports__,"ShaderGodRays",function(){return ShaderGodRays}),__webpack_require__.d(__webpack_exports__,"AfterimageShader",function(){return AfterimageShader}),__webpack_require__.d(__webpack_exports__,"BasicShader",function(){return BasicShader}),__webpack_require__.d(__webpack_exports__,"BleachBypassShader",function(){return BleachBypassShader}),__webpack_require__.d(__webpack_exports__,"BlendShader",function(){return BlendShader}),__webpack_require__.d(__webpack_exports__,"BokehShader",function(){return BokehShader}),__webpack_require__.d(__webpack_exports__,"BokehShader2",function(){return BokehShader2}),__webpack_require__.d(__webpack_exports__,"BokehDepthShader",function(){return BokehDepthShader}),__webpack_require__.d(__webpack_exports__,"BrightnessContrastShader",function(){return BrightnessContrastShader}),__webpack_require__.d(__webpack_exports__,"ColorCorrectionShader",function(){return ColorCorrectionShader}),__webpack_require__.d(__webpack_exports__,"ColorifyShader",function(){return ColorifyShader}),__webpack_require__.d(__webpack_exports__,"ConvolutionShader",function(){return ConvolutionShader}),__webpack_require__.d(__webpack_exports__,"CopyShader",function(){return CopyShader}),__webpack_require__.d(__webpack_exports__,"DepthLimitedBlurShader",function(){return DepthLimitedBlurShader}),__webpack_require__.d(__webpack_exports__,"BlurShaderUtils",function(){return BlurShaderUtils}),__webpack_require__.d(__webpack_exports__,"DigitalGlitch",function(){return DigitalGlitch}),__webpack_require__.d(__webpack_exports__,"DOFMipMapShader",function(){return DOFMipMapShader}),__webpack_require__.d(__webpack_exports__,"DotScreenShader",function(){return DotScreenShader}),__webpack_require__.d(__webpack_exports__,"FilmShader",function(){return FilmShader}),__webpack_require__.d(__webpack_exports__,"FocusShader",function(){return FocusShader}),__webpack_require__.d(__webpack_exports__,"FreiChenShader",function(){return FreiChenShader}),__webpack_require__.d(__webpack_exports__,"FresnelShader",function(){return FresnelShader}),__webpack_require__.d(__webpack_exports__,"FXAAShader",function(){return FXAAShader}),__webpack_require__.d(__webpack_exports__,"GammaCorrectionShader",function(){return GammaCorrectionShader}),__webpack_require__.d(__webpack_exports__,"HalftoneShader",function(){return HalftoneShader}),__webpack_require__.d(__webpack_exports__,"HorizontalBlurShader",function(){return HorizontalBlurShader}),__webpack_require__.d(__webpack_exports__,"HorizontalTiltShiftShader",function(){return HorizontalTiltShiftShader}),__webpack_require__.d(__webpack_exports__,"HueSaturationShader",function(){return HueSaturationShader}),__webpack_require__.d(__webpack_exports__,"KaleidoShader",function(){return KaleidoShader}),__webpack_require__.d(__webpack_exports__,"LuminosityHighPassShader",function(){return LuminosityHighPassShader}),__webpack_require__.d(__webpack_exports__,"LuminosityShader",function(){return LuminosityShader}),__webpack_require__.d(__webpack_exports__,"MirrorShader",function(){return MirrorShader}),__webpack_require__.d(__webpack_exports__,"NormalMapShader",function(){return NormalMapShader}),__webpack_require__.d(__webpack_exports__,"ParallaxShader",function(){return ParallaxShader}),__webpack_require__.d(__webpack_exports__,"PixelShader",function(){return PixelShader}),__webpack_require__.d(__webpack_exports__,"RGBShiftShader",function(){return RGBShiftShader}),__webpack_require__.d(__webpack_exports__,"SAOShader",function(){return SAOShader}),__webpack_require__.d(__webpack_exports__,"SepiaShader",function(){return SepiaShader}),__webpack_require__.d(__webpack_exports__,"SMAAShader",function(){return SMAAShader}),__webpack_require__.d(__webpack_exports__,"SobelOperatorShader",function(){return SobelOperatorShader}),__webpack_require__.d(__webpack_exports__,"SSAOShader",function(){return SSAOShader}),__webpack_require__.d(__webpack_exports__,"SSAODepthShader",function(){return SSAODepthShader}),__webpack_require__.d(__webpack_exports__,"SSAOBlurShader",function(){return SSAOBlurShader}),__webpack_require__.d(__webpack_exports__,"TechnicolorShader",function(){return TechnicolorShader}),__webpack_require__.d(__webpack_exports__,"ToneMapShader",function(){return ToneMapShader}),__webpack_require__.d(__webpack_exports__,"TriangleBlurShader",function(){return TriangleBlurShader}),__webpack_require__.d(__webpack_exports__,"UnpackDepthRGBAShader",function(){return UnpackDepthRGBAShader}),__webpack_require__.d(__webpack_exports__,"VerticalBlurShader",function(){return VerticalBlurShader}),__webpack_require__.d(__webpack_exports__,"VerticalTiltShiftShader",function(){return VerticalTiltShiftShader}),__webpack_require__.d(__webpack_exports__,"VignetteShader",function(){return VignetteShader}),__webpack_require__.d(__webpack_exports__,"VolumeRenderShader1",function(){return VolumeRenderShader1}),__webpack_require__.d(__webpack_exports__,"WaterRefractionShader",function(){return WaterRefractionShader}),__webpack_require__.d(__webpack_exports__,"ShaderSkin",function(){return ShaderSkin}),__webpack_require__.d(__webpack_exports__,"ShaderTerrain",function(){return ShaderTerrain}),__webpack_require__.d(__webpack_exports__,"ShaderToon",function(){return ShaderToon}),__webpack_require__.d(__webpack_exports__,"TranslucentShader",function(){return TranslucentShader}),__webpack_require__.d(__webpack_exports__,"SimplexNoise",function(){return SimplexNoise}),__webpack_require__.d(__webpack_exports__,"TimelinerController",function(){return TimelinerController}),__webpack_require__.d(__webpack_exports__,"TypedArrayUtils",function(){return TypedArrayUtils}),__webpack_require__.d(__webpack_exports__,"BufferGeometryUtils",function(){return BufferGeometryUtils}),__webpack_require__.d(__webpack_exports__,"GeometryUtils",function(){return GeometryUtils}),__webpack_require__.d(__webpack_exports__,"MathUtils",function(){return MathUtils}),__webpack_require__.d(__webpack_exports__,"SceneUtils",function(){return SceneUtils}),__webpack_require__.d(__webpack_exports__,"ShadowMapViewer",function(){return ShadowMapViewer}),__webpack_require__.d(__webpack_exports__,"SkeletonUtils",function(){return SkeletonUtils}),__webpack_require__.d(__webpack_exports__,"UVsDebug",function(){return UVsDebug}),__webpack_require__.d(__webpack_exports__,"VolumeSlice",function(){return VolumeSlice}),__webpack_require__.d(__webpack_exports__,"DaydreamController",function(){return DaydreamController}),__webpack_require__.d(__webpack_exports__,"GearVRController",function(){return GearVRController}),__webpack_require__.d(__webpack_exports__,"PaintViveController",function(){return PaintViveController}),__webpack_require__.d(__webpack_exports__,"ViveController",function(){return ViveController}),__webpack_require__.d(__webpack_exports__,"WebVR",function(){return WebVR}),__webpack_require__.d(__webpack_exports__,"WebGL",function(){return WebGL}),__webpack_require__.d(__webpack_exports__,"AnimationAction",function(){return AnimationAction}),__webpack_require__.d(__webpack_exports__,"AnimationClip",function(){return AnimationClip}),__webpack_require__.d(__webpack_exports__,"AnimationMixer",function(){return AnimationMixer}),__webpack_require__.d(__webpack_exports__,"AnimationObjectGroup",function(){return AnimationObjectGroup}),__webpack_require__.d(__webpack_exports__,"AnimationUtils",function(){return AnimationUtils}),__webpack_require__.d(__webpack_exports__,"KeyframeTrack",function(){return KeyframeTrack}),__webpack_require__.d(__webpack_exports__,"PropertyBinding",function(){return PropertyBinding}),__webpack_require__.d(__webpack_exports__,"PropertyMixer",function(){return PropertyMixer}),__webpack_require__.d(__webpack_exports__,"BooleanKeyframeTrack",function(){return BooleanKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"ColorKeyframeTrack",function(){return ColorKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"NumberKeyframeTrack",function(){return NumberKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"QuaternionKeyframeTrack",function(){return QuaternionKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"StringKeyframeTrack",function(){return StringKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"VectorKeyframeTrack",function(){return VectorKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"Audio",function(){return Audio}),__webpack_require__.d(__webpack_exports__,"AudioAnalyser",function(){return AudioAnalyser}),__webpack_require__.d(__webpack_exports__,"AudioContext",function(){return AudioContext}),__webpack_require__.d(__webpack_exports__,"AudioListener",function(){return AudioListener}),__webpack_require__.d(__webpack_exports__,"PositionalAudio",function(){return PositionalAudio}),__webpack_require__.d(__webpack_exports__,"ArrayCamera",function(){return ArrayCamera}),__webpack_require__.d(__webpack_exports__,"Camera",function(){return Camera}),__webpack_require__.d(__webpack_exports__,"CubeCamera",function(){return CubeCamera}),__webpack_require__.d(__webpack_exports__,"OrthographicCamera",function(){return OrthographicCamera}),__webpack_require__.d(__webpack_exports__,"PerspectiveCamera",function(){return PerspectiveCamera}),__webpack_require__.d(__webpack_exports__,"StereoCamera",function(){return StereoCamera}),__webpack_require__.d(__webpack_exports__,"REVISION",function(){return REVISION}),__webpack_require__.d(__webpack_exports__,"MOUSE",function(){return MOUSE}),__webpack_require__.d(__webpack_exports__,"CullFaceNone",function(){return CullFaceNone}),__webpack_require__.d(__webpack_exports__,"CullFaceBack",function(){return CullFaceBack}),__webpack_require__.d(__webpack_exports__,"CullFaceFront",function(){return CullFaceFront}),__webpack_require__.d(__webpack_exports__,"CullFaceFrontBack",function(){return CullFaceFrontBack}),__webpack_require__.d(__webpack_exports__,"FrontFaceDirectionCW",function(){return FrontFaceDirectionCW}),__webpack_require__.d(__webpack_exports__,"FrontFaceDirectionCCW",function(){return FrontFaceDirectionCCW}),__webpack_require__.d(__webpack_exports__,"BasicShadowMap",function(){return BasicShadowMap}),__webpack_require__.d(__webpack_exports__,"PCFShadowMap",function(){return PCFShadowMap}),__webpack_require__.d(__webpack_exports__,"PCFSoftShadowMap",function(){return PCFSoftShadowMap}),__webpack_require__.d(__webpack_exports__,"FrontSide",function(){return FrontSide}),__webpack_require__.d(__webpack_exports__,"BackSide",function(){return BackSide}),__webpack_require__.d(__webpack_exports__,"DoubleSide",function(){return DoubleSide}),__webpack_require__.d(__webpack_exports__,"FlatShading",function(){return FlatShading}),__webpack_require__.d(__webpack_exports__,"SmoothShading",function(){return SmoothShading}),__webpack_require__.d(__webpack_exports__,"NoColors",function(){return NoColors}),__webpack_require__.d(__webpack_exports__,"FaceColors",function(){return FaceColors}),__webpack_require__.d(__webpack_exports__,"VertexColors",function(){return VertexColors}),__webpack_require__.d(__webpack_exports__,"NoBlending",function(){return NoBlending}),__webpack_require__.d(__webpack_exports__,"NormalBlending",function(){return NormalBlending}),__webpack_require__.d(__webpack_exports__,"AdditiveBlending",function(){return AdditiveBlending}),__webpack_require__.d(__webpack_exports__,"SubtractiveBlending",function(){return SubtractiveBlending}),__webpack_require__.d(__webpack_exports__,"MultiplyBlending",function(){return MultiplyBlending}),__webpack_require__.d(__webpack_exports__,"CustomBlending",function(){return CustomBlending}),__webpack_require__.d(__webpack_exports__,"AddEquation",function(){return AddEquation}),__webpack_require__.d(__webpack_exports__,"SubtractEquation",function(){return SubtractEquation}),__webpack_require__.d(__webpack_exports__,"ReverseSubtractEquation",function(){return ReverseSubtractEquation}),__webpack_require__.d(__webpack_exports__,"MinEquation",function(){return MinEquation}),__webpack_require__.d(__webpack_exports__,"MaxEquation",function(){return MaxEquation}),__webpack_require__.d(__webpack_exports__,"ZeroFactor",function(){return ZeroFactor}),__webpack_require__.d(__webpack_exports__,"OneFactor",function(){return OneFactor}),__webpack_require__.d(__webpack_exports__,"SrcColorFactor",function(){return SrcColorFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusSrcColorFactor",function(){return OneMinusSrcColorFactor}),__webpack_require__.d(__webpack_exports__,"SrcAlphaFactor",function(){return SrcAlphaFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusSrcAlphaFactor",function(){return OneMinusSrcAlphaFactor}),__webpack_require__.d(__webpack_exports__,"DstAlphaFactor",function(){return DstAlphaFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusDstAlphaFactor",function(){return OneMinusDstAlphaFactor}),__webpack_require__.d(__webpack_exports__,"DstColorFactor",function(){return DstColorFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusDstColorFactor",function(){return OneMinusDstColorFactor}),__webpack_require__.d(__webpack_exports__,"SrcAlphaSaturateFactor",function(){return SrcAlphaSaturateFactor}),__webpack_require__.d(__webpack_exports__,"NeverDepth",function(){return NeverDepth}),__webpack_require__.d(__webpack_exports__,"AlwaysDepth",function(){return AlwaysDepth}),__webpack_require__.d(__webpack_exports__,"LessDepth",function(){return LessDepth}),__webpack_require__.d(__webpack_exports__,"LessEqualDepth",function(){return LessEqualDepth}),__webpack_require__.d(__webpack_exports__,"EqualDepth",function(){return EqualDepth}),__webpack_require__.d(__webpack_exports__,"GreaterEqualDepth",function(){return GreaterEqualDepth}),__webpack_require__.d(__webpack_exports__,"GreaterDepth",function(){return GreaterDepth}),__webpack_require__.d(__webpack_exports__,"NotEqualDepth",function(){return NotEqualDepth}),__webpack_require__.d(__webpack_exports__,"MultiplyOperation",function(){return MultiplyOperation}),__webpack_require__.d(__webpack_exports__,"MixOperation",function(){return MixOperation}),__webpack_require__.d(__webpack_exports__,"AddOperation",function(){return AddOperation}),__webpack_require__.d(__webpack_exports__,"NoToneMapping",function(){return NoToneMapping}),__webpack_require__.d(__webpack_exports__,"LinearToneMapping",function(){return LinearToneMapping}),__webpack_require__.d(__webpack_exports__,"ReinhardToneMapping",function(){return ReinhardToneMapping}),__webpack_require__.d(__webpack_exports__,"Uncharted2ToneMapping",function(){return Uncharted2ToneMapping}),__webpack_require__.d(__webpack_exports__,"CineonToneMapping",function(){return CineonToneMapping}),__webpack_require__.d(__webpack_exports__,"ACESFilmicToneMapping",function(){return ACESFilmicToneMapping}),__webpack_require__.d(__webpack_exports__,"UVMapping",function(){return UVMapping}),__webpack_require__.d(__webpack_exports__,"CubeReflectionMapping",function(){return CubeReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeRefractionMapping",function(){return CubeRefractionMapping}),__webpack_require__.d(__webpack_exports__,"EquirectangularReflectionMapping",function(){return EquirectangularReflectionMapping}),__webpack_require__.d(__webpack_exports__,"EquirectangularRefractionMapping",function(){return EquirectangularRefractionMapping}),__webpack_require__.d(__webpack_exports__,"SphericalReflectionMapping",function(){return SphericalReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeUVReflectionMapping",function(){return CubeUVReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeUVRefractionMapping",function(){return CubeUVRefractionMapping}),__webpack_require__.d(__webpack_exports__,"RepeatWrapping",function(){return RepeatWrapping}),__webpack_require__.d(__webpack_exports__,"ClampToEdgeWrapping",function(){return ClampToEdgeWrapping}),__webpack_require__.d(__webpack_exports__,"MirroredRepeatWrapping",function(){return MirroredRepeatWrapping}),__webpack_require__.d(__webpack_exports__,"NearestFilter",function(){return NearestFilter}),__webpack_require__.d(__webpack_exports__,"NearestMipMapNearestFilter",function(){return NearestMipMapNearestFilter}),__webpack_require__.d(__webpack_exports__,"NearestMipMapLinearFilter",function(){return NearestMipMapLinearFilter}),__webpack_require__.d(__webpack_exports__,"LinearFilter",function(){return LinearFilter}),__webpack_require__.d(__webpack_exports__,"LinearMipMapNearestFilter",function(){return LinearMipMapNearestFilter}),__webpack_require__.d(__webpack_exports__,"LinearMipMapLinearFilter",function(){return LinearMipMapLinearFilter}),__webpack_require__.d(__webpack_exports__,"UnsignedByteType",function(){return UnsignedByteType}),__webpack_require__.d(__webpack_exports__,"ByteType",function(){return ByteType}),__webpack_require__.d(__webpack_exports__,"ShortType",function(){return ShortType}),__webpack_require__.d(__webpack_exports__,"UnsignedShortType",function(){return UnsignedShortType}),__webpack_require__.d(__webpack_exports__,"IntType",function(){return IntType}),__webpack_require__.d(__webpack_exports__,"UnsignedIntType",function(){return UnsignedIntType}),__webpack_require__.d(__webpack_exports__,"FloatType",function(){return FloatType}),__webpack_require__.d(__webpack_exports__,"HalfFloatType",function(){return HalfFloatType}),__webpack_require__.d(__webpack_exports__,"UnsignedShort4444Type",function(){return UnsignedShort4444Type}),__webpack_require__.d(__webpack_exports__,"UnsignedShort5551Type",function(){return UnsignedShort5551Type}),__webpack_require__.d(__webpack_exports__,"UnsignedShort565Type",function(){return UnsignedShort565Type}),__webpack_require__.d(__webpack_exports__,"UnsignedInt248Type",function(){return UnsignedInt248Type}),__webpack_require__.d(__webpack_exports__,"AlphaFormat",function(){return AlphaFormat}),__webpack_require__.d(__webpack_exports__,"RGBFormat",function(){return RGBFormat}),__webpack_require__.d(__webpack_exports__,"RGBAFormat",function(){return RGBAFormat}),__webpack_require__.d(__webpack_exports__,"LuminanceFormat",function(){return LuminanceFormat}),__webpack_require__.d(__webpack_exports__,"LuminanceAlphaFormat",function(){return LuminanceAlphaFormat}),__webpack_require__.d(__webpack_exports__,"RGBEFormat",function(){return RGBEFormat}),__webpack_require__.d(__webpack_exports__,"DepthFormat",function(){return DepthFormat}),__webpack_require__.d(__webpack_exports__,"DepthStencilFormat",function(){return DepthStencilFormat}),__webpack_require__.d(__webpack_exports__,"RedFormat",function(){return RedFormat}),__webpack_require__.d(__webpack_exports__,"RGB_S3TC_DXT1_Format",function(){return RGB_S3TC_DXT1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT1_Format",function(){return RGBA_S3TC_DXT1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT3_Format",function(){return RGBA_S3TC_DXT3_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT5_Format",function(){return RGBA_S3TC_DXT5_Format}),__webpack_require__.d(__webpack_exports__,"RGB_PVRTC_4BPPV1_Format",function(){return RGB_PVRTC_4BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGB_PVRTC_2BPPV1_Format",function(){return RGB_PVRTC_2BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_PVRTC_4BPPV1_Format",function(){return RGBA_PVRTC_4BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_PVRTC_2BPPV1_Format",function(){return RGBA_PVRTC_2BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGB_ETC1_Format",function(){return RGB_ETC1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_4x4_Format",function(){return RGBA_ASTC_4x4_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_5x4_Format",function(){return RGBA_ASTC_5x4_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_5x5_Format",function(){return RGBA_ASTC_5x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_6x5_Format",function(){return RGBA_ASTC_6x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_6x6_Format",function(){return RGBA_ASTC_6x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x5_Format",function(){return RGBA_ASTC_8x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x6_Format",function(){return RGBA_ASTC_8x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x8_Format",function(){return RGBA_ASTC_8x8_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x5_Format",function(){return RGBA_ASTC_10x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x6_Format",function(){return RGBA_ASTC_10x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x8_Format",function(){return RGBA_ASTC_10x8_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x10_Format",function(){return RGBA_ASTC_10x10_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_12x10_Format",function(){return RGBA_ASTC_12x10_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_12x12_Format",function(){return RGBA_ASTC_12x12_Format}),__webpack_require__.d(__webpack_exports__,"LoopOnce",function(){return LoopOnce}),__webpack_require__.d(__webpack_exports__,"LoopRepeat",function(){return LoopRepeat}),__webpack_require__.d(__webpack_exports__,"LoopPingPong",function(){return LoopPingPong}),__webpack_require__.d(__webpack_exports__,"InterpolateDiscrete",function(){return InterpolateDiscrete}),__webpack_require__.d(__webpack_exports__,"InterpolateLinear",function(){return InterpolateLinear}),__webpack_require__.d(__webpack_exports__,"InterpolateSmooth",function(){return InterpolateSmooth}),__webpack_require__.d(__webpack_exports__,"ZeroCurvatureEnding",function(){return ZeroCurvatureEnding}),__webpack_require__.d(__webpack_exports__,"ZeroSlopeEnding",function(){return ZeroSlopeEnding}),__webpack_require__.d(__webpack_exports__,"WrapAroundEnding",function(){return WrapAroundEnding}),__webpack_require__.d(__webpack_exports__,"TrianglesDrawMode",function(){return TrianglesDrawMode}),__webpack_require__.d(__webpack_exports__,"TriangleStripDrawMode",function(){return TriangleStripDrawMode}),__webpack_require__.d(__webpack_exports__,"TriangleFanDrawMode",function(){return TriangleFanDrawMode}),__webpack_require__.d(__webpack_exports__,"LinearEncoding",function(){return LinearEncoding}),__webpack_require__.d(__webpack_exports__,"sRGBEncoding",function(){return sRGBEncoding}),__webpack_require__.d(__webpack_exports__,"GammaEncoding",function(){return GammaEncoding}),__webpack_require__.d(__webpack_exports__,"RGBEEncoding",function(){return RGBEEncoding}),__webpack_require__.d(__webpack_exports__,"LogLuvEncoding",function(){return LogLuvEncoding}),__webpack_require__.d(__webpack_exports__,"RGBM7Encoding",function(){return RGBM7Encoding}),__webpack_require__.d(__webpack_exports__,"RGBM16Encoding",function(){return RGBM16Encoding}),__webpack_require__.d(__webpack_exports__,"RGBDEncoding",function(){return RGBDEncoding}),__webpack_require__.d(__webpack_exports__,"BasicDepthPacking",function(){return BasicDepthPacking}),__webpack_require__.d(__webpack_exports__,"RGBADepthPacking",function(){return RGBADepthPacking}),__webpack_require__.d(__webpack_exports__,"TangentSpaceNormalMap",function(){return TangentSpaceNormalMap}),__webpack_require__.d(__webpack_exports__,"ObjectSpaceNormalMap",function(){return ObjectSpaceNormalMap}),__webpack_require__.d(__webpack_exports__,"Float64BufferAttribute",function(){return Float64BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Float32BufferAttribute",function(){return Float32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint32BufferAttribute",function(){return Uint32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int32BufferAttribute",function(){return Int32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint16BufferAttribute",function(){return Uint16BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int16BufferAttribute",function(){return Int16BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint8ClampedBufferAttribute",function(){return Uint8ClampedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint8BufferAttribute",function(){return Uint8BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int8BufferAttribute",function(){return Int8BufferAttribute}),__webpack_require__.d(__webpack_exports__,"BufferAttribute",function(){return BufferAttribute}),__webpack_require__.d(__webpack_exports__,"BufferGeometry",function(){return BufferGeometry}),__webpack_require__.d(__webpack_exports__,"Clock",function(){return Clock}),__webpack_require__.d(__webpack_exports__,"DirectGeometry",function(){return DirectGeometry}),__webpack_require__.d(__webpack_exports__,"EventDispatcher",function(){return EventDispatcher}),__webpack_require__.d(__webpack_exports__,"Face3",function(){return Face3}),__webpack_require__.d(__webpack_exports__,"Geometry",function(){return Geometry}),__webpack_require__.d(__webpack_exports__,"InstancedBufferAttribute",function(){return InstancedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"InstancedBufferGeometry",function(){return InstancedBufferGeometry}),__webpack_require__.d(__webpack_exports__,"InstancedInterleavedBuffer",function(){return InstancedInterleavedBuffer}),__webpack_require__.d(__webpack_exports__,"InterleavedBuffer",function(){return InterleavedBuffer}),__webpack_require__.d(__webpack_exports__,"InterleavedBufferAttribute",function(){return InterleavedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"Layers",function(){return Layers}),__webpack_require__.d(__webpack_exports__,"Object3D",function(){return Object3D}),__webpack_require__.d(__webpack_exports__,"Raycaster",function(){return Raycaster}),__webpack_require__.d(__webpack_exports__,"Uniform",function(){return Uniform}),__webpack_require__.d(__webpack_exports__,"Curve",function(){return Curve}),__webpack_require__.d(__webpack_exports__,"CurvePath",function(){return CurvePath}),__webpack_require__.d(__webpack_exports__,"Font",function(){return Font}),__webpack_require__.d(__webpack_exports__,"CatmullRom",function(){return CatmullRom}),__webpack_require__.d(__webpack_exports__,"QuadraticBezier",function(){return QuadraticBezier}),__webpack_require__.d(__webpack_exports__,"CubicBezier",function(){return CubicBezier}),__webpack_require__.d(__webpack_exports__,"Path",function(){return Path}),__webpack_require__.d(__webpack_exports__,"Shape",function(){return Shape}),__webpack_require__.d(__webpack_exports__,"ShapePath",function(){return ShapePath}),__webpack_require__.d(__webpack_exports__,"ArcCurve",function(){return ArcCurve}),__webpack_require__.d(__webpack_exports__,"CatmullRomCurve3",function(){return CatmullRomCurve3}),__webpack_require__.d(__webpack_exports__,"CubicBezierCurve",function(){return CubicBezierCurve}),__webpack_require__.d(__webpack_exports__,"CubicBezierCurve3",function(){return CubicBezierCurve3}),__webpack_require__.d(__webpack_exports__,"EllipseCurve",function(){return EllipseCurve}),__webpack_require__.d(__webpack_exports__,"LineCurve",function(){return LineCurve}),__webpack_require__.d(__webpack_exports__,"LineCurve3",function(){return LineCurve3}),__webpack_require__.d(__webpack_exports__,"QuadraticBezierCurve",function(){return QuadraticBezierCurve}),__webpack_require__.d(__webpack_exports__,"QuadraticBezierCurve3",function(){return QuadraticBezierCurve3}),__webpack_require__.d(__webpack_exports__,"SplineCurve",function(){return SplineCurve}),__webpack_require__.d(__webpack_exports__,"Earcut",function(){return Earcut}),__webpack_require__.d(__webpack_exports__,"ImageUtils",function(){return ImageUtils}),__webpack_require__.d(__webpack_exports__,"ImmediateRenderObject",function(){return ImmediateRenderObject}),__webpack_require__.d(__webpack_exports__,"ShapeUtils",function(){return ShapeUtils}),__webpack_require__.d(__webpack_exports__,"BoxGeometry",function(){return BoxGeometry}),__webpack_require__.d(__webpack_exports__,"BoxBufferGeometry",function(){return BoxBufferGeometry}),__webpack_require__.d(__webpack_exports__,"CircleGeometry",function(){return CircleGeometry}),__webpack_require__.d(__webpack_exports__,"CircleBufferGeometry",function(){return CircleBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ConeGeometry",function(){return ConeGeometry}),__webpack_require__.d(__webpack_exports__,"ConeBufferGeometry",function(){return ConeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"CylinderGeometry",function(){return CylinderGeometry}),__webpack_require__.d(__webpack_exports__,"CylinderBufferGeometry",function(){return CylinderBufferGeometry}),__webpack_require__.d(__webpack_exports__,"DodecahedronGeometry",function(){return DodecahedronGeometry}),__webpack_require__.d(__webpack_exports__,"DodecahedronBufferGeometry",function(){return DodecahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"EdgesGeometry",function(){return EdgesGeometry}),__webpack_require__.d(__webpack_exports__,"ExtrudeGeometry",function(){return ExtrudeGeometry}),__webpack_require__.d(__webpack_exports__,"ExtrudeBufferGeometry",function(){return ExtrudeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"IcosahedronGeometry",function(){return IcosahedronGeometry}),__webpack_require__.d(__webpack_exports__,"IcosahedronBufferGeometry",function(){return IcosahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"LatheGeometry",function(){return LatheGeometry}),__webpack_require__.d(__webpack_exports__,"LatheBufferGeometry",function(){return LatheBufferGeometry}),__webpack_require__.d(__webpack_exports__,"OctahedronGeometry",function(){return OctahedronGeometry}),__webpack_require__.d(__webpack_exports__,"OctahedronBufferGeometry",function(){return OctahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ParametricGeometry",function(){return ParametricGeometry}),__webpack_require__.d(__webpack_exports__,"ParametricBufferGeometry",function(){return ParametricBufferGeometry}),__webpack_require__.d(__webpack_exports__,"PlaneGeometry",function(){return PlaneGeometry}),__webpack_require__.d(__webpack_exports__,"PlaneBufferGeometry",function(){return PlaneBufferGeometry}),__webpack_require__.d(__webpack_exports__,"PolyhedronGeometry",function(){return PolyhedronGeometry}),__webpack_require__.d(__webpack_exports__,"PolyhedronBufferGeometry",function(){return PolyhedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"RingGeometry",function(){return RingGeometry}),__webpack_require__.d(__webpack_exports__,"RingBufferGeometry",function(){return RingBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ShapeGeometry",function(){return ShapeGeometry}),__webpack_require__.d(__webpack_exports__,"ShapeBufferGeometry",function(){return ShapeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"SphereGeometry",function(){return SphereGeometry}),__webpack_require__.d(__webpack_exports__,"SphereBufferGeometry",function(){return SphereBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TetrahedronGeometry",function(){return TetrahedronGeometry}),__webpack_require__.d(__webpack_exports__,"TetrahedronBufferGeometry",function(){return TetrahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TextGeometry",function(){return TextGeometry}),__webpack_require__.d(__webpack_exports__,"TextBufferGeometry",function(){return TextBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TorusGeometry",function(){return TorusGeometry}),__webpack_require__.d(__webpack_exports__,"TorusBufferGeometry",function(){return TorusBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TorusKnotGeometry",function(){return TorusKnotGeometry}),__webpack_require__.d(__webpack_exports__,"TorusKnotBufferGeometry",function(){return TorusKnotBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TubeGeometry",function(){return TubeGeometry}),__webpack_require__.d(__webpack_exports__,"TubeBufferGeometry",function(){return TubeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"WireframeGeometry",function(){return WireframeGeometry}),__webpack_require__.d(__webpack_exports__,"ArrowHelper",function(){return ArrowHelper}),__webpack_require__.d(__webpack_exports__,"AxesHelper",function(){return AxesHelper}),__webpack_require__.d(__webpack_exports__,"Box3Helper",function(){return Box3Helper}),__webpack_require__.d(__webpack_exports__,"BoxHelper",function(){return BoxHelper}),__webpack_require__.d(__webpack_exports__,"CameraHelper",function(){return CameraHelper}),__webpack_require__.d(__webpack_exports__,"DirectionalLightHelper",function(){return DirectionalLightHelper}),__webpack_require__.d(__webpack_exports__,"FaceNormalsHelper",function(){return FaceNormalsHelper}),__webpack_require__.d(__webpack_exports__,"GridHelper",function(){return GridHelper}),__webpack_require__.d(__webpack_exports__,"HemisphereLightHelper",function(){return HemisphereLightHelper}),__webpack_require__.d(__webpack_exports__,"PlaneHelper",function(){return PlaneHelper}),__webpack_require__.d(__webpack_exports__,"PointLightHelper",function(){return PointLightHelper}),__webpack_require__.d(__webpack_exports__,"PolarGridHelper",function(){return PolarGridHelper}),__webpack_require__.d(__webpack_exports__,"PositionalAudioHelper",function(){return PositionalAudioHelper}),__webpack_require__.d(__webpack_exports__,"RectAreaLightHelper",function(){return RectAreaLightHelper}),__webpack_require__.d(__webpack_exports__,"SkeletonHelper",function(){return SkeletonHelper}),__webpack_require__.d(__webpack_exports__,"SpotLightHelper",function(){return SpotLightHelper}),__webpack_require__.d(__webpack_exports__,"VertexNormalsHelper",function(){return VertexNormalsHelper}),__webpack_require__.d(__webpack_exports__,"AmbientLight",function(){return AmbientLight}),__webpack_require__.d(__webpack_exports__,"DirectionalLight",function(){return DirectionalLight}),__webpack_require__.d(__webpack_exports__,"DirectionalLightShadow",function(){return DirectionalLightShadow}),__webpack_require__.d(__webpack_exports__,"HemisphereLight",function(){return HemisphereLight}),__webpack_require__.d(__webpack_exports__,"Light",function(){return Light}),__webpack_require__.d(__webpack_exports__,"LightShadow",function(){return LightShadow}),__webpack_require__.d(__webpack_exports__,"PointLight",function(){return PointLight}),__webpack_require__.d(__webpack_exports__,"RectAreaLight",function(){return RectAreaLight}),__webpack_require__.d(__webpack_exports__,"SpotLight",function(){return SpotLight}),__webpack_require__.d(__webpack_exports__,"SpotLightShadow",function(){return SpotLightShadow}),__webpack_require__.d(__webpack_exports__,"AnimationLoader",function(){return AnimationLoader}),__webpack_require__.d(__webpack_exports__,"AudioLoader",function(){return AudioLoader}),__webpack_require__.d(__webpack_exports__,"BufferGeometryLoader",function(){return BufferGeometryLoader}),__webpack_require__.d(__webpack_exports__,"Cache",function(){return Cache}),__webpack_require__.d(__webpack_exports__,"CompressedTextureLoader",function(){return CompressedTextureLoader}),__webpack_require__.d(__webpack_exports__,"CubeTextureLoader",function(){return CubeTextureLoader}),__webpack_require__.d(__webpack_exports__,"DataTextureLoader",function(){return DataTextureLoader}),__webpack_require__.d(__webpack_exports__,"FileLoader",function(){return FileLoader}),__webpack_require__.d(__webpack_exports__,"FontLoader",function(){return FontLoader}),__webpack_require__.d(__webpack_exports__,"ImageBitmapLoader",function(){return ImageBitmapLoader}),__webpack_require__.d(__webpack_exports__,"ImageLoader",function(){return ImageLoader}),__webpack_require__.d(__webpack_exports__,"Loader",function(){return Loader$1}),__webpack_require__.d(__webpack_exports__,"LoaderUtils",function(){return LoaderUtils}),__webpack_require__.d(__webpack_exports__,"DefaultLoadingManager",function(){return DefaultLoadingManager}),__webpack_require__.d(__webpack_exports__,"LoadingManager",function(){return LoadingManager}),__webpack_require__.d(__webpack_exports__,"MaterialLoader",function(){return MaterialLoader}),__webpack_require__.d(__webpack_exports__,"ObjectLoader",function(){return ObjectLoader}),__webpack_require__.d(__webpack_exports__,"TextureLoader",function(){return TextureLoader}),__webpack_require__.d(__webpack_exports__,"LineBasicMaterial",function(){return LineBasicMaterial}),__webpack_require__.d(__webpack_exports__,"LineDashedMaterial",function(){return LineDashedMaterial}),__webpack_require__.d(__webpack_exports__,"Material",function(){return Material$1}),__webpack_require__.d(__webpack_exports__,"MeshBasicMaterial",function(){return MeshBasicMaterial}),__webpack_require__.d(__webpack_exports__,"MeshDepthMaterial",function(){return MeshDepthMaterial}),__webpack_require__.d(__webpack_exports__,"MeshDistanceMaterial",function(){return MeshDistanceMaterial}),__webpack_require__.d(__webpack_exports__,"MeshLambertMaterial",function(){return MeshLambertMaterial}),__webpack_require__.d(__webpack_exports__,"MeshMatcapMaterial",function(){return MeshMatcapMaterial}),__webpack_require__.d(__webpack_exports__,"MeshNormalMaterial",function(){return MeshNormalMaterial}),__webpack_require__.d(__webpack_exports__,"MeshPhongMaterial",function(){return MeshPhongMaterial}),__webpack_require__.d(__webpack_exports__,"MeshPhysicalMaterial",function(){return MeshPhysicalMaterial}),__webpack_require__.d(__webpack_exports__,"MeshStandardMaterial",function(){return MeshStandardMaterial}),__webpack_require__.d(__webpack_exports__,"MeshToonMaterial",function(){return MeshToonMaterial}),__webpack_require__.d(__webpack_exports__,"PointsMaterial",function(){return PointsMaterial}),__webpack_require__.d(__webpack_exports__,"RawShaderMaterial",function(){return RawShaderMaterial}),__webpack_require__.d(__webpack_exports__,"ShaderMaterial",function(){return ShaderMaterial}),__webpack_require__.d(__webpack_exports__,"ShadowMaterial",function(){return ShadowMaterial}),__webpack_require__.d(__webpack_exports__,"SpriteMaterial",function(){return SpriteMaterial}),__webpack_require__.d(__webpack_exports__,"Box2",function(){return Box2}),__webpack_require__.d(__webpack_exports__,"Box3",function(){return Box3}),__webpack_require__.d(__webpack_exports__,"Color",function(){return Color}),__webpack_require__.d(__webpack_exports__,"Cylindrical",function(){return Cylindrical}),__webpack_require__.d(__webpack_exports__,"Euler",function(){return Euler}),__webpack_require__.d(__webpack_exports__,"Frustum",function(){return Frustum}),__webpack_require__.d(__webpack_exports__,"Interpolant",function(){return Interpolant}),__webpack_require__.d(__webpack_exports__,"CubicInterpolant",function(){return CubicInterpolant}),__webpack_require__.d(__webpack_exports__,"DiscreteInterpolant",function(){return DiscreteInterpolant}),__webpack_require__.d(__webpack_exports__,"LinearInterpolant",function(){return LinearInterpolant}),__webpack_require__.d(__webpack_exports__,"QuaternionLinearInterpolant",function(){return QuaternionLinearInterpolant}),__webpack_require__.d(__webpack_exports__,"Line3",function(){return Line3}),__webpack_require__.d(__webpack_exports__,"_Math",function(){return _Math}),__webpack_require__.d(__webpack_exports__,"Matrix3",function(){return Matrix3}),__webpack_require__.d(__webpack_exports__,"Matrix4",function(){return Matrix4}),__webpack_require__.d(__webpack_exports__,"Plane",function(){return Plane}),__webpack_require__.d(__webpack_exports__,"Quaternion",function(){return Quaternion}),__webpack_require__.d(__webpack_exports__,"Ray",function(){return Ray}),__webpack_require__.d(__webpack_exports__,"Sphere",function(){return Sphere}),__webpack_require__.d(__webpack_exports__,"Spherical",function(){return Spherical}),__webpack_require__.d(__webpack_exports__,"Triangle",function(){return Triangle}),__webpack_require__.d(__webpack_exports__,"Vector2",function(){return Vector2}),__webpack_require__.d(__webpack_exports__,"Vector3",function(){return Vector3}),__webpack_require__.d(__webpack_exports__,"Vector4",function(){return Vector4}),__webpack_require__.d(__webpack_exports__,"Bone",function(){return Bone}),__webpack_require__.d(__webpack_exports__,"Group",function(){return Group}),__webpack_require__.d(__webpack_exports__,"Line",function(){return Line}),__webpack_require__.d(__webpack_exports__,"LineLoop",function(){return LineLoop}),__webpack_require__.d(__webpack_exports__,"LineSegments",function(){return LineSegments}),__webpack_require__.d(__webpack_exports__,"LOD",function(){return LOD}),__webpack_require__.d(__webpack_exports__,"Mesh",function(){return Mesh}),__webpack_require__.d(__webpack_exports__,"Points",function(){return Points}),__webpack_require__.d(__webpack_exports__,"Skeleton",function(){return Skeleton}),__webpack_require__.d(__webpack_exports__,"SkinnedMesh",function(){return SkinnedMesh}),__webpack_require__.d(__webpack_exports__,"Sprite",function(){return Sprite}),__webpack_require__.d(__webpack_exports__,"ShaderChunk",function(){return ShaderChunk}),__webpack_require__.d(__webpack_exports__,"ShaderLib",function(){return ShaderLib}),__webpack_require__.d(__webpack_exports__,"UniformsLib",function(){return UniformsLib}),__webpack_require__.d(__webpack_exports__,"UniformsUtils",function(){return UniformsUtils}),__webpack_require__.d(__webpack_exports__,"WebGLAnimation",function(){return WebGLAnimation}),__webpack_require__.d(__webpack_exports__,"WebGLAttributes",function(){return WebGLAttributes}),__webpack_require__.d(__webpack_exports__,"WebGLBackground",function(){return WebGLBackground}),__webpack_require__.d(__webpack_exports__,"WebGLBufferRenderer",function(){return WebGLBufferRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLCapabilities",function(){return WebGLCapabilities}),__webpack_require__.d(__webpack_exports__,"WebGLClipping",function(){return WebGLClipping}),__webpack_require__.d(__webpack_exports__,"WebGLExtensions",function(){return WebGLExtensions}),__webpack_require__.d(__webpack_exports__,"WebGLGeometries",function(){return WebGLGeometries}),__webpack_require__.d(__webpack_exports__,"WebGLIndexedBufferRenderer",function(){return WebGLIndexedBufferRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLInfo",function(){return WebGLInfo}),__webpack_require__.d(__webpack_exports__,"WebGLLights",function(){return WebGLLights}),__webpack_require__.d(__webpack_exports__,"WebGLMorphtargets",function(){return WebGLMorphtargets}),__webpack_require__.d(__webpack_exports__,"WebGLObjects",function(){return WebGLObjects}),__webpack_require__.d(__webpack_exports__,"WebGLProgram",function(){return WebGLProgram}),__webpack_require__.d(__webpack_exports__,"WebGLPrograms",function(){return WebGLPrograms}),__webpack_require__.d(__webpack_exports__,"WebGLProperties",function(){return WebGLProperties}),__webpack_require__.d(__webpack_exports__,"WebGLRenderLists",function(){return WebGLRenderLists}),__webpack_require__.d(__webpack_exports__,"WebGLRenderStates",function(){return WebGLRenderStates}),__webpack_require__.d(__webpack_exports__,"WebGLShader",function(){return WebGLShader}),__webpack_require__.d(__webpack_exports__,"WebGLShadowMap",function(){return WebGLShadowMap}),__webpack_require__.d(__webpack_exports__,"WebGLState",function(){return WebGLState}),__webpack_require__.d(__webpack_exports__,"WebGLTextures",function(){return WebGLTextures}),__webpack_require__.d(__webpack_exports__,"WebGLUniforms",function(){return WebGLUniforms}),__webpack_require__.d(__webpack_exports__,"WebGLUtils",function(){return WebGLUtils}),__webpack_require__.d(__webpack_exports__,"WebGL2Renderer",function(){return WebGL2Renderer}),__webpack_require__.d(__webpack_exports__,"WebGLMultisampleRenderTarget",function(){return WebGLMultisampleRenderTarget}),__webpack_require__.d(__webpack_exports__,"WebGLRenderer",function(){return WebGLRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLRenderTarget",function(){return WebGLRenderTarget}),__webpack_require__.d(__webpack_exports__,"WebGLRenderTargetCube",function(){return WebGLRenderTargetCube}),__webpack_require__.d(__webpack_exports__,"WebVRManager",function(){return WebVRManager}),__webpack_require__.d(__webpack_exports__,"setProjectionFromUnion",function(){return setProjectionFromUnion}),__webpack_require__.d(__webpack_exports__,"WebXRManager",function(){return WebXRManager}),__webpack_require__.d(__webpack_exports__,"Fog",function(){return Fog}),__webpack_require__.d(__webpack_exports__,"FogExp2",function(){return FogExp2}),__webpack_require__.d(__webpack_exports__,"Scene",function(){return Scene}),__webpack_require__.d(__webpack_exports__,"CanvasTexture",function(){return CanvasTexture}),__webpack_require__.d(__webpack_exports__,"CompressedTexture",function(){return CompressedTexture}),__webpack_require__.d(__webpack_exports__,"CubeTexture",function(){return CubeTexture}),__webpack_require__.d(__webpack_exports__,"DataTexture",function(){return DataTexture}),__webpack_require__.d(__webpack_exports__,"DataTexture3D",function(){return DataTexture3D}),__webpack_require__.d(__webpack_exports__,"DepthTexture",function(){return DepthTexture}),__webpack_require__.d(__webpack_exports__,"Texture",function(){return Texture}),__webpack_require__.d(__webpack_exports__,"VideoTexture",function(){return VideoTexture}),__webpack_require__.d(__webpack_exports__,"arrayMin",function(){return arrayMin}),__webpack_require__.d(__webpack_exports__,"arrayMax",function(){return arrayMax}),void 0===Number.EPSILON&&(Number.EPSILON=Math.pow(2,-52)),void 0===Number.isInteger&&(Number.isInteger=function(e){return"number"==typeof e&&isFinite(e)&&Math.floor(e)===e}),void 0===Math.sign&&(Math.sign=function(e){return e<0?-1:e>0?1:+e}),"name"in Function.prototype==!1&&Object.defineProperty(Function.prototype,"name",{get:function(){return this.toString().match(/^\s*function\s*([^\(\s]*)/)[1]}}),void 0===Object.assign&&(Object.assign=function(e){var t=arguments;if(null==e)throw new TypeError("Cannot convert undefined or null to object");for(var i=Object(e),r=1;r<arguments.length;r++){var n=t[r];if(null!=n)for(var o in n)Object.prototype.hasOwnProperty.call(n,o)&&(i[o]=n[o])}return i});var _Math={DEG2RAD:Math.PI/180,RAD2DEG:180/Math.PI,generateUUID:function(){for(var e=[],t=0;t<256;t++)e[t]=(t<16?"0":"")+t.toString(16);return function(){var t=4294967295*Math.random()|0,i=4294967295*Math.random()|0,r=4294967295*Math.random()|0,n=4294967295*Math.random()|0;return(e[255&t]+e[t>>8&255]+e[t>>16&255]+e[t>>24&255]+"-"+e[255&i]+e[i>>8&255]+"-"+e[i>>16&15|64]+e[i>>24&255]+"-"+e[63&r|128]+e[r>>8&255]+"-"+e[r>>16&255]+e[r>>24&255]+e[255&n]+e[n>>8&255]+e[n>>16&255]+e[n>>24&255]).toUpperCase()}}(),clamp:function(e,t,i){return Math.max(t,Math.min(i,e))},euclideanModulo:function(e,t){return(e%t+t)%t},mapLinear:function(e,t,i,r,n){return r+(e-t)*(n-r)/(i-t)},lerp:function(e,t,i){return(1-i)*e+i*t},smoothstep:function(e,t,i){return e<=t?0:e>=i?1:(e=(e-t)/(i-t))*e*(3-2*e)},smootherstep:function(e,t,i){return e<=t?0:e>=i?1:(e=(e-t)/(i-t))*e*e*(e*(6*e-15)+10)},randInt:function(e,t){return e+Math.floor(Math.random()*(t-e+1))},randFloat:function(e,t){return e+Math.random()*(t-e)},randFloatSpread:function(e){return e*(.5-Math.random())},degToRad:function(e){return e*_Math.DEG2RAD},radToDeg:function(e){return e*_Math.RAD2DEG},isPowerOfTwo:function(e){return 0==(e&e-1)&&0!==e},ceilPowerOfTwo:function(e){return Math.pow(2,Math.ceil(Math.log(e)/Math.LN2))},floorPowerOfTwo:function(e){return Math.pow(2,Math.floor(Math.log(e)/Math.LN2))}},vector,matrix,x,y,z,zero,one,v1,min,max,quaternion,q;function Matrix4(){this.elements=[1,0,0,0,0,1,0,0,0,0,1,0,0,0,0,1],arguments.length>0&&console.error("Matrix4: the constructor no longer reads arguments. use .set() instead.")}function Vector3(e,t,i){this.x=e||0,this.y=t||0,this.z=i||0}function Quaternion(e,t,i,r){this._x=e||0,this._y=t||0,this._z=i||0,this._w=void 0!==r?r:1}function EventDispatcher(){}function Euler(e,t,i,r){this._x=e||0,this._y=t||0,this._z=i||0,this._order=r||Euler.DefaultOrder}function Layers(){this.mask=1}function Matrix3(){this.elements=[1,0,0,0,1,0,0,0,1],arguments.length>0&&console.error("Matrix3: the constructor no longer reads arguments. use .set() instead.")}Object.assign(Matrix4.prototype,{isMatrix4:!0,set:function(e,t,i,r,n,o,a,s,l,u,h,c,d,p,f,m){var v=this.elements;return v[0]=e,v[4]=t,v[8]=i,v[12]=r,v[1]=n,v[5]=o,v[9]=a,v[13]=s,v[2]=l,v[6]=u,v[10]=h,v[14]=c,v[3]=d,v[7]=p,v[11]=f,v[15]=m,this},identity:function(){return this.set(1,0,0,0,0,1,0,0,0,0,1,0,0,0,0,1),this},clone:function(){return(new Matrix4).fromArray(this.elements)},copy:function(e){var t=this.elements,i=e.elements;return t[0]=i[0],t[1]=i[1],t[2]=i[2],t[3]=i[3],t[4]=i[4],t[5]=i[5],t[6]=i[6],t[7]=i[7],t[8]=i[8],t[9]=i[9],t[10]=i[10],t[11]=i[11],t[12]=i[12],t[13]=i[13],t[14]=i[14],t[15]=i[15],this},copyPosition:function(e){var t=this.elements,i=e.elements;return t[12]=i[12],t[13]=i[13],t[14]=i[14],this},extractBasis:function(e,t,i){return e.setFromMatrixColumn(this,0),t.setFromMatrixColumn(this,1),i.setFromMatrixColumn(this,2),this},makeBasis:function(e,t,i){return this.set(e.x,t.x,i.x,0,e.y,t.y,i.y,0,e.z,t.z,i.z,0,0,0,0,1),this},extractRotation:(v1=new Vector3,function(e){var t=this.elements,i=e.elements,r=1/v1.setFromMatrixColumn(e,0).length(),n=1/v1.setFromMatrixColumn(e,1).length(),o=1/v1.setFromMatrixColumn(e,2).length();return t[0]=i[0]*r,t[1]=i[1]*r,t[2]=i[2]*r,t[3]=0,t[4]=i[4]*n,t[5]=i[5]*n,t[6]=i[6]*n,t[7]=0,t[8]=i[8]*o,t[9]=i[9]*o,t[10]=i[10]*o,t[11]=0,t[12]=0,t[13]=0,t[14]=0,t[15]=1,this}),makeRotationFromEuler:function(e){e&&e.isEuler||console.error("Matrix4: .makeRotationFromEuler() now expects a Euler rotation rather than a Vector3 and order.");var t=this.elements,i=e.x,r=e.y,n=e.z,o=Math.cos(i),a=Math.sin(i),s=Math.cos(r),l=Math.sin(r),u=Math.cos(n),h=Math.sin(n);if("XYZ"===e.order){var c=o*u,d=o*h,p=a*u,f=a*h;t[0]=s*u,t[4]=-s*h,t[8]=l,t[1]=d+p*l,t[5]=c-f*l,t[9]=-a*s,t[2]=f-c*l,t[6]=p+d*l,t[10]=o*s}else if("YXZ"===e.order){var m=s*u,v=s*h,g=l*u,y=l*h;t[0]=m+y*a,t[4]=g*a-v,t[8]=o*l,t[1]=o*h,t[5]=o*u,t[9]=-a,t[2]=v*a-g,t[6]=y+m*a,t[10]=o*s}else if("ZXY"===e.order){m=s*u,v=s*h,g=l*u,y=l*h;t[0]=m-y*a,t[4]=-o*h,t[8]=g+v*a,t[1]=v+g*a,t[5]=o*u,t[9]=y-m*a,t[2]=-o*l,t[6]=a,t[10]=o*s}else if("ZYX"===e.order){c=o*u,d=o*h,p=a*u,f=a*h;t[0]=s*u,t[4]=p*l-d,t[8]=c*l+f,t[1]=s*h,t[5]=f*l+c,t[9]=d*l-p,t[2]=-l,t[6]=a*s,t[10]=o*s}else if("YZX"===e.order){var _=o*s,b=o*l,x=a*s,w=a*l;t[0]=s*u,t[4]=w-_*h,t[8]=x*h+b,t[1]=h,t[5]=o*u,t[9]=-a*u,t[2]=-l*u,t[6]=b*h+x,t[10]=_-w*h}else if("XZY"===e.order){_=o*s,b=o*l,x=a*s,w=a*l;t[0]=s*u,t[4]=-h,t[8]=l*u,t[1]=_*h+w,t[5]=o*u,t[9]=b*h-x,t[2]=x*h-b,t[6]=a*u,t[10]=w*h+_}return t[3]=0,t[7]=0,t[11]=0,t[12]=0,t[13]=0,t[14]=0,t[15]=1,this},makeRotationFromQuaternion:(zero=new Vector3(0,0,0),one=new Vector3(1,1,1),function(e){return this.compose(zero,e,one)}),lookAt:(x=new Vector3,y=new Vector3,z=new Vector3,function(e,t,i){var r=this.elements;return z.subVectors(e,t),0===z.lengthSq()&&(z.z=1),z.normalize(),x.crossVectors(i,z),0===x.lengthSq()&&(1===Math.abs(i.z)?z.x+=1e-4:z.z+=1e-4,z.normalize(),x.crossVectors(i,z)),x.normalize(),y.crossVectors(z,x),r[0]=x.x,r[4]=y.x,r[8]=z.x,r[1]=x.y,r[5]=y.y,r[9]=z.y,r[2]=x.z,r[6]=y.z,r[10]=z.z,this}),multiply:function(e,t){return void 0!==t?(console.warn("Matrix4: .multiply() now only accepts one argument. Use .multiplyMatrices( a, b ) instead."),this.multiplyMatrices(e,t)):this.multiplyMatrices(this,e)},premultiply:function(e){return this.multiplyMatrices(e,this)},multiplyMatrices:function(e,t){var i=e.elements,r=t.elements,n=this.elements,o=i[0],a=i[4],s=i[8],l=i[12],u=i[1],h=i[5],c=i[9],d=i[13],p=i[2],f=i[6],m=i[10],v=i[14],g=i[3],y=i[7],_=i[11],b=i[15],x=r[0],w=r[4],S=r[8],M=r[12],T=r[1],A=r[5],C=r[9],L=r[13],N=r[2],k=r[6],P=r[10],E=r[14],D=r[3],O=r[7],R=r[11],F=r[15];return n[0]=o*x+a*T+s*N+l*D,n[4]=o*w+a*A+s*k+l*O,n[8]=o*S+a*C+s*P+l*R,n[12]=o*M+a*L+s*E+l*F,n[1]=u*x+h*T+c*N+d*D,n[5]=u*w+h*A+c*k+d*O,n[9]=u*S+h*C+c*P+d*R,n[13]=u*M+h*L+c*E+d*F,n[2]=p*x+f*T+m*N+v*D,n[6]=p*w+f*A+m*k+v*O,n[10]=p*S+f*C+m*P+v*R,n[14]=p*M+f*L+m*E+v*F,n[3]=g*x+y*T+_*N+b*D,n[7]=g*w+y*A+_*k+b*O,n[11]=g*S+y*C+_*P+b*R,n[15]=g*M+y*L+_*E+b*F,this},multiplyScalar:function(e){var t=this.elements;return t[0]*=e,t[4]*=e,t[8]*=e,t[12]*=e,t[1]*=e,t[5]*=e,t[9]*=e,t[13]*=e,t[2]*=e,t[6]*=e,t[10]*=e,t[14]*=e,t[3]*=e,t[7]*=e,t[11]*=e,t[15]*=e,this},applyToBufferAttribute:function(){var e=new Vector3;return function(t){for(var i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.applyMatrix4(this),t.setXYZ(i,e.x,e.y,e.z);return t}}(),determinant:function(){var e=this.elements,t=e[0],i=e[4],r=e[8],n=e[12],o=e[1],a=e[5],s=e[9],l=e[13],u=e[2],h=e[6],c=e[10],d=e[14];return e[3]*(+n*s*h-r*l*h-n*a*c+i*l*c+r*a*d-i*s*d)+e[7]*(+t*s*d-t*l*c+n*o*c-r*o*d+r*l*u-n*s*u)+e[11]*(+t*l*h-t*a*d-n*o*h+i*o*d+n*a*u-i*l*u)+e[15]*(-r*a*u-t*s*h+t*a*c+r*o*h-i*o*c+i*s*u)},transpose:function(){var e,t=this.elements;return e=t[1],t[1]=t[4],t[4]=e,e=t[2],t[2]=t[8],t[8]=e,e=t[6],t[6]=t[9],t[9]=e,e=t[3],t[3]=t[12],t[12]=e,e=t[7],t[7]=t[13],t[13]=e,e=t[11],t[11]=t[14],t[14]=e,this},setPosition:function(e){var t=this.elements;return t[12]=e.x,t[13]=e.y,t[14]=e.z,this},getInverse:function(e,t){var i=this.elements,r=e.elements,n=r[0],o=r[1],a=r[2],s=r[3],l=r[4],u=r[5],h=r[6],c=r[7],d=r[8],p=r[9],f=r[10],m=r[11],v=r[12],g=r[13],y=r[14],_=r[15],b=p*y*c-g*f*c+g*h*m-u*y*m-p*h*_+u*f*_,x=v*f*c-d*y*c-v*h*m+l*y*m+d*h*_-l*f*_,w=d*g*c-v*p*c+v*u*m-l*g*m-d*u*_+l*p*_,S=v*p*h-d*g*h-v*u*f+l*g*f+d*u*y-l*p*y,M=n*b+o*x+a*w+s*S;if(0===M){var T="Matrix4: .getInverse() can't invert matrix, determinant is 0";if(!0===t)throw new Error(T);return console.warn(T),this.identity()}var A=1/M;return i[0]=b*A,i[1]=(g*f*s-p*y*s-g*a*m+o*y*m+p*a*_-o*f*_)*A,i[2]=(u*y*s-g*h*s+g*a*c-o*y*c-u*a*_+o*h*_)*A,i[3]=(p*h*s-u*f*s-p*a*c+o*f*c+u*a*m-o*h*m)*A,i[4]=x*A,i[5]=(d*y*s-v*f*s+v*a*m-n*y*m-d*a*_+n*f*_)*A,i[6]=(v*h*s-l*y*s-v*a*c+n*y*c+l*a*_-n*h*_)*A,i[7]=(l*f*s-d*h*s+d*a*c-n*f*c-l*a*m+n*h*m)*A,i[8]=w*A,i[9]=(v*p*s-d*g*s-v*o*m+n*g*m+d*o*_-n*p*_)*A,i[10]=(l*g*s-v*u*s+v*o*c-n*g*c-l*o*_+n*u*_)*A,i[11]=(d*u*s-l*p*s-d*o*c+n*p*c+l*o*m-n*u*m)*A,i[12]=S*A,i[13]=(d*g*a-v*p*a+v*o*f-n*g*f-d*o*y+n*p*y)*A,i[14]=(v*u*a-l*g*a-v*o*h+n*g*h+l*o*y-n*u*y)*A,i[15]=(l*p*a-d*u*a+d*o*h-n*p*h-l*o*f+n*u*f)*A,this},scale:function(e){var t=this.elements,i=e.x,r=e.y,n=e.z;return t[0]*=i,t[4]*=r,t[8]*=n,t[1]*=i,t[5]*=r,t[9]*=n,t[2]*=i,t[6]*=r,t[10]*=n,t[3]*=i,t[7]*=r,t[11]*=n,this},getMaxScaleOnAxis:function(){var e=this.elements,t=e[0]*e[0]+e[1]*e[1]+e[2]*e[2],i=e[4]*e[4]+e[5]*e[5]+e[6]*e[6],r=e[8]*e[8]+e[9]*e[9]+e[10]*e[10];return Math.sqrt(Math.max(t,i,r))},makeTranslation:function(e,t,i){return this.set(1,0,0,e,0,1,0,t,0,0,1,i,0,0,0,1),this},makeRotationX:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(1,0,0,0,0,t,-i,0,0,i,t,0,0,0,0,1),this},makeRotationY:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(t,0,i,0,0,1,0,0,-i,0,t,0,0,0,0,1),this},makeRotationZ:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(t,-i,0,0,i,t,0,0,0,0,1,0,0,0,0,1),this},makeRotationAxis:function(e,t){var i=Math.cos(t),r=Math.sin(t),n=1-i,o=e.x,a=e.y,s=e.z,l=n*o,u=n*a;return this.set(l*o+i,l*a-r*s,l*s+r*a,0,l*a+r*s,u*a+i,u*s-r*o,0,l*s-r*a,u*s+r*o,n*s*s+i,0,0,0,0,1),this},makeScale:function(e,t,i){return this.set(e,0,0,0,0,t,0,0,0,0,i,0,0,0,0,1),this},makeShear:function(e,t,i){return this.set(1,t,i,0,e,1,i,0,e,t,1,0,0,0,0,1),this},compose:function(e,t,i){var r=this.elements,n=t._x,o=t._y,a=t._z,s=t._w,l=n+n,u=o+o,h=a+a,c=n*l,d=n*u,p=n*h,f=o*u,m=o*h,v=a*h,g=s*l,y=s*u,_=s*h,b=i.x,x=i.y,w=i.z;return r[0]=(1-(f+v))*b,r[1]=(d+_)*b,r[2]=(p-y)*b,r[3]=0,r[4]=(d-_)*x,r[5]=(1-(c+v))*x,r[6]=(m+g)*x,r[7]=0,r[8]=(p+y)*w,r[9]=(m-g)*w,r[10]=(1-(c+f))*w,r[11]=0,r[12]=e.x,r[13]=e.y,r[14]=e.z,r[15]=1,this},decompose:(vector=new Vector3,matrix=new Matrix4,function(e,t,i){var r=this.elements,n=vector.set(r[0],r[1],r[2]).length(),o=vector.set(r[4],r[5],r[6]).length(),a=vector.set(r[8],r[9],r[10]).length();this.determinant()<0&&(n=-n),e.x=r[12],e.y=r[13],e.z=r[14],matrix.copy(this);var s=1/n,l=1/o,u=1/a;return matrix.elements[0]*=s,matrix.elements[1]*=s,matrix.elements[2]*=s,matrix.elements[4]*=l,matrix.elements[5]*=l,matrix.elements[6]*=l,matrix.elements[8]*=u,matrix.elements[9]*=u,matrix.elements[10]*=u,t.setFromRotationMatrix(matrix),i.x=n,i.y=o,i.z=a,this}),makePerspective:function(e,t,i,r,n,o){void 0===o&&console.warn("Matrix4: .makePerspective() has been redefined and has a new signature. Please check the docs.");var a=this.elements,s=2*n/(t-e),l=2*n/(i-r),u=(t+e)/(t-e),h=(i+r)/(i-r),c=-(o+n)/(o-n),d=-2*o*n/(o-n);return a[0]=s,a[4]=0,a[8]=u,a[12]=0,a[1]=0,a[5]=l,a[9]=h,a[13]=0,a[2]=0,a[6]=0,a[10]=c,a[14]=d,a[3]=0,a[7]=0,a[11]=-1,a[15]=0,this},makeOrthographic:function(e,t,i,r,n,o){var a=this.elements,s=1/(t-e),l=1/(i-r),u=1/(o-n),h=(t+e)*s,c=(i+r)*l,d=(o+n)*u;return a[0]=2*s,a[4]=0,a[8]=0,a[12]=-h,a[1]=0,a[5]=2*l,a[9]=0,a[13]=-c,a[2]=0,a[6]=0,a[10]=-2*u,a[14]=-d,a[3]=0,a[7]=0,a[11]=0,a[15]=1,this},equals:function(e){for(var t=this.elements,i=e.elements,r=0;r<16;r++)if(t[r]!==i[r])return!1;return!0},fromArray:function(e,t){void 0===t&&(t=0);for(var i=0;i<16;i++)this.elements[i]=e[i+t];return this},toArray:function(e,t){void 0===e&&(e=[]),void 0===t&&(t=0);var i=this.elements;return e[t]=i[0],e[t+1]=i[1],e[t+2]=i[2],e[t+3]=i[3],e[t+4]=i[4],e[t+5]=i[5],e[t+6]=i[6],e[t+7]=i[7],e[t+8]=i[8],e[t+9]=i[9],e[t+10]=i[10],e[t+11]=i[11],e[t+12]=i[12],e[t+13]=i[13],e[t+14]=i[14],e[t+15]=i[15],e}}),Object.assign(Vector3.prototype,{isVector3:!0,set:function(e,t,i){return this.x=e,this.y=t,this.z=i,this},setScalar:function(e){return this.x=e,this.y=e,this.z=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setZ:function(e){return this.z=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;case 2:this.z=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;case 2:return this.z;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y,this.z)},copy:function(e){return this.x=e.x,this.y=e.y,this.z=e.z,this},add:function(e,t){return void 0!==t?(console.warn("Vector3: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this.z+=e.z,this)},addScalar:function(e){return this.x+=e,this.y+=e,this.z+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this.z=e.z+t.z,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this.z+=e.z*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector3: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this.z-=e.z,this)},subScalar:function(e){return this.x-=e,this.y-=e,this.z-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this.z=e.z-t.z,this},multiply:function(e,t){return void 0!==t?(console.warn("Vector3: .multiply() now only accepts one argument. Use .multiplyVectors( a, b ) instead."),this.multiplyVectors(e,t)):(this.x*=e.x,this.y*=e.y,this.z*=e.z,this)},multiplyScalar:function(e){return this.x*=e,this.y*=e,this.z*=e,this},multiplyVectors:function(e,t){return this.x=e.x*t.x,this.y=e.y*t.y,this.z=e.z*t.z,this},applyEuler:(quaternion=new Quaternion,function(e){return e&&e.isEuler||console.error("Vector3: .applyEuler() now expects an Euler rotation rather than a Vector3 and order."),this.applyQuaternion(quaternion.setFromEuler(e))}),applyAxisAngle:function(){var e=new Quaternion;return function(t,i){return this.applyQuaternion(e.setFromAxisAngle(t,i))}}(),applyMatrix3:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements;return this.x=n[0]*t+n[3]*i+n[6]*r,this.y=n[1]*t+n[4]*i+n[7]*r,this.z=n[2]*t+n[5]*i+n[8]*r,this},applyMatrix4:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements,o=1/(n[3]*t+n[7]*i+n[11]*r+n[15]);return this.x=(n[0]*t+n[4]*i+n[8]*r+n[12])*o,this.y=(n[1]*t+n[5]*i+n[9]*r+n[13])*o,this.z=(n[2]*t+n[6]*i+n[10]*r+n[14])*o,this},applyQuaternion:function(e){var t=this.x,i=this.y,r=this.z,n=e.x,o=e.y,a=e.z,s=e.w,l=s*t+o*r-a*i,u=s*i+a*t-n*r,h=s*r+n*i-o*t,c=-n*t-o*i-a*r;return this.x=l*s+c*-n+u*-a-h*-o,this.y=u*s+c*-o+h*-n-l*-a,this.z=h*s+c*-a+l*-o-u*-n,this},project:function(e){return this.applyMatrix4(e.matrixWorldInverse).applyMatrix4(e.projectionMatrix)},unproject:function(){var e=new Matrix4;return function(t){return this.applyMatrix4(e.getInverse(t.projectionMatrix)).applyMatrix4(t.matrixWorld)}}(),transformDirection:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements;return this.x=n[0]*t+n[4]*i+n[8]*r,this.y=n[1]*t+n[5]*i+n[9]*r,this.z=n[2]*t+n[6]*i+n[10]*r,this.normalize()},divide:function(e){return this.x/=e.x,this.y/=e.y,this.z/=e.z,this},divideScalar:function(e){return this.multiplyScalar(1/e)},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this.z=Math.min(this.z,e.z),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this.z=Math.max(this.z,e.z),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this.z=Math.max(e.z,Math.min(t.z,this.z)),this},clampScalar:(min=new Vector3,max=new Vector3,function(e,t){return min.set(e,e,e),max.set(t,t,t),this.clamp(min,max)}),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this.z=Math.floor(this.z),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this.z=Math.ceil(this.z),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this.z=Math.round(this.z),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this.z=this.z<0?Math.ceil(this.z):Math.floor(this.z),this},negate:function(){return this.x=-this.x,this.y=-this.y,this.z=-this.z,this},dot:function(e){return this.x*e.x+this.y*e.y+this.z*e.z},lengthSq:function(){return this.x*this.x+this.y*this.y+this.z*this.z},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y+this.z*this.z)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)+Math.abs(this.z)},normalize:function(){return this.divideScalar(this.length()||1)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this.z+=(e.z-this.z)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},cross:function(e,t){return void 0!==t?(console.warn("Vector3: .cross() now only accepts one argument. Use .crossVectors( a, b ) instead."),this.crossVectors(e,t)):this.crossVectors(this,e)},crossVectors:function(e,t){var i=e.x,r=e.y,n=e.z,o=t.x,a=t.y,s=t.z;return this.x=r*s-n*a,this.y=n*o-i*s,this.z=i*a-r*o,this},projectOnVector:function(e){var t=e.dot(this)/e.lengthSq();return this.copy(e).multiplyScalar(t)},projectOnPlane:function(){var e=new Vector3;return function(t){return e.copy(this).projectOnVector(t),this.sub(e)}}(),reflect:function(){var e=new Vector3;return function(t){return this.sub(e.copy(t).multiplyScalar(2*this.dot(t)))}}(),angleTo:function(e){var t=this.dot(e)/Math.sqrt(this.lengthSq()*e.lengthSq());return Math.acos(_Math.clamp(t,-1,1))},distanceTo:function(e){return Math.sqrt(this.distanceToSquared(e))},distanceToSquared:function(e){var t=this.x-e.x,i=this.y-e.y,r=this.z-e.z;return t*t+i*i+r*r},manhattanDistanceTo:function(e){return Math.abs(this.x-e.x)+Math.abs(this.y-e.y)+Math.abs(this.z-e.z)},setFromSpherical:function(e){return this.setFromSphericalCoords(e.radius,e.phi,e.theta)},setFromSphericalCoords:function(e,t,i){var r=Math.sin(t)*e;return this.x=r*Math.sin(i),this.y=Math.cos(t)*e,this.z=r*Math.cos(i),this},setFromCylindrical:function(e){return this.setFromCylindricalCoords(e.radius,e.theta,e.y)},setFromCylindricalCoords:function(e,t,i){return this.x=e*Math.sin(t),this.y=i,this.z=e*Math.cos(t),this},setFromMatrixPosition:function(e){var t=e.elements;return this.x=t[12],this.y=t[13],this.z=t[14],this},setFromMatrixScale:function(e){var t=this.setFromMatrixColumn(e,0).length(),i=this.setFromMatrixColumn(e,1).length(),r=this.setFromMatrixColumn(e,2).length();return this.x=t,this.y=i,this.z=r,this},setFromMatrixColumn:function(e,t){return this.fromArray(e.elements,4*t)},equals:function(e){return e.x===this.x&&e.y===this.y&&e.z===this.z},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this.z=e[t+2],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e[t+2]=this.z,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector3: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this.z=e.getZ(t),this}}),Object.assign(Quaternion,{slerp:function(e,t,i,r){return i.copy(e).slerp(t,r)},slerpFlat:function(e,t,i,r,n,o,a){var s=i[r+0],l=i[r+1],u=i[r+2],h=i[r+3],c=n[o+0],d=n[o+1],p=n[o+2],f=n[o+3];if(h!==f||s!==c||l!==d||u!==p){var m=1-a,v=s*c+l*d+u*p+h*f,g=v>=0?1:-1,y=1-v*v;if(y>Number.EPSILON){var _=Math.sqrt(y),b=Math.atan2(_,v*g);m=Math.sin(m*b)/_,a=Math.sin(a*b)/_}var x=a*g;if(s=s*m+c*x,l=l*m+d*x,u=u*m+p*x,h=h*m+f*x,m===1-a){var w=1/Math.sqrt(s*s+l*l+u*u+h*h);s*=w,l*=w,u*=w,h*=w}}e[t]=s,e[t+1]=l,e[t+2]=u,e[t+3]=h}}),Object.defineProperties(Quaternion.prototype,{x:{get:function(){return this._x},set:function(e){this._x=e,this.onChangeCallback()}},y:{get:function(){return this._y},set:function(e){this._y=e,this.onChangeCallback()}},z:{get:function(){return this._z},set:function(e){this._z=e,this.onChangeCallback()}},w:{get:function(){return this._w},set:function(e){this._w=e,this.onChangeCallback()}}}),Object.assign(Quaternion.prototype,{isQuaternion:!0,set:function(e,t,i,r){return this._x=e,this._y=t,this._z=i,this._w=r,this.onChangeCallback(),this},clone:function(){return new this.constructor(this._x,this._y,this._z,this._w)},copy:function(e){return this._x=e.x,this._y=e.y,this._z=e.z,this._w=e.w,this.onChangeCallback(),this},setFromEuler:function(e,t){if(!e||!e.isEuler)throw new Error("Quaternion: .setFromEuler() now expects an Euler rotation rather than a Vector3 and order.");var i=e._x,r=e._y,n=e._z,o=e.order,a=Math.cos,s=Math.sin,l=a(i/2),u=a(r/2),h=a(n/2),c=s(i/2),d=s(r/2),p=s(n/2);return"XYZ"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h-c*d*p):"YXZ"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h+c*d*p):"ZXY"===o?(this._x=c*u*h-l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h-c*d*p):"ZYX"===o?(this._x=c*u*h-l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h+c*d*p):"YZX"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h-c*d*p):"XZY"===o&&(this._x=c*u*h-l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h+c*d*p),!1!==t&&this.onChangeCallback(),this},setFromAxisAngle:function(e,t){var i=t/2,r=Math.sin(i);return this._x=e.x*r,this._y=e.y*r,this._z=e.z*r,this._w=Math.cos(i),this.onChangeCallback(),this},setFromRotationMatrix:function(e){var t,i=e.elements,r=i[0],n=i[4],o=i[8],a=i[1],s=i[5],l=i[9],u=i[2],h=i[6],c=i[10],d=r+s+c;return d>0?(t=.5/Math.sqrt(d+1),this._w=.25/t,this._x=(h-l)*t,this._y=(o-u)*t,this._z=(a-n)*t):r>s&&r>c?(t=2*Math.sqrt(1+r-s-c),this._w=(h-l)/t,this._x=.25*t,this._y=(n+a)/t,this._z=(o+u)/t):s>c?(t=2*Math.sqrt(1+s-r-c),this._w=(o-u)/t,this._x=(n+a)/t,this._y=.25*t,this._z=(l+h)/t):(t=2*Math.sqrt(1+c-r-s),this._w=(a-n)/t,this._x=(o+u)/t,this._y=(l+h)/t,this._z=.25*t),this.onChangeCallback(),this},setFromUnitVectors:function(){var e,t=new Vector3;return function(i,r){return void 0===t&&(t=new Vector3),(e=i.dot(r)+1)<1e-6?(e=0,Math.abs(i.x)>Math.abs(i.z)?t.set(-i.y,i.x,0):t.set(0,-i.z,i.y)):t.crossVectors(i,r),this._x=t.x,this._y=t.y,this._z=t.z,this._w=e,this.normalize()}}(),angleTo:function(e){return 2*Math.acos(Math.abs(_Math.clamp(this.dot(e),-1,1)))},rotateTowards:function(e,t){var i=this.angleTo(e);if(0===i)return this;var r=Math.min(1,t/i);return this.slerp(e,r),this},inverse:function(){return this.conjugate()},conjugate:function(){return this._x*=-1,this._y*=-1,this._z*=-1,this.onChangeCallback(),this},dot:function(e){return this._x*e._x+this._y*e._y+this._z*e._z+this._w*e._w},lengthSq:function(){return this._x*this._x+this._y*this._y+this._z*this._z+this._w*this._w},length:function(){return Math.sqrt(this._x*this._x+this._y*this._y+this._z*this._z+this._w*this._w)},normalize:function(){var e=this.length();return 0===e?(this._x=0,this._y=0,this._z=0,this._w=1):(e=1/e,this._x=this._x*e,this._y=this._y*e,this._z=this._z*e,this._w=this._w*e),this.onChangeCallback(),this},multiply:function(e,t){return void 0!==t?(console.warn("Quaternion: .multiply() now only accepts one argument. Use .multiplyQuaternions( a, b ) instead."),this.multiplyQuaternions(e,t)):this.multiplyQuaternions(this,e)},premultiply:function(e){return this.multiplyQuaternions(e,this)},multiplyQuaternions:function(e,t){var i=e._x,r=e._y,n=e._z,o=e._w,a=t._x,s=t._y,l=t._z,u=t._w;return this._x=i*u+o*a+r*l-n*s,this._y=r*u+o*s+n*a-i*l,this._z=n*u+o*l+i*s-r*a,this._w=o*u-i*a-r*s-n*l,this.onChangeCallback(),this},slerp:function(e,t){if(0===t)return this;if(1===t)return this.copy(e);var i=this._x,r=this._y,n=this._z,o=this._w,a=o*e._w+i*e._x+r*e._y+n*e._z;if(a<0?(this._w=-e._w,this._x=-e._x,this._y=-e._y,this._z=-e._z,a=-a):this.copy(e),a>=1)return this._w=o,this._x=i,this._y=r,this._z=n,this;var s=1-a*a;if(s<=Number.EPSILON){var l=1-t;return this._w=l*o+t*this._w,this._x=l*i+t*this._x,this._y=l*r+t*this._y,this._z=l*n+t*this._z,this.normalize()}var u=Math.sqrt(s),h=Math.atan2(u,a),c=Math.sin((1-t)*h)/u,d=Math.sin(t*h)/u;return this._w=o*c+this._w*d,this._x=i*c+this._x*d,this._y=r*c+this._y*d,this._z=n*c+this._z*d,this.onChangeCallback(),this},equals:function(e){return e._x===this._x&&e._y===this._y&&e._z===this._z&&e._w===this._w},fromArray:function(e,t){return void 0===t&&(t=0),this._x=e[t],this._y=e[t+1],this._z=e[t+2],this._w=e[t+3],this.onChangeCallback(),this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this._x,e[t+1]=this._y,e[t+2]=this._z,e[t+3]=this._w,e},onChange:function(e){return this.onChangeCallback=e,this},onChangeCallback:function(){}}),Object.assign(EventDispatcher.prototype,{addEventListener:function(e,t){void 0===this._listeners&&(this._listeners={});var i=this._listeners;void 0===i[e]&&(i[e]=[]),-1===i[e].indexOf(t)&&i[e].push(t)},hasEventListener:function(e,t){if(void 0===this._listeners)return!1;var i=this._listeners;return void 0!==i[e]&&-1!==i[e].indexOf(t)},removeEventListener:function(e,t){if(void 0!==this._listeners){var i=this._listeners[e];if(void 0!==i){var r=i.indexOf(t);-1!==r&&i.splice(r,1)}}},dispatchEvent:function(e){if(void 0!==this._listeners){var t=this._listeners[e.type];if(void 0!==t){e.target=this;for(var i=t.slice(0),r=0,n=i.length;r<n;r++)i[r].call(this,e)}}}}),Euler.RotationOrders=["XYZ","YZX","ZXY","XZY","YXZ","ZYX"],Euler.DefaultOrder="XYZ",Object.defineProperties(Euler.prototype,{x:{get:function(){return this._x},set:function(e){this._x=e,this.onChangeCallback()}},y:{get:function(){return this._y},set:function(e){this._y=e,this.onChangeCallback()}},z:{get:function(){return this._z},set:function(e){this._z=e,this.onChangeCallback()}},order:{get:function(){return this._order},set:function(e){this._order=e,this.onChangeCallback()}}}),Object.assign(Euler.prototype,{isEuler:!0,set:function(e,t,i,r){return this._x=e,this._y=t,this._z=i,this._order=r||this._order,this.onChangeCallback(),this},clone:function(){return new this.constructor(this._x,this._y,this._z,this._order)},copy:function(e){return this._x=e._x,this._y=e._y,this._z=e._z,this._order=e._order,this.onChangeCallback(),this},setFromRotationMatrix:function(e,t,i){var r=_Math.clamp,n=e.elements,o=n[0],a=n[4],s=n[8],l=n[1],u=n[5],h=n[9],c=n[2],d=n[6],p=n[10];return"XYZ"===(t=t||this._order)?(this._y=Math.asin(r(s,-1,1)),Math.abs(s)<.99999?(this._x=Math.atan2(-h,p),this._z=Math.atan2(-a,o)):(this._x=Math.atan2(d,u),this._z=0)):"YXZ"===t?(this._x=Math.asin(-r(h,-1,1)),Math.abs(h)<.99999?(this._y=Math.atan2(s,p),this._z=Math.atan2(l,u)):(this._y=Math.atan2(-c,o),this._z=0)):"ZXY"===t?(this._x=Math.asin(r(d,-1,1)),Math.abs(d)<.99999?(this._y=Math.atan2(-c,p),this._z=Math.atan2(-a,u)):(this._y=0,this._z=Math.atan2(l,o))):"ZYX"===t?(this._y=Math.asin(-r(c,-1,1)),Math.abs(c)<.99999?(this._x=Math.atan2(d,p),this._z=Math.atan2(l,o)):(this._x=0,this._z=Math.atan2(-a,u))):"YZX"===t?(this._z=Math.asin(r(l,-1,1)),Math.abs(l)<.99999?(this._x=Math.atan2(-h,u),this._y=Math.atan2(-c,o)):(this._x=0,this._y=Math.atan2(s,p))):"XZY"===t?(this._z=Math.asin(-r(a,-1,1)),Math.abs(a)<.99999?(this._x=Math.atan2(d,u),this._y=Math.atan2(s,o)):(this._x=Math.atan2(-h,p),this._y=0)):console.warn("Euler: .setFromRotationMatrix() given unsupported order: "+t),this._order=t,!1!==i&&this.onChangeCallback(),this},setFromQuaternion:function(){var e=new Matrix4;return function(t,i,r){return e.makeRotationFromQuaternion(t),this.setFromRotationMatrix(e,i,r)}}(),setFromVector3:function(e,t){return this.set(e.x,e.y,e.z,t||this._order)},reorder:(q=new Quaternion,function(e){return q.setFromEuler(this),this.setFromQuaternion(q,e)}),equals:function(e){return e._x===this._x&&e._y===this._y&&e._z===this._z&&e._order===this._order},fromArray:function(e){return this._x=e[0],this._y=e[1],this._z=e[2],void 0!==e[3]&&(this._order=e[3]),this.onChangeCallback(),this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this._x,e[t+1]=this._y,e[t+2]=this._z,e[t+3]=this._order,e},toVector3:function(e){return e?e.set(this._x,this._y,this._z):new Vector3(this._x,this._y,this._z)},onChange:function(e){return this.onChangeCallback=e,this},onChangeCallback:function(){}}),Object.assign(Layers.prototype,{set:function(e){this.mask=1<<e|0},enable:function(e){this.mask|=1<<e|0},toggle:function(e){this.mask^=1<<e|0},disable:function(e){this.mask&=~(1<<e|0)},test:function(e){return 0!=(this.mask&e.mask)}}),Object.assign(Matrix3.prototype,{isMatrix3:!0,set:function(e,t,i,r,n,o,a,s,l){var u=this.elements;return u[0]=e,u[1]=r,u[2]=a,u[3]=t,u[4]=n,u[5]=s,u[6]=i,u[7]=o,u[8]=l,this},identity:function(){return this.set(1,0,0,0,1,0,0,0,1),this},clone:function(){return(new this.constructor).fromArray(this.elements)},copy:function(e){var t=this.elements,i=e.elements;return t[0]=i[0],t[1]=i[1],t[2]=i[2],t[3]=i[3],t[4]=i[4],t[5]=i[5],t[6]=i[6],t[7]=i[7],t[8]=i[8],this},setFromMatrix4:function(e){var t=e.elements;return this.set(t[0],t[4],t[8],t[1],t[5],t[9],t[2],t[6],t[10]),this},applyToBufferAttribute:function(){var e=new Vector3;return function(t){for(var i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.applyMatrix3(this),t.setXYZ(i,e.x,e.y,e.z);return t}}(),multiply:function(e){return this.multiplyMatrices(this,e)},premultiply:function(e){return this.multiplyMatrices(e,this)},multiplyMatrices:function(e,t){var i=e.elements,r=t.elements,n=this.elements,o=i[0],a=i[3],s=i[6],l=i[1],u=i[4],h=i[7],c=i[2],d=i[5],p=i[8],f=r[0],m=r[3],v=r[6],g=r[1],y=r[4],_=r[7],b=r[2],x=r[5],w=r[8];return n[0]=o*f+a*g+s*b,n[3]=o*m+a*y+s*x,n[6]=o*v+a*_+s*w,n[1]=l*f+u*g+h*b,n[4]=l*m+u*y+h*x,n[7]=l*v+u*_+h*w,n[2]=c*f+d*g+p*b,n[5]=c*m+d*y+p*x,n[8]=c*v+d*_+p*w,this},multiplyScalar:function(e){var t=this.elements;return t[0]*=e,t[3]*=e,t[6]*=e,t[1]*=e,t[4]*=e,t[7]*=e,t[2]*=e,t[5]*=e,t[8]*=e,this},determinant:function(){var e=this.elements,t=e[0],i=e[1],r=e[2],n=e[3],o=e[4],a=e[5],s=e[6],l=e[7],u=e[8];return t*o*u-t*a*l-i*n*u+i*a*s+r*n*l-r*o*s},getInverse:function(e,t){e&&e.isMatrix4&&console.error("Matrix3: .getInverse() no longer takes a Matrix4 argument.");var i=e.elements,r=this.elements,n=i[0],o=i[1],a=i[2],s=i[3],l=i[4],u=i[5],h=i[6],c=i[7],d=i[8],p=d*l-u*c,f=u*h-d*s,m=c*s-l*h,v=n*p+o*f+a*m;if(0===v){var g="Matrix3: .getInverse() can't invert matrix, determinant is 0";if(!0===t)throw new Error(g);return console.warn(g),this.identity()}var y=1/v;return r[0]=p*y,r[1]=(a*c-d*o)*y,r[2]=(u*o-a*l)*y,r[3]=f*y,r[4]=(d*n-a*h)*y,r[5]=(a*s-u*n)*y,r[6]=m*y,r[7]=(o*h-c*n)*y,r[8]=(l*n-o*s)*y,this},transpose:function(){var e,t=this.elements;return e=t[1],t[1]=t[3],t[3]=e,e=t[2],t[2]=t[6],t[6]=e,e=t[5],t[5]=t[7],t[7]=e,this},getNormalMatrix:function(e){return this.setFromMatrix4(e).getInverse(this).transpose()},transposeIntoArray:function(e){var t=this.elements;return e[0]=t[0],e[1]=t[3],e[2]=t[6],e[3]=t[1],e[4]=t[4],e[5]=t[7],e[6]=t[2],e[7]=t[5],e[8]=t[8],this},setUvTransform:function(e,t,i,r,n,o,a){var s=Math.cos(n),l=Math.sin(n);this.set(i*s,i*l,-i*(s*o+l*a)+o+e,-r*l,r*s,-r*(-l*o+s*a)+a+t,0,0,1)},scale:function(e,t){var i=this.elements;return i[0]*=e,i[3]*=e,i[6]*=e,i[1]*=t,i[4]*=t,i[7]*=t,this},rotate:function(e){var t=Math.cos(e),i=Math.sin(e),r=this.elements,n=r[0],o=r[3],a=r[6],s=r[1],l=r[4],u=r[7];return r[0]=t*n+i*s,r[3]=t*o+i*l,r[6]=t*a+i*u,r[1]=-i*n+t*s,r[4]=-i*o+t*l,r[7]=-i*a+t*u,this},translate:function(e,t){var i=this.elements;return i[0]+=e*i[2],i[3]+=e*i[5],i[6]+=e*i[8],i[1]+=t*i[2],i[4]+=t*i[5],i[7]+=t*i[8],this},equals:function(e){for(var t=this.elements,i=e.elements,r=0;r<9;r++)if(t[r]!==i[r])return!1;return!0},fromArray:function(e,t){void 0===t&&(t=0);for(var i=0;i<9;i++)this.elements[i]=e[i+t];return this},toArray:function(e,t){void 0===e&&(e=[]),void 0===t&&(t=0);var i=this.elements;return e[t]=i[0],e[t+1]=i[1],e[t+2]=i[2],e[t+3]=i[3],e[t+4]=i[4],e[t+5]=i[5],e[t+6]=i[6],e[t+7]=i[7],e[t+8]=i[8],e}});var REVISION="102",MOUSE={LEFT:0,MIDDLE:1,RIGHT:2},CullFaceNone=0,CullFaceBack=1,CullFaceFront=2,CullFaceFrontBack=3,FrontFaceDirectionCW=0,FrontFaceDirectionCCW=1,BasicShadowMap=0,PCFShadowMap=1,PCFSoftShadowMap=2,FrontSide=0,BackSide=1,DoubleSide=2,FlatShading=1,SmoothShading=2,NoColors=0,FaceColors=1,VertexColors=2,NoBlending=0,NormalBlending=1,AdditiveBlending=2,SubtractiveBlending=3,MultiplyBlending=4,CustomBlending=5,AddEquation=100,SubtractEquation=101,ReverseSubtractEquation=102,MinEquation=103,MaxEquation=104,ZeroFactor=200,OneFactor=201,SrcColorFactor=202,OneMinusSrcColorFactor=203,SrcAlphaFactor=204,OneMinusSrcAlphaFactor=205,DstAlphaFactor=206,OneMinusDstAlphaFactor=207,DstColorFactor=208,OneMinusDstColorFactor=209,SrcAlphaSaturateFactor=210,NeverDepth=0,AlwaysDepth=1,LessDepth=2,LessEqualDepth=3,EqualDepth=4,GreaterEqualDepth=5,GreaterDepth=6,NotEqualDepth=7,MultiplyOperation=0,MixOperation=1,AddOperation=2,NoToneMapping=0,LinearToneMapping=1,ReinhardToneMapping=2,Uncharted2ToneMapping=3,CineonToneMapping=4,ACESFilmicToneMapping=5,UVMapping=300,CubeReflectionMapping=301,CubeRefractionMapping=302,EquirectangularReflectionMapping=303,EquirectangularRefractionMapping=304,SphericalReflectionMapping=305,CubeUVReflectionMapping=306,CubeUVRefractionMapping=307,RepeatWrapping=1e3,ClampToEdgeWrapping=1001,MirroredRepeatWrapping=1002,NearestFilter=1003,NearestMipMapNearestFilter=1004,NearestMipMapLinearFilter=1005,LinearFilter=1006,LinearMipMapNearestFilter=1007,LinearMipMapLinearFilter=1008,UnsignedByteType=1009,ByteType=1010,ShortType=1011,UnsignedShortType=1012,IntType=1013,UnsignedIntType=1014,FloatType=1015,HalfFloatType=1016,UnsignedShort4444Type=1017,UnsignedShort5551Type=1018,UnsignedShort565Type=1019,UnsignedInt248Type=1020,AlphaFormat=1021,RGBFormat=1022,RGBAFormat=1023,LuminanceFormat=1024,LuminanceAlphaFormat=1025,RGBEFormat=RGBAFormat,DepthFormat=1026,DepthStencilFormat=1027,RedFormat=1028,RGB_S3TC_DXT1_Format=33776,RGBA_S3TC_DXT1_Format=33777,RGBA_S3TC_DXT3_Format=33778,RGBA_S3TC_DXT5_Format=33779,RGB_PVRTC_4BPPV1_Format=35840,RGB_PVRTC_2BPPV1_Format=35841,RGBA_PVRTC_4BPPV1_Format=35842,RGBA_PVRTC_2BPPV1_Format=35843,RGB_ETC1_Format=36196,RGBA_ASTC_4x4_Format=37808,RGBA_ASTC_5x4_Format=37809,RGBA_ASTC_5x5_Format=37810,RGBA_ASTC_6x5_Format=37811,RGBA_ASTC_6x6_Format=37812,RGBA_ASTC_8x5_Format=37813,RGBA_ASTC_8x6_Format=37814,RGBA_ASTC_8x8_Format=37815,RGBA_ASTC_10x5_Format=37816,RGBA_ASTC_10x6_Format=37817,RGBA_ASTC_10x8_Format=37818,RGBA_ASTC_10x10_Format=37819,RGBA_ASTC_12x10_Format=37820,RGBA_ASTC_12x12_Format=37821,LoopOnce=2200,LoopRepeat=2201,LoopPingPong=2202,InterpolateDiscrete=2300,InterpolateLinear=2301,InterpolateSmooth=2302,ZeroCurvatureEnding=2400,ZeroSlopeEnding=2401,WrapAroundEnding=2402,TrianglesDrawMode=0,TriangleStripDrawMode=1,TriangleFanDrawMode=2,LinearEncoding=3e3,sRGBEncoding=3001,GammaEncoding=3007,RGBEEncoding=3002,LogLuvEncoding=3003,RGBM7Encoding=3004,RGBM16Encoding=3005,RGBDEncoding=3006,BasicDepthPacking=3200,RGBADepthPacking=3201,TangentSpaceNormalMap=0,ObjectSpaceNormalMap=1,object3DId=0,position,scale,m1,q1;function Object3D(){Object.defineProperty(this,"id",{value:object3DId++}),this.uuid=_Math.generateUUID(),this.name="",this.type="Object3D",this.parent=null,this.children=[],this.up=Object3D.DefaultUp.clone();var e=new Vector3,t=new Euler,i=new Quaternion,r=new Vector3(1,1,1);t.onChange(function(){i.setFromEuler(t,!1)}),i.onChange(function(){t.setFromQuaternion(i,void 0,!1)}),Object.defineProperties(this,{position:{configurable:!0,enumerable:!0,value:e},rotation:{configurable:!0,enumerable:!0,value:t},quaternion:{configurable:!0,enumerable:!0,value:i},scale:{configurable:!0,enumerable:!0,value:r},modelViewMatrix:{value:new Matrix4},normalMatrix:{value:new Matrix3}}),this.matrix=new Matrix4,this.matrixWorld=new Matrix4,this.matrixAutoUpdate=Object3D.DefaultMatrixAutoUpdate,this.matrixWorldNeedsUpdate=!1,this.layers=new Layers,this.visible=!0,this.castShadow=!1,this.receiveShadow=!1,this.frustumCulled=!0,this.renderOrder=0,this.userData={}}Object3D.DefaultUp=new Vector3(0,1,0),Object3D.DefaultMatrixAutoUpdate=!0,Object3D.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Object3D,isObject3D:!0,onBeforeRender:function(){},onAfterRender:function(){},applyMatrix:function(e){this.matrix.multiplyMatrices(e,this.matrix),this.matrix.decompose(this.position,this.quaternion,this.scale)},applyQuaternion:function(e){return this.quaternion.premultiply(e),this},setRotationFromAxisAngle:function(e,t){this.quaternion.setFromAxisAngle(e,t)},setRotationFromEuler:function(e){this.quaternion.setFromEuler(e,!0)},setRotationFromMatrix:function(e){this.quaternion.setFromRotationMatrix(e)},setRotationFromQuaternion:function(e){this.quaternion.copy(e)},rotateOnAxis:(q1=new Quaternion,function(e,t){return q1.setFromAxisAngle(e,t),this.quaternion.multiply(q1),this}),rotateOnWorldAxis:function(){var e=new Quaternion;return function(t,i){return e.setFromAxisAngle(t,i),this.quaternion.premultiply(e),this}}(),rotateX:function(){var e=new Vector3(1,0,0);return function(t){return this.rotateOnAxis(e,t)}}(),rotateY:function(){var e=new Vector3(0,1,0);return function(t){return this.rotateOnAxis(e,t)}}(),rotateZ:function(){var e=new Vector3(0,0,1);return function(t){return this.rotateOnAxis(e,t)}}(),translateOnAxis:function(){var e=new Vector3;return function(t,i){return e.copy(t).applyQuaternion(this.quaternion),this.position.add(e.multiplyScalar(i)),this}}(),translateX:function(){var e=new Vector3(1,0,0);return function(t){return this.translateOnAxis(e,t)}}(),translateY:function(){var e=new Vector3(0,1,0);return function(t){return this.translateOnAxis(e,t)}}(),translateZ:function(){var e=new Vector3(0,0,1);return function(t){return this.translateOnAxis(e,t)}}(),localToWorld:function(e){return e.applyMatrix4(this.matrixWorld)},worldToLocal:(m1=new Matrix4,function(e){return e.applyMatrix4(m1.getInverse(this.matrixWorld))}),lookAt:function(){var e=new Quaternion,t=new Matrix4,i=new Vector3,r=new Vector3;return function(n,o,a){n.isVector3?i.copy(n):i.set(n,o,a);var s=this.parent;this.updateWorldMatrix(!0,!1),r.setFromMatrixPosition(this.matrixWorld),this.isCamera||this.isLight?t.lookAt(r,i,this.up):t.lookAt(i,r,this.up),this.quaternion.setFromRotationMatrix(t),s&&(t.extractRotation(s.matrixWorld),e.setFromRotationMatrix(t),this.quaternion.premultiply(e.inverse()))}}(),add:function(e){var t=arguments;if(arguments.length>1){for(var i=0;i<arguments.length;i++)this.add(t[i]);return this}return e===this?(console.error("Object3D.add: object can't be added as a child of itself.",e),this):(e&&e.isObject3D?(null!==e.parent&&e.parent.remove(e),e.parent=this,e.dispatchEvent({type:"added"}),this.children.push(e)):console.error("Object3D.add: object not an instance of Object3D.",e),this)},remove:function(e){var t=arguments;if(arguments.length>1){for(var i=0;i<arguments.length;i++)this.remove(t[i]);return this}var r=this.children.indexOf(e);return-1!==r&&(e.parent=null,e.dispatchEvent({type:"removed"}),this.children.splice(r,1)),this},getObjectById:function(e){return this.getObjectByProperty("id",e)},getObjectByName:function(e){return this.getObjectByProperty("name",e)},getObjectByProperty:function(e,t){if(this[e]===t)return this;for(var i=0,r=this.children.length;i<r;i++){var n=this.children[i].getObjectByProperty(e,t);if(void 0!==n)return n}},getWorldPosition:function(e){return void 0===e&&(console.warn("Object3D: .getWorldPosition() target is now required"),e=new Vector3),this.updateMatrixWorld(!0),e.setFromMatrixPosition(this.matrixWorld)},getWorldQuaternion:(position=new Vector3,scale=new Vector3,function(e){return void 0===e&&(console.warn("Object3D: .getWorldQuaternion() target is now required"),e=new Quaternion),this.updateMatrixWorld(!0),this.matrixWorld.decompose(position,e,scale),e}),getWorldScale:function(){var e=new Vector3,t=new Quaternion;return function(i){return void 0===i&&(console.warn("Object3D: .getWorldScale() target is now required"),i=new Vector3),this.updateMatrixWorld(!0),this.matrixWorld.decompose(e,t,i),i}}(),getWorldDirection:function(e){void 0===e&&(console.warn("Object3D: .getWorldDirection() target is now required"),e=new Vector3),this.updateMatrixWorld(!0);var t=this.matrixWorld.elements;return e.set(t[8],t[9],t[10]).normalize()},raycast:function(){},traverse:function(e){e(this);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].traverse(e)},traverseVisible:function(e){if(!1!==this.visible){e(this);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].traverseVisible(e)}},traverseAncestors:function(e){var t=this.parent;null!==t&&(e(t),t.traverseAncestors(e))},updateMatrix:function(){this.matrix.compose(this.position,this.quaternion,this.scale),this.matrixWorldNeedsUpdate=!0},updateMatrixWorld:function(e){this.matrixAutoUpdate&&this.updateMatrix(),(this.matrixWorldNeedsUpdate||e)&&(null===this.parent?this.matrixWorld.copy(this.matrix):this.matrixWorld.multiplyMatrices(this.parent.matrixWorld,this.matrix),this.matrixWorldNeedsUpdate=!1,e=!0);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].updateMatrixWorld(e)},updateWorldMatrix:function(e,t){var i=this.parent;if(!0===e&&null!==i&&i.updateWorldMatrix(!0,!1),this.matrixAutoUpdate&&this.updateMatrix(),null===this.parent?this.matrixWorld.copy(this.matrix):this.matrixWorld.multiplyMatrices(this.parent.matrixWorld,this.matrix),!0===t)for(var r=this.children,n=0,o=r.length;n<o;n++)r[n].updateWorldMatrix(!1,!0)},toJSON:function(e){var t=void 0===e||"string"==typeof e,i={};t&&(e={geometries:{},materials:{},textures:{},images:{},shapes:{}},i.metadata={version:4.5,type:"Object",generator:"Object3D.toJSON"});var r={};function n(t,i){return void 0===t[i.uuid]&&(t[i.uuid]=i.toJSON(e)),i.uuid}if(r.uuid=this.uuid,r.type=this.type,""!==this.name&&(r.name=this.name),!0===this.castShadow&&(r.castShadow=!0),!0===this.receiveShadow&&(r.receiveShadow=!0),!1===this.visible&&(r.visible=!1),!1===this.frustumCulled&&(r.frustumCulled=!1),0!==this.renderOrder&&(r.renderOrder=this.renderOrder),"{}"!==JSON.stringify(this.userData)&&(r.userData=this.userData),r.layers=this.layers.mask,r.matrix=this.matrix.toArray(),!1===this.matrixAutoUpdate&&(r.matrixAutoUpdate=!1),this.isMesh&&this.drawMode!==TrianglesDrawMode&&(r.drawMode=this.drawMode),this.isMesh||this.isLine||this.isPoints){r.geometry=n(e.geometries,this.geometry);var o=this.geometry.parameters;if(void 0!==o&&void 0!==o.shapes){var a=o.shapes;if(Array.isArray(a))for(var s=0,l=a.length;s<l;s++){var u=a[s];n(e.shapes,u)}else n(e.shapes,a)}}if(void 0!==this.material)if(Array.isArray(this.material)){var h=[];for(s=0,l=this.material.length;s<l;s++)h.push(n(e.materials,this.material[s]));r.material=h}else r.material=n(e.materials,this.material);if(this.children.length>0){r.children=[];for(s=0;s<this.children.length;s++)r.children.push(this.children[s].toJSON(e).object)}if(t){var c=m(e.geometries),d=m(e.materials),p=m(e.textures),f=m(e.images);a=m(e.shapes);c.length>0&&(i.geometries=c),d.length>0&&(i.materials=d),p.length>0&&(i.textures=p),f.length>0&&(i.images=f),a.length>0&&(i.shapes=a)}return i.object=r,i;function m(e){var t=[];for(var i in e){var r=e[i];delete r.metadata,t.push(r)}return t}},clone:function(e){return(new this.constructor).copy(this,e)},copy:function(e,t){if(void 0===t&&(t=!0),this.name=e.name,this.up.copy(e.up),this.position.copy(e.position),this.quaternion.copy(e.quaternion),this.scale.copy(e.scale),this.matrix.copy(e.matrix),this.matrixWorld.copy(e.matrixWorld),this.matrixAutoUpdate=e.matrixAutoUpdate,this.matrixWorldNeedsUpdate=e.matrixWorldNeedsUpdate,this.layers.mask=e.layers.mask,this.visible=e.visible,this.castShadow=e.castShadow,this.receiveShadow=e.receiveShadow,this.frustumCulled=e.frustumCulled,this.renderOrder=e.renderOrder,this.userData=JSON.parse(JSON.stringify(e.userData)),!0===t)for(var i=0;i<e.children.length;i++){var r=e.children[i];this.add(r.clone())}return this}});var ColorKeywords={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074},hslA,hslB,hsl,points,closestPoint,box;function Color(e,t,i){return void 0===t&&void 0===i?this.set(e):this.setRGB(e,t,i)}function Face3(e,t,i,r,n,o){this.a=e,this.b=t,this.c=i,this.normal=r&&r.isVector3?r:new Vector3,this.vertexNormals=Array.isArray(r)?r:[],this.color=n&&n.isColor?n:new Color,this.vertexColors=Array.isArray(n)?n:[],this.materialIndex=void 0!==o?o:0}function Box3(e,t){this.min=void 0!==e?e:new Vector3(1/0,1/0,1/0),this.max=void 0!==t?t:new Vector3(-1/0,-1/0,-1/0)}function Sphere(e,t){this.center=void 0!==e?e:new Vector3,this.radius=void 0!==t?t:0}function Vector2(e,t){this.x=e||0,this.y=t||0}Object.assign(Color.prototype,{isColor:!0,r:1,g:1,b:1,set:function(e){return e&&e.isColor?this.copy(e):"number"==typeof e?this.setHex(e):"string"==typeof e&&this.setStyle(e),this},setScalar:function(e){return this.r=e,this.g=e,this.b=e,this},setHex:function(e){return e=Math.floor(e),this.r=(e>>16&255)/255,this.g=(e>>8&255)/255,this.b=(255&e)/255,this},setRGB:function(e,t,i){return this.r=e,this.g=t,this.b=i,this},setHSL:function(){function e(e,t,i){return i<0&&(i+=1),i>1&&(i-=1),i<1/6?e+6*(t-e)*i:i<.5?t:i<2/3?e+6*(t-e)*(2/3-i):e}return function(t,i,r){if(t=_Math.euclideanModulo(t,1),i=_Math.clamp(i,0,1),r=_Math.clamp(r,0,1),0===i)this.r=this.g=this.b=r;else{var n=r<=.5?r*(1+i):r+i-r*i,o=2*r-n;this.r=e(o,n,t+1/3),this.g=e(o,n,t),this.b=e(o,n,t-1/3)}return this}}(),setStyle:function(e){function t(t){void 0!==t&&parseFloat(t)<1&&console.warn("Color: Alpha component of "+e+" will be ignored.")}var i;if(i=/^((?:rgb|hsl)a?)\(\s*([^\)]*)\)/.exec(e)){var r,n=i[1],o=i[2];switch(n){case"rgb":case"rgba":if(r=/^(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o))return this.r=Math.min(255,parseInt(r[1],10))/255,this.g=Math.min(255,parseInt(r[2],10))/255,this.b=Math.min(255,parseInt(r[3],10))/255,t(r[5]),this;if(r=/^(\d+)\%\s*,\s*(\d+)\%\s*,\s*(\d+)\%\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o))return this.r=Math.min(100,parseInt(r[1],10))/100,this.g=Math.min(100,parseInt(r[2],10))/100,this.b=Math.min(100,parseInt(r[3],10))/100,t(r[5]),this;break;case"hsl":case"hsla":if(r=/^([0-9]*\.?[0-9]+)\s*,\s*(\d+)\%\s*,\s*(\d+)\%\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o)){var a=parseFloat(r[1])/360,s=parseInt(r[2],10)/100,l=parseInt(r[3],10)/100;return t(r[5]),this.setHSL(a,s,l)}}}else if(i=/^\#([A-Fa-f0-9]+)$/.exec(e)){var u,h=(u=i[1]).length;if(3===h)return this.r=parseInt(u.charAt(0)+u.charAt(0),16)/255,this.g=parseInt(u.charAt(1)+u.charAt(1),16)/255,this.b=parseInt(u.charAt(2)+u.charAt(2),16)/255,this;if(6===h)return this.r=parseInt(u.charAt(0)+u.charAt(1),16)/255,this.g=parseInt(u.charAt(2)+u.charAt(3),16)/255,this.b=parseInt(u.charAt(4)+u.charAt(5),16)/255,this}e&&e.length>0&&(void 0!==(u=ColorKeywords[e])?this.setHex(u):console.warn("Color: Unknown color "+e));return this},clone:function(){return new this.constructor(this.r,this.g,this.b)},copy:function(e){return this.r=e.r,this.g=e.g,this.b=e.b,this},copyGammaToLinear:function(e,t){return void 0===t&&(t=2),this.r=Math.pow(e.r,t),this.g=Math.pow(e.g,t),this.b=Math.pow(e.b,t),this},copyLinearToGamma:function(e,t){void 0===t&&(t=2);var i=t>0?1/t:1;return this.r=Math.pow(e.r,i),this.g=Math.pow(e.g,i),this.b=Math.pow(e.b,i),this},convertGammaToLinear:function(e){return this.copyGammaToLinear(this,e),this},convertLinearToGamma:function(e){return this.copyLinearToGamma(this,e),this},copySRGBToLinear:function(){function e(e){return e<.04045?.0773993808*e:Math.pow(.9478672986*e+.0521327014,2.4)}return function(t){return this.r=e(t.r),this.g=e(t.g),this.b=e(t.b),this}}(),copyLinearToSRGB:function(){function e(e){return e<.0031308?12.92*e:1.055*Math.pow(e,.41666)-.055}return function(t){return this.r=e(t.r),this.g=e(t.g),this.b=e(t.b),this}}(),convertSRGBToLinear:function(){return this.copySRGBToLinear(this),this},convertLinearToSRGB:function(){return this.copyLinearToSRGB(this),this},getHex:function(){return 255*this.r<<16^255*this.g<<8^255*this.b<<0},getHexString:function(){return("000000"+this.getHex().toString(16)).slice(-6)},getHSL:function(e){void 0===e&&(console.warn("Color: .getHSL() target is now required"),e={h:0,s:0,l:0});var t,i,r=this.r,n=this.g,o=this.b,a=Math.max(r,n,o),s=Math.min(r,n,o),l=(s+a)/2;if(s===a)t=0,i=0;else{var u=a-s;switch(i=l<=.5?u/(a+s):u/(2-a-s),a){case r:t=(n-o)/u+(n<o?6:0);break;case n:t=(o-r)/u+2;break;case o:t=(r-n)/u+4}t/=6}return e.h=t,e.s=i,e.l=l,e},getStyle:function(){return"rgb("+(255*this.r|0)+","+(255*this.g|0)+","+(255*this.b|0)+")"},offsetHSL:(hsl={},function(e,t,i){return this.getHSL(hsl),hsl.h+=e,hsl.s+=t,hsl.l+=i,this.setHSL(hsl.h,hsl.s,hsl.l),this}),add:function(e){return this.r+=e.r,this.g+=e.g,this.b+=e.b,this},addColors:function(e,t){return this.r=e.r+t.r,this.g=e.g+t.g,this.b=e.b+t.b,this},addScalar:function(e){return this.r+=e,this.g+=e,this.b+=e,this},sub:function(e){return this.r=Math.max(0,this.r-e.r),this.g=Math.max(0,this.g-e.g),this.b=Math.max(0,this.b-e.b),this},multiply:function(e){return this.r*=e.r,this.g*=e.g,this.b*=e.b,this},multiplyScalar:function(e){return this.r*=e,this.g*=e,this.b*=e,this},lerp:function(e,t){return this.r+=(e.r-this.r)*t,this.g+=(e.g-this.g)*t,this.b+=(e.b-this.b)*t,this},lerpHSL:(hslA={h:0,s:0,l:0},hslB={h:0,s:0,l:0},function(e,t){this.getHSL(hslA),e.getHSL(hslB);var i=_Math.lerp(hslA.h,hslB.h,t),r=_Math.lerp(hslA.s,hslB.s,t),n=_Math.lerp(hslA.l,hslB.l,t);return this.setHSL(i,r,n),this}),equals:function(e){return e.r===this.r&&e.g===this.g&&e.b===this.b},fromArray:function(e,t){return void 0===t&&(t=0),this.r=e[t],this.g=e[t+1],this.b=e[t+2],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.r,e[t+1]=this.g,e[t+2]=this.b,e},toJSON:function(){return this.getHex()}}),Object.assign(Face3.prototype,{clone:function(){return(new this.constructor).copy(this)},copy:function(e){this.a=e.a,this.b=e.b,this.c=e.c,this.normal.copy(e.normal),this.color.copy(e.color),this.materialIndex=e.materialIndex;for(var t=0,i=e.vertexNormals.length;t<i;t++)this.vertexNormals[t]=e.vertexNormals[t].clone();for(t=0,i=e.vertexColors.length;t<i;t++)this.vertexColors[t]=e.vertexColors[t].clone();return this}}),Object.assign(Box3.prototype,{isBox3:!0,set:function(e,t){return this.min.copy(e),this.max.copy(t),this},setFromArray:function(e){for(var t=1/0,i=1/0,r=1/0,n=-1/0,o=-1/0,a=-1/0,s=0,l=e.length;s<l;s+=3){var u=e[s],h=e[s+1],c=e[s+2];u<t&&(t=u),h<i&&(i=h),c<r&&(r=c),u>n&&(n=u),h>o&&(o=h),c>a&&(a=c)}return this.min.set(t,i,r),this.max.set(n,o,a),this},setFromBufferAttribute:function(e){for(var t=1/0,i=1/0,r=1/0,n=-1/0,o=-1/0,a=-1/0,s=0,l=e.count;s<l;s++){var u=e.getX(s),h=e.getY(s),c=e.getZ(s);u<t&&(t=u),h<i&&(i=h),c<r&&(r=c),u>n&&(n=u),h>o&&(o=h),c>a&&(a=c)}return this.min.set(t,i,r),this.max.set(n,o,a),this},setFromPoints:function(e){this.makeEmpty();for(var t=0,i=e.length;t<i;t++)this.expandByPoint(e[t]);return this},setFromCenterAndSize:function(){var e=new Vector3;return function(t,i){var r=e.copy(i).multiplyScalar(.5);return this.min.copy(t).sub(r),this.max.copy(t).add(r),this}}(),setFromObject:function(e){return this.makeEmpty(),this.expandByObject(e)},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.min.copy(e.min),this.max.copy(e.max),this},makeEmpty:function(){return this.min.x=this.min.y=this.min.z=1/0,this.max.x=this.max.y=this.max.z=-1/0,this},isEmpty:function(){return this.max.x<this.min.x||this.max.y<this.min.y||this.max.z<this.min.z},getCenter:function(e){return void 0===e&&(console.warn("Box3: .getCenter() target is now required"),e=new Vector3),this.isEmpty()?e.set(0,0,0):e.addVectors(this.min,this.max).multiplyScalar(.5)},getSize:function(e){return void 0===e&&(console.warn("Box3: .getSize() target is now required"),e=new Vector3),this.isEmpty()?e.set(0,0,0):e.subVectors(this.max,this.min)},expandByPoint:function(e){return this.min.min(e),this.max.max(e),this},expandByVector:function(e){return this.min.sub(e),this.max.add(e),this},expandByScalar:function(e){return this.min.addScalar(-e),this.max.addScalar(e),this},expandByObject:function(){var e,t,i,r=new Vector3;function n(n){var o=n.geometry;if(void 0!==o)if(o.isGeometry){var a=o.vertices;for(t=0,i=a.length;t<i;t++)r.copy(a[t]),r.applyMatrix4(n.matrixWorld),e.expandByPoint(r)}else if(o.isBufferGeometry){var s=o.attributes.position;if(void 0!==s)for(t=0,i=s.count;t<i;t++)r.fromBufferAttribute(s,t).applyMatrix4(n.matrixWorld),e.expandByPoint(r)}}return function(t){return e=this,t.updateMatrixWorld(!0),t.traverse(n),this}}(),containsPoint:function(e){return!(e.x<this.min.x||e.x>this.max.x||e.y<this.min.y||e.y>this.max.y||e.z<this.min.z||e.z>this.max.z)},containsBox:function(e){return this.min.x<=e.min.x&&e.max.x<=this.max.x&&this.min.y<=e.min.y&&e.max.y<=this.max.y&&this.min.z<=e.min.z&&e.max.z<=this.max.z},getParameter:function(e,t){return void 0===t&&(console.warn("Box3: .getParameter() target is now required"),t=new Vector3),t.set((e.x-this.min.x)/(this.max.x-this.min.x),(e.y-this.min.y)/(this.max.y-this.min.y),(e.z-this.min.z)/(this.max.z-this.min.z))},intersectsBox:function(e){return!(e.max.x<this.min.x||e.min.x>this.max.x||e.max.y<this.min.y||e.min.y>this.max.y||e.max.z<this.min.z||e.min.z>this.max.z)},intersectsSphere:(closestPoint=new Vector3,function(e){return this.clampPoint(e.center,closestPoint),closestPoint.distanceToSquared(e.center)<=e.radius*e.radius}),intersectsPlane:function(e){var t,i;return e.normal.x>0?(t=e.normal.x*this.min.x,i=e.normal.x*this.max.x):(t=e.normal.x*this.max.x,i=e.normal.x*this.min.x),e.normal.y>0?(t+=e.normal.y*this.min.y,i+=e.normal.y*this.max.y):(t+=e.normal.y*this.max.y,i+=e.normal.y*this.min.y),e.normal.z>0?(t+=e.normal.z*this.min.z,i+=e.normal.z*this.max.z):(t+=e.normal.z*this.max.z,i+=e.normal.z*this.min.z),t<=-e.constant&&i>=-e.constant},intersectsTriangle:function(){var e=new Vector3,t=new Vector3,i=new Vector3,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Vector3,l=new Vector3,u=new Vector3;function h(r){var n,o;for(n=0,o=r.length-3;n<=o;n+=3){a.fromArray(r,n);var s=l.x*Math.abs(a.x)+l.y*Math.abs(a.y)+l.z*Math.abs(a.z),u=e.dot(a),h=t.dot(a),c=i.dot(a);if(Math.max(-Math.max(u,h,c),Math.min(u,h,c))>s)return!1}return!0}return function(a){if(this.isEmpty())return!1;this.getCenter(s),l.subVectors(this.max,s),e.subVectors(a.a,s),t.subVectors(a.b,s),i.subVectors(a.c,s),r.subVectors(t,e),n.subVectors(i,t),o.subVectors(e,i);var c=[0,-r.z,r.y,0,-n.z,n.y,0,-o.z,o.y,r.z,0,-r.x,n.z,0,-n.x,o.z,0,-o.x,-r.y,r.x,0,-n.y,n.x,0,-o.y,o.x,0];return!!h(c)&&(!!h(c=[1,0,0,0,1,0,0,0,1])&&(u.crossVectors(r,n),h(c=[u.x,u.y,u.z])))}}(),clampPoint:function(e,t){return void 0===t&&(console.warn("Box3: .clampPoint() target is now required"),t=new Vector3),t.copy(e).clamp(this.min,this.max)},distanceToPoint:function(){var e=new Vector3;return function(t){return e.copy(t).clamp(this.min,this.max).sub(t).length()}}(),getBoundingSphere:function(){var e=new Vector3;return function(t){return void 0===t&&(console.warn("Box3: .getBoundingSphere() target is now required"),t=new Sphere),this.getCenter(t.center),t.radius=.5*this.getSize(e).length(),t}}(),intersect:function(e){return this.min.max(e.min),this.max.min(e.max),this.isEmpty()&&this.makeEmpty(),this},union:function(e){return this.min.min(e.min),this.max.max(e.max),this},applyMatrix4:(points=[new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3],function(e){return this.isEmpty()?this:(points[0].set(this.min.x,this.min.y,this.min.z).applyMatrix4(e),points[1].set(this.min.x,this.min.y,this.max.z).applyMatrix4(e),points[2].set(this.min.x,this.max.y,this.min.z).applyMatrix4(e),points[3].set(this.min.x,this.max.y,this.max.z).applyMatrix4(e),points[4].set(this.max.x,this.min.y,this.min.z).applyMatrix4(e),points[5].set(this.max.x,this.min.y,this.max.z).applyMatrix4(e),points[6].set(this.max.x,this.max.y,this.min.z).applyMatrix4(e),points[7].set(this.max.x,this.max.y,this.max.z).applyMatrix4(e),this.setFromPoints(points),this)}),translate:function(e){return this.min.add(e),this.max.add(e),this},equals:function(e){return e.min.equals(this.min)&&e.max.equals(this.max)}}),Object.assign(Sphere.prototype,{set:function(e,t){return this.center.copy(e),this.radius=t,this},setFromPoints:(box=new Box3,function(e,t){var i=this.center;void 0!==t?i.copy(t):box.setFromPoints(e).getCenter(i);for(var r=0,n=0,o=e.length;n<o;n++)r=Math.max(r,i.distanceToSquared(e[n]));return this.radius=Math.sqrt(r),this}),clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.center.copy(e.center),this.radius=e.radius,this},empty:function(){return this.radius<=0},containsPoint:function(e){return e.distanceToSquared(this.center)<=this.radius*this.radius},distanceToPoint:function(e){return e.distanceTo(this.center)-this.radius},intersectsSphere:function(e){var t=this.radius+e.radius;return e.center.distanceToSquared(this.center)<=t*t},intersectsBox:function(e){return e.intersectsSphere(this)},intersectsPlane:function(e){return Math.abs(e.distanceToPoint(this.center))<=this.radius},clampPoint:function(e,t){var i=this.center.distanceToSquared(e);return void 0===t&&(console.warn("Sphere: .clampPoint() target is now required"),t=new Vector3),t.copy(e),i>this.radius*this.radius&&(t.sub(this.center).normalize(),t.multiplyScalar(this.radius).add(this.center)),t},getBoundingBox:function(e){return void 0===e&&(console.warn("Sphere: .getBoundingBox() target is now required"),e=new Box3),e.set(this.center,this.center),e.expandByScalar(this.radius),e},applyMatrix4:function(e){return this.center.applyMatrix4(e),this.radius=this.radius*e.getMaxScaleOnAxis(),this},translate:function(e){return this.center.add(e),this},equals:function(e){return e.center.equals(this.center)&&e.radius===this.radius}}),Object.defineProperties(Vector2.prototype,{width:{get:function(){return this.x},set:function(e){this.x=e}},height:{get:function(){return this.y},set:function(e){this.y=e}}}),Object.assign(Vector2.prototype,{isVector2:!0,set:function(e,t){return this.x=e,this.y=t,this},setScalar:function(e){return this.x=e,this.y=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y)},copy:function(e){return this.x=e.x,this.y=e.y,this},add:function(e,t){return void 0!==t?(console.warn("Vector2: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this)},addScalar:function(e){return this.x+=e,this.y+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector2: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this)},subScalar:function(e){return this.x-=e,this.y-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this},multiply:function(e){return this.x*=e.x,this.y*=e.y,this},multiplyScalar:function(e){return this.x*=e,this.y*=e,this},divide:function(e){return this.x/=e.x,this.y/=e.y,this},divideScalar:function(e){return this.multiplyScalar(1/e)},applyMatrix3:function(e){var t=this.x,i=this.y,r=e.elements;return this.x=r[0]*t+r[3]*i+r[6],this.y=r[1]*t+r[4]*i+r[7],this},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this},clampScalar:function(){var e=new Vector2,t=new Vector2;return function(i,r){return e.set(i,i),t.set(r,r),this.clamp(e,t)}}(),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this},negate:function(){return this.x=-this.x,this.y=-this.y,this},dot:function(e){return this.x*e.x+this.y*e.y},cross:function(e){return this.x*e.y-this.y*e.x},lengthSq:function(){return this.x*this.x+this.y*this.y},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)},normalize:function(){return this.divideScalar(this.length()||1)},angle:function(){var e=Math.atan2(this.y,this.x);return e<0&&(e+=2*Math.PI),e},distanceTo:function(e){return Math.sqrt(this.distanceToSquared(e))},distanceToSquared:function(e){var t=this.x-e.x,i=this.y-e.y;return t*t+i*i},manhattanDistanceTo:function(e){return Math.abs(this.x-e.x)+Math.abs(this.y-e.y)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},equals:function(e){return e.x===this.x&&e.y===this.y},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector2: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this},rotateAround:function(e,t){var i=Math.cos(t),r=Math.sin(t),n=this.x-e.x,o=this.y-e.y;return this.x=n*i-o*r+e.x,this.y=n*r+o*i+e.y,this}});var geometryId=0,offset,obj;function Geometry(){Object.defineProperty(this,"id",{value:geometryId+=2}),this.uuid=_Math.generateUUID(),this.name="",this.type="Geometry",this.vertices=[],this.colors=[],this.faces=[],this.faceVertexUvs=[[]],this.morphTargets=[],this.morphNormals=[],this.skinWeights=[],this.skinIndices=[],this.lineDistances=[],this.boundingBox=null,this.boundingSphere=null,this.elementsNeedUpdate=!1,this.verticesNeedUpdate=!1,this.uvsNeedUpdate=!1,this.normalsNeedUpdate=!1,this.colorsNeedUpdate=!1,this.lineDistancesNeedUpdate=!1,this.groupsNeedUpdate=!1}function Vector4(e,t,i,r){this.x=e||0,this.y=t||0,this.z=i||0,this.w=void 0!==r?r:1}function BufferAttribute(e,t,i){if(Array.isArray(e))throw new TypeError("BufferAttribute: array should be a Typed Array.");this.name="",this.array=e,this.itemSize=t,this.count=void 0!==e?e.length/t:0,this.normalized=!0===i,this.dynamic=!1,this.updateRange={offset:0,count:-1},this.version=0}function Int8BufferAttribute(e,t,i){BufferAttribute.call(this,new Int8Array(e),t,i)}function Uint8BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint8Array(e),t,i)}function Uint8ClampedBufferAttribute(e,t,i){BufferAttribute.call(this,new Uint8ClampedArray(e),t,i)}function Int16BufferAttribute(e,t,i){BufferAttribute.call(this,new Int16Array(e),t,i)}function Uint16BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint16Array(e),t,i)}function Int32BufferAttribute(e,t,i){BufferAttribute.call(this,new Int32Array(e),t,i)}function Uint32BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint32Array(e),t,i)}function Float32BufferAttribute(e,t,i){BufferAttribute.call(this,new Float32Array(e),t,i)}function Float64BufferAttribute(e,t,i){BufferAttribute.call(this,new Float64Array(e),t,i)}function DirectGeometry(){this.vertices=[],this.normals=[],this.colors=[],this.uvs=[],this.uvs2=[],this.groups=[],this.morphTargets={},this.skinWeights=[],this.skinIndices=[],this.boundingBox=null,this.boundingSphere=null,this.verticesNeedUpdate=!1,this.normalsNeedUpdate=!1,this.colorsNeedUpdate=!1,this.uvsNeedUpdate=!1,this.groupsNeedUpdate=!1}function arrayMin(e){if(0===e.length)return 1/0;for(var t=e[0],i=1,r=e.length;i<r;++i)e[i]<t&&(t=e[i]);return t}function arrayMax(e){if(0===e.length)return-1/0;for(var t=e[0],i=1,r=e.length;i<r;++i)e[i]>t&&(t=e[i]);return t}Geometry.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Geometry,isGeometry:!0,applyMatrix:function(e){for(var t=(new Matrix3).getNormalMatrix(e),i=0,r=this.vertices.length;i<r;i++){this.vertices[i].applyMatrix4(e)}for(i=0,r=this.faces.length;i<r;i++){var n=this.faces[i];n.normal.applyMatrix3(t).normalize();for(var o=0,a=n.vertexNormals.length;o<a;o++)n.vertexNormals[o].applyMatrix3(t).normalize()}return null!==this.boundingBox&&this.computeBoundingBox(),null!==this.boundingSphere&&this.computeBoundingSphere(),this.verticesNeedUpdate=!0,this.normalsNeedUpdate=!0,this},rotateX:function(){var e=new Matrix4;return function(t){return e.makeRotationX(t),this.applyMatrix(e),this}}(),rotateY:function(){var e=new Matrix4;return function(t){return e.makeRotationY(t),this.applyMatrix(e),this}}(),rotateZ:function(){var e=new Matrix4;return function(t){return e.makeRotationZ(t),this.applyMatrix(e),this}}(),translate:function(){var e=new Matrix4;return function(t,i,r){return e.makeTranslation(t,i,r),this.applyMatrix(e),this}}(),scale:function(){var e=new Matrix4;return function(t,i,r){return e.makeScale(t,i,r),this.applyMatrix(e),this}}(),lookAt:(obj=new Object3D,function(e){obj.lookAt(e),obj.updateMatrix(),this.applyMatrix(obj.matrix)}),fromBufferGeometry:function(e){var t=this,i=null!==e.index?e.index.array:void 0,r=e.attributes,n=r.position.array,o=void 0!==r.normal?r.normal.array:void 0,a=void 0!==r.color?r.color.array:void 0,s=void 0!==r.uv?r.uv.array:void 0,l=void 0!==r.uv2?r.uv2.array:void 0;void 0!==l&&(this.faceVertexUvs[1]=[]);for(var u=0,h=0;u<n.length;u+=3,h+=2)t.vertices.push((new Vector3).fromArray(n,u)),void 0!==a&&t.colors.push((new Color).fromArray(a,u));function c(e,i,r,n){var u=void 0===a?[]:[t.colors[e].clone(),t.colors[i].clone(),t.colors[r].clone()],h=new Face3(e,i,r,void 0===o?[]:[(new Vector3).fromArray(o,3*e),(new Vector3).fromArray(o,3*i),(new Vector3).fromArray(o,3*r)],u,n);t.faces.push(h),void 0!==s&&t.faceVertexUvs[0].push([(new Vector2).fromArray(s,2*e),(new Vector2).fromArray(s,2*i),(new Vector2).fromArray(s,2*r)]),void 0!==l&&t.faceVertexUvs[1].push([(new Vector2).fromArray(l,2*e),(new Vector2).fromArray(l,2*i),(new Vector2).fromArray(l,2*r)])}var d=e.groups;if(d.length>0)for(u=0;u<d.length;u++)for(var p=d[u],f=p.start,m=(h=f,f+p.count);h<m;h+=3)void 0!==i?c(i[h],i[h+1],i[h+2],p.materialIndex):c(h,h+1,h+2,p.materialIndex);else if(void 0!==i)for(u=0;u<i.length;u+=3)c(i[u],i[u+1],i[u+2]);else for(u=0;u<n.length/3;u+=3)c(u,u+1,u+2);return this.computeFaceNormals(),null!==e.boundingBox&&(this.boundingBox=e.boundingBox.clone()),null!==e.boundingSphere&&(this.boundingSphere=e.boundingSphere.clone()),this},center:(offset=new Vector3,function(){return this.computeBoundingBox(),this.boundingBox.getCenter(offset).negate(),this.translate(offset.x,offset.y,offset.z),this}),normalize:function(){this.computeBoundingSphere();var e=this.boundingSphere.center,t=this.boundingSphere.radius,i=0===t?1:1/t,r=new Matrix4;return r.set(i,0,0,-i*e.x,0,i,0,-i*e.y,0,0,i,-i*e.z,0,0,0,1),this.applyMatrix(r),this},computeFaceNormals:function(){for(var e=new Vector3,t=new Vector3,i=0,r=this.faces.length;i<r;i++){var n=this.faces[i],o=this.vertices[n.a],a=this.vertices[n.b],s=this.vertices[n.c];e.subVectors(s,a),t.subVectors(o,a),e.cross(t),e.normalize(),n.normal.copy(e)}},computeVertexNormals:function(e){var t,i,r,n,o,a;for(void 0===e&&(e=!0),a=new Array(this.vertices.length),t=0,i=this.vertices.length;t<i;t++)a[t]=new Vector3;if(e){var s,l,u,h=new Vector3,c=new Vector3;for(r=0,n=this.faces.length;r<n;r++)o=this.faces[r],s=this.vertices[o.a],l=this.vertices[o.b],u=this.vertices[o.c],h.subVectors(u,l),c.subVectors(s,l),h.cross(c),a[o.a].add(h),a[o.b].add(h),a[o.c].add(h)}else for(this.computeFaceNormals(),r=0,n=this.faces.length;r<n;r++)a[(o=this.faces[r]).a].add(o.normal),a[o.b].add(o.normal),a[o.c].add(o.normal);for(t=0,i=this.vertices.length;t<i;t++)a[t].normalize();for(r=0,n=this.faces.length;r<n;r++){var d=(o=this.faces[r]).vertexNormals;3===d.length?(d[0].copy(a[o.a]),d[1].copy(a[o.b]),d[2].copy(a[o.c])):(d[0]=a[o.a].clone(),d[1]=a[o.b].clone(),d[2]=a[o.c].clone())}this.faces.length>0&&(this.normalsNeedUpdate=!0)},computeFlatVertexNormals:function(){var e,t,i;for(this.computeFaceNormals(),e=0,t=this.faces.length;e<t;e++){var r=(i=this.faces[e]).vertexNormals;3===r.length?(r[0].copy(i.normal),r[1].copy(i.normal),r[2].copy(i.normal)):(r[0]=i.normal.clone(),r[1]=i.normal.clone(),r[2]=i.normal.clone())}this.faces.length>0&&(this.normalsNeedUpdate=!0)},computeMorphNormals:function(){var e,t,i,r,n;for(i=0,r=this.faces.length;i<r;i++)for((n=this.faces[i]).__originalFaceNormal?n.__originalFaceNormal.copy(n.normal):n.__originalFaceNormal=n.normal.clone(),n.__originalVertexNormals||(n.__originalVertexNormals=[]),e=0,t=n.vertexNormals.length;e<t;e++)n.__originalVertexNormals[e]?n.__originalVertexNormals[e].copy(n.vertexNormals[e]):n.__originalVertexNormals[e]=n.vertexNormals[e].clone();var o=new Geometry;for(o.faces=this.faces,e=0,t=this.morphTargets.length;e<t;e++){if(!this.morphNormals[e]){this.morphNormals[e]={},this.morphNormals[e].faceNormals=[],this.morphNormals[e].vertexNormals=[];var a=this.morphNormals[e].faceNormals,s=this.morphNormals[e].vertexNormals;for(i=0,r=this.faces.length;i<r;i++)l=new Vector3,u={a:new Vector3,b:new Vector3,c:new Vector3},a.push(l),s.push(u)}var l,u,h=this.morphNormals[e];for(o.vertices=this.morphTargets[e].vertices,o.computeFaceNormals(),o.computeVertexNormals(),i=0,r=this.faces.length;i<r;i++)n=this.faces[i],l=h.faceNormals[i],u=h.vertexNormals[i],l.copy(n.normal),u.a.copy(n.vertexNormals[0]),u.b.copy(n.vertexNormals[1]),u.c.copy(n.vertexNormals[2])}for(i=0,r=this.faces.length;i<r;i++)(n=this.faces[i]).normal=n.__originalFaceNormal,n.vertexNormals=n.__originalVertexNormals},computeBoundingBox:function(){null===this.boundingBox&&(this.boundingBox=new Box3),this.boundingBox.setFromPoints(this.vertices)},computeBoundingSphere:function(){null===this.boundingSphere&&(this.boundingSphere=new Sphere),this.boundingSphere.setFromPoints(this.vertices)},merge:function(e,t,i){if(e&&e.isGeometry){var r,n=this.vertices.length,o=this.vertices,a=e.vertices,s=this.faces,l=e.faces,u=this.faceVertexUvs[0],h=e.faceVertexUvs[0],c=this.colors,d=e.colors;void 0===i&&(i=0),void 0!==t&&(r=(new Matrix3).getNormalMatrix(t));for(var p=0,f=a.length;p<f;p++){var m=a[p].clone();void 0!==t&&m.applyMatrix4(t),o.push(m)}for(p=0,f=d.length;p<f;p++)c.push(d[p].clone());for(p=0,f=l.length;p<f;p++){var v,g,y,_=l[p],b=_.vertexNormals,x=_.vertexColors;(v=new Face3(_.a+n,_.b+n,_.c+n)).normal.copy(_.normal),void 0!==r&&v.normal.applyMatrix3(r).normalize();for(var w=0,S=b.length;w<S;w++)g=b[w].clone(),void 0!==r&&g.applyMatrix3(r).normalize(),v.vertexNormals.push(g);v.color.copy(_.color);for(w=0,S=x.length;w<S;w++)y=x[w],v.vertexColors.push(y.clone());v.materialIndex=_.materialIndex+i,s.push(v)}for(p=0,f=h.length;p<f;p++){var M=h[p],T=[];if(void 0!==M){for(w=0,S=M.length;w<S;w++)T.push(M[w].clone());u.push(T)}}}else console.error("Geometry.merge(): geometry not an instance of Geometry.",e)},mergeMesh:function(e){e&&e.isMesh?(e.matrixAutoUpdate&&e.updateMatrix(),this.merge(e.geometry,e.matrix)):console.error("Geometry.mergeMesh(): mesh not an instance of Mesh.",e)},mergeVertices:function(){var e,t,i,r,n,o,a,s,l={},u=[],h=[],c=Math.pow(10,4);for(i=0,r=this.vertices.length;i<r;i++)e=this.vertices[i],void 0===l[t=Math.round(e.x*c)+"_"+Math.round(e.y*c)+"_"+Math.round(e.z*c)]?(l[t]=i,u.push(this.vertices[i]),h[i]=u.length-1):h[i]=h[l[t]];var d=[];for(i=0,r=this.faces.length;i<r;i++){(n=this.faces[i]).a=h[n.a],n.b=h[n.b],n.c=h[n.c],o=[n.a,n.b,n.c];for(var p=0;p<3;p++)if(o[p]===o[(p+1)%3]){d.push(i);break}}for(i=d.length-1;i>=0;i--){var f=d[i];for(this.faces.splice(f,1),a=0,s=this.faceVertexUvs.length;a<s;a++)this.faceVertexUvs[a].splice(f,1)}var m=this.vertices.length-u.length;return this.vertices=u,m},setFromPoints:function(e){this.vertices=[];for(var t=0,i=e.length;t<i;t++){var r=e[t];this.vertices.push(new Vector3(r.x,r.y,r.z||0))}return this},sortFacesByMaterialIndex:function(){for(var e=this.faces,t=e.length,i=0;i<t;i++)e[i]._id=i;e.sort(function(e,t){return e.materialIndex-t.materialIndex});var r,n,o=this.faceVertexUvs[0],a=this.faceVertexUvs[1];o&&o.length===t&&(r=[]),a&&a.length===t&&(n=[]);for(i=0;i<t;i++){var s=e[i]._id;r&&r.push(o[s]),n&&n.push(a[s])}r&&(this.faceVertexUvs[0]=r),n&&(this.faceVertexUvs[1]=n)},toJSON:function(){var e={metadata:{version:4.5,type:"Geometry",generator:"Geometry.toJSON"}};if(e.uuid=this.uuid,e.type=this.type,""!==this.name&&(e.name=this.name),void 0!==this.parameters){var t=this.parameters;for(var i in t)void 0!==t[i]&&(e[i]=t[i]);return e}for(var r=[],n=0;n<this.vertices.length;n++){var o=this.vertices[n];r.push(o.x,o.y,o.z)}var a=[],s=[],l={},u=[],h={},c=[],d={};for(n=0;n<this.faces.length;n++){var p=this.faces[n],f=void 0!==this.faceVertexUvs[0][n],m=p.normal.length()>0,v=p.vertexNormals.length>0,g=1!==p.color.r||1!==p.color.g||1!==p.color.b,y=p.vertexColors.length>0,_=0;if(_=S(_,0,0),_=S(_,1,!0),_=S(_,2,!1),_=S(_,3,f),_=S(_,4,m),_=S(_,5,v),_=S(_,6,g),_=S(_,7,y),a.push(_),a.push(p.a,p.b,p.c),a.push(p.materialIndex),f){var b=this.faceVertexUvs[0][n];a.push(A(b[0]),A(b[1]),A(b[2]))}if(m&&a.push(M(p.normal)),v){var x=p.vertexNormals;a.push(M(x[0]),M(x[1]),M(x[2]))}if(g&&a.push(T(p.color)),y){var w=p.vertexColors;a.push(T(w[0]),T(w[1]),T(w[2]))}}function S(e,t,i){return i?e|1<<t:e&~(1<<t)}function M(e){var t=e.x.toString()+e.y.toString()+e.z.toString();return void 0!==l[t]?l[t]:(l[t]=s.length/3,s.push(e.x,e.y,e.z),l[t])}function T(e){var t=e.r.toString()+e.g.toString()+e.b.toString();return void 0!==h[t]?h[t]:(h[t]=u.length,u.push(e.getHex()),h[t])}function A(e){var t=e.x.toString()+e.y.toString();return void 0!==d[t]?d[t]:(d[t]=c.length/2,c.push(e.x,e.y),d[t])}return e.data={},e.data.vertices=r,e.data.normals=s,u.length>0&&(e.data.colors=u),c.length>0&&(e.data.uvs=[c]),e.data.faces=a,e},clone:function(){return(new Geometry).copy(this)},copy:function(e){var t,i,r,n,o,a;this.vertices=[],this.colors=[],this.faces=[],this.faceVertexUvs=[[]],this.morphTargets=[],this.morphNormals=[],this.skinWeights=[],this.skinIndices=[],this.lineDistances=[],this.boundingBox=null,this.boundingSphere=null,this.name=e.name;var s=e.vertices;for(t=0,i=s.length;t<i;t++)this.vertices.push(s[t].clone());var l=e.colors;for(t=0,i=l.length;t<i;t++)this.colors.push(l[t].clone());var u=e.faces;for(t=0,i=u.length;t<i;t++)this.faces.push(u[t].clone());for(t=0,i=e.faceVertexUvs.length;t<i;t++){var h=e.faceVertexUvs[t];for(void 0===this.faceVertexUvs[t]&&(this.faceVertexUvs[t]=[]),r=0,n=h.length;r<n;r++){var c=h[r],d=[];for(o=0,a=c.length;o<a;o++){var p=c[o];d.push(p.clone())}this.faceVertexUvs[t].push(d)}}var f=e.morphTargets;for(t=0,i=f.length;t<i;t++){var m={};if(m.name=f[t].name,void 0!==f[t].vertices)for(m.vertices=[],r=0,n=f[t].vertices.length;r<n;r++)m.vertices.push(f[t].vertices[r].clone());if(void 0!==f[t].normals)for(m.normals=[],r=0,n=f[t].normals.length;r<n;r++)m.normals.push(f[t].normals[r].clone());this.morphTargets.push(m)}var v=e.morphNormals;for(t=0,i=v.length;t<i;t++){var g={};if(void 0!==v[t].vertexNormals)for(g.vertexNormals=[],r=0,n=v[t].vertexNormals.length;r<n;r++){var y=v[t].vertexNormals[r],_={};_.a=y.a.clone(),_.b=y.b.clone(),_.c=y.c.clone(),g.vertexNormals.push(_)}if(void 0!==v[t].faceNormals)for(g.faceNormals=[],r=0,n=v[t].faceNormals.length;r<n;r++)g.faceNormals.push(v[t].faceNormals[r].clone());this.morphNormals.push(g)}var b=e.skinWeights;for(t=0,i=b.length;t<i;t++)this.skinWeights.push(b[t].clone());var x=e.skinIndices;for(t=0,i=x.length;t<i;t++)this.skinIndices.push(x[t].clone());var w=e.lineDistances;for(t=0,i=w.length;t<i;t++)this.lineDistances.push(w[t]);var S=e.boundingBox;null!==S&&(this.boundingBox=S.clone());var M=e.boundingSphere;return null!==M&&(this.boundingSphere=M.clone()),this.elementsNeedUpdate=e.elementsNeedUpdate,this.verticesNeedUpdate=e.verticesNeedUpdate,this.uvsNeedUpdate=e.uvsNeedUpdate,this.normalsNeedUpdate=e.normalsNeedUpdate,this.colorsNeedUpdate=e.colorsNeedUpdate,this.lineDistancesNeedUpdate=e.lineDistancesNeedUpdate,this.groupsNeedUpdate=e.groupsNeedUpdate,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),Object.assign(Vector4.prototype,{isVector4:!0,set:function(e,t,i,r){return this.x=e,this.y=t,this.z=i,this.w=r,this},setScalar:function(e){return this.x=e,this.y=e,this.z=e,this.w=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setZ:function(e){return this.z=e,this},setW:function(e){return this.w=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;case 2:this.z=t;break;case 3:this.w=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;case 2:return this.z;case 3:return this.w;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y,this.z,this.w)},copy:function(e){return this.x=e.x,this.y=e.y,this.z=e.z,this.w=void 0!==e.w?e.w:1,this},add:function(e,t){return void 0!==t?(console.warn("Vector4: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this.z+=e.z,this.w+=e.w,this)},addScalar:function(e){return this.x+=e,this.y+=e,this.z+=e,this.w+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this.z=e.z+t.z,this.w=e.w+t.w,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this.z+=e.z*t,this.w+=e.w*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector4: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this.z-=e.z,this.w-=e.w,this)},subScalar:function(e){return this.x-=e,this.y-=e,this.z-=e,this.w-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this.z=e.z-t.z,this.w=e.w-t.w,this},multiplyScalar:function(e){return this.x*=e,this.y*=e,this.z*=e,this.w*=e,this},applyMatrix4:function(e){var t=this.x,i=this.y,r=this.z,n=this.w,o=e.elements;return this.x=o[0]*t+o[4]*i+o[8]*r+o[12]*n,this.y=o[1]*t+o[5]*i+o[9]*r+o[13]*n,this.z=o[2]*t+o[6]*i+o[10]*r+o[14]*n,this.w=o[3]*t+o[7]*i+o[11]*r+o[15]*n,this},divideScalar:function(e){return this.multiplyScalar(1/e)},setAxisAngleFromQuaternion:function(e){this.w=2*Math.acos(e.w);var t=Math.sqrt(1-e.w*e.w);return t<1e-4?(this.x=1,this.y=0,this.z=0):(this.x=e.x/t,this.y=e.y/t,this.z=e.z/t),this},setAxisAngleFromRotationMatrix:function(e){var t,i,r,n,o=e.elements,a=o[0],s=o[4],l=o[8],u=o[1],h=o[5],c=o[9],d=o[2],p=o[6],f=o[10];if(Math.abs(s-u)<.01&&Math.abs(l-d)<.01&&Math.abs(c-p)<.01){if(Math.abs(s+u)<.1&&Math.abs(l+d)<.1&&Math.abs(c+p)<.1&&Math.abs(a+h+f-3)<.1)return this.set(1,0,0,0),this;t=Math.PI;var m=(a+1)/2,v=(h+1)/2,g=(f+1)/2,y=(s+u)/4,_=(l+d)/4,b=(c+p)/4;return m>v&&m>g?m<.01?(i=0,r=.707106781,n=.707106781):(r=y/(i=Math.sqrt(m)),n=_/i):v>g?v<.01?(i=.707106781,r=0,n=.707106781):(i=y/(r=Math.sqrt(v)),n=b/r):g<.01?(i=.707106781,r=.707106781,n=0):(i=_/(n=Math.sqrt(g)),r=b/n),this.set(i,r,n,t),this}var x=Math.sqrt((p-c)*(p-c)+(l-d)*(l-d)+(u-s)*(u-s));return Math.abs(x)<.001&&(x=1),this.x=(p-c)/x,this.y=(l-d)/x,this.z=(u-s)/x,this.w=Math.acos((a+h+f-1)/2),this},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this.z=Math.min(this.z,e.z),this.w=Math.min(this.w,e.w),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this.z=Math.max(this.z,e.z),this.w=Math.max(this.w,e.w),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this.z=Math.max(e.z,Math.min(t.z,this.z)),this.w=Math.max(e.w,Math.min(t.w,this.w)),this},clampScalar:function(){var e,t;return function(i,r){return void 0===e&&(e=new Vector4,t=new Vector4),e.set(i,i,i,i),t.set(r,r,r,r),this.clamp(e,t)}}(),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this.z=Math.floor(this.z),this.w=Math.floor(this.w),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this.z=Math.ceil(this.z),this.w=Math.ceil(this.w),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this.z=Math.round(this.z),this.w=Math.round(this.w),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this.z=this.z<0?Math.ceil(this.z):Math.floor(this.z),this.w=this.w<0?Math.ceil(this.w):Math.floor(this.w),this},negate:function(){return this.x=-this.x,this.y=-this.y,this.z=-this.z,this.w=-this.w,this},dot:function(e){return this.x*e.x+this.y*e.y+this.z*e.z+this.w*e.w},lengthSq:function(){return this.x*this.x+this.y*this.y+this.z*this.z+this.w*this.w},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y+this.z*this.z+this.w*this.w)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)+Math.abs(this.z)+Math.abs(this.w)},normalize:function(){return this.divideScalar(this.length()||1)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this.z+=(e.z-this.z)*t,this.w+=(e.w-this.w)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},equals:function(e){return e.x===this.x&&e.y===this.y&&e.z===this.z&&e.w===this.w},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this.z=e[t+2],this.w=e[t+3],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e[t+2]=this.z,e[t+3]=this.w,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector4: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this.z=e.getZ(t),this.w=e.getW(t),this}}),Object.defineProperty(BufferAttribute.prototype,"needsUpdate",{set:function(e){!0===e&&this.version++}}),Object.assign(BufferAttribute.prototype,{isBufferAttribute:!0,onUploadCallback:function(){},setArray:function(e){if(Array.isArray(e))throw new TypeError("BufferAttribute: array should be a Typed Array.");return this.count=void 0!==e?e.length/this.itemSize:0,this.array=e,this},setDynamic:function(e){return this.dynamic=e,this},copy:function(e){return this.name=e.name,this.array=new e.array.constructor(e.array),this.itemSize=e.itemSize,this.count=e.count,this.normalized=e.normalized,this.dynamic=e.dynamic,this},copyAt:function(e,t,i){e*=this.itemSize,i*=t.itemSize;for(var r=0,n=this.itemSize;r<n;r++)this.array[e+r]=t.array[i+r];return this},copyArray:function(e){return this.array.set(e),this},copyColorsArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyColorsArray(): color is undefined",r),o=new Color),t[i++]=o.r,t[i++]=o.g,t[i++]=o.b}return this},copyVector2sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector2sArray(): vector is undefined",r),o=new Vector2),t[i++]=o.x,t[i++]=o.y}return this},copyVector3sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector3sArray(): vector is undefined",r),o=new Vector3),t[i++]=o.x,t[i++]=o.y,t[i++]=o.z}return this},copyVector4sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector4sArray(): vector is undefined",r),o=new Vector4),t[i++]=o.x,t[i++]=o.y,t[i++]=o.z,t[i++]=o.w}return this},set:function(e,t){return void 0===t&&(t=0),this.array.set(e,t),this},getX:function(e){return this.array[e*this.itemSize]},setX:function(e,t){return this.array[e*this.itemSize]=t,this},getY:function(e){return this.array[e*this.itemSize+1]},setY:function(e,t){return this.array[e*this.itemSize+1]=t,this},getZ:function(e){return this.array[e*this.itemSize+2]},setZ:function(e,t){return this.array[e*this.itemSize+2]=t,this},getW:function(e){return this.array[e*this.itemSize+3]},setW:function(e,t){return this.array[e*this.itemSize+3]=t,this},setXY:function(e,t,i){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this},setXYZ:function(e,t,i,r){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this.array[e+2]=r,this},setXYZW:function(e,t,i,r,n){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this.array[e+2]=r,this.array[e+3]=n,this},onUpload:function(e){return this.onUploadCallback=e,this},clone:function(){return new this.constructor(this.array,this.itemSize).copy(this)}}),Int8BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int8BufferAttribute.prototype.constructor=Int8BufferAttribute,Uint8BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint8BufferAttribute.prototype.constructor=Uint8BufferAttribute,Uint8ClampedBufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint8ClampedBufferAttribute.prototype.constructor=Uint8ClampedBufferAttribute,Int16BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int16BufferAttribute.prototype.constructor=Int16BufferAttribute,Uint16BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint16BufferAttribute.prototype.constructor=Uint16BufferAttribute,Int32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int32BufferAttribute.prototype.constructor=Int32BufferAttribute,Uint32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint32BufferAttribute.prototype.constructor=Uint32BufferAttribute,Float32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Float32BufferAttribute.prototype.constructor=Float32BufferAttribute,Float64BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Float64BufferAttribute.prototype.constructor=Float64BufferAttribute,Object.assign(DirectGeometry.prototype,{computeGroups:function(e){for(var t,i=[],r=void 0,n=e.faces,o=0;o<n.length;o++){var a=n[o];a.materialIndex!==r&&(r=a.materialIndex,void 0!==t&&(t.count=3*o-t.start,i.push(t)),t={start:3*o,materialIndex:r})}void 0!==t&&(t.count=3*o-t.start,i.push(t)),this.groups=i},fromGeometry:function(e){var t,i=e.faces,r=e.vertices,n=e.faceVertexUvs,o=n[0]&&n[0].length>0,a=n[1]&&n[1].length>0,s=e.morphTargets,l=s.length;if(l>0){t=[];for(var u=0;u<l;u++)t[u]={name:s[u].name,data:[]};this.morphTargets.position=t}var h,c=e.morphNormals,d=c.length;if(d>0){h=[];for(u=0;u<d;u++)h[u]={name:c[u].name,data:[]};this.morphTargets.normal=h}var p=e.skinIndices,f=e.skinWeights,m=p.length===r.length,v=f.length===r.length;r.length>0&&0===i.length&&console.error("DirectGeometry: Faceless geometries are not supported.");for(u=0;u<i.length;u++){var g=i[u];this.vertices.push(r[g.a],r[g.b],r[g.c]);var y=g.vertexNormals;if(3===y.length)this.normals.push(y[0],y[1],y[2]);else{var _=g.normal;this.normals.push(_,_,_)}var b,x=g.vertexColors;if(3===x.length)this.colors.push(x[0],x[1],x[2]);else{var w=g.color;this.colors.push(w,w,w)}if(!0===o)void 0!==(b=n[0][u])?this.uvs.push(b[0],b[1],b[2]):(console.warn("DirectGeometry.fromGeometry(): Undefined vertexUv ",u),this.uvs.push(new Vector2,new Vector2,new Vector2));if(!0===a)void 0!==(b=n[1][u])?this.uvs2.push(b[0],b[1],b[2]):(console.warn("DirectGeometry.fromGeometry(): Undefined vertexUv2 ",u),this.uvs2.push(new Vector2,new Vector2,new Vector2));for(var S=0;S<l;S++){var M=s[S].vertices;t[S].data.push(M[g.a],M[g.b],M[g.c])}for(S=0;S<d;S++){var T=c[S].vertexNormals[u];h[S].data.push(T.a,T.b,T.c)}m&&this.skinIndices.push(p[g.a],p[g.b],p[g.c]),v&&this.skinWeights.push(f[g.a],f[g.b],f[g.c])}return this.computeGroups(e),this.verticesNeedUpdate=e.verticesNeedUpdate,this.normalsNeedUpdate=e.normalsNeedUpdate,this.colorsNeedUpdate=e.colorsNeedUpdate,this.uvsNeedUpdate=e.uvsNeedUpdate,this.groupsNeedUpdate=e.groupsNeedUpdate,this}});var bufferGeometryId=1;function BufferGeometry(){Object.defineProperty(this,"id",{value:bufferGeometryId+=2}),this.uuid=_Math.generateUUID(),this.name="",this.type="BufferGeometry",this.index=null,this.attributes={},this.morphAttributes={},this.groups=[],this.boundingBox=null,this.boundingSphere=null,this.drawRange={start:0,count:1/0},this.userData={}}function SphereGeometry(e,t,i,r,n,o,a){Geometry.call(this),this.type="SphereGeometry",this.parameters={radius:e,widthSegments:t,heightSegments:i,phiStart:r,phiLength:n,thetaStart:o,thetaLength:a},this.fromBufferGeometry(new SphereBufferGeometry(e,t,i,r,n,o,a)),this.mergeVertices()}function SphereBufferGeometry(e,t,i,r,n,o,a){BufferGeometry.call(this),this.type="SphereBufferGeometry",this.parameters={radius:e,widthSegments:t,heightSegments:i,phiStart:r,phiLength:n,thetaStart:o,thetaLength:a},e=e||1,t=Math.max(3,Math.floor(t)||8),i=Math.max(2,Math.floor(i)||6),r=void 0!==r?r:0,n=void 0!==n?n:2*Math.PI;var s,l,u=(o=void 0!==o?o:0)+(a=void 0!==a?a:Math.PI),h=0,c=[],d=new Vector3,p=new Vector3,f=[],m=[],v=[],g=[];for(l=0;l<=i;l++){var y=[],_=l/i;for(s=0;s<=t;s++){var b=s/t;d.x=-e*Math.cos(r+b*n)*Math.sin(o+_*a),d.y=e*Math.cos(o+_*a),d.z=e*Math.sin(r+b*n)*Math.sin(o+_*a),m.push(d.x,d.y,d.z),p.set(d.x,d.y,d.z).normalize(),v.push(p.x,p.y,p.z),g.push(b,1-_),y.push(h++)}c.push(y)}for(l=0;l<i;l++)for(s=0;s<t;s++){var x=c[l][s+1],w=c[l][s],S=c[l+1][s],M=c[l+1][s+1];(0!==l||o>0)&&f.push(x,w,M),(l!==i-1||u<Math.PI)&&f.push(w,S,M)}this.setIndex(f),this.addAttribute("position",new Float32BufferAttribute(m,3)),this.addAttribute("normal",new Float32BufferAttribute(v,3)),this.addAttribute("uv",new Float32BufferAttribute(g,2))}BufferGeometry.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:BufferGeometry,isBufferGeometry:!0,getIndex:function(){return this.index},setIndex:function(e){Array.isArray(e)?this.index=new(arrayMax(e)>65535?Uint32BufferAttribute:Uint16BufferAttribute)(e,1):this.index=e},addAttribute:function(e,t){return t&&t.isBufferAttribute||t&&t.isInterleavedBufferAttribute?"index"===e?(console.warn("BufferGeometry.addAttribute: Use .setIndex() for index attribute."),this.setIndex(t),this):(this.attributes[e]=t,this):(console.warn("BufferGeometry: .addAttribute() now expects ( name, attribute )."),this.addAttribute(e,new BufferAttribute(arguments[1],arguments[2])))},getAttribute:function(e){return this.attributes[e]},removeAttribute:function(e){return delete this.attributes[e],this},addGroup:function(e,t,i){this.groups.push({start:e,count:t,materialIndex:void 0!==i?i:0})},clearGroups:function(){this.groups=[]},setDrawRange:function(e,t){this.drawRange.start=e,this.drawRange.count=t},applyMatrix:function(e){var t=this.attributes.position;void 0!==t&&(e.applyToBufferAttribute(t),t.needsUpdate=!0);var i=this.attributes.normal;void 0!==i&&((new Matrix3).getNormalMatrix(e).applyToBufferAttribute(i),i.needsUpdate=!0);var r=this.attributes.tangent;void 0!==r&&((new Matrix3).getNormalMatrix(e).applyToBufferAttribute(r),r.needsUpdate=!0);return null!==this.boundingBox&&this.computeBoundingBox(),null!==this.boundingSphere&&this.computeBoundingSphere(),this},rotateX:function(){var e=new Matrix4;return function(t){return e.makeRotationX(t),this.applyMatrix(e),this}}(),rotateY:function(){var e=new Matrix4;return function(t){return e.makeRotationY(t),this.applyMatrix(e),this}}(),rotateZ:function(){var e=new Matrix4;return function(t){return e.makeRotationZ(t),this.applyMatrix(e),this}}(),translate:function(){var e=new Matrix4;return function(t,i,r){return e.makeTranslation(t,i,r),this.applyMatrix(e),this}}(),scale:function(){var e=new Matrix4;return function(t,i,r){return e.makeScale(t,i,r),this.applyMatrix(e),this}}(),lookAt:function(){var e=new Object3D;return function(t){e.lookAt(t),e.updateMatrix(),this.applyMatrix(e.matrix)}}(),center:function(){var e=new Vector3;return function(){return this.computeBoundingBox(),this.boundingBox.getCenter(e).negate(),this.translate(e.x,e.y,e.z),this}}(),setFromObject:function(e){var t=e.geometry;if(e.isPoints||e.isLine){var i=new Float32BufferAttribute(3*t.vertices.length,3),r=new Float32BufferAttribute(3*t.colors.length,3);if(this.addAttribute("position",i.copyVector3sArray(t.vertices)),this.addAttribute("color",r.copyColorsArray(t.colors)),t.lineDistances&&t.lineDistances.length===t.vertices.length){var n=new Float32BufferAttribute(t.lineDistances.length,1);this.addAttribute("lineDistance",n.copyArray(t.lineDistances))}null!==t.boundingSphere&&(this.boundingSphere=t.boundingSphere.clone()),null!==t.boundingBox&&(this.boundingBox=t.boundingBox.clone())}else e.isMesh&&t&&t.isGeometry&&this.fromGeometry(t);return this},setFromPoints:function(e){for(var t=[],i=0,r=e.length;i<r;i++){var n=e[i];t.push(n.x,n.y,n.z||0)}return this.addAttribute("position",new Float32BufferAttribute(t,3)),this},updateFromObject:function(e){var t,i=e.geometry;if(e.isMesh){var r=i.__directGeometry;if(!0===i.elementsNeedUpdate&&(r=void 0,i.elementsNeedUpdate=!1),void 0===r)return this.fromGeometry(i);r.verticesNeedUpdate=i.verticesNeedUpdate,r.normalsNeedUpdate=i.normalsNeedUpdate,r.colorsNeedUpdate=i.colorsNeedUpdate,r.uvsNeedUpdate=i.uvsNeedUpdate,r.groupsNeedUpdate=i.groupsNeedUpdate,i.verticesNeedUpdate=!1,i.normalsNeedUpdate=!1,i.colorsNeedUpdate=!1,i.uvsNeedUpdate=!1,i.groupsNeedUpdate=!1,i=r}return!0===i.verticesNeedUpdate&&(void 0!==(t=this.attributes.position)&&(t.copyVector3sArray(i.vertices),t.needsUpdate=!0),i.verticesNeedUpdate=!1),!0===i.normalsNeedUpdate&&(void 0!==(t=this.attributes.normal)&&(t.copyVector3sArray(i.normals),t.needsUpdate=!0),i.normalsNeedUpdate=!1),!0===i.colorsNeedUpdate&&(void 0!==(t=this.attributes.color)&&(t.copyColorsArray(i.colors),t.needsUpdate=!0),i.colorsNeedUpdate=!1),i.uvsNeedUpdate&&(void 0!==(t=this.attributes.uv)&&(t.copyVector2sArray(i.uvs),t.needsUpdate=!0),i.uvsNeedUpdate=!1),i.lineDistancesNeedUpdate&&(void 0!==(t=this.attributes.lineDistance)&&(t.copyArray(i.lineDistances),t.needsUpdate=!0),i.lineDistancesNeedUpdate=!1),i.groupsNeedUpdate&&(i.computeGroups(e.geometry),this.groups=i.groups,i.groupsNeedUpdate=!1),this},fromGeometry:function(e){return e.__directGeometry=(new DirectGeometry).fromGeometry(e),this.fromDirectGeometry(e.__directGeometry)},fromDirectGeometry:function(e){var t=new Float32Array(3*e.vertices.length);if(this.addAttribute("position",new BufferAttribute(t,3).copyVector3sArray(e.vertices)),e.normals.length>0){var i=new Float32Array(3*e.normals.length);this.addAttribute("normal",new BufferAttribute(i,3).copyVector3sArray(e.normals))}if(e.colors.length>0){var r=new Float32Array(3*e.colors.length);this.addAttribute("color",new BufferAttribute(r,3).copyColorsArray(e.colors))}if(e.uvs.length>0){var n=new Float32Array(2*e.uvs.length);this.addAttribute("uv",new BufferAttribute(n,2).copyVector2sArray(e.uvs))}if(e.uvs2.length>0){var o=new Float32Array(2*e.uvs2.length);this.addAttribute("uv2",new BufferAttribute(o,2).copyVector2sArray(e.uvs2))}for(var a in this.groups=e.groups,e.morphTargets){for(var s=[],l=e.morphTargets[a],u=0,h=l.length;u<h;u++){var c=l[u],d=new Float32BufferAttribute(3*c.data.length,3);d.name=c.name,s.push(d.copyVector3sArray(c.data))}this.morphAttributes[a]=s}if(e.skinIndices.length>0){var p=new Float32BufferAttribute(4*e.skinIndices.length,4);this.addAttribute("skinIndex",p.copyVector4sArray(e.skinIndices))}if(e.skinWeights.length>0){var f=new Float32BufferAttribute(4*e.skinWeights.length,4);this.addAttribute("skinWeight",f.copyVector4sArray(e.skinWeights))}return null!==e.boundingSphere&&(this.boundingSphere=e.boundingSphere.clone()),null!==e.boundingBox&&(this.boundingBox=e.boundingBox.clone()),this},computeBoundingBox:function(){null===this.boundingBox&&(this.boundingBox=new Box3);var e=this.attributes.position;void 0!==e?this.boundingBox.setFromBufferAttribute(e):this.boundingBox.makeEmpty(),(isNaN(this.boundingBox.min.x)||isNaN(this.boundingBox.min.y)||isNaN(this.boundingBox.min.z))&&console.error('BufferGeometry.computeBoundingBox: Computed min/max have NaN values. The "position" attribute is likely to have NaN values.',this)},computeBoundingSphere:function(){var e=new Box3,t=new Vector3;return function(){null===this.boundingSphere&&(this.boundingSphere=new Sphere);var i=this.attributes.position;if(i){var r=this.boundingSphere.center;e.setFromBufferAttribute(i),e.getCenter(r);for(var n=0,o=0,a=i.count;o<a;o++)t.x=i.getX(o),t.y=i.getY(o),t.z=i.getZ(o),n=Math.max(n,r.distanceToSquared(t));this.boundingSphere.radius=Math.sqrt(n),isNaN(this.boundingSphere.radius)&&console.error('BufferGeometry.computeBoundingSphere(): Computed radius is NaN. The "position" attribute is likely to have NaN values.',this)}}}(),computeFaceNormals:function(){},computeVertexNormals:function(){var e=this.index,t=this.attributes;if(t.position){var i=t.position.array;if(void 0===t.normal)this.addAttribute("normal",new BufferAttribute(new Float32Array(i.length),3));else for(var r=t.normal.array,n=0,o=r.length;n<o;n++)r[n]=0;var a,s,l,u=t.normal.array,h=new Vector3,c=new Vector3,d=new Vector3,p=new Vector3,f=new Vector3;if(e){var m=e.array;for(n=0,o=e.count;n<o;n+=3)a=3*m[n+0],s=3*m[n+1],l=3*m[n+2],h.fromArray(i,a),c.fromArray(i,s),d.fromArray(i,l),p.subVectors(d,c),f.subVectors(h,c),p.cross(f),u[a]+=p.x,u[a+1]+=p.y,u[a+2]+=p.z,u[s]+=p.x,u[s+1]+=p.y,u[s+2]+=p.z,u[l]+=p.x,u[l+1]+=p.y,u[l+2]+=p.z}else for(n=0,o=i.length;n<o;n+=9)h.fromArray(i,n),c.fromArray(i,n+3),d.fromArray(i,n+6),p.subVectors(d,c),f.subVectors(h,c),p.cross(f),u[n]=p.x,u[n+1]=p.y,u[n+2]=p.z,u[n+3]=p.x,u[n+4]=p.y,u[n+5]=p.z,u[n+6]=p.x,u[n+7]=p.y,u[n+8]=p.z;this.normalizeNormals(),t.normal.needsUpdate=!0}},merge:function(e,t){if(e&&e.isBufferGeometry){void 0===t&&(t=0,console.warn("BufferGeometry.merge(): Overwriting original geometry, starting at offset=0. Use BufferGeometryUtils.mergeBufferGeometries() for lossless merge."));var i=this.attributes;for(var r in i)if(void 0!==e.attributes[r])for(var n=i[r].array,o=e.attributes[r],a=o.array,s=0,l=o.itemSize*t;s<a.length;s++,l++)n[l]=a[s];return this}console.error("BufferGeometry.merge(): geometry not an instance of BufferGeometry.",e)},normalizeNormals:function(){var e=new Vector3;return function(){for(var t=this.attributes.normal,i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.normalize(),t.setXYZ(i,e.x,e.y,e.z)}}(),toNonIndexed:function(){function e(e,t){for(var i=e.array,r=e.itemSize,n=new i.constructor(t.length*r),o=0,a=0,s=0,l=t.length;s<l;s++){o=t[s]*r;for(var u=0;u<r;u++)n[a++]=i[o++]}return new BufferAttribute(n,r)}if(null===this.index)return console.warn("BufferGeometry.toNonIndexed(): Geometry is already non-indexed."),this;var t=new BufferGeometry,i=this.index.array,r=this.attributes;for(var n in r){var o=e(r[n],i);t.addAttribute(n,o)}var a=this.morphAttributes;for(n in a){for(var s=[],l=a[n],u=0,h=l.length;u<h;u++){o=e(l[u],i);s.push(o)}t.morphAttributes[n]=s}for(var c=this.groups,d=(u=0,c.length);u<d;u++){var p=c[u];t.addGroup(p.start,p.count,p.materialIndex)}return t},toJSON:function(){var e={metadata:{version:4.5,type:"BufferGeometry",generator:"BufferGeometry.toJSON"}};if(e.uuid=this.uuid,e.type=this.type,""!==this.name&&(e.name=this.name),Object.keys(this.userData).length>0&&(e.userData=this.userData),void 0!==this.parameters){var t=this.parameters;for(var i in t)void 0!==t[i]&&(e[i]=t[i]);return e}e.data={attributes:{}};var r=this.index;null!==r&&(e.data.index={type:r.array.constructor.name,array:Array.prototype.slice.call(r.array)});var n=this.attributes;for(var i in n){var o={itemSize:(d=n[i]).itemSize,type:d.array.constructor.name,array:Array.prototype.slice.call(d.array),normalized:d.normalized};""!==d.name&&(o.name=d.name),e.data.attributes[i]=o}var a={},s=!1;for(var i in this.morphAttributes){for(var l=this.morphAttributes[i],u=[],h=0,c=l.length;h<c;h++){var d;o={itemSize:(d=l[h]).itemSize,type:d.array.constructor.name,array:Array.prototype.slice.call(d.array),normalized:d.normalized};""!==d.name&&(o.name=d.name),u.push(o)}u.length>0&&(a[i]=u,s=!0)}s&&(e.data.morphAttributes=a);var p=this.groups;p.length>0&&(e.data.groups=JSON.parse(JSON.stringify(p)));var f=this.boundingSphere;return null!==f&&(e.data.boundingSphere={center:f.center.toArray(),radius:f.radius}),e},clone:function(){return(new BufferGeometry).copy(this)},copy:function(e){var t,i,r;this.index=null,this.attributes={},this.morphAttributes={},this.groups=[],this.boundingBox=null,this.boundingSphere=null,this.name=e.name;var n=e.index;null!==n&&this.setIndex(n.clone());var o=e.attributes;for(t in o){var a=o[t];this.addAttribute(t,a.clone())}var s=e.morphAttributes;for(t in s){var l=[],u=s[t];for(i=0,r=u.length;i<r;i++)l.push(u[i].clone());this.morphAttributes[t]=l}var h=e.groups;for(i=0,r=h.length;i<r;i++){var c=h[i];this.addGroup(c.start,c.count,c.materialIndex)}var d=e.boundingBox;null!==d&&(this.boundingBox=d.clone());var p=e.boundingSphere;return null!==p&&(this.boundingSphere=p.clone()),this.drawRange.start=e.drawRange.start,this.drawRange.count=e.drawRange.count,this.userData=e.userData,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),SphereGeometry.prototype=Object.create(Geometry.prototype),SphereGeometry.prototype.constructor=SphereGeometry,SphereBufferGeometry.prototype=Object.create(BufferGeometry.prototype),SphereBufferGeometry.prototype.constructor=SphereBufferGeometry;var materialId=0,v,segCenter,segDir,diff,barycoord,v0,vab,vac,vbc,vap,vbp,vcp,inverseMatrix,ray,sphere,start,end;function Material$1(){Object.defineProperty(this,"id",{value:materialId++}),this.uuid=_Math.generateUUID(),this.name="",this.type="Material",this.fog=!0,this.lights=!0,this.blending=NormalBlending,this.side=FrontSide,this.flatShading=!1,this.vertexTangents=!1,this.vertexColors=NoColors,this.opacity=1,this.transparent=!1,this.blendSrc=SrcAlphaFactor,this.blendDst=OneMinusSrcAlphaFactor,this.blendEquation=AddEquation,this.blendSrcAlpha=null,this.blendDstAlpha=null,this.blendEquationAlpha=null,this.depthFunc=LessEqualDepth,this.depthTest=!0,this.depthWrite=!0,this.clippingPlanes=null,this.clipIntersection=!1,this.clipShadows=!1,this.shadowSide=null,this.colorWrite=!0,this.precision=null,this.polygonOffset=!1,this.polygonOffsetFactor=0,this.polygonOffsetUnits=0,this.dithering=!1,this.alphaTest=0,this.premultipliedAlpha=!1,this.visible=!0,this.userData={},this.needsUpdate=!0}function MeshBasicMaterial(e){Material$1.call(this),this.type="MeshBasicMaterial",this.color=new Color(16777215),this.map=null,this.lightMap=null,this.lightMapIntensity=1,this.aoMap=null,this.aoMapIntensity=1,this.specularMap=null,this.alphaMap=null,this.envMap=null,this.combine=MultiplyOperation,this.reflectivity=1,this.refractionRatio=.98,this.wireframe=!1,this.wireframeLinewidth=1,this.wireframeLinecap="round",this.wireframeLinejoin="round",this.skinning=!1,this.morphTargets=!1,this.lights=!1,this.setValues(e)}function LineBasicMaterial(e){Material$1.call(this),this.type="LineBasicMaterial",this.color=new Color(16777215),this.linewidth=1,this.linecap="round",this.linejoin="round",this.lights=!1,this.setValues(e)}function Ray(e,t){this.origin=void 0!==e?e:new Vector3,this.direction=void 0!==t?t:new Vector3}function Triangle(e,t,i){this.a=void 0!==e?e:new Vector3,this.b=void 0!==t?t:new Vector3,this.c=void 0!==i?i:new Vector3}function Mesh(e,t){Object3D.call(this),this.type="Mesh",this.geometry=void 0!==e?e:new BufferGeometry,this.material=void 0!==t?t:new MeshBasicMaterial({color:16777215*Math.random()}),this.drawMode=TrianglesDrawMode,this.updateMorphTargets()}function Line(e,t,i){1===i&&console.error("Line: parameter LinePieces no longer supported. Use LineSegments instead."),Object3D.call(this),this.type="Line",this.geometry=void 0!==e?e:new BufferGeometry,this.material=void 0!==t?t:new LineBasicMaterial({color:16777215*Math.random()})}Material$1.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Material$1,isMaterial:!0,onBeforeCompile:function(){},setValues:function(e){if(void 0!==e)for(var t in e){var i=e[t];if(void 0!==i)if("shading"!==t){var r=this[t];void 0!==r?r&&r.isColor?r.set(i):r&&r.isVector3&&i&&i.isVector3?r.copy(i):this[t]=i:console.warn(this.type+": '"+t+"' is not a property of this material.")}else console.warn(this.type+": .shading has been removed. Use the boolean .flatShading instead."),this.flatShading=i===FlatShading;else console.warn("Material: '"+t+"' parameter is undefined.")}},toJSON:function(e){var t=void 0===e||"string"==typeof e;t&&(e={textures:{},images:{}});var i={metadata:{version:4.5,type:"Material",generator:"Material.toJSON"}};function r(e){var t=[];for(var i in e){var r=e[i];delete r.metadata,t.push(r)}return t}if(i.uuid=this.uuid,i.type=this.type,""!==this.name&&(i.name=this.name),this.color&&this.color.isColor&&(i.color=this.color.getHex()),void 0!==this.roughness&&(i.roughness=this.roughness),void 0!==this.metalness&&(i.metalness=this.metalness),this.emissive&&this.emissive.isColor&&(i.emissive=this.emissive.getHex()),1!==this.emissiveIntensity&&(i.emissiveIntensity=this.emissiveIntensity),this.specular&&this.specular.isColor&&(i.specular=this.specular.getHex()),void 0!==this.shininess&&(i.shininess=this.shininess),void 0!==this.clearCoat&&(i.clearCoat=this.clearCoat),void 0!==this.clearCoatRoughness&&(i.clearCoatRoughness=this.clearCoatRoughness),this.map&&this.map.isTexture&&(i.map=this.map.toJSON(e).uuid),this.alphaMap&&this.alphaMap.isTexture&&(i.alphaMap=this.alphaMap.toJSON(e).uuid),this.lightMap&&this.lightMap.isTexture&&(i.lightMap=this.lightMap.toJSON(e).uuid),this.aoMap&&this.aoMap.isTexture&&(i.aoMap=this.aoMap.toJSON(e).uuid,i.aoMapIntensity=this.aoMapIntensity),this.bumpMap&&this.bumpMap.isTexture&&(i.bumpMap=this.bumpMap.toJSON(e).uuid,i.bumpScale=this.bumpScale),this.normalMap&&this.normalMap.isTexture&&(i.normalMap=this.normalMap.toJSON(e).uuid,i.normalMapType=this.normalMapType,i.normalScale=this.normalScale.toArray()),this.displacementMap&&this.displacementMap.isTexture&&(i.displacementMap=this.displacementMap.toJSON(e).uuid,i.displacementScale=this.displacementScale,i.displacementBias=this.displacementBias),this.roughnessMap&&this.roughnessMap.isTexture&&(i.roughnessMap=this.roughnessMap.toJSON(e).uuid),this.metalnessMap&&this.metalnessMap.isTexture&&(i.metalnessMap=this.metalnessMap.toJSON(e).uuid),this.emissiveMap&&this.emissiveMap.isTexture&&(i.emissiveMap=this.emissiveMap.toJSON(e).uuid),this.specularMap&&this.specularMap.isTexture&&(i.specularMap=this.specularMap.toJSON(e).uuid),this.envMap&&this.envMap.isTexture&&(i.envMap=this.envMap.toJSON(e).uuid,i.reflectivity=this.reflectivity,void 0!==this.combine&&(i.combine=this.combine),void 0!==this.envMapIntensity&&(i.envMapIntensity=this.envMapIntensity)),this.gradientMap&&this.gradientMap.isTexture&&(i.gradientMap=this.gradientMap.toJSON(e).uuid),void 0!==this.size&&(i.size=this.size),void 0!==this.sizeAttenuation&&(i.sizeAttenuation=this.sizeAttenuation),this.blending!==NormalBlending&&(i.blending=this.blending),!0===this.flatShading&&(i.flatShading=this.flatShading),this.side!==FrontSide&&(i.side=this.side),this.vertexColors!==NoColors&&(i.vertexColors=this.vertexColors),this.opacity<1&&(i.opacity=this.opacity),!0===this.transparent&&(i.transparent=this.transparent),i.depthFunc=this.depthFunc,i.depthTest=this.depthTest,i.depthWrite=this.depthWrite,0!==this.rotation&&(i.rotation=this.rotation),!0===this.polygonOffset&&(i.polygonOffset=!0),0!==this.polygonOffsetFactor&&(i.polygonOffsetFactor=this.polygonOffsetFactor),0!==this.polygonOffsetUnits&&(i.polygonOffsetUnits=this.polygonOffsetUnits),1!==this.linewidth&&(i.linewidth=this.linewidth),void 0!==this.dashSize&&(i.dashSize=this.dashSize),void 0!==this.gapSize&&(i.gapSize=this.gapSize),void 0!==this.scale&&(i.scale=this.scale),!0===this.dithering&&(i.dithering=!0),this.alphaTest>0&&(i.alphaTest=this.alphaTest),!0===this.premultipliedAlpha&&(i.premultipliedAlpha=this.premultipliedAlpha),!0===this.wireframe&&(i.wireframe=this.wireframe),this.wireframeLinewidth>1&&(i.wireframeLinewidth=this.wireframeLinewidth),"round"!==this.wireframeLinecap&&(i.wireframeLinecap=this.wireframeLinecap),"round"!==this.wireframeLinejoin&&(i.wireframeLinejoin=this.wireframeLinejoin),!0===this.morphTargets&&(i.morphTargets=!0),!0===this.skinning&&(i.skinning=!0),!1===this.visible&&(i.visible=!1),"{}"!==JSON.stringify(this.userData)&&(i.userData=this.userData),t){var n=r(e.textures),o=r(e.images);n.length>0&&(i.textures=n),o.length>0&&(i.images=o)}return i},clone:function(){return(new this.constructor).copy(this)},copy:function(e){this.name=e.name,this.fog=e.fog,this.lights=e.lights,this.blending=e.blending,this.side=e.side,this.flatShading=e.flatShading,this.vertexColors=e.vertexColors,this.opacity=e.opacity,this.transparent=e.transparent,this.blendSrc=e.blendSrc,this.blendDst=e.blendDst,this.blendEquation=e.blendEquation,this.blendSrcAlpha=e.blendSrcAlpha,this.blendDstAlpha=e.blendDstAlpha,this.blendEquationAlpha=e.blendEquationAlpha,this.depthFunc=e.depthFunc,this.depthTest=e.depthTest,this.depthWrite=e.depthWrite,this.colorWrite=e.colorWrite,this.precision=e.precision,this.polygonOffset=e.polygonOffset,this.polygonOffsetFactor=e.polygonOffsetFactor,this.polygonOffsetUnits=e.polygonOffsetUnits,this.dithering=e.dithering,this.alphaTest=e.alphaTest,this.premultipliedAlpha=e.premultipliedAlpha,this.visible=e.visible,this.userData=JSON.parse(JSON.stringify(e.userData)),this.clipShadows=e.clipShadows,this.clipIntersection=e.clipIntersection;var t=e.clippingPlanes,i=null;if(null!==t){var r=t.length;i=new Array(r);for(var n=0;n!==r;++n)i[n]=t[n].clone()}return this.clippingPlanes=i,this.shadowSide=e.shadowSide,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),MeshBasicMaterial.prototype=Object.create(Material$1.prototype),MeshBasicMaterial.prototype.constructor=MeshBasicMaterial,MeshBasicMaterial.prototype.isMeshBasicMaterial=!0,MeshBasicMaterial.prototype.copy=function(e){return Material$1.prototype.copy.call(this,e),this.color.copy(e.color),this.map=e.map,this.lightMap=e.lightMap,this.lightMapIntensity=e.lightMapIntensity,this.aoMap=e.aoMap,this.aoMapIntensity=e.aoMapIntensity,this.specularMap=e.specularMap,this.alphaMap=e.alphaMap,this.envMap=e.envMap,this.combine=e.combine,this.reflectivity=e.reflectivity,this.refractionRatio=e.refractionRatio,this.wireframe=e.wireframe,this.wireframeLinewidth=e.wireframeLinewidth,this.wireframeLinecap=e.wireframeLinecap,this.wireframeLinejoin=e.wireframeLinejoin,this.skinning=e.skinning,this.morphTargets=e.morphTargets,this},LineBasicMaterial.prototype=Object.create(Material$1.prototype),LineBasicMaterial.prototype.constructor=LineBasicMaterial,LineBasicMaterial.prototype.isLineBasicMaterial=!0,LineBasicMaterial.prototype.copy=function(e){return Material$1.prototype.copy.call(this,e),this.color.copy(e.color),this.linewidth=e.linewidth,this.linecap=e.linecap,this.linejoin=e.linejoin,this},Object.assign(Ray.prototype,{set:function(e,t){return this.origin.copy(e),this.direction.copy(t),this},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.origin.copy(e.origin),this.direction.copy(e.direction),this},at:function(e,t){return void 0===t&&(console.warn("Ray: .at() target is now required"),t=new Vector3),t.copy(this.direction).multiplyScalar(e).add(this.origin)},lookAt:function(e){return this.direction.copy(e).sub(this.origin).normalize(),this},recast:function(){var e=new Vector3;return function(t){return this.origin.copy(this.at(t,e)),this}}(),closestPointToPoint:function(e,t){void 0===t&&(console.warn("Ray: .closestPointToPoint() target is now required"),t=new Vector3),t.subVectors(e,this.origin);var i=t.dot(this.direction);return i<0?t.copy(this.origin):t.copy(this.direction).multiplyScalar(i).add(this.origin)},distanceToPoint:function(e){return Math.sqrt(this.distanceSqToPoint(e))},distanceSqToPoint:function(){var e=new Vector3;return function(t){var i=e.subVectors(t,this.origin).dot(this.direction);return i<0?this.origin.distanceToSquared(t):(e.copy(this.direction).multiplyScalar(i).add(this.origin),e.distanceToSquared(t))}}(),distanceSqToSegment:(segCenter=new Vector3,segDir=new Vector3,diff=new Vector3,function(e,t,i,r){segCenter.copy(e).add(t).multiplyScalar(.5),segDir.copy(t).sub(e).normalize(),diff.copy(this.origin).sub(segCenter);var n,o,a,s,l=.5*e.distanceTo(t),u=-this.direction.dot(segDir),h=diff.dot(this.direction),c=-diff.dot(segDir),d=diff.lengthSq(),p=Math.abs(1-u*u);if(p>0)if(o=u*h-c,s=l*p,(n=u*c-h)>=0)if(o>=-s)if(o<=s){var f=1/p;a=(n*=f)*(n+u*(o*=f)+2*h)+o*(u*n+o+2*c)+d}else o=l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;else o=-l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;else o<=-s?a=-(n=Math.max(0,-(-u*l+h)))*n+(o=n>0?-l:Math.min(Math.max(-l,-c),l))*(o+2*c)+d:o<=s?(n=0,a=(o=Math.min(Math.max(-l,-c),l))*(o+2*c)+d):a=-(n=Math.max(0,-(u*l+h)))*n+(o=n>0?l:Math.min(Math.max(-l,-c),l))*(o+2*c)+d;else o=u>0?-l:l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;return i&&i.copy(this.direction).multiplyScalar(n).add(this.origin),r&&r.copy(segDir).multiplyScalar(o).add(segCenter),a}),intersectSphere:function(){var e=new Vector3;return function(t,i){e.subVectors(t.center,this.origin);var r=e.dot(this.direction),n=e.dot(e)-r*r,o=t.radius*t.radius;if(n>o)return null;var a=Math.sqrt(o-n),s=r-a,l=r+a;return s<0&&l<0?null:s<0?this.at(l,i):this.at(s,i)}}(),intersectsSphere:function(e){return this.distanceSqToPoint(e.center)<=e.radius*e.radius},distanceToPlane:function(e){var t=e.normal.dot(this.direction);if(0===t)return 0===e.distanceToPoint(this.origin)?0:null;var i=-(this.origin.dot(e.normal)+e.constant)/t;return i>=0?i:null},intersectPlane:function(e,t){var i=this.distanceToPlane(e);return null===i?null:this.at(i,t)},intersectsPlane:function(e){var t=e.distanceToPoint(this.origin);return 0===t||e.normal.dot(this.direction)*t<0},intersectBox:function(e,t){var i,r,n,o,a,s,l=1/this.direction.x,u=1/this.direction.y,h=1/this.direction.z,c=this.origin;return l>=0?(i=(e.min.x-c.x)*l,r=(e.max.x-c.x)*l):(i=(e.max.x-c.x)*l,r=(e.min.x-c.x)*l),u>=0?(n=(e.min.y-c.y)*u,o=(e.max.y-c.y)*u):(n=(e.max.y-c.y)*u,o=(e.min.y-c.y)*u),i>o||n>r?null:((n>i||i!=i)&&(i=n),(o<r||r!=r)&&(r=o),h>=0?(a=(e.min.z-c.z)*h,s=(e.max.z-c.z)*h):(a=(e.max.z-c.z)*h,s=(e.min.z-c.z)*h),i>s||a>r?null:((a>i||i!=i)&&(i=a),(s<r||r!=r)&&(r=s),r<0?null:this.at(i>=0?i:r,t)))},intersectsBox:(v=new Vector3,function(e){return null!==this.intersectBox(e,v)}),intersectTriangle:function(){var e=new Vector3,t=new Vector3,i=new Vector3,r=new Vector3;return function(n,o,a,s,l){t.subVectors(o,n),i.subVectors(a,n),r.crossVectors(t,i);var u,h=this.direction.dot(r);if(h>0){if(s)return null;u=1}else{if(!(h<0))return null;u=-1,h=-h}e.subVectors(this.origin,n);var c=u*this.direction.dot(i.crossVectors(e,i));if(c<0)return null;var d=u*this.direction.dot(t.cross(e));if(d<0)return null;if(c+d>h)return null;var p=-u*e.dot(r);return p<0?null:this.at(p/h,l)}}(),applyMatrix4:function(e){return this.origin.applyMatrix4(e),this.direction.transformDirection(e),this},equals:function(e){return e.origin.equals(this.origin)&&e.direction.equals(this.direction)}}),Object.assign(Triangle,{getNormal:(v0=new Vector3,function(e,t,i,r){void 0===r&&(console.warn("Triangle: .getNormal() target is now required"),r=new Vector3),r.subVectors(i,t),v0.subVectors(e,t),r.cross(v0);var n=r.lengthSq();return n>0?r.multiplyScalar(1/Math.sqrt(n)):r.set(0,0,0)}),getBarycoord:function(){var e=new Vector3,t=new Vector3,i=new Vector3;return function(r,n,o,a,s){e.subVectors(a,n),t.subVectors(o,n),i.subVectors(r,n);var l=e.dot(e),u=e.dot(t),h=e.dot(i),c=t.dot(t),d=t.dot(i),p=l*c-u*u;if(void 0===s&&(console.warn("Triangle: .getBarycoord() target is now required"),s=new Vector3),0===p)return s.set(-2,-1,-1);var f=1/p,m=(c*h-u*d)*f,v=(l*d-u*h)*f;return s.set(1-m-v,v,m)}}(),containsPoint:function(){var e=new Vector3;return function(t,i,r,n){return Triangle.getBarycoord(t,i,r,n,e),e.x>=0&&e.y>=0&&e.x+e.y<=1}}(),getUV:(barycoord=new Vector3,function(e,t,i,r,n,o,a,s){return this.getBarycoord(e,t,i,r,barycoord),s.set(0,0),s.addScaledVector(n,barycoord.x),s.addScaledVector(o,barycoord.y),s.addScaledVector(a,barycoord.z),s})}),Object.assign(Triangle.prototype,{set:function(e,t,i){return this.a.copy(e),this.b.copy(t),this.c.copy(i),this},setFromPointsAndIndices:function(e,t,i,r){return this.a.copy(e[t]),this.b.copy(e[i]),this.c.copy(e[r]),this},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.a.copy(e.a),this.b.copy(e.b),this.c.copy(e.c),this},getArea:function(){var e=new Vector3,t=new Vector3;return function(){return e.subVectors(this.c,this.b),t.subVectors(this.a,this.b),.5*e.cross(t).length()}}(),getMidpoint:function(e){return void 0===e&&(console.warn("Triangle: .getMidpoint() target is now required"),e=new Vector3),e.addVectors(this.a,this.b).add(this.c).multiplyScalar(1/3)},getNormal:function(e){return Triangle.getNormal(this.a,this.b,this.c,e)},getPlane:function(e){return void 0===e&&(console.warn("Triangle: .getPlane() target is now required"),e=new Vector3),e.setFromCoplanarPoints(this.a,this.b,this.c)},getBarycoord:function(e,t){return Triangle.getBarycoord(e,this.a,this.b,this.c,t)},containsPoint:function(e){return Triangle.containsPoint(e,this.a,this.b,this.c)},getUV:function(e,t,i,r,n){return Triangle.getUV(e,this.a,this.b,this.c,t,i,r,n)},intersectsBox:function(e){return e.intersectsTriangle(this)},closestPointToPoint:(vab=new Vector3,vac=new Vector3,vbc=new Vector3,vap=new Vector3,vbp=new Vector3,vcp=new Vector3,function(e,t){void 0===t&&(console.warn("Triangle: .closestPointToPoint() target is now required"),t=new Vector3);var i,r,n=this.a,o=this.b,a=this.c;vab.subVectors(o,n),vac.subVectors(a,n),vap.subVectors(e,n);var s=vab.dot(vap),l=vac.dot(vap);if(s<=0&&l<=0)return t.copy(n);vbp.subVectors(e,o);var u=vab.dot(vbp),h=vac.dot(vbp);if(u>=0&&h<=u)return t.copy(o);var c=s*h-u*l;if(c<=0&&s>=0&&u<=0)return i=s/(s-u),t.copy(n).addScaledVector(vab,i);vcp.subVectors(e,a);var d=vab.dot(vcp),p=vac.dot(vcp);if(p>=0&&d<=p)return t.copy(a);var f=d*l-s*p;if(f<=0&&l>=0&&p<=0)return r=l/(l-p),t.copy(n).addScaledVector(vac,r);var m=u*p-d*h;if(m<=0&&h-u>=0&&d-p>=0)return vbc.subVectors(a,o),r=(h-u)/(h-u+(d-p)),t.copy(o).addScaledVector(vbc,r);var v=1/(m+f+c);return i=f*v,r=c*v,t.copy(n).addScaledVector(vab,i).addScaledVector(vac,r)}),equals:function(e){return e.a.equals(this.a)&&e.b.equals(this.b)&&e.c.equals(this.c)}}),Mesh.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:Mesh,isMesh:!0,setDrawMode:function(e){this.drawMode=e},copy:function(e){return Object3D.prototype.copy.call(this,e),this.drawMode=e.drawMode,void 0!==e.morphTargetInfluences&&(this.morphTargetInfluences=e.morphTargetInfluences.slice()),void 0!==e.morphTargetDictionary&&(this.morphTargetDictionary=Object.assign({},e.morphTargetDictionary)),this},updateMorphTargets:function(){var e,t,i,r=this.geometry;if(r.isBufferGeometry){var n=r.morphAttributes,o=Object.keys(n);if(o.length>0){var a=n[o[0]];if(void 0!==a)for(this.morphTargetInfluences=[],this.morphTargetDictionary={},e=0,t=a.length;e<t;e++)i=a[e].name||String(e),this.morphTargetInfluences.push(0),this.morphTargetDictionary[i]=e}}else{var s=r.morphTargets;void 0!==s&&s.length>0&&console.error("Mesh.updateMorphTargets() no longer supports Geometry. Use BufferGeometry instead.")}},raycast:function(){var e=new Matrix4,t=new Ray,i=new Sphere,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Vector3,l=new Vector3,u=new Vector2,h=new Vector2,c=new Vector2,d=new Vector3,p=new Vector3;function f(e,t,i,r,n,o,a,s){if(null===(t.side===BackSide?r.intersectTriangle(a,o,n,!0,s):r.intersectTriangle(n,o,a,t.side!==DoubleSide,s)))return null;p.copy(s),p.applyMatrix4(e.matrixWorld);var l=i.ray.origin.distanceTo(p);return l<i.near||l>i.far?null:{distance:l,point:p.clone(),object:e}}function m(e,t,i,a,s,l,p,m,v){r.fromBufferAttribute(s,p),n.fromBufferAttribute(s,m),o.fromBufferAttribute(s,v);var g=f(e,t,i,a,r,n,o,d);if(g){l&&(u.fromBufferAttribute(l,p),h.fromBufferAttribute(l,m),c.fromBufferAttribute(l,v),g.uv=Triangle.getUV(d,r,n,o,u,h,c,new Vector2));var y=new Face3(p,m,v);Triangle.getNormal(r,n,o,y.normal),g.face=y}return g}return function(p,v){var g,y=this.geometry,_=this.material,b=this.matrixWorld;if(void 0!==_&&(null===y.boundingSphere&&y.computeBoundingSphere(),i.copy(y.boundingSphere),i.applyMatrix4(b),!1!==p.ray.intersectsSphere(i)&&(e.getInverse(b),t.copy(p.ray).applyMatrix4(e),null===y.boundingBox||!1!==t.intersectsBox(y.boundingBox))))if(y.isBufferGeometry){var x,w,S,M,T,A,C,L,N,k=y.index,P=y.attributes.position,E=y.attributes.uv,D=y.groups,O=y.drawRange;if(null!==k)if(Array.isArray(_))for(M=0,A=D.length;M<A;M++)for(N=_[(L=D[M]).materialIndex],T=Math.max(L.start,O.start),C=Math.min(L.start+L.count,O.start+O.count);T<C;T+=3)x=k.getX(T),w=k.getX(T+1),S=k.getX(T+2),(g=m(this,N,p,t,P,E,x,w,S))&&(g.faceIndex=Math.floor(T/3),g.face.materialIndex=L.materialIndex,v.push(g));else for(M=Math.max(0,O.start),A=Math.min(k.count,O.start+O.count);M<A;M+=3)x=k.getX(M),w=k.getX(M+1),S=k.getX(M+2),(g=m(this,_,p,t,P,E,x,w,S))&&(g.faceIndex=Math.floor(M/3),v.push(g));else if(void 0!==P)if(Array.isArray(_))for(M=0,A=D.length;M<A;M++)for(N=_[(L=D[M]).materialIndex],T=Math.max(L.start,O.start),C=Math.min(L.start+L.count,O.start+O.count);T<C;T+=3)(g=m(this,N,p,t,P,E,x=T,w=T+1,S=T+2))&&(g.faceIndex=Math.floor(T/3),g.face.materialIndex=L.materialIndex,v.push(g));else for(M=Math.max(0,O.start),A=Math.min(P.count,O.start+O.count);M<A;M+=3)(g=m(this,_,p,t,P,E,x=M,w=M+1,S=M+2))&&(g.faceIndex=Math.floor(M/3),v.push(g))}else if(y.isGeometry){var R,F,I,B,U=Array.isArray(_),V=y.vertices,z=y.faces,G=y.faceVertexUvs[0];G.length>0&&(B=G);for(var j=0,W=z.length;j<W;j++){var H=z[j],q=U?_[H.materialIndex]:_;if(void 0!==q){if(R=V[H.a],F=V[H.b],I=V[H.c],!0===q.morphTargets){var Y=y.morphTargets,X=this.morphTargetInfluences;r.set(0,0,0),n.set(0,0,0),o.set(0,0,0);for(var K=0,Q=Y.length;K<Q;K++){var Z=X[K];if(0!==Z){var J=Y[K].vertices;r.addScaledVector(a.subVectors(J[H.a],R),Z),n.addScaledVector(s.subVectors(J[H.b],F),Z),o.addScaledVector(l.subVectors(J[H.c],I),Z)}}r.add(R),n.add(F),o.add(I),R=r,F=n,I=o}if(g=f(this,q,p,t,R,F,I,d)){if(B&&B[j]){var $=B[j];u.copy($[0]),h.copy($[1]),c.copy($[2]),g.uv=Triangle.getUV(d,R,F,I,u,h,c,new Vector2)}g.face=H,g.faceIndex=j,v.push(g)}}}}}}(),clone:function(){return new this.constructor(this.geometry,this.material).copy(this)}}),Line.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:Line,isLine:!0,computeLineDistances:(start=new Vector3,end=new Vector3,function(){var e=this.geometry;if(e.isBufferGeometry)if(null===e.index){for(var t=e.attributes.position,i=[0],r=1,n=t.count;r<n;r++)start.fromBufferAttribute(t,r-1),end.fromBufferAttribute(t,r),i[r]=i[r-1],i[r]+=start.distanceTo(end);e.addAttribute("lineDistance",new Float32BufferAttribute(i,1))}else console.warn("Line.computeLineDistances(): Computation only possible with non-indexed BufferGeometry.");else if(e.isGeometry){var o=e.vertices;for((i=e.lineDistances)[0]=0,r=1,n=o.length;r<n;r++)i[r]=i[r-1],i[r]+=o[r-1].distanceTo(o[r])}return this}),raycast:(inverseMatrix=new Matrix4,ray=new Ray,sphere=new Sphere,function(e,t){var i=e.linePrecision,r=this.geometry,n=this.matrixWorld;if(null===r.boundingSphere&&r.computeBoundingSphere(),sphere.copy(r.boundingSphere),sphere.applyMatrix4(n),sphere.radius+=i,!1!==e.ray.intersectsSphere(sphere)){inverseMatrix.getInverse(n),ray.copy(e.ray).applyMatrix4(inverseMatrix);var o=i/((this.scale.x+this.scale.y+this.scale.z)/3),a=o*o,s=new Vector3,l=new Vector3,u=new Vector3,h=new Vector3,c=this&&this.isLineSegments?2:1;if(r.isBufferGeometry){var d=r.index,p=r.attributes.position.array;if(null!==d)for(var f=d.array,m=0,v=f.length-1;m<v;m+=c){var g=f[m],y=f[m+1];s.fromArray(p,3*g),l.fromArray(p,3*y),ray.distanceSqToSegment(s,l,h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}else for(m=0,v=p.length/3-1;m<v;m+=c)s.fromArray(p,3*m),l.fromArray(p,3*m+3),ray.distanceSqToSegment(s,l,h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}else if(r.isGeometry){var _=r.vertices,b=_.length;for(m=0;m<b-1;m+=c){var x;ray.distanceSqToSegment(_[m],_[m+1],h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}}}}),copy:function(e){return Object3D.prototype.copy.call(this,e),this.geometry.copy(e.geometry),this.material.copy(e.material),this},clone:function(){return(new this.constructor).copy(this)}});var CCDIKSolver=function(){function e(e,t){this.mesh=e,this.iks=t||[],this._valid()}var t,i,r,n,o,a,s,l,u,h;function c(e,t){Object3D.call(this),this.root=e,this.iks=t||[],this.matrix.copy(e.matrixWorld),this.matrixAutoUpdate=!1,this.sphereGeometry=new SphereBufferGeometry(.25,16,8),this.targetSphereMaterial=new MeshBasicMaterial({color:new Color(16746632),depthTest:!1,depthWrite:!1,transparent:!0}),this.effectorSphereMaterial=new MeshBasicMaterial({color:new Color(8978312),depthTest:!1,depthWrite:!1,transparent:!0}),this.linkSphereMaterial=new MeshBasicMaterial({color:new Color(8947967),depthTest:!1,depthWrite:!1,transparent:!0}),this.lineMaterial=new LineBasicMaterial({color:new Color(16711680),depthTest:!1,depthWrite:!1,transparent:!0}),this._init()}return e.prototype={constructor:e,update:(t=new Quaternion,i=new Vector3,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Quaternion,l=new Vector3,u=new Vector3,h=new Vector3,function(){for(var e=this.mesh.skeleton.bones,c=this.iks,d=Math,p=0,f=c.length;p<f;p++){var m=c[p],v=e[m.effector],g=e[m.target];i.setFromMatrixPosition(g.matrixWorld);for(var y=m.links,_=void 0!==m.iteration?m.iteration:1,b=0;b<_;b++){for(var x=!1,w=0,S=y.length;w<S;w++){var M=e[y[w].index];if(!1===y[w].enabled)break;var T=y[w].limitation,A=y[w].rotationMin,C=y[w].rotationMax;M.matrixWorld.decompose(a,s,l),s.inverse(),n.setFromMatrixPosition(v.matrixWorld),o.subVectors(n,a),o.applyQuaternion(s),o.normalize(),r.subVectors(i,a),r.applyQuaternion(s),r.normalize();var L=r.dot(o);if(L>1?L=1:L<-1&&(L=-1),!((L=d.acos(L))<1e-5)){if(void 0!==m.minAngle&&L<m.minAngle&&(L=m.minAngle),void 0!==m.maxAngle&&L>m.maxAngle&&(L=m.maxAngle),u.crossVectors(o,r),u.normalize(),t.setFromAxisAngle(u,L),M.quaternion.multiply(t),void 0!==T){var N=M.quaternion.w;N>1&&(N=1);var k=d.sqrt(1-N*N);M.quaternion.set(T.x*k,T.y*k,T.z*k,N)}void 0!==A&&M.rotation.setFromVector3(M.rotation.toVector3(h).max(A)),void 0!==C&&M.rotation.setFromVector3(M.rotation.toVector3(h).min(C)),M.updateMatrixWorld(!0),x=!0}}if(!x)break}}return this}),createHelper:function(){return new c(this.mesh,this.mesh.geometry.userData.MMD.iks)},_valid:function(){for(var e=this.iks,t=this.mesh.skeleton.bones,i=0,r=e.length;i<r;i++){var n,o,a=e[i],s=t[a.effector],l=a.links;n=s;for(var u=0,h=l.length;u<h;u++)o=t[l[u].index],n.parent!==o&&console.warn("CCDIKSolver: bone "+n.name+" is not the child of bone "+o.name),n=o}}},c.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:c,updateMatrixWorld:function(){var e=new Matrix4,t=new Vector3;function i(e,i){return t.setFromMatrixPosition(e.matrixWorld).applyMatrix4(i)}function r(e,t,r,n){var o=i(r,n);e[3*t+0]=o.x,e[3*t+1]=o.y,e[3*t+2]=o.z}return function(t){var n=this.root;if(this.visible){var o=0,a=this.iks,s=n.skeleton.bones;e.getInverse(n.matrixWorld);for(var l=0,u=a.length;l<u;l++){var h=a[l],c=s[h.target],d=s[h.effector],p=this.children[o++],f=this.children[o++];p.position.copy(i(c,e)),f.position.copy(i(d,e));for(var m=0,v=h.links.length;m<v;m++){var g=s[h.links[m].index];this.children[o++].position.copy(i(g,e))}var y=this.children[o++],_=y.geometry.attributes.position.array;r(_,0,c,e),r(_,1,d,e);for(m=0,v=h.links.length;m<v;m++){r(_,m+2,g=s[h.links[m].index],e)}y.geometry.attributes.position.needsUpdate=!0}}this.matrix.copy(n.matrixWorld),Object3D.prototype.updateMatrixWorld.call(this,t)}}(),_init:function(){var e=this,t=this.iks;function i(t){return new Line(function(e){var t=new BufferGeometry,i=new Float32Array(3*(2+e.links.length));return t.addAttribute("position",new BufferAttribute(i,3)),t}(t),e.lineMaterial)}for(var r=0,n=t.length;r<n;r++){var o=t[r];this.add(new Mesh(e.sphereGeometry,e.targetSphereMaterial)),this.add(new Mesh(e.sphereGeometry,e.effectorSphereMaterial));for(var a=0,s=o.links.length;a<s;a++)this.add(new Mesh(e.sphereGeometry,e.linkSphereMaterial));this.add(i(o))}}}),e}();function AnimationAction(e,t,i){this._mixer=e,this._clip=t,this._localRoot=i||null;for(var r=t.tracks,n=r.length,o=new Array(n),a={endingStart:ZeroCurvatureEnding,endingEnd:ZeroCurvatureEnding},s=0;s!==n;++s){var l=r[s].createInterpolant(null);o[s]=l,l.settings=a}this._interpolantSettings=a,this._interpolants=o,this._propertyBindings=new Array(n),this._cacheIndex=null,this._byClipCacheIndex=null,this._timeScaleInterpolant=null,this._weightInterpolant=null,this.loop=LoopRepeat,this._loopCount=-1,this._startTime=null,this.time=0,this.timeScale=1,this._effectiveTimeScale=1,this.weight=1,this._effectiveWeight=1,this.repetitions=1/0,this.paused=!1,this.enabled=!0,this.clampWhenFinished=!1,this.zeroSlopeAtStart=!0,this.zeroSlopeAtEnd=!0}function Interpolant(e,t,i,r){this.parameterPositions=e,this._cachedIndex=0,this.resultBuffer=void 0!==r?r:new t.constructor(i),this.sampleValues=t,this.valueSize=i}function LinearInterpolant(e,t,i,r){Interpolant.call(this,e,t,i,r)}Object.assign(AnimationAction.prototype,{play:function(){return this._mixer._activateAction(this),this},stop:function(){return this._mixer._deactivateAction(this),this.reset()},reset:function(){return this.paused=!1,this.enabled=!0,this.time=0,this._loopCount=-1,this._startTime=null,this.stopFading().stopWarping()},isRunning:function(){return this.enabled&&!this.paused&&0!==this.timeScale&&null===this._startTime&&this._mixer._isActiveAction(this)},isScheduled:function(){return this._mixer._isActiveAction(this)},startAt:function(e){return this._startTime=e,this},setLoop:function(e,t){return this.loop=e,this.repetitions=t,this},setEffectiveWeight:function(e){return this.weight=e,this._effectiveWeight=this.enabled?e:0,this.stopFading()},getEffectiveWeight:function(){return this._effectiveWeight},fadeIn:function(e){return this._scheduleFading(e,0,1)},fadeOut:function(e){return this._scheduleFading(e,1,0)},crossFadeFrom:function(e,t,i){if(e.fadeOut(t),this.fadeIn(t),i){var r=this._clip.duration,n=e._clip.duration,o=n/r,a=r/n;e.warp(1,o,t),this.warp(a,1,t)}return this},crossFadeTo:function(e,t,i){return e.crossFadeFrom(this,t,i)},stopFading:function(){var e=this._weightInterpolant;return null!==e&&(this._weightInterpolant=null,this._mixer._takeBackControlInterpolant(e)),this},setEffectiveTimeScale:function(e){return this.timeScale=e,this._effectiveTimeScale=this.paused?0:e,this.stopWarping()},getEffectiveTimeScale:function(){return this._effectiveTimeScale},setDuration:function(e){return this.timeScale=this._clip.duration/e,this.stopWarping()},syncWith:function(e){return this.time=e.time,this.timeScale=e.timeScale,this.stopWarping()},halt:function(e){return this.warp(this._effectiveTimeScale,0,e)},warp:function(e,t,i){var r=this._mixer,n=r.time,o=this._timeScaleInterpolant,a=this.timeScale;null===o&&(o=r._lendControlInterpolant(),this._timeScaleInterpolant=o);var s=o.parameterPositions,l=o.sampleValues;return s[0]=n,s[1]=n+i,l[0]=e/a,l[1]=t/a,this},stopWarping:function(){var e=this._timeScaleInterpolant;return null!==e&&(this._timeScaleInterpolant=null,this._mixer._takeBackControlInterpolant(e)),this},getMixer:function(){return this._mixer},getClip:function(){return this._clip},getRoot:function(){return this._localRoot||this._mixer._root},_update:function(e,t,i,r){if(this.enabled){var n=this._startTime;if(null!==n){var o=(e-n)*i;if(o<0||0===i)return;this._startTime=null,t=i*o}t*=this._updateTimeScale(e);var a=this._updateTime(t),s=this._updateWeight(e);if(s>0)for(var l=this._interpolants,u=this._propertyBindings,h=0,c=l.length;h!==c;++h)l[h].evaluate(a),u[h].accumulate(r,s)}else this._updateWeight(e)},_updateWeight:function(e){var t=0;if(this.enabled){t=this.weight;var i=this._weightInterpolant;if(null!==i){var r=i.evaluate(e)[0];t*=r,e>i.parameterPositions[1]&&(this.stopFading(),0===r&&(this.enabled=!1))}}return this._effectiveWeight=t,t},_updateTimeScale:function(e){var t=0;if(!this.paused){t=this.timeScale;var i=this._timeScaleInterpolant;if(null!==i)t*=i.evaluate(e)[0],e>i.parameterPositions[1]&&(this.stopWarping(),0===t?this.paused=!0:this.timeScale=t)}return this._effectiveTimeScale=t,t},_updateTime:function(e){var t=this.time+e,i=this._clip.duration,r=this.loop,n=this._loopCount,o=r===LoopPingPong;if(0===e)return-1===n?t:o&&1==(1&n)?i-t:t;if(r===LoopOnce){-1===n&&(this._loopCount=0,this._setEndings(!0,!0,!1));e:{if(t>=i)t=i;else{if(!(t<0))break e;t=0}this.clampWhenFinished?this.paused=!0:this.enabled=!1,this._mixer.dispatchEvent({type:"finished",action:this,direction:e<0?-1:1})}}else{if(-1===n&&(e>=0?(n=0,this._setEndings(!0,0===this.repetitions,o)):this._setEndings(0===this.repetitions,!0,o)),t>=i||t<0){var a=Math.floor(t/i);t-=i*a,n+=Math.abs(a);var s=this.repetitions-n;if(s<=0)this.clampWhenFinished?this.paused=!0:this.enabled=!1,t=e>0?i:0,this._mixer.dispatchEvent({type:"finished",action:this,direction:e>0?1:-1});else{if(1===s){var l=e<0;this._setEndings(l,!l,o)}else this._setEndings(!1,!1,o);this._loopCount=n,this._mixer.dispatchEvent({type:"loop",action:this,loopDelta:a})}}if(o&&1==(1&n))return this.time=t,i-t}return this.time=t,t},_setEndings:function(e,t,i){var r=this._interpolantSettings;i?(r.endingStart=ZeroSlopeEnding,r.endingEnd=ZeroSlopeEnding):(r.endingStart=e?this.zeroSlopeAtStart?ZeroSlopeEnding:ZeroCurvatureEnding:WrapAroundEnding,r.endingEnd=t?this.zeroSlopeAtEnd?ZeroSlopeEnding:ZeroCurvatureEnding:WrapAroundEnding)},_scheduleFading:function(e,t,i){var r=this._mixer,n=r.time,o=this._weightInterpolant;null===o&&(o=r._lendControlInterpolant(),this._weightInterpolant=o);var a=o.parameterPositions,s=o.sampleValues;return a[0]=n,s[0]=t,a[1]=n+e,s[1]=i,this}}),Object.assign(Interpolant.prototype,{evaluate:function(e){var t=this.parameterPositions,i=this._cachedIndex,r=t[i],n=t[i-1];e:{t:{var o;i:{r:if(!(e<r)){for(var a=i+2;;){if(void 0===r){if(e<n)break r;return i=t.length,this._cachedIndex=i,this.afterEnd_(i-1,e,n)}if(i===a)break;if(n=r,e<(r=t[++i]))break t}o=t.length;break i}if(e>=n)break e;var s=t[1];e<s&&(i=2,n=s);for(a=i-2;;){if(void 0===n)return this._cachedIndex=0,this.beforeStart_(0,e,r);if(i===a)break;if(r=n,e>=(n=t[--i-1]))break t}o=i,i=0}for(;i<o;){var l=i+o>>>1;e<t[l]?o=l:i=l+1}if(r=t[i],void 0===(n=t[i-1]))return this._cachedIndex=0,this.beforeStart_(0,e,r);if(void 0===r)return i=t.length,this._cachedIndex=i,this.afterEnd_(i-1,n,e)}this._cachedIndex=i,this.intervalChanged_(i,n,r)}return this.interpolate_(i,n,e,r)},settings:null,DefaultSettings_:{},getSettings_:function(){return this.settings||this.DefaultSettings_},copySampleValue_:function(e){for(var t=this.resultBuffer,i=this.sampleValues,r=this.valueSize,n=e*r,o=0;o!==r;++o)t[o]=i[n+o];return t},interpolate_:function(){throw new Error("call to abstract method")},intervalChanged_:function(){}}),
+!function(n,o,a,s){var l,u=["","webkit","Moz","MS","ms","o"],h=o.createElement("div"),c="function",d=Math.round,p=Math.abs,f=Date.now;function m(e,t,i){return setTimeout(w(e,i),t)}function v(e,t,i){return!!Array.isArray(e)&&(g(e,i[t],i),!0)}function g(e,t,i){var r;if(e)if(e.forEach)e.forEach(t,i);else if(e.length!==s)for(r=0;r<e.length;)t.call(i,e[r],r,e),r++;else for(r in e)e.hasOwnProperty(r)&&t.call(i,e[r],r,e)}function y(e,t,i){var r="DEPRECATED METHOD: "+t+"\n"+i+" AT \n";return function(){var t=new Error("get-stack-trace"),i=t&&t.stack?t.stack.replace(/^[^\(]+?[\n$]/gm,"").replace(/^\s+at\s+/gm,"").replace(/^Object.<anonymous>\s*\(/gm,"{anonymous}()@"):"Unknown Stack Trace",o=n.console&&(n.console.warn||n.console.log);return o&&o.call(n.console,r,i),e.apply(this,arguments)}}l="function"!=typeof Object.assign?function(e){if(e===s||null===e)throw new TypeError("Cannot convert undefined or null to object");for(var t=Object(e),i=1;i<arguments.length;i++){var r=arguments[i];if(r!==s&&null!==r)for(var n in r)r.hasOwnProperty(n)&&(t[n]=r[n])}return t}:Object.assign;var _=y(function(e,t,i){for(var r=Object.keys(t),n=0;n<r.length;)(!i||i&&e[r[n]]===s)&&(e[r[n]]=t[r[n]]),n++;return e},"extend","Use `assign`."),b=y(function(e,t){return _(e,t,!0)},"merge","Use `assign`.");function x(e,t,i){var r,n=t.prototype;(r=e.prototype=Object.create(n)).constructor=e,r._super=n,i&&l(r,i)}function w(e,t){return function(){return e.apply(t,arguments)}}function S(e,t){return typeof e==c?e.apply(t&&t[0]||s,t):e}function M(e,t){return e===s?t:e}function T(e,t,i){g(N(t),function(t){e.addEventListener(t,i,!1)})}function A(e,t,i){g(N(t),function(t){e.removeEventListener(t,i,!1)})}function C(e,t){for(;e;){if(e==t)return!0;e=e.parentNode}return!1}function L(e,t){return e.indexOf(t)>-1}function N(e){return e.trim().split(/\s+/g)}function k(e,t,i){if(e.indexOf&&!i)return e.indexOf(t);for(var r=0;r<e.length;){if(i&&e[r][i]==t||!i&&e[r]===t)return r;r++}return-1}function P(e){return Array.prototype.slice.call(e,0)}function E(e,t,i){for(var r=[],n=[],o=0;o<e.length;){var a=t?e[o][t]:e[o];k(n,a)<0&&r.push(e[o]),n[o]=a,o++}return i&&(r=t?r.sort(function(e,i){return e[t]>i[t]}):r.sort()),r}function D(e,t){for(var i,r,n=t[0].toUpperCase()+t.slice(1),o=0;o<u.length;){if((r=(i=u[o])?i+n:t)in e)return r;o++}return s}var O=1;function R(e){var t=e.ownerDocument||e;return t.defaultView||t.parentWindow||n}var F="ontouchstart"in n,I=D(n,"PointerEvent")!==s,B=F&&/mobile|tablet|ip(ad|hone|od)|android/i.test(navigator.userAgent),U=25,V=1,z=2,G=4,j=8,W=1,H=2,q=4,Y=8,X=16,K=H|q,Q=Y|X,Z=K|Q,J=["x","y"],$=["clientX","clientY"];function ee(e,t){var i=this;this.manager=e,this.callback=t,this.element=e.element,this.target=e.options.inputTarget,this.domHandler=function(t){S(e.options.enable,[e])&&i.handler(t)},this.init()}function te(e,t,i){var r=i.pointers.length,n=i.changedPointers.length,o=t&V&&r-n==0,a=t&(G|j)&&r-n==0;i.isFirst=!!o,i.isFinal=!!a,o&&(e.session={}),i.eventType=t,function(e,t){var i=e.session,r=t.pointers,n=r.length;i.firstInput||(i.firstInput=ie(t));n>1&&!i.firstMultiple?i.firstMultiple=ie(t):1===n&&(i.firstMultiple=!1);var o=i.firstInput,a=i.firstMultiple,l=a?a.center:o.center,u=t.center=re(r);t.timeStamp=f(),t.deltaTime=t.timeStamp-o.timeStamp,t.angle=se(l,u),t.distance=ae(l,u),function(e,t){var i=t.center,r=e.offsetDelta||{},n=e.prevDelta||{},o=e.prevInput||{};t.eventType!==V&&o.eventType!==G||(n=e.prevDelta={x:o.deltaX||0,y:o.deltaY||0},r=e.offsetDelta={x:i.x,y:i.y});t.deltaX=n.x+(i.x-r.x),t.deltaY=n.y+(i.y-r.y)}(i,t),t.offsetDirection=oe(t.deltaX,t.deltaY);var h=ne(t.deltaTime,t.deltaX,t.deltaY);t.overallVelocityX=h.x,t.overallVelocityY=h.y,t.overallVelocity=p(h.x)>p(h.y)?h.x:h.y,t.scale=a?(c=a.pointers,d=r,ae(d[0],d[1],$)/ae(c[0],c[1],$)):1,t.rotation=a?function(e,t){return se(t[1],t[0],$)+se(e[1],e[0],$)}(a.pointers,r):0,t.maxPointers=i.prevInput?t.pointers.length>i.prevInput.maxPointers?t.pointers.length:i.prevInput.maxPointers:t.pointers.length,function(e,t){var i,r,n,o,a=e.lastInterval||t,l=t.timeStamp-a.timeStamp;if(t.eventType!=j&&(l>U||a.velocity===s)){var u=t.deltaX-a.deltaX,h=t.deltaY-a.deltaY,c=ne(l,u,h);r=c.x,n=c.y,i=p(c.x)>p(c.y)?c.x:c.y,o=oe(u,h),e.lastInterval=t}else i=a.velocity,r=a.velocityX,n=a.velocityY,o=a.direction;t.velocity=i,t.velocityX=r,t.velocityY=n,t.direction=o}(i,t);var c,d;var m=e.element;C(t.srcEvent.target,m)&&(m=t.srcEvent.target);t.target=m}(e,i),e.emit("hammer.input",i),e.recognize(i),e.session.prevInput=i}function ie(e){for(var t=[],i=0;i<e.pointers.length;)t[i]={clientX:d(e.pointers[i].clientX),clientY:d(e.pointers[i].clientY)},i++;return{timeStamp:f(),pointers:t,center:re(t),deltaX:e.deltaX,deltaY:e.deltaY}}function re(e){var t=e.length;if(1===t)return{x:d(e[0].clientX),y:d(e[0].clientY)};for(var i=0,r=0,n=0;n<t;)i+=e[n].clientX,r+=e[n].clientY,n++;return{x:d(i/t),y:d(r/t)}}function ne(e,t,i){return{x:t/e||0,y:i/e||0}}function oe(e,t){return e===t?W:p(e)>=p(t)?e<0?H:q:t<0?Y:X}function ae(e,t,i){i||(i=J);var r=t[i[0]]-e[i[0]],n=t[i[1]]-e[i[1]];return Math.sqrt(r*r+n*n)}function se(e,t,i){i||(i=J);var r=t[i[0]]-e[i[0]],n=t[i[1]]-e[i[1]];return 180*Math.atan2(n,r)/Math.PI}ee.prototype={handler:function(){},init:function(){this.evEl&&T(this.element,this.evEl,this.domHandler),this.evTarget&&T(this.target,this.evTarget,this.domHandler),this.evWin&&T(R(this.element),this.evWin,this.domHandler)},destroy:function(){this.evEl&&A(this.element,this.evEl,this.domHandler),this.evTarget&&A(this.target,this.evTarget,this.domHandler),this.evWin&&A(R(this.element),this.evWin,this.domHandler)}};var le={mousedown:V,mousemove:z,mouseup:G},ue="mousedown",he="mousemove mouseup";function ce(){this.evEl=ue,this.evWin=he,this.pressed=!1,ee.apply(this,arguments)}x(ce,ee,{handler:function(e){var t=le[e.type];t&V&&0===e.button&&(this.pressed=!0),t&z&&1!==e.which&&(t=G),this.pressed&&(t&G&&(this.pressed=!1),this.callback(this.manager,t,{pointers:[e],changedPointers:[e],pointerType:"mouse",srcEvent:e}))}});var de={pointerdown:V,pointermove:z,pointerup:G,pointercancel:j,pointerout:j},pe={2:"touch",3:"pen",4:"mouse",5:"kinect"},fe="pointerdown",me="pointermove pointerup pointercancel";function ve(){this.evEl=fe,this.evWin=me,ee.apply(this,arguments),this.store=this.manager.session.pointerEvents=[]}n.MSPointerEvent&&!n.PointerEvent&&(fe="MSPointerDown",me="MSPointerMove MSPointerUp MSPointerCancel"),x(ve,ee,{handler:function(e){var t=this.store,i=!1,r=e.type.toLowerCase().replace("ms",""),n=de[r],o=pe[e.pointerType]||e.pointerType,a="touch"==o,s=k(t,e.pointerId,"pointerId");n&V&&(0===e.button||a)?s<0&&(t.push(e),s=t.length-1):n&(G|j)&&(i=!0),s<0||(t[s]=e,this.callback(this.manager,n,{pointers:t,changedPointers:[e],pointerType:o,srcEvent:e}),i&&t.splice(s,1))}});var ge={touchstart:V,touchmove:z,touchend:G,touchcancel:j},ye="touchstart",_e="touchstart touchmove touchend touchcancel";function be(){this.evTarget=ye,this.evWin=_e,this.started=!1,ee.apply(this,arguments)}x(be,ee,{handler:function(e){var t=ge[e.type];if(t===V&&(this.started=!0),this.started){var i=function(e,t){var i=P(e.touches),r=P(e.changedTouches);t&(G|j)&&(i=E(i.concat(r),"identifier",!0));return[i,r]}.call(this,e,t);t&(G|j)&&i[0].length-i[1].length==0&&(this.started=!1),this.callback(this.manager,t,{pointers:i[0],changedPointers:i[1],pointerType:"touch",srcEvent:e})}}});var xe={touchstart:V,touchmove:z,touchend:G,touchcancel:j},we="touchstart touchmove touchend touchcancel";function Se(){this.evTarget=we,this.targetIds={},ee.apply(this,arguments)}x(Se,ee,{handler:function(e){var t=xe[e.type],i=function(e,t){var i=P(e.touches),r=this.targetIds;if(t&(V|z)&&1===i.length)return r[i[0].identifier]=!0,[i,i];var n,o,a=P(e.changedTouches),s=[],l=this.target;if(o=i.filter(function(e){return C(e.target,l)}),t===V)for(n=0;n<o.length;)r[o[n].identifier]=!0,n++;n=0;for(;n<a.length;)r[a[n].identifier]&&s.push(a[n]),t&(G|j)&&delete r[a[n].identifier],n++;if(!s.length)return;return[E(o.concat(s),"identifier",!0),s]}.call(this,e,t);i&&this.callback(this.manager,t,{pointers:i[0],changedPointers:i[1],pointerType:"touch",srcEvent:e})}});var Me=2500,Te=25;function Ae(){ee.apply(this,arguments);var e=w(this.handler,this);this.touch=new Se(this.manager,e),this.mouse=new ce(this.manager,e),this.primaryTouch=null,this.lastTouches=[]}function Ce(e){var t=e.changedPointers[0];if(t.identifier===this.primaryTouch){var i={x:t.clientX,y:t.clientY};this.lastTouches.push(i);var r=this.lastTouches;setTimeout(function(){var e=r.indexOf(i);e>-1&&r.splice(e,1)},Me)}}x(Ae,ee,{handler:function(e,t,i){var r="touch"==i.pointerType,n="mouse"==i.pointerType;if(!(n&&i.sourceCapabilities&&i.sourceCapabilities.firesTouchEvents)){if(r)(function(e,t){e&V?(this.primaryTouch=t.changedPointers[0].identifier,Ce.call(this,t)):e&(G|j)&&Ce.call(this,t)}).call(this,t,i);else if(n&&function(e){for(var t=e.srcEvent.clientX,i=e.srcEvent.clientY,r=0;r<this.lastTouches.length;r++){var n=this.lastTouches[r],o=Math.abs(t-n.x),a=Math.abs(i-n.y);if(o<=Te&&a<=Te)return!0}return!1}.call(this,i))return;this.callback(e,t,i)}},destroy:function(){this.touch.destroy(),this.mouse.destroy()}});var Le=D(h.style,"touchAction"),Ne=Le!==s,ke="auto",Pe="manipulation",Ee="none",De="pan-x",Oe="pan-y",Re=function(){if(!Ne)return!1;var e={},t=n.CSS&&n.CSS.supports;return["auto","manipulation","pan-y","pan-x","pan-x pan-y","none"].forEach(function(i){e[i]=!t||n.CSS.supports("touch-action",i)}),e}();function Fe(e,t){this.manager=e,this.set(t)}Fe.prototype={set:function(e){"compute"==e&&(e=this.compute()),Ne&&this.manager.element.style&&Re[e]&&(this.manager.element.style[Le]=e),this.actions=e.toLowerCase().trim()},update:function(){this.set(this.manager.options.touchAction)},compute:function(){var e=[];return g(this.manager.recognizers,function(t){S(t.options.enable,[t])&&(e=e.concat(t.getTouchAction()))}),function(e){if(L(e,Ee))return Ee;var t=L(e,De),i=L(e,Oe);if(t&&i)return Ee;if(t||i)return t?De:Oe;if(L(e,Pe))return Pe;return ke}(e.join(" "))},preventDefaults:function(e){var t=e.srcEvent,i=e.offsetDirection;if(this.manager.session.prevented)t.preventDefault();else{var r=this.actions,n=L(r,Ee)&&!Re[Ee],o=L(r,Oe)&&!Re[Oe],a=L(r,De)&&!Re[De];if(n){var s=1===e.pointers.length,l=e.distance<2,u=e.deltaTime<250;if(s&&l&&u)return}if(!a||!o)return n||o&&i&K||a&&i&Q?this.preventSrc(t):void 0}},preventSrc:function(e){this.manager.session.prevented=!0,e.preventDefault()}};var Ie=1,Be=2,Ue=4,Ve=8,ze=Ve,Ge=16;function je(e){this.options=l({},this.defaults,e||{}),this.id=O++,this.manager=null,this.options.enable=M(this.options.enable,!0),this.state=Ie,this.simultaneous={},this.requireFail=[]}function We(e){return e&Ge?"cancel":e&Ve?"end":e&Ue?"move":e&Be?"start":""}function He(e){return e==X?"down":e==Y?"up":e==H?"left":e==q?"right":""}function qe(e,t){var i=t.manager;return i?i.get(e):e}function Ye(){je.apply(this,arguments)}function Xe(){Ye.apply(this,arguments),this.pX=null,this.pY=null}function Ke(){Ye.apply(this,arguments)}function Qe(){je.apply(this,arguments),this._timer=null,this._input=null}function Ze(){Ye.apply(this,arguments)}function Je(){Ye.apply(this,arguments)}function $e(){je.apply(this,arguments),this.pTime=!1,this.pCenter=!1,this._timer=null,this._input=null,this.count=0}function et(e,t){return(t=t||{}).recognizers=M(t.recognizers,et.defaults.preset),new tt(e,t)}je.prototype={defaults:{},set:function(e){return l(this.options,e),this.manager&&this.manager.touchAction.update(),this},recognizeWith:function(e){if(v(e,"recognizeWith",this))return this;var t=this.simultaneous;return t[(e=qe(e,this)).id]||(t[e.id]=e,e.recognizeWith(this)),this},dropRecognizeWith:function(e){return v(e,"dropRecognizeWith",this)?this:(e=qe(e,this),delete this.simultaneous[e.id],this)},requireFailure:function(e){if(v(e,"requireFailure",this))return this;var t=this.requireFail;return-1===k(t,e=qe(e,this))&&(t.push(e),e.requireFailure(this)),this},dropRequireFailure:function(e){if(v(e,"dropRequireFailure",this))return this;e=qe(e,this);var t=k(this.requireFail,e);return t>-1&&this.requireFail.splice(t,1),this},hasRequireFailures:function(){return this.requireFail.length>0},canRecognizeWith:function(e){return!!this.simultaneous[e.id]},emit:function(e){var t=this,i=this.state;function r(i){t.manager.emit(i,e)}i<Ve&&r(t.options.event+We(i)),r(t.options.event),e.additionalEvent&&r(e.additionalEvent),i>=Ve&&r(t.options.event+We(i))},tryEmit:function(e){if(this.canEmit())return this.emit(e);this.state=32},canEmit:function(){for(var e=0;e<this.requireFail.length;){if(!(this.requireFail[e].state&(32|Ie)))return!1;e++}return!0},recognize:function(e){var t=l({},e);if(!S(this.options.enable,[this,t]))return this.reset(),void(this.state=32);this.state&(ze|Ge|32)&&(this.state=Ie),this.state=this.process(t),this.state&(Be|Ue|Ve|Ge)&&this.tryEmit(t)},process:function(e){},getTouchAction:function(){},reset:function(){}},x(Ye,je,{defaults:{pointers:1},attrTest:function(e){var t=this.options.pointers;return 0===t||e.pointers.length===t},process:function(e){var t=this.state,i=e.eventType,r=t&(Be|Ue),n=this.attrTest(e);return r&&(i&j||!n)?t|Ge:r||n?i&G?t|Ve:t&Be?t|Ue:Be:32}}),x(Xe,Ye,{defaults:{event:"pan",threshold:10,pointers:1,direction:Z},getTouchAction:function(){var e=this.options.direction,t=[];return e&K&&t.push(Oe),e&Q&&t.push(De),t},directionTest:function(e){var t=this.options,i=!0,r=e.distance,n=e.direction,o=e.deltaX,a=e.deltaY;return n&t.direction||(t.direction&K?(n=0===o?W:o<0?H:q,i=o!=this.pX,r=Math.abs(e.deltaX)):(n=0===a?W:a<0?Y:X,i=a!=this.pY,r=Math.abs(e.deltaY))),e.direction=n,i&&r>t.threshold&&n&t.direction},attrTest:function(e){return Ye.prototype.attrTest.call(this,e)&&(this.state&Be||!(this.state&Be)&&this.directionTest(e))},emit:function(e){this.pX=e.deltaX,this.pY=e.deltaY;var t=He(e.direction);t&&(e.additionalEvent=this.options.event+t),this._super.emit.call(this,e)}}),x(Ke,Ye,{defaults:{event:"pinch",threshold:0,pointers:2},getTouchAction:function(){return[Ee]},attrTest:function(e){return this._super.attrTest.call(this,e)&&(Math.abs(e.scale-1)>this.options.threshold||this.state&Be)},emit:function(e){if(1!==e.scale){var t=e.scale<1?"in":"out";e.additionalEvent=this.options.event+t}this._super.emit.call(this,e)}}),x(Qe,je,{defaults:{event:"press",pointers:1,time:251,threshold:9},getTouchAction:function(){return[ke]},process:function(e){var t=this.options,i=e.pointers.length===t.pointers,r=e.distance<t.threshold,n=e.deltaTime>t.time;if(this._input=e,!r||!i||e.eventType&(G|j)&&!n)this.reset();else if(e.eventType&V)this.reset(),this._timer=m(function(){this.state=ze,this.tryEmit()},t.time,this);else if(e.eventType&G)return ze;return 32},reset:function(){clearTimeout(this._timer)},emit:function(e){this.state===ze&&(e&&e.eventType&G?this.manager.emit(this.options.event+"up",e):(this._input.timeStamp=f(),this.manager.emit(this.options.event,this._input)))}}),x(Ze,Ye,{defaults:{event:"rotate",threshold:0,pointers:2},getTouchAction:function(){return[Ee]},attrTest:function(e){return this._super.attrTest.call(this,e)&&(Math.abs(e.rotation)>this.options.threshold||this.state&Be)}}),x(Je,Ye,{defaults:{event:"swipe",threshold:10,velocity:.3,direction:K|Q,pointers:1},getTouchAction:function(){return Xe.prototype.getTouchAction.call(this)},attrTest:function(e){var t,i=this.options.direction;return i&(K|Q)?t=e.overallVelocity:i&K?t=e.overallVelocityX:i&Q&&(t=e.overallVelocityY),this._super.attrTest.call(this,e)&&i&e.offsetDirection&&e.distance>this.options.threshold&&e.maxPointers==this.options.pointers&&p(t)>this.options.velocity&&e.eventType&G},emit:function(e){var t=He(e.offsetDirection);t&&this.manager.emit(this.options.event+t,e),this.manager.emit(this.options.event,e)}}),x($e,je,{defaults:{event:"tap",pointers:1,taps:1,interval:300,time:250,threshold:9,posThreshold:10},getTouchAction:function(){return[Pe]},process:function(e){var t=this.options,i=e.pointers.length===t.pointers,r=e.distance<t.threshold,n=e.deltaTime<t.time;if(this.reset(),e.eventType&V&&0===this.count)return this.failTimeout();if(r&&n&&i){if(e.eventType!=G)return this.failTimeout();var o=!this.pTime||e.timeStamp-this.pTime<t.interval,a=!this.pCenter||ae(this.pCenter,e.center)<t.posThreshold;if(this.pTime=e.timeStamp,this.pCenter=e.center,a&&o?this.count+=1:this.count=1,this._input=e,0===this.count%t.taps)return this.hasRequireFailures()?(this._timer=m(function(){this.state=ze,this.tryEmit()},t.interval,this),Be):ze}return 32},failTimeout:function(){return this._timer=m(function(){this.state=32},this.options.interval,this),32},reset:function(){clearTimeout(this._timer)},emit:function(){this.state==ze&&(this._input.tapCount=this.count,this.manager.emit(this.options.event,this._input))}}),et.VERSION="2.0.7",et.defaults={domEvents:!1,touchAction:"compute",enable:!0,inputTarget:null,inputClass:null,preset:[[Ze,{enable:!1}],[Ke,{enable:!1},["rotate"]],[Je,{direction:K}],[Xe,{direction:K},["swipe"]],[$e],[$e,{event:"doubletap",taps:2},["tap"]],[Qe]],cssProps:{userSelect:"none",touchSelect:"none",touchCallout:"none",contentZooming:"none",userDrag:"none",tapHighlightColor:"rgba(0,0,0,0)"}};function tt(e,t){var i;this.options=l({},et.defaults,t||{}),this.options.inputTarget=this.options.inputTarget||e,this.handlers={},this.session={},this.recognizers=[],this.oldCssProps={},this.element=e,this.input=new((i=this).options.inputClass||(I?ve:B?Se:F?Ae:ce))(i,te),this.touchAction=new Fe(this,this.options.touchAction),it(this,!0),g(this.options.recognizers,function(e){var t=this.add(new e[0](e[1]));e[2]&&t.recognizeWith(e[2]),e[3]&&t.requireFailure(e[3])},this)}function it(e,t){var i,r=e.element;r.style&&(g(e.options.cssProps,function(n,o){i=D(r.style,o),t?(e.oldCssProps[i]=r.style[i],r.style[i]=n):r.style[i]=e.oldCssProps[i]||""}),t||(e.oldCssProps={}))}tt.prototype={set:function(e){return l(this.options,e),e.touchAction&&this.touchAction.update(),e.inputTarget&&(this.input.destroy(),this.input.target=e.inputTarget,this.input.init()),this},stop:function(e){this.session.stopped=e?2:1},recognize:function(e){var t=this.session;if(!t.stopped){var i;this.touchAction.preventDefaults(e);var r=this.recognizers,n=t.curRecognizer;(!n||n&&n.state&ze)&&(n=t.curRecognizer=null);for(var o=0;o<r.length;)i=r[o],2===t.stopped||n&&i!=n&&!i.canRecognizeWith(n)?i.reset():i.recognize(e),!n&&i.state&(Be|Ue|Ve)&&(n=t.curRecognizer=i),o++}},get:function(e){if(e instanceof je)return e;for(var t=this.recognizers,i=0;i<t.length;i++)if(t[i].options.event==e)return t[i];return null},add:function(e){if(v(e,"add",this))return this;var t=this.get(e.options.event);return t&&this.remove(t),this.recognizers.push(e),e.manager=this,this.touchAction.update(),e},remove:function(e){if(v(e,"remove",this))return this;if(e=this.get(e)){var t=this.recognizers,i=k(t,e);-1!==i&&(t.splice(i,1),this.touchAction.update())}return this},on:function(e,t){if(e!==s&&t!==s){var i=this.handlers;return g(N(e),function(e){i[e]=i[e]||[],i[e].push(t)}),this}},off:function(e,t){if(e!==s){var i=this.handlers;return g(N(e),function(e){t?i[e]&&i[e].splice(k(i[e],t),1):delete i[e]}),this}},emit:function(e,t){this.options.domEvents&&function(e,t){var i=o.createEvent("Event");i.initEvent(e,!0,!0),i.gesture=t,t.target.dispatchEvent(i)}(e,t);var i=this.handlers[e]&&this.handlers[e].slice();if(i&&i.length){t.type=e,t.preventDefault=function(){t.srcEvent.preventDefault()};for(var r=0;r<i.length;)i[r](t),r++}},destroy:function(){this.element&&it(this,!1),this.handlers={},this.session={},this.input.destroy(),this.element=null}},l(et,{INPUT_START:V,INPUT_MOVE:z,INPUT_END:G,INPUT_CANCEL:j,STATE_POSSIBLE:Ie,STATE_BEGAN:Be,STATE_CHANGED:Ue,STATE_ENDED:Ve,STATE_RECOGNIZED:ze,STATE_CANCELLED:Ge,STATE_FAILED:32,DIRECTION_NONE:W,DIRECTION_LEFT:H,DIRECTION_RIGHT:q,DIRECTION_UP:Y,DIRECTION_DOWN:X,DIRECTION_HORIZONTAL:K,DIRECTION_VERTICAL:Q,DIRECTION_ALL:Z,Manager:tt,Input:ee,TouchAction:Fe,TouchInput:Se,MouseInput:ce,PointerEventInput:ve,TouchMouseInput:Ae,SingleTouchInput:be,Recognizer:je,AttrRecognizer:Ye,Tap:$e,Pan:Xe,Swipe:Je,Pinch:Ke,Rotate:Ze,Press:Qe,on:T,off:A,each:g,merge:b,extend:_,assign:l,inherit:x,bindFn:w,prefixed:D}),(void 0!==n?n:"undefined"!=typeof self?self:{}).Hammer=et,(r=function(){return et}.call(t,i,t,e))===s||(e.exports=r)}(window,document)},function(e,t,i){t.util=i(2),t.DOMutil=i(14),t.DataSet=i(11),t.DataView=i(12),t.Queue=i(43),t.Timeline=i(178),t.Graph2d=i(180),t.timeline={Core:i(65),DateUtil:i(36),Range:i(64),stack:i(100),TimeStep:i(66),components:{items:{Item:i(38),BackgroundItem:i(103),BoxItem:i(101),PointItem:i(102),RangeItem:i(70)},BackgroundGroup:i(69),Component:i(16),CurrentTime:i(67),CustomTime:i(46),DataAxis:i(107),DataScale:i(108),GraphGroup:i(109),Group:i(68),ItemSet:i(99),Legend:i(112),LineGraph:i(106),TimeAxis:i(45)}},t.moment=i(9),t.Hammer=i(10),t.keycharm=i(35)},function(e,t,i){var r=i(9),n=i(2),o=i(11),a=i(12),s=i(64),l=i(65),u=i(45),h=i(67),c=i(46),d=i(99),p=i(15).printStyle,f=i(105).allOptions,m=i(105).configureOptions,v=i(71).default,g=i(15).default;function y(e,t,i,l){if(!(this instanceof y))throw new SyntaxError("Constructor must be called with the new operator");if(!(Array.isArray(i)||i instanceof o||i instanceof a)&&i instanceof Object){var c=l;l=i,i=c}l&&l.throttleRedraw&&console.warn('Timeline option "throttleRedraw" is DEPRICATED and no longer supported. It will be removed in the next MAJOR release.');var p=this;if(this.defaultOptions={start:null,end:null,autoResize:!0,orientation:{axis:"bottom",item:"bottom"},moment:r,width:null,height:null,maxHeight:null,minHeight:null},this.options=n.deepExtend({},this.defaultOptions),this._create(e),!l||l&&void 0===l.rtl){this.dom.root.style.visibility="hidden";for(var f,m=this.dom.root;!f&&m;)f=window.getComputedStyle(m,null).direction,m=m.parentElement;this.options.rtl=f&&"rtl"==f.toLowerCase()}else this.options.rtl=l.rtl;this.options.rollingMode=l&&l.rollingMode,this.options.onInitialDrawComplete=l&&l.onInitialDrawComplete,this.components=[],this.body={dom:this.dom,domProps:this.props,emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this)},hiddenDates:[],util:{getScale:function(){return p.timeAxis.step.scale},getStep:function(){return p.timeAxis.step.step},toScreen:p._toScreen.bind(p),toGlobalScreen:p._toGlobalScreen.bind(p),toTime:p._toTime.bind(p),toGlobalTime:p._toGlobalTime.bind(p)}},this.range=new s(this.body,this.options),this.components.push(this.range),this.body.range=this.range,this.timeAxis=new u(this.body,this.options),this.timeAxis2=null,this.components.push(this.timeAxis),this.currentTime=new h(this.body,this.options),this.components.push(this.currentTime),this.itemSet=new d(this.body,this.options),this.components.push(this.itemSet),this.itemsData=null,this.groupsData=null,this.dom.root.onclick=function(e){p.emit("click",p.getEventProperties(e))},this.dom.root.ondblclick=function(e){p.emit("doubleClick",p.getEventProperties(e))},this.dom.root.oncontextmenu=function(e){p.emit("contextmenu",p.getEventProperties(e))},this.dom.root.onmouseover=function(e){p.emit("mouseOver",p.getEventProperties(e))},window.PointerEvent?(this.dom.root.onpointerdown=function(e){p.emit("mouseDown",p.getEventProperties(e))},this.dom.root.onpointermove=function(e){p.emit("mouseMove",p.getEventProperties(e))},this.dom.root.onpointerup=function(e){p.emit("mouseUp",p.getEventProperties(e))}):(this.dom.root.onmousemove=function(e){p.emit("mouseMove",p.getEventProperties(e))},this.dom.root.onmousedown=function(e){p.emit("mouseDown",p.getEventProperties(e))},this.dom.root.onmouseup=function(e){p.emit("mouseUp",p.getEventProperties(e))}),this.initialFitDone=!1,this.on("changed",function(){if(null!=this.itemsData&&!this.options.rollingMode){if(!p.initialFitDone)if(p.initialFitDone=!0,null!=p.options.start||null!=p.options.end){if(null==p.options.start||null==p.options.end)var e=p.getItemRange();var t=null!=p.options.start?p.options.start:e.min,i=null!=p.options.end?p.options.end:e.max;p.setWindow(t,i,{animation:!1})}else p.fit({animation:!1});!p.initialDrawDone&&p.initialRangeChangeDone&&(p.initialDrawDone=!0,p.dom.root.style.visibility="visible",p.options.onInitialDrawComplete&&setTimeout(function(){return p.options.onInitialDrawComplete()},0))}}),l&&this.setOptions(l),i&&this.setGroups(i),t&&this.setItems(t),this._redraw()}function _(e){return n.convert(e.data.start,"Date").valueOf()}function b(e){var t=null!=e.data.end?e.data.end:e.data.start;return n.convert(t,"Date").valueOf()}function x(e,t){var i=e.props.leftContainer.height,r=e.props.left.height,n=t.parent,o=n.top,a=!0,s=e.timeAxis.options.orientation.axis,l=function(){return"bottom"==s?n.height-t.top-t.height:t.top},u=-1*e._getScrollTop(),h=o+l(),c=t.height;return h<u?o+i<=o+l()+c&&(o+=l()-e.itemSet.options.margin.item.vertical):h+c>u+i?o+=l()+c-i+e.itemSet.options.margin.item.vertical:a=!1,{shouldScroll:a,scrollOffset:o=Math.min(o,r-i),itemTop:h}}y.prototype=new l,y.prototype._createConfigurator=function(){return new v(this,this.dom.container,m)},y.prototype.redraw=function(){this.itemSet&&this.itemSet.markDirty({refreshItems:!0}),this._redraw()},y.prototype.setOptions=function(e){if(!0===g.validate(e,f)&&console.log("%cErrors have been found in the supplied options object.",p),l.prototype.setOptions.call(this,e),"type"in e&&e.type!==this.options.type){this.options.type=e.type;var t=this.itemsData;if(t){var i=this.getSelection();this.setItems(null),this.setItems(t),this.setSelection(i)}}},y.prototype.setItems=function(e){var t;t=e?e instanceof o||e instanceof a?e:new o(e,{type:{start:"Date",end:"Date"}}):null,this.itemsData=t,this.itemSet&&this.itemSet.setItems(t)},y.prototype.setGroups=function(e){var t;if(e){var i=function(e){return!1!==e.visible};t=e instanceof o||e instanceof a?new a(e,{filter:i}):new o(e.filter(i))}else t=null;this.groupsData=t,this.itemSet.setGroups(t)},y.prototype.setData=function(e){e&&e.groups&&this.setGroups(e.groups),e&&e.items&&this.setItems(e.items)},y.prototype.setSelection=function(e,t){this.itemSet&&this.itemSet.setSelection(e),t&&t.focus&&this.focus(e,t)},y.prototype.getSelection=function(){return this.itemSet&&this.itemSet.getSelection()||[]},y.prototype.focus=function(e,t){if(this.itemsData&&null!=e){var i=Array.isArray(e)?e:[e],r=this.itemsData.getDataSet().get(i,{type:{start:"Date",end:"Date"}}),n=null,o=null;if(r.forEach(function(e){var t=e.start.valueOf(),i="end"in e?e.end.valueOf():e.start.valueOf();(null===n||t<n)&&(n=t),(null===o||i>o)&&(o=i)}),null!==n&&null!==o){var a=this,s=this.itemSet.items[i[0]],l=-1*this._getScrollTop(),u=null,h=function(){var e=x(a,s);e.shouldScroll&&e.itemTop!=u.itemTop&&(a._setScrollTop(-e.scrollOffset),a._redraw())},c=(n+o)/2,d=Math.max(this.range.end-this.range.start,1.1*(o-n)),p=!t||void 0===t.animation||t.animation;p||(u={shouldScroll:!1,scrollOffset:-1,itemTop:-1}),this.range.setRange(c-d/2,c+d/2,{animation:p},function(){h(),setTimeout(h,100)},function(e,t,i){var r=x(a,s);if(u||(u=r),u.itemTop!=r.itemTop||u.shouldScroll){u.itemTop!=r.itemTop&&r.shouldScroll&&(u=r,l=-1*a._getScrollTop());var n=l,o=u.scrollOffset,h=i?o:n+(o-n)*e;a._setScrollTop(-h),t||a._redraw()}})}}},y.prototype.fit=function(e,t){var i,r=!e||void 0===e.animation||e.animation,n=this.itemsData&&this.itemsData.getDataSet();1===n.length&&void 0===n.get()[0].end?(i=this.getDataRange(),this.moveTo(i.min.valueOf(),{animation:r},t)):(i=this.getItemRange(),this.range.setRange(i.min,i.max,{animation:r},t))},y.prototype.getItemRange=function(){var e=this.getDataRange(),t=null!==e.min?e.min.valueOf():null,i=null!==e.max?e.max.valueOf():null,r=null,o=null;if(null!=t&&null!=i){var a=i-t;a<=0&&(a=10);var s=a/this.props.center.width,l={},u=0;if(n.forEach(this.itemSet.items,function(e,t){if(e.groupShowing){l[t]=e.redraw(!0),u=l[t].length}}),u>0)for(var h=0;h<u;h++)n.forEach(l,function(e){e[h]()});if(n.forEach(this.itemSet.items,function(e){var n,a,l=_(e),u=b(e);this.options.rtl?(n=l-(e.getWidthRight()+10)*s,a=u+(e.getWidthLeft()+10)*s):(n=l-(e.getWidthLeft()+10)*s,a=u+(e.getWidthRight()+10)*s),n<t&&(t=n,r=e),a>i&&(i=a,o=e)}.bind(this)),r&&o){var c=r.getWidthLeft()+10,d=o.getWidthRight()+10,p=this.props.center.width-c-d;p>0&&(this.options.rtl?(t=_(r)-d*a/p,i=b(o)+c*a/p):(t=_(r)-c*a/p,i=b(o)+d*a/p))}}return{min:null!=t?new Date(t):null,max:null!=i?new Date(i):null}},y.prototype.getDataRange=function(){var e=null,t=null,i=this.itemsData&&this.itemsData.getDataSet();return i&&i.forEach(function(i){var r=n.convert(i.start,"Date").valueOf(),o=n.convert(null!=i.end?i.end:i.start,"Date").valueOf();(null===e||r<e)&&(e=r),(null===t||o>t)&&(t=o)}),{min:null!=e?new Date(e):null,max:null!=t?new Date(t):null}},y.prototype.getEventProperties=function(e){var t,i=e.center?e.center.x:e.clientX,r=e.center?e.center.y:e.clientY;t=this.options.rtl?n.getAbsoluteRight(this.dom.centerContainer)-i:i-n.getAbsoluteLeft(this.dom.centerContainer);var o=r-n.getAbsoluteTop(this.dom.centerContainer),a=this.itemSet.itemFromTarget(e),s=this.itemSet.groupFromTarget(e),l=c.customTimeFromTarget(e),u=this.itemSet.options.snap||null,h=this.body.util.getScale(),d=this.body.util.getStep(),p=this._toTime(t),f=u?u(p,h,d):p,m=n.getTarget(e),v=null;return null!=a?v="item":null!=l?v="custom-time":n.hasParent(m,this.timeAxis.dom.foreground)?v="axis":this.timeAxis2&&n.hasParent(m,this.timeAxis2.dom.foreground)?v="axis":n.hasParent(m,this.itemSet.dom.labelSet)?v="group-label":n.hasParent(m,this.currentTime.bar)?v="current-time":n.hasParent(m,this.dom.center)&&(v="background"),{event:e,item:a?a.id:null,group:s?s.groupId:null,what:v,pageX:e.srcEvent?e.srcEvent.pageX:e.pageX,pageY:e.srcEvent?e.srcEvent.pageY:e.pageY,x:t,y:o,time:p,snappedTime:f}},y.prototype.toggleRollingMode=function(){this.range.rolling?this.range.stopRolling():(null==this.options.rollingMode&&this.setOptions(this.options),this.range.startRolling())},e.exports=y},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(19)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=i(10),l=i(37),u=i(2),h=function(){function e(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1;(0,n.default)(this,e),this.pixelRatio=t,this.generated=!1,this.centerCoordinates={x:144.5,y:144.5},this.r=289*.49,this.color={r:255,g:255,b:255,a:1},this.hueCircle=void 0,this.initialColor={r:255,g:255,b:255,a:1},this.previousColor=void 0,this.applied=!1,this.updateCallback=function(){},this.closeCallback=function(){},this._create()}return(0,o.default)(e,[{key:"insertTo",value:function(e){void 0!==this.hammer&&(this.hammer.destroy(),this.hammer=void 0),this.container=e,this.container.appendChild(this.frame),this._bindHammer(),this._setSize()}},{key:"setUpdateCallback",value:function(e){if("function"!=typeof e)throw new Error("Function attempted to set as colorPicker update callback is not a function.");this.updateCallback=e}},{key:"setCloseCallback",value:function(e){if("function"!=typeof e)throw new Error("Function attempted to set as colorPicker closing callback is not a function.");this.closeCallback=e}},{key:"_isColorString",value:function(e){if("string"==typeof e)return{black:"#000000",navy:"#000080",darkblue:"#00008B",mediumblue:"#0000CD",blue:"#0000FF",darkgreen:"#006400",green:"#008000",teal:"#008080",darkcyan:"#008B8B",deepskyblue:"#00BFFF",darkturquoise:"#00CED1",mediumspringgreen:"#00FA9A",lime:"#00FF00",springgreen:"#00FF7F",aqua:"#00FFFF",cyan:"#00FFFF",midnightblue:"#191970",dodgerblue:"#1E90FF",lightseagreen:"#20B2AA",forestgreen:"#228B22",seagreen:"#2E8B57",darkslategray:"#2F4F4F",limegreen:"#32CD32",mediumseagreen:"#3CB371",turquoise:"#40E0D0",royalblue:"#4169E1",steelblue:"#4682B4",darkslateblue:"#483D8B",mediumturquoise:"#48D1CC",indigo:"#4B0082",darkolivegreen:"#556B2F",cadetblue:"#5F9EA0",cornflowerblue:"#6495ED",mediumaquamarine:"#66CDAA",dimgray:"#696969",slateblue:"#6A5ACD",olivedrab:"#6B8E23",slategray:"#708090",lightslategray:"#778899",mediumslateblue:"#7B68EE",lawngreen:"#7CFC00",chartreuse:"#7FFF00",aquamarine:"#7FFFD4",maroon:"#800000",purple:"#800080",olive:"#808000",gray:"#808080",skyblue:"#87CEEB",lightskyblue:"#87CEFA",blueviolet:"#8A2BE2",darkred:"#8B0000",darkmagenta:"#8B008B",saddlebrown:"#8B4513",darkseagreen:"#8FBC8F",lightgreen:"#90EE90",mediumpurple:"#9370D8",darkviolet:"#9400D3",palegreen:"#98FB98",darkorchid:"#9932CC",yellowgreen:"#9ACD32",sienna:"#A0522D",brown:"#A52A2A",darkgray:"#A9A9A9",lightblue:"#ADD8E6",greenyellow:"#ADFF2F",paleturquoise:"#AFEEEE",lightsteelblue:"#B0C4DE",powderblue:"#B0E0E6",firebrick:"#B22222",darkgoldenrod:"#B8860B",mediumorchid:"#BA55D3",rosybrown:"#BC8F8F",darkkhaki:"#BDB76B",silver:"#C0C0C0",mediumvioletred:"#C71585",indianred:"#CD5C5C",peru:"#CD853F",chocolate:"#D2691E",tan:"#D2B48C",lightgrey:"#D3D3D3",palevioletred:"#D87093",thistle:"#D8BFD8",orchid:"#DA70D6",goldenrod:"#DAA520",crimson:"#DC143C",gainsboro:"#DCDCDC",plum:"#DDA0DD",burlywood:"#DEB887",lightcyan:"#E0FFFF",lavender:"#E6E6FA",darksalmon:"#E9967A",violet:"#EE82EE",palegoldenrod:"#EEE8AA",lightcoral:"#F08080",khaki:"#F0E68C",aliceblue:"#F0F8FF",honeydew:"#F0FFF0",azure:"#F0FFFF",sandybrown:"#F4A460",wheat:"#F5DEB3",beige:"#F5F5DC",whitesmoke:"#F5F5F5",mintcream:"#F5FFFA",ghostwhite:"#F8F8FF",salmon:"#FA8072",antiquewhite:"#FAEBD7",linen:"#FAF0E6",lightgoldenrodyellow:"#FAFAD2",oldlace:"#FDF5E6",red:"#FF0000",fuchsia:"#FF00FF",magenta:"#FF00FF",deeppink:"#FF1493",orangered:"#FF4500",tomato:"#FF6347",hotpink:"#FF69B4",coral:"#FF7F50",darkorange:"#FF8C00",lightsalmon:"#FFA07A",orange:"#FFA500",lightpink:"#FFB6C1",pink:"#FFC0CB",gold:"#FFD700",peachpuff:"#FFDAB9",navajowhite:"#FFDEAD",moccasin:"#FFE4B5",bisque:"#FFE4C4",mistyrose:"#FFE4E1",blanchedalmond:"#FFEBCD",papayawhip:"#FFEFD5",lavenderblush:"#FFF0F5",seashell:"#FFF5EE",cornsilk:"#FFF8DC",lemonchiffon:"#FFFACD",floralwhite:"#FFFAF0",snow:"#FFFAFA",yellow:"#FFFF00",lightyellow:"#FFFFE0",ivory:"#FFFFF0",white:"#FFFFFF"}[e]}},{key:"setColor",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if("none"!==e){var i=void 0,n=this._isColorString(e);if(void 0!==n&&(e=n),!0===u.isString(e)){if(!0===u.isValidRGB(e)){var o=e.substr(4).substr(0,e.length-5).split(",");i={r:o[0],g:o[1],b:o[2],a:1}}else if(!0===u.isValidRGBA(e)){var a=e.substr(5).substr(0,e.length-6).split(",");i={r:a[0],g:a[1],b:a[2],a:a[3]}}else if(!0===u.isValidHex(e)){var s=u.hexToRGB(e);i={r:s.r,g:s.g,b:s.b,a:1}}}else if(e instanceof Object&&void 0!==e.r&&void 0!==e.g&&void 0!==e.b){var l=void 0!==e.a?e.a:"1.0";i={r:e.r,g:e.g,b:e.b,a:l}}if(void 0===i)throw new Error("Unknown color passed to the colorPicker. Supported are strings: rgb, hex, rgba. Object: rgb ({r:r,g:g,b:b,[a:a]}). Supplied: "+(0,r.default)(e));this._setColor(i,t)}}},{key:"show",value:function(){void 0!==this.closeCallback&&(this.closeCallback(),this.closeCallback=void 0),this.applied=!1,this.frame.style.display="block",this._generateHueCircle()}},{key:"_hide",value:function(){var e=this;!0===(!(arguments.length>0&&void 0!==arguments[0])||arguments[0])&&(this.previousColor=u.extend({},this.color)),!0===this.applied&&this.updateCallback(this.initialColor),this.frame.style.display="none",setTimeout(function(){void 0!==e.closeCallback&&(e.closeCallback(),e.closeCallback=void 0)},0)}},{key:"_save",value:function(){this.updateCallback(this.color),this.applied=!1,this._hide()}},{key:"_apply",value:function(){this.applied=!0,this.updateCallback(this.color),this._updatePicker(this.color)}},{key:"_loadLast",value:function(){void 0!==this.previousColor?this.setColor(this.previousColor,!1):alert("There is no last color to load...")}},{key:"_setColor",value:function(e){!0===(!(arguments.length>1&&void 0!==arguments[1])||arguments[1])&&(this.initialColor=u.extend({},e)),this.color=e;var t=u.RGBToHSV(e.r,e.g,e.b),i=2*Math.PI,r=this.r*t.s,n=this.centerCoordinates.x+r*Math.sin(i*t.h),o=this.centerCoordinates.y+r*Math.cos(i*t.h);this.colorPickerSelector.style.left=n-.5*this.colorPickerSelector.clientWidth+"px",this.colorPickerSelector.style.top=o-.5*this.colorPickerSelector.clientHeight+"px",this._updatePicker(e)}},{key:"_setOpacity",value:function(e){this.color.a=e/100,this._updatePicker(this.color)}},{key:"_setBrightness",value:function(e){var t=u.RGBToHSV(this.color.r,this.color.g,this.color.b);t.v=e/100;var i=u.HSVToRGB(t.h,t.s,t.v);i.a=this.color.a,this.color=i,this._updatePicker()}},{key:"_updatePicker",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.color,t=u.RGBToHSV(e.r,e.g,e.b),i=this.colorPickerCanvas.getContext("2d");void 0===this.pixelRation&&(this.pixelRatio=(window.devicePixelRatio||1)/(i.webkitBackingStorePixelRatio||i.mozBackingStorePixelRatio||i.msBackingStorePixelRatio||i.oBackingStorePixelRatio||i.backingStorePixelRatio||1)),i.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0);var r=this.colorPickerCanvas.clientWidth,n=this.colorPickerCanvas.clientHeight;i.clearRect(0,0,r,n),i.putImageData(this.hueCircle,0,0),i.fillStyle="rgba(0,0,0,"+(1-t.v)+")",i.circle(this.centerCoordinates.x,this.centerCoordinates.y,this.r),i.fill(),this.brightnessRange.value=100*t.v,this.opacityRange.value=100*e.a,this.initialColorDiv.style.backgroundColor="rgba("+this.initialColor.r+","+this.initialColor.g+","+this.initialColor.b+","+this.initialColor.a+")",this.newColorDiv.style.backgroundColor="rgba("+this.color.r+","+this.color.g+","+this.color.b+","+this.color.a+")"}},{key:"_setSize",value:function(){this.colorPickerCanvas.style.width="100%",this.colorPickerCanvas.style.height="100%",this.colorPickerCanvas.width=289*this.pixelRatio,this.colorPickerCanvas.height=289*this.pixelRatio}},{key:"_create",value:function(){if(this.frame=document.createElement("div"),this.frame.className="vis-color-picker",this.colorPickerDiv=document.createElement("div"),this.colorPickerSelector=document.createElement("div"),this.colorPickerSelector.className="vis-selector",this.colorPickerDiv.appendChild(this.colorPickerSelector),this.colorPickerCanvas=document.createElement("canvas"),this.colorPickerDiv.appendChild(this.colorPickerCanvas),this.colorPickerCanvas.getContext){var e=this.colorPickerCanvas.getContext("2d");this.pixelRatio=(window.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1),this.colorPickerCanvas.getContext("2d").setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0)}else{var t=document.createElement("DIV");t.style.color="red",t.style.fontWeight="bold",t.style.padding="10px",t.innerHTML="Error: your browser does not support HTML canvas",this.colorPickerCanvas.appendChild(t)}this.colorPickerDiv.className="vis-color",this.opacityDiv=document.createElement("div"),this.opacityDiv.className="vis-opacity",this.brightnessDiv=document.createElement("div"),this.brightnessDiv.className="vis-brightness",this.arrowDiv=document.createElement("div"),this.arrowDiv.className="vis-arrow",this.opacityRange=document.createElement("input");try{this.opacityRange.type="range",this.opacityRange.min="0",this.opacityRange.max="100"}catch(e){}this.opacityRange.value="100",this.opacityRange.className="vis-range",this.brightnessRange=document.createElement("input");try{this.brightnessRange.type="range",this.brightnessRange.min="0",this.brightnessRange.max="100"}catch(e){}this.brightnessRange.value="100",this.brightnessRange.className="vis-range",this.opacityDiv.appendChild(this.opacityRange),this.brightnessDiv.appendChild(this.brightnessRange);var i=this;this.opacityRange.onchange=function(){i._setOpacity(this.value)},this.opacityRange.oninput=function(){i._setOpacity(this.value)},this.brightnessRange.onchange=function(){i._setBrightness(this.value)},this.brightnessRange.oninput=function(){i._setBrightness(this.value)},this.brightnessLabel=document.createElement("div"),this.brightnessLabel.className="vis-label vis-brightness",this.brightnessLabel.innerHTML="brightness:",this.opacityLabel=document.createElement("div"),this.opacityLabel.className="vis-label vis-opacity",this.opacityLabel.innerHTML="opacity:",this.newColorDiv=document.createElement("div"),this.newColorDiv.className="vis-new-color",this.newColorDiv.innerHTML="new",this.initialColorDiv=document.createElement("div"),this.initialColorDiv.className="vis-initial-color",this.initialColorDiv.innerHTML="initial",this.cancelButton=document.createElement("div"),this.cancelButton.className="vis-button vis-cancel",this.cancelButton.innerHTML="cancel",this.cancelButton.onclick=this._hide.bind(this,!1),this.applyButton=document.createElement("div"),this.applyButton.className="vis-button vis-apply",this.applyButton.innerHTML="apply",this.applyButton.onclick=this._apply.bind(this),this.saveButton=document.createElement("div"),this.saveButton.className="vis-button vis-save",this.saveButton.innerHTML="save",this.saveButton.onclick=this._save.bind(this),this.loadButton=document.createElement("div"),this.loadButton.className="vis-button vis-load",this.loadButton.innerHTML="load last",this.loadButton.onclick=this._loadLast.bind(this),this.frame.appendChild(this.colorPickerDiv),this.frame.appendChild(this.arrowDiv),this.frame.appendChild(this.brightnessLabel),this.frame.appendChild(this.brightnessDiv),this.frame.appendChild(this.opacityLabel),this.frame.appendChild(this.opacityDiv),this.frame.appendChild(this.newColorDiv),this.frame.appendChild(this.initialColorDiv),this.frame.appendChild(this.cancelButton),this.frame.appendChild(this.applyButton),this.frame.appendChild(this.saveButton),this.frame.appendChild(this.loadButton)}},{key:"_bindHammer",value:function(){var e=this;this.drag={},this.pinch={},this.hammer=new s(this.colorPickerCanvas),this.hammer.get("pinch").set({enable:!0}),l.onTouch(this.hammer,function(t){e._moveSelector(t)}),this.hammer.on("tap",function(t){e._moveSelector(t)}),this.hammer.on("panstart",function(t){e._moveSelector(t)}),this.hammer.on("panmove",function(t){e._moveSelector(t)}),this.hammer.on("panend",function(t){e._moveSelector(t)})}},{key:"_generateHueCircle",value:function(){if(!1===this.generated){var e=this.colorPickerCanvas.getContext("2d");void 0===this.pixelRation&&(this.pixelRatio=(window.devicePixelRatio||1)/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1)),e.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0);var t=this.colorPickerCanvas.clientWidth,i=this.colorPickerCanvas.clientHeight;e.clearRect(0,0,t,i);var r=void 0,n=void 0,o=void 0,a=void 0;this.centerCoordinates={x:.5*t,y:.5*i},this.r=.49*t;var s=2*Math.PI/360,l=1/this.r,h=void 0;for(o=0;o<360;o++)for(a=0;a<this.r;a++)r=this.centerCoordinates.x+a*Math.sin(s*o),n=this.centerCoordinates.y+a*Math.cos(s*o),h=u.HSVToRGB(o*(1/360),a*l,1),e.fillStyle="rgb("+h.r+","+h.g+","+h.b+")",e.fillRect(r-.5,n-.5,2,2);e.strokeStyle="rgba(0,0,0,1)",e.circle(this.centerCoordinates.x,this.centerCoordinates.y,this.r),e.stroke(),this.hueCircle=e.getImageData(0,0,t,i)}this.generated=!0}},{key:"_moveSelector",value:function(e){var t=this.colorPickerDiv.getBoundingClientRect(),i=e.center.x-t.left,r=e.center.y-t.top,n=.5*this.colorPickerDiv.clientHeight,o=.5*this.colorPickerDiv.clientWidth,a=i-o,s=r-n,l=Math.atan2(a,s),h=.98*Math.min(Math.sqrt(a*a+s*s),o),c=Math.cos(l)*h+n,d=Math.sin(l)*h+o;this.colorPickerSelector.style.top=c-.5*this.colorPickerSelector.clientHeight+"px",this.colorPickerSelector.style.left=d-.5*this.colorPickerSelector.clientWidth+"px";var p=l/(2*Math.PI);p=p<0?p+1:p;var f=h/this.r,m=u.RGBToHSV(this.color.r,this.color.g,this.color.b);m.h=p,m.s=f;var v=u.HSVToRGB(m.h,m.s,m.v);v.a=this.color.a,this.color=v,this.initialColorDiv.style.backgroundColor="rgba("+this.initialColor.r+","+this.initialColor.g+","+this.initialColor.b+","+this.initialColor.a+")",this.newColorDiv.style.backgroundColor="rgba("+this.color.r+","+this.color.g+","+this.color.b+","+this.color.a+")"}}]),e}();t.default=h},function(e,t,i){var r=i(9),n=i(2),o=i(11),a=i(12),s=i(64),l=i(65),u=i(45),h=i(67),c=i(46),d=i(106),p=i(15).printStyle,f=i(113).allOptions,m=i(113).configureOptions,v=i(71).default,g=i(15).default;function y(e,t,i,l){if(!(Array.isArray(i)||i instanceof o||i instanceof a)&&i instanceof Object){var c=l;l=i,i=c}l&&l.throttleRedraw&&console.warn('Graph2d option "throttleRedraw" is DEPRICATED and no longer supported. It will be removed in the next MAJOR release.');var p=this;this.defaultOptions={start:null,end:null,autoResize:!0,orientation:{axis:"bottom",item:"bottom"},moment:r,width:null,height:null,maxHeight:null,minHeight:null},this.options=n.deepExtend({},this.defaultOptions),this._create(e),this.components=[],this.body={dom:this.dom,domProps:this.props,emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this)},hiddenDates:[],util:{toScreen:p._toScreen.bind(p),toGlobalScreen:p._toGlobalScreen.bind(p),toTime:p._toTime.bind(p),toGlobalTime:p._toGlobalTime.bind(p)}},this.range=new s(this.body),this.components.push(this.range),this.body.range=this.range,this.timeAxis=new u(this.body),this.components.push(this.timeAxis),this.currentTime=new h(this.body),this.components.push(this.currentTime),this.linegraph=new d(this.body),this.components.push(this.linegraph),this.itemsData=null,this.groupsData=null,this.on("tap",function(e){p.emit("click",p.getEventProperties(e))}),this.on("doubletap",function(e){p.emit("doubleClick",p.getEventProperties(e))}),this.dom.root.oncontextmenu=function(e){p.emit("contextmenu",p.getEventProperties(e))},l&&this.setOptions(l),i&&this.setGroups(i),t&&this.setItems(t),this._redraw()}y.prototype=new l,y.prototype.setOptions=function(e){!0===g.validate(e,f)&&console.log("%cErrors have been found in the supplied options object.",p),l.prototype.setOptions.call(this,e)},y.prototype.setItems=function(e){var t,i=null==this.itemsData;if(t=e?e instanceof o||e instanceof a?e:new o(e,{type:{start:"Date",end:"Date"}}):null,this.itemsData=t,this.linegraph&&this.linegraph.setItems(t),i)if(null!=this.options.start||null!=this.options.end){var r=null!=this.options.start?this.options.start:null,n=null!=this.options.end?this.options.end:null;this.setWindow(r,n,{animation:!1})}else this.fit({animation:!1})},y.prototype.setGroups=function(e){var t;t=e?e instanceof o||e instanceof a?e:new o(e):null,this.groupsData=t,this.linegraph.setGroups(t)},y.prototype.getLegend=function(e,t,i){return void 0===t&&(t=15),void 0===i&&(i=15),void 0!==this.linegraph.groups[e]?this.linegraph.groups[e].getLegend(t,i):"cannot find group:'"+e+"'"},y.prototype.isGroupVisible=function(e){return void 0!==this.linegraph.groups[e]&&(this.linegraph.groups[e].visible&&(void 0===this.linegraph.options.groups.visibility[e]||1==this.linegraph.options.groups.visibility[e]))},y.prototype.getDataRange=function(){var e=null,t=null;for(var i in this.linegraph.groups)if(this.linegraph.groups.hasOwnProperty(i)&&1==this.linegraph.groups[i].visible)for(var r=0;r<this.linegraph.groups[i].itemsData.length;r++){var o=this.linegraph.groups[i].itemsData[r],a=n.convert(o.x,"Date").valueOf();e=null==e?a:e>a?a:e,t=null==t?a:t<a?a:t}return{min:null!=e?new Date(e):null,max:null!=t?new Date(t):null}},y.prototype.getEventProperties=function(e){var t=e.center?e.center.x:e.clientX,i=e.center?e.center.y:e.clientY,r=t-n.getAbsoluteLeft(this.dom.centerContainer),o=i-n.getAbsoluteTop(this.dom.centerContainer),a=this._toTime(r),s=c.customTimeFromTarget(e),l=n.getTarget(e),u=null;n.hasParent(l,this.timeAxis.dom.foreground)?u="axis":this.timeAxis2&&n.hasParent(l,this.timeAxis2.dom.foreground)?u="axis":n.hasParent(l,this.linegraph.yAxisLeft.dom.frame)?u="data-axis":n.hasParent(l,this.linegraph.yAxisRight.dom.frame)?u="data-axis":n.hasParent(l,this.linegraph.legendLeft.dom.frame)?u="legend":n.hasParent(l,this.linegraph.legendRight.dom.frame)?u="legend":null!=s?u="custom-time":n.hasParent(l,this.currentTime.bar)?u="current-time":n.hasParent(l,this.dom.center)&&(u="background");var h=[],d=this.linegraph.yAxisLeft,p=this.linegraph.yAxisRight;return!d.hidden&&this.itemsData.length>0&&h.push(d.screenToValue(o)),!p.hidden&&this.itemsData.length>0&&h.push(p.screenToValue(o)),{event:e,what:u,pageX:e.srcEvent?e.srcEvent.pageX:e.pageX,pageY:e.srcEvent?e.srcEvent.pageY:e.pageY,x:r,y:o,time:a,value:h}},y.prototype._createConfigurator=function(){return new v(this,this.dom.container,m)},e.exports=y},function(e,t,i){t.util=i(2),t.DOMutil=i(14),t.DataSet=i(11),t.DataView=i(12),t.Queue=i(43),t.Network=i(182),t.network={Images:i(116),dotparser:i(114),gephiParser:i(115),allOptions:i(122)},t.network.convertDot=function(e){return t.network.dotparser.DOTToGraph(e)},t.network.convertGephi=function(e,i){return t.network.gephiParser.parseGephi(e,i)},t.moment=i(9),t.Hammer=i(10),t.keycharm=i(35)},function(e,t,i){i(183);var r=i(44),n=i(2),o=i(114),a=i(115),s=i(97),l=i(184),u=i(116).default,h=i(186).default,c=i(187).default,d=i(214).default,p=i(220).default,f=i(227).default,m=i(229).default,v=i(230).default,g=i(231).default,y=i(232).default,_=i(234).default,b=i(235).default,x=i(237).default,w=i(71).default,S=i(15).default,M=i(15).printStyle,T=i(122),A=T.allOptions,C=T.configureOptions,L=i(238).default;function N(e,t,i){var r=this;if(!(this instanceof N))throw new SyntaxError("Constructor must be called with the new operator");this.options={},this.defaultOptions={locale:"en",locales:l,clickToUse:!1},n.extend(this.options,this.defaultOptions),this.body={container:e,nodes:{},nodeIndices:[],edges:{},edgeIndices:[],emitter:{on:this.on.bind(this),off:this.off.bind(this),emit:this.emit.bind(this),once:this.once.bind(this)},eventListeners:{onTap:function(){},onTouch:function(){},onDoubleTap:function(){},onHold:function(){},onDragStart:function(){},onDrag:function(){},onDragEnd:function(){},onMouseWheel:function(){},onPinch:function(){},onMouseMove:function(){},onRelease:function(){},onContext:function(){}},data:{nodes:null,edges:null},functions:{createNode:function(){},createEdge:function(){},getPointer:function(){}},modules:{},view:{scale:1,translation:{x:0,y:0}}},this.bindEventListeners(),this.images=new u(function(){return r.body.emitter.emit("_requestRedraw")}),this.groups=new h,this.canvas=new v(this.body),this.selectionHandler=new _(this.body,this.canvas),this.interactionHandler=new y(this.body,this.canvas,this.selectionHandler),this.view=new g(this.body,this.canvas),this.renderer=new m(this.body,this.canvas),this.physics=new p(this.body),this.layoutEngine=new b(this.body),this.clustering=new f(this.body),this.manipulation=new x(this.body,this.canvas,this.selectionHandler),this.nodesHandler=new c(this.body,this.images,this.groups,this.layoutEngine),this.edgesHandler=new d(this.body,this.images,this.groups),this.body.modules.kamadaKawai=new L(this.body,150,.05),this.body.modules.clustering=this.clustering,this.canvas._create(),this.setOptions(i),this.setData(t)}r(N.prototype),N.prototype.setOptions=function(e){var t=this;if(void 0!==e){!0===S.validate(e,A)&&console.log("%cErrors have been found in the supplied options object.",M);if(n.selectiveDeepExtend(["locale","locales","clickToUse"],this.options,e),e=this.layoutEngine.setOptions(e.layout,e),this.canvas.setOptions(e),this.groups.setOptions(e.groups),this.nodesHandler.setOptions(e.nodes),this.edgesHandler.setOptions(e.edges),this.physics.setOptions(e.physics),this.manipulation.setOptions(e.manipulation,e,this.options),this.interactionHandler.setOptions(e.interaction),this.renderer.setOptions(e.interaction),this.selectionHandler.setOptions(e.interaction),void 0!==e.groups&&this.body.emitter.emit("refreshNodes"),"configure"in e&&(this.configurator||(this.configurator=new w(this,this.body.container,C,this.canvas.pixelRatio)),this.configurator.setOptions(e.configure)),this.configurator&&!0===this.configurator.options.enabled){var i={nodes:{},edges:{},layout:{},interaction:{},manipulation:{},physics:{},global:{}};n.deepExtend(i.nodes,this.nodesHandler.options),n.deepExtend(i.edges,this.edgesHandler.options),n.deepExtend(i.layout,this.layoutEngine.options),n.deepExtend(i.interaction,this.selectionHandler.options),n.deepExtend(i.interaction,this.renderer.options),n.deepExtend(i.interaction,this.interactionHandler.options),n.deepExtend(i.manipulation,this.manipulation.options),n.deepExtend(i.physics,this.physics.options),n.deepExtend(i.global,this.canvas.options),n.deepExtend(i.global,this.options),this.configurator.setModuleOptions(i)}void 0!==e.clickToUse?!0===e.clickToUse?void 0===this.activator&&(this.activator=new s(this.canvas.frame),this.activator.on("change",function(){t.body.emitter.emit("activate")})):(void 0!==this.activator&&(this.activator.destroy(),delete this.activator),this.body.emitter.emit("activate")):this.body.emitter.emit("activate"),this.canvas.setSize(),this.body.emitter.emit("startSimulation")}},N.prototype._updateVisibleIndices=function(){var e=this.body.nodes,t=this.body.edges;for(var i in this.body.nodeIndices=[],this.body.edgeIndices=[],e)e.hasOwnProperty(i)&&(this.clustering._isClusteredNode(i)||!1!==e[i].options.hidden||this.body.nodeIndices.push(e[i].id));for(var r in t)if(t.hasOwnProperty(r)){var n=t[r],o=e[n.fromId],a=e[n.toId],s=void 0!==o&&void 0!==a;!this.clustering._isClusteredEdge(r)&&!1===n.options.hidden&&s&&!1===o.options.hidden&&!1===a.options.hidden&&this.body.edgeIndices.push(n.id)}},N.prototype.bindEventListeners=function(){var e=this;this.body.emitter.on("_dataChanged",function(){e.edgesHandler._updateState(),e.body.emitter.emit("_dataUpdated")}),this.body.emitter.on("_dataUpdated",function(){e.clustering._updateState(),e._updateVisibleIndices(),e._updateValueRange(e.body.nodes),e._updateValueRange(e.body.edges),e.body.emitter.emit("startSimulation"),e.body.emitter.emit("_requestRedraw")})},N.prototype.setData=function(e){if(this.body.emitter.emit("resetPhysics"),this.body.emitter.emit("_resetData"),this.selectionHandler.unselectAll(),e&&e.dot&&(e.nodes||e.edges))throw new SyntaxError('Data must contain either parameter "dot" or  parameter pair "nodes" and "edges", but not both.');if(this.setOptions(e&&e.options),e&&e.dot){console.log("The dot property has been deprecated. Please use the static convertDot method to convert DOT into vis.network format and use the normal data format with nodes and edges. This converter is used like this: var data = vis.network.convertDot(dotString);");var t=o.DOTToGraph(e.dot);this.setData(t)}else if(e&&e.gephi){console.log("The gephi property has been deprecated. Please use the static convertGephi method to convert gephi into vis.network format and use the normal data format with nodes and edges. This converter is used like this: var data = vis.network.convertGephi(gephiJson);");var i=a.parseGephi(e.gephi);this.setData(i)}else this.nodesHandler.setData(e&&e.nodes,!0),this.edgesHandler.setData(e&&e.edges,!0),this.body.emitter.emit("_dataChanged"),this.body.emitter.emit("_dataLoaded"),this.body.emitter.emit("initPhysics")},N.prototype.destroy=function(){for(var e in this.body.emitter.emit("destroy"),this.body.emitter.off(),this.off(),delete this.groups,delete this.canvas,delete this.selectionHandler,delete this.interactionHandler,delete this.view,delete this.renderer,delete this.physics,delete this.layoutEngine,delete this.clustering,delete this.manipulation,delete this.nodesHandler,delete this.edgesHandler,delete this.configurator,delete this.images,this.body.nodes)this.body.nodes.hasOwnProperty(e)&&delete this.body.nodes[e];for(var t in this.body.edges)this.body.edges.hasOwnProperty(t)&&delete this.body.edges[t];n.recursiveDOMDelete(this.body.container)},N.prototype._updateValueRange=function(e){var t,i=void 0,r=void 0,n=0;for(t in e)if(e.hasOwnProperty(t)){var o=e[t].getValue();void 0!==o&&(i=void 0===i?o:Math.min(o,i),r=void 0===r?o:Math.max(o,r),n+=o)}if(void 0!==i&&void 0!==r)for(t in e)e.hasOwnProperty(t)&&e[t].setValueRange(i,r,n)},N.prototype.isActive=function(){return!this.activator||this.activator.active},N.prototype.setSize=function(){return this.canvas.setSize.apply(this.canvas,arguments)},N.prototype.canvasToDOM=function(){return this.canvas.canvasToDOM.apply(this.canvas,arguments)},N.prototype.DOMtoCanvas=function(){return this.canvas.DOMtoCanvas.apply(this.canvas,arguments)},N.prototype.findNode=function(){return this.clustering.findNode.apply(this.clustering,arguments)},N.prototype.isCluster=function(){return this.clustering.isCluster.apply(this.clustering,arguments)},N.prototype.openCluster=function(){return this.clustering.openCluster.apply(this.clustering,arguments)},N.prototype.cluster=function(){return this.clustering.cluster.apply(this.clustering,arguments)},N.prototype.getNodesInCluster=function(){return this.clustering.getNodesInCluster.apply(this.clustering,arguments)},N.prototype.clusterByConnection=function(){return this.clustering.clusterByConnection.apply(this.clustering,arguments)},N.prototype.clusterByHubsize=function(){return this.clustering.clusterByHubsize.apply(this.clustering,arguments)},N.prototype.clusterOutliers=function(){return this.clustering.clusterOutliers.apply(this.clustering,arguments)},N.prototype.getSeed=function(){return this.layoutEngine.getSeed.apply(this.layoutEngine,arguments)},N.prototype.enableEditMode=function(){return this.manipulation.enableEditMode.apply(this.manipulation,arguments)},N.prototype.disableEditMode=function(){return this.manipulation.disableEditMode.apply(this.manipulation,arguments)},N.prototype.addNodeMode=function(){return this.manipulation.addNodeMode.apply(this.manipulation,arguments)},N.prototype.editNode=function(){return this.manipulation.editNode.apply(this.manipulation,arguments)},N.prototype.editNodeMode=function(){return console.log("Deprecated: Please use editNode instead of editNodeMode."),this.manipulation.editNode.apply(this.manipulation,arguments)},N.prototype.addEdgeMode=function(){return this.manipulation.addEdgeMode.apply(this.manipulation,arguments)},N.prototype.editEdgeMode=function(){return this.manipulation.editEdgeMode.apply(this.manipulation,arguments)},N.prototype.deleteSelected=function(){return this.manipulation.deleteSelected.apply(this.manipulation,arguments)},N.prototype.getPositions=function(){return this.nodesHandler.getPositions.apply(this.nodesHandler,arguments)},N.prototype.storePositions=function(){return this.nodesHandler.storePositions.apply(this.nodesHandler,arguments)},N.prototype.moveNode=function(){return this.nodesHandler.moveNode.apply(this.nodesHandler,arguments)},N.prototype.getBoundingBox=function(){return this.nodesHandler.getBoundingBox.apply(this.nodesHandler,arguments)},N.prototype.getConnectedNodes=function(e){return void 0!==this.body.nodes[e]?this.nodesHandler.getConnectedNodes.apply(this.nodesHandler,arguments):this.edgesHandler.getConnectedNodes.apply(this.edgesHandler,arguments)},N.prototype.getConnectedEdges=function(){return this.nodesHandler.getConnectedEdges.apply(this.nodesHandler,arguments)},N.prototype.startSimulation=function(){return this.physics.startSimulation.apply(this.physics,arguments)},N.prototype.stopSimulation=function(){return this.physics.stopSimulation.apply(this.physics,arguments)},N.prototype.stabilize=function(){return this.physics.stabilize.apply(this.physics,arguments)},N.prototype.getSelection=function(){return this.selectionHandler.getSelection.apply(this.selectionHandler,arguments)},N.prototype.setSelection=function(){return this.selectionHandler.setSelection.apply(this.selectionHandler,arguments)},N.prototype.getSelectedNodes=function(){return this.selectionHandler.getSelectedNodes.apply(this.selectionHandler,arguments)},N.prototype.getSelectedEdges=function(){return this.selectionHandler.getSelectedEdges.apply(this.selectionHandler,arguments)},N.prototype.getNodeAt=function(){var e=this.selectionHandler.getNodeAt.apply(this.selectionHandler,arguments);return void 0!==e&&void 0!==e.id?e.id:e},N.prototype.getEdgeAt=function(){var e=this.selectionHandler.getEdgeAt.apply(this.selectionHandler,arguments);return void 0!==e&&void 0!==e.id?e.id:e},N.prototype.selectNodes=function(){return this.selectionHandler.selectNodes.apply(this.selectionHandler,arguments)},N.prototype.selectEdges=function(){return this.selectionHandler.selectEdges.apply(this.selectionHandler,arguments)},N.prototype.unselectAll=function(){this.selectionHandler.unselectAll.apply(this.selectionHandler,arguments),this.redraw()},N.prototype.redraw=function(){return this.renderer.redraw.apply(this.renderer,arguments)},N.prototype.getScale=function(){return this.view.getScale.apply(this.view,arguments)},N.prototype.getViewPosition=function(){return this.view.getViewPosition.apply(this.view,arguments)},N.prototype.fit=function(){return this.view.fit.apply(this.view,arguments)},N.prototype.moveTo=function(){return this.view.moveTo.apply(this.view,arguments)},N.prototype.focus=function(){return this.view.focus.apply(this.view,arguments)},N.prototype.releaseNode=function(){return this.view.releaseNode.apply(this.view,arguments)},N.prototype.getOptionsFromConfigurator=function(){var e={};return this.configurator&&(e=this.configurator.getOptions.apply(this.configurator)),e},e.exports=N},function(e,t,i){"undefined"!=typeof CanvasRenderingContext2D&&(CanvasRenderingContext2D.prototype.circle=function(e,t,i){this.beginPath(),this.arc(e,t,i,0,2*Math.PI,!1),this.closePath()},CanvasRenderingContext2D.prototype.square=function(e,t,i){this.beginPath(),this.rect(e-i,t-i,2*i,2*i),this.closePath()},CanvasRenderingContext2D.prototype.triangle=function(e,t,i){this.beginPath(),t+=.275*(i*=1.15);var r=2*i,n=r/2,o=Math.sqrt(3)/6*r,a=Math.sqrt(r*r-n*n);this.moveTo(e,t-(a-o)),this.lineTo(e+n,t+o),this.lineTo(e-n,t+o),this.lineTo(e,t-(a-o)),this.closePath()},CanvasRenderingContext2D.prototype.triangleDown=function(e,t,i){this.beginPath(),t-=.275*(i*=1.15);var r=2*i,n=r/2,o=Math.sqrt(3)/6*r,a=Math.sqrt(r*r-n*n);this.moveTo(e,t+(a-o)),this.lineTo(e+n,t-o),this.lineTo(e-n,t-o),this.lineTo(e,t+(a-o)),this.closePath()},CanvasRenderingContext2D.prototype.star=function(e,t,i){this.beginPath(),t+=.1*(i*=.82);for(var r=0;r<10;r++){var n=r%2==0?1.3*i:.5*i;this.lineTo(e+n*Math.sin(2*r*Math.PI/10),t-n*Math.cos(2*r*Math.PI/10))}this.closePath()},CanvasRenderingContext2D.prototype.diamond=function(e,t,i){this.beginPath(),this.lineTo(e,t+i),this.lineTo(e+i,t),this.lineTo(e,t-i),this.lineTo(e-i,t),this.closePath()},CanvasRenderingContext2D.prototype.roundRect=function(e,t,i,r,n){var o=Math.PI/180;i-2*n<0&&(n=i/2),r-2*n<0&&(n=r/2),this.beginPath(),this.moveTo(e+n,t),this.lineTo(e+i-n,t),this.arc(e+i-n,t+n,n,270*o,360*o,!1),this.lineTo(e+i,t+r-n),this.arc(e+i-n,t+r-n,n,0,90*o,!1),this.lineTo(e+n,t+r),this.arc(e+n,t+r-n,n,90*o,180*o,!1),this.lineTo(e,t+n),this.arc(e+n,t+n,n,180*o,270*o,!1),this.closePath()},CanvasRenderingContext2D.prototype.ellipse_vis=function(e,t,i,r){var n=i/2*.5522848,o=r/2*.5522848,a=e+i,s=t+r,l=e+i/2,u=t+r/2;this.beginPath(),this.moveTo(e,u),this.bezierCurveTo(e,u-o,l-n,t,l,t),this.bezierCurveTo(l+n,t,a,u-o,a,u),this.bezierCurveTo(a,u+o,l+n,s,l,s),this.bezierCurveTo(l-n,s,e,u+o,e,u),this.closePath()},CanvasRenderingContext2D.prototype.database=function(e,t,i,r){var n=r*(1/3),o=i/2*.5522848,a=n/2*.5522848,s=e+i,l=t+n,u=e+i/2,h=t+n/2,c=t+(r-n/2),d=t+r;this.beginPath(),this.moveTo(s,h),this.bezierCurveTo(s,h+a,u+o,l,u,l),this.bezierCurveTo(u-o,l,e,h+a,e,h),this.bezierCurveTo(e,h-a,u-o,t,u,t),this.bezierCurveTo(u+o,t,s,h-a,s,h),this.lineTo(s,c),this.bezierCurveTo(s,c+a,u+o,d,u,d),this.bezierCurveTo(u-o,d,e,c+a,e,c),this.lineTo(e,h)},CanvasRenderingContext2D.prototype.dashedLine=function(e,t,i,r,n){this.beginPath(),this.moveTo(e,t);for(var o=n.length,a=i-e,s=r-t,l=s/a,u=Math.sqrt(a*a+s*s),h=0,c=!0,d=0,p=n[0];u>=.1;)(p=n[h++%o])>u&&(p=u),d=Math.sqrt(p*p/(1+l*l)),e+=d=a<0?-d:d,t+=l*d,!0===c?this.lineTo(e,t):this.moveTo(e,t),u-=p,c=!c},CanvasRenderingContext2D.prototype.hexagon=function(e,t,i){this.beginPath();var r=2*Math.PI/6;this.moveTo(e+i,t);for(var n=1;n<6;n++)this.lineTo(e+i*Math.cos(r*n),t+i*Math.sin(r*n));this.closePath()})},function(e,t,i){t.en={edit:"Edit",del:"Delete selected",back:"Back",addNode:"Add Node",addEdge:"Add Edge",editNode:"Edit Node",editEdge:"Edit Edge",addDescription:"Click in an empty space to place a new node.",edgeDescription:"Click on a node and drag the edge to another node to connect them.",editEdgeDescription:"Click on the control points and drag them to a node to connect to it.",createEdgeError:"Cannot link edges to a cluster.",deleteClusterError:"Clusters cannot be deleted.",editClusterError:"Clusters cannot be edited."},t.en_EN=t.en,t.en_US=t.en,t.de={edit:"Editieren",del:"Lösche Auswahl",back:"Zurück",addNode:"Knoten hinzufügen",addEdge:"Kante hinzufügen",editNode:"Knoten editieren",editEdge:"Kante editieren",addDescription:"Klicke auf eine freie Stelle, um einen neuen Knoten zu plazieren.",edgeDescription:"Klicke auf einen Knoten und ziehe die Kante zu einem anderen Knoten, um diese zu verbinden.",editEdgeDescription:"Klicke auf die Verbindungspunkte und ziehe diese auf einen Knoten, um sie zu verbinden.",createEdgeError:"Es ist nicht möglich, Kanten mit Clustern zu verbinden.",deleteClusterError:"Cluster können nicht gelöscht werden.",editClusterError:"Cluster können nicht editiert werden."},t.de_DE=t.de,t.es={edit:"Editar",del:"Eliminar selección",back:"Átras",addNode:"Añadir nodo",addEdge:"Añadir arista",editNode:"Editar nodo",editEdge:"Editar arista",addDescription:"Haga clic en un lugar vacío para colocar un nuevo nodo.",edgeDescription:"Haga clic en un nodo y arrastre la arista hacia otro nodo para conectarlos.",editEdgeDescription:"Haga clic en un punto de control y arrastrelo a un nodo para conectarlo.",createEdgeError:"No se puede conectar una arista a un grupo.",deleteClusterError:"No es posible eliminar grupos.",editClusterError:"No es posible editar grupos."},t.es_ES=t.es,t.it={edit:"Modifica",del:"Cancella la selezione",back:"Indietro",addNode:"Aggiungi un nodo",addEdge:"Aggiungi un vertice",editNode:"Modifica il nodo",editEdge:"Modifica il vertice",addDescription:"Clicca per aggiungere un nuovo nodo",edgeDescription:"Clicca su un nodo e trascinalo ad un altro nodo per connetterli.",editEdgeDescription:"Clicca sui Punti di controllo e trascinali ad un nodo per connetterli.",createEdgeError:"Non si possono collegare vertici ad un cluster",deleteClusterError:"I cluster non possono essere cancellati",editClusterError:"I clusters non possono essere modificati."},t.it_IT=t.it,t.nl={edit:"Wijzigen",del:"Selectie verwijderen",back:"Terug",addNode:"Node toevoegen",addEdge:"Link toevoegen",editNode:"Node wijzigen",editEdge:"Link wijzigen",addDescription:"Klik op een leeg gebied om een nieuwe node te maken.",edgeDescription:"Klik op een node en sleep de link naar een andere node om ze te verbinden.",editEdgeDescription:"Klik op de verbindingspunten en sleep ze naar een node om daarmee te verbinden.",createEdgeError:"Kan geen link maken naar een cluster.",deleteClusterError:"Clusters kunnen niet worden verwijderd.",editClusterError:"Clusters kunnen niet worden aangepast."},t.nl_NL=t.nl,t.nl_BE=t.nl,t["pt-br"]={edit:"Editar",del:"Remover selecionado",back:"Voltar",addNode:"Adicionar nó",addEdge:"Adicionar aresta",editNode:"Editar nó",editEdge:"Editar aresta",addDescription:"Clique em um espaço em branco para adicionar um novo nó",edgeDescription:"Clique em um nó e arraste a aresta até outro nó para conectá-los",editEdgeDescription:"Clique nos pontos de controle e os arraste para um nó para conectá-los",createEdgeError:"Não foi possível linkar arestas a um cluster.",deleteClusterError:"Clusters não puderam ser removidos.",editClusterError:"Clusters não puderam ser editados."},t["pt-BR"]=t["pt-br"],t.pt_BR=t["pt-br"],t.pt_br=t["pt-br"],t.ru={edit:"Редактировать",del:"Удалить выбранное",back:"Назад",addNode:"Добавить узел",addEdge:"Добавить ребро",editNode:"Редактировать узел",editEdge:"Редактировать ребро",addDescription:"Кликните в свободное место, чтобы добавить новый узел.",edgeDescription:"Кликните на узел и протяните ребро к другому узлу, чтобы соединить их.",editEdgeDescription:"Кликните на контрольные точки и перетащите их в узел, чтобы подключиться к нему.",createEdgeError:"Невозможно соединить ребра в кластер.",deleteClusterError:"Кластеры не могут быть удалены",editClusterError:"Кластеры недоступны для редактирования."},t.ru_RU=t.ru,t.cn={edit:"编辑",del:"删除选定",back:"返回",addNode:"添加节点",addEdge:"添加连接线",editNode:"编辑节点",editEdge:"编辑连接线",addDescription:"单击空白处放置新节点。",edgeDescription:"单击某个节点并将该连接线拖动到另一个节点以连接它们。",editEdgeDescription:"单击控制节点并将它们拖到节点上连接。",createEdgeError:"无法将连接线连接到群集。",deleteClusterError:"无法删除群集。",editClusterError:"无法编辑群集。"},t.zh_CN=t.cn},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(){(0,r.default)(this,e),this.NUM_ITERATIONS=4,this.image=new Image,this.canvas=document.createElement("canvas")}return(0,n.default)(e,[{key:"init",value:function(){if(!this.initialized()){this.src=this.image.src;var e=this.image.width,t=this.image.height;this.width=e,this.height=t;var i=Math.floor(t/2),r=Math.floor(t/4),n=Math.floor(t/8),o=Math.floor(t/16),a=Math.floor(e/2),s=Math.floor(e/4),l=Math.floor(e/8),u=Math.floor(e/16);this.canvas.width=3*s,this.canvas.height=i,this.coordinates=[[0,0,a,i],[a,0,s,r],[a,r,l,n],[5*l,r,u,o]],this._fillMipMap()}}},{key:"initialized",value:function(){return void 0!==this.coordinates}},{key:"_fillMipMap",value:function(){var e=this.canvas.getContext("2d"),t=this.coordinates[0];e.drawImage(this.image,t[0],t[1],t[2],t[3]);for(var i=1;i<this.NUM_ITERATIONS;i++){var r=this.coordinates[i-1],n=this.coordinates[i];e.drawImage(this.canvas,r[0],r[1],r[2],r[3],n[0],n[1],n[2],n[3])}}},{key:"drawImageAtPosition",value:function(e,t,i,r,n,o){if(this.initialized())if(t>2){t*=.5;for(var a=0;t>2&&a<this.NUM_ITERATIONS;)t*=.5,a+=1;a>=this.NUM_ITERATIONS&&(a=this.NUM_ITERATIONS-1);var s=this.coordinates[a];e.drawImage(this.canvas,s[0],s[1],s[2],s[3],i,r,n,o)}else e.drawImage(this.image,i,r,n,o)}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=function(){function e(){(0,r.default)(this,e),this.clear(),this.defaultIndex=0,this.groupsArray=[],this.groupIndex=0,this.defaultGroups=[{border:"#2B7CE9",background:"#97C2FC",highlight:{border:"#2B7CE9",background:"#D2E5FF"},hover:{border:"#2B7CE9",background:"#D2E5FF"}},{border:"#FFA500",background:"#FFFF00",highlight:{border:"#FFA500",background:"#FFFFA3"},hover:{border:"#FFA500",background:"#FFFFA3"}},{border:"#FA0A10",background:"#FB7E81",highlight:{border:"#FA0A10",background:"#FFAFB1"},hover:{border:"#FA0A10",background:"#FFAFB1"}},{border:"#41A906",background:"#7BE141",highlight:{border:"#41A906",background:"#A1EC76"},hover:{border:"#41A906",background:"#A1EC76"}},{border:"#E129F0",background:"#EB7DF4",highlight:{border:"#E129F0",background:"#F0B3F5"},hover:{border:"#E129F0",background:"#F0B3F5"}},{border:"#7C29F0",background:"#AD85E4",highlight:{border:"#7C29F0",background:"#D3BDF0"},hover:{border:"#7C29F0",background:"#D3BDF0"}},{border:"#C37F00",background:"#FFA807",highlight:{border:"#C37F00",background:"#FFCA66"},hover:{border:"#C37F00",background:"#FFCA66"}},{border:"#4220FB",background:"#6E6EFD",highlight:{border:"#4220FB",background:"#9B9BFD"},hover:{border:"#4220FB",background:"#9B9BFD"}},{border:"#FD5A77",background:"#FFC0CB",highlight:{border:"#FD5A77",background:"#FFD1D9"},hover:{border:"#FD5A77",background:"#FFD1D9"}},{border:"#4AD63A",background:"#C2FABC",highlight:{border:"#4AD63A",background:"#E6FFE3"},hover:{border:"#4AD63A",background:"#E6FFE3"}},{border:"#990000",background:"#EE0000",highlight:{border:"#BB0000",background:"#FF3333"},hover:{border:"#BB0000",background:"#FF3333"}},{border:"#FF6000",background:"#FF6000",highlight:{border:"#FF6000",background:"#FF6000"},hover:{border:"#FF6000",background:"#FF6000"}},{border:"#97C2FC",background:"#2B7CE9",highlight:{border:"#D2E5FF",background:"#2B7CE9"},hover:{border:"#D2E5FF",background:"#2B7CE9"}},{border:"#399605",background:"#255C03",highlight:{border:"#399605",background:"#255C03"},hover:{border:"#399605",background:"#255C03"}},{border:"#B70054",background:"#FF007E",highlight:{border:"#B70054",background:"#FF007E"},hover:{border:"#B70054",background:"#FF007E"}},{border:"#AD85E4",background:"#7C29F0",highlight:{border:"#D3BDF0",background:"#7C29F0"},hover:{border:"#D3BDF0",background:"#7C29F0"}},{border:"#4557FA",background:"#000EA1",highlight:{border:"#6E6EFD",background:"#000EA1"},hover:{border:"#6E6EFD",background:"#000EA1"}},{border:"#FFC0CB",background:"#FD5A77",highlight:{border:"#FFD1D9",background:"#FD5A77"},hover:{border:"#FFD1D9",background:"#FD5A77"}},{border:"#C2FABC",background:"#74D66A",highlight:{border:"#E6FFE3",background:"#74D66A"},hover:{border:"#E6FFE3",background:"#74D66A"}},{border:"#EE0000",background:"#990000",highlight:{border:"#FF3333",background:"#BB0000"},hover:{border:"#FF3333",background:"#BB0000"}}],this.options={},this.defaultOptions={useDefaultGroups:!0},a.extend(this.options,this.defaultOptions)}return(0,n.default)(e,[{key:"setOptions",value:function(e){var t=["useDefaultGroups"];if(void 0!==e)for(var i in e)if(e.hasOwnProperty(i)&&-1===t.indexOf(i)){var r=e[i];this.add(i,r)}}},{key:"clear",value:function(){this.groups={},this.groupsArray=[]}},{key:"get",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this.groups[e];if(void 0===i&&t)if(!1===this.options.useDefaultGroups&&this.groupsArray.length>0){var r=this.groupIndex%this.groupsArray.length;this.groupIndex++,(i={}).color=this.groups[this.groupsArray[r]],this.groups[e]=i}else{var n=this.defaultIndex%this.defaultGroups.length;this.defaultIndex++,(i={}).color=this.defaultGroups[n],this.groups[e]=i}return i}},{key:"add",value:function(e,t){return this.groups[e]=t,this.groupsArray.push(e),t}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(11),l=i(12),u=i(47).default,h=function(){function e(t,i,n,o){var s=this;if((0,r.default)(this,e),this.body=t,this.images=i,this.groups=n,this.layoutEngine=o,this.body.functions.createNode=this.create.bind(this),this.nodesListeners={add:function(e,t){s.add(t.items)},update:function(e,t){s.update(t.items,t.data,t.oldData)},remove:function(e,t){s.remove(t.items)}},this.defaultOptions={borderWidth:1,borderWidthSelected:2,brokenImage:void 0,color:{border:"#2B7CE9",background:"#97C2FC",highlight:{border:"#2B7CE9",background:"#D2E5FF"},hover:{border:"#2B7CE9",background:"#D2E5FF"}},fixed:{x:!1,y:!1},font:{color:"#343434",size:14,face:"arial",background:"none",strokeWidth:0,strokeColor:"#ffffff",align:"center",vadjust:0,multi:!1,bold:{mod:"bold"},boldital:{mod:"bold italic"},ital:{mod:"italic"},mono:{mod:"",size:15,face:"monospace",vadjust:2}},group:void 0,hidden:!1,icon:{face:"FontAwesome",code:void 0,size:50,color:"#2B7CE9"},image:void 0,label:void 0,labelHighlightBold:!0,level:void 0,margin:{top:5,right:5,bottom:5,left:5},mass:1,physics:!0,scaling:{min:10,max:30,label:{enabled:!1,min:14,max:30,maxVisible:30,drawThreshold:5},customScalingFunction:function(e,t,i,r){if(t===e)return.5;var n=1/(t-e);return Math.max(0,(r-e)*n)}},shadow:{enabled:!1,color:"rgba(0,0,0,0.5)",size:10,x:5,y:5},shape:"ellipse",shapeProperties:{borderDashes:!1,borderRadius:6,interpolation:!0,useImageSize:!1,useBorderWithImage:!1},size:25,title:void 0,value:void 0,x:void 0,y:void 0},this.defaultOptions.mass<=0)throw"Internal error: mass in defaultOptions of NodesHandler may not be zero or negative";this.options=a.bridgeObject(this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("refreshNodes",this.refresh.bind(this)),this.body.emitter.on("refresh",this.refresh.bind(this)),this.body.emitter.on("destroy",function(){a.forEach(e.nodesListeners,function(t,i){e.body.data.nodes&&e.body.data.nodes.off(i,t)}),delete e.body.functions.createNode,delete e.nodesListeners.add,delete e.nodesListeners.update,delete e.nodesListeners.remove,delete e.nodesListeners})}},{key:"setOptions",value:function(e){if(void 0!==e){if(u.parseOptions(this.options,e),void 0!==e.shape)for(var t in this.body.nodes)this.body.nodes.hasOwnProperty(t)&&this.body.nodes[t].updateShape();if(void 0!==e.font)for(var i in this.body.nodes)this.body.nodes.hasOwnProperty(i)&&(this.body.nodes[i].updateLabelModule(),this.body.nodes[i].needsRefresh());if(void 0!==e.size)for(var r in this.body.nodes)this.body.nodes.hasOwnProperty(r)&&this.body.nodes[r].needsRefresh();void 0===e.hidden&&void 0===e.physics||this.body.emitter.emit("_dataChanged")}}},{key:"setData",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.data.nodes;if(e instanceof s||e instanceof l)this.body.data.nodes=e;else if(Array.isArray(e))this.body.data.nodes=new s,this.body.data.nodes.add(e);else{if(e)throw new TypeError("Array or DataSet expected");this.body.data.nodes=new s}if(i&&a.forEach(this.nodesListeners,function(e,t){i.off(t,e)}),this.body.nodes={},this.body.data.nodes){var r=this;a.forEach(this.nodesListeners,function(e,t){r.body.data.nodes.on(t,e)});var n=this.body.data.nodes.getIds();this.add(n,!0)}!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"add",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=void 0,r=[],n=0;n<e.length;n++){i=e[n];var o=this.body.data.nodes.get(i),a=this.create(o);r.push(a),this.body.nodes[i]=a}this.layoutEngine.positionInitially(r),!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"update",value:function(e,t,i){for(var r=this.body.nodes,n=!1,o=0;o<e.length;o++){var a=e[o],s=r[a],l=t[o];void 0!==s?s.setOptions(l)&&(n=!0):(n=!0,s=this.create(l),r[a]=s)}n||void 0===i||(n=t.some(function(e,t){var r=i[t];return r&&r.level!==e.level})),!0===n?this.body.emitter.emit("_dataChanged"):this.body.emitter.emit("_dataUpdated")}},{key:"remove",value:function(e){for(var t=this.body.nodes,i=0;i<e.length;i++){delete t[e[i]]}this.body.emitter.emit("_dataChanged")}},{key:"create",value:function(e){return new(arguments.length>1&&void 0!==arguments[1]?arguments[1]:u)(e,this.body,this.images,this.groups,this.options,this.defaultOptions)}},{key:"refresh",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];a.forEach(this.body.nodes,function(i,r){var n=e.body.data.nodes.get(r);void 0!==n&&(!0===t&&i.setOptions({x:null,y:null}),i.setOptions({fixed:!1}),i.setOptions(n))})}},{key:"getPositions",value:function(e){var t={};if(void 0!==e){if(!0===Array.isArray(e)){for(var i=0;i<e.length;i++)if(void 0!==this.body.nodes[e[i]]){var r=this.body.nodes[e[i]];t[e[i]]={x:Math.round(r.x),y:Math.round(r.y)}}}else if(void 0!==this.body.nodes[e]){var n=this.body.nodes[e];t[e]={x:Math.round(n.x),y:Math.round(n.y)}}}else for(var o=0;o<this.body.nodeIndices.length;o++){var a=this.body.nodes[this.body.nodeIndices[o]];t[this.body.nodeIndices[o]]={x:Math.round(a.x),y:Math.round(a.y)}}return t}},{key:"storePositions",value:function(){var e=[],t=this.body.data.nodes.getDataSet();for(var i in t._data)if(t._data.hasOwnProperty(i)){var r=this.body.nodes[i];t._data[i].x==Math.round(r.x)&&t._data[i].y==Math.round(r.y)||e.push({id:r.id,x:Math.round(r.x),y:Math.round(r.y)})}t.update(e)}},{key:"getBoundingBox",value:function(e){if(void 0!==this.body.nodes[e])return this.body.nodes[e].shape.boundingBox}},{key:"getConnectedNodes",value:function(e,t){var i=[];if(void 0!==this.body.nodes[e])for(var r=this.body.nodes[e],n={},o=0;o<r.edges.length;o++){var a=r.edges[o];"to"!==t&&a.toId==r.id?void 0===n[a.fromId]&&(i.push(a.fromId),n[a.fromId]=!0):"from"!==t&&a.fromId==r.id&&void 0===n[a.toId]&&(i.push(a.toId),n[a.toId]=!0)}return i}},{key:"getConnectedEdges",value:function(e){var t=[];if(void 0!==this.body.nodes[e])for(var i=this.body.nodes[e],r=0;r<i.edges.length;r++)t.push(i.edges[r].id);else console.log("NodeId provided for getConnectedEdges does not exist. Provided: ",e);return t}},{key:"moveNode",value:function(e,t,i){var r=this;void 0!==this.body.nodes[e]?(this.body.nodes[e].x=Number(t),this.body.nodes[e].y=Number(i),setTimeout(function(){r.body.emitter.emit("startSimulation")},0)):console.log("Node id supplied to moveNode does not exist. Provided: ",e)}}]),e}();t.default=h},function(e,t,i){e.exports={default:i(189),__esModule:!0}},function(e,t,i){i(49),i(60),e.exports=i(190)},function(e,t,i){var r=i(86),n=i(13)("iterator"),o=i(31);e.exports=i(7).isIterable=function(e){var t=Object(e);return void 0!==t[n]||"@@iterator"in t||o.hasOwnProperty(r(t))}},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(192).default,s=i(48).default,l=function(){function e(t,i,n,o){var s=this;(0,r.default)(this,e),this.ctx=t,this.parent=i;this.lines=new a(function(e,i){if(void 0===e)return 0;var r=s.parent.getFormattingValues(t,n,o,i),a=0;""!==e&&(a=s.ctx.measureText(e).width);return{width:a,values:r}})}return(0,n.default)(e,[{key:"process",value:function(e){if(!s.isValidLabel(e))return this.lines.finalize();var t=this.parent.fontOptions;e=(e=e.replace(/\r\n/g,"\n")).replace(/\r/g,"\n");var i=String(e).split("\n"),r=i.length;if(t.multi)for(var n=0;n<r;n++){var o=this.splitBlocks(i[n],t.multi);if(void 0!==o)if(0!==o.length){if(t.maxWdt>0)for(var a=0;a<o.length;a++){var l=o[a].mod,u=o[a].text;this.splitStringIntoLines(u,l,!0)}else for(var h=0;h<o.length;h++){var c=o[h].mod,d=o[h].text;this.lines.append(d,c)}this.lines.newLine()}else this.lines.newLine("")}else if(t.maxWdt>0)for(var p=0;p<r;p++)this.splitStringIntoLines(i[p]);else for(var f=0;f<r;f++)this.lines.newLine(i[f]);return this.lines.finalize()}},{key:"decodeMarkupSystem",value:function(e){var t="none";return"markdown"===e||"md"===e?t="markdown":!0!==e&&"html"!==e||(t="html"),t}},{key:"splitHtmlBlocks",value:function(e){for(var t=[],i={bold:!1,ital:!1,mono:!1,spacing:!1,position:0,buffer:"",modStack:[],mod:function(){return 0===this.modStack.length?"normal":this.modStack[0]},modName:function(){return 0===this.modStack.length?"normal":"mono"===this.modStack[0]?"mono":i.bold&&i.ital?"boldital":i.bold?"bold":i.ital?"ital":void 0},emitBlock:function(){arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.spacing&&(this.add(" "),this.spacing=!1),this.buffer.length>0&&(t.push({text:this.buffer,mod:this.modName()}),this.buffer="")},add:function(e){" "===e&&(i.spacing=!0),i.spacing&&(this.buffer+=" ",this.spacing=!1)," "!=e&&(this.buffer+=e)}};i.position<e.length;){var r=e.charAt(i.position);/[ \t]/.test(r)?i.mono?i.add(r):i.spacing=!0:/</.test(r)?i.mono||i.bold||!/<b>/.test(e.substr(i.position,3))?i.mono||i.ital||!/<i>/.test(e.substr(i.position,3))?!i.mono&&/<code>/.test(e.substr(i.position,6))?(i.emitBlock(),i.mono=!0,i.modStack.unshift("mono"),i.position+=5):!i.mono&&"bold"===i.mod()&&/<\/b>/.test(e.substr(i.position,4))?(i.emitBlock(),i.bold=!1,i.modStack.shift(),i.position+=3):!i.mono&&"ital"===i.mod()&&/<\/i>/.test(e.substr(i.position,4))?(i.emitBlock(),i.ital=!1,i.modStack.shift(),i.position+=3):"mono"===i.mod()&&/<\/code>/.test(e.substr(i.position,7))?(i.emitBlock(),i.mono=!1,i.modStack.shift(),i.position+=6):i.add(r):(i.emitBlock(),i.ital=!0,i.modStack.unshift("ital"),i.position+=2):(i.emitBlock(),i.bold=!0,i.modStack.unshift("bold"),i.position+=2):/&/.test(r)?/&lt;/.test(e.substr(i.position,4))?(i.add("<"),i.position+=3):/&amp;/.test(e.substr(i.position,5))?(i.add("&"),i.position+=4):i.add("&"):i.add(r),i.position++}return i.emitBlock(),t}},{key:"splitMarkdownBlocks",value:function(e){for(var t=[],i={bold:!1,ital:!1,mono:!1,beginable:!0,spacing:!1,position:0,buffer:"",modStack:[],mod:function(){return 0===this.modStack.length?"normal":this.modStack[0]},modName:function(){return 0===this.modStack.length?"normal":"mono"===this.modStack[0]?"mono":i.bold&&i.ital?"boldital":i.bold?"bold":i.ital?"ital":void 0},emitBlock:function(){arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.spacing&&(this.add(" "),this.spacing=!1),this.buffer.length>0&&(t.push({text:this.buffer,mod:this.modName()}),this.buffer="")},add:function(e){" "===e&&(i.spacing=!0),i.spacing&&(this.buffer+=" ",this.spacing=!1)," "!=e&&(this.buffer+=e)}};i.position<e.length;){var r=e.charAt(i.position);/[ \t]/.test(r)?(i.mono?i.add(r):i.spacing=!0,i.beginable=!0):/\\/.test(r)?i.position<e.length+1&&(i.position++,r=e.charAt(i.position),/ \t/.test(r)?i.spacing=!0:(i.add(r),i.beginable=!1)):i.mono||i.bold||!i.beginable&&!i.spacing||!/\*/.test(r)?i.mono||i.ital||!i.beginable&&!i.spacing||!/\_/.test(r)?!i.mono&&(i.beginable||i.spacing)&&/`/.test(r)?(i.emitBlock(),i.mono=!0,i.modStack.unshift("mono")):!i.mono&&"bold"===i.mod()&&/\*/.test(r)?i.position===e.length-1||/[.,_` \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.bold=!1,i.modStack.shift()):i.add(r):!i.mono&&"ital"===i.mod()&&/\_/.test(r)?i.position===e.length-1||/[.,*` \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.ital=!1,i.modStack.shift()):i.add(r):i.mono&&"mono"===i.mod()&&/`/.test(r)?i.position===e.length-1||/[.,*_ \t\n]/.test(e.charAt(i.position+1))?(i.emitBlock(),i.mono=!1,i.modStack.shift()):i.add(r):(i.add(r),i.beginable=!1):(i.emitBlock(),i.ital=!0,i.modStack.unshift("ital")):(i.emitBlock(),i.bold=!0,i.modStack.unshift("bold")),i.position++}return i.emitBlock(),t}},{key:"splitBlocks",value:function(e,t){var i=this.decodeMarkupSystem(t);return"none"===i?[{text:e,mod:"normal"}]:"markdown"===i?this.splitMarkdownBlocks(e):"html"===i?this.splitHtmlBlocks(e):void 0}},{key:"overMaxWidth",value:function(e){var t=this.ctx.measureText(e).width;return this.lines.curWidth()+t>this.parent.fontOptions.maxWdt}},{key:"getLongestFit",value:function(e){for(var t="",i=0;i<e.length;){var r=t+(""===t?"":" ")+e[i];if(this.overMaxWidth(r))break;t=r,i++}return i}},{key:"getLongestFitWord",value:function(e){for(var t=0;t<e.length&&!this.overMaxWidth(e.slice(0,t));)t++;return t}},{key:"splitStringIntoLines",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal",i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=(e=(e=e.replace(/^( +)/g,"$1\r")).replace(/([^\r][^ ]*)( +)/g,"$1\r$2\r")).split("\r");r.length>0;){var n=this.getLongestFit(r);if(0===n){var o=r[0],a=this.getLongestFitWord(o);this.lines.newLine(o.slice(0,a),t),r[0]=o.slice(a)}else{var s=n;" "===r[n-1]?n--:" "===r[s]&&s++;var l=r.slice(0,n).join("");n==r.length&&i?this.lines.append(l,t):this.lines.newLine(l,t),r=r.slice(s)}}}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(90)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=function(){function e(t){(0,n.default)(this,e),this.measureText=t,this.current=0,this.width=0,this.height=0,this.lines=[]}return(0,o.default)(e,[{key:"_add",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"normal";void 0===this.lines[e]&&(this.lines[e]={width:0,height:0,blocks:[]});var n=t;void 0!==t&&""!==t||(n=" ");var o=this.measureText(n,i),a=(0,r.default)({},o.values);a.text=t,a.width=o.width,a.mod=i,void 0!==t&&""!==t||(a.width=0),this.lines[e].blocks.push(a),this.lines[e].width+=a.width}},{key:"curWidth",value:function(){var e=this.lines[this.current];return void 0===e?0:e.width}},{key:"append",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal";this._add(this.current,e,t)}},{key:"newLine",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"normal";this._add(this.current,e,t),this.current++}},{key:"determineLineHeights",value:function(){for(var e=0;e<this.lines.length;e++){var t=this.lines[e],i=0;if(void 0!==t.blocks)for(var r=0;r<t.blocks.length;r++){var n=t.blocks[r];i<n.height&&(i=n.height)}t.height=i}}},{key:"determineLabelSize",value:function(){for(var e=0,t=0,i=0;i<this.lines.length;i++){var r=this.lines[i];r.width>e&&(e=r.width),t+=r.height}this.width=e,this.height=t}},{key:"removeEmptyBlocks",value:function(){for(var e=[],t=0;t<this.lines.length;t++){var i=this.lines[t];if(0!==i.blocks.length&&(t!==this.lines.length-1||0!==i.width)){var n={};(0,r.default)(n,i),n.blocks=[];for(var o=void 0,a=[],s=0;s<i.blocks.length;s++){var l=i.blocks[s];0!==l.width?a.push(l):void 0===o&&(o=l)}0===a.length&&void 0!==o&&a.push(o),n.blocks=a,e.push(n)}}return e}},{key:"finalize",value:function(){this.determineLineHeights(),this.determineLabelSize();var e=this.removeEmptyBlocks();return{width:this.width,height:this.height,lines:e}}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i);this.width=r.width+this.margin.right+this.margin.left,this.height=r.height+this.margin.top+this.margin.bottom,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.initContextForDraw(e,o),e.roundRect(this.left,this.top,this.width,this.height,o.borderRadius),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n)}},{key:"updateBoundingBox",value:function(e,t,i,r,n){this._updateBoundingBox(e,t,i,r,n);var o=this.options.shapeProperties.borderRadius;this._addBoundingBoxMargin(o)}},{key:"distanceToBorder",value:function(e,t){this.resize(e);var i=this.options.borderWidth;return Math.min(Math.abs(this.width/2/Math.cos(t)),Math.abs(this.height/2/Math.sin(t)))+i}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){i(195),e.exports=i(7).Object.getPrototypeOf},function(e,t,i){var r=i(41),n=i(85);i(87)("getPrototypeOf",function(){return function(e){return n(r(e))}})},function(e,t,i){e.exports={default:i(197),__esModule:!0}},function(e,t,i){i(198),e.exports=i(7).Object.setPrototypeOf},function(e,t,i){var r=i(17);r(r.S,"Object",{setPrototypeOf:i(199).set})},function(e,t,i){var r=i(32),n=i(27),o=function(e,t){if(n(e),!r(t)&&null!==t)throw TypeError(t+": can't set as prototype!")};e.exports={set:Object.setPrototypeOf||("__proto__"in{}?function(e,t,r){try{(r=i(80)(Function.call,i(89).f(Object.prototype,"__proto__").set,2))(e,[]),t=!(e instanceof Array)}catch(e){t=!0}return function(e,i){return o(e,i),t?e.__proto__=i:r(e,i),e}}({},!1):void 0),check:o}},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i),n=Math.max(r.width+this.margin.right+this.margin.left,r.height+this.margin.top+this.margin.bottom);this.options.size=n/2,this.width=n,this.height=n,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this._drawRawCircle(e,t,i,o),this.updateBoundingBox(t,i),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,i,r,n)}},{key:"updateBoundingBox",value:function(e,t){this.boundingBox.top=t-this.options.size,this.boundingBox.left=e-this.options.size,this.boundingBox.right=e+this.options.size,this.boundingBox.bottom=t+this.options.size}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),.5*this.width}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o,s,l){(0,n.default)(this,t);var u=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return u.setImages(s,l),u}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(void 0===this.imageObj.src||void 0===this.imageObj.width||void 0===this.imageObj.height){var r=2*this.options.size;return this.width=r,this.height=r,void(this.radius=.5*this.width)}this.needsRefresh(t,i)&&this._resizeImage()}},{key:"draw",value:function(e,t,i,r,n,o){this.switchImages(r),this.resize(),this.left=t-this.width/2,this.top=i-this.height/2,this._drawRawCircle(e,t,i,o),e.save(),e.clip(),this._drawImageAtPosition(e,o),e.restore(),this._drawImageLabel(e,t,i,r,n),this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){this.boundingBox.top=t-this.options.size,this.boundingBox.left=e-this.options.size,this.boundingBox.right=e+this.options.size,this.boundingBox.bottom=t+this.options.size,this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelOffset)}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),.5*this.width}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i).width+this.margin.right+this.margin.left;this.width=r,this.height=r,this.radius=this.width/2}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.initContextForDraw(e,o),e.database(t-this.width/2,i-this.height/2,this.width,this.height),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"diamond",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"circle",2,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this.resize(e),this.options.size}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(this.needsRefresh(t,i)){var r=this.getDimensionsFromLabel(e,t,i);this.height=2*r.height,this.width=r.width+r.height,this.radius=.5*this.width}}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-.5*this.width,this.top=i-.5*this.height,this.initContextForDraw(e,o),e.ellipse_vis(this.left,this.top,this.width,this.height),this.performFill(e,o),this.updateBoundingBox(t,i,e,r,n),this.labelModule.draw(e,t,i,r,n)}},{key:"distanceToBorder",value:function(e,t){this.resize(e);var i=.5*this.width,r=.5*this.height,n=Math.sin(t)*i,o=Math.cos(t)*r;return i*r/Math.sqrt(n*n+o*o)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){this.needsRefresh(t,i)&&(this.iconSize={width:Number(this.options.icon.size),height:Number(this.options.icon.size)},this.width=this.iconSize.width+this.margin.right+this.margin.left,this.height=this.iconSize.height+this.margin.top+this.margin.bottom,this.radius=.5*this.width)}},{key:"draw",value:function(e,t,i,r,n,o){if(this.resize(e,r,n),this.options.icon.size=this.options.icon.size||50,this.left=t-this.width/2,this.top=i-this.height/2,this._icon(e,t,i,r,n,o),void 0!==this.options.label){this.labelModule.draw(e,this.left+this.iconSize.width/2+this.margin.left,i+this.height/2+5,r)}this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){if(this.boundingBox.top=t-.5*this.options.icon.size,this.boundingBox.left=e-.5*this.options.icon.size,this.boundingBox.right=e+.5*this.options.icon.size,this.boundingBox.bottom=t+.5*this.options.icon.size,void 0!==this.options.label&&this.labelModule.size.width>0){this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelModule.size.height+5)}}},{key:"_icon",value:function(e,t,i,r,n,o){var a=Number(this.options.icon.size);void 0!==this.options.icon.code?(e.font=(r?"bold ":"")+a+"px "+this.options.icon.face,e.fillStyle=this.options.icon.color||"black",e.textAlign="center",e.textBaseline="middle",this.enableShadow(e,o),e.fillText(this.options.icon.code,t,i),this.disableShadow(e,o)):console.error("When using the icon shape, you need to define the code in the icon options object. This can be done per node or globally.")}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o,s,l){(0,n.default)(this,t);var u=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return u.setImages(s,l),u}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.selected,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.hover;if(void 0===this.imageObj.src||void 0===this.imageObj.width||void 0===this.imageObj.height){var r=2*this.options.size;return this.width=r,void(this.height=r)}this.needsRefresh(t,i)&&this._resizeImage()}},{key:"draw",value:function(e,t,i,r,n,o){if(this.switchImages(r),this.resize(),this.left=t-this.width/2,this.top=i-this.height/2,!0===this.options.shapeProperties.useBorderWithImage){var a=this.options.borderWidth,s=this.options.borderWidthSelected||2*this.options.borderWidth,l=(r?s:a)/this.body.view.scale;e.lineWidth=Math.min(this.width,l),e.beginPath(),e.strokeStyle=r?this.options.color.highlight.border:n?this.options.color.hover.border:this.options.color.border,e.fillStyle=r?this.options.color.highlight.background:n?this.options.color.hover.background:this.options.color.background,e.rect(this.left-.5*e.lineWidth,this.top-.5*e.lineWidth,this.width+e.lineWidth,this.height+e.lineWidth),e.fill(),this.performStroke(e,o),e.closePath()}this._drawImageAtPosition(e,o),this._drawImageLabel(e,t,i,r,n),this.updateBoundingBox(t,i)}},{key:"updateBoundingBox",value:function(e,t){this.resize(),this._updateBoundingBox(e,t),void 0!==this.options.label&&this.labelModule.size.width>0&&(this.boundingBox.left=Math.min(this.boundingBox.left,this.labelModule.size.left),this.boundingBox.right=Math.max(this.boundingBox.right,this.labelModule.size.left+this.labelModule.size.width),this.boundingBox.bottom=Math.max(this.boundingBox.bottom,this.boundingBox.bottom+this.labelOffset))}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(73)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"square",2,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"hexagon",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"star",4,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){(0,n.default)(this,t);var s=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o));return s._setMargins(o),s}return(0,s.default)(t,e),(0,o.default)(t,[{key:"resize",value:function(e,t,i){this.needsRefresh(t,i)&&(this.textSize=this.labelModule.getTextSize(e,t,i),this.width=this.textSize.width+this.margin.right+this.margin.left,this.height=this.textSize.height+this.margin.top+this.margin.bottom,this.radius=.5*this.width)}},{key:"draw",value:function(e,t,i,r,n,o){this.resize(e,r,n),this.left=t-this.width/2,this.top=i-this.height/2,this.enableShadow(e,o),this.labelModule.draw(e,this.left+this.textSize.width/2+this.margin.left,this.top+this.textSize.height/2+this.margin.top,r,n),this.disableShadow(e,o),this.updateBoundingBox(t,i,e,r,n)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(23)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"triangle",3,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"draw",value:function(e,t,i,r,n,o){this._drawShape(e,"triangleDown",3,t,i,r,n,o)}},{key:"distanceToBorder",value:function(e,t){return this._distanceToBorder(e,t)}}]),t}(l(i(24)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(11),l=i(12),u=i(74).default,h=function(){function e(t,i,n){var o=this;(0,r.default)(this,e),this.body=t,this.images=i,this.groups=n,this.body.functions.createEdge=this.create.bind(this),this.edgesListeners={add:function(e,t){o.add(t.items)},update:function(e,t){o.update(t.items)},remove:function(e,t){o.remove(t.items)}},this.options={},this.defaultOptions={arrows:{to:{enabled:!1,scaleFactor:1,type:"arrow"},middle:{enabled:!1,scaleFactor:1,type:"arrow"},from:{enabled:!1,scaleFactor:1,type:"arrow"}},arrowStrikethrough:!0,color:{color:"#848484",highlight:"#848484",hover:"#848484",inherit:"from",opacity:1},dashes:!1,font:{color:"#343434",size:14,face:"arial",background:"none",strokeWidth:2,strokeColor:"#ffffff",align:"horizontal",multi:!1,vadjust:0,bold:{mod:"bold"},boldital:{mod:"bold italic"},ital:{mod:"italic"},mono:{mod:"",size:15,face:"courier new",vadjust:2}},hidden:!1,hoverWidth:1.5,label:void 0,labelHighlightBold:!0,length:void 0,physics:!0,scaling:{min:1,max:15,label:{enabled:!0,min:14,max:30,maxVisible:30,drawThreshold:5},customScalingFunction:function(e,t,i,r){if(t===e)return.5;var n=1/(t-e);return Math.max(0,(r-e)*n)}},selectionWidth:1.5,selfReferenceSize:20,shadow:{enabled:!1,color:"rgba(0,0,0,0.5)",size:10,x:5,y:5},smooth:{enabled:!0,type:"dynamic",forceDirection:"none",roundness:.5},title:void 0,width:1,value:void 0},a.deepExtend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("_forceDisableDynamicCurves",function(t){var i=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];"dynamic"===t&&(t="continuous");var r=!1;for(var n in e.body.edges)if(e.body.edges.hasOwnProperty(n)){var o=e.body.edges[n],a=e.body.data.edges._data[n];if(void 0!==a){var s=a.smooth;void 0!==s&&!0===s.enabled&&"dynamic"===s.type&&(void 0===t?o.setOptions({smooth:!1}):o.setOptions({smooth:{type:t}}),r=!0)}}!0===i&&!0===r&&e.body.emitter.emit("_dataChanged")}),this.body.emitter.on("_dataUpdated",function(){e.reconnectEdges()}),this.body.emitter.on("refreshEdges",this.refresh.bind(this)),this.body.emitter.on("refresh",this.refresh.bind(this)),this.body.emitter.on("destroy",function(){a.forEach(e.edgesListeners,function(t,i){e.body.data.edges&&e.body.data.edges.off(i,t)}),delete e.body.functions.createEdge,delete e.edgesListeners.add,delete e.edgesListeners.update,delete e.edgesListeners.remove,delete e.edgesListeners})}},{key:"setOptions",value:function(e){if(void 0!==e){u.parseOptions(this.options,e,!0,this.defaultOptions,!0);var t=!1;if(void 0!==e.smooth)for(var i in this.body.edges)this.body.edges.hasOwnProperty(i)&&(t=this.body.edges[i].updateEdgeType()||t);if(void 0!==e.font)for(var r in this.body.edges)this.body.edges.hasOwnProperty(r)&&this.body.edges[r].updateLabelModule();void 0===e.hidden&&void 0===e.physics&&!0!==t||this.body.emitter.emit("_dataChanged")}}},{key:"setData",value:function(e){var t=this,i=arguments.length>1&&void 0!==arguments[1]&&arguments[1],r=this.body.data.edges;if(e instanceof s||e instanceof l)this.body.data.edges=e;else if(Array.isArray(e))this.body.data.edges=new s,this.body.data.edges.add(e);else{if(e)throw new TypeError("Array or DataSet expected");this.body.data.edges=new s}if(r&&a.forEach(this.edgesListeners,function(e,t){r.off(t,e)}),this.body.edges={},this.body.data.edges){a.forEach(this.edgesListeners,function(e,i){t.body.data.edges.on(i,e)});var n=this.body.data.edges.getIds();this.add(n,!0)}this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),!1===i&&this.body.emitter.emit("_dataChanged")}},{key:"add",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.edges,r=this.body.data.edges,n=0;n<e.length;n++){var o=e[n],a=i[o];a&&a.disconnect();var s=r.get(o,{showInternalIds:!0});i[o]=this.create(s)}this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),!1===t&&this.body.emitter.emit("_dataChanged")}},{key:"update",value:function(e){for(var t=this.body.edges,i=this.body.data.edges,r=!1,n=0;n<e.length;n++){var o=e[n],a=i.get(o),s=t[o];void 0!==s?(s.disconnect(),r=s.setOptions(a)||r,s.connect()):(this.body.edges[o]=this.create(a),r=!0)}!0===r?(this.body.emitter.emit("_adjustEdgesForHierarchicalLayout"),this.body.emitter.emit("_dataChanged")):this.body.emitter.emit("_dataUpdated")}},{key:"remove",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(0!==e.length){var i=this.body.edges;a.forEach(e,function(e){var t=i[e];void 0!==t&&t.remove()}),t&&this.body.emitter.emit("_dataChanged")}}},{key:"refresh",value:function(){var e=this;a.forEach(this.body.edges,function(t,i){var r=e.body.data.edges._data[i];void 0!==r&&t.setOptions(r)})}},{key:"create",value:function(e){return new u(e,this.body,this.options,this.defaultOptions)}},{key:"reconnectEdges",value:function(){var e,t=this.body.nodes,i=this.body.edges;for(e in t)t.hasOwnProperty(e)&&(t[e].edges=[]);for(e in i)if(i.hasOwnProperty(e)){var r=i[e];r.from=null,r.to=null,r.connect()}}},{key:"getConnectedNodes",value:function(e){var t=[];if(void 0!==this.body.edges[e]){var i=this.body.edges[e];void 0!==i.fromId&&t.push(i.fromId),void 0!==i.toId&&t.push(i.toId)}return t}},{key:"_updateState",value:function(){this._addMissingEdges(),this._removeInvalidEdges()}},{key:"_removeInvalidEdges",value:function(){var e=this,t=[];a.forEach(this.body.edges,function(i,r){var n=e.body.nodes[i.toId],o=e.body.nodes[i.fromId];void 0!==n&&!0===n.isCluster||void 0!==o&&!0===o.isCluster||void 0!==n&&void 0!==o||t.push(r)}),this.remove(t,!1)}},{key:"_addMissingEdges",value:function(){var e=this.body.edges,t=this.body.data.edges,i=[];t.forEach(function(t,r){void 0===e[r]&&i.push(r)}),this.add(i,!0)}}]),e}();t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=u(i(30)),n=u(i(3)),o=u(i(0)),a=u(i(1)),s=u(i(4)),l=u(i(5));function u(e){return e&&e.__esModule?e:{default:e}}var h=function(e){function t(e,i,r){return(0,o.default)(this,t),(0,s.default)(this,(t.__proto__||(0,n.default)(t)).call(this,e,i,r))}return(0,l.default)(t,e),(0,a.default)(t,[{key:"_line",value:function(e,t,i){var r=i[0],n=i[1];this._bezierCurve(e,t,r,n)}},{key:"_getViaCoordinates",value:function(){var e=this.from.x-this.to.x,t=this.from.y-this.to.y,i=void 0,r=void 0,n=void 0,o=void 0,a=this.options.smooth.roundness;return(Math.abs(e)>Math.abs(t)||!0===this.options.smooth.forceDirection||"horizontal"===this.options.smooth.forceDirection)&&"vertical"!==this.options.smooth.forceDirection?(r=this.from.y,o=this.to.y,i=this.from.x-a*e,n=this.to.x+a*e):(r=this.from.y-a*t,o=this.to.y+a*t,i=this.from.x,n=this.to.x),[{x:i,y:r},{x:n,y:o}]}},{key:"getViaNode",value:function(){return this._getViaCoordinates()}},{key:"_findBorderPosition",value:function(e,t){return this._findBorderPositionBezier(e,t)}},{key:"_getDistanceToEdge",value:function(e,t,i,n,o,a){var s=arguments.length>6&&void 0!==arguments[6]?arguments[6]:this._getViaCoordinates(),l=(0,r.default)(s,2),u=l[0],h=l[1];return this._getDistanceToBezierEdge(e,t,i,n,o,a,u,h)}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._getViaCoordinates(),i=(0,r.default)(t,2),n=i[0],o=i[1],a=e,s=[];return s[0]=Math.pow(1-a,3),s[1]=3*a*Math.pow(1-a,2),s[2]=3*Math.pow(a,2)*(1-a),s[3]=Math.pow(a,3),{x:s[0]*this.fromPoint.x+s[1]*n.x+s[2]*o.x+s[3]*this.toPoint.x,y:s[0]*this.fromPoint.y+s[1]*n.y+s[2]*o.y+s[3]*this.toPoint.y}}}]),t}(u(i(216)).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_getDistanceToBezierEdge",value:function(e,t,i,r,n,o,a,s){var l=1e9,u=void 0,h=void 0,c=void 0,d=void 0,p=void 0,f=e,m=t,v=[0,0,0,0];for(h=1;h<10;h++)c=.1*h,v[0]=Math.pow(1-c,3),v[1]=3*c*Math.pow(1-c,2),v[2]=3*Math.pow(c,2)*(1-c),v[3]=Math.pow(c,3),d=v[0]*e+v[1]*a.x+v[2]*s.x+v[3]*i,p=v[0]*t+v[1]*a.y+v[2]*s.y+v[3]*r,h>0&&(l=(u=this._getDistanceToLine(f,m,d,p,n,o))<l?u:l),f=d,m=p;return l}}]),t}(l(i(75)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=u(i(30)),n=u(i(3)),o=u(i(0)),a=u(i(1)),s=u(i(4)),l=u(i(5));function u(e){return e&&e.__esModule?e:{default:e}}var h=function(e){function t(e,i,r){(0,o.default)(this,t);var a=(0,s.default)(this,(t.__proto__||(0,n.default)(t)).call(this,e,i,r));return a._boundFunction=function(){a.positionBezierNode()},a.body.emitter.on("_repositionBezierNodes",a._boundFunction),a}return(0,l.default)(t,e),(0,a.default)(t,[{key:"setOptions",value:function(e){var t=!1;this.options.physics!==e.physics&&(t=!0),this.options=e,this.id=this.options.id,this.from=this.body.nodes[this.options.from],this.to=this.body.nodes[this.options.to],this.setupSupportNode(),this.connect(),!0===t&&(this.via.setOptions({physics:this.options.physics}),this.positionBezierNode())}},{key:"connect",value:function(){this.from=this.body.nodes[this.options.from],this.to=this.body.nodes[this.options.to],void 0===this.from||void 0===this.to||!1===this.options.physics?this.via.setOptions({physics:!1}):this.from.id===this.to.id?this.via.setOptions({physics:!1}):this.via.setOptions({physics:!0})}},{key:"cleanup",value:function(){return this.body.emitter.off("_repositionBezierNodes",this._boundFunction),void 0!==this.via&&(delete this.body.nodes[this.via.id],this.via=void 0,!0)}},{key:"setupSupportNode",value:function(){if(void 0===this.via){var e="edgeId:"+this.id,t=this.body.functions.createNode({id:e,shape:"circle",physics:!0,hidden:!0});this.body.nodes[e]=t,this.via=t,this.via.parentEdgeId=this.id,this.positionBezierNode()}}},{key:"positionBezierNode",value:function(){void 0!==this.via&&void 0!==this.from&&void 0!==this.to?(this.via.x=.5*(this.from.x+this.to.x),this.via.y=.5*(this.from.y+this.to.y)):void 0!==this.via&&(this.via.x=0,this.via.y=0)}},{key:"_line",value:function(e,t,i){this._bezierCurve(e,t,i)}},{key:"getViaNode",value:function(){return this.via}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.via,i=e,n=void 0,o=void 0;if(this.from===this.to){var a=this._getCircleData(this.from),s=(0,r.default)(a,3),l=s[0],u=s[1],h=s[2],c=2*Math.PI*(1-i);n=l+h*Math.sin(c),o=u+h-h*(1-Math.cos(c))}else n=Math.pow(1-i,2)*this.fromPoint.x+2*i*(1-i)*t.x+Math.pow(i,2)*this.toPoint.x,o=Math.pow(1-i,2)*this.fromPoint.y+2*i*(1-i)*t.y+Math.pow(i,2)*this.toPoint.y;return{x:n,y:o}}},{key:"_findBorderPosition",value:function(e,t){return this._findBorderPositionBezier(e,t,this.via)}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){return this._getDistanceToBezierEdge(e,t,i,r,n,o,this.via)}}]),t}(u(i(75)).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_line",value:function(e,t,i){this._bezierCurve(e,t,i)}},{key:"getViaNode",value:function(){return this._getViaCoordinates()}},{key:"_getViaCoordinates",value:function(){var e=void 0,t=void 0,i=this.options.smooth.roundness,r=this.options.smooth.type,n=Math.abs(this.from.x-this.to.x),o=Math.abs(this.from.y-this.to.y);if("discrete"===r||"diagonalCross"===r){var a=void 0,s=void 0;a=s=n<=o?i*o:i*n,this.from.x>this.to.x&&(a=-a),this.from.y>=this.to.y&&(s=-s),e=this.from.x+a,t=this.from.y+s,"discrete"===r&&(n<=o?e=n<i*o?this.from.x:e:t=o<i*n?this.from.y:t)}else if("straightCross"===r){var l=(1-i)*n,u=(1-i)*o;n<=o?(l=0,this.from.y<this.to.y&&(u=-u)):(this.from.x<this.to.x&&(l=-l),u=0),e=this.to.x+l,t=this.to.y+u}else if("horizontal"===r){var h=(1-i)*n;this.from.x<this.to.x&&(h=-h),e=this.to.x+h,t=this.from.y}else if("vertical"===r){var c=(1-i)*o;this.from.y<this.to.y&&(c=-c),e=this.from.x,t=this.to.y+c}else if("curvedCW"===r){n=this.to.x-this.from.x,o=this.from.y-this.to.y;var d=Math.sqrt(n*n+o*o),p=Math.PI,f=(Math.atan2(o,n)+(.5*i+.5)*p)%(2*p);e=this.from.x+(.5*i+.5)*d*Math.sin(f),t=this.from.y+(.5*i+.5)*d*Math.cos(f)}else if("curvedCCW"===r){n=this.to.x-this.from.x,o=this.from.y-this.to.y;var m=Math.sqrt(n*n+o*o),v=Math.PI,g=(Math.atan2(o,n)+(.5*-i+.5)*v)%(2*v);e=this.from.x+(.5*i+.5)*m*Math.sin(g),t=this.from.y+(.5*i+.5)*m*Math.cos(g)}else{var y=void 0,_=void 0;y=_=n<=o?i*o:i*n,this.from.x>this.to.x&&(y=-y),this.from.y>=this.to.y&&(_=-_),e=this.from.x+y,t=this.from.y+_,n<=o?e=this.from.x<=this.to.x?this.to.x<e?this.to.x:e:this.to.x>e?this.to.x:e:t=this.from.y>=this.to.y?this.to.y>t?this.to.y:t:this.to.y<t?this.to.y:t}return{x:e,y:t}}},{key:"_findBorderPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return this._findBorderPositionBezier(e,t,i.via)}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){var a=arguments.length>6&&void 0!==arguments[6]?arguments[6]:this._getViaCoordinates();return this._getDistanceToBezierEdge(e,t,i,r,n,o,a)}},{key:"getPoint",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._getViaCoordinates(),i=e;return{x:Math.pow(1-i,2)*this.fromPoint.x+2*i*(1-i)*t.x+Math.pow(i,2)*this.toPoint.x,y:Math.pow(1-i,2)*this.fromPoint.y+2*i*(1-i)*t.y+Math.pow(i,2)*this.toPoint.y}}}]),t}(l(i(75)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_line",value:function(e,t){e.beginPath(),e.moveTo(this.fromPoint.x,this.fromPoint.y),e.lineTo(this.toPoint.x,this.toPoint.y),this.enableShadow(e,t),e.stroke(),this.disableShadow(e,t)}},{key:"getViaNode",value:function(){}},{key:"getPoint",value:function(e){return{x:(1-e)*this.fromPoint.x+e*this.toPoint.x,y:(1-e)*this.fromPoint.y+e*this.toPoint.y}}},{key:"_findBorderPosition",value:function(e,t){var i=this.to,r=this.from;e.id===this.from.id&&(i=this.from,r=this.to);var n=Math.atan2(i.y-r.y,i.x-r.x),o=i.x-r.x,a=i.y-r.y,s=Math.sqrt(o*o+a*a),l=(s-e.distanceToBorder(t,n))/s,u={};return u.x=(1-l)*r.x+l*i.x,u.y=(1-l)*r.y+l*i.y,u}},{key:"_getDistanceToEdge",value:function(e,t,i,r,n,o){return this._getDistanceToLine(e,t,i,r,n,o)}}]),t}(l(i(118)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=a(i(8)),n=a(i(0)),o=a(i(1));function a(e){return e&&e.__esModule?e:{default:e}}var s=i(120).default,l=i(221).default,u=i(222).default,h=i(223).default,c=i(224).default,d=i(121).default,p=i(225).default,f=i(226).default,m=i(2),v=i(119).default,g=function(){function e(t){(0,n.default)(this,e),this.body=t,this.physicsBody={physicsNodeIndices:[],physicsEdgeIndices:[],forces:{},velocities:{}},this.physicsEnabled=!0,this.simulationInterval=1e3/60,this.requiresTimeout=!0,this.previousStates={},this.referenceState={},this.freezeCache={},this.renderTimer=void 0,this.adaptiveTimestep=!1,this.adaptiveTimestepEnabled=!1,this.adaptiveCounter=0,this.adaptiveInterval=3,this.stabilized=!1,this.startedStabilization=!1,this.stabilizationIterations=0,this.ready=!1,this.options={},this.defaultOptions={enabled:!0,barnesHut:{theta:.5,gravitationalConstant:-2e3,centralGravity:.3,springLength:95,springConstant:.04,damping:.09,avoidOverlap:0},forceAtlas2Based:{theta:.5,gravitationalConstant:-50,centralGravity:.01,springConstant:.08,springLength:100,damping:.4,avoidOverlap:0},repulsion:{centralGravity:.2,springLength:200,springConstant:.05,nodeDistance:100,damping:.09,avoidOverlap:0},hierarchicalRepulsion:{centralGravity:0,springLength:100,springConstant:.01,nodeDistance:120,damping:.09},maxVelocity:50,minVelocity:.75,solver:"barnesHut",stabilization:{enabled:!0,iterations:1e3,updateInterval:50,onlyDynamicEdges:!1,fit:!0},timestep:.5,adaptiveTimestep:!0},m.extend(this.options,this.defaultOptions),this.timestep=.5,this.layoutFailed=!1,this.bindEventListeners()}return(0,o.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("initPhysics",function(){e.initPhysics()}),this.body.emitter.on("_layoutFailed",function(){e.layoutFailed=!0}),this.body.emitter.on("resetPhysics",function(){e.stopSimulation(),e.ready=!1}),this.body.emitter.on("disablePhysics",function(){e.physicsEnabled=!1,e.stopSimulation()}),this.body.emitter.on("restorePhysics",function(){e.setOptions(e.options),!0===e.ready&&e.startSimulation()}),this.body.emitter.on("startSimulation",function(){!0===e.ready&&e.startSimulation()}),this.body.emitter.on("stopSimulation",function(){e.stopSimulation()}),this.body.emitter.on("destroy",function(){e.stopSimulation(!1),e.body.emitter.off()}),this.body.emitter.on("_dataChanged",function(){e.updatePhysicsData()})}},{key:"setOptions",value:function(e){void 0!==e&&(!1===e?(this.options.enabled=!1,this.physicsEnabled=!1,this.stopSimulation()):!0===e?(this.options.enabled=!0,this.physicsEnabled=!0,this.startSimulation()):(this.physicsEnabled=!0,m.selectiveNotDeepExtend(["stabilization"],this.options,e),m.mergeOptions(this.options,e,"stabilization"),void 0===e.enabled&&(this.options.enabled=!0),!1===this.options.enabled&&(this.physicsEnabled=!1,this.stopSimulation()),this.timestep=this.options.timestep)),this.init()}},{key:"init",value:function(){var e;"forceAtlas2Based"===this.options.solver?(e=this.options.forceAtlas2Based,this.nodesSolver=new p(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new f(this.body,this.physicsBody,e)):"repulsion"===this.options.solver?(e=this.options.repulsion,this.nodesSolver=new l(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)):"hierarchicalRepulsion"===this.options.solver?(e=this.options.hierarchicalRepulsion,this.nodesSolver=new u(this.body,this.physicsBody,e),this.edgesSolver=new c(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)):(e=this.options.barnesHut,this.nodesSolver=new s(this.body,this.physicsBody,e),this.edgesSolver=new h(this.body,this.physicsBody,e),this.gravitySolver=new d(this.body,this.physicsBody,e)),this.modelOptions=e}},{key:"initPhysics",value:function(){!0===this.physicsEnabled&&!0===this.options.enabled?!0===this.options.stabilization.enabled?this.stabilize():(this.stabilized=!1,this.ready=!0,this.body.emitter.emit("fit",{},this.layoutFailed),this.startSimulation()):(this.ready=!0,this.body.emitter.emit("fit"))}},{key:"startSimulation",value:function(){!0===this.physicsEnabled&&!0===this.options.enabled?(this.stabilized=!1,this.adaptiveTimestep=!1,this.body.emitter.emit("_resizeNodes"),void 0===this.viewFunction&&(this.viewFunction=this.simulationStep.bind(this),this.body.emitter.on("initRedraw",this.viewFunction),this.body.emitter.emit("_startRendering"))):this.body.emitter.emit("_redraw")}},{key:"stopSimulation",value:function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];this.stabilized=!0,!0===e&&this._emitStabilized(),void 0!==this.viewFunction&&(this.body.emitter.off("initRedraw",this.viewFunction),this.viewFunction=void 0,!0===e&&this.body.emitter.emit("_stopRendering"))}},{key:"simulationStep",value:function(){var e=Date.now();this.physicsTick(),(Date.now()-e<.4*this.simulationInterval||!0===this.runDoubleSpeed)&&!1===this.stabilized&&(this.physicsTick(),this.runDoubleSpeed=!0),!0===this.stabilized&&this.stopSimulation()}},{key:"_emitStabilized",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.stabilizationIterations;(this.stabilizationIterations>1||!0===this.startedStabilization)&&setTimeout(function(){e.body.emitter.emit("stabilized",{iterations:t}),e.startedStabilization=!1,e.stabilizationIterations=0},0)}},{key:"physicsStep",value:function(){this.gravitySolver.solve(),this.nodesSolver.solve(),this.edgesSolver.solve(),this.moveNodes()}},{key:"adjustTimeStep",value:function(){!0===this._evaluateStepQuality()?this.timestep=1.2*this.timestep:this.timestep/1.2<this.options.timestep?this.timestep=this.options.timestep:(this.adaptiveCounter=-1,this.timestep=Math.max(this.options.timestep,this.timestep/1.2))}},{key:"physicsTick",value:function(){if(this._startStabilizing(),!0!==this.stabilized){if(!0===this.adaptiveTimestep&&!0===this.adaptiveTimestepEnabled)this.adaptiveCounter%this.adaptiveInterval==0?(this.timestep=2*this.timestep,this.physicsStep(),this.revert(),this.timestep=.5*this.timestep,this.physicsStep(),this.physicsStep(),this.adjustTimeStep()):this.physicsStep(),this.adaptiveCounter+=1;else this.timestep=this.options.timestep,this.physicsStep();!0===this.stabilized&&this.revert(),this.stabilizationIterations++}}},{key:"updatePhysicsData",value:function(){this.physicsBody.forces={},this.physicsBody.physicsNodeIndices=[],this.physicsBody.physicsEdgeIndices=[];var e=this.body.nodes,t=this.body.edges;for(var i in e)e.hasOwnProperty(i)&&!0===e[i].options.physics&&this.physicsBody.physicsNodeIndices.push(e[i].id);for(var r in t)t.hasOwnProperty(r)&&!0===t[r].options.physics&&this.physicsBody.physicsEdgeIndices.push(t[r].id);for(var n=0;n<this.physicsBody.physicsNodeIndices.length;n++){var o=this.physicsBody.physicsNodeIndices[n];this.physicsBody.forces[o]={x:0,y:0},void 0===this.physicsBody.velocities[o]&&(this.physicsBody.velocities[o]={x:0,y:0})}for(var a in this.physicsBody.velocities)void 0===e[a]&&delete this.physicsBody.velocities[a]}},{key:"revert",value:function(){var e=(0,r.default)(this.previousStates),t=this.body.nodes,i=this.physicsBody.velocities;this.referenceState={};for(var n=0;n<e.length;n++){var o=e[n];void 0!==t[o]?!0===t[o].options.physics&&(this.referenceState[o]={positions:{x:t[o].x,y:t[o].y}},i[o].x=this.previousStates[o].vx,i[o].y=this.previousStates[o].vy,t[o].x=this.previousStates[o].x,t[o].y=this.previousStates[o].y):delete this.previousStates[o]}}},{key:"_evaluateStepQuality",value:function(){var e=void 0,t=void 0,i=this.body.nodes,r=this.referenceState;for(var n in this.referenceState)if(this.referenceState.hasOwnProperty(n)&&void 0!==i[n]&&(e=i[n].x-r[n].positions.x,t=i[n].y-r[n].positions.y,Math.sqrt(Math.pow(e,2)+Math.pow(t,2))>.3))return!1;return!0}},{key:"moveNodes",value:function(){for(var e=this.physicsBody.physicsNodeIndices,t=0,i=0,r=0;r<e.length;r++){var n=e[r],o=this._performStep(n);t=Math.max(t,o),i+=o}this.adaptiveTimestepEnabled=i/e.length<5,this.stabilized=t<this.options.minVelocity}},{key:"calculateComponentVelocity",value:function(e,t,i){e+=(t-this.modelOptions.damping*e)/i*this.timestep;var r=this.options.maxVelocity||1e9;return Math.abs(e)>r&&(e=e>0?r:-r),e}},{key:"_performStep",value:function(e){var t=this.body.nodes[e],i=this.physicsBody.forces[e],r=this.physicsBody.velocities[e];return this.previousStates[e]={x:t.x,y:t.y,vx:r.x,vy:r.y},!1===t.options.fixed.x?(r.x=this.calculateComponentVelocity(r.x,i.x,t.options.mass),t.x+=r.x*this.timestep):(i.x=0,r.x=0),!1===t.options.fixed.y?(r.y=this.calculateComponentVelocity(r.y,i.y,t.options.mass),t.y+=r.y*this.timestep):(i.y=0,r.y=0),Math.sqrt(Math.pow(r.x,2)+Math.pow(r.y,2))}},{key:"_freezeNodes",value:function(){var e=this.body.nodes;for(var t in e)if(e.hasOwnProperty(t)&&e[t].x&&e[t].y){var i=e[t].options.fixed;this.freezeCache[t]={x:i.x,y:i.y},i.x=!0,i.y=!0}}},{key:"_restoreFrozenNodes",value:function(){var e=this.body.nodes;for(var t in e)e.hasOwnProperty(t)&&void 0!==this.freezeCache[t]&&(e[t].options.fixed.x=this.freezeCache[t].x,e[t].options.fixed.y=this.freezeCache[t].y);this.freezeCache={}}},{key:"stabilize",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.options.stabilization.iterations;"number"!=typeof t&&(t=this.options.stabilization.iterations,console.log("The stabilize method needs a numeric amount of iterations. Switching to default: ",t)),0!==this.physicsBody.physicsNodeIndices.length?(this.adaptiveTimestep=this.options.adaptiveTimestep,this.body.emitter.emit("_resizeNodes"),this.stopSimulation(),this.stabilized=!1,this.body.emitter.emit("_blockRedraw"),this.targetIterations=t,!0===this.options.stabilization.onlyDynamicEdges&&this._freezeNodes(),this.stabilizationIterations=0,setTimeout(function(){return e._stabilizationBatch()},0)):this.ready=!0}},{key:"_startStabilizing",value:function(){return!0!==this.startedStabilization&&(this.body.emitter.emit("startStabilizing"),this.startedStabilization=!0,!0)}},{key:"_stabilizationBatch",value:function(){var e=this,t=function(){return!1===e.stabilized&&e.stabilizationIterations<e.targetIterations},i=function(){e.body.emitter.emit("stabilizationProgress",{iterations:e.stabilizationIterations,total:e.targetIterations})};this._startStabilizing()&&i();for(var r=0;t()&&r<this.options.stabilization.updateInterval;)this.physicsTick(),r++;i(),t()?setTimeout(this._stabilizationBatch.bind(this),0):this._finalizeStabilization()}},{key:"_finalizeStabilization",value:function(){this.body.emitter.emit("_allowRedraw"),!0===this.options.stabilization.fit&&this.body.emitter.emit("fit"),!0===this.options.stabilization.onlyDynamicEdges&&this._restoreFrozenNodes(),this.body.emitter.emit("stabilizationIterationsDone"),this.body.emitter.emit("_requestRedraw"),!0===this.stabilized?this._emitStabilized():this.startSimulation(),this.ready=!0}},{key:"_drawForces",value:function(e){for(var t=0;t<this.physicsBody.physicsNodeIndices.length;t++){var i=this.physicsBody.physicsNodeIndices[t],r=this.body.nodes[i],n=this.physicsBody.forces[i],o=Math.sqrt(Math.pow(n.x,2)+Math.pow(n.x,2)),a=Math.min(Math.max(5,o),15),s=3*a,l=m.HSVToHex((180-180*Math.min(1,Math.max(0,.03*o)))/360,1,1),u={x:r.x+20*n.x,y:r.y+20*n.y};e.lineWidth=a,e.strokeStyle=l,e.beginPath(),e.moveTo(r.x,r.y),e.lineTo(u.x,u.y),e.stroke();var h=Math.atan2(n.y,n.x);e.fillStyle=l,v.draw(e,{type:"arrow",point:u,angle:h,length:s}),e.fill()}}}]),e}();t.default=g},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e,t,i,r,n,o,a,s,l=this.body.nodes,u=this.physicsBody.physicsNodeIndices,h=this.physicsBody.forces,c=this.options.nodeDistance,d=-2/3/c,p=0;p<u.length-1;p++){a=l[u[p]];for(var f=p+1;f<u.length;f++)e=(s=l[u[f]]).x-a.x,t=s.y-a.y,0===(i=Math.sqrt(e*e+t*t))&&(e=i=.1*Math.random()),i<2*c&&(o=i<.5*c?1:d*i+4/3,r=e*(o/=i),n=t*o,h[a.id].x-=r,h[a.id].y-=n,h[s.id].x+=r,h[s.id].y+=n)}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){var e,t,i,r,n,o,a,s,l,u,h=this.body.nodes,c=this.physicsBody.physicsNodeIndices,d=this.physicsBody.forces,p=this.options.nodeDistance;for(l=0;l<c.length-1;l++)for(a=h[c[l]],u=l+1;u<c.length;u++)if(s=h[c[u]],a.level===s.level){e=s.x-a.x,t=s.y-a.y;o=(i=Math.sqrt(e*e+t*t))<p?-Math.pow(.05*i,2)+Math.pow(.05*p,2):0,0===i?i=.01:o/=i,r=e*o,n=t*o,d[a.id].x-=r,d[a.id].y-=n,d[s.id].x+=r,d[s.id].y+=n}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e=void 0,t=void 0,i=this.physicsBody.physicsEdgeIndices,r=this.body.edges,n=void 0,o=void 0,a=void 0,s=0;s<i.length;s++)!0===(t=r[i[s]]).connected&&t.toId!==t.fromId&&void 0!==this.body.nodes[t.toId]&&void 0!==this.body.nodes[t.fromId]&&(void 0!==t.edgeType.via?(e=void 0===t.options.length?this.options.springLength:t.options.length,n=t.to,o=t.edgeType.via,a=t.from,this._calculateSpringForce(n,o,.5*e),this._calculateSpringForce(o,a,.5*e)):(e=void 0===t.options.length?1.5*this.options.springLength:t.options.length,this._calculateSpringForce(t.from,t.to,e)))}},{key:"_calculateSpringForce",value:function(e,t,i){var r=e.x-t.x,n=e.y-t.y,o=Math.max(Math.sqrt(r*r+n*n),.01),a=this.options.springConstant*(i-o)/o,s=r*a,l=n*a;void 0!==this.physicsBody.forces[e.id]&&(this.physicsBody.forces[e.id].x+=s,this.physicsBody.forces[e.id].y+=l),void 0!==this.physicsBody.forces[t.id]&&(this.physicsBody.forces[t.id].x-=s,this.physicsBody.forces[t.id].y-=l)}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.physicsBody=i,this.setOptions(n)}return(0,n.default)(e,[{key:"setOptions",value:function(e){this.options=e}},{key:"solve",value:function(){for(var e,t,i,r,n,o,a,s,l,u,h=this.body.edges,c=this.physicsBody.physicsEdgeIndices,d=this.physicsBody.physicsNodeIndices,p=this.physicsBody.forces,f=0;f<d.length;f++){var m=d[f];p[m].springFx=0,p[m].springFy=0}for(var v=0;v<c.length;v++)!0===(t=h[c[v]]).connected&&(e=void 0===t.options.length?this.options.springLength:t.options.length,i=t.from.x-t.to.x,r=t.from.y-t.to.y,s=0===(s=Math.sqrt(i*i+r*r))?.01:s,n=i*(a=this.options.springConstant*(e-s)/s),o=r*a,t.to.level!=t.from.level?(void 0!==p[t.toId]&&(p[t.toId].springFx-=n,p[t.toId].springFy-=o),void 0!==p[t.fromId]&&(p[t.fromId].springFx+=n,p[t.fromId].springFy+=o)):(void 0!==p[t.toId]&&(p[t.toId].x-=.5*n,p[t.toId].y-=.5*o),void 0!==p[t.fromId]&&(p[t.fromId].x+=.5*n,p[t.fromId].y+=.5*o)));a=1;for(var g=0;g<d.length;g++){var y=d[g];l=Math.min(a,Math.max(-a,p[y].springFx)),u=Math.min(a,Math.max(-a,p[y].springFy)),p[y].x+=l,p[y].y+=u}for(var _=0,b=0,x=0;x<d.length;x++){var w=d[x];_+=p[w].x,b+=p[w].y}for(var S=_/d.length,M=b/d.length,T=0;T<d.length;T++){var A=d[T];p[A].x-=S,p[A].y-=M}}}]),e}();t.default=a},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_calculateForces",value:function(e,t,i,r,n){0===e&&(t=e=.1*Math.random()),this.overlapAvoidanceFactor<1&&r.shape.radius&&(e=Math.max(.1+this.overlapAvoidanceFactor*r.shape.radius,e-r.shape.radius));var o=r.edges.length+1,a=this.options.gravitationalConstant*n.mass*r.options.mass*o/Math.pow(e,2),s=t*a,l=i*a;this.physicsBody.forces[r.id].x+=s,this.physicsBody.forces[r.id].y+=l}}]),t}(l(i(120)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(e){function t(e,i,o){return(0,n.default)(this,t),(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o))}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_calculateForces",value:function(e,t,i,r,n){if(e>0){var o=n.edges.length+1,a=this.options.centralGravity*o*n.options.mass;r[n.id].x=t*a,r[n.id].y=i*a}}}]),t}(l(i(121)).default);t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=s(i(8)),n=s(i(6)),o=s(i(0)),a=s(i(1));function s(e){return e&&e.__esModule?e:{default:e}}var l=i(2),u=i(76).default,h=i(228).default,c=i(74).default,d=i(47).default,p=function(){function e(t){var i=this;(0,o.default)(this,e),this.body=t,this.clusteredNodes={},this.clusteredEdges={},this.options={},this.defaultOptions={},l.extend(this.options,this.defaultOptions),this.body.emitter.on("_resetData",function(){i.clusteredNodes={},i.clusteredEdges={}})}return(0,a.default)(e,[{key:"clusterByHubsize",value:function(e,t){void 0===e?e=this._getHubSize():"object"===(void 0===e?"undefined":(0,n.default)(e))&&(t=this._checkOptions(e),e=this._getHubSize());for(var i=[],r=0;r<this.body.nodeIndices.length;r++){var o=this.body.nodes[this.body.nodeIndices[r]];o.edges.length>=e&&i.push(o.id)}for(var a=0;a<i.length;a++)this.clusterByConnection(i[a],t,!0);this.body.emitter.emit("_dataChanged")}},{key:"cluster",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},i=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(void 0===t.joinCondition)throw new Error("Cannot call clusterByNodeData without a joinCondition function in the options.");t=this._checkOptions(t);var r={},n={};l.forEach(this.body.nodes,function(i,o){var a=u.cloneOptions(i);!0===t.joinCondition(a)&&(r[o]=i,l.forEach(i.edges,function(t){void 0===e.clusteredEdges[t.id]&&(n[t.id]=t)}))}),this._cluster(r,n,t,i)}},{key:"clusterByEdgeCount",value:function(e,t){var i=this,n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];t=this._checkOptions(t);for(var o=[],a={},s=void 0,l=void 0,h=void 0,c=function(n){var c={},d={},m=i.body.nodeIndices[n],v=i.body.nodes[m];if(void 0===a[m]){h=0,l=[];for(var g=0;g<v.edges.length;g++)s=v.edges[g],void 0===i.clusteredEdges[s.id]&&(s.toId!==s.fromId&&h++,l.push(s));if(h===e){p=function(e){if(void 0===t.joinCondition||null===t.joinCondition)return!0;var i=u.cloneOptions(e);return t.joinCondition(i)};for(var y=!0,_=0;_<l.length;_++){s=l[_];var b=i._getConnectedId(s,m);if(!p(v)){y=!1;break}d[s.id]=s,c[m]=v,c[b]=i.body.nodes[b],a[m]=!0}if((0,r.default)(c).length>0&&(0,r.default)(d).length>0&&!0===y)if(void 0!==(f=function(){for(var e=0;e<o.length;++e)for(var t in c)if(void 0!==o[e].nodes[t])return o[e]}())){for(var x in c)void 0===f.nodes[x]&&(f.nodes[x]=c[x]);for(var w in d)void 0===f.edges[w]&&(f.edges[w]=d[w])}else o.push({nodes:c,edges:d})}}},d=0;d<this.body.nodeIndices.length;d++){var p,f;c(d)}for(d=0;d<o.length;d++)this._cluster(o[d].nodes,o[d].edges,t,!1);!0===n&&this.body.emitter.emit("_dataChanged")}},{key:"clusterOutliers",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.clusterByEdgeCount(1,e,t)}},{key:"clusterBridges",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.clusterByEdgeCount(2,e,t)}},{key:"clusterByConnection",value:function(e,t){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(void 0===e)throw new Error("No nodeId supplied to clusterByConnection!");if(void 0===this.body.nodes[e])throw new Error("The nodeId given to clusterByConnection does not exist!");var n=this.body.nodes[e];void 0===(t=this._checkOptions(t,n)).clusterNodeProperties.x&&(t.clusterNodeProperties.x=n.x),void 0===t.clusterNodeProperties.y&&(t.clusterNodeProperties.y=n.y),void 0===t.clusterNodeProperties.fixed&&(t.clusterNodeProperties.fixed={},t.clusterNodeProperties.fixed.x=n.options.fixed.x,t.clusterNodeProperties.fixed.y=n.options.fixed.y);var o={},a={},s=n.id,l=u.cloneOptions(n);o[s]=n;for(var h=0;h<n.edges.length;h++){var c=n.edges[h];if(void 0===this.clusteredEdges[c.id]){var d=this._getConnectedId(c,s);if(void 0===this.clusteredNodes[d])if(d!==s)if(void 0===t.joinCondition)a[c.id]=c,o[d]=this.body.nodes[d];else{var p=u.cloneOptions(this.body.nodes[d]);!0===t.joinCondition(l,p)&&(a[c.id]=c,o[d]=this.body.nodes[d])}else a[c.id]=c}}var f=(0,r.default)(o).map(function(e){return o[e].id});for(m in o)if(o.hasOwnProperty(m))for(var m=o[m],v=0;v<m.edges.length;v++){var g=m.edges[v];f.indexOf(this._getConnectedId(g,m.id))>-1&&(a[g.id]=g)}this._cluster(o,a,t,i)}},{key:"_createClusterEdges",value:function(e,t,i,n){for(var o=void 0,a=void 0,s=void 0,l=void 0,u=void 0,h=void 0,c=(0,r.default)(e),d=[],p=0;p<c.length;p++){s=e[a=c[p]];for(var f=0;f<s.edges.length;f++)o=s.edges[f],void 0===this.clusteredEdges[o.id]&&(o.toId==o.fromId?t[o.id]=o:o.toId==a?(l=i.id,h=u=o.fromId):(l=o.toId,u=i.id,h=l),void 0===e[h]&&d.push({edge:o,fromId:u,toId:l}))}for(var m=[],v=function(e){for(var t=0;t<m.length;t++){var i=m[t],r=e.fromId===i.fromId&&e.toId===i.toId,n=e.fromId===i.toId&&e.toId===i.fromId;if(r||n)return i}return null},g=0;g<d.length;g++){var y=d[g],_=y.edge,b=v(y);null===b?(b=this._createClusteredEdge(y.fromId,y.toId,_,n),m.push(b)):b.clusteringEdgeReplacingIds.push(_.id),this.body.edges[_.id].edgeReplacedById=b.id,this._backupEdgeOptions(_),_.setOptions({physics:!1})}}},{key:"_checkOptions",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return void 0===e.clusterEdgeProperties&&(e.clusterEdgeProperties={}),void 0===e.clusterNodeProperties&&(e.clusterNodeProperties={}),e}},{key:"_cluster",value:function(e,t,i){var n=!(arguments.length>3&&void 0!==arguments[3])||arguments[3],o=[];for(var a in e)e.hasOwnProperty(a)&&void 0!==this.clusteredNodes[a]&&o.push(a);for(var s=0;s<o.length;++s)delete e[o[s]];if(0!=(0,r.default)(e).length&&(1!=(0,r.default)(e).length||1==i.clusterNodeProperties.allowSingleNodeCluster)){var c=l.deepExtend({},i.clusterNodeProperties);if(void 0!==i.processProperties){var d=[];for(var p in e)if(e.hasOwnProperty(p)){var f=u.cloneOptions(e[p]);d.push(f)}var m=[];for(var v in t)if(t.hasOwnProperty(v)&&"clusterEdge:"!==v.substr(0,12)){var g=u.cloneOptions(t[v],"edge");m.push(g)}if(!(c=i.processProperties(c,d,m)))throw new Error("The processProperties function does not return properties!")}void 0===c.id&&(c.id="cluster:"+l.randomUUID());var y=c.id;void 0===c.label&&(c.label="cluster");var _=void 0;void 0===c.x&&(_=this._getClusterPosition(e),c.x=_.x),void 0===c.y&&(void 0===_&&(_=this._getClusterPosition(e)),c.y=_.y),c.id=y;var b=this.body.functions.createNode(c,h);b.containedNodes=e,b.containedEdges=t,b.clusterEdgeProperties=i.clusterEdgeProperties,this.body.nodes[c.id]=b,this._clusterEdges(e,t,c,i.clusterEdgeProperties),c.id=void 0,!0===n&&this.body.emitter.emit("_dataChanged")}}},{key:"_backupEdgeOptions",value:function(e){void 0===this.clusteredEdges[e.id]&&(this.clusteredEdges[e.id]={physics:e.options.physics})}},{key:"_restoreEdge",value:function(e){var t=this.clusteredEdges[e.id];void 0!==t&&(e.setOptions({physics:t.physics}),delete this.clusteredEdges[e.id])}},{key:"isCluster",value:function(e){return void 0!==this.body.nodes[e]?!0===this.body.nodes[e].isCluster:(console.log("Node does not exist."),!1)}},{key:"_getClusterPosition",value:function(e){for(var t=(0,r.default)(e),i=e[t[0]].x,n=e[t[0]].x,o=e[t[0]].y,a=e[t[0]].y,s=void 0,l=1;l<t.length;l++)i=(s=e[t[l]]).x<i?s.x:i,n=s.x>n?s.x:n,o=s.y<o?s.y:o,a=s.y>a?s.y:a;return{x:.5*(i+n),y:.5*(o+a)}}},{key:"openCluster",value:function(e,t){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(void 0===e)throw new Error("No clusterNodeId supplied to openCluster.");var r=this.body.nodes[e];if(void 0===r)throw new Error("The clusterNodeId supplied to openCluster does not exist.");if(!0!==r.isCluster||void 0===r.containedNodes||void 0===r.containedEdges)throw new Error("The node:"+e+" is not a valid cluster.");var n=this.findNode(e),o=n.indexOf(e)-1;if(o>=0){var a=n[o];return this.body.nodes[a]._openChildCluster(e),delete this.body.nodes[e],void(!0===i&&this.body.emitter.emit("_dataChanged"))}var s=r.containedNodes,u=r.containedEdges;if(void 0!==t&&void 0!==t.releaseFunction&&"function"==typeof t.releaseFunction){var h={},c={x:r.x,y:r.y};for(var d in s)if(s.hasOwnProperty(d)){var p=this.body.nodes[d];h[d]={x:p.x,y:p.y}}var f=t.releaseFunction(c,h);for(var m in s)if(s.hasOwnProperty(m)){var v=this.body.nodes[m];void 0!==f[m]&&(v.x=void 0===f[m].x?r.x:f[m].x,v.y=void 0===f[m].y?r.y:f[m].y)}}else l.forEach(s,function(e){!1===e.options.fixed.x&&(e.x=r.x),!1===e.options.fixed.y&&(e.y=r.y)});for(var g in s)if(s.hasOwnProperty(g)){var y=this.body.nodes[g];y.vx=r.vx,y.vy=r.vy,y.setOptions({physics:!0}),delete this.clusteredNodes[g]}for(var _=[],b=0;b<r.edges.length;b++)_.push(r.edges[b]);for(var x=0;x<_.length;x++){for(var w=_[x],S=this._getConnectedId(w,e),M=this.clusteredNodes[S],T=0;T<w.clusteringEdgeReplacingIds.length;T++){var A=w.clusteringEdgeReplacingIds[T],C=this.body.edges[A];if(void 0!==C)if(void 0!==M){var L=this.body.nodes[M.clusterId];L.containedEdges[C.id]=C,delete u[C.id];var N=C.fromId,k=C.toId;C.toId==S?k=M.clusterId:N=M.clusterId,this._createClusteredEdge(N,k,C,L.clusterEdgeProperties,{hidden:!1,physics:!0})}else this._restoreEdge(C)}w.remove()}for(var P in u)u.hasOwnProperty(P)&&this._restoreEdge(u[P]);delete this.body.nodes[e],!0===i&&this.body.emitter.emit("_dataChanged")}},{key:"getNodesInCluster",value:function(e){var t=[];if(!0===this.isCluster(e)){var i=this.body.nodes[e].containedNodes;for(var r in i)i.hasOwnProperty(r)&&t.push(this.body.nodes[r].id)}return t}},{key:"findNode",value:function(e){for(var t=[],i=0,r=void 0;void 0!==this.clusteredNodes[e]&&i<100;){if(void 0===(r=this.body.nodes[e]))return[];t.push(r.id),e=this.clusteredNodes[e].clusterId,i++}return void 0===(r=this.body.nodes[e])?[]:(t.push(r.id),t.reverse(),t)}},{key:"updateClusteredNode",value:function(e,t){if(void 0===e)throw new Error("No clusteredNodeId supplied to updateClusteredNode.");if(void 0===t)throw new Error("No newOptions supplied to updateClusteredNode.");if(void 0===this.body.nodes[e])throw new Error("The clusteredNodeId supplied to updateClusteredNode does not exist.");this.body.nodes[e].setOptions(t),this.body.emitter.emit("_dataChanged")}},{key:"updateEdge",value:function(e,t){if(void 0===e)throw new Error("No startEdgeId supplied to updateEdge.");if(void 0===t)throw new Error("No newOptions supplied to updateEdge.");if(void 0===this.body.edges[e])throw new Error("The startEdgeId supplied to updateEdge does not exist.");for(var i=this.getClusteredEdges(e),r=0;r<i.length;r++){this.body.edges[i[r]].setOptions(t)}this.body.emitter.emit("_dataChanged")}},{key:"getClusteredEdges",value:function(e){for(var t=[],i=0;void 0!==e&&void 0!==this.body.edges[e]&&i<100;)t.push(this.body.edges[e].id),e=this.body.edges[e].edgeReplacedById,i++;return t.reverse(),t}},{key:"getBaseEdge",value:function(e){return this.getBaseEdges(e)[0]}},{key:"getBaseEdges",value:function(e){for(var t=[e],i=[],r=[],n=0;t.length>0&&n<100;){var o=t.pop();if(void 0!==o){var a=this.body.edges[o];if(void 0!==a){n++;var s=a.clusteringEdgeReplacingIds;if(void 0===s)r.push(o);else for(var l=0;l<s.length;++l){var u=s[l];-1===t.indexOf(s)&&-1===i.indexOf(s)&&t.push(u)}i.push(o)}}}return r}},{key:"_getConnectedId",value:function(e,t){return e.toId!=t?e.toId:(e.fromId,e.fromId)}},{key:"_getHubSize",value:function(){for(var e=0,t=0,i=0,r=0,n=0;n<this.body.nodeIndices.length;n++){var o=this.body.nodes[this.body.nodeIndices[n]];o.edges.length>r&&(r=o.edges.length),e+=o.edges.length,t+=Math.pow(o.edges.length,2),i+=1}e/=i;var a=(t/=i)-Math.pow(e,2),s=Math.sqrt(a),l=Math.floor(e+2*s);return l>r&&(l=r),l}},{key:"_createClusteredEdge",value:function(e,t,i,r,n){var o=u.cloneOptions(i,"edge");l.deepExtend(o,r),o.from=e,o.to=t,o.id="clusterEdge:"+l.randomUUID(),void 0!==n&&l.deepExtend(o,n);var a=this.body.functions.createEdge(o);return a.clusteringEdgeReplacingIds=[i.id],a.connect(),this.body.edges[a.id]=a,a}},{key:"_clusterEdges",value:function(e,t,i,r){if(t instanceof c){var n=t,o={};o[n.id]=n,t=o}if(e instanceof d){var a=e,s={};s[a.id]=a,e=s}if(null==i)throw new Error("_clusterEdges: parameter clusterNode required");for(var l in void 0===r&&(r=i.clusterEdgeProperties),this._createClusterEdges(e,t,i,r),t)if(t.hasOwnProperty(l)&&void 0!==this.body.edges[l]){var u=this.body.edges[l];this._backupEdgeOptions(u),u.setOptions({physics:!1})}for(var h in e)e.hasOwnProperty(h)&&(this.clusteredNodes[h]={clusterId:i.id,node:this.body.nodes[h]},this.body.nodes[h].setOptions({physics:!1}))}},{key:"_getClusterNodeForNode",value:function(e){if(void 0!==e){var t=this.clusteredNodes[e];if(void 0!==t){var i=t.clusterId;if(void 0!==i)return this.body.nodes[i]}}}},{key:"_filter",value:function(e,t){var i=[];return l.forEach(e,function(e){t(e)&&i.push(e)}),i}},{key:"_updateState",value:function(){var e=this,t=void 0,i=[],n=[],o=function(t){l.forEach(e.body.nodes,function(e){!0===e.isCluster&&t(e)})};for(t in this.clusteredNodes){if(this.clusteredNodes.hasOwnProperty(t))void 0===this.body.nodes[t]&&i.push(t)}o(function(e){for(var t=0;t<i.length;t++)delete e.containedNodes[i[t]]});for(var a=0;a<i.length;a++)delete this.clusteredNodes[i[a]];l.forEach(this.clusteredEdges,function(t){var i=e.body.edges[t];void 0!==i&&i.endPointsValid()||n.push(t)}),o(function(e){l.forEach(e.containedEdges,function(e,t){e.endPointsValid()||-1!==n.indexOf(t)||n.push(t)})}),l.forEach(this.body.edges,function(t,i){var r=!0,o=t.clusteringEdgeReplacingIds;if(void 0!==o){var a=0;l.forEach(o,function(t){var i=e.body.edges[t];void 0!==i&&i.endPointsValid()&&(a+=1)}),r=a>0}t.endPointsValid()&&r||n.push(i)}),o(function(t){l.forEach(n,function(i){delete t.containedEdges[i],l.forEach(t.edges,function(r,o){r.id!==i?r.clusteringEdgeReplacingIds=e._filter(r.clusteringEdgeReplacingIds,function(e){return-1===n.indexOf(e)}):t.edges[o]=null}),t.edges=e._filter(t.edges,function(e){return null!==e})})}),l.forEach(n,function(t){delete e.clusteredEdges[t]}),l.forEach(n,function(t){delete e.body.edges[t]});var s=(0,r.default)(this.body.edges);l.forEach(s,function(t){var i=e.body.edges[t],r=e._isClusteredNode(i.fromId)||e._isClusteredNode(i.toId);if(r!==e._isClusteredEdge(i.id)){if(!r)throw new Error("remove edge from clustering not implemented!");var n=e._getClusterNodeForNode(i.fromId);void 0!==n&&e._clusterEdges(e.body.nodes[i.fromId],i,n);var o=e._getClusterNodeForNode(i.toId);void 0!==o&&e._clusterEdges(e.body.nodes[i.toId],i,o)}});for(var u=!1,h=!0,c=function(){var t=[];o(function(e){var i=(0,r.default)(e.containedNodes).length,n=!0===e.options.allowSingleNodeCluster;(n&&i<1||!n&&i<2)&&t.push(e.id)});for(var i=0;i<t.length;++i)e.openCluster(t[i],{},!1);h=t.length>0,u=u||h};h;)c();u&&this._updateState()}},{key:"_isClusteredNode",value:function(e){return void 0!==this.clusteredNodes[e]}},{key:"_isClusteredEdge",value:function(e){return void 0!==this.clusteredEdges[e]}}]),e}();t.default=p},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(3)),n=l(i(0)),o=l(i(1)),a=l(i(4)),s=l(i(5));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=function(e){function t(e,i,o,s,l,u){(0,n.default)(this,t);var h=(0,a.default)(this,(t.__proto__||(0,r.default)(t)).call(this,e,i,o,s,l,u));return h.isCluster=!0,h.containedNodes={},h.containedEdges={},h}return(0,s.default)(t,e),(0,o.default)(t,[{key:"_openChildCluster",value:function(e){var t=this,i=this.body.nodes[e];if(void 0===this.containedNodes[e])throw new Error("node with id: "+e+" not in current cluster");if(!i.isCluster)throw new Error("node with id: "+e+" is not a cluster");delete this.containedNodes[e],u.forEach(i.edges,function(e){delete t.containedEdges[e.id]}),u.forEach(i.containedNodes,function(e,i){t.containedNodes[i]=e}),i.containedNodes={},u.forEach(i.containedEdges,function(e,i){t.containedEdges[i]=e}),i.containedEdges={},u.forEach(i.edges,function(e){u.forEach(t.edges,function(i){var r=i.clusteringEdgeReplacingIds.indexOf(e.id);-1!==r&&(u.forEach(e.clusteringEdgeReplacingIds,function(e){i.clusteringEdgeReplacingIds.push(e),t.body.edges[e].edgeReplacedById=i.id}),i.clusteringEdgeReplacingIds.splice(r,1))})}),i.edges=[]}}]),t}(i(47).default);t.default=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=function(){function e(t,i){var n;(0,r.default)(this,e),void 0!==window&&(n=window.requestAnimationFrame||window.mozRequestAnimationFrame||window.webkitRequestAnimationFrame||window.msRequestAnimationFrame),window.requestAnimationFrame=void 0===n?function(e){e()}:n,this.body=t,this.canvas=i,this.redrawRequested=!1,this.renderTimer=void 0,this.requiresTimeout=!0,this.renderingActive=!1,this.renderRequests=0,this.allowRedraw=!0,this.dragging=!1,this.options={},this.defaultOptions={hideEdgesOnDrag:!1,hideNodesOnDrag:!1},a.extend(this.options,this.defaultOptions),this._determineBrowserMethod(),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("dragStart",function(){e.dragging=!0}),this.body.emitter.on("dragEnd",function(){e.dragging=!1}),this.body.emitter.on("_resizeNodes",function(){e._resizeNodes()}),this.body.emitter.on("_redraw",function(){!1===e.renderingActive&&e._redraw()}),this.body.emitter.on("_blockRedraw",function(){e.allowRedraw=!1}),this.body.emitter.on("_allowRedraw",function(){e.allowRedraw=!0,e.redrawRequested=!1}),this.body.emitter.on("_requestRedraw",this._requestRedraw.bind(this)),this.body.emitter.on("_startRendering",function(){e.renderRequests+=1,e.renderingActive=!0,e._startRendering()}),this.body.emitter.on("_stopRendering",function(){e.renderRequests-=1,e.renderingActive=e.renderRequests>0,e.renderTimer=void 0}),this.body.emitter.on("destroy",function(){e.renderRequests=0,e.allowRedraw=!1,e.renderingActive=!1,!0===e.requiresTimeout?clearTimeout(e.renderTimer):window.cancelAnimationFrame(e.renderTimer),e.body.emitter.off()})}},{key:"setOptions",value:function(e){if(void 0!==e){a.selectiveDeepExtend(["hideEdgesOnDrag","hideNodesOnDrag"],this.options,e)}}},{key:"_requestNextFrame",value:function(e,t){if("undefined"!=typeof window){var i=void 0,r=window;return!0===this.requiresTimeout?i=r.setTimeout(e,t):r.requestAnimationFrame&&(i=r.requestAnimationFrame(e)),i}}},{key:"_startRendering",value:function(){!0===this.renderingActive&&void 0===this.renderTimer&&(this.renderTimer=this._requestNextFrame(this._renderStep.bind(this),this.simulationInterval))}},{key:"_renderStep",value:function(){!0===this.renderingActive&&(this.renderTimer=void 0,!0===this.requiresTimeout&&this._startRendering(),this._redraw(),!1===this.requiresTimeout&&this._startRendering())}},{key:"redraw",value:function(){this.body.emitter.emit("setSize"),this._redraw()}},{key:"_requestRedraw",value:function(){var e=this;!0!==this.redrawRequested&&!1===this.renderingActive&&!0===this.allowRedraw&&(this.redrawRequested=!0,this._requestNextFrame(function(){e._redraw(!1)},0))}},{key:"_redraw",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];if(!0===this.allowRedraw){this.body.emitter.emit("initRedraw"),this.redrawRequested=!1,0!==this.canvas.frame.canvas.width&&0!==this.canvas.frame.canvas.height||this.canvas.setSize(),this.canvas.setTransform();var t=this.canvas.getContext(),i=this.canvas.frame.canvas.clientWidth,r=this.canvas.frame.canvas.clientHeight;if(t.clearRect(0,0,i,r),0===this.canvas.frame.clientWidth)return;t.save(),t.translate(this.body.view.translation.x,this.body.view.translation.y),t.scale(this.body.view.scale,this.body.view.scale),t.beginPath(),this.body.emitter.emit("beforeDrawing",t),t.closePath(),!1===e&&(!1===this.dragging||!0===this.dragging&&!1===this.options.hideEdgesOnDrag)&&this._drawEdges(t),(!1===this.dragging||!0===this.dragging&&!1===this.options.hideNodesOnDrag)&&this._drawNodes(t,e),t.beginPath(),this.body.emitter.emit("afterDrawing",t),t.closePath(),t.restore(),!0===e&&t.clearRect(0,0,i,r)}}},{key:"_resizeNodes",value:function(){this.canvas.setTransform();var e=this.canvas.getContext();e.save(),e.translate(this.body.view.translation.x,this.body.view.translation.y),e.scale(this.body.view.scale,this.body.view.scale);var t=this.body.nodes,i=void 0;for(var r in t)t.hasOwnProperty(r)&&((i=t[r]).resize(e),i.updateBoundingBox(e,i.selected));e.restore()}},{key:"_drawNodes",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=this.body.nodes,r=this.body.nodeIndices,n=void 0,o=[],a=this.canvas.DOMtoCanvas({x:-20,y:-20}),s=this.canvas.DOMtoCanvas({x:this.canvas.frame.canvas.clientWidth+20,y:this.canvas.frame.canvas.clientHeight+20}),l={top:a.y,left:a.x,bottom:s.y,right:s.x},u=0;u<r.length;u++)(n=i[r[u]]).isSelected()?o.push(r[u]):!0===t?n.draw(e):!0===n.isBoundingBoxOverlappingWith(l)?n.draw(e):n.updateBoundingBox(e,n.selected);for(var h=0;h<o.length;h++)(n=i[o[h]]).draw(e)}},{key:"_drawEdges",value:function(e){for(var t=this.body.edges,i=this.body.edgeIndices,r=void 0,n=0;n<i.length;n++)!0===(r=t[i[n]]).connected&&r.draw(e)}},{key:"_determineBrowserMethod",value:function(){if("undefined"!=typeof window){var e=navigator.userAgent.toLowerCase();this.requiresTimeout=!1,-1!=e.indexOf("msie 9.0")?this.requiresTimeout=!0:-1!=e.indexOf("safari")&&e.indexOf("chrome")<=-1&&(this.requiresTimeout=!0)}else this.requiresTimeout=!0}}]),e}();t.default=s},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(10),s=i(37),l=i(2),u=function(){function e(t){(0,r.default)(this,e),this.body=t,this.pixelRatio=1,this.resizeTimer=void 0,this.resizeFunction=this._onResize.bind(this),this.cameraState={},this.initialized=!1,this.canvasViewCenter={},this.options={},this.defaultOptions={autoResize:!0,height:"100%",width:"100%"},l.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.once("resize",function(t){0!==t.width&&(e.body.view.translation.x=.5*t.width),0!==t.height&&(e.body.view.translation.y=.5*t.height)}),this.body.emitter.on("setSize",this.setSize.bind(this)),this.body.emitter.on("destroy",function(){e.hammerFrame.destroy(),e.hammer.destroy(),e._cleanUp()})}},{key:"setOptions",value:function(e){var t=this;if(void 0!==e){l.selectiveDeepExtend(["width","height","autoResize"],this.options,e)}!0===this.options.autoResize&&(this._cleanUp(),this.resizeTimer=setInterval(function(){!0===t.setSize()&&t.body.emitter.emit("_requestRedraw")},1e3),this.resizeFunction=this._onResize.bind(this),l.addEventListener(window,"resize",this.resizeFunction))}},{key:"_cleanUp",value:function(){void 0!==this.resizeTimer&&clearInterval(this.resizeTimer),l.removeEventListener(window,"resize",this.resizeFunction),this.resizeFunction=void 0}},{key:"_onResize",value:function(){this.setSize(),this.body.emitter.emit("_redraw")}},{key:"_getCameraState",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.pixelRatio;!0===this.initialized&&(this.cameraState.previousWidth=this.frame.canvas.width/e,this.cameraState.previousHeight=this.frame.canvas.height/e,this.cameraState.scale=this.body.view.scale,this.cameraState.position=this.DOMtoCanvas({x:.5*this.frame.canvas.width/e,y:.5*this.frame.canvas.height/e}))}},{key:"_setCameraState",value:function(){if(void 0!==this.cameraState.scale&&0!==this.frame.canvas.clientWidth&&0!==this.frame.canvas.clientHeight&&0!==this.pixelRatio&&this.cameraState.previousWidth>0){var e=this.frame.canvas.width/this.pixelRatio/this.cameraState.previousWidth,t=this.frame.canvas.height/this.pixelRatio/this.cameraState.previousHeight,i=this.cameraState.scale;1!=e&&1!=t?i=.5*this.cameraState.scale*(e+t):1!=e?i=this.cameraState.scale*e:1!=t&&(i=this.cameraState.scale*t),this.body.view.scale=i;var r=this.DOMtoCanvas({x:.5*this.frame.canvas.clientWidth,y:.5*this.frame.canvas.clientHeight}),n={x:r.x-this.cameraState.position.x,y:r.y-this.cameraState.position.y};this.body.view.translation.x+=n.x*this.body.view.scale,this.body.view.translation.y+=n.y*this.body.view.scale}}},{key:"_prepareValue",value:function(e){if("number"==typeof e)return e+"px";if("string"==typeof e){if(-1!==e.indexOf("%")||-1!==e.indexOf("px"))return e;if(-1===e.indexOf("%"))return e+"px"}throw new Error("Could not use the value supplied for width or height:"+e)}},{key:"_create",value:function(){for(;this.body.container.hasChildNodes();)this.body.container.removeChild(this.body.container.firstChild);if(this.frame=document.createElement("div"),this.frame.className="vis-network",this.frame.style.position="relative",this.frame.style.overflow="hidden",this.frame.tabIndex=900,this.frame.canvas=document.createElement("canvas"),this.frame.canvas.style.position="relative",this.frame.appendChild(this.frame.canvas),this.frame.canvas.getContext)this._setPixelRatio(),this.setTransform();else{var e=document.createElement("DIV");e.style.color="red",e.style.fontWeight="bold",e.style.padding="10px",e.innerHTML="Error: your browser does not support HTML canvas",this.frame.canvas.appendChild(e)}this.body.container.appendChild(this.frame),this.body.view.scale=1,this.body.view.translation={x:.5*this.frame.canvas.clientWidth,y:.5*this.frame.canvas.clientHeight},this._bindHammer()}},{key:"_bindHammer",value:function(){var e=this;void 0!==this.hammer&&this.hammer.destroy(),this.drag={},this.pinch={},this.hammer=new a(this.frame.canvas),this.hammer.get("pinch").set({enable:!0}),this.hammer.get("pan").set({threshold:5,direction:a.DIRECTION_ALL}),s.onTouch(this.hammer,function(t){e.body.eventListeners.onTouch(t)}),this.hammer.on("tap",function(t){e.body.eventListeners.onTap(t)}),this.hammer.on("doubletap",function(t){e.body.eventListeners.onDoubleTap(t)}),this.hammer.on("press",function(t){e.body.eventListeners.onHold(t)}),this.hammer.on("panstart",function(t){e.body.eventListeners.onDragStart(t)}),this.hammer.on("panmove",function(t){e.body.eventListeners.onDrag(t)}),this.hammer.on("panend",function(t){e.body.eventListeners.onDragEnd(t)}),this.hammer.on("pinch",function(t){e.body.eventListeners.onPinch(t)}),this.frame.canvas.addEventListener("mousewheel",function(t){e.body.eventListeners.onMouseWheel(t)}),this.frame.canvas.addEventListener("DOMMouseScroll",function(t){e.body.eventListeners.onMouseWheel(t)}),this.frame.canvas.addEventListener("mousemove",function(t){e.body.eventListeners.onMouseMove(t)}),this.frame.canvas.addEventListener("contextmenu",function(t){e.body.eventListeners.onContext(t)}),this.hammerFrame=new a(this.frame),s.onRelease(this.hammerFrame,function(t){e.body.eventListeners.onRelease(t)})}},{key:"setSize",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.options.width,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.options.height;e=this._prepareValue(e),t=this._prepareValue(t);var i=!1,r=this.frame.canvas.width,n=this.frame.canvas.height,o=this.pixelRatio;if(this._setPixelRatio(),e!=this.options.width||t!=this.options.height||this.frame.style.width!=e||this.frame.style.height!=t)this._getCameraState(o),this.frame.style.width=e,this.frame.style.height=t,this.frame.canvas.style.width="100%",this.frame.canvas.style.height="100%",this.frame.canvas.width=Math.round(this.frame.canvas.clientWidth*this.pixelRatio),this.frame.canvas.height=Math.round(this.frame.canvas.clientHeight*this.pixelRatio),this.options.width=e,this.options.height=t,this.canvasViewCenter={x:.5*this.frame.clientWidth,y:.5*this.frame.clientHeight},i=!0;else{var a=Math.round(this.frame.canvas.clientWidth*this.pixelRatio),s=Math.round(this.frame.canvas.clientHeight*this.pixelRatio);this.frame.canvas.width===a&&this.frame.canvas.height===s||this._getCameraState(o),this.frame.canvas.width!==a&&(this.frame.canvas.width=a,i=!0),this.frame.canvas.height!==s&&(this.frame.canvas.height=s,i=!0)}return!0===i&&(this.body.emitter.emit("resize",{width:Math.round(this.frame.canvas.width/this.pixelRatio),height:Math.round(this.frame.canvas.height/this.pixelRatio),oldWidth:Math.round(r/this.pixelRatio),oldHeight:Math.round(n/this.pixelRatio)}),this._setCameraState()),this.initialized=!0,i}},{key:"getContext",value:function(){return this.frame.canvas.getContext("2d")}},{key:"_determinePixelRatio",value:function(){var e=this.getContext();if(void 0===e)throw new Error("Could not get canvax context");var t=1;return"undefined"!=typeof window&&(t=window.devicePixelRatio||1),t/(e.webkitBackingStorePixelRatio||e.mozBackingStorePixelRatio||e.msBackingStorePixelRatio||e.oBackingStorePixelRatio||e.backingStorePixelRatio||1)}},{key:"_setPixelRatio",value:function(){this.pixelRatio=this._determinePixelRatio()}},{key:"setTransform",value:function(){var e=this.getContext();if(void 0===e)throw new Error("Could not get canvax context");e.setTransform(this.pixelRatio,0,0,this.pixelRatio,0,0)}},{key:"_XconvertDOMtoCanvas",value:function(e){return(e-this.body.view.translation.x)/this.body.view.scale}},{key:"_XconvertCanvasToDOM",value:function(e){return e*this.body.view.scale+this.body.view.translation.x}},{key:"_YconvertDOMtoCanvas",value:function(e){return(e-this.body.view.translation.y)/this.body.view.scale}},{key:"_YconvertCanvasToDOM",value:function(e){return e*this.body.view.scale+this.body.view.translation.y}},{key:"canvasToDOM",value:function(e){return{x:this._XconvertCanvasToDOM(e.x),y:this._YconvertCanvasToDOM(e.y)}}},{key:"DOMtoCanvas",value:function(e){return{x:this._XconvertDOMtoCanvas(e.x),y:this._YconvertDOMtoCanvas(e.y)}}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(76).default,l=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.animationSpeed=1/this.renderRefreshRate,this.animationEasingFunction="easeInOutQuint",this.easingTime=0,this.sourceScale=0,this.targetScale=0,this.sourceTranslation=0,this.targetTranslation=0,this.lockedOnNodeId=void 0,this.lockedOnNodeOffset=void 0,this.touchTime=0,this.viewFunction=void 0,this.body.emitter.on("fit",this.fit.bind(this)),this.body.emitter.on("animationFinished",function(){n.body.emitter.emit("_stopRendering")}),this.body.emitter.on("unlockNode",this.releaseNode.bind(this))}return(0,n.default)(e,[{key:"setOptions",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};this.options=e}},{key:"fit",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{nodes:[]},t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],i=void 0,r=void 0;if(void 0!==e.nodes&&0!==e.nodes.length||(e.nodes=this.body.nodeIndices),!0===t){var n=0;for(var o in this.body.nodes){if(this.body.nodes.hasOwnProperty(o))!0===this.body.nodes[o].predefinedPosition&&(n+=1)}if(n>.5*this.body.nodeIndices.length)return void this.fit(e,!1);i=s.getRange(this.body.nodes,e.nodes),r=12.662/(this.body.nodeIndices.length+7.4147)+.0964822,r*=Math.min(this.canvas.frame.canvas.clientWidth/600,this.canvas.frame.canvas.clientHeight/600)}else{this.body.emitter.emit("_resizeNodes"),i=s.getRange(this.body.nodes,e.nodes);var a=1.1*Math.abs(i.maxX-i.minX),l=1.1*Math.abs(i.maxY-i.minY),u=this.canvas.frame.canvas.clientWidth/a,h=this.canvas.frame.canvas.clientHeight/l;r=u<=h?u:h}r>1?r=1:0===r&&(r=1);var c={position:s.findCenter(i),scale:r,animation:e.animation};this.moveTo(c)}},{key:"focus",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(void 0!==this.body.nodes[e]){var i={x:this.body.nodes[e].x,y:this.body.nodes[e].y};t.position=i,t.lockedOnNode=e,this.moveTo(t)}else console.log("Node: "+e+" cannot be found.")}},{key:"moveTo",value:function(e){void 0!==e?(void 0===e.offset&&(e.offset={x:0,y:0}),void 0===e.offset.x&&(e.offset.x=0),void 0===e.offset.y&&(e.offset.y=0),void 0===e.scale&&(e.scale=this.body.view.scale),void 0===e.position&&(e.position=this.getViewPosition()),void 0===e.animation&&(e.animation={duration:0}),!1===e.animation&&(e.animation={duration:0}),!0===e.animation&&(e.animation={}),void 0===e.animation.duration&&(e.animation.duration=1e3),void 0===e.animation.easingFunction&&(e.animation.easingFunction="easeInOutQuad"),this.animateView(e)):e={}}},{key:"animateView",value:function(e){if(void 0!==e){this.animationEasingFunction=e.animation.easingFunction,this.releaseNode(),!0===e.locked&&(this.lockedOnNodeId=e.lockedOnNode,this.lockedOnNodeOffset=e.offset),0!=this.easingTime&&this._transitionRedraw(!0),this.sourceScale=this.body.view.scale,this.sourceTranslation=this.body.view.translation,this.targetScale=e.scale,this.body.view.scale=this.targetScale;var t=this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight}),i=t.x-e.position.x,r=t.y-e.position.y;this.targetTranslation={x:this.sourceTranslation.x+i*this.targetScale+e.offset.x,y:this.sourceTranslation.y+r*this.targetScale+e.offset.y},0===e.animation.duration?null!=this.lockedOnNodeId?(this.viewFunction=this._lockedRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction)):(this.body.view.scale=this.targetScale,this.body.view.translation=this.targetTranslation,this.body.emitter.emit("_requestRedraw")):(this.animationSpeed=1/(60*e.animation.duration*.001)||1/60,this.animationEasingFunction=e.animation.easingFunction,this.viewFunction=this._transitionRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction),this.body.emitter.emit("_startRendering"))}}},{key:"_lockedRedraw",value:function(){var e=this.body.nodes[this.lockedOnNodeId].x,t=this.body.nodes[this.lockedOnNodeId].y,i=this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight}),r=i.x-e,n=i.y-t,o=this.body.view.translation,a={x:o.x+r*this.body.view.scale+this.lockedOnNodeOffset.x,y:o.y+n*this.body.view.scale+this.lockedOnNodeOffset.y};this.body.view.translation=a}},{key:"releaseNode",value:function(){void 0!==this.lockedOnNodeId&&void 0!==this.viewFunction&&(this.body.emitter.off("initRedraw",this.viewFunction),this.lockedOnNodeId=void 0,this.lockedOnNodeOffset=void 0)}},{key:"_transitionRedraw",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];this.easingTime+=this.animationSpeed,this.easingTime=!0===e?1:this.easingTime;var t=a.easingFunctions[this.animationEasingFunction](this.easingTime);this.body.view.scale=this.sourceScale+(this.targetScale-this.sourceScale)*t,this.body.view.translation={x:this.sourceTranslation.x+(this.targetTranslation.x-this.sourceTranslation.x)*t,y:this.sourceTranslation.y+(this.targetTranslation.y-this.sourceTranslation.y)*t},this.easingTime>=1&&(this.body.emitter.off("initRedraw",this.viewFunction),this.easingTime=0,null!=this.lockedOnNodeId&&(this.viewFunction=this._lockedRedraw.bind(this),this.body.emitter.on("initRedraw",this.viewFunction)),this.body.emitter.emit("animationFinished"))}},{key:"getScale",value:function(){return this.body.view.scale}},{key:"getViewPosition",value:function(){return this.canvas.DOMtoCanvas({x:.5*this.canvas.frame.canvas.clientWidth,y:.5*this.canvas.frame.canvas.clientHeight})}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(2),s=i(233).default,l=i(104).default,u=function(){function e(t,i,n){(0,r.default)(this,e),this.body=t,this.canvas=i,this.selectionHandler=n,this.navigationHandler=new s(t,i),this.body.eventListeners.onTap=this.onTap.bind(this),this.body.eventListeners.onTouch=this.onTouch.bind(this),this.body.eventListeners.onDoubleTap=this.onDoubleTap.bind(this),this.body.eventListeners.onHold=this.onHold.bind(this),this.body.eventListeners.onDragStart=this.onDragStart.bind(this),this.body.eventListeners.onDrag=this.onDrag.bind(this),this.body.eventListeners.onDragEnd=this.onDragEnd.bind(this),this.body.eventListeners.onMouseWheel=this.onMouseWheel.bind(this),this.body.eventListeners.onPinch=this.onPinch.bind(this),this.body.eventListeners.onMouseMove=this.onMouseMove.bind(this),this.body.eventListeners.onRelease=this.onRelease.bind(this),this.body.eventListeners.onContext=this.onContext.bind(this),this.touchTime=0,this.drag={},this.pinch={},this.popup=void 0,this.popupObj=void 0,this.popupTimer=void 0,this.body.functions.getPointer=this.getPointer.bind(this),this.options={},this.defaultOptions={dragNodes:!0,dragView:!0,hover:!1,keyboard:{enabled:!1,speed:{x:10,y:10,zoom:.02},bindToWindow:!0},navigationButtons:!1,tooltipDelay:300,zoomView:!0},a.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,n.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("destroy",function(){clearTimeout(e.popupTimer),delete e.body.functions.getPointer})}},{key:"setOptions",value:function(e){if(void 0!==e){a.selectiveNotDeepExtend(["hideEdgesOnDrag","hideNodesOnDrag","keyboard","multiselect","selectable","selectConnectedEdges"],this.options,e),a.mergeOptions(this.options,e,"keyboard"),e.tooltip&&(a.extend(this.options.tooltip,e.tooltip),e.tooltip.color&&(this.options.tooltip.color=a.parseColor(e.tooltip.color)))}this.navigationHandler.setOptions(this.options)}},{key:"getPointer",value:function(e){return{x:e.x-a.getAbsoluteLeft(this.canvas.frame.canvas),y:e.y-a.getAbsoluteTop(this.canvas.frame.canvas)}}},{key:"onTouch",value:function(e){(new Date).valueOf()-this.touchTime>50&&(this.drag.pointer=this.getPointer(e.center),this.drag.pinched=!1,this.pinch.scale=this.body.view.scale,this.touchTime=(new Date).valueOf())}},{key:"onTap",value:function(e){var t=this.getPointer(e.center),i=this.selectionHandler.options.multiselect&&(e.changedPointers[0].ctrlKey||e.changedPointers[0].metaKey);this.checkSelectionChanges(t,e,i),this.selectionHandler._generateClickEvent("click",e,t)}},{key:"onDoubleTap",value:function(e){var t=this.getPointer(e.center);this.selectionHandler._generateClickEvent("doubleClick",e,t)}},{key:"onHold",value:function(e){var t=this.getPointer(e.center),i=this.selectionHandler.options.multiselect;this.checkSelectionChanges(t,e,i),this.selectionHandler._generateClickEvent("click",e,t),this.selectionHandler._generateClickEvent("hold",e,t)}},{key:"onRelease",value:function(e){if((new Date).valueOf()-this.touchTime>10){var t=this.getPointer(e.center);this.selectionHandler._generateClickEvent("release",e,t),this.touchTime=(new Date).valueOf()}}},{key:"onContext",value:function(e){var t=this.getPointer({x:e.clientX,y:e.clientY});this.selectionHandler._generateClickEvent("oncontext",e,t)}},{key:"checkSelectionChanges",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=this.selectionHandler.getSelection(),n=!1;n=!0===i?this.selectionHandler.selectAdditionalOnPoint(e):this.selectionHandler.selectOnPoint(e);var o=this.selectionHandler.getSelection(),a=this._determineDifference(r,o),s=this._determineDifference(o,r);a.edges.length>0&&(this.selectionHandler._generateClickEvent("deselectEdge",t,e,r),n=!0),a.nodes.length>0&&(this.selectionHandler._generateClickEvent("deselectNode",t,e,r),n=!0),s.nodes.length>0&&(this.selectionHandler._generateClickEvent("selectNode",t,e),n=!0),s.edges.length>0&&(this.selectionHandler._generateClickEvent("selectEdge",t,e),n=!0),!0===n&&this.selectionHandler._generateClickEvent("select",t,e)}},{key:"_determineDifference",value:function(e,t){var i=function(e,t){for(var i=[],r=0;r<e.length;r++){var n=e[r];-1===t.indexOf(n)&&i.push(n)}return i};return{nodes:i(e.nodes,t.nodes),edges:i(e.edges,t.edges)}}},{key:"onDragStart",value:function(e){void 0===this.drag.pointer&&this.onTouch(e);var t=this.selectionHandler.getNodeAt(this.drag.pointer);if(this.drag.dragging=!0,this.drag.selection=[],this.drag.translation=a.extend({},this.body.view.translation),this.drag.nodeId=void 0,void 0!==t&&!0===this.options.dragNodes){this.drag.nodeId=t.id,!1===t.isSelected()&&(this.selectionHandler.unselectAll(),this.selectionHandler.selectObject(t)),this.selectionHandler._generateClickEvent("dragStart",e,this.drag.pointer);var i=this.selectionHandler.selectionObj.nodes;for(var r in i)if(i.hasOwnProperty(r)){var n=i[r],o={id:n.id,node:n,x:n.x,y:n.y,xFixed:n.options.fixed.x,yFixed:n.options.fixed.y};n.options.fixed.x=!0,n.options.fixed.y=!0,this.drag.selection.push(o)}}else this.selectionHandler._generateClickEvent("dragStart",e,this.drag.pointer,void 0,!0)}},{key:"onDrag",value:function(e){var t=this;if(!0!==this.drag.pinched){this.body.emitter.emit("unlockNode");var i=this.getPointer(e.center),r=this.drag.selection;if(r&&r.length&&!0===this.options.dragNodes){this.selectionHandler._generateClickEvent("dragging",e,i);var n=i.x-this.drag.pointer.x,o=i.y-this.drag.pointer.y;r.forEach(function(e){var i=e.node;!1===e.xFixed&&(i.x=t.canvas._XconvertDOMtoCanvas(t.canvas._XconvertCanvasToDOM(e.x)+n)),!1===e.yFixed&&(i.y=t.canvas._YconvertDOMtoCanvas(t.canvas._YconvertCanvasToDOM(e.y)+o))}),this.body.emitter.emit("startSimulation")}else if(!0===this.options.dragView){if(this.selectionHandler._generateClickEvent("dragging",e,i,void 0,!0),void 0===this.drag.pointer)return void this.onDragStart(e);var a=i.x-this.drag.pointer.x,s=i.y-this.drag.pointer.y;this.body.view.translation={x:this.drag.translation.x+a,y:this.drag.translation.y+s},this.body.emitter.emit("_requestRedraw")}}}},{key:"onDragEnd",value:function(e){this.drag.dragging=!1;var t=this.drag.selection;t&&t.length?(t.forEach(function(e){e.node.options.fixed.x=e.xFixed,e.node.options.fixed.y=e.yFixed}),this.selectionHandler._generateClickEvent("dragEnd",e,this.getPointer(e.center)),this.body.emitter.emit("startSimulation")):(this.selectionHandler._generateClickEvent("dragEnd",e,this.getPointer(e.center),void 0,!0),this.body.emitter.emit("_requestRedraw"))}},{key:"onPinch",value:function(e){var t=this.getPointer(e.center);this.drag.pinched=!0,void 0===this.pinch.scale&&(this.pinch.scale=1);var i=this.pinch.scale*e.scale;this.zoom(i,t)}},{key:"zoom",value:function(e,t){if(!0===this.options.zoomView){var i=this.body.view.scale;e<1e-5&&(e=1e-5),e>10&&(e=10);var r=void 0;void 0!==this.drag&&!0===this.drag.dragging&&(r=this.canvas.DOMtoCanvas(this.drag.pointer));var n=this.body.view.translation,o=e/i,a=(1-o)*t.x+n.x*o,s=(1-o)*t.y+n.y*o;if(this.body.view.scale=e,this.body.view.translation={x:a,y:s},null!=r){var l=this.canvas.canvasToDOM(r);this.drag.pointer.x=l.x,this.drag.pointer.y=l.y}this.body.emitter.emit("_requestRedraw"),i<e?this.body.emitter.emit("zoom",{direction:"+",scale:this.body.view.scale,pointer:t}):this.body.emitter.emit("zoom",{direction:"-",scale:this.body.view.scale,pointer:t})}}},{key:"onMouseWheel",value:function(e){if(!0===this.options.zoomView){var t=0;if(e.wheelDelta?t=e.wheelDelta/120:e.detail&&(t=-e.detail/3),0!==t){var i=this.body.view.scale,r=t/10;t<0&&(r/=1-r),i*=1+r;var n=this.getPointer({x:e.clientX,y:e.clientY});this.zoom(i,n)}e.preventDefault()}}},{key:"onMouseMove",value:function(e){var t=this,i=this.getPointer({x:e.clientX,y:e.clientY}),r=!1;void 0!==this.popup&&(!1===this.popup.hidden&&this._checkHidePopup(i),!1===this.popup.hidden&&(r=!0,this.popup.setPosition(i.x+3,i.y-5),this.popup.show())),!1===this.options.keyboard.bindToWindow&&!0===this.options.keyboard.enabled&&this.canvas.frame.focus(),!1===r&&(void 0!==this.popupTimer&&(clearInterval(this.popupTimer),this.popupTimer=void 0),this.drag.dragging||(this.popupTimer=setTimeout(function(){return t._checkShowPopup(i)},this.options.tooltipDelay))),!0===this.options.hover&&this.selectionHandler.hoverObject(e,i)}},{key:"_checkShowPopup",value:function(e){var t=this.canvas._XconvertDOMtoCanvas(e.x),i=this.canvas._YconvertDOMtoCanvas(e.y),r={left:t,top:i,right:t,bottom:i},n=void 0===this.popupObj?void 0:this.popupObj.id,o=!1,a="node";if(void 0===this.popupObj){for(var s=this.body.nodeIndices,u=this.body.nodes,h=void 0,c=[],d=0;d<s.length;d++)!0===(h=u[s[d]]).isOverlappingWith(r)&&void 0!==h.getTitle()&&c.push(s[d]);c.length>0&&(this.popupObj=u[c[c.length-1]],o=!0)}if(void 0===this.popupObj&&!1===o){for(var p=this.body.edgeIndices,f=this.body.edges,m=void 0,v=[],g=0;g<p.length;g++)!0===(m=f[p[g]]).isOverlappingWith(r)&&!0===m.connected&&void 0!==m.getTitle()&&v.push(p[g]);v.length>0&&(this.popupObj=f[v[v.length-1]],a="edge")}void 0!==this.popupObj?this.popupObj.id!==n&&(void 0===this.popup&&(this.popup=new l(this.canvas.frame)),this.popup.popupTargetType=a,this.popup.popupTargetId=this.popupObj.id,this.popup.setPosition(e.x+3,e.y-5),this.popup.setText(this.popupObj.getTitle()),this.popup.show(),this.body.emitter.emit("showPopup",this.popupObj.id)):void 0!==this.popup&&(this.popup.hide(),this.body.emitter.emit("hidePopup"))}},{key:"_checkHidePopup",value:function(e){var t=this.selectionHandler._pointerToPositionObject(e),i=!1;if("node"===this.popup.popupTargetType){if(void 0!==this.body.nodes[this.popup.popupTargetId]&&!0===(i=this.body.nodes[this.popup.popupTargetId].isOverlappingWith(t))){var r=this.selectionHandler.getNodeAt(e);i=void 0!==r&&r.id===this.popup.popupTargetId}}else void 0===this.selectionHandler.getNodeAt(e)&&void 0!==this.body.edges[this.popup.popupTargetId]&&(i=this.body.edges[this.popup.popupTargetId].isOverlappingWith(t));!1===i&&(this.popupObj=void 0,this.popup.hide(),this.body.emitter.emit("hidePopup"))}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(10),s=i(37),l=i(35),u=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.iconsCreated=!1,this.navigationHammers=[],this.boundFunctions={},this.touchTime=0,this.activated=!1,this.body.emitter.on("activate",function(){n.activated=!0,n.configureKeyboardBindings()}),this.body.emitter.on("deactivate",function(){n.activated=!1,n.configureKeyboardBindings()}),this.body.emitter.on("destroy",function(){void 0!==n.keycharm&&n.keycharm.destroy()}),this.options={}}return(0,n.default)(e,[{key:"setOptions",value:function(e){void 0!==e&&(this.options=e,this.create())}},{key:"create",value:function(){!0===this.options.navigationButtons?!1===this.iconsCreated&&this.loadNavigationElements():!0===this.iconsCreated&&this.cleanNavigation(),this.configureKeyboardBindings()}},{key:"cleanNavigation",value:function(){if(0!=this.navigationHammers.length){for(var e=0;e<this.navigationHammers.length;e++)this.navigationHammers[e].destroy();this.navigationHammers=[]}this.navigationDOM&&this.navigationDOM.wrapper&&this.navigationDOM.wrapper.parentNode&&this.navigationDOM.wrapper.parentNode.removeChild(this.navigationDOM.wrapper),this.iconsCreated=!1}},{key:"loadNavigationElements",value:function(){var e=this;this.cleanNavigation(),this.navigationDOM={};var t=["up","down","left","right","zoomIn","zoomOut","zoomExtends"],i=["_moveUp","_moveDown","_moveLeft","_moveRight","_zoomIn","_zoomOut","_fit"];this.navigationDOM.wrapper=document.createElement("div"),this.navigationDOM.wrapper.className="vis-navigation",this.canvas.frame.appendChild(this.navigationDOM.wrapper);for(var r=0;r<t.length;r++){this.navigationDOM[t[r]]=document.createElement("div"),this.navigationDOM[t[r]].className="vis-button vis-"+t[r],this.navigationDOM.wrapper.appendChild(this.navigationDOM[t[r]]);var n=new a(this.navigationDOM[t[r]]);"_fit"===i[r]?s.onTouch(n,this._fit.bind(this)):s.onTouch(n,this.bindToRedraw.bind(this,i[r])),this.navigationHammers.push(n)}var o=new a(this.canvas.frame);s.onRelease(o,function(){e._stopMovement()}),this.navigationHammers.push(o),this.iconsCreated=!0}},{key:"bindToRedraw",value:function(e){void 0===this.boundFunctions[e]&&(this.boundFunctions[e]=this[e].bind(this),this.body.emitter.on("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_startRendering"))}},{key:"unbindFromRedraw",value:function(e){void 0!==this.boundFunctions[e]&&(this.body.emitter.off("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_stopRendering"),delete this.boundFunctions[e])}},{key:"_fit",value:function(){(new Date).valueOf()-this.touchTime>700&&(this.body.emitter.emit("fit",{duration:700}),this.touchTime=(new Date).valueOf())}},{key:"_stopMovement",value:function(){for(var e in this.boundFunctions)this.boundFunctions.hasOwnProperty(e)&&(this.body.emitter.off("initRedraw",this.boundFunctions[e]),this.body.emitter.emit("_stopRendering"));this.boundFunctions={}}},{key:"_moveUp",value:function(){this.body.view.translation.y+=this.options.keyboard.speed.y}},{key:"_moveDown",value:function(){this.body.view.translation.y-=this.options.keyboard.speed.y}},{key:"_moveLeft",value:function(){this.body.view.translation.x+=this.options.keyboard.speed.x}},{key:"_moveRight",value:function(){this.body.view.translation.x-=this.options.keyboard.speed.x}},{key:"_zoomIn",value:function(){var e=this.body.view.scale,t=this.body.view.scale*(1+this.options.keyboard.speed.zoom),i=this.body.view.translation,r=t/e,n=(1-r)*this.canvas.canvasViewCenter.x+i.x*r,o=(1-r)*this.canvas.canvasViewCenter.y+i.y*r;this.body.view.scale=t,this.body.view.translation={x:n,y:o},this.body.emitter.emit("zoom",{direction:"+",scale:this.body.view.scale,pointer:null})}},{key:"_zoomOut",value:function(){var e=this.body.view.scale,t=this.body.view.scale/(1+this.options.keyboard.speed.zoom),i=this.body.view.translation,r=t/e,n=(1-r)*this.canvas.canvasViewCenter.x+i.x*r,o=(1-r)*this.canvas.canvasViewCenter.y+i.y*r;this.body.view.scale=t,this.body.view.translation={x:n,y:o},this.body.emitter.emit("zoom",{direction:"-",scale:this.body.view.scale,pointer:null})}},{key:"configureKeyboardBindings",value:function(){var e=this;void 0!==this.keycharm&&this.keycharm.destroy(),!0===this.options.keyboard.enabled&&(!0===this.options.keyboard.bindToWindow?this.keycharm=l({container:window,preventDefault:!0}):this.keycharm=l({container:this.canvas.frame,preventDefault:!0}),this.keycharm.reset(),!0===this.activated&&(this.keycharm.bind("up",function(){e.bindToRedraw("_moveUp")},"keydown"),this.keycharm.bind("down",function(){e.bindToRedraw("_moveDown")},"keydown"),this.keycharm.bind("left",function(){e.bindToRedraw("_moveLeft")},"keydown"),this.keycharm.bind("right",function(){e.bindToRedraw("_moveRight")},"keydown"),this.keycharm.bind("=",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("num+",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("num-",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("-",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("[",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("]",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("pageup",function(){e.bindToRedraw("_zoomIn")},"keydown"),this.keycharm.bind("pagedown",function(){e.bindToRedraw("_zoomOut")},"keydown"),this.keycharm.bind("up",function(){e.unbindFromRedraw("_moveUp")},"keyup"),this.keycharm.bind("down",function(){e.unbindFromRedraw("_moveDown")},"keyup"),this.keycharm.bind("left",function(){e.unbindFromRedraw("_moveLeft")},"keyup"),this.keycharm.bind("right",function(){e.unbindFromRedraw("_moveRight")},"keyup"),this.keycharm.bind("=",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("num+",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("num-",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("-",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("[",function(){e.unbindFromRedraw("_zoomOut")},"keyup"),this.keycharm.bind("]",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("pageup",function(){e.unbindFromRedraw("_zoomIn")},"keyup"),this.keycharm.bind("pagedown",function(){e.unbindFromRedraw("_zoomOut")},"keyup")))}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=i(47).default,s=i(74).default,l=i(2),u=function(){function e(t,i){var n=this;(0,r.default)(this,e),this.body=t,this.canvas=i,this.selectionObj={nodes:[],edges:[]},this.hoverObj={nodes:{},edges:{}},this.options={},this.defaultOptions={multiselect:!1,selectable:!0,selectConnectedEdges:!0,hoverConnectedEdges:!0},l.extend(this.options,this.defaultOptions),this.body.emitter.on("_dataChanged",function(){n.updateSelection()})}return(0,n.default)(e,[{key:"setOptions",value:function(e){if(void 0!==e){l.selectiveDeepExtend(["multiselect","hoverConnectedEdges","selectable","selectConnectedEdges"],this.options,e)}}},{key:"selectOnPoint",value:function(e){var t=!1;if(!0===this.options.selectable){var i=this.getNodeAt(e)||this.getEdgeAt(e);this.unselectAll(),void 0!==i&&(t=this.selectObject(i)),this.body.emitter.emit("_requestRedraw")}return t}},{key:"selectAdditionalOnPoint",value:function(e){var t=!1;if(!0===this.options.selectable){var i=this.getNodeAt(e)||this.getEdgeAt(e);void 0!==i&&(t=!0,!0===i.isSelected()?this.deselectObject(i):this.selectObject(i),this.body.emitter.emit("_requestRedraw"))}return t}},{key:"_initBaseEvent",value:function(e,t){var i={};return i.pointer={DOM:{x:t.x,y:t.y},canvas:this.canvas.DOMtoCanvas(t)},i.event=e,i}},{key:"_generateClickEvent",value:function(e,t,i,r){var n=arguments.length>4&&void 0!==arguments[4]&&arguments[4],o=this._initBaseEvent(t,i);if(!0===n)o.nodes=[],o.edges=[];else{var a=this.getSelection();o.nodes=a.nodes,o.edges=a.edges}void 0!==r&&(o.previousSelection=r),"click"==e&&(o.items=this.getClickedItems(i)),this.body.emitter.emit(e,o)}},{key:"selectObject",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.options.selectConnectedEdges;return void 0!==e&&(e instanceof a&&!0===t&&this._selectConnectedEdges(e),e.select(),this._addToSelection(e),!0)}},{key:"deselectObject",value:function(e){!0===e.isSelected()&&(e.selected=!1,this._removeFromSelection(e))}},{key:"_getAllNodesOverlappingWith",value:function(e){for(var t=[],i=this.body.nodes,r=0;r<this.body.nodeIndices.length;r++){var n=this.body.nodeIndices[r];i[n].isOverlappingWith(e)&&t.push(n)}return t}},{key:"_pointerToPositionObject",value:function(e){var t=this.canvas.DOMtoCanvas(e);return{left:t.x-1,top:t.y+1,right:t.x+1,bottom:t.y-1}}},{key:"getNodeAt",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this._pointerToPositionObject(e),r=this._getAllNodesOverlappingWith(i);return r.length>0?!0===t?this.body.nodes[r[r.length-1]]:r[r.length-1]:void 0}},{key:"_getEdgesOverlappingWith",value:function(e,t){for(var i=this.body.edges,r=0;r<this.body.edgeIndices.length;r++){var n=this.body.edgeIndices[r];i[n].isOverlappingWith(e)&&t.push(n)}}},{key:"_getAllEdgesOverlappingWith",value:function(e){var t=[];return this._getEdgesOverlappingWith(e,t),t}},{key:"getEdgeAt",value:function(e){for(var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this.canvas.DOMtoCanvas(e),r=10,n=null,o=this.body.edges,a=0;a<this.body.edgeIndices.length;a++){var s=this.body.edgeIndices[a],l=o[s];if(l.connected){var u=l.from.x,h=l.from.y,c=l.to.x,d=l.to.y,p=l.edgeType.getDistanceToEdge(u,h,c,d,i.x,i.y);p<r&&(n=s,r=p)}}return null!==n?!0===t?this.body.edges[n]:n:void 0}},{key:"_addToSelection",value:function(e){e instanceof a?this.selectionObj.nodes[e.id]=e:this.selectionObj.edges[e.id]=e}},{key:"_addToHover",value:function(e){e instanceof a?this.hoverObj.nodes[e.id]=e:this.hoverObj.edges[e.id]=e}},{key:"_removeFromSelection",value:function(e){e instanceof a?(delete this.selectionObj.nodes[e.id],this._unselectConnectedEdges(e)):delete this.selectionObj.edges[e.id]}},{key:"unselectAll",value:function(){for(var e in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(e)&&this.selectionObj.nodes[e].unselect();for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&this.selectionObj.edges[t].unselect();this.selectionObj={nodes:{},edges:{}}}},{key:"_getSelectedNodeCount",value:function(){var e=0;for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&(e+=1);return e}},{key:"_getSelectedNode",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e))return this.selectionObj.nodes[e]}},{key:"_getSelectedEdge",value:function(){for(var e in this.selectionObj.edges)if(this.selectionObj.edges.hasOwnProperty(e))return this.selectionObj.edges[e]}},{key:"_getSelectedEdgeCount",value:function(){var e=0;for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&(e+=1);return e}},{key:"_getSelectedObjectCount",value:function(){var e=0;for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&(e+=1);for(var i in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(i)&&(e+=1);return e}},{key:"_selectionIsEmpty",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e))return!1;for(var t in this.selectionObj.edges)if(this.selectionObj.edges.hasOwnProperty(t))return!1;return!0}},{key:"_clusterInSelection",value:function(){for(var e in this.selectionObj.nodes)if(this.selectionObj.nodes.hasOwnProperty(e)&&this.selectionObj.nodes[e].clusterSize>1)return!0;return!1}},{key:"_selectConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.select(),this._addToSelection(i)}}},{key:"_hoverConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.hover=!0,this._addToHover(i)}}},{key:"_unselectConnectedEdges",value:function(e){for(var t=0;t<e.edges.length;t++){var i=e.edges[t];i.unselect(),this._removeFromSelection(i)}}},{key:"emitBlurEvent",value:function(e,t,i){var r=this._initBaseEvent(e,t);!0===i.hover&&(i.hover=!1,i instanceof a?(r.node=i.id,this.body.emitter.emit("blurNode",r)):(r.edge=i.id,this.body.emitter.emit("blurEdge",r)))}},{key:"emitHoverEvent",value:function(e,t,i){var r=this._initBaseEvent(e,t),n=!1;return!1===i.hover&&(i.hover=!0,this._addToHover(i),n=!0,i instanceof a?(r.node=i.id,this.body.emitter.emit("hoverNode",r)):(r.edge=i.id,this.body.emitter.emit("hoverEdge",r))),n}},{key:"hoverObject",value:function(e,t){var i=this.getNodeAt(t);void 0===i&&(i=this.getEdgeAt(t));var r=!1;for(var n in this.hoverObj.nodes)this.hoverObj.nodes.hasOwnProperty(n)&&(void 0===i||i instanceof a&&i.id!=n||i instanceof s)&&(this.emitBlurEvent(e,t,this.hoverObj.nodes[n]),delete this.hoverObj.nodes[n],r=!0);for(var o in this.hoverObj.edges)this.hoverObj.edges.hasOwnProperty(o)&&(!0===r?(this.hoverObj.edges[o].hover=!1,delete this.hoverObj.edges[o]):(void 0===i||i instanceof s&&i.id!=o||i instanceof a&&!i.hover)&&(this.emitBlurEvent(e,t,this.hoverObj.edges[o]),delete this.hoverObj.edges[o],r=!0));void 0!==i&&(r=r||this.emitHoverEvent(e,t,i),i instanceof a&&!0===this.options.hoverConnectedEdges&&this._hoverConnectedEdges(i)),!0===r&&this.body.emitter.emit("_requestRedraw")}},{key:"getSelection",value:function(){return{nodes:this.getSelectedNodes(),edges:this.getSelectedEdges()}}},{key:"getSelectedNodes",value:function(){var e=[];if(!0===this.options.selectable)for(var t in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(t)&&e.push(this.selectionObj.nodes[t].id);return e}},{key:"getSelectedEdges",value:function(){var e=[];if(!0===this.options.selectable)for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&e.push(this.selectionObj.edges[t].id);return e}},{key:"setSelection",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=void 0,r=void 0;if(!e||!e.nodes&&!e.edges)throw"Selection must be an object with nodes and/or edges properties";if((t.unselectAll||void 0===t.unselectAll)&&this.unselectAll(),e.nodes)for(i=0;i<e.nodes.length;i++){r=e.nodes[i];var n=this.body.nodes[r];if(!n)throw new RangeError('Node with id "'+r+'" not found');this.selectObject(n,t.highlightEdges)}if(e.edges)for(i=0;i<e.edges.length;i++){r=e.edges[i];var o=this.body.edges[r];if(!o)throw new RangeError('Edge with id "'+r+'" not found');this.selectObject(o)}this.body.emitter.emit("_requestRedraw")}},{key:"selectNodes",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];if(!e||void 0===e.length)throw"Selection must be an array with ids";this.setSelection({nodes:e},{highlightEdges:t})}},{key:"selectEdges",value:function(e){if(!e||void 0===e.length)throw"Selection must be an array with ids";this.setSelection({edges:e})}},{key:"updateSelection",value:function(){for(var e in this.selectionObj.nodes)this.selectionObj.nodes.hasOwnProperty(e)&&(this.body.nodes.hasOwnProperty(e)||delete this.selectionObj.nodes[e]);for(var t in this.selectionObj.edges)this.selectionObj.edges.hasOwnProperty(t)&&(this.body.edges.hasOwnProperty(t)||delete this.selectionObj.edges[t])}},{key:"getClickedItems",value:function(e){for(var t=this.canvas.DOMtoCanvas(e),i=[],r=this.body.nodeIndices,n=this.body.nodes,o=r.length-1;o>=0;o--){var a=n[r[o]].getItemsOnPoint(t);i.push.apply(i,a)}for(var s=this.body.edgeIndices,l=this.body.edges,u=s.length-1;u>=0;u--){var h=l[s[u]].getItemsOnPoint(t);i.push.apply(i,h)}return i}}]),e}();t.default=u},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(30)),n=l(i(6)),o=l(i(8)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=i(76).default,c=i(236),d=c.HorizontalStrategy,p=c.VerticalStrategy,f=function(){function e(){(0,a.default)(this,e),this.childrenReference={},this.parentReference={},this.trees={},this.distributionOrdering={},this.levels={},this.distributionIndex={},this.isTree=!1,this.treeIndex=-1}return(0,s.default)(e,[{key:"addRelation",value:function(e,t){void 0===this.childrenReference[e]&&(this.childrenReference[e]=[]),this.childrenReference[e].push(t),void 0===this.parentReference[t]&&(this.parentReference[t]=[]),this.parentReference[t].push(e)}},{key:"checkIfTree",value:function(){for(var e in this.parentReference)if(this.parentReference[e].length>1)return void(this.isTree=!1);this.isTree=!0}},{key:"numTrees",value:function(){return this.treeIndex+1}},{key:"setTreeIndex",value:function(e,t){void 0!==t&&void 0===this.trees[e.id]&&(this.trees[e.id]=t,this.treeIndex=Math.max(t,this.treeIndex))}},{key:"ensureLevel",value:function(e){void 0===this.levels[e]&&(this.levels[e]=0)}},{key:"getMaxLevel",value:function(e){var t=this,i={};return function e(r){if(void 0!==i[r])return i[r];var n=t.levels[r];if(t.childrenReference[r]){var o=t.childrenReference[r];if(o.length>0)for(var a=0;a<o.length;a++)n=Math.max(n,e(o[a]))}return i[r]=n,n}(e)}},{key:"levelDownstream",value:function(e,t){void 0===this.levels[t.id]&&(void 0===this.levels[e.id]&&(this.levels[e.id]=0),this.levels[t.id]=this.levels[e.id]+1)}},{key:"setMinLevelToZero",value:function(e){var t=1e9;for(var i in e)e.hasOwnProperty(i)&&void 0!==this.levels[i]&&(t=Math.min(this.levels[i],t));for(var r in e)e.hasOwnProperty(r)&&void 0!==this.levels[r]&&(this.levels[r]-=t)}},{key:"getTreeSize",value:function(e,t){var i=1e9,r=-1e9,n=1e9,o=-1e9;for(var a in this.trees)if(this.trees.hasOwnProperty(a)&&this.trees[a]===t){var s=e[a];i=Math.min(s.x,i),r=Math.max(s.x,r),n=Math.min(s.y,n),o=Math.max(s.y,o)}return{min_x:i,max_x:r,min_y:n,max_y:o}}},{key:"hasSameParent",value:function(e,t){var i=this.parentReference[e.id],r=this.parentReference[t.id];if(void 0===i||void 0===r)return!1;for(var n=0;n<i.length;n++)for(var o=0;o<r.length;o++)if(i[n]==r[o])return!0;return!1}},{key:"inSameSubNetwork",value:function(e,t){return this.trees[e.id]===this.trees[t.id]}},{key:"getLevels",value:function(){return(0,o.default)(this.distributionOrdering)}},{key:"addToOrdering",value:function(e,t){void 0===this.distributionOrdering[t]&&(this.distributionOrdering[t]=[]);var i=!1,r=this.distributionOrdering[t];for(var n in r)if(r[n]===e){i=!0;break}i||(this.distributionOrdering[t].push(e),this.distributionIndex[e.id]=this.distributionOrdering[t].length-1)}}]),e}(),m=function(){function e(t){(0,a.default)(this,e),this.body=t,this.initialRandomSeed=Math.round(1e6*Math.random()),this.randomSeed=this.initialRandomSeed,this.setPhysics=!1,this.options={},this.optionsBackup={physics:{}},this.defaultOptions={randomSeed:void 0,improvedLayout:!0,hierarchical:{enabled:!1,levelSeparation:150,nodeSpacing:100,treeSpacing:200,blockShifting:!0,edgeMinimization:!0,parentCentralization:!0,direction:"UD",sortMethod:"hubsize"}},u.extend(this.options,this.defaultOptions),this.bindEventListeners()}return(0,s.default)(e,[{key:"bindEventListeners",value:function(){var e=this;this.body.emitter.on("_dataChanged",function(){e.setupHierarchicalLayout()}),this.body.emitter.on("_dataLoaded",function(){e.layoutNetwork()}),this.body.emitter.on("_resetHierarchicalLayout",function(){e.setupHierarchicalLayout()}),this.body.emitter.on("_adjustEdgesForHierarchicalLayout",function(){if(!0===e.options.hierarchical.enabled){var t=e.direction.curveType();e.body.emitter.emit("_forceDisableDynamicCurves",t,!1)}})}},{key:"setOptions",value:function(e,t){if(void 0!==e){var i=this.options.hierarchical,r=i.enabled;if(u.selectiveDeepExtend(["randomSeed","improvedLayout"],this.options,e),u.mergeOptions(this.options,e,"hierarchical"),void 0!==e.randomSeed&&(this.initialRandomSeed=e.randomSeed),!0===i.enabled)return!0===r&&this.body.emitter.emit("refresh",!0),"RL"===i.direction||"DU"===i.direction?i.levelSeparation>0&&(i.levelSeparation*=-1):i.levelSeparation<0&&(i.levelSeparation*=-1),this.setDirectionStrategy(),this.body.emitter.emit("_resetHierarchicalLayout"),this.adaptAllOptionsForHierarchicalLayout(t);if(!0===r)return this.body.emitter.emit("refresh"),u.deepExtend(t,this.optionsBackup)}return t}},{key:"adaptAllOptionsForHierarchicalLayout",value:function(e){if(!0===this.options.hierarchical.enabled){var t=this.optionsBackup.physics;void 0===e.physics||!0===e.physics?(e.physics={enabled:void 0===t.enabled||t.enabled,solver:"hierarchicalRepulsion"},t.enabled=void 0===t.enabled||t.enabled,t.solver=t.solver||"barnesHut"):"object"===(0,n.default)(e.physics)?(t.enabled=void 0===e.physics.enabled||e.physics.enabled,t.solver=e.physics.solver||"barnesHut",e.physics.solver="hierarchicalRepulsion"):!1!==e.physics&&(t.solver="barnesHut",e.physics={solver:"hierarchicalRepulsion"});var i=this.direction.curveType();if(void 0===e.edges)this.optionsBackup.edges={smooth:{enabled:!0,type:"dynamic"}},e.edges={smooth:!1};else if(void 0===e.edges.smooth)this.optionsBackup.edges={smooth:{enabled:!0,type:"dynamic"}},e.edges.smooth=!1;else if("boolean"==typeof e.edges.smooth)this.optionsBackup.edges={smooth:e.edges.smooth},e.edges.smooth={enabled:e.edges.smooth,type:i};else{var r=e.edges.smooth;void 0!==r.type&&"dynamic"!==r.type&&(i=r.type),this.optionsBackup.edges={smooth:void 0===r.enabled||r.enabled,type:void 0===r.type?"dynamic":r.type,roundness:void 0===r.roundness?.5:r.roundness,forceDirection:void 0!==r.forceDirection&&r.forceDirection},e.edges.smooth={enabled:void 0===r.enabled||r.enabled,type:i,roundness:void 0===r.roundness?.5:r.roundness,forceDirection:void 0!==r.forceDirection&&r.forceDirection}}this.body.emitter.emit("_forceDisableDynamicCurves",i)}return e}},{key:"seededRandom",value:function(){var e=1e4*Math.sin(this.randomSeed++);return e-Math.floor(e)}},{key:"positionInitially",value:function(e){if(!0!==this.options.hierarchical.enabled){this.randomSeed=this.initialRandomSeed;for(var t=e.length+50,i=0;i<e.length;i++){var r=e[i],n=2*Math.PI*this.seededRandom();void 0===r.x&&(r.x=t*Math.cos(n)),void 0===r.y&&(r.y=t*Math.sin(n))}}}},{key:"layoutNetwork",value:function(){if(!0!==this.options.hierarchical.enabled&&!0===this.options.improvedLayout){for(var e=this.body.nodeIndices,t=0,i=0;i<e.length;i++){!0===this.body.nodes[e[i]].predefinedPosition&&(t+=1)}if(t<.5*e.length){var r=0,n={clusterNodeProperties:{shape:"ellipse",label:"",group:"",font:{multi:!1}},clusterEdgeProperties:{label:"",font:{multi:!1},smooth:{enabled:!1}}};if(e.length>150){for(var o=e.length;e.length>150&&r<=10;){r+=1;var a=e.length;if(r%3==0?this.body.modules.clustering.clusterBridges(n):this.body.modules.clustering.clusterOutliers(n),a==e.length&&r%3!=0)return this._declusterAll(),this.body.emitter.emit("_layoutFailed"),void console.info("This network could not be positioned by this version of the improved layout algorithm. Please disable improvedLayout for better performance.")}this.body.modules.kamadaKawai.setOptions({springLength:Math.max(150,2*o)})}r>10&&console.info("The clustering didn't succeed within the amount of interations allowed, progressing with partial result."),this.body.modules.kamadaKawai.solve(e,this.body.edgeIndices,!0),this._shiftToCenter();for(var s=0;s<e.length;s++){var l=this.body.nodes[e[s]];!1===l.predefinedPosition&&(l.x+=70*(.5-this.seededRandom()),l.y+=70*(.5-this.seededRandom()))}this._declusterAll(),this.body.emitter.emit("_repositionBezierNodes")}}}},{key:"_shiftToCenter",value:function(){for(var e=h.getRangeCore(this.body.nodes,this.body.nodeIndices),t=h.findCenter(e),i=0;i<this.body.nodeIndices.length;i++){var r=this.body.nodes[this.body.nodeIndices[i]];r.x-=t.x,r.y-=t.y}}},{key:"_declusterAll",value:function(){for(var e=!0;!0===e;){e=!1;for(var t=0;t<this.body.nodeIndices.length;t++)!0===this.body.nodes[this.body.nodeIndices[t]].isCluster&&(e=!0,this.body.modules.clustering.openCluster(this.body.nodeIndices[t],{},!1));!0===e&&this.body.emitter.emit("_dataChanged")}}},{key:"getSeed",value:function(){return this.initialRandomSeed}},{key:"setupHierarchicalLayout",value:function(){if(!0===this.options.hierarchical.enabled&&this.body.nodeIndices.length>0){var e=void 0,t=void 0,i=!1,r=!1;for(t in this.lastNodeOnLevel={},this.hierarchical=new f,this.body.nodes)this.body.nodes.hasOwnProperty(t)&&(void 0!==(e=this.body.nodes[t]).options.level?(i=!0,this.hierarchical.levels[t]=e.options.level):r=!0);if(!0===r&&!0===i)throw new Error("To use the hierarchical layout, nodes require either no predefined levels or levels have to be defined for all nodes.");if(!0===r){var n=this.options.hierarchical.sortMethod;"hubsize"===n?this._determineLevelsByHubsize():"directed"===n?this._determineLevelsDirected():"custom"===n&&this._determineLevelsCustomCallback()}for(var o in this.body.nodes)this.body.nodes.hasOwnProperty(o)&&this.hierarchical.ensureLevel(o);var a=this._getDistribution();this._generateMap(),this._placeNodesByHierarchy(a),this._condenseHierarchy(),this._shiftToCenter()}}},{key:"_condenseHierarchy",value:function(){var e=this,t=!1,i={},n=function(t,i){var r=e.hierarchical.trees;for(var n in r)r.hasOwnProperty(n)&&r[n]===t&&e.direction.shift(n,i)},o=function(){for(var t=[],i=0;i<e.hierarchical.numTrees();i++)t.push(e.direction.getTreeSize(i));return t},a=function t(i,r){if(!r[i.id]&&(r[i.id]=!0,e.hierarchical.childrenReference[i.id])){var n=e.hierarchical.childrenReference[i.id];if(n.length>0)for(var o=0;o<n.length;o++)t(e.body.nodes[n[o]],r)}},s=function(t){var i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1e9,n=1e9,o=1e9,a=1e9,s=-1e9;for(var l in t)if(t.hasOwnProperty(l)){var u=e.body.nodes[l],h=e.hierarchical.levels[u.id],c=e.direction.getPosition(u),d=e._getSpaceAroundNode(u,t),p=(0,r.default)(d,2),f=p[0],m=p[1];n=Math.min(f,n),o=Math.min(m,o),h<=i&&(a=Math.min(c,a),s=Math.max(c,s))}return[a,s,n,o]},l=function(t,i,r){for(var n=e.hierarchical,o=0;o<i.length;o++){var a=i[o],s=n.distributionOrdering[a];if(s.length>1)for(var l=0;l<s.length-1;l++){var u=s[l],h=s[l+1];n.hasSameParent(u,h)&&n.inSameSubNetwork(u,h)&&t(u,h,r)}}},u=function(i,r){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],o=e.direction.getPosition(i),l=e.direction.getPosition(r),u=Math.abs(l-o),h=e.options.hierarchical.nodeSpacing;if(u>h){var c={},d={};a(i,c),a(r,d);var p=function(t,i){var r=e.hierarchical.getMaxLevel(t.id),n=e.hierarchical.getMaxLevel(i.id);return Math.min(r,n)}(i,r),f=s(c,p),m=s(d,p),v=f[1],g=m[0],y=m[2];if(Math.abs(v-g)>h){var _=v-g+h;_<-y+h&&(_=-y+h),_<0&&(e._shiftBlock(r.id,_),t=!0,!0===n&&e._centerParent(r))}}},h=function(n,o){for(var l=o.id,u=o.edges,h=e.hierarchical.levels[o.id],c=e.options.hierarchical.levelSeparation*e.options.hierarchical.levelSeparation,d={},p=[],f=0;f<u.length;f++){var m=u[f];if(m.toId!=m.fromId){var v=m.toId==l?m.from:m.to;d[u[f].id]=v,e.hierarchical.levels[v.id]<h&&p.push(m)}}var g=function(t,i){for(var r=0,n=0;n<i.length;n++)if(void 0!==d[i[n].id]){var o=e.direction.getPosition(d[i[n].id])-t;r+=o/Math.sqrt(o*o+c)}return r},y=function(t,i){for(var r=0,n=0;n<i.length;n++)if(void 0!==d[i[n].id]){var o=e.direction.getPosition(d[i[n].id])-t;r-=c*Math.pow(o*o+c,-1.5)}return r},_=function(t,i){for(var r=e.direction.getPosition(o),n={},a=0;a<t;a++){var s=g(r,i),l=y(r,i);if(void 0!==n[r-=Math.max(-40,Math.min(40,Math.round(s/l)))])break;n[r]=a}return r},b=_(n,p);!function(r){var n=e.direction.getPosition(o);if(void 0===i[o.id]){var l={};a(o,l),i[o.id]=l}var u=s(i[o.id]),h=u[2],c=u[3],d=r-n,p=0;d>0?p=Math.min(d,c-e.options.hierarchical.nodeSpacing):d<0&&(p=-Math.min(-d,h-e.options.hierarchical.nodeSpacing)),0!=p&&(e._shiftBlock(o.id,p),t=!0)}(b),function(i){var n=e.direction.getPosition(o),a=e._getSpaceAroundNode(o),s=(0,r.default)(a,2),l=s[0],u=s[1],h=i-n,c=n;h>0?c=Math.min(n+(u-e.options.hierarchical.nodeSpacing),i):h<0&&(c=Math.max(n-(l-e.options.hierarchical.nodeSpacing),i)),c!==n&&(e.direction.setPosition(o,c),t=!0)}(b=_(n,u))};!0===this.options.hierarchical.blockShifting&&(function(i){var r=e.hierarchical.getLevels();r=r.reverse();for(var n=0;n<i&&(t=!1,l(u,r,!0),!0===t);n++);}(5),function(){for(var t in e.body.nodes)e.body.nodes.hasOwnProperty(t)&&e._centerParent(e.body.nodes[t])}()),!0===this.options.hierarchical.edgeMinimization&&function(i){var r=e.hierarchical.getLevels();r=r.reverse();for(var n=0;n<i;n++){t=!1;for(var o=0;o<r.length;o++)for(var a=r[o],s=e.hierarchical.distributionOrdering[a],l=0;l<s.length;l++)h(1e3,s[l]);if(!0!==t)break}}(20),!0===this.options.hierarchical.parentCentralization&&function(){var t=e.hierarchical.getLevels();t=t.reverse();for(var i=0;i<t.length;i++)for(var r=t[i],n=e.hierarchical.distributionOrdering[r],o=0;o<n.length;o++)e._centerParent(n[o])}(),function(){for(var t=o(),i=0,r=0;r<t.length-1;r++)i+=t[r].max-t[r+1].min+e.options.hierarchical.treeSpacing,n(r+1,i)}()}},{key:"_getSpaceAroundNode",value:function(e,t){var i=!0;void 0===t&&(i=!1);var r=this.hierarchical.levels[e.id];if(void 0!==r){var n=this.hierarchical.distributionIndex[e.id],o=this.direction.getPosition(e),a=this.hierarchical.distributionOrdering[r],s=1e9,l=1e9;if(0!==n){var u=a[n-1];if(!0===i&&void 0===t[u.id]||!1===i)s=o-this.direction.getPosition(u)}if(n!=a.length-1){var h=a[n+1];if(!0===i&&void 0===t[h.id]||!1===i){var c=this.direction.getPosition(h);l=Math.min(l,c-o)}}return[s,l]}return[0,0]}},{key:"_centerParent",value:function(e){if(this.hierarchical.parentReference[e.id])for(var t=this.hierarchical.parentReference[e.id],i=0;i<t.length;i++){var n=t[i],o=this.body.nodes[n],a=this.hierarchical.childrenReference[n];if(void 0!==a){var s=this._getCenterPosition(a),l=this.direction.getPosition(o),u=this._getSpaceAroundNode(o),h=(0,r.default)(u,2),c=h[0],d=h[1],p=l-s;(p<0&&Math.abs(p)<d-this.options.hierarchical.nodeSpacing||p>0&&Math.abs(p)<c-this.options.hierarchical.nodeSpacing)&&this.direction.setPosition(o,s)}}}},{key:"_placeNodesByHierarchy",value:function(e){for(var t in this.positionedNodes={},e)if(e.hasOwnProperty(t)){var i=(0,o.default)(e[t]);i=this._indexArrayToNodes(i),this.direction.sort(i);for(var r=0,n=0;n<i.length;n++){var a=i[n];if(void 0===this.positionedNodes[a.id]){var s=this.options.hierarchical.nodeSpacing,l=s*r;r>0&&(l=this.direction.getPosition(i[n-1])+s),this.direction.setPosition(a,l,t),this._validatePositionAndContinue(a,t,l),r++}}}}},{key:"_placeBranchNodes",value:function(e,t){var i=this.hierarchical.childrenReference[e];if(void 0!==i){for(var r=[],n=0;n<i.length;n++)r.push(this.body.nodes[i[n]]);this.direction.sort(r);for(var o=0;o<r.length;o++){var a=r[o],s=this.hierarchical.levels[a.id];if(!(s>t&&void 0===this.positionedNodes[a.id]))return;var l=this.options.hierarchical.nodeSpacing,u=void 0;u=0===o?this.direction.getPosition(this.body.nodes[e]):this.direction.getPosition(r[o-1])+l,this.direction.setPosition(a,u,s),this._validatePositionAndContinue(a,s,u)}var h=this._getCenterPosition(r);this.direction.setPosition(this.body.nodes[e],h,t)}}},{key:"_validatePositionAndContinue",value:function(e,t,i){if(this.hierarchical.isTree){if(void 0!==this.lastNodeOnLevel[t]){var r=this.direction.getPosition(this.body.nodes[this.lastNodeOnLevel[t]]);if(i-r<this.options.hierarchical.nodeSpacing){var n=r+this.options.hierarchical.nodeSpacing-i,o=this._findCommonParent(this.lastNodeOnLevel[t],e.id);this._shiftBlock(o.withChild,n)}}this.lastNodeOnLevel[t]=e.id,this.positionedNodes[e.id]=!0,this._placeBranchNodes(e.id,t)}}},{key:"_indexArrayToNodes",value:function(e){for(var t=[],i=0;i<e.length;i++)t.push(this.body.nodes[e[i]]);return t}},{key:"_getDistribution",value:function(){var e={},t=void 0,i=void 0;for(t in this.body.nodes)if(this.body.nodes.hasOwnProperty(t)){i=this.body.nodes[t];var r=void 0===this.hierarchical.levels[t]?0:this.hierarchical.levels[t];this.direction.fix(i,r),void 0===e[r]&&(e[r]={}),e[r][t]=i}return e}},{key:"_getActiveEdges",value:function(e){var t=this,i=[];return u.forEach(e.edges,function(e){-1!==t.body.edgeIndices.indexOf(e.id)&&i.push(e)}),i}},{key:"_getHubSizes",value:function(){var e=this,t={},i=this.body.nodeIndices;u.forEach(i,function(i){var r=e.body.nodes[i],n=e._getActiveEdges(r).length;t[n]=!0});var r=[];return u.forEach(t,function(e){r.push(Number(e))}),r.sort(function(e,t){return t-e}),r}},{key:"_determineLevelsByHubsize",value:function(){for(var e=this,t=function(t,i){e.hierarchical.levelDownstream(t,i)},i=this._getHubSizes(),r=function(r){var n=i[r];if(0===n)return"break";u.forEach(e.body.nodeIndices,function(i){var r=e.body.nodes[i];n===e._getActiveEdges(r).length&&e._crawlNetwork(t,i)})},n=0;n<i.length;++n){if("break"===r(n))break}}},{key:"_determineLevelsCustomCallback",value:function(){var e=this;this._crawlNetwork(function(t,i,r){var n=e.hierarchical.levels[t.id];void 0===n&&(n=e.hierarchical.levels[t.id]=1e5);var o=(h.cloneOptions(t,"node"),h.cloneOptions(i,"node"),void h.cloneOptions(r,"edge"));e.hierarchical.levels[i.id]=n+o}),this.hierarchical.setMinLevelToZero(this.body.nodes)}},{key:"_determineLevelsDirected",value:function(){var e=this;this._crawlNetwork(function(t,i,r){var n=e.hierarchical.levels[t.id],o=e.hierarchical.levels[i.id];(function(t){return u.forEach(e.body.edges,function(e){if(e.toId===t.fromId&&e.fromId===t.toId)return!0}),!1})(r)&&void 0!==n&&void 0!==o||(void 0===n&&(n=e.hierarchical.levels[t.id]=1e4),r.toId==i.id?e.hierarchical.levels[i.id]=n+1:e.hierarchical.levels[i.id]=n-1)}),this.hierarchical.setMinLevelToZero(this.body.nodes)}},{key:"_generateMap",value:function(){var e=this;this._crawlNetwork(function(t,i){e.hierarchical.levels[i.id]>e.hierarchical.levels[t.id]&&e.hierarchical.addRelation(t.id,i.id)}),this.hierarchical.checkIfTree()}},{key:"_crawlNetwork",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:function(){},i=arguments[1],r={},n=function i(n,o){if(void 0===r[n.id]){e.hierarchical.setTreeIndex(n,o),r[n.id]=!0;for(var a=void 0,s=e._getActiveEdges(n),l=0;l<s.length;l++){var u=s[l];!0===u.connected&&(a=u.toId==n.id?u.from:u.to,n.id!=a.id&&(t(n,a,u),i(a,o)))}}};if(void 0===i)for(var o=0,a=0;a<this.body.nodeIndices.length;a++){var s=this.body.nodeIndices[a];if(void 0===r[s])n(this.body.nodes[s],o),o+=1}else{var l=this.body.nodes[i];if(void 0===l)return void console.error("Node not found:",i);n(l)}}},{key:"_shiftBlock",value:function(e,t){var i=this,r={};!function e(n){if(!r[n]){r[n]=!0,i.direction.shift(n,t);var o=i.hierarchical.childrenReference[n];if(void 0!==o)for(var a=0;a<o.length;a++)e(o[a])}}(e)}},{key:"_findCommonParent",value:function(e,t){var i=this,r={};return function e(t,r){var n=i.hierarchical.parentReference[r];if(void 0!==n)for(var o=0;o<n.length;o++){var a=n[o];t[a]=!0,e(t,a)}}(r,e),function e(t,r){var n=i.hierarchical.parentReference[r];if(void 0!==n)for(var o=0;o<n.length;o++){var a=n[o];if(void 0!==t[a])return{foundParent:a,withChild:r};var s=e(t,a);if(null!==s.foundParent)return s}return{foundParent:null,withChild:r}}(r,t)}},{key:"setDirectionStrategy",value:function(){var e="UD"===this.options.hierarchical.direction||"DU"===this.options.hierarchical.direction;this.direction=e?new p(this):new d(this)}},{key:"_getCenterPosition",value:function(e){for(var t=1e9,i=-1e9,r=0;r<e.length;r++){var n=void 0;if(void 0!==e[r].id)n=e[r];else{var o=e[r];n=this.body.nodes[o]}var a=this.direction.getPosition(n);t=Math.min(t,a),i=Math.max(i,a)}return.5*(t+i)}}]),e}();t.default=m},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0}),t.VerticalStrategy=t.HorizontalStrategy=void 0;var r=l(i(3)),n=l(i(4)),o=l(i(5)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=function(){function e(){(0,a.default)(this,e)}return(0,s.default)(e,[{key:"abstract",value:function(){throw new Error("Can't instantiate abstract class!")}},{key:"fake_use",value:function(){}},{key:"curveType",value:function(){return this.abstract()}},{key:"getPosition",value:function(e){return this.fake_use(e),this.abstract()}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;this.fake_use(e,t,i),this.abstract()}},{key:"getTreeSize",value:function(e){return this.fake_use(e),this.abstract()}},{key:"sort",value:function(e){this.fake_use(e),this.abstract()}},{key:"fix",value:function(e,t){this.fake_use(e,t),this.abstract()}},{key:"shift",value:function(e,t){this.fake_use(e,t),this.abstract()}}]),e}(),h=function(e){function t(e){(0,a.default)(this,t);var i=(0,n.default)(this,(t.__proto__||(0,r.default)(t)).call(this));return i.layout=e,i}return(0,o.default)(t,e),(0,s.default)(t,[{key:"curveType",value:function(){return"horizontal"}},{key:"getPosition",value:function(e){return e.x}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;void 0!==i&&this.layout.hierarchical.addToOrdering(e,i),e.x=t}},{key:"getTreeSize",value:function(e){var t=this.layout.hierarchical.getTreeSize(this.layout.body.nodes,e);return{min:t.min_x,max:t.max_x}}},{key:"sort",value:function(e){e.sort(function(e,t){return void 0===e.x||void 0===t.x?0:e.x-t.x})}},{key:"fix",value:function(e,t){e.y=this.layout.options.hierarchical.levelSeparation*t,e.options.fixed.y=!0}},{key:"shift",value:function(e,t){this.layout.body.nodes[e].x+=t}}]),t}(u),c=function(e){function t(e){(0,a.default)(this,t);var i=(0,n.default)(this,(t.__proto__||(0,r.default)(t)).call(this));return i.layout=e,i}return(0,o.default)(t,e),(0,s.default)(t,[{key:"curveType",value:function(){return"vertical"}},{key:"getPosition",value:function(e){return e.y}},{key:"setPosition",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;void 0!==i&&this.layout.hierarchical.addToOrdering(e,i),e.y=t}},{key:"getTreeSize",value:function(e){var t=this.layout.hierarchical.getTreeSize(this.layout.body.nodes,e);return{min:t.min_y,max:t.max_y}}},{key:"sort",value:function(e){e.sort(function(e,t){return void 0===e.y||void 0===t.y?0:e.y-t.y})}},{key:"fix",value:function(e,t){e.x=this.layout.options.hierarchical.levelSeparation*t,e.options.fixed.x=!0}},{key:"shift",value:function(e,t){this.layout.body.nodes[e].y+=t}}]),t}(u);t.HorizontalStrategy=c,t.VerticalStrategy=h},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=l(i(8)),n=l(i(19)),o=l(i(6)),a=l(i(0)),s=l(i(1));function l(e){return e&&e.__esModule?e:{default:e}}var u=i(2),h=i(10),c=i(37),d=function(){function e(t,i,r){var n=this;(0,a.default)(this,e),this.body=t,this.canvas=i,this.selectionHandler=r,this.editMode=!1,this.manipulationDiv=void 0,this.editModeDiv=void 0,this.closeDiv=void 0,this.manipulationHammers=[],this.temporaryUIFunctions={},this.temporaryEventFunctions=[],this.touchTime=0,this.temporaryIds={nodes:[],edges:[]},this.guiEnabled=!1,this.inMode=!1,this.selectedControlNode=void 0,this.options={},this.defaultOptions={enabled:!1,initiallyActive:!1,addNode:!0,addEdge:!0,editNode:void 0,editEdge:!0,deleteNode:!0,deleteEdge:!0,controlNodeStyle:{shape:"dot",size:6,color:{background:"#ff0000",border:"#3c3c3c",highlight:{background:"#07f968",border:"#3c3c3c"}},borderWidth:2,borderWidthSelected:2}},u.extend(this.options,this.defaultOptions),this.body.emitter.on("destroy",function(){n._clean()}),this.body.emitter.on("_dataChanged",this._restore.bind(this)),this.body.emitter.on("_resetData",this._restore.bind(this))}return(0,s.default)(e,[{key:"_restore",value:function(){!1!==this.inMode&&(!0===this.options.initiallyActive?this.enableEditMode():this.disableEditMode())}},{key:"setOptions",value:function(e,t,i){void 0!==t&&(void 0!==t.locale?this.options.locale=t.locale:this.options.locale=i.locale,void 0!==t.locales?this.options.locales=t.locales:this.options.locales=i.locales),void 0!==e&&("boolean"==typeof e?this.options.enabled=e:(this.options.enabled=!0,u.deepExtend(this.options,e)),!0===this.options.initiallyActive&&(this.editMode=!0),this._setup())}},{key:"toggleEditMode",value:function(){!0===this.editMode?this.disableEditMode():this.enableEditMode()}},{key:"enableEditMode",value:function(){this.editMode=!0,this._clean(),!0===this.guiEnabled&&(this.manipulationDiv.style.display="block",this.closeDiv.style.display="block",this.editModeDiv.style.display="none",this.showManipulatorToolbar())}},{key:"disableEditMode",value:function(){this.editMode=!1,this._clean(),!0===this.guiEnabled&&(this.manipulationDiv.style.display="none",this.closeDiv.style.display="none",this.editModeDiv.style.display="block",this._createEditButton())}},{key:"showManipulatorToolbar",value:function(){if(this._clean(),this.manipulationDOM={},!0===this.guiEnabled){this.editMode=!0,this.manipulationDiv.style.display="block",this.closeDiv.style.display="block";var e=this.selectionHandler._getSelectedNodeCount(),t=this.selectionHandler._getSelectedEdgeCount(),i=e+t,r=this.options.locales[this.options.locale],n=!1;!1!==this.options.addNode&&(this._createAddNodeButton(r),n=!0),!1!==this.options.addEdge&&(!0===n?this._createSeperator(1):n=!0,this._createAddEdgeButton(r)),1===e&&"function"==typeof this.options.editNode?(!0===n?this._createSeperator(2):n=!0,this._createEditNodeButton(r)):1===t&&0===e&&!1!==this.options.editEdge&&(!0===n?this._createSeperator(3):n=!0,this._createEditEdgeButton(r)),0!==i&&(e>0&&!1!==this.options.deleteNode?(!0===n&&this._createSeperator(4),this._createDeleteButton(r)):0===e&&!1!==this.options.deleteEdge&&(!0===n&&this._createSeperator(4),this._createDeleteButton(r))),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this)),this._temporaryBindEvent("select",this.showManipulatorToolbar.bind(this))}this.body.emitter.emit("_redraw")}},{key:"addNodeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="addNode",!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.addDescription||this.options.locales.en.addDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}this._temporaryBindEvent("click",this._performAddNode.bind(this))}},{key:"editNode",value:function(){var e=this;!0!==this.editMode&&this.enableEditMode(),this._clean();var t=this.selectionHandler._getSelectedNode();if(void 0!==t){if(this.inMode="editNode","function"!=typeof this.options.editNode)throw new Error("No function has been configured to handle the editing of nodes.");if(!0!==t.isCluster){var i=u.deepExtend({},t.options,!1);if(i.x=t.x,i.y=t.y,2!==this.options.editNode.length)throw new Error("The function for edit does not support two arguments (data, callback)");this.options.editNode(i,function(t){null!=t&&"editNode"===e.inMode&&e.body.data.nodes.getDataSet().update(t),e.showManipulatorToolbar()})}else alert(this.options.locales[this.options.locale].editClusterError||this.options.locales.en.editClusterError)}else this.showManipulatorToolbar()}},{key:"addEdgeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="addEdge",!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.edgeDescription||this.options.locales.en.edgeDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}this._temporaryBindUI("onTouch",this._handleConnect.bind(this)),this._temporaryBindUI("onDragEnd",this._finishConnect.bind(this)),this._temporaryBindUI("onDrag",this._dragControlNode.bind(this)),this._temporaryBindUI("onRelease",this._finishConnect.bind(this)),this._temporaryBindUI("onDragStart",this._dragStartEdge.bind(this)),this._temporaryBindUI("onHold",function(){})}},{key:"editEdgeMode",value:function(){if(!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="editEdge","object"!==(0,o.default)(this.options.editEdge)||"function"!=typeof this.options.editEdge.editWithoutDrag||(this.edgeBeingEditedId=this.selectionHandler.getSelectedEdges()[0],void 0===this.edgeBeingEditedId)){if(!0===this.guiEnabled){var e=this.options.locales[this.options.locale];this.manipulationDOM={},this._createBackButton(e),this._createSeperator(),this._createDescription(e.editEdgeDescription||this.options.locales.en.editEdgeDescription),this._bindHammerToDiv(this.closeDiv,this.toggleEditMode.bind(this))}if(this.edgeBeingEditedId=this.selectionHandler.getSelectedEdges()[0],void 0!==this.edgeBeingEditedId){var t=this.body.edges[this.edgeBeingEditedId],i=this._getNewTargetNode(t.from.x,t.from.y),r=this._getNewTargetNode(t.to.x,t.to.y);this.temporaryIds.nodes.push(i.id),this.temporaryIds.nodes.push(r.id),this.body.nodes[i.id]=i,this.body.nodeIndices.push(i.id),this.body.nodes[r.id]=r,this.body.nodeIndices.push(r.id),this._temporaryBindUI("onTouch",this._controlNodeTouch.bind(this)),this._temporaryBindUI("onTap",function(){}),this._temporaryBindUI("onHold",function(){}),this._temporaryBindUI("onDragStart",this._controlNodeDragStart.bind(this)),this._temporaryBindUI("onDrag",this._controlNodeDrag.bind(this)),this._temporaryBindUI("onDragEnd",this._controlNodeDragEnd.bind(this)),this._temporaryBindUI("onMouseMove",function(){}),this._temporaryBindEvent("beforeDrawing",function(e){var n=t.edgeType.findBorderPositions(e);!1===i.selected&&(i.x=n.from.x,i.y=n.from.y),!1===r.selected&&(r.x=n.to.x,r.y=n.to.y)}),this.body.emitter.emit("_redraw")}else this.showManipulatorToolbar()}else{var n=this.body.edges[this.edgeBeingEditedId];this._performEditEdge(n.from,n.to)}}},{key:"deleteSelected",value:function(){var e=this;!0!==this.editMode&&this.enableEditMode(),this._clean(),this.inMode="delete";var t=this.selectionHandler.getSelectedNodes(),i=this.selectionHandler.getSelectedEdges(),r=void 0;if(t.length>0){for(var n=0;n<t.length;n++)if(!0===this.body.nodes[t[n]].isCluster)return void alert(this.options.locales[this.options.locale].deleteClusterError||this.options.locales.en.deleteClusterError);"function"==typeof this.options.deleteNode&&(r=this.options.deleteNode)}else i.length>0&&"function"==typeof this.options.deleteEdge&&(r=this.options.deleteEdge);if("function"==typeof r){var o={nodes:t,edges:i};if(2!==r.length)throw new Error("The function for delete does not support two arguments (data, callback)");r(o,function(t){null!=t&&"delete"===e.inMode?(e.body.data.edges.getDataSet().remove(t.edges),e.body.data.nodes.getDataSet().remove(t.nodes),e.body.emitter.emit("startSimulation"),e.showManipulatorToolbar()):(e.body.emitter.emit("startSimulation"),e.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().remove(i),this.body.data.nodes.getDataSet().remove(t),this.body.emitter.emit("startSimulation"),this.showManipulatorToolbar()}},{key:"_setup",value:function(){!0===this.options.enabled?(this.guiEnabled=!0,this._createWrappers(),!1===this.editMode?this._createEditButton():this.showManipulatorToolbar()):(this._removeManipulationDOM(),this.guiEnabled=!1)}},{key:"_createWrappers",value:function(){void 0===this.manipulationDiv&&(this.manipulationDiv=document.createElement("div"),this.manipulationDiv.className="vis-manipulation",!0===this.editMode?this.manipulationDiv.style.display="block":this.manipulationDiv.style.display="none",this.canvas.frame.appendChild(this.manipulationDiv)),void 0===this.editModeDiv&&(this.editModeDiv=document.createElement("div"),this.editModeDiv.className="vis-edit-mode",!0===this.editMode?this.editModeDiv.style.display="none":this.editModeDiv.style.display="block",this.canvas.frame.appendChild(this.editModeDiv)),void 0===this.closeDiv&&(this.closeDiv=document.createElement("div"),this.closeDiv.className="vis-close",this.closeDiv.style.display=this.manipulationDiv.style.display,this.canvas.frame.appendChild(this.closeDiv))}},{key:"_getNewTargetNode",value:function(e,t){var i=u.deepExtend({},this.options.controlNodeStyle);i.id="targetNode"+u.randomUUID(),i.hidden=!1,i.physics=!1,i.x=e,i.y=t;var r=this.body.functions.createNode(i);return r.shape.boundingBox={left:e,right:e,top:t,bottom:t},r}},{key:"_createEditButton",value:function(){this._clean(),this.manipulationDOM={},u.recursiveDOMDelete(this.editModeDiv);var e=this.options.locales[this.options.locale],t=this._createButton("editMode","vis-button vis-edit vis-edit-mode",e.edit||this.options.locales.en.edit);this.editModeDiv.appendChild(t),this._bindHammerToDiv(t,this.toggleEditMode.bind(this))}},{key:"_clean",value:function(){this.inMode=!1,!0===this.guiEnabled&&(u.recursiveDOMDelete(this.editModeDiv),u.recursiveDOMDelete(this.manipulationDiv),this._cleanManipulatorHammers()),this._cleanupTemporaryNodesAndEdges(),this._unbindTemporaryUIs(),this._unbindTemporaryEvents(),this.body.emitter.emit("restorePhysics")}},{key:"_cleanManipulatorHammers",value:function(){if(0!=this.manipulationHammers.length){for(var e=0;e<this.manipulationHammers.length;e++)this.manipulationHammers[e].destroy();this.manipulationHammers=[]}}},{key:"_removeManipulationDOM",value:function(){this._clean(),u.recursiveDOMDelete(this.manipulationDiv),u.recursiveDOMDelete(this.editModeDiv),u.recursiveDOMDelete(this.closeDiv),this.manipulationDiv&&this.canvas.frame.removeChild(this.manipulationDiv),this.editModeDiv&&this.canvas.frame.removeChild(this.editModeDiv),this.closeDiv&&this.canvas.frame.removeChild(this.closeDiv),this.manipulationDiv=void 0,this.editModeDiv=void 0,this.closeDiv=void 0}},{key:"_createSeperator",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1;this.manipulationDOM["seperatorLineDiv"+e]=document.createElement("div"),this.manipulationDOM["seperatorLineDiv"+e].className="vis-separator-line",this.manipulationDiv.appendChild(this.manipulationDOM["seperatorLineDiv"+e])}},{key:"_createAddNodeButton",value:function(e){var t=this._createButton("addNode","vis-button vis-add",e.addNode||this.options.locales.en.addNode);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.addNodeMode.bind(this))}},{key:"_createAddEdgeButton",value:function(e){var t=this._createButton("addEdge","vis-button vis-connect",e.addEdge||this.options.locales.en.addEdge);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.addEdgeMode.bind(this))}},{key:"_createEditNodeButton",value:function(e){var t=this._createButton("editNode","vis-button vis-edit",e.editNode||this.options.locales.en.editNode);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.editNode.bind(this))}},{key:"_createEditEdgeButton",value:function(e){var t=this._createButton("editEdge","vis-button vis-edit",e.editEdge||this.options.locales.en.editEdge);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.editEdgeMode.bind(this))}},{key:"_createDeleteButton",value:function(e){var t;t=this.options.rtl?"vis-button vis-delete-rtl":"vis-button vis-delete";var i=this._createButton("delete",t,e.del||this.options.locales.en.del);this.manipulationDiv.appendChild(i),this._bindHammerToDiv(i,this.deleteSelected.bind(this))}},{key:"_createBackButton",value:function(e){var t=this._createButton("back","vis-button vis-back",e.back||this.options.locales.en.back);this.manipulationDiv.appendChild(t),this._bindHammerToDiv(t,this.showManipulatorToolbar.bind(this))}},{key:"_createButton",value:function(e,t,i){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"vis-label";return this.manipulationDOM[e+"Div"]=document.createElement("div"),this.manipulationDOM[e+"Div"].className=t,this.manipulationDOM[e+"Label"]=document.createElement("div"),this.manipulationDOM[e+"Label"].className=r,this.manipulationDOM[e+"Label"].innerHTML=i,this.manipulationDOM[e+"Div"].appendChild(this.manipulationDOM[e+"Label"]),this.manipulationDOM[e+"Div"]}},{key:"_createDescription",value:function(e){this.manipulationDiv.appendChild(this._createButton("description","vis-button vis-none",e))}},{key:"_temporaryBindEvent",value:function(e,t){this.temporaryEventFunctions.push({event:e,boundFunction:t}),this.body.emitter.on(e,t)}},{key:"_temporaryBindUI",value:function(e,t){if(void 0===this.body.eventListeners[e])throw new Error("This UI function does not exist. Typo? You tried: "+e+" possible are: "+(0,n.default)((0,r.default)(this.body.eventListeners)));this.temporaryUIFunctions[e]=this.body.eventListeners[e],this.body.eventListeners[e]=t}},{key:"_unbindTemporaryUIs",value:function(){for(var e in this.temporaryUIFunctions)this.temporaryUIFunctions.hasOwnProperty(e)&&(this.body.eventListeners[e]=this.temporaryUIFunctions[e],delete this.temporaryUIFunctions[e]);this.temporaryUIFunctions={}}},{key:"_unbindTemporaryEvents",value:function(){for(var e=0;e<this.temporaryEventFunctions.length;e++){var t=this.temporaryEventFunctions[e].event,i=this.temporaryEventFunctions[e].boundFunction;this.body.emitter.off(t,i)}this.temporaryEventFunctions=[]}},{key:"_bindHammerToDiv",value:function(e,t){var i=new h(e,{});c.onTouch(i,t),this.manipulationHammers.push(i)}},{key:"_cleanupTemporaryNodesAndEdges",value:function(){for(var e=0;e<this.temporaryIds.edges.length;e++){this.body.edges[this.temporaryIds.edges[e]].disconnect(),delete this.body.edges[this.temporaryIds.edges[e]];var t=this.body.edgeIndices.indexOf(this.temporaryIds.edges[e]);-1!==t&&this.body.edgeIndices.splice(t,1)}for(var i=0;i<this.temporaryIds.nodes.length;i++){delete this.body.nodes[this.temporaryIds.nodes[i]];var r=this.body.nodeIndices.indexOf(this.temporaryIds.nodes[i]);-1!==r&&this.body.nodeIndices.splice(r,1)}this.temporaryIds={nodes:[],edges:[]}}},{key:"_controlNodeTouch",value:function(e){this.selectionHandler.unselectAll(),this.lastTouch=this.body.functions.getPointer(e.center),this.lastTouch.translation=u.extend({},this.body.view.translation)}},{key:"_controlNodeDragStart",value:function(e){var t=this.lastTouch,i=this.selectionHandler._pointerToPositionObject(t),r=this.body.nodes[this.temporaryIds.nodes[0]],n=this.body.nodes[this.temporaryIds.nodes[1]],o=this.body.edges[this.edgeBeingEditedId];this.selectedControlNode=void 0;var a=r.isOverlappingWith(i),s=n.isOverlappingWith(i);!0===a?(this.selectedControlNode=r,o.edgeType.from=r):!0===s&&(this.selectedControlNode=n,o.edgeType.to=n),void 0!==this.selectedControlNode&&this.selectionHandler.selectObject(this.selectedControlNode),this.body.emitter.emit("_redraw")}},{key:"_controlNodeDrag",value:function(e){this.body.emitter.emit("disablePhysics");var t=this.body.functions.getPointer(e.center),i=this.canvas.DOMtoCanvas(t);if(void 0!==this.selectedControlNode)this.selectedControlNode.x=i.x,this.selectedControlNode.y=i.y;else{var r=t.x-this.lastTouch.x,n=t.y-this.lastTouch.y;this.body.view.translation={x:this.lastTouch.translation.x+r,y:this.lastTouch.translation.y+n}}this.body.emitter.emit("_redraw")}},{key:"_controlNodeDragEnd",value:function(e){var t=this.body.functions.getPointer(e.center),i=this.selectionHandler._pointerToPositionObject(t),r=this.body.edges[this.edgeBeingEditedId];if(void 0!==this.selectedControlNode){this.selectionHandler.unselectAll();for(var n=this.selectionHandler._getAllNodesOverlappingWith(i),o=void 0,a=n.length-1;a>=0;a--)if(n[a]!==this.selectedControlNode.id){o=this.body.nodes[n[a]];break}if(void 0!==o&&void 0!==this.selectedControlNode)if(!0===o.isCluster)alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError);else{var s=this.body.nodes[this.temporaryIds.nodes[0]];this.selectedControlNode.id===s.id?this._performEditEdge(o.id,r.to.id):this._performEditEdge(r.from.id,o.id)}else r.updateEdgeType(),this.body.emitter.emit("restorePhysics");this.body.emitter.emit("_redraw")}}},{key:"_handleConnect",value:function(e){if((new Date).valueOf()-this.touchTime>100){this.lastTouch=this.body.functions.getPointer(e.center),this.lastTouch.translation=u.extend({},this.body.view.translation);var t=this.lastTouch,i=this.selectionHandler.getNodeAt(t);if(void 0!==i)if(!0===i.isCluster)alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError);else{var r=this._getNewTargetNode(i.x,i.y);this.body.nodes[r.id]=r,this.body.nodeIndices.push(r.id);var n=this.body.functions.createEdge({id:"connectionEdge"+u.randomUUID(),from:i.id,to:r.id,physics:!1,smooth:{enabled:!0,type:"continuous",roundness:.5}});this.body.edges[n.id]=n,this.body.edgeIndices.push(n.id),this.temporaryIds.nodes.push(r.id),this.temporaryIds.edges.push(n.id)}this.touchTime=(new Date).valueOf()}}},{key:"_dragControlNode",value:function(e){var t=this.body.functions.getPointer(e.center);if(void 0!==this.temporaryIds.nodes[0]){var i=this.body.nodes[this.temporaryIds.nodes[0]];i.x=this.canvas._XconvertDOMtoCanvas(t.x),i.y=this.canvas._YconvertDOMtoCanvas(t.y),this.body.emitter.emit("_redraw")}else{var r=t.x-this.lastTouch.x,n=t.y-this.lastTouch.y;this.body.view.translation={x:this.lastTouch.translation.x+r,y:this.lastTouch.translation.y+n}}}},{key:"_finishConnect",value:function(e){var t=this.body.functions.getPointer(e.center),i=this.selectionHandler._pointerToPositionObject(t),r=void 0;void 0!==this.temporaryIds.edges[0]&&(r=this.body.edges[this.temporaryIds.edges[0]].fromId);for(var n=this.selectionHandler._getAllNodesOverlappingWith(i),o=void 0,a=n.length-1;a>=0;a--)if(-1===this.temporaryIds.nodes.indexOf(n[a])){o=this.body.nodes[n[a]];break}this._cleanupTemporaryNodesAndEdges(),void 0!==o&&(!0===o.isCluster?alert(this.options.locales[this.options.locale].createEdgeError||this.options.locales.en.createEdgeError):void 0!==this.body.nodes[r]&&void 0!==this.body.nodes[o.id]&&this._performAddEdge(r,o.id)),this.body.emitter.emit("_redraw")}},{key:"_dragStartEdge",value:function(e){var t=this.lastTouch;this.selectionHandler._generateClickEvent("dragStart",e,t,void 0,!0)}},{key:"_performAddNode",value:function(e){var t=this,i={id:u.randomUUID(),x:e.pointer.canvas.x,y:e.pointer.canvas.y,label:"new"};if("function"==typeof this.options.addNode){if(2!==this.options.addNode.length)throw this.showManipulatorToolbar(),new Error("The function for add does not support two arguments (data,callback)");this.options.addNode(i,function(e){null!=e&&"addNode"===t.inMode&&(t.body.data.nodes.getDataSet().add(e),t.showManipulatorToolbar())})}else this.body.data.nodes.getDataSet().add(i),this.showManipulatorToolbar()}},{key:"_performAddEdge",value:function(e,t){var i=this,r={from:e,to:t};if("function"==typeof this.options.addEdge){if(2!==this.options.addEdge.length)throw new Error("The function for connect does not support two arguments (data,callback)");this.options.addEdge(r,function(e){null!=e&&"addEdge"===i.inMode&&(i.body.data.edges.getDataSet().add(e),i.selectionHandler.unselectAll(),i.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().add(r),this.selectionHandler.unselectAll(),this.showManipulatorToolbar()}},{key:"_performEditEdge",value:function(e,t){var i=this,r={id:this.edgeBeingEditedId,from:e,to:t,label:this.body.data.edges._data[this.edgeBeingEditedId].label},n=this.options.editEdge;if("object"===(void 0===n?"undefined":(0,o.default)(n))&&(n=n.editWithoutDrag),"function"==typeof n){if(2!==n.length)throw new Error("The function for edit does not support two arguments (data, callback)");n(r,function(e){null==e||"editEdge"!==i.inMode?(i.body.edges[r.id].updateEdgeType(),i.body.emitter.emit("_redraw"),i.showManipulatorToolbar()):(i.body.data.edges.getDataSet().update(e),i.selectionHandler.unselectAll(),i.showManipulatorToolbar())})}else this.body.data.edges.getDataSet().update(r),this.selectionHandler.unselectAll(),this.showManipulatorToolbar()}}]),e}();t.default=d},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=s(i(30)),n=s(i(0)),o=s(i(1)),a=s(i(239));function s(e){return e&&e.__esModule?e:{default:e}}var l=function(){function e(t,i,r){(0,n.default)(this,e),this.body=t,this.springLength=i,this.springConstant=r,this.distanceSolver=new a.default}return(0,o.default)(e,[{key:"setOptions",value:function(e){e&&(e.springLength&&(this.springLength=e.springLength),e.springConstant&&(this.springConstant=e.springConstant))}},{key:"solve",value:function(e,t){var i=arguments.length>2&&void 0!==arguments[2]&&arguments[2],n=this.distanceSolver.getDistances(this.body,e,t);this._createL_matrix(n),this._createK_matrix(n),this._createE_matrix();for(var o=0,a=Math.max(1e3,Math.min(10*this.body.nodeIndices.length,6e3)),s=1e9,l=0,u=0,h=0,c=0,d=0;s>.01&&o<a;){o+=1;var p=this._getHighestEnergyNode(i),f=(0,r.default)(p,4);for(l=f[0],s=f[1],u=f[2],h=f[3],c=s,d=0;c>1&&d<5;){d+=1,this._moveNode(l,u,h);var m=this._getEnergy(l),v=(0,r.default)(m,3);c=v[0],u=v[1],h=v[2]}}}},{key:"_getHighestEnergyNode",value:function(e){for(var t=this.body.nodeIndices,i=this.body.nodes,n=0,o=t[0],a=0,s=0,l=0;l<t.length;l++){var u=t[l];if(!1===i[u].predefinedPosition||!0===i[u].isCluster&&!0===e||!0===i[u].options.fixed.x||!0===i[u].options.fixed.y){var h=this._getEnergy(u),c=(0,r.default)(h,3),d=c[0],p=c[1],f=c[2];n<d&&(n=d,o=u,a=p,s=f)}}return[o,n,a,s]}},{key:"_getEnergy",value:function(e){var t=(0,r.default)(this.E_sums[e],2),i=t[0],n=t[1];return[Math.sqrt(Math.pow(i,2)+Math.pow(n,2)),i,n]}},{key:"_moveNode",value:function(e,t,i){for(var r=this.body.nodeIndices,n=this.body.nodes,o=0,a=0,s=0,l=n[e].x,u=n[e].y,h=this.K_matrix[e],c=this.L_matrix[e],d=0;d<r.length;d++){var p=r[d];if(p!==e){var f=n[p].x,m=n[p].y,v=h[p],g=c[p],y=1/Math.pow(Math.pow(l-f,2)+Math.pow(u-m,2),1.5);o+=v*(1-g*Math.pow(u-m,2)*y),a+=v*(g*(l-f)*(u-m)*y),s+=v*(1-g*Math.pow(l-f,2)*y)}}var _=(t/o+i/a)/(a/o-s/a),b=-(a*_+t)/o;n[e].x+=b,n[e].y+=_,this._updateE_matrix(e)}},{key:"_createL_matrix",value:function(e){var t=this.body.nodeIndices,i=this.springLength;this.L_matrix=[];for(var r=0;r<t.length;r++){this.L_matrix[t[r]]={};for(var n=0;n<t.length;n++)this.L_matrix[t[r]][t[n]]=i*e[t[r]][t[n]]}}},{key:"_createK_matrix",value:function(e){var t=this.body.nodeIndices,i=this.springConstant;this.K_matrix=[];for(var r=0;r<t.length;r++){this.K_matrix[t[r]]={};for(var n=0;n<t.length;n++)this.K_matrix[t[r]][t[n]]=i*Math.pow(e[t[r]][t[n]],-2)}}},{key:"_createE_matrix",value:function(){var e=this.body.nodeIndices,t=this.body.nodes;this.E_matrix={},this.E_sums={};for(var i=0;i<e.length;i++)this.E_matrix[e[i]]=[];for(var r=0;r<e.length;r++){for(var n=e[r],o=t[n].x,a=t[n].y,s=0,l=0,u=r;u<e.length;u++){var h=e[u];if(h!==n){var c=t[h].x,d=t[h].y,p=1/Math.sqrt(Math.pow(o-c,2)+Math.pow(a-d,2));this.E_matrix[n][u]=[this.K_matrix[n][h]*(o-c-this.L_matrix[n][h]*(o-c)*p),this.K_matrix[n][h]*(a-d-this.L_matrix[n][h]*(a-d)*p)],this.E_matrix[h][r]=this.E_matrix[n][u],s+=this.E_matrix[n][u][0],l+=this.E_matrix[n][u][1]}}this.E_sums[n]=[s,l]}}},{key:"_updateE_matrix",value:function(e){for(var t=this.body.nodeIndices,i=this.body.nodes,r=this.E_matrix[e],n=this.K_matrix[e],o=this.L_matrix[e],a=i[e].x,s=i[e].y,l=0,u=0,h=0;h<t.length;h++){var c=t[h];if(c!==e){var d=r[h],p=d[0],f=d[1],m=i[c].x,v=i[c].y,g=1/Math.sqrt(Math.pow(a-m,2)+Math.pow(s-v,2)),y=n[c]*(a-m-o[c]*(a-m)*g),_=n[c]*(s-v-o[c]*(s-v)*g);r[h]=[y,_],l+=y,u+=_;var b=this.E_sums[c];b[0]+=y-p,b[1]+=_-f}}this.E_sums[e]=[l,u]}}]),e}();t.default=l},function(e,t,i){Object.defineProperty(t,"__esModule",{value:!0});var r=o(i(0)),n=o(i(1));function o(e){return e&&e.__esModule?e:{default:e}}var a=function(){function e(){(0,r.default)(this,e)}return(0,n.default)(e,[{key:"getDistances",value:function(e,t,i){for(var r={},n=e.edges,o=0;o<t.length;o++){var a={};r[t[o]]=a;for(var s=0;s<t.length;s++)a[t[s]]=o==s?0:1e9}for(var l=0;l<i.length;l++){var u=n[i[l]];!0===u.connected&&void 0!==r[u.fromId]&&void 0!==r[u.toId]&&(r[u.fromId][u.toId]=1,r[u.toId][u.fromId]=1)}for(var h=t.length,c=0;c<h;c++)for(var d=t[c],p=r[d],f=0;f<h-1;f++)for(var m=t[f],v=r[m],g=f+1;g<h;g++){var y=t[g],_=r[y],b=Math.min(v[y],v[d]+p[y]);v[y]=b,_[m]=b}return r}}]),e}();t.default=a}])},e.exports=r()},function(e,t,i){for(var r=i(239),n=[],o={},a=0;a<256;a++)n[a]=(a+256).toString(16).substr(1),o[n[a]]=a;function s(e,t){var i=t||0,r=n;return r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+"-"+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]+r[e[i++]]}var l=r(),u=[1|l[0],l[1],l[2],l[3],l[4],l[5]],h=16383&(l[6]<<8|l[7]),c=0,d=0;function p(e,t,i){var n=t&&i||0;"string"==typeof e&&(t="binary"==e?new Array(16):null,e=null);var o=(e=e||{}).random||(e.rng||r)();if(o[6]=15&o[6]|64,o[8]=63&o[8]|128,t)for(var a=0;a<16;a++)t[n+a]=o[a];return t||s(o)}var f=p;f.v1=function(e,t,i){var r=t&&i||0,n=t||[],o=void 0!==(e=e||{}).clockseq?e.clockseq:h,a=void 0!==e.msecs?e.msecs:(new Date).getTime(),l=void 0!==e.nsecs?e.nsecs:d+1,p=a-c+(l-d)/1e4;if(p<0&&void 0===e.clockseq&&(o=o+1&16383),(p<0||a>c)&&void 0===e.nsecs&&(l=0),l>=1e4)throw new Error("uuid.v1(): Can't create more than 10M uuids/sec");c=a,d=l,h=o;var f=(1e4*(268435455&(a+=122192928e5))+l)%4294967296;n[r++]=f>>>24&255,n[r++]=f>>>16&255,n[r++]=f>>>8&255,n[r++]=255&f;var m=a/4294967296*1e4&268435455;n[r++]=m>>>8&255,n[r++]=255&m,n[r++]=m>>>24&15|16,n[r++]=m>>>16&255,n[r++]=o>>>8|128,n[r++]=255&o;for(var v=e.node||u,g=0;g<6;g++)n[r+g]=v[g];return t||s(n)},f.v4=p,f.parse=function(e,t,i){var r=t&&i||0,n=0;for(t=t||[],e.toLowerCase().replace(/[0-9a-f]{2}/g,function(e){n<16&&(t[r+n++]=o[e])});n<16;)t[r+n++]=0;return t},f.unparse=s,e.exports=f},function(e,t,i){(function(t){var i,r=t.crypto||t.msCrypto;if(r&&r.getRandomValues){var n=new Uint8Array(16);i=function(){return r.getRandomValues(n),n}}if(!i){var o=new Array(16);i=function(){for(var e,t=0;t<16;t++)0==(3&t)&&(e=4294967296*Math.random()),o[t]=e>>>((3&t)<<3)&255;return o}}e.exports=i}).call(this,i(59))},function(module,exports,__webpack_require__){'use strict';Object.defineProperty(exports,'__esModule',{value:true});var _createClass=function(){function defineProperties(target,props){for(var i=0;i<props.length;i++){var descriptor=props[i];descriptor.enumerable=descriptor.enumerable||false;descriptor.configurable=true;if('value'in descriptor)descriptor.writable=true;Object.defineProperty(target,descriptor.key,descriptor)}}return function(Constructor,protoProps,staticProps){if(protoProps)defineProperties(Constructor.prototype,protoProps);if(staticProps)defineProperties(Constructor,staticProps);return Constructor}}();var _react=__webpack_require__(30);var _react2=_interopRequireDefault(_react);var _propTypes=__webpack_require__(31);var _propTypes2=_interopRequireDefault(_propTypes);var _Simple3DScene=__webpack_require__(241);var _Simple3DScene2=_interopRequireDefault(_Simple3DScene);function _interopRequireDefault(obj){return obj&&obj.__esModule?obj:{default:obj}}function _classCallCheck(instance,Constructor){if(!(instance instanceof Constructor)){throw new TypeError('Cannot call a class as a function')}}function _possibleConstructorReturn(self,call){if(!self){throw new ReferenceError('this hasn\'t been initialised - super() hasn\'t been called')}return call&&(typeof call==='object'||typeof call==='function')?call:self}function _inherits(subClass,superClass){if(typeof superClass!=='function'&&superClass!==null){throw new TypeError('Super expression must either be null or a function, not '+typeof superClass)}subClass.prototype=Object.create(superClass&&superClass.prototype,{constructor:{value:subClass,enumerable:false,writable:true,configurable:true}});if(superClass)Object.setPrototypeOf?Object.setPrototypeOf(subClass,superClass):subClass.__proto__=superClass}var Simple3DSceneComponent=function(_Component){_inherits(Simple3DSceneComponent,_Component);function Simple3DSceneComponent(props){_classCallCheck(this,Simple3DSceneComponent);var _this=_possibleConstructorReturn(this,(Simple3DSceneComponent.__proto__||Object.getPrototypeOf(Simple3DSceneComponent)).call(this,props));_this.handleClick=_this.handleClick.bind(_this);return _this}_createClass(Simple3DSceneComponent,[{key:'componentDidMount',value:function componentDidMount(){this.scene=new _Simple3DScene2.default(this.props.data,this.mount,this.props.settings);this.scene.toggleVisibility(this.props.toggleVisibility)}},{key:'componentWillUpdate',value:function componentWillUpdate(nextProps,nextState){if(nextProps.downloadRequest!==this.props.downloadRequest){this.scene.download(nextProps.downloadRequest.filename,nextProps.downloadRequest.filetype)}if(nextProps.data!==this.props.data){this.scene.addToScene(nextProps.data);this.scene.toggleVisibility(this.props.toggleVisibility)}else if(nextProps.patch&&nextProps.patch!==this.props.patch){this.scene.applyPatch(nextProps.patch)}if(nextProps.toggleVisibility!==this.props.toggleVisibility){this.scene.toggleVisibility(nextProps.toggleVisibility)}}},{key:'componentWillUnmount',value:function componentWillUnmount(){this.scene.stop();this.mount.removeChild(this.scene.renderer.domElement);this.scene.renderer.forceContextLoss();this.scene.renderer.context=null;this.scene.renderer.domElement=null;this.scene.renderer=null}},{key:'handleClick',value:function handleClick(event){event.preventDefault();var clickedReference=this.scene.getClickedReference(event.clientX,event.clientY);if(this.props.selectedObjectReference===clickedReference){this.setState(function(state){return{selectedObjectCount:state.selectedObjectCount+1}})}else{this.setState({selectedObjectReference:clickedReference,selectedObjectCount:1})}}},{key:'render',value:function render(){var _this2=this;var id=this.props.id;return _react2.default.createElement('div',{id:id,style:{width:'100%',height:'100%'},ref:function ref(mount){_this2.mount=mount},onClick:this.handleClick})}}]);return Simple3DSceneComponent}(_react.Component);exports.default=Simple3DSceneComponent;Simple3DSceneComponent.propTypes={id:_propTypes2.default.string,data:_propTypes2.default.object,patch:_propTypes2.default.object,settings:_propTypes2.default.object,toggleVisibility:_propTypes2.default.object,downloadRequest:_propTypes2.default.object,setProps:_propTypes2.default.func,selectedObjectReference:_propTypes2.default.string,selectedObjectCount:_propTypes2.default.number};},function(module,exports,__webpack_require__){'use strict';Object.defineProperty(exports,'__esModule',{value:true});var _typeof=typeof Symbol==='function'&&typeof Symbol.iterator==='symbol'?function(obj){return typeof obj}:function(obj){return obj&&typeof Symbol==='function'&&obj.constructor===Symbol&&obj!==Symbol.prototype?'symbol':typeof obj};var _createClass=function(){function defineProperties(target,props){for(var i=0;i<props.length;i++){var descriptor=props[i];descriptor.enumerable=descriptor.enumerable||false;descriptor.configurable=true;if('value'in descriptor)descriptor.writable=true;Object.defineProperty(target,descriptor.key,descriptor)}}return function(Constructor,protoProps,staticProps){if(protoProps)defineProperties(Constructor.prototype,protoProps);if(staticProps)defineProperties(Constructor,staticProps);return Constructor}}();var _threeFull=__webpack_require__(242);var THREE=_interopRequireWildcard(_threeFull);function _interopRequireWildcard(obj){if(obj&&obj.__esModule){return obj}else{var newObj={};if(obj!=null){for(var key in obj){if(Object.prototype.hasOwnProperty.call(obj,key))newObj[key]=obj[key]}}newObj.default=obj;return newObj}}function _toConsumableArray(arr){if(Array.isArray(arr)){for(var i=0,arr2=Array(arr.length);i<arr.length;i++){arr2[i]=arr[i]}return arr2}else{return Array.from(arr)}}function _classCallCheck(instance,Constructor){if(!(instance instanceof Constructor)){throw new TypeError('Cannot call a class as a function')}}var Simple3DScene=function(){function Simple3DScene(scene_json,dom_elt,settings){_classCallCheck(this,Simple3DScene);this.start=this.start.bind(this);this.stop=this.stop.bind(this);this.animate=this.animate.bind(this);var defaults={shadows:true,antialias:true,transparent_background:false,background:'#ffffff',sphereSegments:32,cylinderSegments:16,staticScene:true,sphereScale:1,cylinderScale:1,defaultSurfaceOpacity:0.5,lights:[{type:'HemisphereLight',args:['#eeeeee','#999999',1]},{type:'DirectionalLight',args:['#ffffff',0.15],position:[0,0,-10]},{type:'DirectionalLight',args:['#ffffff',0.15],position:[-10,10,10]}],material:{type:'MeshStandardMaterial',parameters:{roughness:0.07,metalness:0}},enableZoom:true,defaultZoom:0.8};this.settings=Object.assign(defaults,settings);var width=dom_elt.clientWidth;var height=dom_elt.clientHeight;var renderer=new THREE.WebGLRenderer({antialias:this.settings.antialias,alpha:this.settings.transparent_background,gammaInput:true,gammaOutput:true,gammaFactor:2.2,shadowMapEnabled:this.settings.shadows,shadowMapType:THREE.PCFSoftShadowMap});this.renderer=renderer;renderer.setPixelRatio(window.devicePixelRatio);renderer.setClearColor(16777215,0);renderer.setSize(width,height);dom_elt.appendChild(renderer.domElement);var scene=new THREE.Scene;scene.background=new THREE.Color(this.settings.background);this.scene=scene;var camera=new THREE.OrthographicCamera(width/-2,width/2,height/2,height/-2,-2000,2000);camera.position.z=2;this.camera=camera;scene.add(camera);this.addToScene(scene_json);var lights=this.makeLights(this.settings.lights);camera.add(lights);var controls=new THREE.OrbitControls(this.camera,this.renderer.domElement);controls.enableKeys=false;controls.minZoom=2;controls.maxZoom=100;controls.enablePan=false;controls.enableZoom=this.settings.enableZoom;function render(){renderer.render(scene,camera)}render();if(this.settings.staticScene){controls.addEventListener('change',render)}else{this.start()}function resizeRendererToDisplaySize(){var canvas=renderer.domElement;var width=canvas.parentElement.clientWidth|0;var height=canvas.parentElement.clientHeight|0;if(canvas.width!==width||canvas.height!==height){renderer.setSize(width,height,true)}renderer.render(scene,camera)}window.addEventListener('resize',resizeRendererToDisplaySize,false);this.clickable_objects=[]}_createClass(Simple3DScene,[{key:'download',value:function download(filename,filetype){switch(filetype){case'png':this.downloadScreenshot(filename);break;default:throw new Error('Unknown filetype.');}}},{key:'downloadScreenshot',value:function downloadScreenshot(filename){var link=document.createElement('a');link.style.display='none';document.body.appendChild(link);this.renderScene();link.href=this.renderer.domElement.toDataURL('image/png');link.download=filename||'screenshot.png';link.click()}},{key:'addToScene',value:function addToScene(scene_json){Simple3DScene.removeObjectByName(this.scene,scene_json.name);this.clickable_objects=[];var root_obj=new THREE.Object3D;root_obj.name=scene_json.name;function traverse_scene(o,parent,self){o.contents.forEach(function(sub_o){if(sub_o.hasOwnProperty('type')){parent.add(self.makeObject(sub_o))}else{var new_parent=new THREE.Object3D;new_parent.name=sub_o.name;parent.add(new_parent);traverse_scene(sub_o,new_parent,self)}})}traverse_scene(scene_json,root_obj,this);this.scene.add(root_obj);var box=new THREE.Box3;box.setFromObject(root_obj);var width=this.renderer.domElement.clientWidth;var height=this.renderer.domElement.clientHeight;this.camera.zoom=Math.min(Math.max(width,height)/(box.max.x-box.min.x),Math.max(width,height)/(box.max.y-box.min.y),Math.max(width,height)/(box.max.z-box.min.z))*this.settings.defaultZoom;this.camera.updateProjectionMatrix();this.camera.updateMatrix();this.renderScene();if(!this.settings.transparent_background){this.renderer.domElement.parentElement.style.backgroundSize='100%';this.renderer.domElement.parentElement.style.backgroundRepeat='no-repeat';this.renderer.domElement.parentElement.style.backgroundPosition='center';this.renderer.domElement.parentElement.style.backgroundImage='url(\''+this.renderer.domElement.toDataURL('image/png')+'\')'}}},{key:'applyPatch',value:function applyPatch(patch){var root_obj=this.scene.getObjectByName(patch.name);if(typeof root_obj==='undefined'){return}patch.updates.forEach(function(update){var obj=root_obj;update.path.forEach(function(idx){obj=obj&&obj.children[idx]});if(typeof obj==='undefined'){return}if(update.hasOwnProperty('color')){obj.children.forEach(function(child){if(child.material&&child.material.color){child.material.color.set(update.color)}})}if(update.hasOwnProperty('radius')&&obj.userData.radius){var scale=update.radius/obj.userData.radius;obj.children.forEach(function(child){if(obj.userData.type==='spheres'){child.scale.setScalar(scale)}else if(obj.userData.type==='cylinders'){child.scale.x=scale;child.scale.z=scale}})}});this.renderScene()}},{key:'makeLights',value:function makeLights(light_json){var lights=new THREE.Object3D;lights.name='lights';light_json.forEach(function(light){switch(light.type){case'DirectionalLight':var lightObj=new(Function.prototype.bind.apply(THREE.DirectionalLight,[null].concat(_toConsumableArray(light.args))));if(light.helper){var lightHelper=new THREE.DirectionalLightHelper(lightObj,5,'#444444');lightObj.add(lightHelper)}break;case'AmbientLight':var lightObj=new(Function.prototype.bind.apply(THREE.AmbientLight,[null].concat(_toConsumableArray(light.args))));break;case'HemisphereLight':var lightObj=new(Function.prototype.bind.apply(THREE.HemisphereLight,[null].concat(_toConsumableArray(light.args))));break;default:throw new Error('Unknown light.');}if(light.hasOwnProperty('position')){var _lightObj$position;(_lightObj$position=lightObj.position).set.apply(_lightObj$position,_toConsumableArray(light.position))}lights.add(lightObj)});return lights}},{key:'makeObject',value:function makeObject(object_json){var obj=new THREE.Object3D;obj.name=object_json.name;obj.userData.type=object_json.type;if(object_json.visible){obj.visible=object_json.visible}if(object_json.clickable){obj.reference=object_json.reference;this.clickable_objects.push(obj)};switch(object_json.type){case'spheres':{obj.userData.radius=object_json.radius;var geom=new THREE.SphereBufferGeometry(object_json.radius*this.settings.sphereScale,this.settings.sphereSegments,this.settings.sphereSegments,object_json.phiStart||0,object_json.phiEnd||Math.PI*2);var mat=this.makeMaterial(object_json.color);var meshes=[];Simple3DScene.decodeNestedArray(object_json.positions).forEach(function(position){var _mesh$position;var mesh=new THREE.Mesh(geom,mat);(_mesh$position=mesh.position).set.apply(_mesh$position,_toConsumableArray(position));meshes.push(mesh)});meshes.forEach(function(mesh){obj.add(mesh)});return obj}case'ellipsoids':{var _geom=new THREE.SphereBufferGeometry(this.settings.sphereScale,this.settings.sphereSegments,this.settings.sphereSegments,object_json.phiStart||0,object_json.phiEnd||Math.PI*2);var _mat=this.makeMaterial(object_json.color);var _meshes=[];Simple3DScene.decodeNestedArray(object_json.positions).forEach(function(position){var _mesh$position2,_mesh$scale;var mesh=new THREE.Mesh(_geom,_mat);(_mesh$position2=mesh.position).set.apply(_mesh$position2,_toConsumableArray(position));(_mesh$scale=mesh.scale).set.apply(_mesh$scale,_toConsumableArray(object_json.scale));_meshes.push(mesh)});var vec_z=new THREE.Vector3(0,0,1);var quaternion=new THREE.Quaternion;Simple3DScene.decodeNestedArray(object_json.rotate_to).forEach(function(rotation,index){var rotation_vec=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(rotation))));quaternion.setFromUnitVectors(vec_z,rotation_vec.normalize());_meshes[index].setRotationFromQuaternion(quaternion)});_meshes.forEach(function(mesh){obj.add(mesh)});return obj}case'cylinders':{var radius=object_json.radius||1;obj.userData.radius=radius;var _geom2=new THREE.CylinderBufferGeometry(radius*this.settings.cylinderScale,radius*this.settings.cylinderScale,1,this.settings.cylinderSegments);var _mat2=this.makeMaterial(object_json.color);var vec_y=new THREE.Vector3(0,1,0);var _quaternion=new THREE.Quaternion;Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function(positionPair){var mesh=new THREE.Mesh(_geom2,_mat2);var vec_a=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(positionPair[0]))));var vec_b=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(positionPair[1]))));var vec_rel=vec_b.sub(vec_a);mesh.scale.y=vec_rel.length();var vec_midpoint=vec_a.add(vec_rel.clone().multiplyScalar(0.5));mesh.position.set(vec_midpoint.x,vec_midpoint.y,vec_midpoint.z);_quaternion.setFromUnitVectors(vec_y,vec_rel.normalize());mesh.setRotationFromQuaternion(_quaternion);obj.add(mesh)});return obj}case'cubes':{var _geom3=new THREE.BoxBufferGeometry(object_json.width*this.settings.sphereScale,object_json.width*this.settings.sphereScale,object_json.width*this.settings.sphereScale);var _mat3=this.makeMaterial(object_json.color);Simple3DScene.decodeNestedArray(object_json.positions).forEach(function(position){var _mesh$position3;var mesh=new THREE.Mesh(_geom3,_mat3);(_mesh$position3=mesh.position).set.apply(_mesh$position3,_toConsumableArray(position));obj.add(mesh)});return obj}case'lines':{var verts=new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.positions),3);var _geom4=new THREE.BufferGeometry;_geom4.addAttribute('position',verts);var _mat4=void 0;if(object_json.dashSize||object_json.scale||object_json.gapSize){_mat4=new THREE.LineDashedMaterial({color:object_json.color||'#000000',linewidth:object_json.line_width||1,scale:object_json.scale||1,dashSize:object_json.dashSize||3,gapSize:object_json.gapSize||1})}else{_mat4=new THREE.LineBasicMaterial({color:object_json.color||'#2c3c54',linewidth:object_json.line_width||1})}var mesh=new THREE.LineSegments(_geom4,_mat4);if(object_json.dashSize||object_json.scale||object_json.gapSize){mesh.computeLineDistances()}obj.add(mesh);return obj}case'surface':{var _verts=new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.positions),3);var _geom5=new THREE.BufferGeometry;_geom5.addAttribute('position',_verts);var opacity=object_json.opacity||this.settings.defaultSurfaceOpacity;var _mat5=this.makeMaterial(object_json.color,opacity);if(object_json.normals){var normals=new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.normals),3);_geom5.addAttribute('normal',normals)}else{_geom5.computeFaceNormals();_mat5.side=THREE.DoubleSide}if(opacity){_mat5.transparent=true;_mat5.depthWrite=false}var _mesh=new THREE.Mesh(_geom5,_mat5);obj.add(_mesh);return obj}case'convex':{var points=Simple3DScene.decodeNestedArray(object_json.positions).map(function(p){return new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(p))))});var _geom6=new THREE.ConvexBufferGeometry(points);var _opacity=object_json.opacity||this.settings.defaultSurfaceOpacity;var _mat6=this.makeMaterial(object_json.color,_opacity);if(_opacity){_mat6.transparent=true;_mat6.depthWrite=false}var _mesh2=new THREE.Mesh(_geom6,_mat6);obj.add(_mesh2);var edges=new THREE.EdgesGeometry(_geom6);var line=new THREE.LineSegments(edges,new THREE.LineBasicMaterial({color:object_json.color}));obj.add(line);return obj}case'arrows':{var _radius=object_json.radius||1;var headLength=object_json.headLength||2;var headWidth=object_json.headWidth||2;var geom_cyl=new THREE.CylinderBufferGeometry(_radius*this.settings.cylinderScale,_radius*this.settings.cylinderScale,1,this.settings.cylinderSegments);var geom_head=new THREE.ConeBufferGeometry(headWidth*this.settings.cylinderScale,headLength*this.settings.cylinderScale,this.settings.cylinderSegments);var _mat7=this.makeMaterial(object_json.color);var _vec_y=new THREE.Vector3(0,1,0);var _vec_z=new THREE.Vector3(0,0,1);var _quaternion2=new THREE.Quaternion;var quaternion_head=new THREE.Quaternion;Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function(positionPair){var mesh=new THREE.Mesh(geom_cyl,_mat7);var vec_a=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(positionPair[0]))));var vec_b=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(positionPair[1]))));var vec_head=new(Function.prototype.bind.apply(THREE.Vector3,[null].concat(_toConsumableArray(positionPair[1]))));var vec_rel=vec_b.sub(vec_a);mesh.scale.y=vec_rel.length();var vec_midpoint=vec_a.add(vec_rel.clone().multiplyScalar(0.5));mesh.position.set(vec_midpoint.x,vec_midpoint.y,vec_midpoint.z);_quaternion2.setFromUnitVectors(_vec_y,vec_rel.normalize());mesh.setRotationFromQuaternion(_quaternion2);obj.add(mesh);var mesh_head=new THREE.Mesh(geom_head,_mat7);mesh_head.position.set(vec_head.x,vec_head.y,vec_head.z);quaternion_head.setFromUnitVectors(_vec_y,vec_rel.normalize());mesh_head.setRotationFromQuaternion(quaternion_head);obj.add(mesh_head)});return obj}case'labels':{return obj}default:{return obj}}}},{key:'makeMaterial',value:function makeMaterial(color,opacity){var parameters=Object.assign(this.settings.material.parameters,{color:color||'#52afb0',opacity:opacity||1});switch(this.settings.material.type){case'MeshStandardMaterial':{return new THREE.MeshStandardMaterial(parameters)}default:throw new Error('Unknown material.');}}},{key:'start',value:function start(){if(!this.frameId){this.frameId=requestAnimationFrame(this.animate)}}},{key:'stop',value:function stop(){cancelAnimationFrame(this.frameId)}},{key:'animate',value:function animate(){this.renderScene();this.frameId=window.requestAnimationFrame(this.animate)}},{key:'renderScene',value:function renderScene(){this.renderer.render(this.scene,this.camera)}},{key:'toggleVisibility',value:function toggleVisibility(namesToVisibility){if(typeof namesToVisibility!=='undefined'){for(var objName in namesToVisibility){if(namesToVisibility.hasOwnProperty(objName)){var obj=this.scene.getObjectByName(objName);if(typeof obj!=='undefined'){obj.visible=Boolean(namesToVisibility[objName])}}}}this.renderScene()}},{key:'getClickedReference',value:function getClickedReference(clientX,clientY){var raycaster=new THREE.Raycaster;var mouse=new THREE.Vector2;mouse.x=clientX/this.renderer.domElement.clientWidth*2-1;mouse.y=-(clientY/this.renderer.domElement.clientHeight)*2+1;raycaster.setFromCamera(mouse,this.camera);var intersects=raycaster.intersectObjects(this.clickable_objects);if(intersects.length>0){return intersects[0].object.reference}return null}}],[{key:'decodeArray',value:function decodeArray(value){var binary=window.atob(value.data);var bytes=new Uint8Array(binary.length);for(var i=0;i<binary.length;i++){bytes[i]=binary.charCodeAt(i)}return new Float32Array(bytes.buffer)}},{key:'isBinaryArray',value:function isBinaryArray(value){return value!==null&&(typeof value==='undefined'?'undefined':_typeof(value))==='object'&&value.hasOwnProperty('@binary')}},{key:'decodeFlatArray',value:function decodeFlatArray(value){if(Simple3DScene.isBinaryArray(value)){return Simple3DScene.decodeArray(value)}return[].concat.apply([],value)}},{key:'decodeNestedArray',value:function decodeNestedArray(value){if(!Simple3DScene.isBinaryArray(value)){return value}var flat=Simple3DScene.decodeArray(value);function nest(offset,shape){if(shape.length===1){return Array.from(flat.subarray(offset,offset+shape[0]))}var stride=shape.slice(1).reduce(function(a,b){return a*b},1);var nested=[];for(var i=0;i<shape[0];i++){nested.push(nest(offset+i*stride,shape.slice(1)))}return nested}return nest(0,value.shape)}},{key:'removeObjectByName',value:function removeObjectByName(scene,name){var object=scene.getObjectByName(name);if(typeof object!=='undefined'){scene.remove(object)}}}]);return Simple3DScene}();exports.default=Simple3DScene;},function(module,__webpack_exports__,__webpack_require__){"use strict";__webpack_require__.r(__webpack_exports__),__webpack_require__.d(__webpack_exports__,"CCDIKSolver",function(){return CCDIKSolver}),__webpack_require__.d(__webpack_exports__,"MMDAnimationHelper",function(){return MMDAnimationHelper}),__webpack_require__.d(__webpack_exports__,"MMDPhysics",function(){return MMDPhysics}),__webpack_require__.d(__webpack_exports__,"AnimationClipCreator",function(){return AnimationClipCreator}),__webpack_require__.d(__webpack_exports__,"CinematicCamera",function(){return CinematicCamera}),__webpack_require__.d(__webpack_exports__,"Car",function(){return Car}),__webpack_require__.d(__webpack_exports__,"DeviceOrientationControls",function(){return DeviceOrientationControls}),__webpack_require__.d(__webpack_exports__,"DragControls",function(){return DragControls}),__webpack_require__.d(__webpack_exports__,"EditorControls",function(){return EditorControls}),__webpack_require__.d(__webpack_exports__,"FirstPersonControls",function(){return FirstPersonControls}),__webpack_require__.d(__webpack_exports__,"FlyControls",function(){return FlyControls}),__webpack_require__.d(__webpack_exports__,"MapControls",function(){return MapControls}),__webpack_require__.d(__webpack_exports__,"OrbitControls",function(){return OrbitControls}),__webpack_require__.d(__webpack_exports__,"OrthographicTrackballControls",function(){return OrthographicTrackballControls}),__webpack_require__.d(__webpack_exports__,"PointerLockControls",function(){return PointerLockControls}),__webpack_require__.d(__webpack_exports__,"TrackballControls",function(){return TrackballControls}),__webpack_require__.d(__webpack_exports__,"TransformControls",function(){return TransformControls}),__webpack_require__.d(__webpack_exports__,"TransformControlsGizmo",function(){return TransformControlsGizmo}),__webpack_require__.d(__webpack_exports__,"TransformControlsPlane",function(){return TransformControlsPlane}),__webpack_require__.d(__webpack_exports__,"ConvexObjectBreaker",function(){return ConvexObjectBreaker}),__webpack_require__.d(__webpack_exports__,"GrannyKnot",function(){return GrannyKnot}),__webpack_require__.d(__webpack_exports__,"HeartCurve",function(){return HeartCurve}),__webpack_require__.d(__webpack_exports__,"VivianiCurve",function(){return VivianiCurve}),__webpack_require__.d(__webpack_exports__,"KnotCurve",function(){return KnotCurve}),__webpack_require__.d(__webpack_exports__,"HelixCurve",function(){return HelixCurve}),__webpack_require__.d(__webpack_exports__,"TrefoilKnot",function(){return TrefoilKnot}),__webpack_require__.d(__webpack_exports__,"TorusKnot",function(){return TorusKnot}),__webpack_require__.d(__webpack_exports__,"CinquefoilKnot",function(){return CinquefoilKnot}),__webpack_require__.d(__webpack_exports__,"TrefoilPolynomialKnot",function(){return TrefoilPolynomialKnot}),__webpack_require__.d(__webpack_exports__,"FigureEightPolynomialKnot",function(){return FigureEightPolynomialKnot}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot4a",function(){return DecoratedTorusKnot4a}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot4b",function(){return DecoratedTorusKnot4b}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot5a",function(){return DecoratedTorusKnot5a}),__webpack_require__.d(__webpack_exports__,"DecoratedTorusKnot5c",function(){return DecoratedTorusKnot5c}),__webpack_require__.d(__webpack_exports__,"NURBSCurve",function(){return NURBSCurve}),__webpack_require__.d(__webpack_exports__,"NURBSSurface",function(){return NURBSSurface}),__webpack_require__.d(__webpack_exports__,"NURBSUtils",function(){return NURBSUtils}),__webpack_require__.d(__webpack_exports__,"AnaglyphEffect",function(){return AnaglyphEffect}),__webpack_require__.d(__webpack_exports__,"AsciiEffect",function(){return AsciiEffect}),__webpack_require__.d(__webpack_exports__,"OutlineEffect",function(){return OutlineEffect}),__webpack_require__.d(__webpack_exports__,"ParallaxBarrierEffect",function(){return ParallaxBarrierEffect}),__webpack_require__.d(__webpack_exports__,"PeppersGhostEffect",function(){return PeppersGhostEffect}),__webpack_require__.d(__webpack_exports__,"StereoEffect",function(){return StereoEffect}),__webpack_require__.d(__webpack_exports__,"ColladaExporter",function(){return ColladaExporter}),__webpack_require__.d(__webpack_exports__,"GLTFExporter",function(){return GLTFExporter}),__webpack_require__.d(__webpack_exports__,"MMDExporter",function(){return MMDExporter}),__webpack_require__.d(__webpack_exports__,"OBJExporter",function(){return OBJExporter}),__webpack_require__.d(__webpack_exports__,"PLYExporter",function(){return PLYExporter}),__webpack_require__.d(__webpack_exports__,"STLExporter",function(){return STLExporter}),__webpack_require__.d(__webpack_exports__,"TypedGeometryExporter",function(){return TypedGeometryExporter}),__webpack_require__.d(__webpack_exports__,"BoxLineGeometry",function(){return BoxLineGeometry}),__webpack_require__.d(__webpack_exports__,"ConvexGeometry",function(){return ConvexGeometry}),__webpack_require__.d(__webpack_exports__,"ConvexBufferGeometry",function(){return ConvexBufferGeometry}),__webpack_require__.d(__webpack_exports__,"DecalGeometry",function(){return DecalGeometry}),__webpack_require__.d(__webpack_exports__,"hilbert2D",function(){return hilbert2D}),__webpack_require__.d(__webpack_exports__,"hilbert3D",function(){return hilbert3D}),__webpack_require__.d(__webpack_exports__,"LightningStrike",function(){return LightningStrike}),__webpack_require__.d(__webpack_exports__,"TeapotBufferGeometry",function(){return TeapotBufferGeometry}),__webpack_require__.d(__webpack_exports__,"GPUComputationRenderer",function(){return GPUComputationRenderer}),__webpack_require__.d(__webpack_exports__,"GPUParticleSystem",function(){return GPUParticleSystem}),__webpack_require__.d(__webpack_exports__,"GPUParticleContainer",function(){return GPUParticleContainer}),__webpack_require__.d(__webpack_exports__,"Gyroscope",function(){return Gyroscope}),__webpack_require__.d(__webpack_exports__,"ImprovedNoise",function(){return ImprovedNoise}),__webpack_require__.d(__webpack_exports__,"SelectionBox",function(){return SelectionBox}),__webpack_require__.d(__webpack_exports__,"SelectionHelper",function(){return SelectionHelper}),__webpack_require__.d(__webpack_exports__,"Line2",function(){return Line2}),__webpack_require__.d(__webpack_exports__,"LineGeometry",function(){return LineGeometry}),__webpack_require__.d(__webpack_exports__,"LineMaterial",function(){return LineMaterial}),__webpack_require__.d(__webpack_exports__,"LineSegments2",function(){return LineSegments2}),__webpack_require__.d(__webpack_exports__,"LineSegmentsGeometry",function(){return LineSegmentsGeometry}),__webpack_require__.d(__webpack_exports__,"Wireframe",function(){return Wireframe}),__webpack_require__.d(__webpack_exports__,"WireframeGeometry2",function(){return WireframeGeometry2}),__webpack_require__.d(__webpack_exports__,"ThreeMFLoader",function(){return ThreeMFLoader}),__webpack_require__.d(__webpack_exports__,"AMFLoader",function(){return AMFLoader}),__webpack_require__.d(__webpack_exports__,"AssimpJSONLoader",function(){return AssimpJSONLoader}),__webpack_require__.d(__webpack_exports__,"AssimpLoader",function(){return AssimpLoader}),__webpack_require__.d(__webpack_exports__,"AWDLoader",function(){return AWDLoader}),__webpack_require__.d(__webpack_exports__,"BabylonLoader",function(){return BabylonLoader}),__webpack_require__.d(__webpack_exports__,"BVHLoader",function(){return BVHLoader}),__webpack_require__.d(__webpack_exports__,"ColladaLoader",function(){return ColladaLoader}),__webpack_require__.d(__webpack_exports__,"DDSLoader",function(){return DDSLoader}),__webpack_require__.d(__webpack_exports__,"LegacyGLTFLoader",function(){return LegacyGLTFLoader}),__webpack_require__.d(__webpack_exports__,"LegacyJSONLoader",function(){return LegacyJSONLoader}),__webpack_require__.d(__webpack_exports__,"DRACOLoader",function(){return DRACOLoader$1}),__webpack_require__.d(__webpack_exports__,"CubemapGenerator",function(){return CubemapGenerator}),__webpack_require__.d(__webpack_exports__,"EXRLoader",function(){return EXRLoader}),__webpack_require__.d(__webpack_exports__,"FBXLoader",function(){return FBXLoader}),__webpack_require__.d(__webpack_exports__,"GCodeLoader",function(){return GCodeLoader}),__webpack_require__.d(__webpack_exports__,"GLTFLoader",function(){return GLTFLoader}),__webpack_require__.d(__webpack_exports__,"HDRCubeTextureLoader",function(){return HDRCubeTextureLoader}),__webpack_require__.d(__webpack_exports__,"KMZLoader",function(){return KMZLoader}),__webpack_require__.d(__webpack_exports__,"KTXLoader",function(){return KTXLoader}),__webpack_require__.d(__webpack_exports__,"LDrawLoader",function(){return LDrawLoader}),__webpack_require__.d(__webpack_exports__,"LoaderSupport",function(){return LoaderSupport}),__webpack_require__.d(__webpack_exports__,"MD2Loader",function(){return MD2Loader}),__webpack_require__.d(__webpack_exports__,"MMDLoader",function(){return MMDLoader}),__webpack_require__.d(__webpack_exports__,"MTLLoader",function(){return MTLLoader}),__webpack_require__.d(__webpack_exports__,"NodeMaterialLoader",function(){return NodeMaterialLoader}),__webpack_require__.d(__webpack_exports__,"OBJLoader",function(){return OBJLoader}),__webpack_require__.d(__webpack_exports__,"OBJLoader2",function(){return OBJLoader2}),__webpack_require__.d(__webpack_exports__,"PCDLoader",function(){return PCDLoader}),__webpack_require__.d(__webpack_exports__,"PDBLoader",function(){return PDBLoader}),__webpack_require__.d(__webpack_exports__,"PlayCanvasLoader",function(){return PlayCanvasLoader}),__webpack_require__.d(__webpack_exports__,"PLYLoader",function(){return PLYLoader}),__webpack_require__.d(__webpack_exports__,"PRWMLoader",function(){return PRWMLoader}),__webpack_require__.d(__webpack_exports__,"PVRLoader",function(){return PVRLoader}),__webpack_require__.d(__webpack_exports__,"HDRLoader",function(){return HDRLoader}),__webpack_require__.d(__webpack_exports__,"RGBELoader",function(){return RGBELoader}),__webpack_require__.d(__webpack_exports__,"STLLoader",function(){return STLLoader}),__webpack_require__.d(__webpack_exports__,"SVGLoader",function(){return SVGLoader}),__webpack_require__.d(__webpack_exports__,"TDSLoader",function(){return TDSLoader}),__webpack_require__.d(__webpack_exports__,"TGALoader",function(){return TGALoader}),__webpack_require__.d(__webpack_exports__,"TTFLoader",function(){return TTFLoader}),__webpack_require__.d(__webpack_exports__,"VRMLLoader",function(){return VRMLLoader}),__webpack_require__.d(__webpack_exports__,"VRMLoader",function(){return VRMLoader}),__webpack_require__.d(__webpack_exports__,"VTKLoader",function(){return VTKLoader}),__webpack_require__.d(__webpack_exports__,"MarchingCubes",function(){return MarchingCubes}),__webpack_require__.d(__webpack_exports__,"ColorConverter",function(){return ColorConverter}),__webpack_require__.d(__webpack_exports__,"Lut",function(){return Lut}),__webpack_require__.d(__webpack_exports__,"MD2Character",function(){return MD2Character}),__webpack_require__.d(__webpack_exports__,"MD2CharacterComplex",function(){return MD2CharacterComplex}),__webpack_require__.d(__webpack_exports__,"ExplodeModifier",function(){return ExplodeModifier}),__webpack_require__.d(__webpack_exports__,"SimplifyModifier",function(){return SimplifyModifier}),__webpack_require__.d(__webpack_exports__,"SubdivisionModifier",function(){return SubdivisionModifier}),__webpack_require__.d(__webpack_exports__,"TessellateModifier",function(){return TessellateModifier}),__webpack_require__.d(__webpack_exports__,"MorphAnimMesh",function(){return MorphAnimMesh}),__webpack_require__.d(__webpack_exports__,"MorphBlendMesh",function(){return MorphBlendMesh}),__webpack_require__.d(__webpack_exports__,"CameraNode",function(){return CameraNode}),__webpack_require__.d(__webpack_exports__,"ColorsNode",function(){return ColorsNode}),__webpack_require__.d(__webpack_exports__,"LightNode",function(){return LightNode}),__webpack_require__.d(__webpack_exports__,"NormalNode",function(){return NormalNode$1}),__webpack_require__.d(__webpack_exports__,"PositionNode",function(){return PositionNode}),__webpack_require__.d(__webpack_exports__,"ReflectNode",function(){return ReflectNode}),__webpack_require__.d(__webpack_exports__,"ResolutionNode",function(){return ResolutionNode}),__webpack_require__.d(__webpack_exports__,"ScreenUVNode",function(){return ScreenUVNode}),__webpack_require__.d(__webpack_exports__,"UVNode",function(){return UVNode}),__webpack_require__.d(__webpack_exports__,"BlinnExponentToRoughnessNode",function(){return BlinnExponentToRoughnessNode}),__webpack_require__.d(__webpack_exports__,"BlinnShininessExponentNode",function(){return BlinnShininessExponentNode}),__webpack_require__.d(__webpack_exports__,"RoughnessToBlinnExponentNode",function(){return RoughnessToBlinnExponentNode}),__webpack_require__.d(__webpack_exports__,"AttributeNode",function(){return AttributeNode}),__webpack_require__.d(__webpack_exports__,"ConstNode",function(){return ConstNode}),__webpack_require__.d(__webpack_exports__,"ExpressionNode",function(){return ExpressionNode}),__webpack_require__.d(__webpack_exports__,"FunctionCallNode",function(){return FunctionCallNode}),__webpack_require__.d(__webpack_exports__,"FunctionNode",function(){return FunctionNode}),__webpack_require__.d(__webpack_exports__,"InputNode",function(){return InputNode}),__webpack_require__.d(__webpack_exports__,"Node",function(){return Node$1}),__webpack_require__.d(__webpack_exports__,"NodeBuilder",function(){return NodeBuilder}),__webpack_require__.d(__webpack_exports__,"NodeFrame",function(){return NodeFrame}),__webpack_require__.d(__webpack_exports__,"NodeLib",function(){return NodeLib}),__webpack_require__.d(__webpack_exports__,"NodeUniform",function(){return NodeUniform}),__webpack_require__.d(__webpack_exports__,"NodeUtils",function(){return NodeUtils}),__webpack_require__.d(__webpack_exports__,"StructNode",function(){return StructNode}),__webpack_require__.d(__webpack_exports__,"TempNode",function(){return TempNode}),__webpack_require__.d(__webpack_exports__,"VarNode",function(){return VarNode}),__webpack_require__.d(__webpack_exports__,"BlurNode",function(){return BlurNode}),__webpack_require__.d(__webpack_exports__,"ColorAdjustmentNode",function(){return ColorAdjustmentNode}),__webpack_require__.d(__webpack_exports__,"LuminanceNode",function(){return LuminanceNode}),__webpack_require__.d(__webpack_exports__,"BoolNode",function(){return BoolNode}),__webpack_require__.d(__webpack_exports__,"ColorNode",function(){return ColorNode}),__webpack_require__.d(__webpack_exports__,"CubeTextureNode",function(){return CubeTextureNode}),__webpack_require__.d(__webpack_exports__,"FloatNode",function(){return FloatNode}),__webpack_require__.d(__webpack_exports__,"IntNode",function(){return IntNode}),__webpack_require__.d(__webpack_exports__,"Matrix3Node",function(){return Matrix3Node}),__webpack_require__.d(__webpack_exports__,"Matrix4Node",function(){return Matrix4Node}),__webpack_require__.d(__webpack_exports__,"PropertyNode",function(){return PropertyNode}),__webpack_require__.d(__webpack_exports__,"ReflectorNode",function(){return ReflectorNode}),__webpack_require__.d(__webpack_exports__,"RTTNode",function(){return RTTNode}),__webpack_require__.d(__webpack_exports__,"ScreenNode",function(){return ScreenNode}),__webpack_require__.d(__webpack_exports__,"TextureNode",function(){return TextureNode}),__webpack_require__.d(__webpack_exports__,"Vector2Node",function(){return Vector2Node}),__webpack_require__.d(__webpack_exports__,"Vector3Node",function(){return Vector3Node}),__webpack_require__.d(__webpack_exports__,"Vector4Node",function(){return Vector4Node}),__webpack_require__.d(__webpack_exports__,"MeshStandardNodeMaterial",function(){return MeshStandardNodeMaterial}),__webpack_require__.d(__webpack_exports__,"NodeMaterial",function(){return NodeMaterial}),__webpack_require__.d(__webpack_exports__,"MeshStandardNode",function(){return MeshStandardNode}),__webpack_require__.d(__webpack_exports__,"PhongNode",function(){return PhongNode}),__webpack_require__.d(__webpack_exports__,"RawNode",function(){return RawNode}),__webpack_require__.d(__webpack_exports__,"SpriteNode",function(){return SpriteNode}),__webpack_require__.d(__webpack_exports__,"StandardNode",function(){return StandardNode}),__webpack_require__.d(__webpack_exports__,"PhongNodeMaterial",function(){return PhongNodeMaterial}),__webpack_require__.d(__webpack_exports__,"SpriteNodeMaterial",function(){return SpriteNodeMaterial}),__webpack_require__.d(__webpack_exports__,"StandardNodeMaterial",function(){return StandardNodeMaterial}),__webpack_require__.d(__webpack_exports__,"CondNode",function(){return CondNode}),__webpack_require__.d(__webpack_exports__,"Math1Node",function(){return Math1Node}),__webpack_require__.d(__webpack_exports__,"Math2Node",function(){return Math2Node}),__webpack_require__.d(__webpack_exports__,"Math3Node",function(){return Math3Node}),__webpack_require__.d(__webpack_exports__,"OperatorNode",function(){return OperatorNode}),__webpack_require__.d(__webpack_exports__,"BumpMapNode",function(){return BumpMapNode}),__webpack_require__.d(__webpack_exports__,"NormalMapNode",function(){return NormalMapNode}),__webpack_require__.d(__webpack_exports__,"TextureCubeNode",function(){return TextureCubeNode}),__webpack_require__.d(__webpack_exports__,"TextureCubeUVNode",function(){return TextureCubeUVNode}),__webpack_require__.d(__webpack_exports__,"NodePass",function(){return NodePass}),__webpack_require__.d(__webpack_exports__,"NodePostProcessing",function(){return NodePostProcessing}),__webpack_require__.d(__webpack_exports__,"CheckerNode",function(){return CheckerNode}),__webpack_require__.d(__webpack_exports__,"NoiseNode",function(){return NoiseNode}),__webpack_require__.d(__webpack_exports__,"BypassNode",function(){return BypassNode}),__webpack_require__.d(__webpack_exports__,"ColorSpaceNode",function(){return ColorSpaceNode}),__webpack_require__.d(__webpack_exports__,"JoinNode",function(){return JoinNode}),__webpack_require__.d(__webpack_exports__,"MaxMIPLevelNode",function(){return MaxMIPLevelNode}),__webpack_require__.d(__webpack_exports__,"SwitchNode",function(){return SwitchNode}),__webpack_require__.d(__webpack_exports__,"TimerNode",function(){return TimerNode}),__webpack_require__.d(__webpack_exports__,"UVTransformNode",function(){return UVTransformNode}),__webpack_require__.d(__webpack_exports__,"VelocityNode",function(){return VelocityNode}),__webpack_require__.d(__webpack_exports__,"Fire",function(){return Fire}),__webpack_require__.d(__webpack_exports__,"Lensflare",function(){return Lensflare}),__webpack_require__.d(__webpack_exports__,"LensflareElement",function(){return LensflareElement}),__webpack_require__.d(__webpack_exports__,"LightningStorm",function(){return LightningStorm}),__webpack_require__.d(__webpack_exports__,"Reflector",function(){return Reflector}),__webpack_require__.d(__webpack_exports__,"ReflectorRTT",function(){return ReflectorRTT}),__webpack_require__.d(__webpack_exports__,"Refractor",function(){return Refractor}),__webpack_require__.d(__webpack_exports__,"ShadowMesh",function(){return ShadowMesh}),__webpack_require__.d(__webpack_exports__,"Sky",function(){return Sky}),__webpack_require__.d(__webpack_exports__,"Water",function(){return Water}),__webpack_require__.d(__webpack_exports__,"Water2",function(){return Water2}),__webpack_require__.d(__webpack_exports__,"Ocean",function(){return Ocean}),__webpack_require__.d(__webpack_exports__,"PMREMCubeUVPacker",function(){return PMREMCubeUVPacker}),__webpack_require__.d(__webpack_exports__,"PMREMGenerator",function(){return PMREMGenerator}),__webpack_require__.d(__webpack_exports__,"AdaptiveToneMappingPass",function(){return AdaptiveToneMappingPass}),__webpack_require__.d(__webpack_exports__,"AfterimagePass",function(){return AfterimagePass}),__webpack_require__.d(__webpack_exports__,"BloomPass",function(){return BloomPass}),__webpack_require__.d(__webpack_exports__,"BokehPass",function(){return BokehPass}),__webpack_require__.d(__webpack_exports__,"ClearPass",function(){return ClearPass}),__webpack_require__.d(__webpack_exports__,"CubeTexturePass",function(){return CubeTexturePass}),__webpack_require__.d(__webpack_exports__,"DotScreenPass",function(){return DotScreenPass}),__webpack_require__.d(__webpack_exports__,"EffectComposer",function(){return EffectComposer}),__webpack_require__.d(__webpack_exports__,"FilmPass",function(){return FilmPass}),__webpack_require__.d(__webpack_exports__,"GlitchPass",function(){return GlitchPass}),__webpack_require__.d(__webpack_exports__,"HalftonePass",function(){return HalftonePass}),__webpack_require__.d(__webpack_exports__,"MaskPass",function(){return MaskPass}),__webpack_require__.d(__webpack_exports__,"ClearMaskPass",function(){return ClearMaskPass}),__webpack_require__.d(__webpack_exports__,"OutlinePass",function(){return OutlinePass}),__webpack_require__.d(__webpack_exports__,"Pass",function(){return Pass}),__webpack_require__.d(__webpack_exports__,"RenderPass",function(){return RenderPass}),__webpack_require__.d(__webpack_exports__,"SAOPass",function(){return SAOPass}),__webpack_require__.d(__webpack_exports__,"SavePass",function(){return SavePass}),__webpack_require__.d(__webpack_exports__,"ShaderPass",function(){return ShaderPass}),__webpack_require__.d(__webpack_exports__,"SMAAPass",function(){return SMAAPass}),__webpack_require__.d(__webpack_exports__,"SSAARenderPass",function(){return SSAARenderPass}),__webpack_require__.d(__webpack_exports__,"SSAOPass",function(){return SSAOPass}),__webpack_require__.d(__webpack_exports__,"TAARenderPass",function(){return TAARenderPass}),__webpack_require__.d(__webpack_exports__,"TexturePass",function(){return TexturePass}),__webpack_require__.d(__webpack_exports__,"UnrealBloomPass",function(){return UnrealBloomPass}),__webpack_require__.d(__webpack_exports__,"PRNG",function(){return PRNG}),__webpack_require__.d(__webpack_exports__,"QuickHull",function(){return QuickHull}),__webpack_require__.d(__webpack_exports__,"CSS2DObject",function(){return CSS2DObject}),__webpack_require__.d(__webpack_exports__,"CSS2DRenderer",function(){return CSS2DRenderer}),__webpack_require__.d(__webpack_exports__,"CSS3DObject",function(){return CSS3DObject}),__webpack_require__.d(__webpack_exports__,"CSS3DSprite",function(){return CSS3DSprite}),__webpack_require__.d(__webpack_exports__,"CSS3DRenderer",function(){return CSS3DRenderer}),__webpack_require__.d(__webpack_exports__,"RenderableObject",function(){return RenderableObject}),__webpack_require__.d(__webpack_exports__,"RenderableFace",function(){return RenderableFace}),__webpack_require__.d(__webpack_exports__,"RenderableVertex",function(){return RenderableVertex}),__webpack_require__.d(__webpack_exports__,"RenderableLine",function(){return RenderableLine}),__webpack_require__.d(__webpack_exports__,"RenderableSprite",function(){return RenderableSprite}),__webpack_require__.d(__webpack_exports__,"Projector",function(){return Projector}),__webpack_require__.d(__webpack_exports__,"RaytracingRenderer",function(){return RaytracingRenderer}),__webpack_require__.d(__webpack_exports__,"SoftwareRenderer",function(){return SoftwareRenderer}),__webpack_require__.d(__webpack_exports__,"SVGObject",function(){return SVGObject}),__webpack_require__.d(__webpack_exports__,"SVGRenderer",function(){return SVGRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLDeferredRenderer",function(){return WebGLDeferredRenderer}),__webpack_require__.d(__webpack_exports__,"RollerCoasterGeometry",function(){return RollerCoasterGeometry}),__webpack_require__.d(__webpack_exports__,"RollerCoasterLiftersGeometry",function(){return RollerCoasterLiftersGeometry}),__webpack_require__.d(__webpack_exports__,"RollerCoasterShadowGeometry",function(){return RollerCoasterShadowGeometry}),__webpack_require__.d(__webpack_exports__,"SkyGeometry",function(){return SkyGeometry}),__webpack_require__.d(__webpack_exports__,"TreesGeometry",function(){return TreesGeometry}),__webpack_require__.d(__webpack_exports__,"ShaderGodRays",function(){return ShaderGodRays}),__webpack_require__.d(__webpack_exports__,"AfterimageShader",function(){return AfterimageShader}),__webpack_require__.d(__webpack_exports__,"BasicShader",function(){return BasicShader}),__webpack_require__.d(__webpack_exports__,"BleachBypassShader",function(){return BleachBypassShader}),__webpack_require__.d(__webpack_exports__,"BlendShader",function(){return BlendShader}),__webpack_require__.d(__webpack_exports__,"BokehShader",function(){return BokehShader}),__webpack_require__.d(__webpack_exports__,"BokehShader2",function(){return BokehShader2}),__webpack_require__.d(__webpack_exports__,"BokehDepthShader",function(){return BokehDepthShader}),__webpack_require__.d(__webpack_exports__,"BrightnessContrastShader",function(){return BrightnessContrastShader}),__webpack_require__.d(__webpack_exports__,"ColorCorrectionShader",function(){return ColorCorrectionShader}),__webpack_require__.d(__webpack_exports__,"ColorifyShader",function(){return ColorifyShader}),__webpack_require__.d(__webpack_exports__,"ConvolutionShader",function(){return ConvolutionShader}),__webpack_require__.d(__webpack_exports__,"CopyShader",function(){return CopyShader}),__webpack_require__.d(__webpack_exports__,"DepthLimitedBlurShader",function(){return DepthLimitedBlurShader}),__webpack_require__.d(__webpack_exports__,"BlurShaderUtils",function(){return BlurShaderUtils}),__webpack_require__.d(__webpack_exports__,"DigitalGlitch",function(){return DigitalGlitch}),__webpack_require__.d(__webpack_exports__,"DOFMipMapShader",function(){return DOFMipMapShader}),__webpack_require__.d(__webpack_exports__,"DotScreenShader",function(){return DotScreenShader}),__webpack_require__.d(__webpack_exports__,"FilmShader",function(){return FilmShader}),__webpack_require__.d(__webpack_exports__,"FocusShader",function(){return FocusShader}),__webpack_require__.d(__webpack_exports__,"FreiChenShader",function(){return FreiChenShader}),__webpack_require__.d(__webpack_exports__,"FresnelShader",function(){return FresnelShader}),__webpack_require__.d(__webpack_exports__,"FXAAShader",function(){return FXAAShader}),__webpack_require__.d(__webpack_exports__,"GammaCorrectionShader",function(){return GammaCorrectionShader}),__webpack_require__.d(__webpack_exports__,"HalftoneShader",function(){return HalftoneShader}),__webpack_require__.d(__webpack_exports__,"HorizontalBlurShader",function(){return HorizontalBlurShader}),__webpack_require__.d(__webpack_exports__,"HorizontalTiltShiftShader",function(){return HorizontalTiltShiftShader}),__webpack_require__.d(__webpack_exports__,"HueSaturationShader",function(){return HueSaturationShader}),__webpack_require__.d(__webpack_exports__,"KaleidoShader",function(){return KaleidoShader}),__webpack_require__.d(__webpack_exports__,"LuminosityHighPassShader",function(){return LuminosityHighPassShader}),__webpack_require__.d(__webpack_exports__,"LuminosityShader",function(){return LuminosityShader}),__webpack_require__.d(__webpack_exports__,"MirrorShader",function(){return MirrorShader}),__webpack_require__.d(__webpack_exports__,"NormalMapShader",function(){return NormalMapShader}),__webpack_require__.d(__webpack_exports__,"ParallaxShader",function(){return ParallaxShader}),__webpack_require__.d(__webpack_exports__,"PixelShader",function(){return PixelShader}),__webpack_require__.d(__webpack_exports__,"RGBShiftShader",function(){return RGBShiftShader}),__webpack_require__.d(__webpack_exports__,"SAOShader",function(){return SAOShader}),__webpack_require__.d(__webpack_exports__,"SepiaShader",function(){return SepiaShader}),__webpack_require__.d(__webpack_exports__,"SMAAShader",function(){return SMAAShader}),__webpack_require__.d(__webpack_exports__,"SobelOperatorShader",function(){return SobelOperatorShader}),__webpack_require__.d(__webpack_exports__,"SSAOShader",function(){return SSAOShader}),__webpack_require__.d(__webpack_exports__,"SSAODepthShader",function(){return SSAODepthShader}),__webpack_require__.d(__webpack_exports__,"SSAOBlurShader",function(){return SSAOBlurShader}),__webpack_require__.d(__webpack_exports__,"TechnicolorShader",function(){return TechnicolorShader}),__webpack_require__.d(__webpack_exports__,"ToneMapShader",function(){return ToneMapShader}),__webpack_require__.d(__webpack_exports__,"TriangleBlurShader",function(){return TriangleBlurShader}),__webpack_require__.d(__webpack_exports__,"UnpackDepthRGBAShader",function(){return UnpackDepthRGBAShader}),__webpack_require__.d(__webpack_exports__,"VerticalBlurShader",function(){return VerticalBlurShader}),__webpack_require__.d(__webpack_exports__,"VerticalTiltShiftShader",function(){return VerticalTiltShiftShader}),__webpack_require__.d(__webpack_exports__,"VignetteShader",function(){return VignetteShader}),__webpack_require__.d(__webpack_exports__,"VolumeRenderShader1",function(){return VolumeRenderShader1}),__webpack_require__.d(__webpack_exports__,"WaterRefractionShader",function(){return WaterRefractionShader}),__webpack_require__.d(__webpack_exports__,"ShaderSkin",function(){return ShaderSkin}),__webpack_require__.d(__webpack_exports__,"ShaderTerrain",function(){return ShaderTerrain}),__webpack_require__.d(__webpack_exports__,"ShaderToon",function(){return ShaderToon}),__webpack_require__.d(__webpack_exports__,"TranslucentShader",function(){return TranslucentShader}),__webpack_require__.d(__webpack_exports__,"SimplexNoise",function(){return SimplexNoise}),__webpack_require__.d(__webpack_exports__,"TimelinerController",function(){return TimelinerController}),__webpack_require__.d(__webpack_exports__,"TypedArrayUtils",function(){return TypedArrayUtils}),__webpack_require__.d(__webpack_exports__,"BufferGeometryUtils",function(){return BufferGeometryUtils}),__webpack_require__.d(__webpack_exports__,"GeometryUtils",function(){return GeometryUtils}),__webpack_require__.d(__webpack_exports__,"MathUtils",function(){return MathUtils}),__webpack_require__.d(__webpack_exports__,"SceneUtils",function(){return SceneUtils}),__webpack_require__.d(__webpack_exports__,"ShadowMapViewer",function(){return ShadowMapViewer}),__webpack_require__.d(__webpack_exports__,"SkeletonUtils",function(){return SkeletonUtils}),__webpack_require__.d(__webpack_exports__,"UVsDebug",function(){return UVsDebug}),__webpack_require__.d(__webpack_exports__,"VolumeSlice",function(){return VolumeSlice}),__webpack_require__.d(__webpack_exports__,"DaydreamController",function(){return DaydreamController}),__webpack_require__.d(__webpack_exports__,"GearVRController",function(){return GearVRController}),__webpack_require__.d(__webpack_exports__,"PaintViveController",function(){return PaintViveController}),__webpack_require__.d(__webpack_exports__,"ViveController",function(){return ViveController}),__webpack_require__.d(__webpack_exports__,"WebVR",function(){return WebVR}),__webpack_require__.d(__webpack_exports__,"WebGL",function(){return WebGL}),__webpack_require__.d(__webpack_exports__,"AnimationAction",function(){return AnimationAction}),__webpack_require__.d(__webpack_exports__,"AnimationClip",function(){return AnimationClip}),__webpack_require__.d(__webpack_exports__,"AnimationMixer",function(){return AnimationMixer}),__webpack_require__.d(__webpack_exports__,"AnimationObjectGroup",function(){return AnimationObjectGroup}),__webpack_require__.d(__webpack_exports__,"AnimationUtils",function(){return AnimationUtils}),__webpack_require__.d(__webpack_exports__,"KeyframeTrack",function(){return KeyframeTrack}),__webpack_require__.d(__webpack_exports__,"PropertyBinding",function(){return PropertyBinding}),__webpack_require__.d(__webpack_exports__,"PropertyMixer",function(){return PropertyMixer}),__webpack_require__.d(__webpack_exports__,"BooleanKeyframeTrack",function(){return BooleanKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"ColorKeyframeTrack",function(){return ColorKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"NumberKeyframeTrack",function(){return NumberKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"QuaternionKeyframeTrack",function(){return QuaternionKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"StringKeyframeTrack",function(){return StringKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"VectorKeyframeTrack",function(){return VectorKeyframeTrack}),__webpack_require__.d(__webpack_exports__,"Audio",function(){return Audio}),__webpack_require__.d(__webpack_exports__,"AudioAnalyser",function(){return AudioAnalyser}),__webpack_require__.d(__webpack_exports__,"AudioContext",function(){return AudioContext}),__webpack_require__.d(__webpack_exports__,"AudioListener",function(){return AudioListener}),__webpack_require__.d(__webpack_exports__,"PositionalAudio",function(){return PositionalAudio}),__webpack_require__.d(__webpack_exports__,"ArrayCamera",function(){return ArrayCamera}),__webpack_require__.d(__webpack_exports__,"Camera",function(){return Camera}),__webpack_require__.d(__webpack_exports__,"CubeCamera",function(){return CubeCamera}),__webpack_require__.d(__webpack_exports__,"OrthographicCamera",function(){return OrthographicCamera}),__webpack_require__.d(__webpack_exports__,"PerspectiveCamera",function(){return PerspectiveCamera}),__webpack_require__.d(__webpack_exports__,"StereoCamera",function(){return StereoCamera}),__webpack_require__.d(__webpack_exports__,"REVISION",function(){return REVISION}),__webpack_require__.d(__webpack_exports__,"MOUSE",function(){return MOUSE}),__webpack_require__.d(__webpack_exports__,"CullFaceNone",function(){return CullFaceNone}),__webpack_require__.d(__webpack_exports__,"CullFaceBack",function(){return CullFaceBack}),__webpack_require__.d(__webpack_exports__,"CullFaceFront",function(){return CullFaceFront}),__webpack_require__.d(__webpack_exports__,"CullFaceFrontBack",function(){return CullFaceFrontBack}),__webpack_require__.d(__webpack_exports__,"FrontFaceDirectionCW",function(){return FrontFaceDirectionCW}),__webpack_require__.d(__webpack_exports__,"FrontFaceDirectionCCW",function(){return FrontFaceDirectionCCW}),__webpack_require__.d(__webpack_exports__,"BasicShadowMap",function(){return BasicShadowMap}),__webpack_require__.d(__webpack_exports__,"PCFShadowMap",function(){return PCFShadowMap}),__webpack_require__.d(__webpack_exports__,"PCFSoftShadowMap",function(){return PCFSoftShadowMap}),__webpack_require__.d(__webpack_exports__,"FrontSide",function(){return FrontSide}),__webpack_require__.d(__webpack_exports__,"BackSide",function(){return BackSide}),__webpack_require__.d(__webpack_exports__,"DoubleSide",function(){return DoubleSide}),__webpack_require__.d(__webpack_exports__,"FlatShading",function(){return FlatShading}),__webpack_require__.d(__webpack_exports__,"SmoothShading",function(){return SmoothShading}),__webpack_require__.d(__webpack_exports__,"NoColors",function(){return NoColors}),__webpack_require__.d(__webpack_exports__,"FaceColors",function(){return FaceColors}),__webpack_require__.d(__webpack_exports__,"VertexColors",function(){return VertexColors}),__webpack_require__.d(__webpack_exports__,"NoBlending",function(){return NoBlending}),__webpack_require__.d(__webpack_exports__,"NormalBlending",function(){return NormalBlending}),__webpack_require__.d(__webpack_exports__,"AdditiveBlending",function(){return AdditiveBlending}),__webpack_require__.d(__webpack_exports__,"SubtractiveBlending",function(){return SubtractiveBlending}),__webpack_require__.d(__webpack_exports__,"MultiplyBlending",function(){return MultiplyBlending}),__webpack_require__.d(__webpack_exports__,"CustomBlending",function(){return CustomBlending}),__webpack_require__.d(__webpack_exports__,"AddEquation",function(){return AddEquation}),__webpack_require__.d(__webpack_exports__,"SubtractEquation",function(){return SubtractEquation}),__webpack_require__.d(__webpack_exports__,"ReverseSubtractEquation",function(){return ReverseSubtractEquation}),__webpack_require__.d(__webpack_exports__,"MinEquation",function(){return MinEquation}),__webpack_require__.d(__webpack_exports__,"MaxEquation",function(){return MaxEquation}),__webpack_require__.d(__webpack_exports__,"ZeroFactor",function(){return ZeroFactor}),__webpack_require__.d(__webpack_exports__,"OneFactor",function(){return OneFactor}),__webpack_require__.d(__webpack_exports__,"SrcColorFactor",function(){return SrcColorFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusSrcColorFactor",function(){return OneMinusSrcColorFactor}),__webpack_require__.d(__webpack_exports__,"SrcAlphaFactor",function(){return SrcAlphaFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusSrcAlphaFactor",function(){return OneMinusSrcAlphaFactor}),__webpack_require__.d(__webpack_exports__,"DstAlphaFactor",function(){return DstAlphaFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusDstAlphaFactor",function(){return OneMinusDstAlphaFactor}),__webpack_require__.d(__webpack_exports__,"DstColorFactor",function(){return DstColorFactor}),__webpack_require__.d(__webpack_exports__,"OneMinusDstColorFactor",function(){return OneMinusDstColorFactor}),__webpack_require__.d(__webpack_exports__,"SrcAlphaSaturateFactor",function(){return SrcAlphaSaturateFactor}),__webpack_require__.d(__webpack_exports__,"NeverDepth",function(){return NeverDepth}),__webpack_require__.d(__webpack_exports__,"AlwaysDepth",function(){return AlwaysDepth}),__webpack_require__.d(__webpack_exports__,"LessDepth",function(){return LessDepth}),__webpack_require__.d(__webpack_exports__,"LessEqualDepth",function(){return LessEqualDepth}),__webpack_require__.d(__webpack_exports__,"EqualDepth",function(){return EqualDepth}),__webpack_require__.d(__webpack_exports__,"GreaterEqualDepth",function(){return GreaterEqualDepth}),__webpack_require__.d(__webpack_exports__,"GreaterDepth",function(){return GreaterDepth}),__webpack_require__.d(__webpack_exports__,"NotEqualDepth",function(){return NotEqualDepth}),__webpack_require__.d(__webpack_exports__,"MultiplyOperation",function(){return MultiplyOperation}),__webpack_require__.d(__webpack_exports__,"MixOperation",function(){return MixOperation}),__webpack_require__.d(__webpack_exports__,"AddOperation",function(){return AddOperation}),__webpack_require__.d(__webpack_exports__,"NoToneMapping",function(){return NoToneMapping}),__webpack_require__.d(__webpack_exports__,"LinearToneMapping",function(){return LinearToneMapping}),__webpack_require__.d(__webpack_exports__,"ReinhardToneMapping",function(){return ReinhardToneMapping}),__webpack_require__.d(__webpack_exports__,"Uncharted2ToneMapping",function(){return Uncharted2ToneMapping}),__webpack_require__.d(__webpack_exports__,"CineonToneMapping",function(){return CineonToneMapping}),__webpack_require__.d(__webpack_exports__,"ACESFilmicToneMapping",function(){return ACESFilmicToneMapping}),__webpack_require__.d(__webpack_exports__,"UVMapping",function(){return UVMapping}),__webpack_require__.d(__webpack_exports__,"CubeReflectionMapping",function(){return CubeReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeRefractionMapping",function(){return CubeRefractionMapping}),__webpack_require__.d(__webpack_exports__,"EquirectangularReflectionMapping",function(){return EquirectangularReflectionMapping}),__webpack_require__.d(__webpack_exports__,"EquirectangularRefractionMapping",function(){return EquirectangularRefractionMapping}),__webpack_require__.d(__webpack_exports__,"SphericalReflectionMapping",function(){return SphericalReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeUVReflectionMapping",function(){return CubeUVReflectionMapping}),__webpack_require__.d(__webpack_exports__,"CubeUVRefractionMapping",function(){return CubeUVRefractionMapping}),__webpack_require__.d(__webpack_exports__,"RepeatWrapping",function(){return RepeatWrapping}),__webpack_require__.d(__webpack_exports__,"ClampToEdgeWrapping",function(){return ClampToEdgeWrapping}),__webpack_require__.d(__webpack_exports__,"MirroredRepeatWrapping",function(){return MirroredRepeatWrapping}),__webpack_require__.d(__webpack_exports__,"NearestFilter",function(){return NearestFilter}),__webpack_require__.d(__webpack_exports__,"NearestMipMapNearestFilter",function(){return NearestMipMapNearestFilter}),__webpack_require__.d(__webpack_exports__,"NearestMipMapLinearFilter",function(){return NearestMipMapLinearFilter}),__webpack_require__.d(__webpack_exports__,"LinearFilter",function(){return LinearFilter}),__webpack_require__.d(__webpack_exports__,"LinearMipMapNearestFilter",function(){return LinearMipMapNearestFilter}),__webpack_require__.d(__webpack_exports__,"LinearMipMapLinearFilter",function(){return LinearMipMapLinearFilter}),__webpack_require__.d(__webpack_exports__,"UnsignedByteType",function(){return UnsignedByteType}),__webpack_require__.d(__webpack_exports__,"ByteType",function(){return ByteType}),__webpack_require__.d(__webpack_exports__,"ShortType",function(){return ShortType}),__webpack_require__.d(__webpack_exports__,"UnsignedShortType",function(){return UnsignedShortType}),__webpack_require__.d(__webpack_exports__,"IntType",function(){return IntType}),__webpack_require__.d(__webpack_exports__,"UnsignedIntType",function(){return UnsignedIntType}),__webpack_require__.d(__webpack_exports__,"FloatType",function(){return FloatType}),__webpack_require__.d(__webpack_exports__,"HalfFloatType",function(){return HalfFloatType}),__webpack_require__.d(__webpack_exports__,"UnsignedShort4444Type",function(){return UnsignedShort4444Type}),__webpack_require__.d(__webpack_exports__,"UnsignedShort5551Type",function(){return UnsignedShort5551Type}),__webpack_require__.d(__webpack_exports__,"UnsignedShort565Type",function(){return UnsignedShort565Type}),__webpack_require__.d(__webpack_exports__,"UnsignedInt248Type",function(){return UnsignedInt248Type}),__webpack_require__.d(__webpack_exports__,"AlphaFormat",function(){return AlphaFormat}),__webpack_require__.d(__webpack_exports__,"RGBFormat",function(){return RGBFormat}),__webpack_require__.d(__webpack_exports__,"RGBAFormat",function(){return RGBAFormat}),__webpack_require__.d(__webpack_exports__,"LuminanceFormat",function(){return LuminanceFormat}),__webpack_require__.d(__webpack_exports__,"LuminanceAlphaFormat",function(){return LuminanceAlphaFormat}),__webpack_require__.d(__webpack_exports__,"RGBEFormat",function(){return RGBEFormat}),__webpack_require__.d(__webpack_exports__,"DepthFormat",function(){return DepthFormat}),__webpack_require__.d(__webpack_exports__,"DepthStencilFormat",function(){return DepthStencilFormat}),__webpack_require__.d(__webpack_exports__,"RedFormat",function(){return RedFormat}),__webpack_require__.d(__webpack_exports__,"RGB_S3TC_DXT1_Format",function(){return RGB_S3TC_DXT1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT1_Format",function(){return RGBA_S3TC_DXT1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT3_Format",function(){return RGBA_S3TC_DXT3_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_S3TC_DXT5_Format",function(){return RGBA_S3TC_DXT5_Format}),__webpack_require__.d(__webpack_exports__,"RGB_PVRTC_4BPPV1_Format",function(){return RGB_PVRTC_4BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGB_PVRTC_2BPPV1_Format",function(){return RGB_PVRTC_2BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_PVRTC_4BPPV1_Format",function(){return RGBA_PVRTC_4BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_PVRTC_2BPPV1_Format",function(){return RGBA_PVRTC_2BPPV1_Format}),__webpack_require__.d(__webpack_exports__,"RGB_ETC1_Format",function(){return RGB_ETC1_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_4x4_Format",function(){return RGBA_ASTC_4x4_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_5x4_Format",function(){return RGBA_ASTC_5x4_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_5x5_Format",function(){return RGBA_ASTC_5x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_6x5_Format",function(){return RGBA_ASTC_6x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_6x6_Format",function(){return RGBA_ASTC_6x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x5_Format",function(){return RGBA_ASTC_8x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x6_Format",function(){return RGBA_ASTC_8x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_8x8_Format",function(){return RGBA_ASTC_8x8_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x5_Format",function(){return RGBA_ASTC_10x5_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x6_Format",function(){return RGBA_ASTC_10x6_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x8_Format",function(){return RGBA_ASTC_10x8_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_10x10_Format",function(){return RGBA_ASTC_10x10_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_12x10_Format",function(){return RGBA_ASTC_12x10_Format}),__webpack_require__.d(__webpack_exports__,"RGBA_ASTC_12x12_Format",function(){return RGBA_ASTC_12x12_Format}),__webpack_require__.d(__webpack_exports__,"LoopOnce",function(){return LoopOnce}),__webpack_require__.d(__webpack_exports__,"LoopRepeat",function(){return LoopRepeat}),__webpack_require__.d(__webpack_exports__,"LoopPingPong",function(){return LoopPingPong}),__webpack_require__.d(__webpack_exports__,"InterpolateDiscrete",function(){return InterpolateDiscrete}),__webpack_require__.d(__webpack_exports__,"InterpolateLinear",function(){return InterpolateLinear}),__webpack_require__.d(__webpack_exports__,"InterpolateSmooth",function(){return InterpolateSmooth}),__webpack_require__.d(__webpack_exports__,"ZeroCurvatureEnding",function(){return ZeroCurvatureEnding}),__webpack_require__.d(__webpack_exports__,"ZeroSlopeEnding",function(){return ZeroSlopeEnding}),__webpack_require__.d(__webpack_exports__,"WrapAroundEnding",function(){return WrapAroundEnding}),__webpack_require__.d(__webpack_exports__,"TrianglesDrawMode",function(){return TrianglesDrawMode}),__webpack_require__.d(__webpack_exports__,"TriangleStripDrawMode",function(){return TriangleStripDrawMode}),__webpack_require__.d(__webpack_exports__,"TriangleFanDrawMode",function(){return TriangleFanDrawMode}),__webpack_require__.d(__webpack_exports__,"LinearEncoding",function(){return LinearEncoding}),__webpack_require__.d(__webpack_exports__,"sRGBEncoding",function(){return sRGBEncoding}),__webpack_require__.d(__webpack_exports__,"GammaEncoding",function(){return GammaEncoding}),__webpack_require__.d(__webpack_exports__,"RGBEEncoding",function(){return RGBEEncoding}),__webpack_require__.d(__webpack_exports__,"LogLuvEncoding",function(){return LogLuvEncoding}),__webpack_require__.d(__webpack_exports__,"RGBM7Encoding",function(){return RGBM7Encoding}),__webpack_require__.d(__webpack_exports__,"RGBM16Encoding",function(){return RGBM16Encoding}),__webpack_require__.d(__webpack_exports__,"RGBDEncoding",function(){return RGBDEncoding}),__webpack_require__.d(__webpack_exports__,"BasicDepthPacking",function(){return BasicDepthPacking}),__webpack_require__.d(__webpack_exports__,"RGBADepthPacking",function(){return RGBADepthPacking}),__webpack_require__.d(__webpack_exports__,"TangentSpaceNormalMap",function(){return TangentSpaceNormalMap}),__webpack_require__.d(__webpack_exports__,"ObjectSpaceNormalMap",function(){return ObjectSpaceNormalMap}),__webpack_require__.d(__webpack_exports__,"Float64BufferAttribute",function(){return Float64BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Float32BufferAttribute",function(){return Float32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint32BufferAttribute",function(){return Uint32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int32BufferAttribute",function(){return Int32BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint16BufferAttribute",function(){return Uint16BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int16BufferAttribute",function(){return Int16BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint8ClampedBufferAttribute",function(){return Uint8ClampedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"Uint8BufferAttribute",function(){return Uint8BufferAttribute}),__webpack_require__.d(__webpack_exports__,"Int8BufferAttribute",function(){return Int8BufferAttribute}),__webpack_require__.d(__webpack_exports__,"BufferAttribute",function(){return BufferAttribute}),__webpack_require__.d(__webpack_exports__,"BufferGeometry",function(){return BufferGeometry}),__webpack_require__.d(__webpack_exports__,"Clock",function(){return Clock}),__webpack_require__.d(__webpack_exports__,"DirectGeometry",function(){return DirectGeometry}),__webpack_require__.d(__webpack_exports__,"EventDispatcher",function(){return EventDispatcher}),__webpack_require__.d(__webpack_exports__,"Face3",function(){return Face3}),__webpack_require__.d(__webpack_exports__,"Geometry",function(){return Geometry}),__webpack_require__.d(__webpack_exports__,"InstancedBufferAttribute",function(){return InstancedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"InstancedBufferGeometry",function(){return InstancedBufferGeometry}),__webpack_require__.d(__webpack_exports__,"InstancedInterleavedBuffer",function(){return InstancedInterleavedBuffer}),__webpack_require__.d(__webpack_exports__,"InterleavedBuffer",function(){return InterleavedBuffer}),__webpack_require__.d(__webpack_exports__,"InterleavedBufferAttribute",function(){return InterleavedBufferAttribute}),__webpack_require__.d(__webpack_exports__,"Layers",function(){return Layers}),__webpack_require__.d(__webpack_exports__,"Object3D",function(){return Object3D}),__webpack_require__.d(__webpack_exports__,"Raycaster",function(){return Raycaster}),__webpack_require__.d(__webpack_exports__,"Uniform",function(){return Uniform}),__webpack_require__.d(__webpack_exports__,"Curve",function(){return Curve}),__webpack_require__.d(__webpack_exports__,"CurvePath",function(){return CurvePath}),__webpack_require__.d(__webpack_exports__,"Font",function(){return Font}),__webpack_require__.d(__webpack_exports__,"CatmullRom",function(){return CatmullRom}),__webpack_require__.d(__webpack_exports__,"QuadraticBezier",function(){return QuadraticBezier}),__webpack_require__.d(__webpack_exports__,"CubicBezier",function(){return CubicBezier}),__webpack_require__.d(__webpack_exports__,"Path",function(){return Path}),__webpack_require__.d(__webpack_exports__,"Shape",function(){return Shape}),__webpack_require__.d(__webpack_exports__,"ShapePath",function(){return ShapePath}),__webpack_require__.d(__webpack_exports__,"ArcCurve",function(){return ArcCurve}),__webpack_require__.d(__webpack_exports__,"CatmullRomCurve3",function(){return CatmullRomCurve3}),__webpack_require__.d(__webpack_exports__,"CubicBezierCurve",function(){return CubicBezierCurve}),__webpack_require__.d(__webpack_exports__,"CubicBezierCurve3",function(){return CubicBezierCurve3}),__webpack_require__.d(__webpack_exports__,"EllipseCurve",function(){return EllipseCurve}),__webpack_require__.d(__webpack_exports__,"LineCurve",function(){return LineCurve}),__webpack_require__.d(__webpack_exports__,"LineCurve3",function(){return LineCurve3}),__webpack_require__.d(__webpack_exports__,"QuadraticBezierCurve",function(){return QuadraticBezierCurve}),__webpack_require__.d(__webpack_exports__,"QuadraticBezierCurve3",function(){return QuadraticBezierCurve3}),__webpack_require__.d(__webpack_exports__,"SplineCurve",function(){return SplineCurve}),__webpack_require__.d(__webpack_exports__,"Earcut",function(){return Earcut}),__webpack_require__.d(__webpack_exports__,"ImageUtils",function(){return ImageUtils}),__webpack_require__.d(__webpack_exports__,"ImmediateRenderObject",function(){return ImmediateRenderObject}),__webpack_require__.d(__webpack_exports__,"ShapeUtils",function(){return ShapeUtils}),__webpack_require__.d(__webpack_exports__,"BoxGeometry",function(){return BoxGeometry}),__webpack_require__.d(__webpack_exports__,"BoxBufferGeometry",function(){return BoxBufferGeometry}),__webpack_require__.d(__webpack_exports__,"CircleGeometry",function(){return CircleGeometry}),__webpack_require__.d(__webpack_exports__,"CircleBufferGeometry",function(){return CircleBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ConeGeometry",function(){return ConeGeometry}),__webpack_require__.d(__webpack_exports__,"ConeBufferGeometry",function(){return ConeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"CylinderGeometry",function(){return CylinderGeometry}),__webpack_require__.d(__webpack_exports__,"CylinderBufferGeometry",function(){return CylinderBufferGeometry}),__webpack_require__.d(__webpack_exports__,"DodecahedronGeometry",function(){return DodecahedronGeometry}),__webpack_require__.d(__webpack_exports__,"DodecahedronBufferGeometry",function(){return DodecahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"EdgesGeometry",function(){return EdgesGeometry}),__webpack_require__.d(__webpack_exports__,"ExtrudeGeometry",function(){return ExtrudeGeometry}),__webpack_require__.d(__webpack_exports__,"ExtrudeBufferGeometry",function(){return ExtrudeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"IcosahedronGeometry",function(){return IcosahedronGeometry}),__webpack_require__.d(__webpack_exports__,"IcosahedronBufferGeometry",function(){return IcosahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"LatheGeometry",function(){return LatheGeometry}),__webpack_require__.d(__webpack_exports__,"LatheBufferGeometry",function(){return LatheBufferGeometry}),__webpack_require__.d(__webpack_exports__,"OctahedronGeometry",function(){return OctahedronGeometry}),__webpack_require__.d(__webpack_exports__,"OctahedronBufferGeometry",function(){return OctahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ParametricGeometry",function(){return ParametricGeometry}),__webpack_require__.d(__webpack_exports__,"ParametricBufferGeometry",function(){return ParametricBufferGeometry}),__webpack_require__.d(__webpack_exports__,"PlaneGeometry",function(){return PlaneGeometry}),__webpack_require__.d(__webpack_exports__,"PlaneBufferGeometry",function(){return PlaneBufferGeometry}),__webpack_require__.d(__webpack_exports__,"PolyhedronGeometry",function(){return PolyhedronGeometry}),__webpack_require__.d(__webpack_exports__,"PolyhedronBufferGeometry",function(){return PolyhedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"RingGeometry",function(){return RingGeometry}),__webpack_require__.d(__webpack_exports__,"RingBufferGeometry",function(){return RingBufferGeometry}),__webpack_require__.d(__webpack_exports__,"ShapeGeometry",function(){return ShapeGeometry}),__webpack_require__.d(__webpack_exports__,"ShapeBufferGeometry",function(){return ShapeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"SphereGeometry",function(){return SphereGeometry}),__webpack_require__.d(__webpack_exports__,"SphereBufferGeometry",function(){return SphereBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TetrahedronGeometry",function(){return TetrahedronGeometry}),__webpack_require__.d(__webpack_exports__,"TetrahedronBufferGeometry",function(){return TetrahedronBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TextGeometry",function(){return TextGeometry}),__webpack_require__.d(__webpack_exports__,"TextBufferGeometry",function(){return TextBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TorusGeometry",function(){return TorusGeometry}),__webpack_require__.d(__webpack_exports__,"TorusBufferGeometry",function(){return TorusBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TorusKnotGeometry",function(){return TorusKnotGeometry}),__webpack_require__.d(__webpack_exports__,"TorusKnotBufferGeometry",function(){return TorusKnotBufferGeometry}),__webpack_require__.d(__webpack_exports__,"TubeGeometry",function(){return TubeGeometry}),__webpack_require__.d(__webpack_exports__,"TubeBufferGeometry",function(){return TubeBufferGeometry}),__webpack_require__.d(__webpack_exports__,"WireframeGeometry",function(){return WireframeGeometry}),__webpack_require__.d(__webpack_exports__,"ArrowHelper",function(){return ArrowHelper}),__webpack_require__.d(__webpack_exports__,"AxesHelper",function(){return AxesHelper}),__webpack_require__.d(__webpack_exports__,"Box3Helper",function(){return Box3Helper}),__webpack_require__.d(__webpack_exports__,"BoxHelper",function(){return BoxHelper}),__webpack_require__.d(__webpack_exports__,"CameraHelper",function(){return CameraHelper}),__webpack_require__.d(__webpack_exports__,"DirectionalLightHelper",function(){return DirectionalLightHelper}),__webpack_require__.d(__webpack_exports__,"FaceNormalsHelper",function(){return FaceNormalsHelper}),__webpack_require__.d(__webpack_exports__,"GridHelper",function(){return GridHelper}),__webpack_require__.d(__webpack_exports__,"HemisphereLightHelper",function(){return HemisphereLightHelper}),__webpack_require__.d(__webpack_exports__,"PlaneHelper",function(){return PlaneHelper}),__webpack_require__.d(__webpack_exports__,"PointLightHelper",function(){return PointLightHelper}),__webpack_require__.d(__webpack_exports__,"PolarGridHelper",function(){return PolarGridHelper}),__webpack_require__.d(__webpack_exports__,"PositionalAudioHelper",function(){return PositionalAudioHelper}),__webpack_require__.d(__webpack_exports__,"RectAreaLightHelper",function(){return RectAreaLightHelper}),__webpack_require__.d(__webpack_exports__,"SkeletonHelper",function(){return SkeletonHelper}),__webpack_require__.d(__webpack_exports__,"SpotLightHelper",function(){return SpotLightHelper}),__webpack_require__.d(__webpack_exports__,"VertexNormalsHelper",function(){return VertexNormalsHelper}),__webpack_require__.d(__webpack_exports__,"AmbientLight",function(){return AmbientLight}),__webpack_require__.d(__webpack_exports__,"DirectionalLight",function(){return DirectionalLight}),__webpack_require__.d(__webpack_exports__,"DirectionalLightShadow",function(){return DirectionalLightShadow}),__webpack_require__.d(__webpack_exports__,"HemisphereLight",function(){return HemisphereLight}),__webpack_require__.d(__webpack_exports__,"Light",function(){return Light}),__webpack_require__.d(__webpack_exports__,"LightShadow",function(){return LightShadow}),__webpack_require__.d(__webpack_exports__,"PointLight",function(){return PointLight}),__webpack_require__.d(__webpack_exports__,"RectAreaLight",function(){return RectAreaLight}),__webpack_require__.d(__webpack_exports__,"SpotLight",function(){return SpotLight}),__webpack_require__.d(__webpack_exports__,"SpotLightShadow",function(){return SpotLightShadow}),__webpack_require__.d(__webpack_exports__,"AnimationLoader",function(){return AnimationLoader}),__webpack_require__.d(__webpack_exports__,"AudioLoader",function(){return AudioLoader}),__webpack_require__.d(__webpack_exports__,"BufferGeometryLoader",function(){return BufferGeometryLoader}),__webpack_require__.d(__webpack_exports__,"Cache",function(){return Cache}),__webpack_require__.d(__webpack_exports__,"CompressedTextureLoader",function(){return CompressedTextureLoader}),__webpack_require__.d(__webpack_exports__,"CubeTextureLoader",function(){return CubeTextureLoader}),__webpack_require__.d(__webpack_exports__,"DataTextureLoader",function(){return DataTextureLoader}),__webpack_require__.d(__webpack_exports__,"FileLoader",function(){return FileLoader}),__webpack_require__.d(__webpack_exports__,"FontLoader",function(){return FontLoader}),__webpack_require__.d(__webpack_exports__,"ImageBitmapLoader",function(){return ImageBitmapLoader}),__webpack_require__.d(__webpack_exports__,"ImageLoader",function(){return ImageLoader}),__webpack_require__.d(__webpack_exports__,"Loader",function(){return Loader$1}),__webpack_require__.d(__webpack_exports__,"LoaderUtils",function(){return LoaderUtils}),__webpack_require__.d(__webpack_exports__,"DefaultLoadingManager",function(){return DefaultLoadingManager}),__webpack_require__.d(__webpack_exports__,"LoadingManager",function(){return LoadingManager}),__webpack_require__.d(__webpack_exports__,"MaterialLoader",function(){return MaterialLoader}),__webpack_require__.d(__webpack_exports__,"ObjectLoader",function(){return ObjectLoader}),__webpack_require__.d(__webpack_exports__,"TextureLoader",function(){return TextureLoader}),__webpack_require__.d(__webpack_exports__,"LineBasicMaterial",function(){return LineBasicMaterial}),__webpack_require__.d(__webpack_exports__,"LineDashedMaterial",function(){return LineDashedMaterial}),__webpack_require__.d(__webpack_exports__,"Material",function(){return Material$1}),__webpack_require__.d(__webpack_exports__,"MeshBasicMaterial",function(){return MeshBasicMaterial}),__webpack_require__.d(__webpack_exports__,"MeshDepthMaterial",function(){return MeshDepthMaterial}),__webpack_require__.d(__webpack_exports__,"MeshDistanceMaterial",function(){return MeshDistanceMaterial}),__webpack_require__.d(__webpack_exports__,"MeshLambertMaterial",function(){return MeshLambertMaterial}),__webpack_require__.d(__webpack_exports__,"MeshMatcapMaterial",function(){return MeshMatcapMaterial}),__webpack_require__.d(__webpack_exports__,"MeshNormalMaterial",function(){return MeshNormalMaterial}),__webpack_require__.d(__webpack_exports__,"MeshPhongMaterial",function(){return MeshPhongMaterial}),__webpack_require__.d(__webpack_exports__,"MeshPhysicalMaterial",function(){return MeshPhysicalMaterial}),__webpack_require__.d(__webpack_exports__,"MeshStandardMaterial",function(){return MeshStandardMaterial}),__webpack_require__.d(__webpack_exports__,"MeshToonMaterial",function(){return MeshToonMaterial}),__webpack_require__.d(__webpack_exports__,"PointsMaterial",function(){return PointsMaterial}),__webpack_require__.d(__webpack_exports__,"RawShaderMaterial",function(){return RawShaderMaterial}),__webpack_require__.d(__webpack_exports__,"ShaderMaterial",function(){return ShaderMaterial}),__webpack_require__.d(__webpack_exports__,"ShadowMaterial",function(){return ShadowMaterial}),__webpack_require__.d(__webpack_exports__,"SpriteMaterial",function(){return SpriteMaterial}),__webpack_require__.d(__webpack_exports__,"Box2",function(){return Box2}),__webpack_require__.d(__webpack_exports__,"Box3",function(){return Box3}),__webpack_require__.d(__webpack_exports__,"Color",function(){return Color}),__webpack_require__.d(__webpack_exports__,"Cylindrical",function(){return Cylindrical}),__webpack_require__.d(__webpack_exports__,"Euler",function(){return Euler}),__webpack_require__.d(__webpack_exports__,"Frustum",function(){return Frustum}),__webpack_require__.d(__webpack_exports__,"Interpolant",function(){return Interpolant}),__webpack_require__.d(__webpack_exports__,"CubicInterpolant",function(){return CubicInterpolant}),__webpack_require__.d(__webpack_exports__,"DiscreteInterpolant",function(){return DiscreteInterpolant}),__webpack_require__.d(__webpack_exports__,"LinearInterpolant",function(){return LinearInterpolant}),__webpack_require__.d(__webpack_exports__,"QuaternionLinearInterpolant",function(){return QuaternionLinearInterpolant}),__webpack_require__.d(__webpack_exports__,"Line3",function(){return Line3}),__webpack_require__.d(__webpack_exports__,"_Math",function(){return _Math}),__webpack_require__.d(__webpack_exports__,"Matrix3",function(){return Matrix3}),__webpack_require__.d(__webpack_exports__,"Matrix4",function(){return Matrix4}),__webpack_require__.d(__webpack_exports__,"Plane",function(){return Plane}),__webpack_require__.d(__webpack_exports__,"Quaternion",function(){return Quaternion}),__webpack_require__.d(__webpack_exports__,"Ray",function(){return Ray}),__webpack_require__.d(__webpack_exports__,"Sphere",function(){return Sphere}),__webpack_require__.d(__webpack_exports__,"Spherical",function(){return Spherical}),__webpack_require__.d(__webpack_exports__,"Triangle",function(){return Triangle}),__webpack_require__.d(__webpack_exports__,"Vector2",function(){return Vector2}),__webpack_require__.d(__webpack_exports__,"Vector3",function(){return Vector3}),__webpack_require__.d(__webpack_exports__,"Vector4",function(){return Vector4}),__webpack_require__.d(__webpack_exports__,"Bone",function(){return Bone}),__webpack_require__.d(__webpack_exports__,"Group",function(){return Group}),__webpack_require__.d(__webpack_exports__,"Line",function(){return Line}),__webpack_require__.d(__webpack_exports__,"LineLoop",function(){return LineLoop}),__webpack_require__.d(__webpack_exports__,"LineSegments",function(){return LineSegments}),__webpack_require__.d(__webpack_exports__,"LOD",function(){return LOD}),__webpack_require__.d(__webpack_exports__,"Mesh",function(){return Mesh}),__webpack_require__.d(__webpack_exports__,"Points",function(){return Points}),__webpack_require__.d(__webpack_exports__,"Skeleton",function(){return Skeleton}),__webpack_require__.d(__webpack_exports__,"SkinnedMesh",function(){return SkinnedMesh}),__webpack_require__.d(__webpack_exports__,"Sprite",function(){return Sprite}),__webpack_require__.d(__webpack_exports__,"ShaderChunk",function(){return ShaderChunk}),__webpack_require__.d(__webpack_exports__,"ShaderLib",function(){return ShaderLib}),__webpack_require__.d(__webpack_exports__,"UniformsLib",function(){return UniformsLib}),__webpack_require__.d(__webpack_exports__,"UniformsUtils",function(){return UniformsUtils}),__webpack_require__.d(__webpack_exports__,"WebGLAnimation",function(){return WebGLAnimation}),__webpack_require__.d(__webpack_exports__,"WebGLAttributes",function(){return WebGLAttributes}),__webpack_require__.d(__webpack_exports__,"WebGLBackground",function(){return WebGLBackground}),__webpack_require__.d(__webpack_exports__,"WebGLBufferRenderer",function(){return WebGLBufferRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLCapabilities",function(){return WebGLCapabilities}),__webpack_require__.d(__webpack_exports__,"WebGLClipping",function(){return WebGLClipping}),__webpack_require__.d(__webpack_exports__,"WebGLExtensions",function(){return WebGLExtensions}),__webpack_require__.d(__webpack_exports__,"WebGLGeometries",function(){return WebGLGeometries}),__webpack_require__.d(__webpack_exports__,"WebGLIndexedBufferRenderer",function(){return WebGLIndexedBufferRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLInfo",function(){return WebGLInfo}),__webpack_require__.d(__webpack_exports__,"WebGLLights",function(){return WebGLLights}),__webpack_require__.d(__webpack_exports__,"WebGLMorphtargets",function(){return WebGLMorphtargets}),__webpack_require__.d(__webpack_exports__,"WebGLObjects",function(){return WebGLObjects}),__webpack_require__.d(__webpack_exports__,"WebGLProgram",function(){return WebGLProgram}),__webpack_require__.d(__webpack_exports__,"WebGLPrograms",function(){return WebGLPrograms}),__webpack_require__.d(__webpack_exports__,"WebGLProperties",function(){return WebGLProperties}),__webpack_require__.d(__webpack_exports__,"WebGLRenderLists",function(){return WebGLRenderLists}),__webpack_require__.d(__webpack_exports__,"WebGLRenderStates",function(){return WebGLRenderStates}),__webpack_require__.d(__webpack_exports__,"WebGLShader",function(){return WebGLShader}),__webpack_require__.d(__webpack_exports__,"WebGLShadowMap",function(){return WebGLShadowMap}),__webpack_require__.d(__webpack_exports__,"WebGLState",function(){return WebGLState}),__webpack_require__.d(__webpack_exports__,"WebGLTextures",function(){return WebGLTextures}),__webpack_require__.d(__webpack_exports__,"WebGLUniforms",function(){return WebGLUniforms}),__webpack_require__.d(__webpack_exports__,"WebGLUtils",function(){return WebGLUtils}),__webpack_require__.d(__webpack_exports__,"WebGL2Renderer",function(){return WebGL2Renderer}),__webpack_require__.d(__webpack_exports__,"WebGLMultisampleRenderTarget",function(){return WebGLMultisampleRenderTarget}),__webpack_require__.d(__webpack_exports__,"WebGLRenderer",function(){return WebGLRenderer}),__webpack_require__.d(__webpack_exports__,"WebGLRenderTarget",function(){return WebGLRenderTarget}),__webpack_require__.d(__webpack_exports__,"WebGLRenderTargetCube",function(){return WebGLRenderTargetCube}),__webpack_require__.d(__webpack_exports__,"WebVRManager",function(){return WebVRManager}),__webpack_require__.d(__webpack_exports__,"setProjectionFromUnion",function(){return setProjectionFromUnion}),__webpack_require__.d(__webpack_exports__,"WebXRManager",function(){return WebXRManager}),__webpack_require__.d(__webpack_exports__,"Fog",function(){return Fog}),__webpack_require__.d(__webpack_exports__,"FogExp2",function(){return FogExp2}),__webpack_require__.d(__webpack_exports__,"Scene",function(){return Scene}),__webpack_require__.d(__webpack_exports__,"CanvasTexture",function(){return CanvasTexture}),__webpack_require__.d(__webpack_exports__,"CompressedTexture",function(){return CompressedTexture}),__webpack_require__.d(__webpack_exports__,"CubeTexture",function(){return CubeTexture}),__webpack_require__.d(__webpack_exports__,"DataTexture",function(){return DataTexture}),__webpack_require__.d(__webpack_exports__,"DataTexture3D",function(){return DataTexture3D}),__webpack_require__.d(__webpack_exports__,"DepthTexture",function(){return DepthTexture}),__webpack_require__.d(__webpack_exports__,"Texture",function(){return Texture}),__webpack_require__.d(__webpack_exports__,"VideoTexture",function(){return VideoTexture}),__webpack_require__.d(__webpack_exports__,"arrayMin",function(){return arrayMin}),__webpack_require__.d(__webpack_exports__,"arrayMax",function(){return arrayMax}),void 0===Number.EPSILON&&(Number.EPSILON=Math.pow(2,-52)),void 0===Number.isInteger&&(Number.isInteger=function(e){return"number"==typeof e&&isFinite(e)&&Math.floor(e)===e}),void 0===Math.sign&&(Math.sign=function(e){return e<0?-1:e>0?1:+e}),"name"in Function.prototype==!1&&Object.defineProperty(Function.prototype,"name",{get:function(){return this.toString().match(/^\s*function\s*([^\(\s]*)/)[1]}}),void 0===Object.assign&&(Object.assign=function(e){var t=arguments;if(null==e)throw new TypeError("Cannot convert undefined or null to object");for(var i=Object(e),r=1;r<arguments.length;r++){var n=t[r];if(null!=n)for(var o in n)Object.prototype.hasOwnProperty.call(n,o)&&(i[o]=n[o])}return i});var _Math={DEG2RAD:Math.PI/180,RAD2DEG:180/Math.PI,generateUUID:function(){for(var e=[],t=0;t<256;t++)e[t]=(t<16?"0":"")+t.toString(16);return function(){var t=4294967295*Math.random()|0,i=4294967295*Math.random()|0,r=4294967295*Math.random()|0,n=4294967295*Math.random()|0;return(e[255&t]+e[t>>8&255]+e[t>>16&255]+e[t>>24&255]+"-"+e[255&i]+e[i>>8&255]+"-"+e[i>>16&15|64]+e[i>>24&255]+"-"+e[63&r|128]+e[r>>8&255]+"-"+e[r>>16&255]+e[r>>24&255]+e[255&n]+e[n>>8&255]+e[n>>16&255]+e[n>>24&255]).toUpperCase()}}(),clamp:function(e,t,i){return Math.max(t,Math.min(i,e))},euclideanModulo:function(e,t){return(e%t+t)%t},mapLinear:function(e,t,i,r,n){return r+(e-t)*(n-r)/(i-t)},lerp:function(e,t,i){return(1-i)*e+i*t},smoothstep:function(e,t,i){return e<=t?0:e>=i?1:(e=(e-t)/(i-t))*e*(3-2*e)},smootherstep:function(e,t,i){return e<=t?0:e>=i?1:(e=(e-t)/(i-t))*e*e*(e*(6*e-15)+10)},randInt:function(e,t){return e+Math.floor(Math.random()*(t-e+1))},randFloat:function(e,t){return e+Math.random()*(t-e)},randFloatSpread:function(e){return e*(.5-Math.random())},degToRad:function(e){return e*_Math.DEG2RAD},radToDeg:function(e){return e*_Math.RAD2DEG},isPowerOfTwo:function(e){return 0==(e&e-1)&&0!==e},ceilPowerOfTwo:function(e){return Math.pow(2,Math.ceil(Math.log(e)/Math.LN2))},floorPowerOfTwo:function(e){return Math.pow(2,Math.floor(Math.log(e)/Math.LN2))}},vector,matrix,x,y,z,zero,one,v1,min,max,quaternion,q;function Matrix4(){this.elements=[1,0,0,0,0,1,0,0,0,0,1,0,0,0,0,1],arguments.length>0&&console.error("Matrix4: the constructor no longer reads arguments. use .set() instead.")}function Vector3(e,t,i){this.x=e||0,this.y=t||0,this.z=i||0}function Quaternion(e,t,i,r){this._x=e||0,this._y=t||0,this._z=i||0,this._w=void 0!==r?r:1}function EventDispatcher(){}function Euler(e,t,i,r){this._x=e||0,this._y=t||0,this._z=i||0,this._order=r||Euler.DefaultOrder}function Layers(){this.mask=1}function Matrix3(){this.elements=[1,0,0,0,1,0,0,0,1],arguments.length>0&&console.error("Matrix3: the constructor no longer reads arguments. use .set() instead.")}Object.assign(Matrix4.prototype,{isMatrix4:!0,set:function(e,t,i,r,n,o,a,s,l,u,h,c,d,p,f,m){var v=this.elements;return v[0]=e,v[4]=t,v[8]=i,v[12]=r,v[1]=n,v[5]=o,v[9]=a,v[13]=s,v[2]=l,v[6]=u,v[10]=h,v[14]=c,v[3]=d,v[7]=p,v[11]=f,v[15]=m,this},identity:function(){return this.set(1,0,0,0,0,1,0,0,0,0,1,0,0,0,0,1),this},clone:function(){return(new Matrix4).fromArray(this.elements)},copy:function(e){var t=this.elements,i=e.elements;return t[0]=i[0],t[1]=i[1],t[2]=i[2],t[3]=i[3],t[4]=i[4],t[5]=i[5],t[6]=i[6],t[7]=i[7],t[8]=i[8],t[9]=i[9],t[10]=i[10],t[11]=i[11],t[12]=i[12],t[13]=i[13],t[14]=i[14],t[15]=i[15],this},copyPosition:function(e){var t=this.elements,i=e.elements;return t[12]=i[12],t[13]=i[13],t[14]=i[14],this},extractBasis:function(e,t,i){return e.setFromMatrixColumn(this,0),t.setFromMatrixColumn(this,1),i.setFromMatrixColumn(this,2),this},makeBasis:function(e,t,i){return this.set(e.x,t.x,i.x,0,e.y,t.y,i.y,0,e.z,t.z,i.z,0,0,0,0,1),this},extractRotation:(v1=new Vector3,function(e){var t=this.elements,i=e.elements,r=1/v1.setFromMatrixColumn(e,0).length(),n=1/v1.setFromMatrixColumn(e,1).length(),o=1/v1.setFromMatrixColumn(e,2).length();return t[0]=i[0]*r,t[1]=i[1]*r,t[2]=i[2]*r,t[3]=0,t[4]=i[4]*n,t[5]=i[5]*n,t[6]=i[6]*n,t[7]=0,t[8]=i[8]*o,t[9]=i[9]*o,t[10]=i[10]*o,t[11]=0,t[12]=0,t[13]=0,t[14]=0,t[15]=1,this}),makeRotationFromEuler:function(e){e&&e.isEuler||console.error("Matrix4: .makeRotationFromEuler() now expects a Euler rotation rather than a Vector3 and order.");var t=this.elements,i=e.x,r=e.y,n=e.z,o=Math.cos(i),a=Math.sin(i),s=Math.cos(r),l=Math.sin(r),u=Math.cos(n),h=Math.sin(n);if("XYZ"===e.order){var c=o*u,d=o*h,p=a*u,f=a*h;t[0]=s*u,t[4]=-s*h,t[8]=l,t[1]=d+p*l,t[5]=c-f*l,t[9]=-a*s,t[2]=f-c*l,t[6]=p+d*l,t[10]=o*s}else if("YXZ"===e.order){var m=s*u,v=s*h,g=l*u,y=l*h;t[0]=m+y*a,t[4]=g*a-v,t[8]=o*l,t[1]=o*h,t[5]=o*u,t[9]=-a,t[2]=v*a-g,t[6]=y+m*a,t[10]=o*s}else if("ZXY"===e.order){m=s*u,v=s*h,g=l*u,y=l*h;t[0]=m-y*a,t[4]=-o*h,t[8]=g+v*a,t[1]=v+g*a,t[5]=o*u,t[9]=y-m*a,t[2]=-o*l,t[6]=a,t[10]=o*s}else if("ZYX"===e.order){c=o*u,d=o*h,p=a*u,f=a*h;t[0]=s*u,t[4]=p*l-d,t[8]=c*l+f,t[1]=s*h,t[5]=f*l+c,t[9]=d*l-p,t[2]=-l,t[6]=a*s,t[10]=o*s}else if("YZX"===e.order){var _=o*s,b=o*l,x=a*s,w=a*l;t[0]=s*u,t[4]=w-_*h,t[8]=x*h+b,t[1]=h,t[5]=o*u,t[9]=-a*u,t[2]=-l*u,t[6]=b*h+x,t[10]=_-w*h}else if("XZY"===e.order){_=o*s,b=o*l,x=a*s,w=a*l;t[0]=s*u,t[4]=-h,t[8]=l*u,t[1]=_*h+w,t[5]=o*u,t[9]=b*h-x,t[2]=x*h-b,t[6]=a*u,t[10]=w*h+_}return t[3]=0,t[7]=0,t[11]=0,t[12]=0,t[13]=0,t[14]=0,t[15]=1,this},makeRotationFromQuaternion:(zero=new Vector3(0,0,0),one=new Vector3(1,1,1),function(e){return this.compose(zero,e,one)}),lookAt:(x=new Vector3,y=new Vector3,z=new Vector3,function(e,t,i){var r=this.elements;return z.subVectors(e,t),0===z.lengthSq()&&(z.z=1),z.normalize(),x.crossVectors(i,z),0===x.lengthSq()&&(1===Math.abs(i.z)?z.x+=1e-4:z.z+=1e-4,z.normalize(),x.crossVectors(i,z)),x.normalize(),y.crossVectors(z,x),r[0]=x.x,r[4]=y.x,r[8]=z.x,r[1]=x.y,r[5]=y.y,r[9]=z.y,r[2]=x.z,r[6]=y.z,r[10]=z.z,this}),multiply:function(e,t){return void 0!==t?(console.warn("Matrix4: .multiply() now only accepts one argument. Use .multiplyMatrices( a, b ) instead."),this.multiplyMatrices(e,t)):this.multiplyMatrices(this,e)},premultiply:function(e){return this.multiplyMatrices(e,this)},multiplyMatrices:function(e,t){var i=e.elements,r=t.elements,n=this.elements,o=i[0],a=i[4],s=i[8],l=i[12],u=i[1],h=i[5],c=i[9],d=i[13],p=i[2],f=i[6],m=i[10],v=i[14],g=i[3],y=i[7],_=i[11],b=i[15],x=r[0],w=r[4],S=r[8],M=r[12],T=r[1],A=r[5],C=r[9],L=r[13],N=r[2],k=r[6],P=r[10],E=r[14],D=r[3],O=r[7],R=r[11],F=r[15];return n[0]=o*x+a*T+s*N+l*D,n[4]=o*w+a*A+s*k+l*O,n[8]=o*S+a*C+s*P+l*R,n[12]=o*M+a*L+s*E+l*F,n[1]=u*x+h*T+c*N+d*D,n[5]=u*w+h*A+c*k+d*O,n[9]=u*S+h*C+c*P+d*R,n[13]=u*M+h*L+c*E+d*F,n[2]=p*x+f*T+m*N+v*D,n[6]=p*w+f*A+m*k+v*O,n[10]=p*S+f*C+m*P+v*R,n[14]=p*M+f*L+m*E+v*F,n[3]=g*x+y*T+_*N+b*D,n[7]=g*w+y*A+_*k+b*O,n[11]=g*S+y*C+_*P+b*R,n[15]=g*M+y*L+_*E+b*F,this},multiplyScalar:function(e){var t=this.elements;return t[0]*=e,t[4]*=e,t[8]*=e,t[12]*=e,t[1]*=e,t[5]*=e,t[9]*=e,t[13]*=e,t[2]*=e,t[6]*=e,t[10]*=e,t[14]*=e,t[3]*=e,t[7]*=e,t[11]*=e,t[15]*=e,this},applyToBufferAttribute:function(){var e=new Vector3;return function(t){for(var i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.applyMatrix4(this),t.setXYZ(i,e.x,e.y,e.z);return t}}(),determinant:function(){var e=this.elements,t=e[0],i=e[4],r=e[8],n=e[12],o=e[1],a=e[5],s=e[9],l=e[13],u=e[2],h=e[6],c=e[10],d=e[14];return e[3]*(+n*s*h-r*l*h-n*a*c+i*l*c+r*a*d-i*s*d)+e[7]*(+t*s*d-t*l*c+n*o*c-r*o*d+r*l*u-n*s*u)+e[11]*(+t*l*h-t*a*d-n*o*h+i*o*d+n*a*u-i*l*u)+e[15]*(-r*a*u-t*s*h+t*a*c+r*o*h-i*o*c+i*s*u)},transpose:function(){var e,t=this.elements;return e=t[1],t[1]=t[4],t[4]=e,e=t[2],t[2]=t[8],t[8]=e,e=t[6],t[6]=t[9],t[9]=e,e=t[3],t[3]=t[12],t[12]=e,e=t[7],t[7]=t[13],t[13]=e,e=t[11],t[11]=t[14],t[14]=e,this},setPosition:function(e){var t=this.elements;return t[12]=e.x,t[13]=e.y,t[14]=e.z,this},getInverse:function(e,t){var i=this.elements,r=e.elements,n=r[0],o=r[1],a=r[2],s=r[3],l=r[4],u=r[5],h=r[6],c=r[7],d=r[8],p=r[9],f=r[10],m=r[11],v=r[12],g=r[13],y=r[14],_=r[15],b=p*y*c-g*f*c+g*h*m-u*y*m-p*h*_+u*f*_,x=v*f*c-d*y*c-v*h*m+l*y*m+d*h*_-l*f*_,w=d*g*c-v*p*c+v*u*m-l*g*m-d*u*_+l*p*_,S=v*p*h-d*g*h-v*u*f+l*g*f+d*u*y-l*p*y,M=n*b+o*x+a*w+s*S;if(0===M){var T="Matrix4: .getInverse() can't invert matrix, determinant is 0";if(!0===t)throw new Error(T);return console.warn(T),this.identity()}var A=1/M;return i[0]=b*A,i[1]=(g*f*s-p*y*s-g*a*m+o*y*m+p*a*_-o*f*_)*A,i[2]=(u*y*s-g*h*s+g*a*c-o*y*c-u*a*_+o*h*_)*A,i[3]=(p*h*s-u*f*s-p*a*c+o*f*c+u*a*m-o*h*m)*A,i[4]=x*A,i[5]=(d*y*s-v*f*s+v*a*m-n*y*m-d*a*_+n*f*_)*A,i[6]=(v*h*s-l*y*s-v*a*c+n*y*c+l*a*_-n*h*_)*A,i[7]=(l*f*s-d*h*s+d*a*c-n*f*c-l*a*m+n*h*m)*A,i[8]=w*A,i[9]=(v*p*s-d*g*s-v*o*m+n*g*m+d*o*_-n*p*_)*A,i[10]=(l*g*s-v*u*s+v*o*c-n*g*c-l*o*_+n*u*_)*A,i[11]=(d*u*s-l*p*s-d*o*c+n*p*c+l*o*m-n*u*m)*A,i[12]=S*A,i[13]=(d*g*a-v*p*a+v*o*f-n*g*f-d*o*y+n*p*y)*A,i[14]=(v*u*a-l*g*a-v*o*h+n*g*h+l*o*y-n*u*y)*A,i[15]=(l*p*a-d*u*a+d*o*h-n*p*h-l*o*f+n*u*f)*A,this},scale:function(e){var t=this.elements,i=e.x,r=e.y,n=e.z;return t[0]*=i,t[4]*=r,t[8]*=n,t[1]*=i,t[5]*=r,t[9]*=n,t[2]*=i,t[6]*=r,t[10]*=n,t[3]*=i,t[7]*=r,t[11]*=n,this},getMaxScaleOnAxis:function(){var e=this.elements,t=e[0]*e[0]+e[1]*e[1]+e[2]*e[2],i=e[4]*e[4]+e[5]*e[5]+e[6]*e[6],r=e[8]*e[8]+e[9]*e[9]+e[10]*e[10];return Math.sqrt(Math.max(t,i,r))},makeTranslation:function(e,t,i){return this.set(1,0,0,e,0,1,0,t,0,0,1,i,0,0,0,1),this},makeRotationX:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(1,0,0,0,0,t,-i,0,0,i,t,0,0,0,0,1),this},makeRotationY:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(t,0,i,0,0,1,0,0,-i,0,t,0,0,0,0,1),this},makeRotationZ:function(e){var t=Math.cos(e),i=Math.sin(e);return this.set(t,-i,0,0,i,t,0,0,0,0,1,0,0,0,0,1),this},makeRotationAxis:function(e,t){var i=Math.cos(t),r=Math.sin(t),n=1-i,o=e.x,a=e.y,s=e.z,l=n*o,u=n*a;return this.set(l*o+i,l*a-r*s,l*s+r*a,0,l*a+r*s,u*a+i,u*s-r*o,0,l*s-r*a,u*s+r*o,n*s*s+i,0,0,0,0,1),this},makeScale:function(e,t,i){return this.set(e,0,0,0,0,t,0,0,0,0,i,0,0,0,0,1),this},makeShear:function(e,t,i){return this.set(1,t,i,0,e,1,i,0,e,t,1,0,0,0,0,1),this},compose:function(e,t,i){var r=this.elements,n=t._x,o=t._y,a=t._z,s=t._w,l=n+n,u=o+o,h=a+a,c=n*l,d=n*u,p=n*h,f=o*u,m=o*h,v=a*h,g=s*l,y=s*u,_=s*h,b=i.x,x=i.y,w=i.z;return r[0]=(1-(f+v))*b,r[1]=(d+_)*b,r[2]=(p-y)*b,r[3]=0,r[4]=(d-_)*x,r[5]=(1-(c+v))*x,r[6]=(m+g)*x,r[7]=0,r[8]=(p+y)*w,r[9]=(m-g)*w,r[10]=(1-(c+f))*w,r[11]=0,r[12]=e.x,r[13]=e.y,r[14]=e.z,r[15]=1,this},decompose:(vector=new Vector3,matrix=new Matrix4,function(e,t,i){var r=this.elements,n=vector.set(r[0],r[1],r[2]).length(),o=vector.set(r[4],r[5],r[6]).length(),a=vector.set(r[8],r[9],r[10]).length();this.determinant()<0&&(n=-n),e.x=r[12],e.y=r[13],e.z=r[14],matrix.copy(this);var s=1/n,l=1/o,u=1/a;return matrix.elements[0]*=s,matrix.elements[1]*=s,matrix.elements[2]*=s,matrix.elements[4]*=l,matrix.elements[5]*=l,matrix.elements[6]*=l,matrix.elements[8]*=u,matrix.elements[9]*=u,matrix.elements[10]*=u,t.setFromRotationMatrix(matrix),i.x=n,i.y=o,i.z=a,this}),makePerspective:function(e,t,i,r,n,o){void 0===o&&console.warn("Matrix4: .makePerspective() has been redefined and has a new signature. Please check the docs.");var a=this.elements,s=2*n/(t-e),l=2*n/(i-r),u=(t+e)/(t-e),h=(i+r)/(i-r),c=-(o+n)/(o-n),d=-2*o*n/(o-n);return a[0]=s,a[4]=0,a[8]=u,a[12]=0,a[1]=0,a[5]=l,a[9]=h,a[13]=0,a[2]=0,a[6]=0,a[10]=c,a[14]=d,a[3]=0,a[7]=0,a[11]=-1,a[15]=0,this},makeOrthographic:function(e,t,i,r,n,o){var a=this.elements,s=1/(t-e),l=1/(i-r),u=1/(o-n),h=(t+e)*s,c=(i+r)*l,d=(o+n)*u;return a[0]=2*s,a[4]=0,a[8]=0,a[12]=-h,a[1]=0,a[5]=2*l,a[9]=0,a[13]=-c,a[2]=0,a[6]=0,a[10]=-2*u,a[14]=-d,a[3]=0,a[7]=0,a[11]=0,a[15]=1,this},equals:function(e){for(var t=this.elements,i=e.elements,r=0;r<16;r++)if(t[r]!==i[r])return!1;return!0},fromArray:function(e,t){void 0===t&&(t=0);for(var i=0;i<16;i++)this.elements[i]=e[i+t];return this},toArray:function(e,t){void 0===e&&(e=[]),void 0===t&&(t=0);var i=this.elements;return e[t]=i[0],e[t+1]=i[1],e[t+2]=i[2],e[t+3]=i[3],e[t+4]=i[4],e[t+5]=i[5],e[t+6]=i[6],e[t+7]=i[7],e[t+8]=i[8],e[t+9]=i[9],e[t+10]=i[10],e[t+11]=i[11],e[t+12]=i[12],e[t+13]=i[13],e[t+14]=i[14],e[t+15]=i[15],e}}),Object.assign(Vector3.prototype,{isVector3:!0,set:function(e,t,i){return this.x=e,this.y=t,this.z=i,this},setScalar:function(e){return this.x=e,this.y=e,this.z=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setZ:function(e){return this.z=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;case 2:this.z=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;case 2:return this.z;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y,this.z)},copy:function(e){return this.x=e.x,this.y=e.y,this.z=e.z,this},add:function(e,t){return void 0!==t?(console.warn("Vector3: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this.z+=e.z,this)},addScalar:function(e){return this.x+=e,this.y+=e,this.z+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this.z=e.z+t.z,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this.z+=e.z*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector3: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this.z-=e.z,this)},subScalar:function(e){return this.x-=e,this.y-=e,this.z-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this.z=e.z-t.z,this},multiply:function(e,t){return void 0!==t?(console.warn("Vector3: .multiply() now only accepts one argument. Use .multiplyVectors( a, b ) instead."),this.multiplyVectors(e,t)):(this.x*=e.x,this.y*=e.y,this.z*=e.z,this)},multiplyScalar:function(e){return this.x*=e,this.y*=e,this.z*=e,this},multiplyVectors:function(e,t){return this.x=e.x*t.x,this.y=e.y*t.y,this.z=e.z*t.z,this},applyEuler:(quaternion=new Quaternion,function(e){return e&&e.isEuler||console.error("Vector3: .applyEuler() now expects an Euler rotation rather than a Vector3 and order."),this.applyQuaternion(quaternion.setFromEuler(e))}),applyAxisAngle:function(){var e=new Quaternion;return function(t,i){return this.applyQuaternion(e.setFromAxisAngle(t,i))}}(),applyMatrix3:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements;return this.x=n[0]*t+n[3]*i+n[6]*r,this.y=n[1]*t+n[4]*i+n[7]*r,this.z=n[2]*t+n[5]*i+n[8]*r,this},applyMatrix4:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements,o=1/(n[3]*t+n[7]*i+n[11]*r+n[15]);return this.x=(n[0]*t+n[4]*i+n[8]*r+n[12])*o,this.y=(n[1]*t+n[5]*i+n[9]*r+n[13])*o,this.z=(n[2]*t+n[6]*i+n[10]*r+n[14])*o,this},applyQuaternion:function(e){var t=this.x,i=this.y,r=this.z,n=e.x,o=e.y,a=e.z,s=e.w,l=s*t+o*r-a*i,u=s*i+a*t-n*r,h=s*r+n*i-o*t,c=-n*t-o*i-a*r;return this.x=l*s+c*-n+u*-a-h*-o,this.y=u*s+c*-o+h*-n-l*-a,this.z=h*s+c*-a+l*-o-u*-n,this},project:function(e){return this.applyMatrix4(e.matrixWorldInverse).applyMatrix4(e.projectionMatrix)},unproject:function(){var e=new Matrix4;return function(t){return this.applyMatrix4(e.getInverse(t.projectionMatrix)).applyMatrix4(t.matrixWorld)}}(),transformDirection:function(e){var t=this.x,i=this.y,r=this.z,n=e.elements;return this.x=n[0]*t+n[4]*i+n[8]*r,this.y=n[1]*t+n[5]*i+n[9]*r,this.z=n[2]*t+n[6]*i+n[10]*r,this.normalize()},divide:function(e){return this.x/=e.x,this.y/=e.y,this.z/=e.z,this},divideScalar:function(e){return this.multiplyScalar(1/e)},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this.z=Math.min(this.z,e.z),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this.z=Math.max(this.z,e.z),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this.z=Math.max(e.z,Math.min(t.z,this.z)),this},clampScalar:(min=new Vector3,max=new Vector3,function(e,t){return min.set(e,e,e),max.set(t,t,t),this.clamp(min,max)}),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this.z=Math.floor(this.z),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this.z=Math.ceil(this.z),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this.z=Math.round(this.z),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this.z=this.z<0?Math.ceil(this.z):Math.floor(this.z),this},negate:function(){return this.x=-this.x,this.y=-this.y,this.z=-this.z,this},dot:function(e){return this.x*e.x+this.y*e.y+this.z*e.z},lengthSq:function(){return this.x*this.x+this.y*this.y+this.z*this.z},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y+this.z*this.z)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)+Math.abs(this.z)},normalize:function(){return this.divideScalar(this.length()||1)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this.z+=(e.z-this.z)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},cross:function(e,t){return void 0!==t?(console.warn("Vector3: .cross() now only accepts one argument. Use .crossVectors( a, b ) instead."),this.crossVectors(e,t)):this.crossVectors(this,e)},crossVectors:function(e,t){var i=e.x,r=e.y,n=e.z,o=t.x,a=t.y,s=t.z;return this.x=r*s-n*a,this.y=n*o-i*s,this.z=i*a-r*o,this},projectOnVector:function(e){var t=e.dot(this)/e.lengthSq();return this.copy(e).multiplyScalar(t)},projectOnPlane:function(){var e=new Vector3;return function(t){return e.copy(this).projectOnVector(t),this.sub(e)}}(),reflect:function(){var e=new Vector3;return function(t){return this.sub(e.copy(t).multiplyScalar(2*this.dot(t)))}}(),angleTo:function(e){var t=this.dot(e)/Math.sqrt(this.lengthSq()*e.lengthSq());return Math.acos(_Math.clamp(t,-1,1))},distanceTo:function(e){return Math.sqrt(this.distanceToSquared(e))},distanceToSquared:function(e){var t=this.x-e.x,i=this.y-e.y,r=this.z-e.z;return t*t+i*i+r*r},manhattanDistanceTo:function(e){return Math.abs(this.x-e.x)+Math.abs(this.y-e.y)+Math.abs(this.z-e.z)},setFromSpherical:function(e){return this.setFromSphericalCoords(e.radius,e.phi,e.theta)},setFromSphericalCoords:function(e,t,i){var r=Math.sin(t)*e;return this.x=r*Math.sin(i),this.y=Math.cos(t)*e,this.z=r*Math.cos(i),this},setFromCylindrical:function(e){return this.setFromCylindricalCoords(e.radius,e.theta,e.y)},setFromCylindricalCoords:function(e,t,i){return this.x=e*Math.sin(t),this.y=i,this.z=e*Math.cos(t),this},setFromMatrixPosition:function(e){var t=e.elements;return this.x=t[12],this.y=t[13],this.z=t[14],this},setFromMatrixScale:function(e){var t=this.setFromMatrixColumn(e,0).length(),i=this.setFromMatrixColumn(e,1).length(),r=this.setFromMatrixColumn(e,2).length();return this.x=t,this.y=i,this.z=r,this},setFromMatrixColumn:function(e,t){return this.fromArray(e.elements,4*t)},equals:function(e){return e.x===this.x&&e.y===this.y&&e.z===this.z},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this.z=e[t+2],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e[t+2]=this.z,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector3: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this.z=e.getZ(t),this}}),Object.assign(Quaternion,{slerp:function(e,t,i,r){return i.copy(e).slerp(t,r)},slerpFlat:function(e,t,i,r,n,o,a){var s=i[r+0],l=i[r+1],u=i[r+2],h=i[r+3],c=n[o+0],d=n[o+1],p=n[o+2],f=n[o+3];if(h!==f||s!==c||l!==d||u!==p){var m=1-a,v=s*c+l*d+u*p+h*f,g=v>=0?1:-1,y=1-v*v;if(y>Number.EPSILON){var _=Math.sqrt(y),b=Math.atan2(_,v*g);m=Math.sin(m*b)/_,a=Math.sin(a*b)/_}var x=a*g;if(s=s*m+c*x,l=l*m+d*x,u=u*m+p*x,h=h*m+f*x,m===1-a){var w=1/Math.sqrt(s*s+l*l+u*u+h*h);s*=w,l*=w,u*=w,h*=w}}e[t]=s,e[t+1]=l,e[t+2]=u,e[t+3]=h}}),Object.defineProperties(Quaternion.prototype,{x:{get:function(){return this._x},set:function(e){this._x=e,this.onChangeCallback()}},y:{get:function(){return this._y},set:function(e){this._y=e,this.onChangeCallback()}},z:{get:function(){return this._z},set:function(e){this._z=e,this.onChangeCallback()}},w:{get:function(){return this._w},set:function(e){this._w=e,this.onChangeCallback()}}}),Object.assign(Quaternion.prototype,{isQuaternion:!0,set:function(e,t,i,r){return this._x=e,this._y=t,this._z=i,this._w=r,this.onChangeCallback(),this},clone:function(){return new this.constructor(this._x,this._y,this._z,this._w)},copy:function(e){return this._x=e.x,this._y=e.y,this._z=e.z,this._w=e.w,this.onChangeCallback(),this},setFromEuler:function(e,t){if(!e||!e.isEuler)throw new Error("Quaternion: .setFromEuler() now expects an Euler rotation rather than a Vector3 and order.");var i=e._x,r=e._y,n=e._z,o=e.order,a=Math.cos,s=Math.sin,l=a(i/2),u=a(r/2),h=a(n/2),c=s(i/2),d=s(r/2),p=s(n/2);return"XYZ"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h-c*d*p):"YXZ"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h+c*d*p):"ZXY"===o?(this._x=c*u*h-l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h-c*d*p):"ZYX"===o?(this._x=c*u*h-l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h+c*d*p):"YZX"===o?(this._x=c*u*h+l*d*p,this._y=l*d*h+c*u*p,this._z=l*u*p-c*d*h,this._w=l*u*h-c*d*p):"XZY"===o&&(this._x=c*u*h-l*d*p,this._y=l*d*h-c*u*p,this._z=l*u*p+c*d*h,this._w=l*u*h+c*d*p),!1!==t&&this.onChangeCallback(),this},setFromAxisAngle:function(e,t){var i=t/2,r=Math.sin(i);return this._x=e.x*r,this._y=e.y*r,this._z=e.z*r,this._w=Math.cos(i),this.onChangeCallback(),this},setFromRotationMatrix:function(e){var t,i=e.elements,r=i[0],n=i[4],o=i[8],a=i[1],s=i[5],l=i[9],u=i[2],h=i[6],c=i[10],d=r+s+c;return d>0?(t=.5/Math.sqrt(d+1),this._w=.25/t,this._x=(h-l)*t,this._y=(o-u)*t,this._z=(a-n)*t):r>s&&r>c?(t=2*Math.sqrt(1+r-s-c),this._w=(h-l)/t,this._x=.25*t,this._y=(n+a)/t,this._z=(o+u)/t):s>c?(t=2*Math.sqrt(1+s-r-c),this._w=(o-u)/t,this._x=(n+a)/t,this._y=.25*t,this._z=(l+h)/t):(t=2*Math.sqrt(1+c-r-s),this._w=(a-n)/t,this._x=(o+u)/t,this._y=(l+h)/t,this._z=.25*t),this.onChangeCallback(),this},setFromUnitVectors:function(){var e,t=new Vector3;return function(i,r){return void 0===t&&(t=new Vector3),(e=i.dot(r)+1)<1e-6?(e=0,Math.abs(i.x)>Math.abs(i.z)?t.set(-i.y,i.x,0):t.set(0,-i.z,i.y)):t.crossVectors(i,r),this._x=t.x,this._y=t.y,this._z=t.z,this._w=e,this.normalize()}}(),angleTo:function(e){return 2*Math.acos(Math.abs(_Math.clamp(this.dot(e),-1,1)))},rotateTowards:function(e,t){var i=this.angleTo(e);if(0===i)return this;var r=Math.min(1,t/i);return this.slerp(e,r),this},inverse:function(){return this.conjugate()},conjugate:function(){return this._x*=-1,this._y*=-1,this._z*=-1,this.onChangeCallback(),this},dot:function(e){return this._x*e._x+this._y*e._y+this._z*e._z+this._w*e._w},lengthSq:function(){return this._x*this._x+this._y*this._y+this._z*this._z+this._w*this._w},length:function(){return Math.sqrt(this._x*this._x+this._y*this._y+this._z*this._z+this._w*this._w)},normalize:function(){var e=this.length();return 0===e?(this._x=0,this._y=0,this._z=0,this._w=1):(e=1/e,this._x=this._x*e,this._y=this._y*e,this._z=this._z*e,this._w=this._w*e),this.onChangeCallback(),this},multiply:function(e,t){return void 0!==t?(console.warn("Quaternion: .multiply() now only accepts one argument. Use .multiplyQuaternions( a, b ) instead."),this.multiplyQuaternions(e,t)):this.multiplyQuaternions(this,e)},premultiply:function(e){return this.multiplyQuaternions(e,this)},multiplyQuaternions:function(e,t){var i=e._x,r=e._y,n=e._z,o=e._w,a=t._x,s=t._y,l=t._z,u=t._w;return this._x=i*u+o*a+r*l-n*s,this._y=r*u+o*s+n*a-i*l,this._z=n*u+o*l+i*s-r*a,this._w=o*u-i*a-r*s-n*l,this.onChangeCallback(),this},slerp:function(e,t){if(0===t)return this;if(1===t)return this.copy(e);var i=this._x,r=this._y,n=this._z,o=this._w,a=o*e._w+i*e._x+r*e._y+n*e._z;if(a<0?(this._w=-e._w,this._x=-e._x,this._y=-e._y,this._z=-e._z,a=-a):this.copy(e),a>=1)return this._w=o,this._x=i,this._y=r,this._z=n,this;var s=1-a*a;if(s<=Number.EPSILON){var l=1-t;return this._w=l*o+t*this._w,this._x=l*i+t*this._x,this._y=l*r+t*this._y,this._z=l*n+t*this._z,this.normalize()}var u=Math.sqrt(s),h=Math.atan2(u,a),c=Math.sin((1-t)*h)/u,d=Math.sin(t*h)/u;return this._w=o*c+this._w*d,this._x=i*c+this._x*d,this._y=r*c+this._y*d,this._z=n*c+this._z*d,this.onChangeCallback(),this},equals:function(e){return e._x===this._x&&e._y===this._y&&e._z===this._z&&e._w===this._w},fromArray:function(e,t){return void 0===t&&(t=0),this._x=e[t],this._y=e[t+1],this._z=e[t+2],this._w=e[t+3],this.onChangeCallback(),this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this._x,e[t+1]=this._y,e[t+2]=this._z,e[t+3]=this._w,e},onChange:function(e){return this.onChangeCallback=e,this},onChangeCallback:function(){}}),Object.assign(EventDispatcher.prototype,{addEventListener:function(e,t){void 0===this._listeners&&(this._listeners={});var i=this._listeners;void 0===i[e]&&(i[e]=[]),-1===i[e].indexOf(t)&&i[e].push(t)},hasEventListener:function(e,t){if(void 0===this._listeners)return!1;var i=this._listeners;return void 0!==i[e]&&-1!==i[e].indexOf(t)},removeEventListener:function(e,t){if(void 0!==this._listeners){var i=this._listeners[e];if(void 0!==i){var r=i.indexOf(t);-1!==r&&i.splice(r,1)}}},dispatchEvent:function(e){if(void 0!==this._listeners){var t=this._listeners[e.type];if(void 0!==t){e.target=this;for(var i=t.slice(0),r=0,n=i.length;r<n;r++)i[r].call(this,e)}}}}),Euler.RotationOrders=["XYZ","YZX","ZXY","XZY","YXZ","ZYX"],Euler.DefaultOrder="XYZ",Object.defineProperties(Euler.prototype,{x:{get:function(){return this._x},set:function(e){this._x=e,this.onChangeCallback()}},y:{get:function(){return this._y},set:function(e){this._y=e,this.onChangeCallback()}},z:{get:function(){return this._z},set:function(e){this._z=e,this.onChangeCallback()}},order:{get:function(){return this._order},set:function(e){this._order=e,this.onChangeCallback()}}}),Object.assign(Euler.prototype,{isEuler:!0,set:function(e,t,i,r){return this._x=e,this._y=t,this._z=i,this._order=r||this._order,this.onChangeCallback(),this},clone:function(){return new this.constructor(this._x,this._y,this._z,this._order)},copy:function(e){return this._x=e._x,this._y=e._y,this._z=e._z,this._order=e._order,this.onChangeCallback(),this},setFromRotationMatrix:function(e,t,i){var r=_Math.clamp,n=e.elements,o=n[0],a=n[4],s=n[8],l=n[1],u=n[5],h=n[9],c=n[2],d=n[6],p=n[10];return"XYZ"===(t=t||this._order)?(this._y=Math.asin(r(s,-1,1)),Math.abs(s)<.99999?(this._x=Math.atan2(-h,p),this._z=Math.atan2(-a,o)):(this._x=Math.atan2(d,u),this._z=0)):"YXZ"===t?(this._x=Math.asin(-r(h,-1,1)),Math.abs(h)<.99999?(this._y=Math.atan2(s,p),this._z=Math.atan2(l,u)):(this._y=Math.atan2(-c,o),this._z=0)):"ZXY"===t?(this._x=Math.asin(r(d,-1,1)),Math.abs(d)<.99999?(this._y=Math.atan2(-c,p),this._z=Math.atan2(-a,u)):(this._y=0,this._z=Math.atan2(l,o))):"ZYX"===t?(this._y=Math.asin(-r(c,-1,1)),Math.abs(c)<.99999?(this._x=Math.atan2(d,p),this._z=Math.atan2(l,o)):(this._x=0,this._z=Math.atan2(-a,u))):"YZX"===t?(this._z=Math.asin(r(l,-1,1)),Math.abs(l)<.99999?(this._x=Math.atan2(-h,u),this._y=Math.atan2(-c,o)):(this._x=0,this._y=Math.atan2(s,p))):"XZY"===t?(this._z=Math.asin(-r(a,-1,1)),Math.abs(a)<.99999?(this._x=Math.atan2(d,u),this._y=Math.atan2(s,o)):(this._x=Math.atan2(-h,p),this._y=0)):console.warn("Euler: .setFromRotationMatrix() given unsupported order: "+t),this._order=t,!1!==i&&this.onChangeCallback(),this},setFromQuaternion:function(){var e=new Matrix4;return function(t,i,r){return e.makeRotationFromQuaternion(t),this.setFromRotationMatrix(e,i,r)}}(),setFromVector3:function(e,t){return this.set(e.x,e.y,e.z,t||this._order)},reorder:(q=new Quaternion,function(e){return q.setFromEuler(this),this.setFromQuaternion(q,e)}),equals:function(e){return e._x===this._x&&e._y===this._y&&e._z===this._z&&e._order===this._order},fromArray:function(e){return this._x=e[0],this._y=e[1],this._z=e[2],void 0!==e[3]&&(this._order=e[3]),this.onChangeCallback(),this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this._x,e[t+1]=this._y,e[t+2]=this._z,e[t+3]=this._order,e},toVector3:function(e){return e?e.set(this._x,this._y,this._z):new Vector3(this._x,this._y,this._z)},onChange:function(e){return this.onChangeCallback=e,this},onChangeCallback:function(){}}),Object.assign(Layers.prototype,{set:function(e){this.mask=1<<e|0},enable:function(e){this.mask|=1<<e|0},toggle:function(e){this.mask^=1<<e|0},disable:function(e){this.mask&=~(1<<e|0)},test:function(e){return 0!=(this.mask&e.mask)}}),Object.assign(Matrix3.prototype,{isMatrix3:!0,set:function(e,t,i,r,n,o,a,s,l){var u=this.elements;return u[0]=e,u[1]=r,u[2]=a,u[3]=t,u[4]=n,u[5]=s,u[6]=i,u[7]=o,u[8]=l,this},identity:function(){return this.set(1,0,0,0,1,0,0,0,1),this},clone:function(){return(new this.constructor).fromArray(this.elements)},copy:function(e){var t=this.elements,i=e.elements;return t[0]=i[0],t[1]=i[1],t[2]=i[2],t[3]=i[3],t[4]=i[4],t[5]=i[5],t[6]=i[6],t[7]=i[7],t[8]=i[8],this},setFromMatrix4:function(e){var t=e.elements;return this.set(t[0],t[4],t[8],t[1],t[5],t[9],t[2],t[6],t[10]),this},applyToBufferAttribute:function(){var e=new Vector3;return function(t){for(var i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.applyMatrix3(this),t.setXYZ(i,e.x,e.y,e.z);return t}}(),multiply:function(e){return this.multiplyMatrices(this,e)},premultiply:function(e){return this.multiplyMatrices(e,this)},multiplyMatrices:function(e,t){var i=e.elements,r=t.elements,n=this.elements,o=i[0],a=i[3],s=i[6],l=i[1],u=i[4],h=i[7],c=i[2],d=i[5],p=i[8],f=r[0],m=r[3],v=r[6],g=r[1],y=r[4],_=r[7],b=r[2],x=r[5],w=r[8];return n[0]=o*f+a*g+s*b,n[3]=o*m+a*y+s*x,n[6]=o*v+a*_+s*w,n[1]=l*f+u*g+h*b,n[4]=l*m+u*y+h*x,n[7]=l*v+u*_+h*w,n[2]=c*f+d*g+p*b,n[5]=c*m+d*y+p*x,n[8]=c*v+d*_+p*w,this},multiplyScalar:function(e){var t=this.elements;return t[0]*=e,t[3]*=e,t[6]*=e,t[1]*=e,t[4]*=e,t[7]*=e,t[2]*=e,t[5]*=e,t[8]*=e,this},determinant:function(){var e=this.elements,t=e[0],i=e[1],r=e[2],n=e[3],o=e[4],a=e[5],s=e[6],l=e[7],u=e[8];return t*o*u-t*a*l-i*n*u+i*a*s+r*n*l-r*o*s},getInverse:function(e,t){e&&e.isMatrix4&&console.error("Matrix3: .getInverse() no longer takes a Matrix4 argument.");var i=e.elements,r=this.elements,n=i[0],o=i[1],a=i[2],s=i[3],l=i[4],u=i[5],h=i[6],c=i[7],d=i[8],p=d*l-u*c,f=u*h-d*s,m=c*s-l*h,v=n*p+o*f+a*m;if(0===v){var g="Matrix3: .getInverse() can't invert matrix, determinant is 0";if(!0===t)throw new Error(g);return console.warn(g),this.identity()}var y=1/v;return r[0]=p*y,r[1]=(a*c-d*o)*y,r[2]=(u*o-a*l)*y,r[3]=f*y,r[4]=(d*n-a*h)*y,r[5]=(a*s-u*n)*y,r[6]=m*y,r[7]=(o*h-c*n)*y,r[8]=(l*n-o*s)*y,this},transpose:function(){var e,t=this.elements;return e=t[1],t[1]=t[3],t[3]=e,e=t[2],t[2]=t[6],t[6]=e,e=t[5],t[5]=t[7],t[7]=e,this},getNormalMatrix:function(e){return this.setFromMatrix4(e).getInverse(this).transpose()},transposeIntoArray:function(e){var t=this.elements;return e[0]=t[0],e[1]=t[3],e[2]=t[6],e[3]=t[1],e[4]=t[4],e[5]=t[7],e[6]=t[2],e[7]=t[5],e[8]=t[8],this},setUvTransform:function(e,t,i,r,n,o,a){var s=Math.cos(n),l=Math.sin(n);this.set(i*s,i*l,-i*(s*o+l*a)+o+e,-r*l,r*s,-r*(-l*o+s*a)+a+t,0,0,1)},scale:function(e,t){var i=this.elements;return i[0]*=e,i[3]*=e,i[6]*=e,i[1]*=t,i[4]*=t,i[7]*=t,this},rotate:function(e){var t=Math.cos(e),i=Math.sin(e),r=this.elements,n=r[0],o=r[3],a=r[6],s=r[1],l=r[4],u=r[7];return r[0]=t*n+i*s,r[3]=t*o+i*l,r[6]=t*a+i*u,r[1]=-i*n+t*s,r[4]=-i*o+t*l,r[7]=-i*a+t*u,this},translate:function(e,t){var i=this.elements;return i[0]+=e*i[2],i[3]+=e*i[5],i[6]+=e*i[8],i[1]+=t*i[2],i[4]+=t*i[5],i[7]+=t*i[8],this},equals:function(e){for(var t=this.elements,i=e.elements,r=0;r<9;r++)if(t[r]!==i[r])return!1;return!0},fromArray:function(e,t){void 0===t&&(t=0);for(var i=0;i<9;i++)this.elements[i]=e[i+t];return this},toArray:function(e,t){void 0===e&&(e=[]),void 0===t&&(t=0);var i=this.elements;return e[t]=i[0],e[t+1]=i[1],e[t+2]=i[2],e[t+3]=i[3],e[t+4]=i[4],e[t+5]=i[5],e[t+6]=i[6],e[t+7]=i[7],e[t+8]=i[8],e}});var REVISION="102",MOUSE={LEFT:0,MIDDLE:1,RIGHT:2},CullFaceNone=0,CullFaceBack=1,CullFaceFront=2,CullFaceFrontBack=3,FrontFaceDirectionCW=0,FrontFaceDirectionCCW=1,BasicShadowMap=0,PCFShadowMap=1,PCFSoftShadowMap=2,FrontSide=0,BackSide=1,DoubleSide=2,FlatShading=1,SmoothShading=2,NoColors=0,FaceColors=1,VertexColors=2,NoBlending=0,NormalBlending=1,AdditiveBlending=2,SubtractiveBlending=3,MultiplyBlending=4,CustomBlending=5,AddEquation=100,SubtractEquation=101,ReverseSubtractEquation=102,MinEquation=103,MaxEquation=104,ZeroFactor=200,OneFactor=201,SrcColorFactor=202,OneMinusSrcColorFactor=203,SrcAlphaFactor=204,OneMinusSrcAlphaFactor=205,DstAlphaFactor=206,OneMinusDstAlphaFactor=207,DstColorFactor=208,OneMinusDstColorFactor=209,SrcAlphaSaturateFactor=210,NeverDepth=0,AlwaysDepth=1,LessDepth=2,LessEqualDepth=3,EqualDepth=4,GreaterEqualDepth=5,GreaterDepth=6,NotEqualDepth=7,MultiplyOperation=0,MixOperation=1,AddOperation=2,NoToneMapping=0,LinearToneMapping=1,ReinhardToneMapping=2,Uncharted2ToneMapping=3,CineonToneMapping=4,ACESFilmicToneMapping=5,UVMapping=300,CubeReflectionMapping=301,CubeRefractionMapping=302,EquirectangularReflectionMapping=303,EquirectangularRefractionMapping=304,SphericalReflectionMapping=305,CubeUVReflectionMapping=306,CubeUVRefractionMapping=307,RepeatWrapping=1e3,ClampToEdgeWrapping=1001,MirroredRepeatWrapping=1002,NearestFilter=1003,NearestMipMapNearestFilter=1004,NearestMipMapLinearFilter=1005,LinearFilter=1006,LinearMipMapNearestFilter=1007,LinearMipMapLinearFilter=1008,UnsignedByteType=1009,ByteType=1010,ShortType=1011,UnsignedShortType=1012,IntType=1013,UnsignedIntType=1014,FloatType=1015,HalfFloatType=1016,UnsignedShort4444Type=1017,UnsignedShort5551Type=1018,UnsignedShort565Type=1019,UnsignedInt248Type=1020,AlphaFormat=1021,RGBFormat=1022,RGBAFormat=1023,LuminanceFormat=1024,LuminanceAlphaFormat=1025,RGBEFormat=RGBAFormat,DepthFormat=1026,DepthStencilFormat=1027,RedFormat=1028,RGB_S3TC_DXT1_Format=33776,RGBA_S3TC_DXT1_Format=33777,RGBA_S3TC_DXT3_Format=33778,RGBA_S3TC_DXT5_Format=33779,RGB_PVRTC_4BPPV1_Format=35840,RGB_PVRTC_2BPPV1_Format=35841,RGBA_PVRTC_4BPPV1_Format=35842,RGBA_PVRTC_2BPPV1_Format=35843,RGB_ETC1_Format=36196,RGBA_ASTC_4x4_Format=37808,RGBA_ASTC_5x4_Format=37809,RGBA_ASTC_5x5_Format=37810,RGBA_ASTC_6x5_Format=37811,RGBA_ASTC_6x6_Format=37812,RGBA_ASTC_8x5_Format=37813,RGBA_ASTC_8x6_Format=37814,RGBA_ASTC_8x8_Format=37815,RGBA_ASTC_10x5_Format=37816,RGBA_ASTC_10x6_Format=37817,RGBA_ASTC_10x8_Format=37818,RGBA_ASTC_10x10_Format=37819,RGBA_ASTC_12x10_Format=37820,RGBA_ASTC_12x12_Format=37821,LoopOnce=2200,LoopRepeat=2201,LoopPingPong=2202,InterpolateDiscrete=2300,InterpolateLinear=2301,InterpolateSmooth=2302,ZeroCurvatureEnding=2400,ZeroSlopeEnding=2401,WrapAroundEnding=2402,TrianglesDrawMode=0,TriangleStripDrawMode=1,TriangleFanDrawMode=2,LinearEncoding=3e3,sRGBEncoding=3001,GammaEncoding=3007,RGBEEncoding=3002,LogLuvEncoding=3003,RGBM7Encoding=3004,RGBM16Encoding=3005,RGBDEncoding=3006,BasicDepthPacking=3200,RGBADepthPacking=3201,TangentSpaceNormalMap=0,ObjectSpaceNormalMap=1,object3DId=0,position,scale,m1,q1;function Object3D(){Object.defineProperty(this,"id",{value:object3DId++}),this.uuid=_Math.generateUUID(),this.name="",this.type="Object3D",this.parent=null,this.children=[],this.up=Object3D.DefaultUp.clone();var e=new Vector3,t=new Euler,i=new Quaternion,r=new Vector3(1,1,1);t.onChange(function(){i.setFromEuler(t,!1)}),i.onChange(function(){t.setFromQuaternion(i,void 0,!1)}),Object.defineProperties(this,{position:{configurable:!0,enumerable:!0,value:e},rotation:{configurable:!0,enumerable:!0,value:t},quaternion:{configurable:!0,enumerable:!0,value:i},scale:{configurable:!0,enumerable:!0,value:r},modelViewMatrix:{value:new Matrix4},normalMatrix:{value:new Matrix3}}),this.matrix=new Matrix4,this.matrixWorld=new Matrix4,this.matrixAutoUpdate=Object3D.DefaultMatrixAutoUpdate,this.matrixWorldNeedsUpdate=!1,this.layers=new Layers,this.visible=!0,this.castShadow=!1,this.receiveShadow=!1,this.frustumCulled=!0,this.renderOrder=0,this.userData={}}Object3D.DefaultUp=new Vector3(0,1,0),Object3D.DefaultMatrixAutoUpdate=!0,Object3D.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Object3D,isObject3D:!0,onBeforeRender:function(){},onAfterRender:function(){},applyMatrix:function(e){this.matrix.multiplyMatrices(e,this.matrix),this.matrix.decompose(this.position,this.quaternion,this.scale)},applyQuaternion:function(e){return this.quaternion.premultiply(e),this},setRotationFromAxisAngle:function(e,t){this.quaternion.setFromAxisAngle(e,t)},setRotationFromEuler:function(e){this.quaternion.setFromEuler(e,!0)},setRotationFromMatrix:function(e){this.quaternion.setFromRotationMatrix(e)},setRotationFromQuaternion:function(e){this.quaternion.copy(e)},rotateOnAxis:(q1=new Quaternion,function(e,t){return q1.setFromAxisAngle(e,t),this.quaternion.multiply(q1),this}),rotateOnWorldAxis:function(){var e=new Quaternion;return function(t,i){return e.setFromAxisAngle(t,i),this.quaternion.premultiply(e),this}}(),rotateX:function(){var e=new Vector3(1,0,0);return function(t){return this.rotateOnAxis(e,t)}}(),rotateY:function(){var e=new Vector3(0,1,0);return function(t){return this.rotateOnAxis(e,t)}}(),rotateZ:function(){var e=new Vector3(0,0,1);return function(t){return this.rotateOnAxis(e,t)}}(),translateOnAxis:function(){var e=new Vector3;return function(t,i){return e.copy(t).applyQuaternion(this.quaternion),this.position.add(e.multiplyScalar(i)),this}}(),translateX:function(){var e=new Vector3(1,0,0);return function(t){return this.translateOnAxis(e,t)}}(),translateY:function(){var e=new Vector3(0,1,0);return function(t){return this.translateOnAxis(e,t)}}(),translateZ:function(){var e=new Vector3(0,0,1);return function(t){return this.translateOnAxis(e,t)}}(),localToWorld:function(e){return e.applyMatrix4(this.matrixWorld)},worldToLocal:(m1=new Matrix4,function(e){return e.applyMatrix4(m1.getInverse(this.matrixWorld))}),lookAt:function(){var e=new Quaternion,t=new Matrix4,i=new Vector3,r=new Vector3;return function(n,o,a){n.isVector3?i.copy(n):i.set(n,o,a);var s=this.parent;this.updateWorldMatrix(!0,!1),r.setFromMatrixPosition(this.matrixWorld),this.isCamera||this.isLight?t.lookAt(r,i,this.up):t.lookAt(i,r,this.up),this.quaternion.setFromRotationMatrix(t),s&&(t.extractRotation(s.matrixWorld),e.setFromRotationMatrix(t),this.quaternion.premultiply(e.inverse()))}}(),add:function(e){var t=arguments;if(arguments.length>1){for(var i=0;i<arguments.length;i++)this.add(t[i]);return this}return e===this?(console.error("Object3D.add: object can't be added as a child of itself.",e),this):(e&&e.isObject3D?(null!==e.parent&&e.parent.remove(e),e.parent=this,e.dispatchEvent({type:"added"}),this.children.push(e)):console.error("Object3D.add: object not an instance of Object3D.",e),this)},remove:function(e){var t=arguments;if(arguments.length>1){for(var i=0;i<arguments.length;i++)this.remove(t[i]);return this}var r=this.children.indexOf(e);return-1!==r&&(e.parent=null,e.dispatchEvent({type:"removed"}),this.children.splice(r,1)),this},getObjectById:function(e){return this.getObjectByProperty("id",e)},getObjectByName:function(e){return this.getObjectByProperty("name",e)},getObjectByProperty:function(e,t){if(this[e]===t)return this;for(var i=0,r=this.children.length;i<r;i++){var n=this.children[i].getObjectByProperty(e,t);if(void 0!==n)return n}},getWorldPosition:function(e){return void 0===e&&(console.warn("Object3D: .getWorldPosition() target is now required"),e=new Vector3),this.updateMatrixWorld(!0),e.setFromMatrixPosition(this.matrixWorld)},getWorldQuaternion:(position=new Vector3,scale=new Vector3,function(e){return void 0===e&&(console.warn("Object3D: .getWorldQuaternion() target is now required"),e=new Quaternion),this.updateMatrixWorld(!0),this.matrixWorld.decompose(position,e,scale),e}),getWorldScale:function(){var e=new Vector3,t=new Quaternion;return function(i){return void 0===i&&(console.warn("Object3D: .getWorldScale() target is now required"),i=new Vector3),this.updateMatrixWorld(!0),this.matrixWorld.decompose(e,t,i),i}}(),getWorldDirection:function(e){void 0===e&&(console.warn("Object3D: .getWorldDirection() target is now required"),e=new Vector3),this.updateMatrixWorld(!0);var t=this.matrixWorld.elements;return e.set(t[8],t[9],t[10]).normalize()},raycast:function(){},traverse:function(e){e(this);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].traverse(e)},traverseVisible:function(e){if(!1!==this.visible){e(this);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].traverseVisible(e)}},traverseAncestors:function(e){var t=this.parent;null!==t&&(e(t),t.traverseAncestors(e))},updateMatrix:function(){this.matrix.compose(this.position,this.quaternion,this.scale),this.matrixWorldNeedsUpdate=!0},updateMatrixWorld:function(e){this.matrixAutoUpdate&&this.updateMatrix(),(this.matrixWorldNeedsUpdate||e)&&(null===this.parent?this.matrixWorld.copy(this.matrix):this.matrixWorld.multiplyMatrices(this.parent.matrixWorld,this.matrix),this.matrixWorldNeedsUpdate=!1,e=!0);for(var t=this.children,i=0,r=t.length;i<r;i++)t[i].updateMatrixWorld(e)},updateWorldMatrix:function(e,t){var i=this.parent;if(!0===e&&null!==i&&i.updateWorldMatrix(!0,!1),this.matrixAutoUpdate&&this.updateMatrix(),null===this.parent?this.matrixWorld.copy(this.matrix):this.matrixWorld.multiplyMatrices(this.parent.matrixWorld,this.matrix),!0===t)for(var r=this.children,n=0,o=r.length;n<o;n++)r[n].updateWorldMatrix(!1,!0)},toJSON:function(e){var t=void 0===e||"string"==typeof e,i={};t&&(e={geometries:{},materials:{},textures:{},images:{},shapes:{}},i.metadata={version:4.5,type:"Object",generator:"Object3D.toJSON"});var r={};function n(t,i){return void 0===t[i.uuid]&&(t[i.uuid]=i.toJSON(e)),i.uuid}if(r.uuid=this.uuid,r.type=this.type,""!==this.name&&(r.name=this.name),!0===this.castShadow&&(r.castShadow=!0),!0===this.receiveShadow&&(r.receiveShadow=!0),!1===this.visible&&(r.visible=!1),!1===this.frustumCulled&&(r.frustumCulled=!1),0!==this.renderOrder&&(r.renderOrder=this.renderOrder),"{}"!==JSON.stringify(this.userData)&&(r.userData=this.userData),r.layers=this.layers.mask,r.matrix=this.matrix.toArray(),!1===this.matrixAutoUpdate&&(r.matrixAutoUpdate=!1),this.isMesh&&this.drawMode!==TrianglesDrawMode&&(r.drawMode=this.drawMode),this.isMesh||this.isLine||this.isPoints){r.geometry=n(e.geometries,this.geometry);var o=this.geometry.parameters;if(void 0!==o&&void 0!==o.shapes){var a=o.shapes;if(Array.isArray(a))for(var s=0,l=a.length;s<l;s++){var u=a[s];n(e.shapes,u)}else n(e.shapes,a)}}if(void 0!==this.material)if(Array.isArray(this.material)){var h=[];for(s=0,l=this.material.length;s<l;s++)h.push(n(e.materials,this.material[s]));r.material=h}else r.material=n(e.materials,this.material);if(this.children.length>0){r.children=[];for(s=0;s<this.children.length;s++)r.children.push(this.children[s].toJSON(e).object)}if(t){var c=m(e.geometries),d=m(e.materials),p=m(e.textures),f=m(e.images);a=m(e.shapes);c.length>0&&(i.geometries=c),d.length>0&&(i.materials=d),p.length>0&&(i.textures=p),f.length>0&&(i.images=f),a.length>0&&(i.shapes=a)}return i.object=r,i;function m(e){var t=[];for(var i in e){var r=e[i];delete r.metadata,t.push(r)}return t}},clone:function(e){return(new this.constructor).copy(this,e)},copy:function(e,t){if(void 0===t&&(t=!0),this.name=e.name,this.up.copy(e.up),this.position.copy(e.position),this.quaternion.copy(e.quaternion),this.scale.copy(e.scale),this.matrix.copy(e.matrix),this.matrixWorld.copy(e.matrixWorld),this.matrixAutoUpdate=e.matrixAutoUpdate,this.matrixWorldNeedsUpdate=e.matrixWorldNeedsUpdate,this.layers.mask=e.layers.mask,this.visible=e.visible,this.castShadow=e.castShadow,this.receiveShadow=e.receiveShadow,this.frustumCulled=e.frustumCulled,this.renderOrder=e.renderOrder,this.userData=JSON.parse(JSON.stringify(e.userData)),!0===t)for(var i=0;i<e.children.length;i++){var r=e.children[i];this.add(r.clone())}return this}});var ColorKeywords={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074},hslA,hslB,hsl,points,closestPoint,box;function Color(e,t,i){return void 0===t&&void 0===i?this.set(e):this.setRGB(e,t,i)}function Face3(e,t,i,r,n,o){this.a=e,this.b=t,this.c=i,this.normal=r&&r.isVector3?r:new Vector3,this.vertexNormals=Array.isArray(r)?r:[],this.color=n&&n.isColor?n:new Color,this.vertexColors=Array.isArray(n)?n:[],this.materialIndex=void 0!==o?o:0}function Box3(e,t){this.min=void 0!==e?e:new Vector3(1/0,1/0,1/0),this.max=void 0!==t?t:new Vector3(-1/0,-1/0,-1/0)}function Sphere(e,t){this.center=void 0!==e?e:new Vector3,this.radius=void 0!==t?t:0}function Vector2(e,t){this.x=e||0,this.y=t||0}Object.assign(Color.prototype,{isColor:!0,r:1,g:1,b:1,set:function(e){return e&&e.isColor?this.copy(e):"number"==typeof e?this.setHex(e):"string"==typeof e&&this.setStyle(e),this},setScalar:function(e){return this.r=e,this.g=e,this.b=e,this},setHex:function(e){return e=Math.floor(e),this.r=(e>>16&255)/255,this.g=(e>>8&255)/255,this.b=(255&e)/255,this},setRGB:function(e,t,i){return this.r=e,this.g=t,this.b=i,this},setHSL:function(){function e(e,t,i){return i<0&&(i+=1),i>1&&(i-=1),i<1/6?e+6*(t-e)*i:i<.5?t:i<2/3?e+6*(t-e)*(2/3-i):e}return function(t,i,r){if(t=_Math.euclideanModulo(t,1),i=_Math.clamp(i,0,1),r=_Math.clamp(r,0,1),0===i)this.r=this.g=this.b=r;else{var n=r<=.5?r*(1+i):r+i-r*i,o=2*r-n;this.r=e(o,n,t+1/3),this.g=e(o,n,t),this.b=e(o,n,t-1/3)}return this}}(),setStyle:function(e){function t(t){void 0!==t&&parseFloat(t)<1&&console.warn("Color: Alpha component of "+e+" will be ignored.")}var i;if(i=/^((?:rgb|hsl)a?)\(\s*([^\)]*)\)/.exec(e)){var r,n=i[1],o=i[2];switch(n){case"rgb":case"rgba":if(r=/^(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o))return this.r=Math.min(255,parseInt(r[1],10))/255,this.g=Math.min(255,parseInt(r[2],10))/255,this.b=Math.min(255,parseInt(r[3],10))/255,t(r[5]),this;if(r=/^(\d+)\%\s*,\s*(\d+)\%\s*,\s*(\d+)\%\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o))return this.r=Math.min(100,parseInt(r[1],10))/100,this.g=Math.min(100,parseInt(r[2],10))/100,this.b=Math.min(100,parseInt(r[3],10))/100,t(r[5]),this;break;case"hsl":case"hsla":if(r=/^([0-9]*\.?[0-9]+)\s*,\s*(\d+)\%\s*,\s*(\d+)\%\s*(,\s*([0-9]*\.?[0-9]+)\s*)?$/.exec(o)){var a=parseFloat(r[1])/360,s=parseInt(r[2],10)/100,l=parseInt(r[3],10)/100;return t(r[5]),this.setHSL(a,s,l)}}}else if(i=/^\#([A-Fa-f0-9]+)$/.exec(e)){var u,h=(u=i[1]).length;if(3===h)return this.r=parseInt(u.charAt(0)+u.charAt(0),16)/255,this.g=parseInt(u.charAt(1)+u.charAt(1),16)/255,this.b=parseInt(u.charAt(2)+u.charAt(2),16)/255,this;if(6===h)return this.r=parseInt(u.charAt(0)+u.charAt(1),16)/255,this.g=parseInt(u.charAt(2)+u.charAt(3),16)/255,this.b=parseInt(u.charAt(4)+u.charAt(5),16)/255,this}e&&e.length>0&&(void 0!==(u=ColorKeywords[e])?this.setHex(u):console.warn("Color: Unknown color "+e));return this},clone:function(){return new this.constructor(this.r,this.g,this.b)},copy:function(e){return this.r=e.r,this.g=e.g,this.b=e.b,this},copyGammaToLinear:function(e,t){return void 0===t&&(t=2),this.r=Math.pow(e.r,t),this.g=Math.pow(e.g,t),this.b=Math.pow(e.b,t),this},copyLinearToGamma:function(e,t){void 0===t&&(t=2);var i=t>0?1/t:1;return this.r=Math.pow(e.r,i),this.g=Math.pow(e.g,i),this.b=Math.pow(e.b,i),this},convertGammaToLinear:function(e){return this.copyGammaToLinear(this,e),this},convertLinearToGamma:function(e){return this.copyLinearToGamma(this,e),this},copySRGBToLinear:function(){function e(e){return e<.04045?.0773993808*e:Math.pow(.9478672986*e+.0521327014,2.4)}return function(t){return this.r=e(t.r),this.g=e(t.g),this.b=e(t.b),this}}(),copyLinearToSRGB:function(){function e(e){return e<.0031308?12.92*e:1.055*Math.pow(e,.41666)-.055}return function(t){return this.r=e(t.r),this.g=e(t.g),this.b=e(t.b),this}}(),convertSRGBToLinear:function(){return this.copySRGBToLinear(this),this},convertLinearToSRGB:function(){return this.copyLinearToSRGB(this),this},getHex:function(){return 255*this.r<<16^255*this.g<<8^255*this.b<<0},getHexString:function(){return("000000"+this.getHex().toString(16)).slice(-6)},getHSL:function(e){void 0===e&&(console.warn("Color: .getHSL() target is now required"),e={h:0,s:0,l:0});var t,i,r=this.r,n=this.g,o=this.b,a=Math.max(r,n,o),s=Math.min(r,n,o),l=(s+a)/2;if(s===a)t=0,i=0;else{var u=a-s;switch(i=l<=.5?u/(a+s):u/(2-a-s),a){case r:t=(n-o)/u+(n<o?6:0);break;case n:t=(o-r)/u+2;break;case o:t=(r-n)/u+4}t/=6}return e.h=t,e.s=i,e.l=l,e},getStyle:function(){return"rgb("+(255*this.r|0)+","+(255*this.g|0)+","+(255*this.b|0)+")"},offsetHSL:(hsl={},function(e,t,i){return this.getHSL(hsl),hsl.h+=e,hsl.s+=t,hsl.l+=i,this.setHSL(hsl.h,hsl.s,hsl.l),this}),add:function(e){return this.r+=e.r,this.g+=e.g,this.b+=e.b,this},addColors:function(e,t){return this.r=e.r+t.r,this.g=e.g+t.g,this.b=e.b+t.b,this},addScalar:function(e){return this.r+=e,this.g+=e,this.b+=e,this},sub:function(e){return this.r=Math.max(0,this.r-e.r),this.g=Math.max(0,this.g-e.g),this.b=Math.max(0,this.b-e.b),this},multiply:function(e){return this.r*=e.r,this.g*=e.g,this.b*=e.b,this},multiplyScalar:function(e){return this.r*=e,this.g*=e,this.b*=e,this},lerp:function(e,t){return this.r+=(e.r-this.r)*t,this.g+=(e.g-this.g)*t,this.b+=(e.b-this.b)*t,this},lerpHSL:(hslA={h:0,s:0,l:0},hslB={h:0,s:0,l:0},function(e,t){this.getHSL(hslA),e.getHSL(hslB);var i=_Math.lerp(hslA.h,hslB.h,t),r=_Math.lerp(hslA.s,hslB.s,t),n=_Math.lerp(hslA.l,hslB.l,t);return this.setHSL(i,r,n),this}),equals:function(e){return e.r===this.r&&e.g===this.g&&e.b===this.b},fromArray:function(e,t){return void 0===t&&(t=0),this.r=e[t],this.g=e[t+1],this.b=e[t+2],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.r,e[t+1]=this.g,e[t+2]=this.b,e},toJSON:function(){return this.getHex()}}),Object.assign(Face3.prototype,{clone:function(){return(new this.constructor).copy(this)},copy:function(e){this.a=e.a,this.b=e.b,this.c=e.c,this.normal.copy(e.normal),this.color.copy(e.color),this.materialIndex=e.materialIndex;for(var t=0,i=e.vertexNormals.length;t<i;t++)this.vertexNormals[t]=e.vertexNormals[t].clone();for(t=0,i=e.vertexColors.length;t<i;t++)this.vertexColors[t]=e.vertexColors[t].clone();return this}}),Object.assign(Box3.prototype,{isBox3:!0,set:function(e,t){return this.min.copy(e),this.max.copy(t),this},setFromArray:function(e){for(var t=1/0,i=1/0,r=1/0,n=-1/0,o=-1/0,a=-1/0,s=0,l=e.length;s<l;s+=3){var u=e[s],h=e[s+1],c=e[s+2];u<t&&(t=u),h<i&&(i=h),c<r&&(r=c),u>n&&(n=u),h>o&&(o=h),c>a&&(a=c)}return this.min.set(t,i,r),this.max.set(n,o,a),this},setFromBufferAttribute:function(e){for(var t=1/0,i=1/0,r=1/0,n=-1/0,o=-1/0,a=-1/0,s=0,l=e.count;s<l;s++){var u=e.getX(s),h=e.getY(s),c=e.getZ(s);u<t&&(t=u),h<i&&(i=h),c<r&&(r=c),u>n&&(n=u),h>o&&(o=h),c>a&&(a=c)}return this.min.set(t,i,r),this.max.set(n,o,a),this},setFromPoints:function(e){this.makeEmpty();for(var t=0,i=e.length;t<i;t++)this.expandByPoint(e[t]);return this},setFromCenterAndSize:function(){var e=new Vector3;return function(t,i){var r=e.copy(i).multiplyScalar(.5);return this.min.copy(t).sub(r),this.max.copy(t).add(r),this}}(),setFromObject:function(e){return this.makeEmpty(),this.expandByObject(e)},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.min.copy(e.min),this.max.copy(e.max),this},makeEmpty:function(){return this.min.x=this.min.y=this.min.z=1/0,this.max.x=this.max.y=this.max.z=-1/0,this},isEmpty:function(){return this.max.x<this.min.x||this.max.y<this.min.y||this.max.z<this.min.z},getCenter:function(e){return void 0===e&&(console.warn("Box3: .getCenter() target is now required"),e=new Vector3),this.isEmpty()?e.set(0,0,0):e.addVectors(this.min,this.max).multiplyScalar(.5)},getSize:function(e){return void 0===e&&(console.warn("Box3: .getSize() target is now required"),e=new Vector3),this.isEmpty()?e.set(0,0,0):e.subVectors(this.max,this.min)},expandByPoint:function(e){return this.min.min(e),this.max.max(e),this},expandByVector:function(e){return this.min.sub(e),this.max.add(e),this},expandByScalar:function(e){return this.min.addScalar(-e),this.max.addScalar(e),this},expandByObject:function(){var e,t,i,r=new Vector3;function n(n){var o=n.geometry;if(void 0!==o)if(o.isGeometry){var a=o.vertices;for(t=0,i=a.length;t<i;t++)r.copy(a[t]),r.applyMatrix4(n.matrixWorld),e.expandByPoint(r)}else if(o.isBufferGeometry){var s=o.attributes.position;if(void 0!==s)for(t=0,i=s.count;t<i;t++)r.fromBufferAttribute(s,t).applyMatrix4(n.matrixWorld),e.expandByPoint(r)}}return function(t){return e=this,t.updateMatrixWorld(!0),t.traverse(n),this}}(),containsPoint:function(e){return!(e.x<this.min.x||e.x>this.max.x||e.y<this.min.y||e.y>this.max.y||e.z<this.min.z||e.z>this.max.z)},containsBox:function(e){return this.min.x<=e.min.x&&e.max.x<=this.max.x&&this.min.y<=e.min.y&&e.max.y<=this.max.y&&this.min.z<=e.min.z&&e.max.z<=this.max.z},getParameter:function(e,t){return void 0===t&&(console.warn("Box3: .getParameter() target is now required"),t=new Vector3),t.set((e.x-this.min.x)/(this.max.x-this.min.x),(e.y-this.min.y)/(this.max.y-this.min.y),(e.z-this.min.z)/(this.max.z-this.min.z))},intersectsBox:function(e){return!(e.max.x<this.min.x||e.min.x>this.max.x||e.max.y<this.min.y||e.min.y>this.max.y||e.max.z<this.min.z||e.min.z>this.max.z)},intersectsSphere:(closestPoint=new Vector3,function(e){return this.clampPoint(e.center,closestPoint),closestPoint.distanceToSquared(e.center)<=e.radius*e.radius}),intersectsPlane:function(e){var t,i;return e.normal.x>0?(t=e.normal.x*this.min.x,i=e.normal.x*this.max.x):(t=e.normal.x*this.max.x,i=e.normal.x*this.min.x),e.normal.y>0?(t+=e.normal.y*this.min.y,i+=e.normal.y*this.max.y):(t+=e.normal.y*this.max.y,i+=e.normal.y*this.min.y),e.normal.z>0?(t+=e.normal.z*this.min.z,i+=e.normal.z*this.max.z):(t+=e.normal.z*this.max.z,i+=e.normal.z*this.min.z),t<=-e.constant&&i>=-e.constant},intersectsTriangle:function(){var e=new Vector3,t=new Vector3,i=new Vector3,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Vector3,l=new Vector3,u=new Vector3;function h(r){var n,o;for(n=0,o=r.length-3;n<=o;n+=3){a.fromArray(r,n);var s=l.x*Math.abs(a.x)+l.y*Math.abs(a.y)+l.z*Math.abs(a.z),u=e.dot(a),h=t.dot(a),c=i.dot(a);if(Math.max(-Math.max(u,h,c),Math.min(u,h,c))>s)return!1}return!0}return function(a){if(this.isEmpty())return!1;this.getCenter(s),l.subVectors(this.max,s),e.subVectors(a.a,s),t.subVectors(a.b,s),i.subVectors(a.c,s),r.subVectors(t,e),n.subVectors(i,t),o.subVectors(e,i);var c=[0,-r.z,r.y,0,-n.z,n.y,0,-o.z,o.y,r.z,0,-r.x,n.z,0,-n.x,o.z,0,-o.x,-r.y,r.x,0,-n.y,n.x,0,-o.y,o.x,0];return!!h(c)&&(!!h(c=[1,0,0,0,1,0,0,0,1])&&(u.crossVectors(r,n),h(c=[u.x,u.y,u.z])))}}(),clampPoint:function(e,t){return void 0===t&&(console.warn("Box3: .clampPoint() target is now required"),t=new Vector3),t.copy(e).clamp(this.min,this.max)},distanceToPoint:function(){var e=new Vector3;return function(t){return e.copy(t).clamp(this.min,this.max).sub(t).length()}}(),getBoundingSphere:function(){var e=new Vector3;return function(t){return void 0===t&&(console.warn("Box3: .getBoundingSphere() target is now required"),t=new Sphere),this.getCenter(t.center),t.radius=.5*this.getSize(e).length(),t}}(),intersect:function(e){return this.min.max(e.min),this.max.min(e.max),this.isEmpty()&&this.makeEmpty(),this},union:function(e){return this.min.min(e.min),this.max.max(e.max),this},applyMatrix4:(points=[new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3,new Vector3],function(e){return this.isEmpty()?this:(points[0].set(this.min.x,this.min.y,this.min.z).applyMatrix4(e),points[1].set(this.min.x,this.min.y,this.max.z).applyMatrix4(e),points[2].set(this.min.x,this.max.y,this.min.z).applyMatrix4(e),points[3].set(this.min.x,this.max.y,this.max.z).applyMatrix4(e),points[4].set(this.max.x,this.min.y,this.min.z).applyMatrix4(e),points[5].set(this.max.x,this.min.y,this.max.z).applyMatrix4(e),points[6].set(this.max.x,this.max.y,this.min.z).applyMatrix4(e),points[7].set(this.max.x,this.max.y,this.max.z).applyMatrix4(e),this.setFromPoints(points),this)}),translate:function(e){return this.min.add(e),this.max.add(e),this},equals:function(e){return e.min.equals(this.min)&&e.max.equals(this.max)}}),Object.assign(Sphere.prototype,{set:function(e,t){return this.center.copy(e),this.radius=t,this},setFromPoints:(box=new Box3,function(e,t){var i=this.center;void 0!==t?i.copy(t):box.setFromPoints(e).getCenter(i);for(var r=0,n=0,o=e.length;n<o;n++)r=Math.max(r,i.distanceToSquared(e[n]));return this.radius=Math.sqrt(r),this}),clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.center.copy(e.center),this.radius=e.radius,this},empty:function(){return this.radius<=0},containsPoint:function(e){return e.distanceToSquared(this.center)<=this.radius*this.radius},distanceToPoint:function(e){return e.distanceTo(this.center)-this.radius},intersectsSphere:function(e){var t=this.radius+e.radius;return e.center.distanceToSquared(this.center)<=t*t},intersectsBox:function(e){return e.intersectsSphere(this)},intersectsPlane:function(e){return Math.abs(e.distanceToPoint(this.center))<=this.radius},clampPoint:function(e,t){var i=this.center.distanceToSquared(e);return void 0===t&&(console.warn("Sphere: .clampPoint() target is now required"),t=new Vector3),t.copy(e),i>this.radius*this.radius&&(t.sub(this.center).normalize(),t.multiplyScalar(this.radius).add(this.center)),t},getBoundingBox:function(e){return void 0===e&&(console.warn("Sphere: .getBoundingBox() target is now required"),e=new Box3),e.set(this.center,this.center),e.expandByScalar(this.radius),e},applyMatrix4:function(e){return this.center.applyMatrix4(e),this.radius=this.radius*e.getMaxScaleOnAxis(),this},translate:function(e){return this.center.add(e),this},equals:function(e){return e.center.equals(this.center)&&e.radius===this.radius}}),Object.defineProperties(Vector2.prototype,{width:{get:function(){return this.x},set:function(e){this.x=e}},height:{get:function(){return this.y},set:function(e){this.y=e}}}),Object.assign(Vector2.prototype,{isVector2:!0,set:function(e,t){return this.x=e,this.y=t,this},setScalar:function(e){return this.x=e,this.y=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y)},copy:function(e){return this.x=e.x,this.y=e.y,this},add:function(e,t){return void 0!==t?(console.warn("Vector2: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this)},addScalar:function(e){return this.x+=e,this.y+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector2: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this)},subScalar:function(e){return this.x-=e,this.y-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this},multiply:function(e){return this.x*=e.x,this.y*=e.y,this},multiplyScalar:function(e){return this.x*=e,this.y*=e,this},divide:function(e){return this.x/=e.x,this.y/=e.y,this},divideScalar:function(e){return this.multiplyScalar(1/e)},applyMatrix3:function(e){var t=this.x,i=this.y,r=e.elements;return this.x=r[0]*t+r[3]*i+r[6],this.y=r[1]*t+r[4]*i+r[7],this},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this},clampScalar:function(){var e=new Vector2,t=new Vector2;return function(i,r){return e.set(i,i),t.set(r,r),this.clamp(e,t)}}(),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this},negate:function(){return this.x=-this.x,this.y=-this.y,this},dot:function(e){return this.x*e.x+this.y*e.y},cross:function(e){return this.x*e.y-this.y*e.x},lengthSq:function(){return this.x*this.x+this.y*this.y},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)},normalize:function(){return this.divideScalar(this.length()||1)},angle:function(){var e=Math.atan2(this.y,this.x);return e<0&&(e+=2*Math.PI),e},distanceTo:function(e){return Math.sqrt(this.distanceToSquared(e))},distanceToSquared:function(e){var t=this.x-e.x,i=this.y-e.y;return t*t+i*i},manhattanDistanceTo:function(e){return Math.abs(this.x-e.x)+Math.abs(this.y-e.y)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},equals:function(e){return e.x===this.x&&e.y===this.y},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector2: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this},rotateAround:function(e,t){var i=Math.cos(t),r=Math.sin(t),n=this.x-e.x,o=this.y-e.y;return this.x=n*i-o*r+e.x,this.y=n*r+o*i+e.y,this}});var geometryId=0,offset,obj;function Geometry(){Object.defineProperty(this,"id",{value:geometryId+=2}),this.uuid=_Math.generateUUID(),this.name="",this.type="Geometry",this.vertices=[],this.colors=[],this.faces=[],this.faceVertexUvs=[[]],this.morphTargets=[],this.morphNormals=[],this.skinWeights=[],this.skinIndices=[],this.lineDistances=[],this.boundingBox=null,this.boundingSphere=null,this.elementsNeedUpdate=!1,this.verticesNeedUpdate=!1,this.uvsNeedUpdate=!1,this.normalsNeedUpdate=!1,this.colorsNeedUpdate=!1,this.lineDistancesNeedUpdate=!1,this.groupsNeedUpdate=!1}function Vector4(e,t,i,r){this.x=e||0,this.y=t||0,this.z=i||0,this.w=void 0!==r?r:1}function BufferAttribute(e,t,i){if(Array.isArray(e))throw new TypeError("BufferAttribute: array should be a Typed Array.");this.name="",this.array=e,this.itemSize=t,this.count=void 0!==e?e.length/t:0,this.normalized=!0===i,this.dynamic=!1,this.updateRange={offset:0,count:-1},this.version=0}function Int8BufferAttribute(e,t,i){BufferAttribute.call(this,new Int8Array(e),t,i)}function Uint8BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint8Array(e),t,i)}function Uint8ClampedBufferAttribute(e,t,i){BufferAttribute.call(this,new Uint8ClampedArray(e),t,i)}function Int16BufferAttribute(e,t,i){BufferAttribute.call(this,new Int16Array(e),t,i)}function Uint16BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint16Array(e),t,i)}function Int32BufferAttribute(e,t,i){BufferAttribute.call(this,new Int32Array(e),t,i)}function Uint32BufferAttribute(e,t,i){BufferAttribute.call(this,new Uint32Array(e),t,i)}function Float32BufferAttribute(e,t,i){BufferAttribute.call(this,new Float32Array(e),t,i)}function Float64BufferAttribute(e,t,i){BufferAttribute.call(this,new Float64Array(e),t,i)}function DirectGeometry(){this.vertices=[],this.normals=[],this.colors=[],this.uvs=[],this.uvs2=[],this.groups=[],this.morphTargets={},this.skinWeights=[],this.skinIndices=[],this.boundingBox=null,this.boundingSphere=null,this.verticesNeedUpdate=!1,this.normalsNeedUpdate=!1,this.colorsNeedUpdate=!1,this.uvsNeedUpdate=!1,this.groupsNeedUpdate=!1}function arrayMin(e){if(0===e.length)return 1/0;for(var t=e[0],i=1,r=e.length;i<r;++i)e[i]<t&&(t=e[i]);return t}function arrayMax(e){if(0===e.length)return-1/0;for(var t=e[0],i=1,r=e.length;i<r;++i)e[i]>t&&(t=e[i]);return t}Geometry.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Geometry,isGeometry:!0,applyMatrix:function(e){for(var t=(new Matrix3).getNormalMatrix(e),i=0,r=this.vertices.length;i<r;i++){this.vertices[i].applyMatrix4(e)}for(i=0,r=this.faces.length;i<r;i++){var n=this.faces[i];n.normal.applyMatrix3(t).normalize();for(var o=0,a=n.vertexNormals.length;o<a;o++)n.vertexNormals[o].applyMatrix3(t).normalize()}return null!==this.boundingBox&&this.computeBoundingBox(),null!==this.boundingSphere&&this.computeBoundingSphere(),this.verticesNeedUpdate=!0,this.normalsNeedUpdate=!0,this},rotateX:function(){var e=new Matrix4;return function(t){return e.makeRotationX(t),this.applyMatrix(e),this}}(),rotateY:function(){var e=new Matrix4;return function(t){return e.makeRotationY(t),this.applyMatrix(e),this}}(),rotateZ:function(){var e=new Matrix4;return function(t){return e.makeRotationZ(t),this.applyMatrix(e),this}}(),translate:function(){var e=new Matrix4;return function(t,i,r){return e.makeTranslation(t,i,r),this.applyMatrix(e),this}}(),scale:function(){var e=new Matrix4;return function(t,i,r){return e.makeScale(t,i,r),this.applyMatrix(e),this}}(),lookAt:(obj=new Object3D,function(e){obj.lookAt(e),obj.updateMatrix(),this.applyMatrix(obj.matrix)}),fromBufferGeometry:function(e){var t=this,i=null!==e.index?e.index.array:void 0,r=e.attributes,n=r.position.array,o=void 0!==r.normal?r.normal.array:void 0,a=void 0!==r.color?r.color.array:void 0,s=void 0!==r.uv?r.uv.array:void 0,l=void 0!==r.uv2?r.uv2.array:void 0;void 0!==l&&(this.faceVertexUvs[1]=[]);for(var u=0,h=0;u<n.length;u+=3,h+=2)t.vertices.push((new Vector3).fromArray(n,u)),void 0!==a&&t.colors.push((new Color).fromArray(a,u));function c(e,i,r,n){var u=void 0===a?[]:[t.colors[e].clone(),t.colors[i].clone(),t.colors[r].clone()],h=new Face3(e,i,r,void 0===o?[]:[(new Vector3).fromArray(o,3*e),(new Vector3).fromArray(o,3*i),(new Vector3).fromArray(o,3*r)],u,n);t.faces.push(h),void 0!==s&&t.faceVertexUvs[0].push([(new Vector2).fromArray(s,2*e),(new Vector2).fromArray(s,2*i),(new Vector2).fromArray(s,2*r)]),void 0!==l&&t.faceVertexUvs[1].push([(new Vector2).fromArray(l,2*e),(new Vector2).fromArray(l,2*i),(new Vector2).fromArray(l,2*r)])}var d=e.groups;if(d.length>0)for(u=0;u<d.length;u++)for(var p=d[u],f=p.start,m=(h=f,f+p.count);h<m;h+=3)void 0!==i?c(i[h],i[h+1],i[h+2],p.materialIndex):c(h,h+1,h+2,p.materialIndex);else if(void 0!==i)for(u=0;u<i.length;u+=3)c(i[u],i[u+1],i[u+2]);else for(u=0;u<n.length/3;u+=3)c(u,u+1,u+2);return this.computeFaceNormals(),null!==e.boundingBox&&(this.boundingBox=e.boundingBox.clone()),null!==e.boundingSphere&&(this.boundingSphere=e.boundingSphere.clone()),this},center:(offset=new Vector3,function(){return this.computeBoundingBox(),this.boundingBox.getCenter(offset).negate(),this.translate(offset.x,offset.y,offset.z),this}),normalize:function(){this.computeBoundingSphere();var e=this.boundingSphere.center,t=this.boundingSphere.radius,i=0===t?1:1/t,r=new Matrix4;return r.set(i,0,0,-i*e.x,0,i,0,-i*e.y,0,0,i,-i*e.z,0,0,0,1),this.applyMatrix(r),this},computeFaceNormals:function(){for(var e=new Vector3,t=new Vector3,i=0,r=this.faces.length;i<r;i++){var n=this.faces[i],o=this.vertices[n.a],a=this.vertices[n.b],s=this.vertices[n.c];e.subVectors(s,a),t.subVectors(o,a),e.cross(t),e.normalize(),n.normal.copy(e)}},computeVertexNormals:function(e){var t,i,r,n,o,a;for(void 0===e&&(e=!0),a=new Array(this.vertices.length),t=0,i=this.vertices.length;t<i;t++)a[t]=new Vector3;if(e){var s,l,u,h=new Vector3,c=new Vector3;for(r=0,n=this.faces.length;r<n;r++)o=this.faces[r],s=this.vertices[o.a],l=this.vertices[o.b],u=this.vertices[o.c],h.subVectors(u,l),c.subVectors(s,l),h.cross(c),a[o.a].add(h),a[o.b].add(h),a[o.c].add(h)}else for(this.computeFaceNormals(),r=0,n=this.faces.length;r<n;r++)a[(o=this.faces[r]).a].add(o.normal),a[o.b].add(o.normal),a[o.c].add(o.normal);for(t=0,i=this.vertices.length;t<i;t++)a[t].normalize();for(r=0,n=this.faces.length;r<n;r++){var d=(o=this.faces[r]).vertexNormals;3===d.length?(d[0].copy(a[o.a]),d[1].copy(a[o.b]),d[2].copy(a[o.c])):(d[0]=a[o.a].clone(),d[1]=a[o.b].clone(),d[2]=a[o.c].clone())}this.faces.length>0&&(this.normalsNeedUpdate=!0)},computeFlatVertexNormals:function(){var e,t,i;for(this.computeFaceNormals(),e=0,t=this.faces.length;e<t;e++){var r=(i=this.faces[e]).vertexNormals;3===r.length?(r[0].copy(i.normal),r[1].copy(i.normal),r[2].copy(i.normal)):(r[0]=i.normal.clone(),r[1]=i.normal.clone(),r[2]=i.normal.clone())}this.faces.length>0&&(this.normalsNeedUpdate=!0)},computeMorphNormals:function(){var e,t,i,r,n;for(i=0,r=this.faces.length;i<r;i++)for((n=this.faces[i]).__originalFaceNormal?n.__originalFaceNormal.copy(n.normal):n.__originalFaceNormal=n.normal.clone(),n.__originalVertexNormals||(n.__originalVertexNormals=[]),e=0,t=n.vertexNormals.length;e<t;e++)n.__originalVertexNormals[e]?n.__originalVertexNormals[e].copy(n.vertexNormals[e]):n.__originalVertexNormals[e]=n.vertexNormals[e].clone();var o=new Geometry;for(o.faces=this.faces,e=0,t=this.morphTargets.length;e<t;e++){if(!this.morphNormals[e]){this.morphNormals[e]={},this.morphNormals[e].faceNormals=[],this.morphNormals[e].vertexNormals=[];var a=this.morphNormals[e].faceNormals,s=this.morphNormals[e].vertexNormals;for(i=0,r=this.faces.length;i<r;i++)l=new Vector3,u={a:new Vector3,b:new Vector3,c:new Vector3},a.push(l),s.push(u)}var l,u,h=this.morphNormals[e];for(o.vertices=this.morphTargets[e].vertices,o.computeFaceNormals(),o.computeVertexNormals(),i=0,r=this.faces.length;i<r;i++)n=this.faces[i],l=h.faceNormals[i],u=h.vertexNormals[i],l.copy(n.normal),u.a.copy(n.vertexNormals[0]),u.b.copy(n.vertexNormals[1]),u.c.copy(n.vertexNormals[2])}for(i=0,r=this.faces.length;i<r;i++)(n=this.faces[i]).normal=n.__originalFaceNormal,n.vertexNormals=n.__originalVertexNormals},computeBoundingBox:function(){null===this.boundingBox&&(this.boundingBox=new Box3),this.boundingBox.setFromPoints(this.vertices)},computeBoundingSphere:function(){null===this.boundingSphere&&(this.boundingSphere=new Sphere),this.boundingSphere.setFromPoints(this.vertices)},merge:function(e,t,i){if(e&&e.isGeometry){var r,n=this.vertices.length,o=this.vertices,a=e.vertices,s=this.faces,l=e.faces,u=this.faceVertexUvs[0],h=e.faceVertexUvs[0],c=this.colors,d=e.colors;void 0===i&&(i=0),void 0!==t&&(r=(new Matrix3).getNormalMatrix(t));for(var p=0,f=a.length;p<f;p++){var m=a[p].clone();void 0!==t&&m.applyMatrix4(t),o.push(m)}for(p=0,f=d.length;p<f;p++)c.push(d[p].clone());for(p=0,f=l.length;p<f;p++){var v,g,y,_=l[p],b=_.vertexNormals,x=_.vertexColors;(v=new Face3(_.a+n,_.b+n,_.c+n)).normal.copy(_.normal),void 0!==r&&v.normal.applyMatrix3(r).normalize();for(var w=0,S=b.length;w<S;w++)g=b[w].clone(),void 0!==r&&g.applyMatrix3(r).normalize(),v.vertexNormals.push(g);v.color.copy(_.color);for(w=0,S=x.length;w<S;w++)y=x[w],v.vertexColors.push(y.clone());v.materialIndex=_.materialIndex+i,s.push(v)}for(p=0,f=h.length;p<f;p++){var M=h[p],T=[];if(void 0!==M){for(w=0,S=M.length;w<S;w++)T.push(M[w].clone());u.push(T)}}}else console.error("Geometry.merge(): geometry not an instance of Geometry.",e)},mergeMesh:function(e){e&&e.isMesh?(e.matrixAutoUpdate&&e.updateMatrix(),this.merge(e.geometry,e.matrix)):console.error("Geometry.mergeMesh(): mesh not an instance of Mesh.",e)},mergeVertices:function(){var e,t,i,r,n,o,a,s,l={},u=[],h=[],c=Math.pow(10,4);for(i=0,r=this.vertices.length;i<r;i++)e=this.vertices[i],void 0===l[t=Math.round(e.x*c)+"_"+Math.round(e.y*c)+"_"+Math.round(e.z*c)]?(l[t]=i,u.push(this.vertices[i]),h[i]=u.length-1):h[i]=h[l[t]];var d=[];for(i=0,r=this.faces.length;i<r;i++){(n=this.faces[i]).a=h[n.a],n.b=h[n.b],n.c=h[n.c],o=[n.a,n.b,n.c];for(var p=0;p<3;p++)if(o[p]===o[(p+1)%3]){d.push(i);break}}for(i=d.length-1;i>=0;i--){var f=d[i];for(this.faces.splice(f,1),a=0,s=this.faceVertexUvs.length;a<s;a++)this.faceVertexUvs[a].splice(f,1)}var m=this.vertices.length-u.length;return this.vertices=u,m},setFromPoints:function(e){this.vertices=[];for(var t=0,i=e.length;t<i;t++){var r=e[t];this.vertices.push(new Vector3(r.x,r.y,r.z||0))}return this},sortFacesByMaterialIndex:function(){for(var e=this.faces,t=e.length,i=0;i<t;i++)e[i]._id=i;e.sort(function(e,t){return e.materialIndex-t.materialIndex});var r,n,o=this.faceVertexUvs[0],a=this.faceVertexUvs[1];o&&o.length===t&&(r=[]),a&&a.length===t&&(n=[]);for(i=0;i<t;i++){var s=e[i]._id;r&&r.push(o[s]),n&&n.push(a[s])}r&&(this.faceVertexUvs[0]=r),n&&(this.faceVertexUvs[1]=n)},toJSON:function(){var e={metadata:{version:4.5,type:"Geometry",generator:"Geometry.toJSON"}};if(e.uuid=this.uuid,e.type=this.type,""!==this.name&&(e.name=this.name),void 0!==this.parameters){var t=this.parameters;for(var i in t)void 0!==t[i]&&(e[i]=t[i]);return e}for(var r=[],n=0;n<this.vertices.length;n++){var o=this.vertices[n];r.push(o.x,o.y,o.z)}var a=[],s=[],l={},u=[],h={},c=[],d={};for(n=0;n<this.faces.length;n++){var p=this.faces[n],f=void 0!==this.faceVertexUvs[0][n],m=p.normal.length()>0,v=p.vertexNormals.length>0,g=1!==p.color.r||1!==p.color.g||1!==p.color.b,y=p.vertexColors.length>0,_=0;if(_=S(_,0,0),_=S(_,1,!0),_=S(_,2,!1),_=S(_,3,f),_=S(_,4,m),_=S(_,5,v),_=S(_,6,g),_=S(_,7,y),a.push(_),a.push(p.a,p.b,p.c),a.push(p.materialIndex),f){var b=this.faceVertexUvs[0][n];a.push(A(b[0]),A(b[1]),A(b[2]))}if(m&&a.push(M(p.normal)),v){var x=p.vertexNormals;a.push(M(x[0]),M(x[1]),M(x[2]))}if(g&&a.push(T(p.color)),y){var w=p.vertexColors;a.push(T(w[0]),T(w[1]),T(w[2]))}}function S(e,t,i){return i?e|1<<t:e&~(1<<t)}function M(e){var t=e.x.toString()+e.y.toString()+e.z.toString();return void 0!==l[t]?l[t]:(l[t]=s.length/3,s.push(e.x,e.y,e.z),l[t])}function T(e){var t=e.r.toString()+e.g.toString()+e.b.toString();return void 0!==h[t]?h[t]:(h[t]=u.length,u.push(e.getHex()),h[t])}function A(e){var t=e.x.toString()+e.y.toString();return void 0!==d[t]?d[t]:(d[t]=c.length/2,c.push(e.x,e.y),d[t])}return e.data={},e.data.vertices=r,e.data.normals=s,u.length>0&&(e.data.colors=u),c.length>0&&(e.data.uvs=[c]),e.data.faces=a,e},clone:function(){return(new Geometry).copy(this)},copy:function(e){var t,i,r,n,o,a;this.vertices=[],this.colors=[],this.faces=[],this.faceVertexUvs=[[]],this.morphTargets=[],this.morphNormals=[],this.skinWeights=[],this.skinIndices=[],this.lineDistances=[],this.boundingBox=null,this.boundingSphere=null,this.name=e.name;var s=e.vertices;for(t=0,i=s.length;t<i;t++)this.vertices.push(s[t].clone());var l=e.colors;for(t=0,i=l.length;t<i;t++)this.colors.push(l[t].clone());var u=e.faces;for(t=0,i=u.length;t<i;t++)this.faces.push(u[t].clone());for(t=0,i=e.faceVertexUvs.length;t<i;t++){var h=e.faceVertexUvs[t];for(void 0===this.faceVertexUvs[t]&&(this.faceVertexUvs[t]=[]),r=0,n=h.length;r<n;r++){var c=h[r],d=[];for(o=0,a=c.length;o<a;o++){var p=c[o];d.push(p.clone())}this.faceVertexUvs[t].push(d)}}var f=e.morphTargets;for(t=0,i=f.length;t<i;t++){var m={};if(m.name=f[t].name,void 0!==f[t].vertices)for(m.vertices=[],r=0,n=f[t].vertices.length;r<n;r++)m.vertices.push(f[t].vertices[r].clone());if(void 0!==f[t].normals)for(m.normals=[],r=0,n=f[t].normals.length;r<n;r++)m.normals.push(f[t].normals[r].clone());this.morphTargets.push(m)}var v=e.morphNormals;for(t=0,i=v.length;t<i;t++){var g={};if(void 0!==v[t].vertexNormals)for(g.vertexNormals=[],r=0,n=v[t].vertexNormals.length;r<n;r++){var y=v[t].vertexNormals[r],_={};_.a=y.a.clone(),_.b=y.b.clone(),_.c=y.c.clone(),g.vertexNormals.push(_)}if(void 0!==v[t].faceNormals)for(g.faceNormals=[],r=0,n=v[t].faceNormals.length;r<n;r++)g.faceNormals.push(v[t].faceNormals[r].clone());this.morphNormals.push(g)}var b=e.skinWeights;for(t=0,i=b.length;t<i;t++)this.skinWeights.push(b[t].clone());var x=e.skinIndices;for(t=0,i=x.length;t<i;t++)this.skinIndices.push(x[t].clone());var w=e.lineDistances;for(t=0,i=w.length;t<i;t++)this.lineDistances.push(w[t]);var S=e.boundingBox;null!==S&&(this.boundingBox=S.clone());var M=e.boundingSphere;return null!==M&&(this.boundingSphere=M.clone()),this.elementsNeedUpdate=e.elementsNeedUpdate,this.verticesNeedUpdate=e.verticesNeedUpdate,this.uvsNeedUpdate=e.uvsNeedUpdate,this.normalsNeedUpdate=e.normalsNeedUpdate,this.colorsNeedUpdate=e.colorsNeedUpdate,this.lineDistancesNeedUpdate=e.lineDistancesNeedUpdate,this.groupsNeedUpdate=e.groupsNeedUpdate,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),Object.assign(Vector4.prototype,{isVector4:!0,set:function(e,t,i,r){return this.x=e,this.y=t,this.z=i,this.w=r,this},setScalar:function(e){return this.x=e,this.y=e,this.z=e,this.w=e,this},setX:function(e){return this.x=e,this},setY:function(e){return this.y=e,this},setZ:function(e){return this.z=e,this},setW:function(e){return this.w=e,this},setComponent:function(e,t){switch(e){case 0:this.x=t;break;case 1:this.y=t;break;case 2:this.z=t;break;case 3:this.w=t;break;default:throw new Error("index is out of range: "+e)}return this},getComponent:function(e){switch(e){case 0:return this.x;case 1:return this.y;case 2:return this.z;case 3:return this.w;default:throw new Error("index is out of range: "+e)}},clone:function(){return new this.constructor(this.x,this.y,this.z,this.w)},copy:function(e){return this.x=e.x,this.y=e.y,this.z=e.z,this.w=void 0!==e.w?e.w:1,this},add:function(e,t){return void 0!==t?(console.warn("Vector4: .add() now only accepts one argument. Use .addVectors( a, b ) instead."),this.addVectors(e,t)):(this.x+=e.x,this.y+=e.y,this.z+=e.z,this.w+=e.w,this)},addScalar:function(e){return this.x+=e,this.y+=e,this.z+=e,this.w+=e,this},addVectors:function(e,t){return this.x=e.x+t.x,this.y=e.y+t.y,this.z=e.z+t.z,this.w=e.w+t.w,this},addScaledVector:function(e,t){return this.x+=e.x*t,this.y+=e.y*t,this.z+=e.z*t,this.w+=e.w*t,this},sub:function(e,t){return void 0!==t?(console.warn("Vector4: .sub() now only accepts one argument. Use .subVectors( a, b ) instead."),this.subVectors(e,t)):(this.x-=e.x,this.y-=e.y,this.z-=e.z,this.w-=e.w,this)},subScalar:function(e){return this.x-=e,this.y-=e,this.z-=e,this.w-=e,this},subVectors:function(e,t){return this.x=e.x-t.x,this.y=e.y-t.y,this.z=e.z-t.z,this.w=e.w-t.w,this},multiplyScalar:function(e){return this.x*=e,this.y*=e,this.z*=e,this.w*=e,this},applyMatrix4:function(e){var t=this.x,i=this.y,r=this.z,n=this.w,o=e.elements;return this.x=o[0]*t+o[4]*i+o[8]*r+o[12]*n,this.y=o[1]*t+o[5]*i+o[9]*r+o[13]*n,this.z=o[2]*t+o[6]*i+o[10]*r+o[14]*n,this.w=o[3]*t+o[7]*i+o[11]*r+o[15]*n,this},divideScalar:function(e){return this.multiplyScalar(1/e)},setAxisAngleFromQuaternion:function(e){this.w=2*Math.acos(e.w);var t=Math.sqrt(1-e.w*e.w);return t<1e-4?(this.x=1,this.y=0,this.z=0):(this.x=e.x/t,this.y=e.y/t,this.z=e.z/t),this},setAxisAngleFromRotationMatrix:function(e){var t,i,r,n,o=e.elements,a=o[0],s=o[4],l=o[8],u=o[1],h=o[5],c=o[9],d=o[2],p=o[6],f=o[10];if(Math.abs(s-u)<.01&&Math.abs(l-d)<.01&&Math.abs(c-p)<.01){if(Math.abs(s+u)<.1&&Math.abs(l+d)<.1&&Math.abs(c+p)<.1&&Math.abs(a+h+f-3)<.1)return this.set(1,0,0,0),this;t=Math.PI;var m=(a+1)/2,v=(h+1)/2,g=(f+1)/2,y=(s+u)/4,_=(l+d)/4,b=(c+p)/4;return m>v&&m>g?m<.01?(i=0,r=.707106781,n=.707106781):(r=y/(i=Math.sqrt(m)),n=_/i):v>g?v<.01?(i=.707106781,r=0,n=.707106781):(i=y/(r=Math.sqrt(v)),n=b/r):g<.01?(i=.707106781,r=.707106781,n=0):(i=_/(n=Math.sqrt(g)),r=b/n),this.set(i,r,n,t),this}var x=Math.sqrt((p-c)*(p-c)+(l-d)*(l-d)+(u-s)*(u-s));return Math.abs(x)<.001&&(x=1),this.x=(p-c)/x,this.y=(l-d)/x,this.z=(u-s)/x,this.w=Math.acos((a+h+f-1)/2),this},min:function(e){return this.x=Math.min(this.x,e.x),this.y=Math.min(this.y,e.y),this.z=Math.min(this.z,e.z),this.w=Math.min(this.w,e.w),this},max:function(e){return this.x=Math.max(this.x,e.x),this.y=Math.max(this.y,e.y),this.z=Math.max(this.z,e.z),this.w=Math.max(this.w,e.w),this},clamp:function(e,t){return this.x=Math.max(e.x,Math.min(t.x,this.x)),this.y=Math.max(e.y,Math.min(t.y,this.y)),this.z=Math.max(e.z,Math.min(t.z,this.z)),this.w=Math.max(e.w,Math.min(t.w,this.w)),this},clampScalar:function(){var e,t;return function(i,r){return void 0===e&&(e=new Vector4,t=new Vector4),e.set(i,i,i,i),t.set(r,r,r,r),this.clamp(e,t)}}(),clampLength:function(e,t){var i=this.length();return this.divideScalar(i||1).multiplyScalar(Math.max(e,Math.min(t,i)))},floor:function(){return this.x=Math.floor(this.x),this.y=Math.floor(this.y),this.z=Math.floor(this.z),this.w=Math.floor(this.w),this},ceil:function(){return this.x=Math.ceil(this.x),this.y=Math.ceil(this.y),this.z=Math.ceil(this.z),this.w=Math.ceil(this.w),this},round:function(){return this.x=Math.round(this.x),this.y=Math.round(this.y),this.z=Math.round(this.z),this.w=Math.round(this.w),this},roundToZero:function(){return this.x=this.x<0?Math.ceil(this.x):Math.floor(this.x),this.y=this.y<0?Math.ceil(this.y):Math.floor(this.y),this.z=this.z<0?Math.ceil(this.z):Math.floor(this.z),this.w=this.w<0?Math.ceil(this.w):Math.floor(this.w),this},negate:function(){return this.x=-this.x,this.y=-this.y,this.z=-this.z,this.w=-this.w,this},dot:function(e){return this.x*e.x+this.y*e.y+this.z*e.z+this.w*e.w},lengthSq:function(){return this.x*this.x+this.y*this.y+this.z*this.z+this.w*this.w},length:function(){return Math.sqrt(this.x*this.x+this.y*this.y+this.z*this.z+this.w*this.w)},manhattanLength:function(){return Math.abs(this.x)+Math.abs(this.y)+Math.abs(this.z)+Math.abs(this.w)},normalize:function(){return this.divideScalar(this.length()||1)},setLength:function(e){return this.normalize().multiplyScalar(e)},lerp:function(e,t){return this.x+=(e.x-this.x)*t,this.y+=(e.y-this.y)*t,this.z+=(e.z-this.z)*t,this.w+=(e.w-this.w)*t,this},lerpVectors:function(e,t,i){return this.subVectors(t,e).multiplyScalar(i).add(e)},equals:function(e){return e.x===this.x&&e.y===this.y&&e.z===this.z&&e.w===this.w},fromArray:function(e,t){return void 0===t&&(t=0),this.x=e[t],this.y=e[t+1],this.z=e[t+2],this.w=e[t+3],this},toArray:function(e,t){return void 0===e&&(e=[]),void 0===t&&(t=0),e[t]=this.x,e[t+1]=this.y,e[t+2]=this.z,e[t+3]=this.w,e},fromBufferAttribute:function(e,t,i){return void 0!==i&&console.warn("Vector4: offset has been removed from .fromBufferAttribute()."),this.x=e.getX(t),this.y=e.getY(t),this.z=e.getZ(t),this.w=e.getW(t),this}}),Object.defineProperty(BufferAttribute.prototype,"needsUpdate",{set:function(e){!0===e&&this.version++}}),Object.assign(BufferAttribute.prototype,{isBufferAttribute:!0,onUploadCallback:function(){},setArray:function(e){if(Array.isArray(e))throw new TypeError("BufferAttribute: array should be a Typed Array.");return this.count=void 0!==e?e.length/this.itemSize:0,this.array=e,this},setDynamic:function(e){return this.dynamic=e,this},copy:function(e){return this.name=e.name,this.array=new e.array.constructor(e.array),this.itemSize=e.itemSize,this.count=e.count,this.normalized=e.normalized,this.dynamic=e.dynamic,this},copyAt:function(e,t,i){e*=this.itemSize,i*=t.itemSize;for(var r=0,n=this.itemSize;r<n;r++)this.array[e+r]=t.array[i+r];return this},copyArray:function(e){return this.array.set(e),this},copyColorsArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyColorsArray(): color is undefined",r),o=new Color),t[i++]=o.r,t[i++]=o.g,t[i++]=o.b}return this},copyVector2sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector2sArray(): vector is undefined",r),o=new Vector2),t[i++]=o.x,t[i++]=o.y}return this},copyVector3sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector3sArray(): vector is undefined",r),o=new Vector3),t[i++]=o.x,t[i++]=o.y,t[i++]=o.z}return this},copyVector4sArray:function(e){for(var t=this.array,i=0,r=0,n=e.length;r<n;r++){var o=e[r];void 0===o&&(console.warn("BufferAttribute.copyVector4sArray(): vector is undefined",r),o=new Vector4),t[i++]=o.x,t[i++]=o.y,t[i++]=o.z,t[i++]=o.w}return this},set:function(e,t){return void 0===t&&(t=0),this.array.set(e,t),this},getX:function(e){return this.array[e*this.itemSize]},setX:function(e,t){return this.array[e*this.itemSize]=t,this},getY:function(e){return this.array[e*this.itemSize+1]},setY:function(e,t){return this.array[e*this.itemSize+1]=t,this},getZ:function(e){return this.array[e*this.itemSize+2]},setZ:function(e,t){return this.array[e*this.itemSize+2]=t,this},getW:function(e){return this.array[e*this.itemSize+3]},setW:function(e,t){return this.array[e*this.itemSize+3]=t,this},setXY:function(e,t,i){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this},setXYZ:function(e,t,i,r){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this.array[e+2]=r,this},setXYZW:function(e,t,i,r,n){return e*=this.itemSize,this.array[e+0]=t,this.array[e+1]=i,this.array[e+2]=r,this.array[e+3]=n,this},onUpload:function(e){return this.onUploadCallback=e,this},clone:function(){return new this.constructor(this.array,this.itemSize).copy(this)}}),Int8BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int8BufferAttribute.prototype.constructor=Int8BufferAttribute,Uint8BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint8BufferAttribute.prototype.constructor=Uint8BufferAttribute,Uint8ClampedBufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint8ClampedBufferAttribute.prototype.constructor=Uint8ClampedBufferAttribute,Int16BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int16BufferAttribute.prototype.constructor=Int16BufferAttribute,Uint16BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint16BufferAttribute.prototype.constructor=Uint16BufferAttribute,Int32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Int32BufferAttribute.prototype.constructor=Int32BufferAttribute,Uint32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Uint32BufferAttribute.prototype.constructor=Uint32BufferAttribute,Float32BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Float32BufferAttribute.prototype.constructor=Float32BufferAttribute,Float64BufferAttribute.prototype=Object.create(BufferAttribute.prototype),Float64BufferAttribute.prototype.constructor=Float64BufferAttribute,Object.assign(DirectGeometry.prototype,{computeGroups:function(e){for(var t,i=[],r=void 0,n=e.faces,o=0;o<n.length;o++){var a=n[o];a.materialIndex!==r&&(r=a.materialIndex,void 0!==t&&(t.count=3*o-t.start,i.push(t)),t={start:3*o,materialIndex:r})}void 0!==t&&(t.count=3*o-t.start,i.push(t)),this.groups=i},fromGeometry:function(e){var t,i=e.faces,r=e.vertices,n=e.faceVertexUvs,o=n[0]&&n[0].length>0,a=n[1]&&n[1].length>0,s=e.morphTargets,l=s.length;if(l>0){t=[];for(var u=0;u<l;u++)t[u]={name:s[u].name,data:[]};this.morphTargets.position=t}var h,c=e.morphNormals,d=c.length;if(d>0){h=[];for(u=0;u<d;u++)h[u]={name:c[u].name,data:[]};this.morphTargets.normal=h}var p=e.skinIndices,f=e.skinWeights,m=p.length===r.length,v=f.length===r.length;r.length>0&&0===i.length&&console.error("DirectGeometry: Faceless geometries are not supported.");for(u=0;u<i.length;u++){var g=i[u];this.vertices.push(r[g.a],r[g.b],r[g.c]);var y=g.vertexNormals;if(3===y.length)this.normals.push(y[0],y[1],y[2]);else{var _=g.normal;this.normals.push(_,_,_)}var b,x=g.vertexColors;if(3===x.length)this.colors.push(x[0],x[1],x[2]);else{var w=g.color;this.colors.push(w,w,w)}if(!0===o)void 0!==(b=n[0][u])?this.uvs.push(b[0],b[1],b[2]):(console.warn("DirectGeometry.fromGeometry(): Undefined vertexUv ",u),this.uvs.push(new Vector2,new Vector2,new Vector2));if(!0===a)void 0!==(b=n[1][u])?this.uvs2.push(b[0],b[1],b[2]):(console.warn("DirectGeometry.fromGeometry(): Undefined vertexUv2 ",u),this.uvs2.push(new Vector2,new Vector2,new Vector2));for(var S=0;S<l;S++){var M=s[S].vertices;t[S].data.push(M[g.a],M[g.b],M[g.c])}for(S=0;S<d;S++){var T=c[S].vertexNormals[u];h[S].data.push(T.a,T.b,T.c)}m&&this.skinIndices.push(p[g.a],p[g.b],p[g.c]),v&&this.skinWeights.push(f[g.a],f[g.b],f[g.c])}return this.computeGroups(e),this.verticesNeedUpdate=e.verticesNeedUpdate,this.normalsNeedUpdate=e.normalsNeedUpdate,this.colorsNeedUpdate=e.colorsNeedUpdate,this.uvsNeedUpdate=e.uvsNeedUpdate,this.groupsNeedUpdate=e.groupsNeedUpdate,this}});var bufferGeometryId=1;function BufferGeometry(){Object.defineProperty(this,"id",{value:bufferGeometryId+=2}),this.uuid=_Math.generateUUID(),this.name="",this.type="BufferGeometry",this.index=null,this.attributes={},this.morphAttributes={},this.groups=[],this.boundingBox=null,this.boundingSphere=null,this.drawRange={start:0,count:1/0},this.userData={}}function SphereGeometry(e,t,i,r,n,o,a){Geometry.call(this),this.type="SphereGeometry",this.parameters={radius:e,widthSegments:t,heightSegments:i,phiStart:r,phiLength:n,thetaStart:o,thetaLength:a},this.fromBufferGeometry(new SphereBufferGeometry(e,t,i,r,n,o,a)),this.mergeVertices()}function SphereBufferGeometry(e,t,i,r,n,o,a){BufferGeometry.call(this),this.type="SphereBufferGeometry",this.parameters={radius:e,widthSegments:t,heightSegments:i,phiStart:r,phiLength:n,thetaStart:o,thetaLength:a},e=e||1,t=Math.max(3,Math.floor(t)||8),i=Math.max(2,Math.floor(i)||6),r=void 0!==r?r:0,n=void 0!==n?n:2*Math.PI;var s,l,u=(o=void 0!==o?o:0)+(a=void 0!==a?a:Math.PI),h=0,c=[],d=new Vector3,p=new Vector3,f=[],m=[],v=[],g=[];for(l=0;l<=i;l++){var y=[],_=l/i;for(s=0;s<=t;s++){var b=s/t;d.x=-e*Math.cos(r+b*n)*Math.sin(o+_*a),d.y=e*Math.cos(o+_*a),d.z=e*Math.sin(r+b*n)*Math.sin(o+_*a),m.push(d.x,d.y,d.z),p.set(d.x,d.y,d.z).normalize(),v.push(p.x,p.y,p.z),g.push(b,1-_),y.push(h++)}c.push(y)}for(l=0;l<i;l++)for(s=0;s<t;s++){var x=c[l][s+1],w=c[l][s],S=c[l+1][s],M=c[l+1][s+1];(0!==l||o>0)&&f.push(x,w,M),(l!==i-1||u<Math.PI)&&f.push(w,S,M)}this.setIndex(f),this.addAttribute("position",new Float32BufferAttribute(m,3)),this.addAttribute("normal",new Float32BufferAttribute(v,3)),this.addAttribute("uv",new Float32BufferAttribute(g,2))}BufferGeometry.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:BufferGeometry,isBufferGeometry:!0,getIndex:function(){return this.index},setIndex:function(e){Array.isArray(e)?this.index=new(arrayMax(e)>65535?Uint32BufferAttribute:Uint16BufferAttribute)(e,1):this.index=e},addAttribute:function(e,t){return t&&t.isBufferAttribute||t&&t.isInterleavedBufferAttribute?"index"===e?(console.warn("BufferGeometry.addAttribute: Use .setIndex() for index attribute."),this.setIndex(t),this):(this.attributes[e]=t,this):(console.warn("BufferGeometry: .addAttribute() now expects ( name, attribute )."),this.addAttribute(e,new BufferAttribute(arguments[1],arguments[2])))},getAttribute:function(e){return this.attributes[e]},removeAttribute:function(e){return delete this.attributes[e],this},addGroup:function(e,t,i){this.groups.push({start:e,count:t,materialIndex:void 0!==i?i:0})},clearGroups:function(){this.groups=[]},setDrawRange:function(e,t){this.drawRange.start=e,this.drawRange.count=t},applyMatrix:function(e){var t=this.attributes.position;void 0!==t&&(e.applyToBufferAttribute(t),t.needsUpdate=!0);var i=this.attributes.normal;void 0!==i&&((new Matrix3).getNormalMatrix(e).applyToBufferAttribute(i),i.needsUpdate=!0);var r=this.attributes.tangent;void 0!==r&&((new Matrix3).getNormalMatrix(e).applyToBufferAttribute(r),r.needsUpdate=!0);return null!==this.boundingBox&&this.computeBoundingBox(),null!==this.boundingSphere&&this.computeBoundingSphere(),this},rotateX:function(){var e=new Matrix4;return function(t){return e.makeRotationX(t),this.applyMatrix(e),this}}(),rotateY:function(){var e=new Matrix4;return function(t){return e.makeRotationY(t),this.applyMatrix(e),this}}(),rotateZ:function(){var e=new Matrix4;return function(t){return e.makeRotationZ(t),this.applyMatrix(e),this}}(),translate:function(){var e=new Matrix4;return function(t,i,r){return e.makeTranslation(t,i,r),this.applyMatrix(e),this}}(),scale:function(){var e=new Matrix4;return function(t,i,r){return e.makeScale(t,i,r),this.applyMatrix(e),this}}(),lookAt:function(){var e=new Object3D;return function(t){e.lookAt(t),e.updateMatrix(),this.applyMatrix(e.matrix)}}(),center:function(){var e=new Vector3;return function(){return this.computeBoundingBox(),this.boundingBox.getCenter(e).negate(),this.translate(e.x,e.y,e.z),this}}(),setFromObject:function(e){var t=e.geometry;if(e.isPoints||e.isLine){var i=new Float32BufferAttribute(3*t.vertices.length,3),r=new Float32BufferAttribute(3*t.colors.length,3);if(this.addAttribute("position",i.copyVector3sArray(t.vertices)),this.addAttribute("color",r.copyColorsArray(t.colors)),t.lineDistances&&t.lineDistances.length===t.vertices.length){var n=new Float32BufferAttribute(t.lineDistances.length,1);this.addAttribute("lineDistance",n.copyArray(t.lineDistances))}null!==t.boundingSphere&&(this.boundingSphere=t.boundingSphere.clone()),null!==t.boundingBox&&(this.boundingBox=t.boundingBox.clone())}else e.isMesh&&t&&t.isGeometry&&this.fromGeometry(t);return this},setFromPoints:function(e){for(var t=[],i=0,r=e.length;i<r;i++){var n=e[i];t.push(n.x,n.y,n.z||0)}return this.addAttribute("position",new Float32BufferAttribute(t,3)),this},updateFromObject:function(e){var t,i=e.geometry;if(e.isMesh){var r=i.__directGeometry;if(!0===i.elementsNeedUpdate&&(r=void 0,i.elementsNeedUpdate=!1),void 0===r)return this.fromGeometry(i);r.verticesNeedUpdate=i.verticesNeedUpdate,r.normalsNeedUpdate=i.normalsNeedUpdate,r.colorsNeedUpdate=i.colorsNeedUpdate,r.uvsNeedUpdate=i.uvsNeedUpdate,r.groupsNeedUpdate=i.groupsNeedUpdate,i.verticesNeedUpdate=!1,i.normalsNeedUpdate=!1,i.colorsNeedUpdate=!1,i.uvsNeedUpdate=!1,i.groupsNeedUpdate=!1,i=r}return!0===i.verticesNeedUpdate&&(void 0!==(t=this.attributes.position)&&(t.copyVector3sArray(i.vertices),t.needsUpdate=!0),i.verticesNeedUpdate=!1),!0===i.normalsNeedUpdate&&(void 0!==(t=this.attributes.normal)&&(t.copyVector3sArray(i.normals),t.needsUpdate=!0),i.normalsNeedUpdate=!1),!0===i.colorsNeedUpdate&&(void 0!==(t=this.attributes.color)&&(t.copyColorsArray(i.colors),t.needsUpdate=!0),i.colorsNeedUpdate=!1),i.uvsNeedUpdate&&(void 0!==(t=this.attributes.uv)&&(t.copyVector2sArray(i.uvs),t.needsUpdate=!0),i.uvsNeedUpdate=!1),i.lineDistancesNeedUpdate&&(void 0!==(t=this.attributes.lineDistance)&&(t.copyArray(i.lineDistances),t.needsUpdate=!0),i.lineDistancesNeedUpdate=!1),i.groupsNeedUpdate&&(i.computeGroups(e.geometry),this.groups=i.groups,i.groupsNeedUpdate=!1),this},fromGeometry:function(e){return e.__directGeometry=(new DirectGeometry).fromGeometry(e),this.fromDirectGeometry(e.__directGeometry)},fromDirectGeometry:function(e){var t=new Float32Array(3*e.vertices.length);if(this.addAttribute("position",new BufferAttribute(t,3).copyVector3sArray(e.vertices)),e.normals.length>0){var i=new Float32Array(3*e.normals.length);this.addAttribute("normal",new BufferAttribute(i,3).copyVector3sArray(e.normals))}if(e.colors.length>0){var r=new Float32Array(3*e.colors.length);this.addAttribute("color",new BufferAttribute(r,3).copyColorsArray(e.colors))}if(e.uvs.length>0){var n=new Float32Array(2*e.uvs.length);this.addAttribute("uv",new BufferAttribute(n,2).copyVector2sArray(e.uvs))}if(e.uvs2.length>0){var o=new Float32Array(2*e.uvs2.length);this.addAttribute("uv2",new BufferAttribute(o,2).copyVector2sArray(e.uvs2))}for(var a in this.groups=e.groups,e.morphTargets){for(var s=[],l=e.morphTargets[a],u=0,h=l.length;u<h;u++){var c=l[u],d=new Float32BufferAttribute(3*c.data.length,3);d.name=c.name,s.push(d.copyVector3sArray(c.data))}this.morphAttributes[a]=s}if(e.skinIndices.length>0){var p=new Float32BufferAttribute(4*e.skinIndices.length,4);this.addAttribute("skinIndex",p.copyVector4sArray(e.skinIndices))}if(e.skinWeights.length>0){var f=new Float32BufferAttribute(4*e.skinWeights.length,4);this.addAttribute("skinWeight",f.copyVector4sArray(e.skinWeights))}return null!==e.boundingSphere&&(this.boundingSphere=e.boundingSphere.clone()),null!==e.boundingBox&&(this.boundingBox=e.boundingBox.clone()),this},computeBoundingBox:function(){null===this.boundingBox&&(this.boundingBox=new Box3);var e=this.attributes.position;void 0!==e?this.boundingBox.setFromBufferAttribute(e):this.boundingBox.makeEmpty(),(isNaN(this.boundingBox.min.x)||isNaN(this.boundingBox.min.y)||isNaN(this.boundingBox.min.z))&&console.error('BufferGeometry.computeBoundingBox: Computed min/max have NaN values. The "position" attribute is likely to have NaN values.',this)},computeBoundingSphere:function(){var e=new Box3,t=new Vector3;return function(){null===this.boundingSphere&&(this.boundingSphere=new Sphere);var i=this.attributes.position;if(i){var r=this.boundingSphere.center;e.setFromBufferAttribute(i),e.getCenter(r);for(var n=0,o=0,a=i.count;o<a;o++)t.x=i.getX(o),t.y=i.getY(o),t.z=i.getZ(o),n=Math.max(n,r.distanceToSquared(t));this.boundingSphere.radius=Math.sqrt(n),isNaN(this.boundingSphere.radius)&&console.error('BufferGeometry.computeBoundingSphere(): Computed radius is NaN. The "position" attribute is likely to have NaN values.',this)}}}(),computeFaceNormals:function(){},computeVertexNormals:function(){var e=this.index,t=this.attributes;if(t.position){var i=t.position.array;if(void 0===t.normal)this.addAttribute("normal",new BufferAttribute(new Float32Array(i.length),3));else for(var r=t.normal.array,n=0,o=r.length;n<o;n++)r[n]=0;var a,s,l,u=t.normal.array,h=new Vector3,c=new Vector3,d=new Vector3,p=new Vector3,f=new Vector3;if(e){var m=e.array;for(n=0,o=e.count;n<o;n+=3)a=3*m[n+0],s=3*m[n+1],l=3*m[n+2],h.fromArray(i,a),c.fromArray(i,s),d.fromArray(i,l),p.subVectors(d,c),f.subVectors(h,c),p.cross(f),u[a]+=p.x,u[a+1]+=p.y,u[a+2]+=p.z,u[s]+=p.x,u[s+1]+=p.y,u[s+2]+=p.z,u[l]+=p.x,u[l+1]+=p.y,u[l+2]+=p.z}else for(n=0,o=i.length;n<o;n+=9)h.fromArray(i,n),c.fromArray(i,n+3),d.fromArray(i,n+6),p.subVectors(d,c),f.subVectors(h,c),p.cross(f),u[n]=p.x,u[n+1]=p.y,u[n+2]=p.z,u[n+3]=p.x,u[n+4]=p.y,u[n+5]=p.z,u[n+6]=p.x,u[n+7]=p.y,u[n+8]=p.z;this.normalizeNormals(),t.normal.needsUpdate=!0}},merge:function(e,t){if(e&&e.isBufferGeometry){void 0===t&&(t=0,console.warn("BufferGeometry.merge(): Overwriting original geometry, starting at offset=0. Use BufferGeometryUtils.mergeBufferGeometries() for lossless merge."));var i=this.attributes;for(var r in i)if(void 0!==e.attributes[r])for(var n=i[r].array,o=e.attributes[r],a=o.array,s=0,l=o.itemSize*t;s<a.length;s++,l++)n[l]=a[s];return this}console.error("BufferGeometry.merge(): geometry not an instance of BufferGeometry.",e)},normalizeNormals:function(){var e=new Vector3;return function(){for(var t=this.attributes.normal,i=0,r=t.count;i<r;i++)e.x=t.getX(i),e.y=t.getY(i),e.z=t.getZ(i),e.normalize(),t.setXYZ(i,e.x,e.y,e.z)}}(),toNonIndexed:function(){function e(e,t){for(var i=e.array,r=e.itemSize,n=new i.constructor(t.length*r),o=0,a=0,s=0,l=t.length;s<l;s++){o=t[s]*r;for(var u=0;u<r;u++)n[a++]=i[o++]}return new BufferAttribute(n,r)}if(null===this.index)return console.warn("BufferGeometry.toNonIndexed(): Geometry is already non-indexed."),this;var t=new BufferGeometry,i=this.index.array,r=this.attributes;for(var n in r){var o=e(r[n],i);t.addAttribute(n,o)}var a=this.morphAttributes;for(n in a){for(var s=[],l=a[n],u=0,h=l.length;u<h;u++){o=e(l[u],i);s.push(o)}t.morphAttributes[n]=s}for(var c=this.groups,d=(u=0,c.length);u<d;u++){var p=c[u];t.addGroup(p.start,p.count,p.materialIndex)}return t},toJSON:function(){var e={metadata:{version:4.5,type:"BufferGeometry",generator:"BufferGeometry.toJSON"}};if(e.uuid=this.uuid,e.type=this.type,""!==this.name&&(e.name=this.name),Object.keys(this.userData).length>0&&(e.userData=this.userData),void 0!==this.parameters){var t=this.parameters;for(var i in t)void 0!==t[i]&&(e[i]=t[i]);return e}e.data={attributes:{}};var r=this.index;null!==r&&(e.data.index={type:r.array.constructor.name,array:Array.prototype.slice.call(r.array)});var n=this.attributes;for(var i in n){var o={itemSize:(d=n[i]).itemSize,type:d.array.constructor.name,array:Array.prototype.slice.call(d.array),normalized:d.normalized};""!==d.name&&(o.name=d.name),e.data.attributes[i]=o}var a={},s=!1;for(var i in this.morphAttributes){for(var l=this.morphAttributes[i],u=[],h=0,c=l.length;h<c;h++){var d;o={itemSize:(d=l[h]).itemSize,type:d.array.constructor.name,array:Array.prototype.slice.call(d.array),normalized:d.normalized};""!==d.name&&(o.name=d.name),u.push(o)}u.length>0&&(a[i]=u,s=!0)}s&&(e.data.morphAttributes=a);var p=this.groups;p.length>0&&(e.data.groups=JSON.parse(JSON.stringify(p)));var f=this.boundingSphere;return null!==f&&(e.data.boundingSphere={center:f.center.toArray(),radius:f.radius}),e},clone:function(){return(new BufferGeometry).copy(this)},copy:function(e){var t,i,r;this.index=null,this.attributes={},this.morphAttributes={},this.groups=[],this.boundingBox=null,this.boundingSphere=null,this.name=e.name;var n=e.index;null!==n&&this.setIndex(n.clone());var o=e.attributes;for(t in o){var a=o[t];this.addAttribute(t,a.clone())}var s=e.morphAttributes;for(t in s){var l=[],u=s[t];for(i=0,r=u.length;i<r;i++)l.push(u[i].clone());this.morphAttributes[t]=l}var h=e.groups;for(i=0,r=h.length;i<r;i++){var c=h[i];this.addGroup(c.start,c.count,c.materialIndex)}var d=e.boundingBox;null!==d&&(this.boundingBox=d.clone());var p=e.boundingSphere;return null!==p&&(this.boundingSphere=p.clone()),this.drawRange.start=e.drawRange.start,this.drawRange.count=e.drawRange.count,this.userData=e.userData,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),SphereGeometry.prototype=Object.create(Geometry.prototype),SphereGeometry.prototype.constructor=SphereGeometry,SphereBufferGeometry.prototype=Object.create(BufferGeometry.prototype),SphereBufferGeometry.prototype.constructor=SphereBufferGeometry;var materialId=0,v,segCenter,segDir,diff,barycoord,v0,vab,vac,vbc,vap,vbp,vcp,inverseMatrix,ray,sphere,start,end;function Material$1(){Object.defineProperty(this,"id",{value:materialId++}),this.uuid=_Math.generateUUID(),this.name="",this.type="Material",this.fog=!0,this.lights=!0,this.blending=NormalBlending,this.side=FrontSide,this.flatShading=!1,this.vertexTangents=!1,this.vertexColors=NoColors,this.opacity=1,this.transparent=!1,this.blendSrc=SrcAlphaFactor,this.blendDst=OneMinusSrcAlphaFactor,this.blendEquation=AddEquation,this.blendSrcAlpha=null,this.blendDstAlpha=null,this.blendEquationAlpha=null,this.depthFunc=LessEqualDepth,this.depthTest=!0,this.depthWrite=!0,this.clippingPlanes=null,this.clipIntersection=!1,this.clipShadows=!1,this.shadowSide=null,this.colorWrite=!0,this.precision=null,this.polygonOffset=!1,this.polygonOffsetFactor=0,this.polygonOffsetUnits=0,this.dithering=!1,this.alphaTest=0,this.premultipliedAlpha=!1,this.visible=!0,this.userData={},this.needsUpdate=!0}function MeshBasicMaterial(e){Material$1.call(this),this.type="MeshBasicMaterial",this.color=new Color(16777215),this.map=null,this.lightMap=null,this.lightMapIntensity=1,this.aoMap=null,this.aoMapIntensity=1,this.specularMap=null,this.alphaMap=null,this.envMap=null,this.combine=MultiplyOperation,this.reflectivity=1,this.refractionRatio=.98,this.wireframe=!1,this.wireframeLinewidth=1,this.wireframeLinecap="round",this.wireframeLinejoin="round",this.skinning=!1,this.morphTargets=!1,this.lights=!1,this.setValues(e)}function LineBasicMaterial(e){Material$1.call(this),this.type="LineBasicMaterial",this.color=new Color(16777215),this.linewidth=1,this.linecap="round",this.linejoin="round",this.lights=!1,this.setValues(e)}function Ray(e,t){this.origin=void 0!==e?e:new Vector3,this.direction=void 0!==t?t:new Vector3}function Triangle(e,t,i){this.a=void 0!==e?e:new Vector3,this.b=void 0!==t?t:new Vector3,this.c=void 0!==i?i:new Vector3}function Mesh(e,t){Object3D.call(this),this.type="Mesh",this.geometry=void 0!==e?e:new BufferGeometry,this.material=void 0!==t?t:new MeshBasicMaterial({color:16777215*Math.random()}),this.drawMode=TrianglesDrawMode,this.updateMorphTargets()}function Line(e,t,i){1===i&&console.error("Line: parameter LinePieces no longer supported. Use LineSegments instead."),Object3D.call(this),this.type="Line",this.geometry=void 0!==e?e:new BufferGeometry,this.material=void 0!==t?t:new LineBasicMaterial({color:16777215*Math.random()})}Material$1.prototype=Object.assign(Object.create(EventDispatcher.prototype),{constructor:Material$1,isMaterial:!0,onBeforeCompile:function(){},setValues:function(e){if(void 0!==e)for(var t in e){var i=e[t];if(void 0!==i)if("shading"!==t){var r=this[t];void 0!==r?r&&r.isColor?r.set(i):r&&r.isVector3&&i&&i.isVector3?r.copy(i):this[t]=i:console.warn(this.type+": '"+t+"' is not a property of this material.")}else console.warn(this.type+": .shading has been removed. Use the boolean .flatShading instead."),this.flatShading=i===FlatShading;else console.warn("Material: '"+t+"' parameter is undefined.")}},toJSON:function(e){var t=void 0===e||"string"==typeof e;t&&(e={textures:{},images:{}});var i={metadata:{version:4.5,type:"Material",generator:"Material.toJSON"}};function r(e){var t=[];for(var i in e){var r=e[i];delete r.metadata,t.push(r)}return t}if(i.uuid=this.uuid,i.type=this.type,""!==this.name&&(i.name=this.name),this.color&&this.color.isColor&&(i.color=this.color.getHex()),void 0!==this.roughness&&(i.roughness=this.roughness),void 0!==this.metalness&&(i.metalness=this.metalness),this.emissive&&this.emissive.isColor&&(i.emissive=this.emissive.getHex()),1!==this.emissiveIntensity&&(i.emissiveIntensity=this.emissiveIntensity),this.specular&&this.specular.isColor&&(i.specular=this.specular.getHex()),void 0!==this.shininess&&(i.shininess=this.shininess),void 0!==this.clearCoat&&(i.clearCoat=this.clearCoat),void 0!==this.clearCoatRoughness&&(i.clearCoatRoughness=this.clearCoatRoughness),this.map&&this.map.isTexture&&(i.map=this.map.toJSON(e).uuid),this.alphaMap&&this.alphaMap.isTexture&&(i.alphaMap=this.alphaMap.toJSON(e).uuid),this.lightMap&&this.lightMap.isTexture&&(i.lightMap=this.lightMap.toJSON(e).uuid),this.aoMap&&this.aoMap.isTexture&&(i.aoMap=this.aoMap.toJSON(e).uuid,i.aoMapIntensity=this.aoMapIntensity),this.bumpMap&&this.bumpMap.isTexture&&(i.bumpMap=this.bumpMap.toJSON(e).uuid,i.bumpScale=this.bumpScale),this.normalMap&&this.normalMap.isTexture&&(i.normalMap=this.normalMap.toJSON(e).uuid,i.normalMapType=this.normalMapType,i.normalScale=this.normalScale.toArray()),this.displacementMap&&this.displacementMap.isTexture&&(i.displacementMap=this.displacementMap.toJSON(e).uuid,i.displacementScale=this.displacementScale,i.displacementBias=this.displacementBias),this.roughnessMap&&this.roughnessMap.isTexture&&(i.roughnessMap=this.roughnessMap.toJSON(e).uuid),this.metalnessMap&&this.metalnessMap.isTexture&&(i.metalnessMap=this.metalnessMap.toJSON(e).uuid),this.emissiveMap&&this.emissiveMap.isTexture&&(i.emissiveMap=this.emissiveMap.toJSON(e).uuid),this.specularMap&&this.specularMap.isTexture&&(i.specularMap=this.specularMap.toJSON(e).uuid),this.envMap&&this.envMap.isTexture&&(i.envMap=this.envMap.toJSON(e).uuid,i.reflectivity=this.reflectivity,void 0!==this.combine&&(i.combine=this.combine),void 0!==this.envMapIntensity&&(i.envMapIntensity=this.envMapIntensity)),this.gradientMap&&this.gradientMap.isTexture&&(i.gradientMap=this.gradientMap.toJSON(e).uuid),void 0!==this.size&&(i.size=this.size),void 0!==this.sizeAttenuation&&(i.sizeAttenuation=this.sizeAttenuation),this.blending!==NormalBlending&&(i.blending=this.blending),!0===this.flatShading&&(i.flatShading=this.flatShading),this.side!==FrontSide&&(i.side=this.side),this.vertexColors!==NoColors&&(i.vertexColors=this.vertexColors),this.opacity<1&&(i.opacity=this.opacity),!0===this.transparent&&(i.transparent=this.transparent),i.depthFunc=this.depthFunc,i.depthTest=this.depthTest,i.depthWrite=this.depthWrite,0!==this.rotation&&(i.rotation=this.rotation),!0===this.polygonOffset&&(i.polygonOffset=!0),0!==this.polygonOffsetFactor&&(i.polygonOffsetFactor=this.polygonOffsetFactor),0!==this.polygonOffsetUnits&&(i.polygonOffsetUnits=this.polygonOffsetUnits),1!==this.linewidth&&(i.linewidth=this.linewidth),void 0!==this.dashSize&&(i.dashSize=this.dashSize),void 0!==this.gapSize&&(i.gapSize=this.gapSize),void 0!==this.scale&&(i.scale=this.scale),!0===this.dithering&&(i.dithering=!0),this.alphaTest>0&&(i.alphaTest=this.alphaTest),!0===this.premultipliedAlpha&&(i.premultipliedAlpha=this.premultipliedAlpha),!0===this.wireframe&&(i.wireframe=this.wireframe),this.wireframeLinewidth>1&&(i.wireframeLinewidth=this.wireframeLinewidth),"round"!==this.wireframeLinecap&&(i.wireframeLinecap=this.wireframeLinecap),"round"!==this.wireframeLinejoin&&(i.wireframeLinejoin=this.wireframeLinejoin),!0===this.morphTargets&&(i.morphTargets=!0),!0===this.skinning&&(i.skinning=!0),!1===this.visible&&(i.visible=!1),"{}"!==JSON.stringify(this.userData)&&(i.userData=this.userData),t){var n=r(e.textures),o=r(e.images);n.length>0&&(i.textures=n),o.length>0&&(i.images=o)}return i},clone:function(){return(new this.constructor).copy(this)},copy:function(e){this.name=e.name,this.fog=e.fog,this.lights=e.lights,this.blending=e.blending,this.side=e.side,this.flatShading=e.flatShading,this.vertexColors=e.vertexColors,this.opacity=e.opacity,this.transparent=e.transparent,this.blendSrc=e.blendSrc,this.blendDst=e.blendDst,this.blendEquation=e.blendEquation,this.blendSrcAlpha=e.blendSrcAlpha,this.blendDstAlpha=e.blendDstAlpha,this.blendEquationAlpha=e.blendEquationAlpha,this.depthFunc=e.depthFunc,this.depthTest=e.depthTest,this.depthWrite=e.depthWrite,this.colorWrite=e.colorWrite,this.precision=e.precision,this.polygonOffset=e.polygonOffset,this.polygonOffsetFactor=e.polygonOffsetFactor,this.polygonOffsetUnits=e.polygonOffsetUnits,this.dithering=e.dithering,this.alphaTest=e.alphaTest,this.premultipliedAlpha=e.premultipliedAlpha,this.visible=e.visible,this.userData=JSON.parse(JSON.stringify(e.userData)),this.clipShadows=e.clipShadows,this.clipIntersection=e.clipIntersection;var t=e.clippingPlanes,i=null;if(null!==t){var r=t.length;i=new Array(r);for(var n=0;n!==r;++n)i[n]=t[n].clone()}return this.clippingPlanes=i,this.shadowSide=e.shadowSide,this},dispose:function(){this.dispatchEvent({type:"dispose"})}}),MeshBasicMaterial.prototype=Object.create(Material$1.prototype),MeshBasicMaterial.prototype.constructor=MeshBasicMaterial,MeshBasicMaterial.prototype.isMeshBasicMaterial=!0,MeshBasicMaterial.prototype.copy=function(e){return Material$1.prototype.copy.call(this,e),this.color.copy(e.color),this.map=e.map,this.lightMap=e.lightMap,this.lightMapIntensity=e.lightMapIntensity,this.aoMap=e.aoMap,this.aoMapIntensity=e.aoMapIntensity,this.specularMap=e.specularMap,this.alphaMap=e.alphaMap,this.envMap=e.envMap,this.combine=e.combine,this.reflectivity=e.reflectivity,this.refractionRatio=e.refractionRatio,this.wireframe=e.wireframe,this.wireframeLinewidth=e.wireframeLinewidth,this.wireframeLinecap=e.wireframeLinecap,this.wireframeLinejoin=e.wireframeLinejoin,this.skinning=e.skinning,this.morphTargets=e.morphTargets,this},LineBasicMaterial.prototype=Object.create(Material$1.prototype),LineBasicMaterial.prototype.constructor=LineBasicMaterial,LineBasicMaterial.prototype.isLineBasicMaterial=!0,LineBasicMaterial.prototype.copy=function(e){return Material$1.prototype.copy.call(this,e),this.color.copy(e.color),this.linewidth=e.linewidth,this.linecap=e.linecap,this.linejoin=e.linejoin,this},Object.assign(Ray.prototype,{set:function(e,t){return this.origin.copy(e),this.direction.copy(t),this},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.origin.copy(e.origin),this.direction.copy(e.direction),this},at:function(e,t){return void 0===t&&(console.warn("Ray: .at() target is now required"),t=new Vector3),t.copy(this.direction).multiplyScalar(e).add(this.origin)},lookAt:function(e){return this.direction.copy(e).sub(this.origin).normalize(),this},recast:function(){var e=new Vector3;return function(t){return this.origin.copy(this.at(t,e)),this}}(),closestPointToPoint:function(e,t){void 0===t&&(console.warn("Ray: .closestPointToPoint() target is now required"),t=new Vector3),t.subVectors(e,this.origin);var i=t.dot(this.direction);return i<0?t.copy(this.origin):t.copy(this.direction).multiplyScalar(i).add(this.origin)},distanceToPoint:function(e){return Math.sqrt(this.distanceSqToPoint(e))},distanceSqToPoint:function(){var e=new Vector3;return function(t){var i=e.subVectors(t,this.origin).dot(this.direction);return i<0?this.origin.distanceToSquared(t):(e.copy(this.direction).multiplyScalar(i).add(this.origin),e.distanceToSquared(t))}}(),distanceSqToSegment:(segCenter=new Vector3,segDir=new Vector3,diff=new Vector3,function(e,t,i,r){segCenter.copy(e).add(t).multiplyScalar(.5),segDir.copy(t).sub(e).normalize(),diff.copy(this.origin).sub(segCenter);var n,o,a,s,l=.5*e.distanceTo(t),u=-this.direction.dot(segDir),h=diff.dot(this.direction),c=-diff.dot(segDir),d=diff.lengthSq(),p=Math.abs(1-u*u);if(p>0)if(o=u*h-c,s=l*p,(n=u*c-h)>=0)if(o>=-s)if(o<=s){var f=1/p;a=(n*=f)*(n+u*(o*=f)+2*h)+o*(u*n+o+2*c)+d}else o=l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;else o=-l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;else o<=-s?a=-(n=Math.max(0,-(-u*l+h)))*n+(o=n>0?-l:Math.min(Math.max(-l,-c),l))*(o+2*c)+d:o<=s?(n=0,a=(o=Math.min(Math.max(-l,-c),l))*(o+2*c)+d):a=-(n=Math.max(0,-(u*l+h)))*n+(o=n>0?l:Math.min(Math.max(-l,-c),l))*(o+2*c)+d;else o=u>0?-l:l,a=-(n=Math.max(0,-(u*o+h)))*n+o*(o+2*c)+d;return i&&i.copy(this.direction).multiplyScalar(n).add(this.origin),r&&r.copy(segDir).multiplyScalar(o).add(segCenter),a}),intersectSphere:function(){var e=new Vector3;return function(t,i){e.subVectors(t.center,this.origin);var r=e.dot(this.direction),n=e.dot(e)-r*r,o=t.radius*t.radius;if(n>o)return null;var a=Math.sqrt(o-n),s=r-a,l=r+a;return s<0&&l<0?null:s<0?this.at(l,i):this.at(s,i)}}(),intersectsSphere:function(e){return this.distanceSqToPoint(e.center)<=e.radius*e.radius},distanceToPlane:function(e){var t=e.normal.dot(this.direction);if(0===t)return 0===e.distanceToPoint(this.origin)?0:null;var i=-(this.origin.dot(e.normal)+e.constant)/t;return i>=0?i:null},intersectPlane:function(e,t){var i=this.distanceToPlane(e);return null===i?null:this.at(i,t)},intersectsPlane:function(e){var t=e.distanceToPoint(this.origin);return 0===t||e.normal.dot(this.direction)*t<0},intersectBox:function(e,t){var i,r,n,o,a,s,l=1/this.direction.x,u=1/this.direction.y,h=1/this.direction.z,c=this.origin;return l>=0?(i=(e.min.x-c.x)*l,r=(e.max.x-c.x)*l):(i=(e.max.x-c.x)*l,r=(e.min.x-c.x)*l),u>=0?(n=(e.min.y-c.y)*u,o=(e.max.y-c.y)*u):(n=(e.max.y-c.y)*u,o=(e.min.y-c.y)*u),i>o||n>r?null:((n>i||i!=i)&&(i=n),(o<r||r!=r)&&(r=o),h>=0?(a=(e.min.z-c.z)*h,s=(e.max.z-c.z)*h):(a=(e.max.z-c.z)*h,s=(e.min.z-c.z)*h),i>s||a>r?null:((a>i||i!=i)&&(i=a),(s<r||r!=r)&&(r=s),r<0?null:this.at(i>=0?i:r,t)))},intersectsBox:(v=new Vector3,function(e){return null!==this.intersectBox(e,v)}),intersectTriangle:function(){var e=new Vector3,t=new Vector3,i=new Vector3,r=new Vector3;return function(n,o,a,s,l){t.subVectors(o,n),i.subVectors(a,n),r.crossVectors(t,i);var u,h=this.direction.dot(r);if(h>0){if(s)return null;u=1}else{if(!(h<0))return null;u=-1,h=-h}e.subVectors(this.origin,n);var c=u*this.direction.dot(i.crossVectors(e,i));if(c<0)return null;var d=u*this.direction.dot(t.cross(e));if(d<0)return null;if(c+d>h)return null;var p=-u*e.dot(r);return p<0?null:this.at(p/h,l)}}(),applyMatrix4:function(e){return this.origin.applyMatrix4(e),this.direction.transformDirection(e),this},equals:function(e){return e.origin.equals(this.origin)&&e.direction.equals(this.direction)}}),Object.assign(Triangle,{getNormal:(v0=new Vector3,function(e,t,i,r){void 0===r&&(console.warn("Triangle: .getNormal() target is now required"),r=new Vector3),r.subVectors(i,t),v0.subVectors(e,t),r.cross(v0);var n=r.lengthSq();return n>0?r.multiplyScalar(1/Math.sqrt(n)):r.set(0,0,0)}),getBarycoord:function(){var e=new Vector3,t=new Vector3,i=new Vector3;return function(r,n,o,a,s){e.subVectors(a,n),t.subVectors(o,n),i.subVectors(r,n);var l=e.dot(e),u=e.dot(t),h=e.dot(i),c=t.dot(t),d=t.dot(i),p=l*c-u*u;if(void 0===s&&(console.warn("Triangle: .getBarycoord() target is now required"),s=new Vector3),0===p)return s.set(-2,-1,-1);var f=1/p,m=(c*h-u*d)*f,v=(l*d-u*h)*f;return s.set(1-m-v,v,m)}}(),containsPoint:function(){var e=new Vector3;return function(t,i,r,n){return Triangle.getBarycoord(t,i,r,n,e),e.x>=0&&e.y>=0&&e.x+e.y<=1}}(),getUV:(barycoord=new Vector3,function(e,t,i,r,n,o,a,s){return this.getBarycoord(e,t,i,r,barycoord),s.set(0,0),s.addScaledVector(n,barycoord.x),s.addScaledVector(o,barycoord.y),s.addScaledVector(a,barycoord.z),s})}),Object.assign(Triangle.prototype,{set:function(e,t,i){return this.a.copy(e),this.b.copy(t),this.c.copy(i),this},setFromPointsAndIndices:function(e,t,i,r){return this.a.copy(e[t]),this.b.copy(e[i]),this.c.copy(e[r]),this},clone:function(){return(new this.constructor).copy(this)},copy:function(e){return this.a.copy(e.a),this.b.copy(e.b),this.c.copy(e.c),this},getArea:function(){var e=new Vector3,t=new Vector3;return function(){return e.subVectors(this.c,this.b),t.subVectors(this.a,this.b),.5*e.cross(t).length()}}(),getMidpoint:function(e){return void 0===e&&(console.warn("Triangle: .getMidpoint() target is now required"),e=new Vector3),e.addVectors(this.a,this.b).add(this.c).multiplyScalar(1/3)},getNormal:function(e){return Triangle.getNormal(this.a,this.b,this.c,e)},getPlane:function(e){return void 0===e&&(console.warn("Triangle: .getPlane() target is now required"),e=new Vector3),e.setFromCoplanarPoints(this.a,this.b,this.c)},getBarycoord:function(e,t){return Triangle.getBarycoord(e,this.a,this.b,this.c,t)},containsPoint:function(e){return Triangle.containsPoint(e,this.a,this.b,this.c)},getUV:function(e,t,i,r,n){return Triangle.getUV(e,this.a,this.b,this.c,t,i,r,n)},intersectsBox:function(e){return e.intersectsTriangle(this)},closestPointToPoint:(vab=new Vector3,vac=new Vector3,vbc=new Vector3,vap=new Vector3,vbp=new Vector3,vcp=new Vector3,function(e,t){void 0===t&&(console.warn("Triangle: .closestPointToPoint() target is now required"),t=new Vector3);var i,r,n=this.a,o=this.b,a=this.c;vab.subVectors(o,n),vac.subVectors(a,n),vap.subVectors(e,n);var s=vab.dot(vap),l=vac.dot(vap);if(s<=0&&l<=0)return t.copy(n);vbp.subVectors(e,o);var u=vab.dot(vbp),h=vac.dot(vbp);if(u>=0&&h<=u)return t.copy(o);var c=s*h-u*l;if(c<=0&&s>=0&&u<=0)return i=s/(s-u),t.copy(n).addScaledVector(vab,i);vcp.subVectors(e,a);var d=vab.dot(vcp),p=vac.dot(vcp);if(p>=0&&d<=p)return t.copy(a);var f=d*l-s*p;if(f<=0&&l>=0&&p<=0)return r=l/(l-p),t.copy(n).addScaledVector(vac,r);var m=u*p-d*h;if(m<=0&&h-u>=0&&d-p>=0)return vbc.subVectors(a,o),r=(h-u)/(h-u+(d-p)),t.copy(o).addScaledVector(vbc,r);var v=1/(m+f+c);return i=f*v,r=c*v,t.copy(n).addScaledVector(vab,i).addScaledVector(vac,r)}),equals:function(e){return e.a.equals(this.a)&&e.b.equals(this.b)&&e.c.equals(this.c)}}),Mesh.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:Mesh,isMesh:!0,setDrawMode:function(e){this.drawMode=e},copy:function(e){return Object3D.prototype.copy.call(this,e),this.drawMode=e.drawMode,void 0!==e.morphTargetInfluences&&(this.morphTargetInfluences=e.morphTargetInfluences.slice()),void 0!==e.morphTargetDictionary&&(this.morphTargetDictionary=Object.assign({},e.morphTargetDictionary)),this},updateMorphTargets:function(){var e,t,i,r=this.geometry;if(r.isBufferGeometry){var n=r.morphAttributes,o=Object.keys(n);if(o.length>0){var a=n[o[0]];if(void 0!==a)for(this.morphTargetInfluences=[],this.morphTargetDictionary={},e=0,t=a.length;e<t;e++)i=a[e].name||String(e),this.morphTargetInfluences.push(0),this.morphTargetDictionary[i]=e}}else{var s=r.morphTargets;void 0!==s&&s.length>0&&console.error("Mesh.updateMorphTargets() no longer supports Geometry. Use BufferGeometry instead.")}},raycast:function(){var e=new Matrix4,t=new Ray,i=new Sphere,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Vector3,l=new Vector3,u=new Vector2,h=new Vector2,c=new Vector2,d=new Vector3,p=new Vector3;function f(e,t,i,r,n,o,a,s){if(null===(t.side===BackSide?r.intersectTriangle(a,o,n,!0,s):r.intersectTriangle(n,o,a,t.side!==DoubleSide,s)))return null;p.copy(s),p.applyMatrix4(e.matrixWorld);var l=i.ray.origin.distanceTo(p);return l<i.near||l>i.far?null:{distance:l,point:p.clone(),object:e}}function m(e,t,i,a,s,l,p,m,v){r.fromBufferAttribute(s,p),n.fromBufferAttribute(s,m),o.fromBufferAttribute(s,v);var g=f(e,t,i,a,r,n,o,d);if(g){l&&(u.fromBufferAttribute(l,p),h.fromBufferAttribute(l,m),c.fromBufferAttribute(l,v),g.uv=Triangle.getUV(d,r,n,o,u,h,c,new Vector2));var y=new Face3(p,m,v);Triangle.getNormal(r,n,o,y.normal),g.face=y}return g}return function(p,v){var g,y=this.geometry,_=this.material,b=this.matrixWorld;if(void 0!==_&&(null===y.boundingSphere&&y.computeBoundingSphere(),i.copy(y.boundingSphere),i.applyMatrix4(b),!1!==p.ray.intersectsSphere(i)&&(e.getInverse(b),t.copy(p.ray).applyMatrix4(e),null===y.boundingBox||!1!==t.intersectsBox(y.boundingBox))))if(y.isBufferGeometry){var x,w,S,M,T,A,C,L,N,k=y.index,P=y.attributes.position,E=y.attributes.uv,D=y.groups,O=y.drawRange;if(null!==k)if(Array.isArray(_))for(M=0,A=D.length;M<A;M++)for(N=_[(L=D[M]).materialIndex],T=Math.max(L.start,O.start),C=Math.min(L.start+L.count,O.start+O.count);T<C;T+=3)x=k.getX(T),w=k.getX(T+1),S=k.getX(T+2),(g=m(this,N,p,t,P,E,x,w,S))&&(g.faceIndex=Math.floor(T/3),g.face.materialIndex=L.materialIndex,v.push(g));else for(M=Math.max(0,O.start),A=Math.min(k.count,O.start+O.count);M<A;M+=3)x=k.getX(M),w=k.getX(M+1),S=k.getX(M+2),(g=m(this,_,p,t,P,E,x,w,S))&&(g.faceIndex=Math.floor(M/3),v.push(g));else if(void 0!==P)if(Array.isArray(_))for(M=0,A=D.length;M<A;M++)for(N=_[(L=D[M]).materialIndex],T=Math.max(L.start,O.start),C=Math.min(L.start+L.count,O.start+O.count);T<C;T+=3)(g=m(this,N,p,t,P,E,x=T,w=T+1,S=T+2))&&(g.faceIndex=Math.floor(T/3),g.face.materialIndex=L.materialIndex,v.push(g));else for(M=Math.max(0,O.start),A=Math.min(P.count,O.start+O.count);M<A;M+=3)(g=m(this,_,p,t,P,E,x=M,w=M+1,S=M+2))&&(g.faceIndex=Math.floor(M/3),v.push(g))}else if(y.isGeometry){var R,F,I,B,U=Array.isArray(_),V=y.vertices,z=y.faces,G=y.faceVertexUvs[0];G.length>0&&(B=G);for(var j=0,W=z.length;j<W;j++){var H=z[j],q=U?_[H.materialIndex]:_;if(void 0!==q){if(R=V[H.a],F=V[H.b],I=V[H.c],!0===q.morphTargets){var Y=y.morphTargets,X=this.morphTargetInfluences;r.set(0,0,0),n.set(0,0,0),o.set(0,0,0);for(var K=0,Q=Y.length;K<Q;K++){var Z=X[K];if(0!==Z){var J=Y[K].vertices;r.addScaledVector(a.subVectors(J[H.a],R),Z),n.addScaledVector(s.subVectors(J[H.b],F),Z),o.addScaledVector(l.subVectors(J[H.c],I),Z)}}r.add(R),n.add(F),o.add(I),R=r,F=n,I=o}if(g=f(this,q,p,t,R,F,I,d)){if(B&&B[j]){var $=B[j];u.copy($[0]),h.copy($[1]),c.copy($[2]),g.uv=Triangle.getUV(d,R,F,I,u,h,c,new Vector2)}g.face=H,g.faceIndex=j,v.push(g)}}}}}}(),clone:function(){return new this.constructor(this.geometry,this.material).copy(this)}}),Line.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:Line,isLine:!0,computeLineDistances:(start=new Vector3,end=new Vector3,function(){var e=this.geometry;if(e.isBufferGeometry)if(null===e.index){for(var t=e.attributes.position,i=[0],r=1,n=t.count;r<n;r++)start.fromBufferAttribute(t,r-1),end.fromBufferAttribute(t,r),i[r]=i[r-1],i[r]+=start.distanceTo(end);e.addAttribute("lineDistance",new Float32BufferAttribute(i,1))}else console.warn("Line.computeLineDistances(): Computation only possible with non-indexed BufferGeometry.");else if(e.isGeometry){var o=e.vertices;for((i=e.lineDistances)[0]=0,r=1,n=o.length;r<n;r++)i[r]=i[r-1],i[r]+=o[r-1].distanceTo(o[r])}return this}),raycast:(inverseMatrix=new Matrix4,ray=new Ray,sphere=new Sphere,function(e,t){var i=e.linePrecision,r=this.geometry,n=this.matrixWorld;if(null===r.boundingSphere&&r.computeBoundingSphere(),sphere.copy(r.boundingSphere),sphere.applyMatrix4(n),sphere.radius+=i,!1!==e.ray.intersectsSphere(sphere)){inverseMatrix.getInverse(n),ray.copy(e.ray).applyMatrix4(inverseMatrix);var o=i/((this.scale.x+this.scale.y+this.scale.z)/3),a=o*o,s=new Vector3,l=new Vector3,u=new Vector3,h=new Vector3,c=this&&this.isLineSegments?2:1;if(r.isBufferGeometry){var d=r.index,p=r.attributes.position.array;if(null!==d)for(var f=d.array,m=0,v=f.length-1;m<v;m+=c){var g=f[m],y=f[m+1];s.fromArray(p,3*g),l.fromArray(p,3*y),ray.distanceSqToSegment(s,l,h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}else for(m=0,v=p.length/3-1;m<v;m+=c)s.fromArray(p,3*m),l.fromArray(p,3*m+3),ray.distanceSqToSegment(s,l,h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}else if(r.isGeometry){var _=r.vertices,b=_.length;for(m=0;m<b-1;m+=c){var x;ray.distanceSqToSegment(_[m],_[m+1],h,u)>a||(h.applyMatrix4(this.matrixWorld),(x=e.ray.origin.distanceTo(h))<e.near||x>e.far||t.push({distance:x,point:u.clone().applyMatrix4(this.matrixWorld),index:m,face:null,faceIndex:null,object:this}))}}}}),copy:function(e){return Object3D.prototype.copy.call(this,e),this.geometry.copy(e.geometry),this.material.copy(e.material),this},clone:function(){return(new this.constructor).copy(this)}});var CCDIKSolver=function(){function e(e,t){this.mesh=e,this.iks=t||[],this._valid()}var t,i,r,n,o,a,s,l,u,h;function c(e,t){Object3D.call(this),this.root=e,this.iks=t||[],this.matrix.copy(e.matrixWorld),this.matrixAutoUpdate=!1,this.sphereGeometry=new SphereBufferGeometry(.25,16,8),this.targetSphereMaterial=new MeshBasicMaterial({color:new Color(16746632),depthTest:!1,depthWrite:!1,transparent:!0}),this.effectorSphereMaterial=new MeshBasicMaterial({color:new Color(8978312),depthTest:!1,depthWrite:!1,transparent:!0}),this.linkSphereMaterial=new MeshBasicMaterial({color:new Color(8947967),depthTest:!1,depthWrite:!1,transparent:!0}),this.lineMaterial=new LineBasicMaterial({color:new Color(16711680),depthTest:!1,depthWrite:!1,transparent:!0}),this._init()}return e.prototype={constructor:e,update:(t=new Quaternion,i=new Vector3,r=new Vector3,n=new Vector3,o=new Vector3,a=new Vector3,s=new Quaternion,l=new Vector3,u=new Vector3,h=new Vector3,function(){for(var e=this.mesh.skeleton.bones,c=this.iks,d=Math,p=0,f=c.length;p<f;p++){var m=c[p],v=e[m.effector],g=e[m.target];i.setFromMatrixPosition(g.matrixWorld);for(var y=m.links,_=void 0!==m.iteration?m.iteration:1,b=0;b<_;b++){for(var x=!1,w=0,S=y.length;w<S;w++){var M=e[y[w].index];if(!1===y[w].enabled)break;var T=y[w].limitation,A=y[w].rotationMin,C=y[w].rotationMax;M.matrixWorld.decompose(a,s,l),s.inverse(),n.setFromMatrixPosition(v.matrixWorld),o.subVectors(n,a),o.applyQuaternion(s),o.normalize(),r.subVectors(i,a),r.applyQuaternion(s),r.normalize();var L=r.dot(o);if(L>1?L=1:L<-1&&(L=-1),!((L=d.acos(L))<1e-5)){if(void 0!==m.minAngle&&L<m.minAngle&&(L=m.minAngle),void 0!==m.maxAngle&&L>m.maxAngle&&(L=m.maxAngle),u.crossVectors(o,r),u.normalize(),t.setFromAxisAngle(u,L),M.quaternion.multiply(t),void 0!==T){var N=M.quaternion.w;N>1&&(N=1);var k=d.sqrt(1-N*N);M.quaternion.set(T.x*k,T.y*k,T.z*k,N)}void 0!==A&&M.rotation.setFromVector3(M.rotation.toVector3(h).max(A)),void 0!==C&&M.rotation.setFromVector3(M.rotation.toVector3(h).min(C)),M.updateMatrixWorld(!0),x=!0}}if(!x)break}}return this}),createHelper:function(){return new c(this.mesh,this.mesh.geometry.userData.MMD.iks)},_valid:function(){for(var e=this.iks,t=this.mesh.skeleton.bones,i=0,r=e.length;i<r;i++){var n,o,a=e[i],s=t[a.effector],l=a.links;n=s;for(var u=0,h=l.length;u<h;u++)o=t[l[u].index],n.parent!==o&&console.warn("CCDIKSolver: bone "+n.name+" is not the child of bone "+o.name),n=o}}},c.prototype=Object.assign(Object.create(Object3D.prototype),{constructor:c,updateMatrixWorld:function(){var e=new Matrix4,t=new Vector3;function i(e,i){return t.setFromMatrixPosition(e.matrixWorld).applyMatrix4(i)}function r(e,t,r,n){var o=i(r,n);e[3*t+0]=o.x,e[3*t+1]=o.y,e[3*t+2]=o.z}return function(t){var n=this.root;if(this.visible){var o=0,a=this.iks,s=n.skeleton.bones;e.getInverse(n.matrixWorld);for(var l=0,u=a.length;l<u;l++){var h=a[l],c=s[h.target],d=s[h.effector],p=this.children[o++],f=this.children[o++];p.position.copy(i(c,e)),f.position.copy(i(d,e));for(var m=0,v=h.links.length;m<v;m++){var g=s[h.links[m].index];this.children[o++].position.copy(i(g,e))}var y=this.children[o++],_=y.geometry.attributes.position.array;r(_,0,c,e),r(_,1,d,e);for(m=0,v=h.links.length;m<v;m++){r(_,m+2,g=s[h.links[m].index],e)}y.geometry.attributes.position.needsUpdate=!0}}this.matrix.copy(n.matrixWorld),Object3D.prototype.updateMatrixWorld.call(this,t)}}(),_init:function(){var e=this,t=this.iks;function i(t){return new Line(function(e){var t=new BufferGeometry,i=new Float32Array(3*(2+e.links.length));return t.addAttribute("position",new BufferAttribute(i,3)),t}(t),e.lineMaterial)}for(var r=0,n=t.length;r<n;r++){var o=t[r];this.add(new Mesh(e.sphereGeometry,e.targetSphereMaterial)),this.add(new Mesh(e.sphereGeometry,e.effectorSphereMaterial));for(var a=0,s=o.links.length;a<s;a++)this.add(new Mesh(e.sphereGeometry,e.linkSphereMaterial));this.add(i(o))}}}),e}();function AnimationAction(e,t,i){this._mixer=e,this._clip=t,this._localRoot=i||null;for(var r=t.tracks,n=r.length,o=new Array(n),a={endingStart:ZeroCurvatureEnding,endingEnd:ZeroCurvatureEnding},s=0;s!==n;++s){var l=r[s].createInterpolant(null);o[s]=l,l.settings=a}this._interpolantSettings=a,this._interpolants=o,this._propertyBindings=new Array(n),this._cacheIndex=null,this._byClipCacheIndex=null,this._timeScaleInterpolant=null,this._weightInterpolant=null,this.loop=LoopRepeat,this._loopCount=-1,this._startTime=null,this.time=0,this.timeScale=1,this._effectiveTimeScale=1,this.weight=1,this._effectiveWeight=1,this.repetitions=1/0,this.paused=!1,this.enabled=!0,this.clampWhenFinished=!1,this.zeroSlopeAtStart=!0,this.zeroSlopeAtEnd=!0}function Interpolant(e,t,i,r){this.parameterPositions=e,this._cachedIndex=0,this.resultBuffer=void 0!==r?r:new t.constructor(i),this.sampleValues=t,this.valueSize=i}function LinearInterpolant(e,t,i,r){Interpolant.call(this,e,t,i,r)}Object.assign(AnimationAction.prototype,{play:function(){return this._mixer._activateAction(this),this},stop:function(){return this._mixer._deactivateAction(this),this.reset()},reset:function(){return this.paused=!1,this.enabled=!0,this.time=0,this._loopCount=-1,this._startTime=null,this.stopFading().stopWarping()},isRunning:function(){return this.enabled&&!this.paused&&0!==this.timeScale&&null===this._startTime&&this._mixer._isActiveAction(this)},isScheduled:function(){return this._mixer._isActiveAction(this)},startAt:function(e){return this._startTime=e,this},setLoop:function(e,t){return this.loop=e,this.repetitions=t,this},setEffectiveWeight:function(e){return this.weight=e,this._effectiveWeight=this.enabled?e:0,this.stopFading()},getEffectiveWeight:function(){return this._effectiveWeight},fadeIn:function(e){return this._scheduleFading(e,0,1)},fadeOut:function(e){return this._scheduleFading(e,1,0)},crossFadeFrom:function(e,t,i){if(e.fadeOut(t),this.fadeIn(t),i){var r=this._clip.duration,n=e._clip.duration,o=n/r,a=r/n;e.warp(1,o,t),this.warp(a,1,t)}return this},crossFadeTo:function(e,t,i){return e.crossFadeFrom(this,t,i)},stopFading:function(){var e=this._weightInterpolant;return null!==e&&(this._weightInterpolant=null,this._mixer._takeBackControlInterpolant(e)),this},setEffectiveTimeScale:function(e){return this.timeScale=e,this._effectiveTimeScale=this.paused?0:e,this.stopWarping()},getEffectiveTimeScale:function(){return this._effectiveTimeScale},setDuration:function(e){return this.timeScale=this._clip.duration/e,this.stopWarping()},syncWith:function(e){return this.time=e.time,this.timeScale=e.timeScale,this.stopWarping()},halt:function(e){return this.warp(this._effectiveTimeScale,0,e)},warp:function(e,t,i){var r=this._mixer,n=r.time,o=this._timeScaleInterpolant,a=this.timeScale;null===o&&(o=r._lendControlInterpolant(),this._timeScaleInterpolant=o);var s=o.parameterPositions,l=o.sampleValues;return s[0]=n,s[1]=n+i,l[0]=e/a,l[1]=t/a,this},stopWarping:function(){var e=this._timeScaleInterpolant;return null!==e&&(this._timeScaleInterpolant=null,this._mixer._takeBackControlInterpolant(e)),this},getMixer:function(){return this._mixer},getClip:function(){return this._clip},getRoot:function(){return this._localRoot||this._mixer._root},_update:function(e,t,i,r){if(this.enabled){var n=this._startTime;if(null!==n){var o=(e-n)*i;if(o<0||0===i)return;this._startTime=null,t=i*o}t*=this._updateTimeScale(e);var a=this._updateTime(t),s=this._updateWeight(e);if(s>0)for(var l=this._interpolants,u=this._propertyBindings,h=0,c=l.length;h!==c;++h)l[h].evaluate(a),u[h].accumulate(r,s)}else this._updateWeight(e)},_updateWeight:function(e){var t=0;if(this.enabled){t=this.weight;var i=this._weightInterpolant;if(null!==i){var r=i.evaluate(e)[0];t*=r,e>i.parameterPositions[1]&&(this.stopFading(),0===r&&(this.enabled=!1))}}return this._effectiveWeight=t,t},_updateTimeScale:function(e){var t=0;if(!this.paused){t=this.timeScale;var i=this._timeScaleInterpolant;if(null!==i)t*=i.evaluate(e)[0],e>i.parameterPositions[1]&&(this.stopWarping(),0===t?this.paused=!0:this.timeScale=t)}return this._effectiveTimeScale=t,t},_updateTime:function(e){var t=this.time+e,i=this._clip.duration,r=this.loop,n=this._loopCount,o=r===LoopPingPong;if(0===e)return-1===n?t:o&&1==(1&n)?i-t:t;if(r===LoopOnce){-1===n&&(this._loopCount=0,this._setEndings(!0,!0,!1));e:{if(t>=i)t=i;else{if(!(t<0))break e;t=0}this.clampWhenFinished?this.paused=!0:this.enabled=!1,this._mixer.dispatchEvent({type:"finished",action:this,direction:e<0?-1:1})}}else{if(-1===n&&(e>=0?(n=0,this._setEndings(!0,0===this.repetitions,o)):this._setEndings(0===this.repetitions,!0,o)),t>=i||t<0){var a=Math.floor(t/i);t-=i*a,n+=Math.abs(a);var s=this.repetitions-n;if(s<=0)this.clampWhenFinished?this.paused=!0:this.enabled=!1,t=e>0?i:0,this._mixer.dispatchEvent({type:"finished",action:this,direction:e>0?1:-1});else{if(1===s){var l=e<0;this._setEndings(l,!l,o)}else this._setEndings(!1,!1,o);this._loopCount=n,this._mixer.dispatchEvent({type:"loop",action:this,loopDelta:a})}}if(o&&1==(1&n))return this.time=t,i-t}return this.time=t,t},_setEndings:function(e,t,i){var r=this._interpolantSettings;i?(r.endingStart=ZeroSlopeEnding,r.endingEnd=ZeroSlopeEnding):(r.endingStart=e?this.zeroSlopeAtStart?ZeroSlopeEnding:ZeroCurvatureEnding:WrapAroundEnding,r.endingEnd=t?this.zeroSlopeAtEnd?ZeroSlopeEnding:ZeroCurvatureEnding:WrapAroundEnding)},_scheduleFading:function(e,t,i){var r=this._mixer,n=r.time,o=this._weightInterpolant;null===o&&(o=r._lendControlInterpolant(),this._weightInterpolant=o);var a=o.parameterPositions,s=o.sampleValues;return a[0]=n,s[0]=t,a[1]=n+e,s[1]=i,this}}),Object.assign(Interpolant.prototype,{evaluate:function(e){var t=this.parameterPositions,i=this._cachedIndex,r=t[i],n=t[i-1];e:{t:{var o;i:{r:if(!(e<r)){for(var a=i+2;;){if(void 0===r){if(e<n)break r;return i=t.length,this._cachedIndex=i,this.afterEnd_(i-1,e,n)}if(i===a)break;if(n=r,e<(r=t[++i]))break t}o=t.length;break i}if(e>=n)break e;var s=t[1];e<s&&(i=2,n=s);for(a=i-2;;){if(void 0===n)return this._cachedIndex=0,this.beforeStart_(0,e,r);if(i===a)break;if(r=n,e>=(n=t[--i-1]))break t}o=i,i=0}for(;i<o;){var l=i+o>>>1;e<t[l]?o=l:i=l+1}if(r=t[i],void 0===(n=t[i-1]))return this._cachedIndex=0,this.beforeStart_(0,e,r);if(void 0===r)return i=t.length,this._cachedIndex=i,this.afterEnd_(i-1,n,e)}this._cachedIndex=i,this.intervalChanged_(i,n,r)}return this.interpolate_(i,n,e,r)},settings:null,DefaultSettings_:{},getSettings_:function(){return this.settings||this.DefaultSettings_},copySampleValue_:function(e){for(var t=this.resultBuffer,i=this.sampleValues,r=this.valueSize,n=e*r,o=0;o!==r;++o)t[o]=i[n+o];return t},interpolate_:function(){throw new Error("call to abstract method")},intervalChanged_:function(){}}),
 //!\ DECLARE ALIAS AFTER assign prototype !
 Object.assign(Interpolant.prototype,{beforeStart_:Interpolant.prototype.copySampleValue_,afterEnd_:Interpolant.prototype.copySampleValue_}),LinearInterpolant.prototype=Object.assign(Object.create(Interpolant.prototype),{constructor:LinearInterpolant,interpolate_:function(e,t,i,r){for(var n=this.resultBuffer,o=this.sampleValues,a=this.valueSize,s=e*a,l=s-a,u=(i-t)/(r-t),h=1-u,c=0;c!==a;++c)n[c]=o[l+c]*h+o[s+c]*u;return n}});var RESERVED_CHARS_RE="\\[\\]\\.:\\/",wordChar,wordCharOrDot,directoryRe,nodeRe,objectRe,propertyRe,trackRe,supportedObjectNames,reservedRe;function Composite(e,t,i){var r=i||PropertyBinding.parseTrackName(t);this._targetGroup=e,this._bindings=e.subscribe_(t,r)}function PropertyBinding(e,t,i){this.path=t,this.parsedPath=i||PropertyBinding.parseTrackName(t),this.node=PropertyBinding.findNode(e,this.parsedPath.nodeName)||e,this.rootNode=e}function PropertyMixer(e,t,i){this.binding=e,this.valueSize=i;var r,n=Float64Array;switch(t){case"quaternion":r=this._slerp;break;case"string":case"bool":n=Array,r=this._select;break;default:r=this._lerp}this.buffer=new n(4*i),this._mixBufferRegion=r,this.cumulativeWeight=0,this.useCount=0,this.referenceCount=0}Object.assign(Composite.prototype,{getValue:function(e,t){this.bind();var i=this._targetGroup.nCachedObjects_,r=this._bindings[i];void 0!==r&&r.getValue(e,t)},setValue:function(e,t){for(var i=this._bindings,r=this._targetGroup.nCachedObjects_,n=i.length;r!==n;++r)i[r].setValue(e,t)},bind:function(){for(var e=this._bindings,t=this._targetGroup.nCachedObjects_,i=e.length;t!==i;++t)e[t].bind()},unbind:function(){for(var e=this._bindings,t=this._targetGroup.nCachedObjects_,i=e.length;t!==i;++t)e[t].unbind()}}),Object.assign(PropertyBinding,{Composite:Composite,create:function(e,t,i){return e&&e.isAnimationObjectGroup?new PropertyBinding.Composite(e,t,i):new PropertyBinding(e,t,i)},sanitizeNodeName:(reservedRe=new RegExp("["+RESERVED_CHARS_RE+"]","g"),function(e){return e.replace(/\s/g,"_").replace(reservedRe,"")}),parseTrackName:(wordChar="[^"+RESERVED_CHARS_RE+"]",wordCharOrDot="[^"+RESERVED_CHARS_RE.replace("\\.","")+"]",directoryRe=/((?:WC+[\/:])*)/.source.replace("WC",wordChar),nodeRe=/(WCOD+)?/.source.replace("WCOD",wordCharOrDot),objectRe=/(?:\.(WC+)(?:\[(.+)\])?)?/.source.replace("WC",wordChar),propertyRe=/\.(WC+)(?:\[(.+)\])?/.source.replace("WC",wordChar),trackRe=new RegExp("^"+directoryRe+nodeRe+objectRe+propertyRe+"$"),supportedObjectNames=["material","materials","bones"],function(e){var t=trackRe.exec(e);if(!t)throw new Error("PropertyBinding: Cannot parse trackName: "+e);var i={nodeName:t[2],objectName:t[3],objectIndex:t[4],propertyName:t[5],propertyIndex:t[6]},r=i.nodeName&&i.nodeName.lastIndexOf(".");if(void 0!==r&&-1!==r){var n=i.nodeName.substring(r+1);-1!==supportedObjectNames.indexOf(n)&&(i.nodeName=i.nodeName.substring(0,r),i.objectName=n)}if(null===i.propertyName||0===i.propertyName.length)throw new Error("PropertyBinding: can not parse propertyName from trackName: "+e);return i}),findNode:function(e,t){if(!t||""===t||"root"===t||"."===t||-1===t||t===e.name||t===e.uuid)return e;if(e.skeleton){var i=e.skeleton.getBoneByName(t);if(void 0!==i)return i}if(e.children){var r=function(e){for(var i=0;i<e.length;i++){var n=e[i];if(n.name===t||n.uuid===t)return n;var o=r(n.children);if(o)return o}return null},n=r(e.children);if(n)return n}return null}}),Object.assign(PropertyBinding.prototype,{_getValue_unavailable:function(){},_setValue_unavailable:function(){},BindingType:{Direct:0,EntireArray:1,ArrayElement:2,HasFromToArray:3},Versioning:{None:0,NeedsUpdate:1,MatrixWorldNeedsUpdate:2},GetterByBindingType:[function(e,t){e[t]=this.node[this.propertyName]},function(e,t){for(var i=this.resolvedProperty,r=0,n=i.length;r!==n;++r)e[t++]=i[r]},function(e,t){e[t]=this.resolvedProperty[this.propertyIndex]},function(e,t){this.resolvedProperty.toArray(e,t)}],SetterByBindingTypeAndVersioning:[[function(e,t){this.targetObject[this.propertyName]=e[t]},function(e,t){this.targetObject[this.propertyName]=e[t],this.targetObject.needsUpdate=!0},function(e,t){this.targetObject[this.propertyName]=e[t],this.targetObject.matrixWorldNeedsUpdate=!0}],[function(e,t){for(var i=this.resolvedProperty,r=0,n=i.length;r!==n;++r)i[r]=e[t++]},function(e,t){for(var i=this.resolvedProperty,r=0,n=i.length;r!==n;++r)i[r]=e[t++];this.targetObject.needsUpdate=!0},function(e,t){for(var i=this.resolvedProperty,r=0,n=i.length;r!==n;++r)i[r]=e[t++];this.targetObject.matrixWorldNeedsUpdate=!0}],[function(e,t){this.resolvedProperty[this.propertyIndex]=e[t]},function(e,t){this.resolvedProperty[this.propertyIndex]=e[t],this.targetObject.needsUpdate=!0},function(e,t){this.resolvedProperty[this.propertyIndex]=e[t],this.targetObject.matrixWorldNeedsUpdate=!0}],[function(e,t){this.resolvedProperty.fromArray(e,t)},function(e,t){this.resolvedProperty.fromArray(e,t),this.targetObject.needsUpdate=!0},function(e,t){this.resolvedProperty.fromArray(e,t),this.targetObject.matrixWorldNeedsUpdate=!0}]],getValue:function(e,t){this.bind(),this.getValue(e,t)},setValue:function(e,t){this.bind(),this.setValue(e,t)},bind:function(){var e=this.node,t=this.parsedPath,i=t.objectName,r=t.propertyName,n=t.propertyIndex;if(e||(e=PropertyBinding.findNode(this.rootNode,t.nodeName)||this.rootNode,this.node=e),this.getValue=this._getValue_unavailable,this.setValue=this._setValue_unavailable,e){if(i){var o=t.objectIndex;switch(i){case"materials":if(!e.material)return void console.error("PropertyBinding: Can not bind to material as node does not have a material.",this);if(!e.material.materials)return void console.error("PropertyBinding: Can not bind to material.materials as node.material does not have a materials array.",this);e=e.material.materials;break;case"bones":if(!e.skeleton)return void console.error("PropertyBinding: Can not bind to bones as node does not have a skeleton.",this);e=e.skeleton.bones;for(var a=0;a<e.length;a++)if(e[a].name===o){o=a;break}break;default:if(void 0===e[i])return void console.error("PropertyBinding: Can not bind to objectName of node undefined.",this);e=e[i]}if(void 0!==o){if(void 0===e[o])return void console.error("PropertyBinding: Trying to bind to objectIndex of objectName, but is undefined.",this,e);e=e[o]}}var s=e[r];if(void 0!==s){var l=this.Versioning.None;this.targetObject=e,void 0!==e.needsUpdate?l=this.Versioning.NeedsUpdate:void 0!==e.matrixWorldNeedsUpdate&&(l=this.Versioning.MatrixWorldNeedsUpdate);var u=this.BindingType.Direct;if(void 0!==n){if("morphTargetInfluences"===r){if(!e.geometry)return void console.error("PropertyBinding: Can not bind to morphTargetInfluences because node does not have a geometry.",this);if(e.geometry.isBufferGeometry){if(!e.geometry.morphAttributes)return void console.error("PropertyBinding: Can not bind to morphTargetInfluences because node does not have a geometry.morphAttributes.",this);for(a=0;a<this.node.geometry.morphAttributes.position.length;a++)if(e.geometry.morphAttributes.position[a].name===n){n=a;break}}else{if(!e.geometry.morphTargets)return void console.error("PropertyBinding: Can not bind to morphTargetInfluences because node does not have a geometry.morphTargets.",this);for(a=0;a<this.node.geometry.morphTargets.length;a++)if(e.geometry.morphTargets[a].name===n){n=a;break}}}u=this.BindingType.ArrayElement,this.resolvedProperty=s,this.propertyIndex=n}else void 0!==s.fromArray&&void 0!==s.toArray?(u=this.BindingType.HasFromToArray,this.resolvedProperty=s):Array.isArray(s)?(u=this.BindingType.EntireArray,this.resolvedProperty=s):this.propertyName=r;this.getValue=this.GetterByBindingType[u],this.setValue=this.SetterByBindingTypeAndVersioning[u][l]}else{var h=t.nodeName;console.error("PropertyBinding: Trying to update property for track: "+h+"."+r+" but it wasn't found.",e)}}else console.error("PropertyBinding: Trying to update node for track: "+this.path+" but it wasn't found.")},unbind:function(){this.node=null,this.getValue=this._getValue_unbound,this.setValue=this._setValue_unbound}}),
 //!\ DECLARE ALIAS AFTER assign prototype !
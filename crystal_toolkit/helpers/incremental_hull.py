@@ -0,0 +1,370 @@
+"""
+A convex hull of formation energies that can be updated one entry at a time.
+
+A PhaseDiagram is re-computed from scratch whenever its entries change, which
+is slow for systems with many entries. Here, inserting an entry only replaces
+the facets of the hull that lie above it, and only the energies above the hull
+of entries beneath those facets are re-computed. The hull is constructed in
+the same co-ordinates as PhaseDiagram (atomic fractions of all but the first
+element, and energy per atom), so a PhaseDiagram can be made from it without
+re-computing the hull.
+"""
+
+from collections import Counter
+from inspect import signature
+from itertools import chain, combinations
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from scipy.spatial import ConvexHull
+
+from pymatgen.analysis.phase_diagram import PhaseDiagram, PhaseDiagramError, PDEntry
+from pymatgen.core.periodic_table import Element
+from pymatgen.util.coord import Simplex
+
+# a PhaseDiagram can only be made from a hull computed elsewhere if it accepts
+# pre-computed data, otherwise there is no benefit to using IncrementalHull
+SUPPORTS_COMPUTED_DATA = "computed_data" in signature(PhaseDiagram).parameters
+
+
+class IncrementalHull:
+    """
+    The lower convex hull of a set of entries, supporting insertion and
+    removal of single entries.
+    """
+
+    # same tolerances as PhaseDiagram, so that the same entries are stable
+    formation_energy_tol = PhaseDiagram.formation_energy_tol
+    numerical_tol = PhaseDiagram.numerical_tol
+
+    # number of entries to locate on the hull at once, limits memory use
+    chunk_size = 256
+
+    def __init__(
+        self, entries: Sequence[PDEntry], elements: Optional[List[Element]] = None
+    ):
+        """
+        :param entries: entries, which must include an entry for every element
+        :param elements: elements of the hull, by default those of the entries
+        """
+
+        if elements is None:
+            elements = sorted(
+                set(chain.from_iterable(e.composition.elements for e in entries))
+            )
+
+        self.elements = list(elements)
+        self.dim = len(self.elements)
+        self.entries = list(entries)
+
+        self._build()
+
+    def _get_points(self, entries: Sequence[PDEntry]) -> np.ndarray:
+        """
+        :return: atomic fractions of all but the first element and energy per
+        atom of each entry, with shape (len(entries), dim)
+        """
+
+        points = np.empty((len(entries), self.dim))
+
+        for idx, entry in enumerate(entries):
+            if not set(entry.composition.elements).issubset(self.elements):
+                raise ValueError(
+                    f"{entry.composition} has elements not in the hull {self.elements}"
+                )
+            points[idx, :-1] = [
+                entry.composition.get_atomic_fraction(el) for el in self.elements[1:]
+            ]
+            points[idx, -1] = entry.energy_per_atom
+
+        return points
+
+    def _build(self):
+        """
+        Compute the hull of all entries from scratch.
+        """
+
+        self._points = self._get_points(self.entries)
+
+        el_refs = self.el_refs
+        if len(el_refs) != self.dim:
+            raise PhaseDiagramError(
+                "There are no entries associated with a terminal element!"
+            )
+
+        # as for PhaseDiagram, only entries with negative formation energies
+        # and the elemental references can be vertices of the hull
+        ref_idxs = [self.entries.index(ref) for ref in el_refs.values()]
+        ref_energies = np.array([ref.energy_per_atom for ref in el_refs.values()])
+        fractions = np.hstack(
+            [1 - self._points[:, :-1].sum(axis=1, keepdims=True), self._points[:, :-1]]
+        )
+        form_e = self._points[:, -1] - fractions @ ref_energies
+        candidate_idxs = np.union1d(
+            np.where(form_e < -self.formation_energy_tol)[0], ref_idxs
+        )
+
+        if self.dim == 1:
+            facets = np.array([[candidate_idxs[0]]])
+        else:
+            # an extra point above all others ensures the hull is full
+            # dimensional, facets including it are not part of the lower hull
+            extra_point = np.zeros(self.dim) + 1 / self.dim
+            extra_point[-1] = np.max(self._points[candidate_idxs]) + 1
+            hull = ConvexHull(
+                np.vstack([self._points[candidate_idxs], extra_point]),
+                qhull_options="Qt i",
+            )
+            facets = hull.simplices[
+                np.all(hull.simplices < len(candidate_idxs), axis=1)
+            ]
+            facets = candidate_idxs[facets]
+
+        self._facets = np.empty((0, self.dim), dtype=int)
+        self._inverses = np.empty((0, self.dim, self.dim))
+        self._add_facets(facets)
+
+        self._e_above_hull, self._entry_facets = self._locate(self._points)
+
+    def _add_facets(self, facets: np.ndarray) -> np.ndarray:
+        """
+        Add facets, ignoring those that are degenerate.
+
+        :param facets: indices of the entries at the vertices of each facet
+        :return: indices of the facets added
+        """
+
+        matrices = np.ones((len(facets), self.dim, self.dim))
+        matrices[:, :, :-1] = self._points[facets][:, :, :-1]
+
+        facets = facets[np.abs(np.linalg.det(matrices)) > 1e-14]
+        matrices = matrices[np.abs(np.linalg.det(matrices)) > 1e-14]
+
+        new_idxs = np.arange(len(self._facets), len(self._facets) + len(facets))
+
+        self._facets = np.vstack([self._facets, facets])
+        # barycentric co-ordinates of x in a facet are [x, 1] @ inverse
+        self._inverses = np.vstack([self._inverses, np.linalg.inv(matrices)])
+
+        return new_idxs
+
+    def _locate(self, points: np.ndarray, facet_idxs: Optional[np.ndarray] = None):
+        """
+        Find the facet of the hull beneath each point.
+
+        :param points: points, as returned by _get_points
+        :param facet_idxs: facets to consider, by default all facets
+        :return: energy above the hull of each point, and the index of the
+        facet beneath each point
+        """
+
+        if facet_idxs is None:
+            facet_idxs = np.arange(len(self._facets))
+
+        inverses = self._inverses[facet_idxs]
+        facet_energies = self._points[self._facets[facet_idxs], -1]
+
+        e_above_hull = np.empty(len(points))
+        located_facets = np.empty(len(points), dtype=int)
+
+        for start in range(0, len(points), self.chunk_size):
+            chunk = points[start : start + self.chunk_size]
+            coords = np.hstack([chunk[:, :-1], np.ones((len(chunk), 1))])
+            # barycentric co-ordinates of every point in every facet
+            barycentric = np.einsum("pi,fij->pfj", coords, inverses)
+            idxs = np.argmax(barycentric.min(axis=2), axis=1)
+            hull_energies = np.einsum(
+                "pj,pj->p",
+                barycentric[np.arange(len(chunk)), idxs],
+                facet_energies[idxs],
+            )
+            e_above_hull[start : start + self.chunk_size] = chunk[:, -1] - hull_energies
+            located_facets[start : start + self.chunk_size] = facet_idxs[idxs]
+
+        return e_above_hull, located_facets
+
+    def _remove_facets(self, mask: np.ndarray):
+        """
+        Remove facets and re-index the facets of entries accordingly, entries
+        on a removed facet are left with an index of -1.
+
+        :param mask: True for the facets to remove
+        """
+
+        new_idxs = np.cumsum(~mask) - 1
+        new_idxs[mask] = -1
+
+        self._facets = self._facets[~mask]
+        self._inverses = self._inverses[~mask]
+        self._entry_facets = new_idxs[self._entry_facets]
+
+    def insert(self, entry: PDEntry):
+        """
+        Add an entry to the hull. If the entry is below the hull, the facets
+        above it are replaced by facets joining the entry to the boundary of
+        those facets.
+
+        :param entry: entry
+        """
+
+        point = self._get_points([entry])
+        e_above_hull, facet_idx = self._locate(point)
+
+        self.entries.append(entry)
+        self._points = np.vstack([self._points, point])
+        self._e_above_hull = np.append(self._e_above_hull, e_above_hull)
+        self._entry_facets = np.append(self._entry_facets, facet_idx)
+
+        if e_above_hull[0] >= -self.formation_energy_tol:
+            return
+
+        # all facets whose planes pass above the new entry are removed
+        coords = np.append(point[0, :-1], 1)
+        plane_energies = np.einsum(
+            "fj,fj->f",
+            np.einsum("i,fij->fj", coords, self._inverses),
+            self._points[self._facets, -1],
+        )
+        visible = plane_energies - point[0, -1] > self.formation_energy_tol
+
+        # the ridges of the removed facets that are not shared between two
+        # removed facets form the boundary of the region to re-triangulate
+        ridges = Counter(
+            ridge
+            for facet in self._facets[visible]
+            for ridge in combinations(sorted(facet), self.dim - 1)
+        )
+        new_idx = len(self.entries) - 1
+        new_facets = np.array(
+            [ridge + (new_idx,) for ridge, count in ridges.items() if count == 1],
+            dtype=int,
+        ).reshape(-1, self.dim)
+
+        self._remove_facets(visible)
+        new_facet_idxs = self._add_facets(new_facets)
+
+        # only entries beneath the removed facets have a new energy above hull
+        affected = self._entry_facets == -1
+        self._e_above_hull[affected], self._entry_facets[affected] = self._locate(
+            self._points[affected], new_facet_idxs
+        )
+
+    def remove(self, entry: PDEntry):
+        """
+        Remove an entry from the hull. Removing an entry that is not a vertex
+        of the hull leaves the hull unchanged, removing a vertex of the hull
+        requires the hull to be re-computed.
+
+        :param entry: entry
+        """
+
+        idx = self.entries.index(entry)
+
+        if np.any(self._facets == idx):
+            del self.entries[idx]
+            self._build()
+            return
+
+        del self.entries[idx]
+        self._points = np.delete(self._points, idx, axis=0)
+        self._e_above_hull = np.delete(self._e_above_hull, idx)
+        self._entry_facets = np.delete(self._entry_facets, idx)
+        self._facets[self._facets > idx] -= 1
+
+    def copy(self) -> "IncrementalHull":
+        """
+        :return: a copy of the hull that can be updated independently
+        """
+
+        new_hull = self.__class__.__new__(self.__class__)
+        new_hull.__dict__.update(self.__dict__)
+        new_hull.elements = list(self.elements)
+        new_hull.entries = list(self.entries)
+        for attr in (
+            "_points",
+            "_facets",
+            "_inverses",
+            "_e_above_hull",
+            "_entry_facets",
+        ):
+            setattr(new_hull, attr, getattr(self, attr).copy())
+
+        return new_hull
+
+    @property
+    def el_refs(self):
+        """
+        :return: a dict of the lowest energy entry of each element
+        """
+
+        el_refs = {}
+        for entry in self.entries:
+            if entry.composition.is_element:
+                el = entry.composition.elements[0]
+                if (
+                    el not in el_refs
+                    or entry.energy_per_atom < el_refs[el].energy_per_atom
+                ):
+                    el_refs[el] = entry
+
+        return {el: el_refs[el] for el in self.elements if el in el_refs}
+
+    @property
+    def stable_entries(self) -> List[PDEntry]:
+        """
+        :return: entries at the vertices of the hull
+        """
+        return [self.entries[idx] for idx in np.unique(self._facets)]
+
+    def get_e_above_hull(self, entry: PDEntry) -> float:
+        """
+        :param entry: an entry of the hull
+        :return: energy above the hull in eV/atom
+        """
+
+        idx = self.entries.index(entry)
+
+        if np.any(self._facets == idx):
+            return 0.0
+
+        return float(self._e_above_hull[idx])
+
+    def get_phase_diagram(self) -> PhaseDiagram:
+        """
+        :return: a PhaseDiagram of the entries, using this hull instead of
+        re-computing it
+        :raises NotImplementedError: if the installed pymatgen does not
+        support pre-computed data, see SUPPORTS_COMPUTED_DATA
+        """
+
+        if not SUPPORTS_COMPUTED_DATA:
+            raise NotImplementedError(
+                "This version of pymatgen cannot make a PhaseDiagram from a "
+                "pre-computed hull."
+            )
+
+        vertex_idxs = np.unique(self._facets)
+        qhull_entries = [self.entries[idx] for idx in vertex_idxs]
+
+        extra_point = np.zeros(self.dim) + 1 / self.dim
+        extra_point[-1] = np.max(self._points[vertex_idxs]) + 1
+        qhull_data = np.vstack([self._points[vertex_idxs], extra_point])
+
+        facets = np.searchsorted(vertex_idxs, self._facets).tolist()
+
+        # in the same form as returned by PhaseDiagram._compute, which has
+        # included simplexes and dim in some versions of pymatgen
+        computed_data = {
+            "facets": facets,
+            "simplexes": [Simplex(qhull_data[f, :-1]) for f in facets],
+            "all_entries": sorted(
+                self.entries, key=lambda e: e.composition.reduced_composition
+            ),
+            "qhull_data": qhull_data,
+            "dim": self.dim,
+            "el_refs": list(self.el_refs.items()),
+            "qhull_entries": qhull_entries,
+        }
+
+        return PhaseDiagram(self.entries, self.elements, computed_data=computed_data)
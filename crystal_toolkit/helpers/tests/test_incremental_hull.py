@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from crystal_toolkit.helpers.incremental_hull import (
+    IncrementalHull,
+    SUPPORTS_COMPUTED_DATA,
+)
+
+from pymatgen.analysis.phase_diagram import PhaseDiagram, PDEntry
+from pymatgen.core.composition import Composition
+
+
+class TestIncrementalHull:
+    def setup_method(self, method):
+
+        self.chemsyses = [["Li", "O"], ["Li", "Fe", "O"], ["Li", "Fe", "P", "O"]]
+        self.entries = {}
+
+        random_state = np.random.RandomState(0)
+
+        for chemsys in self.chemsyses:
+            entries = [PDEntry(Composition(el), random_state.rand()) for el in chemsys]
+            while len(entries) < 60:
+                amounts = random_state.randint(0, 5, len(chemsys))
+                if not amounts.any():
+                    continue
+                comp = Composition(dict(zip(chemsys, amounts)))
+                energy = comp.num_atoms * (random_state.rand() - 1.5)
+                entries.append(PDEntry(comp, energy))
+            self.entries["-".join(chemsys)] = entries
+
+    def assert_matches_phase_diagram(self, hull):
+
+        pd = PhaseDiagram(hull.entries)
+
+        assert set(map(id, hull.stable_entries)) == set(map(id, pd.stable_entries))
+        for entry in hull.entries:
+            assert np.isclose(
+                hull.get_e_above_hull(entry), pd.get_e_above_hull(entry), atol=1e-8
+            )
+
+    def test_insert(self):
+
+        for entries in self.entries.values():
+
+            hull = IncrementalHull(entries[:30])
+            self.assert_matches_phase_diagram(hull)
+
+            for entry in entries[30:]:
+                hull.insert(entry)
+                self.assert_matches_phase_diagram(hull)
+
+            # a new elemental reference changes every formation energy
+            hull.insert(PDEntry(Composition({hull.elements[0]: 1}), -5))
+            self.assert_matches_phase_diagram(hull)
+
+    def test_remove(self):
+
+        for entries in self.entries.values():
+
+            hull = IncrementalHull(entries)
+
+            # remove stable and unstable entries, keeping elemental entries
+            for entry in entries[len(hull.elements) :: 3]:
+                hull.remove(entry)
+                self.assert_matches_phase_diagram(hull)
+
+    def test_copy(self):
+
+        entries = self.entries["Li-Fe-O"]
+
+        hull = IncrementalHull(entries[:-1])
+        new_hull = hull.copy()
+        new_hull.insert(entries[-1])
+
+        assert len(hull.entries) == len(entries) - 1
+        self.assert_matches_phase_diagram(hull)
+        self.assert_matches_phase_diagram(new_hull)
+
+    @pytest.mark.skipif(
+        not SUPPORTS_COMPUTED_DATA, reason="requires PhaseDiagram computed_data"
+    )
+    def test_get_phase_diagram(self):
+
+        for entries in self.entries.values():
+
+            hull = IncrementalHull(entries[:30])
+            for entry in entries[30:]:
+                hull.insert(entry)
+
+            pd = hull.get_phase_diagram()
+            expected_pd = PhaseDiagram(entries)
+
+            # everything PhaseDiagram computes is given
+            assert set(pd.computed_data) >= set(expected_pd.computed_data)
+
+            assert pd.stable_entries == expected_pd.stable_entries
+            for entry in entries:
+                assert np.isclose(
+                    pd.get_e_above_hull(entry), expected_pd.get_e_above_hull(entry)
+                )
+                assert np.isclose(
+                    pd.get_form_energy_per_atom(entry),
+                    expected_pd.get_form_energy_per_atom(entry),
+                )
+
+                decomposition = pd.get_decomposition(entry.composition)
+                expected_decomposition = expected_pd.get_decomposition(
+                    entry.composition
+                )
+                assert set(decomposition) == set(expected_decomposition)
+                for decomposition_entry, amount in decomposition.items():
+                    assert np.isclose(
+                        amount, expected_decomposition[decomposition_entry]
+                    )
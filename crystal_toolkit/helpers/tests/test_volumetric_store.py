@@ -0,0 +1,97 @@
+import os
+
+from tempfile import TemporaryDirectory
+from time import time
+
+import numpy as np
+import pytest
+
+from crystal_toolkit.core.mpcomponent import MPComponent
+from crystal_toolkit.helpers.volumetric_store import (
+    VolumetricDataHandle,
+    VolumetricDataStore,
+)
+
+from pymatgen import Structure, Lattice
+from pymatgen.io.vasp import Chgcar, Poscar
+
+
+class TestVolumetricDataStore:
+    def setup_method(self, method):
+
+        VolumetricDataStore.loaded.clear()
+        self.tempdir = TemporaryDirectory()
+        self.store = VolumetricDataStore(
+            directory=os.path.join(self.tempdir.name, "store"), ttl=60
+        )
+
+        struct = Structure(Lattice.cubic(4.2), ["Na", "Cl"], [[0, 0, 0], [0.5] * 3])
+        x, y, z = np.mgrid[0:1:10j, 0:1:12j, 0:1:14j]
+        self.grid = np.sin(6 * x) + np.cos(5 * y) * np.sin(4 * z)
+
+        self.filename = os.path.join(self.tempdir.name, "CHGCAR")
+        Chgcar(Poscar(struct), {"total": self.grid * struct.volume}).write_file(
+            self.filename
+        )
+
+    def teardown_method(self, method):
+        self.tempdir.cleanup()
+
+    def test_add_load(self):
+
+        handle = self.store.add(self.filename)
+
+        # the handle is sent to the browser, so must not say where data is
+        assert "directory" not in handle.as_dict()
+        handle = MPComponent.from_data(MPComponent.to_data(handle))
+
+        volumetric_data = handle.load(self.store)
+        assert np.allclose(
+            volumetric_data.data["total"], Chgcar.from_file(self.filename).data["total"]
+        )
+
+        # data is only parsed once
+        os.remove(self.filename)
+        assert self.store.add(self.filename, key=handle.key).as_dict() == (
+            handle.as_dict()
+        )
+
+    def test_load_cached(self):
+
+        handle = self.store.add(self.filename)
+
+        # as when loading the handle in a callback, with a new store each time
+        volumetric_data = handle.load(VolumetricDataStore(self.store.directory))
+        analysis = volumetric_data.get_analysis()
+
+        handle = MPComponent.from_data(MPComponent.to_data(handle))
+        assert handle.load(VolumetricDataStore(self.store.directory)) is (
+            volumetric_data
+        )
+        assert volumetric_data.get_analysis() is analysis
+
+    def test_invalid_handle(self):
+
+        handle = self.store.add(self.filename)
+
+        for key, data_keys in (
+            ("../" * 10 + "etc/passwd", handle.data_keys),
+            (handle.key, ["../../total"]),
+        ):
+            with pytest.raises(ValueError):
+                self.store.load(VolumetricDataHandle(key, data_keys, handle.structure))
+
+    def test_evict_expired(self):
+
+        handle = self.store.add(self.filename)
+        self.store.load(handle)
+
+        for filename in os.listdir(self.store.directory):
+            path = os.path.join(self.store.directory, filename)
+            os.utime(path, (time() - 120, time() - 120))
+        self.store._last_evicted = 0
+        self.store._evict_expired()
+
+        assert not os.listdir(self.store.directory)
+        with pytest.raises(KeyError):
+            self.store.load(handle)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from crystal_toolkit.components.xrd import XRayDiffractionComponent
+from crystal_toolkit.helpers.xrd_batch import (
+    iter_patterns,
+    read_patterns,
+    write_patterns,
+)
+
+from pymatgen import Structure, Lattice
+
+
+class TestBatch:
+    def setup_method(self, method):
+
+        self.structs = [
+            Structure(Lattice.cubic(a), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+            for a in np.linspace(3, 5, 5)
+        ]
+
+    def test_iter_patterns(self):
+
+        progress = []
+
+        patterns = list(
+            iter_patterns(
+                self.structs, workers=2, chunk_size=2, progress=progress.append
+            )
+        )
+
+        assert progress[-1] == len(self.structs)
+
+        for struct, (x, y) in zip(self.structs, patterns):
+            pattern = XRayDiffractionComponent.get_pattern(
+                struct, XRayDiffractionComponent.default_xrdcalculator_kwargs
+            )
+            assert np.allclose(x, pattern["x"])
+            assert np.allclose(y, pattern["y"])
+
+    def test_write_patterns(self, tmp_path):
+
+        filename = str(tmp_path / "patterns.npz")
+
+        assert (
+            write_patterns(
+                filename, self.structs, profile_kwargs={"logsize": 1}, workers=2
+            )
+            == 5
+        )
+
+        patterns = read_patterns(filename)
+        assert len(patterns) == 5
+
+        pattern = XRayDiffractionComponent.get_pattern(
+            self.structs[0], XRayDiffractionComponent.default_xrdcalculator_kwargs
+        )
+        x, y = XRayDiffractionComponent.get_profile(
+            pattern["x"], pattern["y"], logsize=1
+        )
+        assert np.allclose(patterns[0][0], x, rtol=1e-6)
+        assert np.allclose(patterns[0][1], y, rtol=1e-5, atol=1e-5)
+
+    def test_failed_pattern(self, tmp_path):
+
+        filename = str(tmp_path / "patterns.npz")
+
+        # a structure that fails does not stop the others
+        structs = self.structs[:2] + ["not a structure"] + self.structs[2:]
+        with pytest.warns(UserWarning, match="structure 2"):
+            assert write_patterns(filename, structs, workers=2, chunk_size=2) == 6
+
+        patterns = read_patterns(filename)
+        assert len(patterns[2][0]) == 0
+        assert np.allclose(
+            patterns[3][0],
+            XRayDiffractionComponent.get_pattern(
+                self.structs[2], XRayDiffractionComponent.default_xrdcalculator_kwargs
+            )["x"],
+        )
+
+    def test_profile_wavelength(self):
+
+        patterns = iter_patterns(
+            self.structs[:1],
+            xrdcalculator_kwargs={"wavelength": "MoKa"},
+            profile_kwargs={"logsize": 1, "wavelength": "MoKa"},
+            workers=1,
+        )
+        assert len(list(patterns)) == 1
+
+        with pytest.raises(ValueError):
+            list(
+                iter_patterns(
+                    self.structs[:1],
+                    profile_kwargs={"logsize": 1, "wavelength": "MoKa"},
+                    workers=1,
+                )
+            )
@@ -0,0 +1,200 @@
+"""
+Volumetric data (e.g. from a CHGCAR or LOCPOT) can be hundreds of MB, far
+too large to keep in a dcc.Store. Instead, the grids are saved once to
+local disk as .npy files and only a small handle is kept in the Store.
+Grids are then read as memory-mapped arrays, so that only the parts of
+the grid actually used are read from disk.
+"""
+
+import os
+import re
+
+from hashlib import sha1
+from tempfile import gettempdir
+from time import time
+from typing import List, Optional
+
+import numpy as np
+
+from monty.json import MSONable
+from monty.serialization import dumpfn, loadfn
+
+from crystal_toolkit.core.cache import LRUCache
+
+from pymatgen.core.structure import Structure
+from pymatgen.io.vasp.outputs import Chgcar, VolumetricData
+
+
+class VolumetricDataHandle(MSONable):
+    """
+    A reference to volumetric data saved in a VolumetricDataStore. Handles
+    are sent to the browser, so they do not say where the data is saved,
+    this is only known to the VolumetricDataStore on the server.
+    """
+
+    def __init__(self, key: str, data_keys: List[str], structure: Structure):
+        """
+        :param key: hash of the file the data was parsed from
+        :param data_keys: keys of the grids available, e.g. "total" and "diff"
+        :param structure: the structure the volumetric data is defined on
+        """
+        self.key = key
+        self.data_keys = data_keys
+        self.structure = structure
+
+    def load(self, store: Optional["VolumetricDataStore"] = None) -> VolumetricData:
+        """
+        :param store: the VolumetricDataStore the data was saved in, by
+        default the store in the default directory
+        :return: VolumetricData with its grids memory-mapped from disk
+        """
+        return (store or VolumetricDataStore()).load(self)
+
+
+class VolumetricDataStore:
+    """
+    Saves the grids of volumetric data to disk, keyed by a hash of the file
+    they were parsed from, so that each file is only ever parsed once. Data
+    not used for ttl seconds is evicted.
+    """
+
+    # recently loaded data, so that repeated loads of the same handle return
+    # the same VolumetricData and share its analysis, see
+    # VolumetricData.get_analysis, grids are memory-mapped so this is cheap
+    loaded = LRUCache(maxsize=8)
+
+    def __init__(self, directory: Optional[str] = None, ttl: int = 86400):
+        """
+        :param directory: where to save grids, by default the
+        CRYSTAL_TOOLKIT_VOLUMETRIC_DIR environment variable if set,
+        otherwise a directory in the system's temporary directory
+        :param ttl: time in seconds after which unused data is evicted
+        """
+        self.directory = directory or os.environ.get(
+            "CRYSTAL_TOOLKIT_VOLUMETRIC_DIR",
+            os.path.join(gettempdir(), "crystal_toolkit_volumetric"),
+        )
+        self.ttl = ttl
+
+        self._last_evicted = 0
+
+    def _get_path(self, key: str, data_key: Optional[str] = None) -> str:
+        """
+        :return: path of the grid for the given data_key, or of the saved
+        handle if data_key is None
+        """
+        # handles come back from the browser, so check they cannot refer to
+        # files outside of the store
+        if not re.fullmatch(r"[0-9a-f]{40}", key):
+            raise ValueError(f"Invalid volumetric data key: {key}")
+        if data_key is None:
+            return os.path.join(self.directory, f"{key}.json")
+        if not re.fullmatch(r"\w+", data_key):
+            raise ValueError(f"Invalid volumetric data key: {data_key}")
+        return os.path.join(self.directory, f"{key}_{data_key}.npy")
+
+    def add(self, filename: str, key: Optional[str] = None) -> VolumetricDataHandle:
+        """
+        :param filename: a file parseable by Chgcar.from_file, e.g. a CHGCAR
+        or LOCPOT
+        :param key: a sha1 hex digest of the file contents, if already known
+        :return: a handle to the saved data
+        """
+
+        if key is None:
+            with open(filename, "rb") as f:
+                key = sha1(f.read()).hexdigest()
+
+        # written last, so if present all the grids have been saved
+        handle_path = self._get_path(key)
+
+        if os.path.exists(handle_path):
+            handle = loadfn(handle_path)
+            self._touch(handle)
+            return handle
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._evict_expired()
+
+        volumetric_data = Chgcar.from_file(filename)
+
+        handle = VolumetricDataHandle(
+            key=key,
+            data_keys=sorted(volumetric_data.data.keys()),
+            structure=volumetric_data.structure,
+        )
+
+        for data_key, grid in volumetric_data.data.items():
+            # write to a temporary file first, in case several processes
+            # are saving the same data
+            path = self._get_path(key, data_key)
+            with open(f"{path}.{os.getpid()}", "wb") as f:
+                np.save(f, grid)
+            os.replace(f"{path}.{os.getpid()}", path)
+
+        dumpfn(handle, f"{handle_path}.{os.getpid()}")
+        os.replace(f"{handle_path}.{os.getpid()}", handle_path)
+
+        return handle
+
+    def load(self, handle: VolumetricDataHandle) -> VolumetricData:
+        """
+        :param handle: a handle, as returned by add
+        :return: VolumetricData with its grids memory-mapped from disk
+        :raises KeyError: if the data has expired or was never saved
+        """
+        cache_key = (self.directory, handle.key, tuple(handle.data_keys))
+        volumetric_data = self.loaded.get(cache_key)
+        # data may have been evicted from disk while loaded
+        if volumetric_data is not None and os.path.exists(self._get_path(handle.key)):
+            self._touch(handle)
+            return volumetric_data
+
+        try:
+            data = {
+                data_key: np.load(self._get_path(handle.key, data_key), mmap_mode="r")
+                for data_key in handle.data_keys
+            }
+        except FileNotFoundError:
+            raise KeyError(
+                f"Volumetric data {handle.key} not found, it may have expired"
+            )
+        self._touch(handle)
+        volumetric_data = VolumetricData(handle.structure, data)
+        self.loaded.set(cache_key, volumetric_data)
+        return volumetric_data
+
+    def _touch(self, handle: VolumetricDataHandle):
+        """
+        Mark data as recently used, so that it is not evicted.
+        """
+        for data_key in [None] + handle.data_keys:
+            try:
+                os.utime(self._get_path(handle.key, data_key))
+            except FileNotFoundError:
+                pass
+
+    def _evict_expired(self):
+        """
+        Remove data from disk that has not been used for ttl seconds. Checks
+        at most every tenth of ttl, since this requires listing the directory.
+        """
+
+        now = time()
+        if now - self._last_evicted < self.ttl / 10:
+            return
+        self._last_evicted = now
+
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            try:
+                if os.path.getmtime(path) < now - self.ttl:
+                    # the saved handle is removed first, so that the data is
+                    # saved again if added again, file names start with the key
+                    handle_path = os.path.join(self.directory, f"{filename[:40]}.json")
+                    for path_to_remove in (handle_path, path):
+                        if os.path.exists(path_to_remove):
+                            os.remove(path_to_remove)
+            except FileNotFoundError:
+                # removed by another process
+                pass
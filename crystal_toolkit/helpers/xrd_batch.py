@@ -0,0 +1,282 @@
+"""
+Calculate X-ray diffraction patterns for many structures without an app, e.g.
+to pre-compute patterns for a database of structures. Patterns are calculated
+in a process pool and written to a compact columnar .npz file, see
+write_patterns and read_patterns.
+
+Run as a script, this can also warm the cache of an app, so that patterns are
+already cached when first viewed:
+
+    python -m crystal_toolkit.helpers.xrd_batch mp-13 --redis-url $REDIS_URL
+"""
+
+import os
+import warnings
+
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from shutil import copyfileobj
+from tempfile import TemporaryFile
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from zipfile import ZipFile, ZIP_DEFLATED
+
+import numpy as np
+
+from pymatgen import MPRester, Structure
+from pymatgen.analysis.diffraction.xrd import WAVELENGTHS
+
+from crystal_toolkit.components.xrd import XRayDiffractionComponent
+from crystal_toolkit.core.mpcomponent import MPComponent
+
+
+def _get_patterns(args):
+    """
+    Process pool worker, returns (x, y, error) for the pattern of each
+    structure, broadened into a continuous profile if profile_kwargs are
+    given. If a pattern could not be calculated, x and y are empty and error
+    is the reason, otherwise error is None.
+    """
+    structs, xrdcalculator_kwargs, profile_kwargs = args
+    patterns = []
+    for struct in structs:
+        try:
+            pattern = XRayDiffractionComponent.get_pattern(struct, xrdcalculator_kwargs)
+            if profile_kwargs is None:
+                x, y = np.array(pattern["x"]), np.array(pattern["y"])
+            else:
+                x, y = XRayDiffractionComponent.get_profile(
+                    pattern["x"],
+                    pattern["y"],
+                    wavelength=xrdcalculator_kwargs["wavelength"],
+                    **profile_kwargs,
+                )
+        except Exception as exc:
+            patterns.append((np.empty(0), np.empty(0), repr(exc)))
+        else:
+            patterns.append((x, y, None))
+    return patterns
+
+
+def iter_patterns(
+    structs: Iterable[Structure],
+    xrdcalculator_kwargs: Optional[Dict] = None,
+    profile_kwargs: Optional[Dict] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Calculate diffraction patterns for many structures in parallel, without
+    an app. Structures are consumed in chunks and only a few chunks are in
+    progress at any time, so structures can be read lazily, e.g. from a
+    database, and memory use does not grow with the number of structures.
+
+    :param structs: Structures
+    :param xrdcalculator_kwargs: kwargs for XRDCalculator, defaults as in
+    XRayDiffractionComponent
+    :param profile_kwargs: if given, patterns are broadened into a continuous
+    profile using these kwargs for XRayDiffractionComponent.get_profile, e.g.
+    {"logsize": 1, "peak_profile": "V"}, otherwise peaks are returned
+    :param workers: number of processes, by default the number of CPUs
+    :param chunk_size: number of structures sent to a process at a time
+    :param progress: called with the number of patterns calculated so far
+    :return: (x, y) for each structure as NumPy arrays, in order, x and y
+    are empty (and a warning is issued) if a pattern could not be calculated
+    """
+
+    xrdcalculator_kwargs = dict(
+        XRayDiffractionComponent.default_xrdcalculator_kwargs,
+        **(xrdcalculator_kwargs or {}),
+    )
+    workers = workers or os.cpu_count()
+
+    # the wavelength of the profile is always that of the pattern
+    if profile_kwargs and "wavelength" in profile_kwargs:
+        profile_kwargs = dict(profile_kwargs)
+        wavelength = profile_kwargs.pop("wavelength")
+        if wavelength != xrdcalculator_kwargs["wavelength"]:
+            raise ValueError(
+                f"Profile wavelength {wavelength} does not match the "
+                f"XRDCalculator wavelength {xrdcalculator_kwargs['wavelength']}, "
+                f"set the wavelength in xrdcalculator_kwargs instead."
+            )
+
+    structs = iter(structs)
+    chunks = iter(lambda: list(islice(structs, chunk_size)), [])
+
+    n_done = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        pending = deque()
+
+        # None marks the end of the chunks, when all pending chunks are collected
+        for chunk in chain(chunks, [None]):
+
+            if chunk is not None:
+                pending.append(
+                    executor.submit(
+                        _get_patterns, (chunk, xrdcalculator_kwargs, profile_kwargs)
+                    )
+                )
+
+            while pending and (chunk is None or len(pending) >= 2 * workers):
+                for x, y, error in pending.popleft().result():
+                    if error is not None:
+                        warnings.warn(
+                            f"Could not calculate pattern for structure "
+                            f"{n_done}: {error}"
+                        )
+                    n_done += 1
+                    yield x, y
+                if progress:
+                    progress(n_done)
+
+
+def write_patterns(filename: str, structs: Iterable[Structure], **kwargs) -> int:
+    """
+    Calculate diffraction patterns for many structures and save them in a
+    compact columnar .npz file, see read_patterns. Patterns are written to
+    disk as they are calculated, so memory use does not grow with the number
+    of structures. Structures whose pattern could not be calculated have an
+    empty pattern.
+
+    :param filename: .npz file to write
+    :param structs: Structures
+    :param kwargs: passed to iter_patterns
+    :return: number of patterns written
+    """
+
+    if not filename.endswith(".npz"):
+        filename += ".npz"
+
+    # the length of each column is only known at the end, so columns are
+    # first streamed to temporary files and then copied into the .npz
+    with TemporaryFile() as x_file, TemporaryFile() as y_file:
+
+        offsets = [0]
+        for x, y in iter_patterns(structs, **kwargs):
+            x_file.write(x.astype(np.float32).tobytes())
+            y_file.write(y.astype(np.float32).tobytes())
+            offsets.append(offsets[-1] + len(x))
+
+        header = {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+            "fortran_order": False,
+            "shape": (offsets[-1],),
+        }
+
+        with ZipFile(filename, "w", compression=ZIP_DEFLATED) as npz:
+            for name, column_file in (("x", x_file), ("y", y_file)):
+                column_file.seek(0)
+                with npz.open(f"{name}.npy", "w", force_zip64=True) as f:
+                    np.lib.format.write_array_header_1_0(f, header)
+                    copyfileobj(column_file, f)
+            with npz.open("offsets.npy", "w") as f:
+                np.lib.format.write_array(f, np.array(offsets, dtype=np.int64))
+
+    return len(offsets) - 1
+
+
+def read_patterns(filename: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    :param filename: .npz file written by write_patterns, where the x and y
+    of pattern i are x[offsets[i]:offsets[i + 1]] and y[offsets[i]:offsets[i + 1]]
+    :return: (x, y) for each pattern
+    """
+    with np.load(filename) as data:
+        x, y, offsets = data["x"], data["y"], data["offsets"]
+    return [(x[i:j], y[i:j]) for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+def main():
+    """
+    Calculate diffraction patterns for a list of structures, and write them to
+    a file and/or cache them in the cache used by the app.
+    """
+
+    parser = ArgumentParser(
+        description="Calculate X-ray diffraction patterns for the given structures."
+    )
+    parser.add_argument(
+        "structures",
+        nargs="+",
+        help="structure files, or Materials Project ids (e.g. mp-13)",
+    )
+    parser.add_argument(
+        "--wavelength",
+        action="append",
+        choices=list(WAVELENGTHS.keys()),
+        help="radiation source, may be given more than once (default: CuKa)",
+    )
+    parser.add_argument(
+        "--output",
+        help="write patterns to this .npz file, suffixed with the radiation "
+        "source if more than one is given, see read_patterns",
+    )
+    parser.add_argument(
+        "--redis-url",
+        default=os.environ.get("REDIS_URL", ""),
+        help="Redis cache to warm, should match the app (default: $REDIS_URL)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of processes (default: number of CPUs)"
+    )
+    args = parser.parse_args()
+
+    if not args.output and not args.redis_url:
+        parser.error("Either --output or a Redis URL is required.")
+
+    if args.redis_url:
+        # only needed to warm the cache
+        from flask import Flask
+        from flask_caching import Cache
+
+        MPComponent.register_cache(
+            Cache(
+                Flask(__name__),
+                config={"CACHE_TYPE": "redis", "CACHE_REDIS_URL": args.redis_url},
+            )
+        )
+
+    wavelengths = args.wavelength or [
+        XRayDiffractionComponent.default_xrdcalculator_kwargs["wavelength"]
+    ]
+
+    structs = []
+    for name in args.structures:
+        if os.path.exists(name):
+            structs.append(Structure.from_file(name))
+        else:
+            with MPRester() as mpr:
+                structs.append(mpr.get_structure_by_material_id(name))
+
+    for wavelength in wavelengths:
+
+        xrdcalculator_kwargs = dict(
+            XRayDiffractionComponent.default_xrdcalculator_kwargs,
+            wavelength=wavelength,
+        )
+
+        if args.redis_url:
+            for name, struct in zip(args.structures, structs):
+                XRayDiffractionComponent.get_pattern(struct, xrdcalculator_kwargs)
+                print(f"Cached {wavelength} pattern for {name}")
+
+        if args.output:
+            filename = args.output
+            if len(wavelengths) > 1:
+                filename = f"{os.path.splitext(filename)[0]}_{wavelength}.npz"
+            n_patterns = write_patterns(
+                filename,
+                structs,
+                xrdcalculator_kwargs=xrdcalculator_kwargs,
+                workers=args.workers,
+            )
+            print(f"Wrote {n_patterns} {wavelength} patterns to {filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,9 @@ import numpy as np
 from pymatgen import PeriodicSite
 from pymatgen.analysis.graphs import MoleculeGraph
 
-from crystal_toolkit.core.scene import Scene
+from crystal_toolkit.core.scene import Scene, Spheres
 from crystal_toolkit.core.legend import Legend
+from crystal_toolkit.renderables.site import _is_single_sphere
 
 
 # TODO: fix Sam's bug (reorder)
@@ -18,8 +19,22 @@ def get_molecule_graph_scene(
 
     legend = legend or Legend(self.molecule)
 
+    # look up colors and radii for all sites at once
+    site_colors = legend.get_colors()
+    site_radii = legend.get_radii()
+
     primitives = defaultdict(list)
 
+    # sites drawn as single spheres are drawn together, with one Spheres per
+    # color and radius rather than one per site
+    single_sphere = [_is_single_sphere(site) for site in self.molecule]
+    idxs = np.where(single_sphere)[0]
+    primitives["atoms"] += Spheres.from_arrays(
+        np.subtract(self.molecule.cart_coords[idxs], origin),
+        [site_colors[idx][0] for idx in idxs],
+        [site_radii[idx][0] for idx in idxs],
+    )
+
     for idx, site in enumerate(self.molecule):
 
         connected_sites = self.get_connected_sites(idx)
@@ -29,6 +44,9 @@ def get_molecule_graph_scene(
             origin=origin,
             explicitly_calculate_polyhedra_hull=explicitly_calculate_polyhedra_hull,
             legend=legend,
+            colors=site_colors[idx],
+            radii=site_radii[idx],
+            draw_atoms=not single_sphere[idx],
         )
         for scene in site_scene.contents:
             primitives[scene.name] += scene.contents
@@ -5,6 +5,7 @@ from scipy.spatial.qhull import Delaunay
 from crystal_toolkit.core.scene import Scene, Cubes, Spheres, Cylinders, Surface, Convex
 from crystal_toolkit.core.legend import Legend
 
+from collections import defaultdict
 from itertools import chain
 from pymatgen import Site
 from pymatgen.analysis.graphs import ConnectedSite
@@ -12,6 +13,38 @@ from pymatgen.analysis.graphs import ConnectedSite
 from typing import List, Optional
 
 
+def _get_bond_cylinders(
+    position: np.ndarray, bond_midpoints: np.ndarray, colors: List[str]
+) -> List[Cylinders]:
+    """
+    Create one Cylinders primitive per bond color, each holding the
+    (N, 2, 3) array of position pairs for all bonds of that color,
+    rather than one primitive per bond.
+    """
+
+    position_pairs = np.stack(
+        [np.broadcast_to(position, bond_midpoints.shape), bond_midpoints], axis=1
+    )
+
+    indices_by_color = defaultdict(list)
+    for idx, color in enumerate(colors):
+        indices_by_color[color].append(idx)
+
+    return [
+        Cylinders(positionPairs=position_pairs[indices], color=color)
+        for color, indices in indices_by_color.items()
+    ]
+
+
+def _is_single_sphere(site: Site) -> bool:
+    """
+    Whether a site is drawn as a single, whole sphere, in which case it can
+    be drawn together with other such sites using Spheres.from_arrays rather
+    than by get_site_scene.
+    """
+    return site.is_ordered and not isinstance(site.specie, DummySpecie)
+
+
 def get_site_scene(
     self,
     connected_sites: List[ConnectedSite] = None,
@@ -24,6 +57,9 @@ def get_site_scene(
     draw_polyhedra: bool = True,
     explicitly_calculate_polyhedra_hull: bool = False,
     legend: Optional[Legend] = None,
+    colors: Optional[List[str]] = None,
+    radii: Optional[List[float]] = None,
+    draw_atoms: bool = True,
 ) -> Scene:
     """
 
@@ -37,6 +73,11 @@ def get_site_scene(
         origin:
         explicitly_calculate_polyhedra_hull:
         legend:
+        colors: colors for each species on this site, if already known,
+        for example from Legend.get_colors, to save looking them up again
+        radii: radii for each species on this site, as for colors
+        draw_atoms: if False, only draw bonds and polyhedra, e.g. if the
+        atoms of many sites are drawn together using Spheres.from_arrays
 
     Returns:
 
@@ -53,21 +94,27 @@ def get_site_scene(
     phiStart, phiEnd = None, None
     occu_start = 0.0
 
-    position = np.subtract(self.coords, origin).tolist()
+    position = np.subtract(self.coords, origin)
 
-    for idx, (sp, occu) in enumerate(self.species.items()):
+    if colors is None:
+        colors = [legend.get_color(sp, site=self) for sp in self.species]
+
+    # bonds re-use the color of the last species drawn
+    color = colors[-1]
+
+    for idx, (sp, occu) in enumerate(self.species.items() if draw_atoms else []):
 
         if isinstance(sp, DummySpecie):
 
-            cube = Cubes(
-                positions=[position], color=legend.get_color(sp, site=self), width=0.4
-            )
+            cube = Cubes(positions=[position], color=colors[idx], width=0.4)
             atoms.append(cube)
 
         else:
 
-            color = legend.get_color(sp, site=self)
-            radius = legend.get_radius(sp, site=self)
+            color = colors[idx]
+            radius = (
+                radii[idx] if radii is not None else legend.get_radius(sp, site=self)
+            )
 
             # TODO: make optional/default to None
             # in disordered structures, we fractionally color-code spheres,
@@ -94,7 +141,7 @@ def get_site_scene(
             )
             atoms.append(sphere)
 
-    if not is_ordered and not np.isclose(phiEnd, np.pi * 2):
+    if draw_atoms and not is_ordered and not np.isclose(phiEnd, np.pi * 2):
         # if site occupancy doesn't sum to 100%, cap sphere
         sphere = Spheres(
             positions=[position],
@@ -115,43 +162,39 @@ def get_site_scene(
         # necessary to include center site in case it's outside polyhedra
         all_positions = [np.subtract(self.coords, origin)]
 
-        for idx, connected_site in enumerate(connected_sites):
+        connected_positions = np.subtract(
+            [connected_site.site.coords for connected_site in connected_sites],
+            origin,
+        )
+        bond_midpoints = np.add(position, connected_positions) / 2
 
-            connected_position = np.subtract(connected_site.site.coords, origin)
-            bond_midpoint = np.add(position, connected_position) / 2
+        bonds += _get_bond_cylinders(
+            position,
+            bond_midpoints,
+            connected_sites_colors or [site_color] * len(connected_sites),
+        )
+        all_positions += list(connected_positions)
 
-            if connected_sites_colors:
-                color = connected_sites_colors[idx]
-            else:
-                color = site_color
+        if connected_sites_not_drawn and not hide_incomplete_edges:
 
-            cylinder = Cylinders(
-                positionPairs=[[position, bond_midpoint.tolist()]], color=color
+            connected_positions = np.subtract(
+                [
+                    connected_site.site.coords
+                    for connected_site in connected_sites_not_drawn
+                ],
+                origin,
+            )
+            bond_midpoints = (
+                incomplete_edge_length_scale * np.add(position, connected_positions) / 2
             )
-            bonds.append(cylinder)
-            all_positions.append(connected_position.tolist())
-
-        if connected_sites_not_drawn and not hide_incomplete_edges:
 
-            for idx, connected_site in enumerate(connected_sites_not_drawn):
-
-                connected_position = np.subtract(connected_site.site.coords, origin)
-                bond_midpoint = (
-                    incomplete_edge_length_scale
-                    * np.add(position, connected_position)
-                    / 2
-                )
-
-                if connected_sites_not_drawn_colors:
-                    color = connected_sites_not_drawn_colors[idx]
-                else:
-                    color = site_color
-
-                cylinder = Cylinders(
-                    positionPairs=[[position, bond_midpoint.tolist()]], color=color
-                )
-                bonds.append(cylinder)
-                all_positions.append(connected_position.tolist())
+            bonds += _get_bond_cylinders(
+                position,
+                bond_midpoints,
+                connected_sites_not_drawn_colors
+                or [site_color] * len(connected_sites_not_drawn),
+            )
+            all_positions += list(connected_positions)
 
         # ensure intersecting polyhedra are not shown, defaults to choose by electronegativity
         not_most_electro_negative = map(
@@ -1,5 +1,4 @@
 from collections import defaultdict
-from itertools import combinations
 
 import numpy as np
 from pymatgen.core.sites import PeriodicSite
@@ -12,52 +11,61 @@ from crystal_toolkit.core.legend import Legend
 from typing import Optional
 
 
-def _get_sites_to_draw(self, draw_image_atoms=True):
+def _get_image_sites(frac_coords, atol=0.05):
     """
-    Returns a list of site indices and image vectors.
+    Returns site indices and image vectors for all periodic images of sites
+    that lie on (or close to) a unit cell boundary, e.g. a site at the origin
+    will also be drawn at (1, 0, 0), (0, 1, 0), (1, 1, 0), etc.
+
+    This operates on the full (N, 3) array of fractional co-ordinates at once
+    rather than site-by-site, which is substantially faster for large cells.
+
+    :param frac_coords: (N, 3) array of fractional co-ordinates
+    :param atol: tolerance for a co-ordinate to be considered on a boundary
+    :return: a set of (site index, image vector) tuples, not including the
+    (0, 0, 0) image of each site
     """
 
-    sites_to_draw = [(idx, (0, 0, 0)) for idx in range(len(self.structure))]
+    frac_coords = np.reshape(frac_coords, (-1, 3))
 
-    if draw_image_atoms:
+    # all non-empty combinations of the three lattice directions, equivalent
+    # to itertools.combinations of the axes on a boundary, one row per subset
+    axes_subsets = np.array(
+        [[(mask >> axis) & 1 for axis in range(3)] for mask in range(1, 8)],
+        dtype=bool,
+    )
+
+    images = set()
+
+    for boundary, sign in ((0, 1), (1, -1)):
 
-        for idx, site in enumerate(self.structure):
+        on_boundary = np.isclose(frac_coords, boundary, atol=atol)
 
-            zero_elements = [
-                idx
-                for idx, f in enumerate(site.frac_coords)
-                if np.allclose(f, 0, atol=0.05)
-            ]
+        # a subset is valid for a site if every axis in the subset is on the
+        # boundary for that site, shape (N, 7)
+        valid = ~np.any(axes_subsets[None, :, :] & ~on_boundary[:, None, :], axis=2)
 
-            coord_permutations = [
-                x
-                for l in range(1, len(zero_elements) + 1)
-                for x in combinations(zero_elements, l)
-            ]
+        site_indices, subset_indices = np.nonzero(valid)
+        jimages = sign * axes_subsets[subset_indices].astype(int)
 
-            for perm in coord_permutations:
-                sites_to_draw.append(
-                    (idx, (int(0 in perm), int(1 in perm), int(2 in perm)))
-                )
+        images.update(
+            zip(site_indices.tolist(), map(tuple, jimages.tolist()))
+        )
 
-            one_elements = [
-                idx
-                for idx, f in enumerate(site.frac_coords)
-                if np.allclose(f, 1, atol=0.05)
-            ]
+    return images
 
-            coord_permutations = [
-                x
-                for l in range(1, len(one_elements) + 1)
-                for x in combinations(one_elements, l)
-            ]
 
-            for perm in coord_permutations:
-                sites_to_draw.append(
-                    (idx, (-int(0 in perm), -int(1 in perm), -int(2 in perm)))
-                )
+def _get_sites_to_draw(self, draw_image_atoms=True):
+    """
+    Returns a list of site indices and image vectors.
+    """
 
-    return set(sites_to_draw)
+    sites_to_draw = {(idx, (0, 0, 0)) for idx in range(len(self.structure))}
+
+    if draw_image_atoms:
+        sites_to_draw |= _get_image_sites(self.structure.frac_coords)
+
+    return sites_to_draw
 
 
 def get_structure_scene(
@@ -70,6 +78,10 @@ def get_structure_scene(
 
     legend = legend or Legend(self.structure)
 
+    # look up colors and radii for all sites at once
+    site_colors = legend.get_colors()
+    site_radii = legend.get_radii()
+
     primitives = defaultdict(list)
 
     sites_to_draw = self._get_sites_to_draw(
@@ -91,7 +103,12 @@ def get_structure_scene(
         else:
             connected_sites = self.get_connected_sites(idx)
 
-        site_scene = site.get_scene(origin=origin, legend=legend)
+        site_scene = site.get_scene(
+            origin=origin,
+            legend=legend,
+            colors=site_colors[idx],
+            radii=site_radii[idx],
+        )
         for scene in site_scene.contents:
             primitives[scene.name] += scene.contents
 
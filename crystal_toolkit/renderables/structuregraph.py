@@ -1,12 +1,13 @@
 from collections import defaultdict
-from itertools import combinations
 
 import numpy as np
 from pymatgen import PeriodicSite
 from pymatgen.analysis.graphs import StructureGraph
 
-from crystal_toolkit.core.scene import Scene
+from crystal_toolkit.core.scene import Scene, Spheres
 from crystal_toolkit.core.legend import Legend
+from crystal_toolkit.renderables.site import _is_single_sphere
+from crystal_toolkit.renderables.sitecollection import _get_image_sites
 
 from matplotlib.cm import get_cmap
 
@@ -23,42 +24,7 @@ def _get_sites_to_draw(
     sites_to_draw = [(idx, (0, 0, 0)) for idx in range(len(self.structure))]
 
     if draw_image_atoms:
-
-        for idx, site in enumerate(self.structure):
-
-            zero_elements = [
-                idx
-                for idx, f in enumerate(site.frac_coords)
-                if np.allclose(f, 0, atol=0.05)
-            ]
-
-            coord_permutations = [
-                x
-                for l in range(1, len(zero_elements) + 1)
-                for x in combinations(zero_elements, l)
-            ]
-
-            for perm in coord_permutations:
-                sites_to_draw.append(
-                    (idx, (int(0 in perm), int(1 in perm), int(2 in perm)))
-                )
-
-            one_elements = [
-                idx
-                for idx, f in enumerate(site.frac_coords)
-                if np.allclose(f, 1, atol=0.05)
-            ]
-
-            coord_permutations = [
-                x
-                for l in range(1, len(one_elements) + 1)
-                for x in combinations(one_elements, l)
-            ]
-
-            for perm in coord_permutations:
-                sites_to_draw.append(
-                    (idx, (-int(0 in perm), -int(1 in perm), -int(2 in perm)))
-                )
+        sites_to_draw += _get_image_sites(self.structure.frac_coords)
 
     if bonded_sites_outside_unit_cell:
 
@@ -94,6 +60,10 @@ def get_structure_graph_scene(
 
     legend = legend or Legend(self.structure)
 
+    # look up colors and radii for all sites at once
+    site_colors = legend.get_colors()
+    site_radii = legend.get_radii()
+
     primitives = defaultdict(list)
 
     sites_to_draw = self._get_sites_to_draw(
@@ -125,6 +95,23 @@ def get_structure_graph_scene(
 
             color_edges = True
 
+    # sites drawn as single spheres are drawn together, with one Spheres per
+    # color and radius rather than one per site
+    single_sphere = [_is_single_sphere(site) for site in self.structure]
+    single_sphere_sites = [
+        (idx, jimage) for (idx, jimage) in sites_to_draw if single_sphere[idx]
+    ]
+    if single_sphere_sites:
+        idxs, jimages = map(np.array, zip(*single_sphere_sites))
+        positions = self.structure.lattice.get_cartesian_coords(
+            self.structure.frac_coords[idxs] + jimages
+        )
+        primitives["atoms"] += Spheres.from_arrays(
+            np.subtract(positions, origin),
+            [site_colors[idx][0] for idx in idxs],
+            [site_radii[idx][0] for idx in idxs],
+        )
+
     for (idx, jimage) in sites_to_draw:
 
         site = self.structure[idx]
@@ -170,6 +157,9 @@ def get_structure_graph_scene(
             origin=origin,
             explicitly_calculate_polyhedra_hull=explicitly_calculate_polyhedra_hull,
             legend=legend,
+            colors=site_colors[idx],
+            radii=site_radii[idx],
+            draw_atoms=not single_sphere[idx],
         )
         for scene in site_scene.contents:
             primitives[scene.name] += scene.contents
@@ -0,0 +1,108 @@
+from itertools import combinations
+
+import numpy as np
+
+from crystal_toolkit.renderables.sitecollection import _get_image_sites
+
+from pymatgen import Structure, Lattice
+from pymatgen.analysis.graphs import StructureGraph
+
+
+def _get_image_sites_reference(frac_coords):
+    # original site-by-site implementation, kept to check the vectorized version
+
+    sites = []
+
+    for idx, site_frac_coords in enumerate(frac_coords):
+
+        for boundary, sign in ((0, 1), (1, -1)):
+
+            boundary_elements = [
+                axis
+                for axis, f in enumerate(site_frac_coords)
+                if np.allclose(f, boundary, atol=0.05)
+            ]
+
+            coord_permutations = [
+                x
+                for l in range(1, len(boundary_elements) + 1)
+                for x in combinations(boundary_elements, l)
+            ]
+
+            for perm in coord_permutations:
+                sites.append(
+                    (
+                        idx,
+                        (
+                            sign * int(0 in perm),
+                            sign * int(1 in perm),
+                            sign * int(2 in perm),
+                        ),
+                    )
+                )
+
+    return set(sites)
+
+
+class TestGetImageSites:
+    def setup_method(self, method):
+
+        # choose co-ordinates on, near and away from the cell boundaries,
+        # including values either side of the tolerance
+        values = [0, 0.01, 0.049, 0.051, 0.3, 0.5, 0.949, 0.951, 0.99, 1.0]
+        rng = np.random.RandomState(0)
+        self.frac_coords = rng.choice(values, size=(2000, 3))
+
+    def test_get_image_sites(self):
+
+        assert _get_image_sites([[0.5, 0.5, 0.5]]) == set()
+
+        assert _get_image_sites([[0, 0.5, 1]]) == {(0, (1, 0, 0)), (0, (0, 0, -1))}
+
+        assert _get_image_sites([[0, 0, 0]]) == {
+            (0, (1, 0, 0)),
+            (0, (0, 1, 0)),
+            (0, (0, 0, 1)),
+            (0, (1, 1, 0)),
+            (0, (1, 0, 1)),
+            (0, (0, 1, 1)),
+            (0, (1, 1, 1)),
+        }
+
+        assert _get_image_sites(self.frac_coords) == _get_image_sites_reference(
+            self.frac_coords
+        )
+
+    def test_structure_scene(self):
+
+        structure = Structure(
+            Lattice.cubic(4.2),
+            ["Na", "Cl", "Na"],
+            [[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0.98]],
+        )
+        scene = StructureGraph.with_empty_graph(structure).get_scene(
+            bonded_sites_outside_unit_cell=False
+        )
+
+        positions = [
+            position
+            for primitive in scene.contents
+            if primitive.name == "atoms"
+            for spheres in primitive.contents
+            for position in spheres.positions
+        ]
+
+        # the same atoms are drawn as with the original implementation
+        expected_sites = {
+            (idx, (0, 0, 0)) for idx in range(len(structure))
+        } | _get_image_sites_reference(structure.frac_coords)
+        expected_positions = [
+            structure.lattice.get_cartesian_coords(structure.frac_coords[idx] + jimage)
+            for idx, jimage in expected_sites
+        ]
+
+        # eight corners, one center, and three images of the last site
+        assert len(positions) == len(expected_positions) == 8 + 1 + 3
+        assert np.allclose(
+            sorted(map(tuple, positions)), sorted(map(tuple, expected_positions))
+        )
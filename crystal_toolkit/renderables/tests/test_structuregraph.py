@@ -0,0 +1,59 @@
+import numpy as np
+
+from crystal_toolkit.core.legend import Legend
+from crystal_toolkit.core.scene import Spheres
+from crystal_toolkit.renderables.structuregraph import StructureGraph
+
+from pymatgen import Structure, Lattice, PeriodicSite
+
+
+def get_spheres(scene):
+    """
+    :return: a set of (color, radius, position) for every sphere in the
+    atoms of a scene, with positions rounded to allow comparison
+    """
+
+    atoms = next(s for s in scene.contents if s.name == "atoms")
+
+    return {
+        (sphere.color, sphere.radius, tuple(np.round(position, 6)))
+        for sphere in atoms.contents
+        if isinstance(sphere, Spheres)
+        for position in np.reshape(sphere.positions, (-1, 3)).tolist()
+    }
+
+
+class TestStructureGraphScene:
+    def setup_method(self, method):
+
+        struct = Structure(
+            Lattice.cubic(4.2), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]
+        )
+        struct.make_supercell([2, 2, 2])
+        struct.replace(0, {"Na": 0.5, "K": 0.5})
+        self.graph = StructureGraph.with_empty_graph(struct)
+
+    def test_atoms(self):
+
+        legend = Legend(self.graph.structure)
+        scene = self.graph.get_scene(origin=(1, 1, 1), legend=legend)
+
+        # one Spheres per color and radius for ordered sites, and the
+        # disordered site is still drawn as segments of a sphere
+        spheres = [
+            s
+            for s in next(s for s in scene.contents if s.name == "atoms").contents
+            if s.phiStart is None
+        ]
+        assert len(spheres) == 2
+
+        # same spheres as drawing every site individually
+        expected = set()
+        for idx, jimage in self.graph._get_sites_to_draw():
+            site = self.graph.structure[idx]
+            site = PeriodicSite(
+                site.species, np.add(site.frac_coords, jimage), site.lattice
+            )
+            expected |= get_spheres(site.get_scene(origin=(1, 1, 1), legend=legend))
+
+        assert get_spheres(scene) == expected
@@ -0,0 +1,127 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from crystal_toolkit.renderables.volumetric import (
+    ANALYSES,
+    _decimate,
+    _get_blocks,
+    _get_block_surface,
+)
+
+from pymatgen import Structure, Lattice
+from pymatgen.io.vasp import VolumetricData
+
+
+class TestChunkedMarchingCubes:
+    def setup_method(self, method):
+
+        x, y, z = np.mgrid[0:1:40j, 0:1:36j, 0:1:30j]
+        self.data = np.sin(6 * x) + np.cos(5 * y) * np.sin(4 * z)
+
+    def test_get_blocks(self):
+
+        blocks = _get_blocks((10, 10, 10), block_size=4, step_size=3)
+
+        assert len(blocks) == 27
+        assert blocks[0] == (slice(0, 4), slice(0, 4), slice(0, 4))
+        assert blocks[-1] == (slice(6, 10), slice(6, 10), slice(6, 10))
+
+    def test_same_surface(self):
+
+        for step_size in (1, 2, 3):
+
+            whole_grid = tuple(slice(0, n) for n in self.data.shape)
+            expected, _ = _get_block_surface(
+                self.data, whole_grid, isolvl=0.5, step_size=step_size
+            )
+
+            triangles = np.concatenate(
+                [
+                    _get_block_surface(
+                        self.data, block, isolvl=0.5, step_size=step_size
+                    )[0]
+                    for block in _get_blocks(self.data.shape, 8, step_size)
+                ]
+            )
+
+            # every triangle should be found in both, up to float32 precision
+            assert len(triangles) == len(expected)
+            distances, _ = cKDTree(expected.reshape(-1, 9)).query(
+                triangles.reshape(-1, 9)
+            )
+            assert np.all(distances < 1e-4)
+
+
+class TestLevelsOfDetail:
+    def setup_method(self, method):
+
+        x, y, z = np.mgrid[-1:1:40j, -1:1:40j, -1:1:40j]
+        self.volumetric_data = VolumetricData(
+            Structure(Lattice.cubic(10), ["Na"], [[0, 0, 0]]),
+            {"total": x**2 + y**2 + z**2},
+        )
+
+    def test_decimate(self):
+
+        vertices, normals = self.volumetric_data.get_lods(
+            isolvl=0.5, step_size=1, levels=1
+        )[0]
+
+        decimated_vertices, decimated_normals = _decimate(
+            vertices, normals, cell_size=1.0
+        )
+
+        assert len(decimated_vertices) < len(vertices) / 2
+        assert decimated_vertices.shape == decimated_normals.shape
+
+        # no degenerate triangles
+        triangles = decimated_vertices.reshape(-1, 3, 3)
+        areas = np.linalg.norm(
+            np.cross(
+                triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+            ),
+            axis=1,
+        )
+        assert np.all(areas > 0)
+
+        # the simplified surface stays close to the original sphere
+        distances, _ = cKDTree(vertices).query(decimated_vertices)
+        assert np.all(distances < 1.0)
+
+    def test_max_triangles(self):
+
+        full_surface = self.volumetric_data.get_lods(isolvl=0.5, levels=1)[0]
+        num_triangles = len(full_surface[0]) // 3
+
+        # no levels of detail are generated if the full surface fits
+        lods = self.volumetric_data.get_lods(isolvl=0.5, max_triangles=num_triangles)
+        assert len(lods) == 1
+
+        # otherwise only until a level fits
+        lods = self.volumetric_data.get_lods(
+            isolvl=0.5, max_triangles=num_triangles // 2
+        )
+        assert 1 < len(lods) < 4
+        assert len(lods[-1][0]) // 3 <= num_triangles // 2
+        assert len(lods[-2][0]) // 3 > num_triangles // 2
+
+        scene = self.volumetric_data.get_scene(
+            isolvl=0.5, max_triangles=num_triangles // 2
+        )
+        assert len(scene.contents) == 1
+        assert np.array_equal(scene.contents[0].positions, lods[-1][0])
+
+    def test_analysis_cache(self):
+
+        analysis = self.volumetric_data.get_analysis()
+        assert self.volumetric_data.get_analysis() is analysis
+        assert self.volumetric_data in ANALYSES
+
+        # the VolumetricData itself is not modified
+        assert set(vars(self.volumetric_data)) == set(
+            vars(
+                VolumetricData(
+                    self.volumetric_data.structure, self.volumetric_data.data
+                )
+            )
+        )
@@ -1,23 +1,368 @@
 import numpy as np
 
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from itertools import product
+from weakref import WeakKeyDictionary
+
+from crystal_toolkit.core.cache import LRUCache
 from crystal_toolkit.core.scene import Scene, Surface
 
 from pymatgen.io.vasp import VolumetricData
 from skimage import measure
 
+from typing import Iterator, List, Tuple
+
+# recently generated isosurfaces, see get_volumetric_surfaces, limited by the
+# total size of their vertices and normals since a single isosurface of a large
+# grid can be hundreds of MB
+ISOSURFACES = LRUCache(
+    maxsize=32,
+    maxbytes=256 * 2 ** 20,
+    getsizeof=lambda block_surfaces: sum(
+        vertices.nbytes + normals.nbytes for vertices, normals in block_surfaces
+    ),
+)
+
+# analyses of VolumetricData, see get_volumetric_analysis, entries are removed
+# when the VolumetricData is garbage collected, data loaded from a
+# VolumetricDataStore is kept while in its cache of loaded data
+ANALYSES = WeakKeyDictionary()
+
+
+def _get_blocks(
+    shape: Tuple[int, int, int], block_size: int, step_size: int
+) -> List[Tuple[slice, slice, slice]]:
+    """
+    Tile a grid of the given shape into blocks for marching cubes. Blocks
+    start on multiples of step_size and share their last layer of grid points
+    with the next block, so that marching cubes on each block samples the same
+    grid points, and gives the same surface, as on the whole grid.
+    """
+
+    # blocks must be aligned with the grid points sampled
+    block_size = max(step_size, block_size - block_size % step_size)
+
+    block_slices = [
+        [
+            slice(start, min(start + block_size + 1, n))
+            for start in range(0, max(n - step_size, 1), block_size)
+        ]
+        for n in shape
+    ]
+
+    return list(product(*block_slices))
+
+
+def _get_block_surface(
+    data: np.ndarray, block: Tuple[slice, slice, slice], isolvl: float, step_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    :return: triangle vertices and normals, with shape (N, 3, 3), in grid
+    co-ordinates of the whole grid
+    """
+
+    block_data = data[block]
+
+    # marching cubes fails if the isosurface does not pass through the block
+    if not (block_data.min() <= isolvl <= block_data.max()):
+        return np.empty((0, 3, 3)), np.empty((0, 3, 3))
+
+    try:
+        vertices, faces, normals, values = measure.marching_cubes_lewiner(
+            block_data, level=isolvl, step_size=step_size
+        )
+    except RuntimeError:
+        # no surface found amongst the grid points sampled
+        return np.empty((0, 3, 3)), np.empty((0, 3, 3))
+    vertices += [s.start for s in block]
+
+    return vertices[faces], normals[faces]
+
+
+class VolumetricAnalysis:
+    """
+    Properties of a grid that are expensive to compute but independent of the
+    isovalue, so that they can be computed once and re-used as the isovalue
+    changes: a hash of the grid, a histogram of its values and the minimum
+    and maximum value in each block.
+    """
+
+    def __init__(self, data: np.ndarray, step_size: int, block_size: int, bins=256):
+        """
+        :param data: the grid
+        :param step_size: step size used for marching cubes
+        :param block_size: block size used for marching cubes
+        :param bins: number of bins for the histogram
+        """
+
+        self.digest = sha1(np.ascontiguousarray(data)).hexdigest()
+
+        self.histogram, self.bin_edges = np.histogram(data, bins=bins)
+
+        self.blocks = _get_blocks(data.shape, block_size, step_size)
+        self.block_ranges = np.array(
+            [(data[block].min(), data[block].max()) for block in self.blocks]
+        )
+
+    def get_blocks(self, isolvl: float) -> List[Tuple[slice, slice, slice]]:
+        """
+        :return: the blocks that the isosurface might pass through
+        """
+        return [
+            block
+            for block, (block_min, block_max) in zip(self.blocks, self.block_ranges)
+            if block_min <= isolvl <= block_max
+        ]
+
+    def get_isolvl(self, fraction: float) -> float:
+        """
+        Useful to choose sensible isovalues, e.g. for a slider.
+
+        :param fraction: fraction of grid points to enclose, between 0 and 1
+        :return: the approximate isovalue above which this fraction of grid
+        points lie
+        """
+        cumulative = np.cumsum(self.histogram[::-1])[::-1] / np.sum(self.histogram)
+        return float(np.interp(-fraction, -cumulative, self.bin_edges[:-1]))
+
+
+def get_volumetric_analysis(
+    self, data_key="total", step_size=3, block_size=64
+) -> VolumetricAnalysis:
+    """
+    :return: a VolumetricAnalysis of the given data, computed only once
+    """
+    analyses = ANALYSES.setdefault(self, {})
+    key = (data_key, step_size, block_size)
+    if key not in analyses:
+        analyses[key] = VolumetricAnalysis(
+            self.data[data_key], step_size=step_size, block_size=block_size
+        )
+    return analyses[key]
+
+
+def get_volumetric_surfaces(
+    self,
+    origin=(0, 0, 0),
+    data_key="total",
+    isolvl=2.0,
+    step_size=3,
+    block_size=64,
+    workers=1,
+    **kwargs,
+) -> Iterator[Surface]:
+    """
+    Generate the isosurface of the volumetric data, one block of the grid at
+    a time, so that only one block has to be held in memory at once (or one
+    per worker) and surfaces can be used as soon as they are available.
+
+    :param origin: origin
+    :param data_key: key of the data to draw, e.g. "total" or "diff"
+    :param isolvl: value of the isosurface
+    :param step_size: step size in grid points, larger steps are faster
+    but give coarser surfaces
+    :param block_size: approximate size of each block in grid points along
+    each axis, rounded down to a multiple of step_size
+    :param workers: number of threads to use for marching cubes
+    :param kwargs: passed to Surface, e.g. color or opacity
+    :return: a Surface for every block the isosurface passes through
+    """
+
+    data = self.data[data_key]
+
+    analysis = self.get_analysis(
+        data_key=data_key, step_size=step_size, block_size=block_size
+    )
+    cache_key = (analysis.digest, isolvl, step_size, block_size)
+
+    executor = None
+    cached_block_surfaces = ISOSURFACES.get(cache_key)
+
+    if cached_block_surfaces is not None:
+        block_surfaces = cached_block_surfaces
+    else:
+
+        def get_block_surface(block):
+            return _get_block_surface(data, block, isolvl, step_size)
+
+        # only blocks containing the isovalue need to be considered
+        blocks = analysis.get_blocks(isolvl)
+
+        if workers > 1:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            block_surfaces = executor.map(get_block_surface, blocks)
+        else:
+            block_surfaces = map(get_block_surface, blocks)
 
-def get_volumetric_scene(self,
-                         origin=(0, 0, 0),
-                         data_key='total',
-                         isolvl=2.0,
-                         step_size=3,
-                         **kwargs):
     o = -np.array(origin)
-    vertices, faces, normals, values = measure.marching_cubes_lewiner(
-        self.data[data_key], level=isolvl, step_size=step_size)
-    vertices = vertices/self.data[data_key].shape  # transform to fractional coordinates
-    vertices = np.dot(o + vertices, self.structure.lattice.matrix) # transform to cartesian
-    return Scene("volumetric-data", contents=[Surface(vertices, normals, **kwargs)])
+
+    new_block_surfaces = []
+
+    try:
+        for vertices, normals in block_surfaces:
+            if not len(vertices):
+                continue
+            new_block_surfaces.append((vertices, normals))
+            vertices = vertices.reshape(-1, 3) / data.shape  # fractional coordinates
+            vertices = np.dot(o + vertices, self.structure.lattice.matrix)  # cartesian
+            yield Surface(vertices, normals.reshape(-1, 3), **kwargs)
+        if cached_block_surfaces is None:
+            ISOSURFACES.set(cache_key, new_block_surfaces)
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+
+
+def _decimate(
+    vertices: np.ndarray, normals: np.ndarray, cell_size: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simplify a triangle mesh by vertex clustering: vertices within the same
+    cube of side cell_size are merged into one at their mean position, and
+    triangles which become degenerate or duplicated are removed.
+
+    :param vertices: triangle vertices, with shape (3N, 3)
+    :param normals: vertex normals, with shape (3N, 3)
+    :param cell_size: size of clusters, in the same units as vertices
+    :return: vertices and normals of the simplified mesh
+    """
+
+    cells = np.floor(vertices / cell_size).astype(np.int64)
+    cells -= cells.min(axis=0)
+    cell_keys = np.ravel_multi_index(cells.T, cells.max(axis=0) + 1)
+    _, clusters = np.unique(cell_keys, return_inverse=True)
+    clusters = clusters.ravel()
+
+    counts = np.bincount(clusters)
+    cluster_vertices = np.stack(
+        [np.bincount(clusters, weights=vertices[:, i]) for i in range(3)], axis=1
+    )
+    cluster_vertices /= counts[:, None]
+    cluster_normals = np.stack(
+        [np.bincount(clusters, weights=normals[:, i]) for i in range(3)], axis=1
+    )
+    cluster_normals /= np.maximum(
+        np.linalg.norm(cluster_normals, axis=1, keepdims=True), 1e-12
+    )
+
+    faces = clusters.reshape(-1, 3)
+    faces = faces[
+        (faces[:, 0] != faces[:, 1])
+        & (faces[:, 1] != faces[:, 2])
+        & (faces[:, 2] != faces[:, 0])
+    ]
+    _, unique_faces = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    faces = faces[np.sort(unique_faces)]
+
+    return cluster_vertices[faces].reshape(-1, 3), cluster_normals[faces].reshape(-1, 3)
+
+
+def get_volumetric_lods(
+    self,
+    origin=(0, 0, 0),
+    data_key="total",
+    isolvl=2.0,
+    step_size=3,
+    block_size=64,
+    workers=1,
+    levels=4,
+    max_triangles=None,
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Generate levels of detail of the isosurface, each with roughly a quarter
+    of the triangles of the previous level, by vertex clustering with a
+    cluster size of twice that of the previous level.
+
+    :param levels: maximum number of levels of detail, including the full
+    surface
+    :param max_triangles: if set, no coarser levels are generated once a
+    level has at most this many triangles
+    :return: a list of (vertices, normals) from the full surface to the
+    coarsest, suitable for constructing a Surface
+    """
+
+    surfaces = list(
+        self.get_surfaces(
+            origin=origin,
+            data_key=data_key,
+            isolvl=isolvl,
+            step_size=step_size,
+            block_size=block_size,
+            workers=workers,
+        )
+    )
+
+    if not surfaces:
+        return [(np.empty((0, 3)), np.empty((0, 3)))] * levels
+
+    vertices = np.concatenate([surface.positions for surface in surfaces])
+    normals = np.concatenate([surface.normals for surface in surfaces])
+
+    # start from the spacing of the grid points sampled by marching cubes
+    grid_spacing = (
+        np.mean(np.divide(self.structure.lattice.abc, self.data[data_key].shape))
+        * step_size
+    )
+
+    lods = [(vertices, normals)]
+    for level in range(1, levels):
+        if max_triangles is not None and len(lods[-1][0]) // 3 <= max_triangles:
+            break
+        lods.append(_decimate(*lods[-1], cell_size=grid_spacing * 2 ** level))
+
+    return lods
+
+
+def get_volumetric_scene(
+    self,
+    origin=(0, 0, 0),
+    data_key="total",
+    isolvl=2.0,
+    step_size=3,
+    block_size=64,
+    workers=1,
+    max_triangles=None,
+    **kwargs,
+):
+    """
+    :param max_triangles: if set, the isosurface is simplified to have at most
+    this many triangles where possible, see get_lods
+    """
+
+    if max_triangles is None:
+        contents = list(
+            self.get_surfaces(
+                origin=origin,
+                data_key=data_key,
+                isolvl=isolvl,
+                step_size=step_size,
+                block_size=block_size,
+                workers=workers,
+                **kwargs,
+            )
+        )
+    else:
+        lods = self.get_lods(
+            origin=origin,
+            data_key=data_key,
+            isolvl=isolvl,
+            step_size=step_size,
+            block_size=block_size,
+            workers=workers,
+            max_triangles=max_triangles,
+        )
+        # choose the most detailed level within budget, or else the coarsest
+        vertices, normals = next(
+            (lod for lod in lods if len(lod[0]) // 3 <= max_triangles), lods[-1]
+        )
+        contents = [Surface(vertices, normals, **kwargs)] if len(vertices) else []
+
+    return Scene("volumetric-data", contents=contents)
+
 
 # TODO: re-think origin, shift globally at end (scene.origin)
+VolumetricData.get_analysis = get_volumetric_analysis
+VolumetricData.get_surfaces = get_volumetric_surfaces
+VolumetricData.get_lods = get_volumetric_lods
 VolumetricData.get_scene = get_volumetric_scene
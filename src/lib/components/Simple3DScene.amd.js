@@ -24,6 +24,12 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
     }
   }
 
+  var _typeof = typeof Symbol === "function" && typeof Symbol.iterator === "symbol" ? function (obj) {
+    return typeof obj;
+  } : function (obj) {
+    return obj && typeof Symbol === "function" && obj.constructor === Symbol && obj !== Symbol.prototype ? "symbol" : typeof obj;
+  };
+
   function _toConsumableArray(arr) {
     if (Array.isArray(arr)) {
       for (var i = 0, arr2 = Array(arr.length); i < arr.length; i++) {
@@ -266,6 +272,50 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
           this.renderer.domElement.parentElement.style.backgroundImage = "url('" + this.renderer.domElement.toDataURL('image/png') + "')";
         }
       }
+    }, {
+      key: 'applyPatch',
+      value: function applyPatch(patch) {
+        // update colors and radii of existing objects in place instead of
+        // re-drawing the whole scene, see get_scene_patch in scene.py
+        var root_obj = this.scene.getObjectByName(patch.name);
+        if (typeof root_obj === 'undefined') {
+          return;
+        }
+
+        patch.updates.forEach(function (update) {
+          var obj = root_obj;
+          update.path.forEach(function (idx) {
+            obj = obj && obj.children[idx];
+          });
+          if (typeof obj === 'undefined') {
+            return;
+          }
+
+          if (update.hasOwnProperty('color')) {
+            obj.children.forEach(function (child) {
+              if (child.material && child.material.color) {
+                child.material.color.set(update.color);
+              }
+            });
+          }
+
+          if (update.hasOwnProperty('radius') && obj.userData.radius) {
+            // geometry is shared between meshes, so scale meshes relative
+            // to the radius the geometry was created with
+            var scale = update.radius / obj.userData.radius;
+            obj.children.forEach(function (child) {
+              if (obj.userData.type === 'spheres') {
+                child.scale.setScalar(scale);
+              } else if (obj.userData.type === 'cylinders') {
+                child.scale.x = scale;
+                child.scale.z = scale;
+              }
+            });
+          }
+        });
+
+        this.renderScene();
+      }
     }, {
       key: 'makeLights',
       value: function makeLights(light_json) {
@@ -305,6 +355,8 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
       value: function makeObject(object_json) {
         var obj = new THREE.Object3D();
         obj.name = object_json.name;
+        // retained so that the object can be patched in place later
+        obj.userData.type = object_json.type;
 
         if (object_json.visible) {
           obj.visible = object_json.visible;
@@ -318,6 +370,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
         switch (object_json.type) {
           case 'spheres':
             {
+              obj.userData.radius = object_json.radius;
               var geom = new THREE.SphereBufferGeometry(object_json.radius * this.settings.sphereScale, this.settings.sphereSegments, this.settings.sphereSegments, object_json.phiStart || 0, object_json.phiEnd || Math.PI * 2);
               var mat = this.makeMaterial(object_json.color);
 
@@ -327,7 +380,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               // }
 
               var meshes = [];
-              object_json.positions.forEach(function (position) {
+              Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
                 var _mesh$position;
 
                 var mesh = new THREE.Mesh(geom, mat);
@@ -352,7 +405,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               // }
 
               var _meshes = [];
-              object_json.positions.forEach(function (position) {
+              Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
                 var _mesh$position2, _mesh$scale;
 
                 var mesh = new THREE.Mesh(_geom, _mat);
@@ -365,7 +418,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
 
               var vec_z = new THREE.Vector3(0, 0, 1);
               var quaternion = new THREE.Quaternion();
-              object_json.rotate_to.forEach(function (rotation, index) {
+              Simple3DScene.decodeNestedArray(object_json.rotate_to).forEach(function (rotation, index) {
                 var rotation_vec = new (Function.prototype.bind.apply(THREE.Vector3, [null].concat(_toConsumableArray(rotation))))();
                 quaternion.setFromUnitVectors(vec_z, rotation_vec.normalize());
                 _meshes[index].setRotationFromQuaternion(quaternion);
@@ -380,6 +433,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
           case 'cylinders':
             {
               var radius = object_json.radius || 1;
+              obj.userData.radius = radius;
 
               var _geom2 = new THREE.CylinderBufferGeometry(radius * this.settings.cylinderScale, radius * this.settings.cylinderScale, 1.0, this.settings.cylinderSegments);
               var _mat2 = this.makeMaterial(object_json.color);
@@ -387,7 +441,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               var vec_y = new THREE.Vector3(0, 1, 0); // initial axis of cylinder
               var _quaternion = new THREE.Quaternion();
 
-              object_json.positionPairs.forEach(function (positionPair) {
+              Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function (positionPair) {
                 // the following is technically correct but could be optimized?
 
                 var mesh = new THREE.Mesh(_geom2, _mat2);
@@ -416,7 +470,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               var _geom3 = new THREE.BoxBufferGeometry(object_json.width * this.settings.sphereScale, object_json.width * this.settings.sphereScale, object_json.width * this.settings.sphereScale);
               var _mat3 = this.makeMaterial(object_json.color);
 
-              object_json.positions.forEach(function (position) {
+              Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
                 var _mesh$position3;
 
                 var mesh = new THREE.Mesh(_geom3, _mat3);
@@ -428,7 +482,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
             }
           case 'lines':
             {
-              var verts = new THREE.Float32BufferAttribute([].concat.apply([], object_json.positions), 3);
+              var verts = new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.positions), 3);
               var _geom4 = new THREE.BufferGeometry();
               _geom4.addAttribute('position', verts);
 
@@ -458,7 +512,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
             }
           case 'surface':
             {
-              var _verts = new THREE.Float32BufferAttribute([].concat.apply([], object_json.positions), 3);
+              var _verts = new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.positions), 3);
               var _geom5 = new THREE.BufferGeometry();
               _geom5.addAttribute('position', _verts);
 
@@ -466,7 +520,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               var _mat5 = this.makeMaterial(object_json.color, opacity);
 
               if (object_json.normals) {
-                var normals = new THREE.Float32BufferAttribute([].concat.apply([], object_json.normals), 3);
+                var normals = new THREE.Float32BufferAttribute(Simple3DScene.decodeFlatArray(object_json.normals), 3);
                 _geom5.addAttribute('normal', normals);
               } else {
                 _geom5.computeFaceNormals();
@@ -485,7 +539,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
             }
           case 'convex':
             {
-              var points = object_json.positions.map(function (p) {
+              var points = Simple3DScene.decodeNestedArray(object_json.positions).map(function (p) {
                 return new (Function.prototype.bind.apply(THREE.Vector3, [null].concat(_toConsumableArray(p))))();
               });
               var _geom6 = new THREE.ConvexBufferGeometry(points);
@@ -525,7 +579,7 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
               var _quaternion2 = new THREE.Quaternion();
               var quaternion_head = new THREE.Quaternion();
 
-              object_json.positionPairs.forEach(function (positionPair) {
+              Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function (positionPair) {
                 // the following is technically correct but could be optimized?
 
                 var mesh = new THREE.Mesh(geom_cyl, _mat7);
@@ -645,6 +699,56 @@ define(['exports', 'three-full'], function (exports, _threeFull) {
         return null;
       }
     }], [{
+      key: 'decodeArray',
+      value: function decodeArray(value) {
+        // arrays can be sent from Python as base64-encoded little-endian
+        // float32 buffers (see Scene.to_json(binary=True)), which are much
+        // smaller and faster to parse than nested lists of floats
+        var binary = window.atob(value.data);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) {
+          bytes[i] = binary.charCodeAt(i);
+        }
+        return new Float32Array(bytes.buffer);
+      }
+    }, {
+      key: 'isBinaryArray',
+      value: function isBinaryArray(value) {
+        return value !== null && (typeof value === 'undefined' ? 'undefined' : _typeof(value)) === 'object' && value.hasOwnProperty('@binary');
+      }
+    }, {
+      key: 'decodeFlatArray',
+      value: function decodeFlatArray(value) {
+        // returns a flat array suitable for a BufferAttribute
+        if (Simple3DScene.isBinaryArray(value)) {
+          return Simple3DScene.decodeArray(value);
+        }
+        return [].concat.apply([], value);
+      }
+    }, {
+      key: 'decodeNestedArray',
+      value: function decodeNestedArray(value) {
+        // returns nested arrays, e.g. a list of positions or position pairs
+        if (!Simple3DScene.isBinaryArray(value)) {
+          return value;
+        }
+        var flat = Simple3DScene.decodeArray(value);
+        function nest(offset, shape) {
+          if (shape.length === 1) {
+            return Array.from(flat.subarray(offset, offset + shape[0]));
+          }
+          var stride = shape.slice(1).reduce(function (a, b) {
+            return a * b;
+          }, 1);
+          var nested = [];
+          for (var i = 0; i < shape[0]; i++) {
+            nested.push(nest(offset + i * stride, shape.slice(1)));
+          }
+          return nested;
+        }
+        return nest(0, value.shape);
+      }
+    }, {
       key: 'removeObjectByName',
       value: function removeObjectByName(scene, name) {
         // name is not necessarily unique, make this recursive ?
@@ -222,6 +222,49 @@ export default class Simple3DScene {
     }
   }
 
+  applyPatch (patch) {
+    // update colors and radii of existing objects in place instead of
+    // re-drawing the whole scene, see get_scene_patch in scene.py
+    const root_obj = this.scene.getObjectByName(patch.name)
+    if (typeof root_obj === 'undefined') {
+      return
+    }
+
+    patch.updates.forEach(function (update) {
+      let obj = root_obj
+      update.path.forEach(function (idx) {
+        obj = obj && obj.children[idx]
+      })
+      if (typeof obj === 'undefined') {
+        return
+      }
+
+      if (update.hasOwnProperty('color')) {
+        obj.children.forEach(function (child) {
+          if (child.material && child.material.color) {
+            child.material.color.set(update.color)
+          }
+        })
+      }
+
+      if (update.hasOwnProperty('radius') && obj.userData.radius) {
+        // geometry is shared between meshes, so scale meshes relative
+        // to the radius the geometry was created with
+        const scale = update.radius / obj.userData.radius
+        obj.children.forEach(function (child) {
+          if (obj.userData.type === 'spheres') {
+            child.scale.setScalar(scale)
+          } else if (obj.userData.type === 'cylinders') {
+            child.scale.x = scale
+            child.scale.z = scale
+          }
+        })
+      }
+    })
+
+    this.renderScene()
+  }
+
   makeLights (light_json) {
     const lights = new THREE.Object3D()
     lights.name = 'lights'
@@ -260,6 +303,8 @@ export default class Simple3DScene {
   makeObject (object_json) {
     const obj = new THREE.Object3D()
     obj.name = object_json.name
+    // retained so that the object can be patched in place later
+    obj.userData.type = object_json.type
 
     if (object_json.visible) {
       obj.visible = object_json.visible
@@ -272,6 +317,7 @@ export default class Simple3DScene {
 
     switch (object_json.type) {
       case 'spheres': {
+        obj.userData.radius = object_json.radius
         const geom = new THREE.SphereBufferGeometry(
           object_json.radius * this.settings.sphereScale,
           this.settings.sphereSegments,
@@ -287,7 +333,7 @@ export default class Simple3DScene {
         // }
 
         const meshes = []
-        object_json.positions.forEach(function (position) {
+        Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
           const mesh = new THREE.Mesh(geom, mat)
           mesh.position.set(...position)
           meshes.push(mesh)
@@ -315,7 +361,7 @@ export default class Simple3DScene {
         // }
 
         const meshes = []
-        object_json.positions.forEach(function (position) {
+        Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
           const mesh = new THREE.Mesh(geom, mat)
           mesh.position.set(...position)
           mesh.scale.set(...object_json.scale) // TODO: Is this valid JS?
@@ -326,7 +372,7 @@ export default class Simple3DScene {
 
         const vec_z = new THREE.Vector3(0, 0, 1)
         const quaternion = new THREE.Quaternion()
-        object_json.rotate_to.forEach(function (rotation, index) {
+        Simple3DScene.decodeNestedArray(object_json.rotate_to).forEach(function (rotation, index) {
           const rotation_vec = new THREE.Vector3(...rotation)
           quaternion.setFromUnitVectors(vec_z, rotation_vec.normalize())
           meshes[index].setRotationFromQuaternion(quaternion)
@@ -340,6 +386,7 @@ export default class Simple3DScene {
       }
       case 'cylinders': {
         const radius = object_json.radius || 1
+        obj.userData.radius = radius
 
         const geom = new THREE.CylinderBufferGeometry(
           radius * this.settings.cylinderScale,
@@ -352,7 +399,7 @@ export default class Simple3DScene {
         const vec_y = new THREE.Vector3(0, 1, 0) // initial axis of cylinder
         const quaternion = new THREE.Quaternion()
 
-        object_json.positionPairs.forEach(function (positionPair) {
+        Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function (positionPair) {
           // the following is technically correct but could be optimized?
 
           const mesh = new THREE.Mesh(geom, mat)
@@ -384,7 +431,7 @@ export default class Simple3DScene {
         )
         const mat = this.makeMaterial(object_json.color)
 
-        object_json.positions.forEach(function (position) {
+        Simple3DScene.decodeNestedArray(object_json.positions).forEach(function (position) {
           const mesh = new THREE.Mesh(geom, mat)
           mesh.position.set(...position)
           obj.add(mesh)
@@ -394,7 +441,7 @@ export default class Simple3DScene {
       }
       case 'lines': {
         const verts = new THREE.Float32BufferAttribute(
-          [].concat.apply([], object_json.positions),
+          Simple3DScene.decodeFlatArray(object_json.positions),
           3
         )
         const geom = new THREE.BufferGeometry()
@@ -426,7 +473,7 @@ export default class Simple3DScene {
       }
       case 'surface': {
         const verts = new THREE.Float32BufferAttribute(
-          [].concat.apply([], object_json.positions),
+          Simple3DScene.decodeFlatArray(object_json.positions),
           3
         )
         const geom = new THREE.BufferGeometry()
@@ -438,7 +485,7 @@ export default class Simple3DScene {
 
         if (object_json.normals) {
           const normals = new THREE.Float32BufferAttribute(
-            [].concat.apply([], object_json.normals),
+            Simple3DScene.decodeFlatArray(object_json.normals),
             3
           )
           geom.addAttribute('normal', normals)
@@ -458,7 +505,7 @@ export default class Simple3DScene {
         return obj
       }
       case 'convex': {
-        const points = object_json.positions.map(p => new THREE.Vector3(...p))
+        const points = Simple3DScene.decodeNestedArray(object_json.positions).map(p => new THREE.Vector3(...p))
         const geom = new THREE.ConvexBufferGeometry(points)
 
         const opacity =
@@ -504,7 +551,7 @@ export default class Simple3DScene {
         const quaternion = new THREE.Quaternion()
         const quaternion_head = new THREE.Quaternion()
 
-        object_json.positionPairs.forEach(function (positionPair) {
+        Simple3DScene.decodeNestedArray(object_json.positionPairs).forEach(function (positionPair) {
           // the following is technically correct but could be optimized?
 
           const mesh = new THREE.Mesh(geom_cyl, mat)
@@ -614,6 +661,50 @@ export default class Simple3DScene {
     return null
   }
 
+  static decodeArray (value) {
+    // arrays can be sent from Python as base64-encoded little-endian
+    // float32 buffers (see Scene.to_json(binary=True)), which are much
+    // smaller and faster to parse than nested lists of floats
+    const binary = window.atob(value.data)
+    const bytes = new Uint8Array(binary.length)
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i)
+    }
+    return new Float32Array(bytes.buffer)
+  }
+
+  static isBinaryArray (value) {
+    return value !== null && typeof value === 'object' && value.hasOwnProperty('@binary')
+  }
+
+  static decodeFlatArray (value) {
+    // returns a flat array suitable for a BufferAttribute
+    if (Simple3DScene.isBinaryArray(value)) {
+      return Simple3DScene.decodeArray(value)
+    }
+    return [].concat.apply([], value)
+  }
+
+  static decodeNestedArray (value) {
+    // returns nested arrays, e.g. a list of positions or position pairs
+    if (!Simple3DScene.isBinaryArray(value)) {
+      return value
+    }
+    const flat = Simple3DScene.decodeArray(value)
+    function nest (offset, shape) {
+      if (shape.length === 1) {
+        return Array.from(flat.subarray(offset, offset + shape[0]))
+      }
+      const stride = shape.slice(1).reduce((a, b) => a * b, 1)
+      const nested = []
+      for (let i = 0; i < shape[0]; i++) {
+        nested.push(nest(offset + i * stride, shape.slice(1)))
+      }
+      return nested
+    }
+    return nest(0, value.shape)
+  }
+
   static removeObjectByName (scene, name) {
     // name is not necessarily unique, make this recursive ?
     const object = scene.getObjectByName(name)
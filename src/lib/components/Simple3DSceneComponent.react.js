@@ -30,6 +30,8 @@ export default class Simple3DSceneComponent extends Component {
     if (nextProps.data !== this.props.data) {
       this.scene.addToScene(nextProps.data)
       this.scene.toggleVisibility(this.props.toggleVisibility)
+    } else if (nextProps.patch && nextProps.patch !== this.props.patch) {
+      this.scene.applyPatch(nextProps.patch)
     }
 
     if (nextProps.toggleVisibility !== this.props.toggleVisibility) {
@@ -97,6 +99,12 @@ Simple3DSceneComponent.propTypes = {
          */
   data: PropTypes.object,
 
+  /**
+         * Changes to colors and radii of objects already in the scene,
+         * applied in place without re-drawing the scene
+         */
+  patch: PropTypes.object,
+
   /**
          * Options used for generating scene
          */